@@ -19,16 +19,16 @@ import asyncio
 import json
 import logging
 import math
-import statistics
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
+from typing import Any, Deque, Dict, List, Optional, Sequence, Set, Tuple, Union
 
 import numpy as np
-from scipy import stats
+
+from .rolling_stats import RollingWindow
 
 
 logger = logging.getLogger(__name__)
@@ -102,44 +102,63 @@ class AnomalyAlert:
 
 @dataclass
 class TimeSeriesBuffer:
-    """Circular buffer for time series data with statistical analysis."""
+    """Circular buffer for time series data with statistical analysis.
+
+    Values are mirrored into ``RollingWindow`` rings (the full buffer plus one
+    per lookback length asked for), so mean, deviation, z-score and trend are
+    kept up to date on insert instead of recomputed from the points.
+    """
     
     max_size: int
     data: Deque[DataPoint] = field(default_factory=deque)
+    _window: RollingWindow = field(init=False, repr=False)
+    _lookbacks: Dict[int, RollingWindow] = field(init=False, repr=False, default_factory=dict)
     
     def __post_init__(self) -> None:
         """Initialize with proper deque max length."""
         self.data = deque(maxlen=self.max_size)
+        self._window = RollingWindow(self.max_size)
     
     def add_point(self, timestamp: datetime, value: Decimal, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Add a new data point to the buffer."""
         point = DataPoint(timestamp, value, metadata or {})
         self.data.append(point)
+        value_float = float(value)
+        self._window.append(value_float)
+        for window in self._lookbacks.values():
+            window.append(value_float)
+    
+    def window(self, lookback: Optional[int] = None) -> RollingWindow:
+        """Rolling statistics over the most recent ``lookback`` values (default: all)."""
+        if not lookback or lookback >= self.max_size:
+            return self._window
+        window = self._lookbacks.get(lookback)
+        if window is None:
+            window = RollingWindow(lookback)
+            for value in self._window.tail(lookback):
+                window.append(value)
+            self._lookbacks[lookback] = window
+        return window
     
     def get_values(self) -> List[float]:
         """Get all values as floats for statistical analysis."""
-        return [float(point.value) for point in self.data]
+        return self._window.values().tolist()
     
     def get_recent_values(self, count: int) -> List[float]:
         """Get the most recent N values."""
-        values = self.get_values()
-        return values[-count:] if len(values) >= count else values
+        return self._window.tail(count).tolist()
     
     def calculate_mean(self, lookback: Optional[int] = None) -> float:
         """Calculate mean of values."""
-        values = self.get_recent_values(lookback) if lookback else self.get_values()
-        return statistics.mean(values) if values else 0.0
+        return self.window(lookback).mean
     
     def calculate_std(self, lookback: Optional[int] = None) -> float:
         """Calculate standard deviation of values."""
-        values = self.get_recent_values(lookback) if lookback else self.get_values()
-        return statistics.stdev(values) if len(values) > 1 else 0.0
+        return self.window(lookback).std
     
     def calculate_z_score(self, new_value: float, lookback: Optional[int] = None) -> float:
         """Calculate z-score for a new value."""
-        mean = self.calculate_mean(lookback)
-        std = self.calculate_std(lookback)
-        return (new_value - mean) / std if std > 0 else 0.0
+        return self.window(lookback).z_score(new_value)
     
     def detect_outlier(self, new_value: float, threshold: float = 3.0, lookback: Optional[int] = None) -> bool:
         """Detect if new value is an outlier using z-score."""
@@ -151,18 +170,23 @@ class TimeSeriesBuffer:
     
     def calculate_trend(self, lookback: Optional[int] = None) -> float:
         """Calculate trend using linear regression slope."""
-        values = self.get_recent_values(lookback) if lookback else self.get_values()
-        if len(values) < 3:
-            return 0.0
-        
-        x = np.arange(len(values))
-        y = np.array(values)
-        
-        try:
-            slope, _, _, _, _ = stats.linregress(x, y)
-            return float(slope)
-        except Exception:
+        window = self.window(lookback)
+        if len(window) < 3:
             return 0.0
+        return window.slope()
+
+
+WindowOrValues = Union[RollingWindow, Sequence[float]]
+
+
+def _as_window(values: WindowOrValues) -> RollingWindow:
+    """Use a maintained window as-is; load a plain sequence into a new one."""
+    if isinstance(values, RollingWindow):
+        return values
+    window = RollingWindow(len(values))
+    for value in values:
+        window.append(value)
+    return window
 
 
 class StatisticalAnomalyDetector:
@@ -183,27 +207,24 @@ class StatisticalAnomalyDetector:
         self.iqr_multiplier = iqr_multiplier
         self.mad_threshold = mad_threshold
     
-    def detect_z_score_anomaly(self, values: List[float], new_value: float) -> Tuple[bool, float]:
+    def detect_z_score_anomaly(self, values: WindowOrValues, new_value: float) -> Tuple[bool, float]:
         """Detect anomaly using z-score method."""
         if len(values) < 3:
             return False, 0.0
         
-        mean = statistics.mean(values)
-        std = statistics.stdev(values) if len(values) > 1 else 0.0
-        
-        if std == 0:
+        window = _as_window(values)
+        if window.std == 0:
             return False, 0.0
         
-        z_score = abs((new_value - mean) / std)
+        z_score = abs(window.z_score(new_value))
         return z_score > self.z_score_threshold, z_score
     
-    def detect_iqr_anomaly(self, values: List[float], new_value: float) -> Tuple[bool, float]:
+    def detect_iqr_anomaly(self, values: WindowOrValues, new_value: float) -> Tuple[bool, float]:
         """Detect anomaly using Interquartile Range method."""
         if len(values) < 4:
             return False, 0.0
         
-        q1 = statistics.quantiles(values, n=4)[0]
-        q3 = statistics.quantiles(values, n=4)[2]
+        q1, _, q3 = _as_window(values).quartiles()
         iqr = q3 - q1
         
         lower_bound = q1 - self.iqr_multiplier * iqr
@@ -214,13 +235,14 @@ class StatisticalAnomalyDetector:
         
         return is_anomaly, distance
     
-    def detect_mad_anomaly(self, values: List[float], new_value: float) -> Tuple[bool, float]:
+    def detect_mad_anomaly(self, values: WindowOrValues, new_value: float) -> Tuple[bool, float]:
         """Detect anomaly using Median Absolute Deviation method."""
         if len(values) < 3:
             return False, 0.0
         
-        median = statistics.median(values)
-        mad = statistics.median([abs(v - median) for v in values])
+        window = _as_window(values)
+        median = window.median()
+        mad = window.mad(median)
         
         if mad == 0:
             return False, 0.0
@@ -273,16 +295,19 @@ class TokenAnomalyTracker:
             timestamp = datetime.utcnow()
         
         price_float = float(price)
+        # Score against the 9 prices before this one, then record it
+        previous = self.price_buffer.window(9)
+        has_history = len(self.price_buffer.data) >= 9
+        is_anomaly, z_score = (
+            self.statistical_detector.detect_z_score_anomaly(previous, price_float) if has_history else (False, 0.0)
+        )
+        recent_mean = previous.mean
         self.price_buffer.add_point(timestamp, price, {"source": "price_update"})
         
         # Detect price spike/crash
-        if len(self.price_buffer.data) >= 10:
-            recent_prices = self.price_buffer.get_recent_values(10)
-            is_anomaly, z_score = self.statistical_detector.detect_z_score_anomaly(recent_prices[:-1], price_float)
-            
+        if has_history:
             if is_anomaly:
                 # Determine if spike or crash
-                recent_mean = statistics.mean(recent_prices[:-1])
                 
                 if price_float > recent_mean * 1.5:  # 50% increase
                     return self._create_alert(
@@ -312,15 +337,16 @@ class TokenAnomalyTracker:
             timestamp = datetime.utcnow()
         
         volume_float = float(volume)
+        previous = self.volume_buffer.window(9)
+        has_history = len(self.volume_buffer.data) >= 9
+        is_anomaly, z_score = (
+            self.statistical_detector.detect_z_score_anomaly(previous, volume_float) if has_history else (False, 0.0)
+        )
+        recent_mean = previous.mean
         self.volume_buffer.add_point(timestamp, volume, {"source": "volume_update"})
         
-        if len(self.volume_buffer.data) >= 10:
-            recent_volumes = self.volume_buffer.get_recent_values(10)
-            is_anomaly, z_score = self.statistical_detector.detect_z_score_anomaly(recent_volumes[:-1], volume_float)
-            
+        if has_history:
             if is_anomaly:
-                recent_mean = statistics.mean(recent_volumes[:-1])
-                
                 if volume_float > recent_mean * 3:  # 300% increase
                     return self._create_alert(
                         AnomalyType.VOLUME_SPIKE,
@@ -567,7 +593,7 @@ class TokenAnomalyTracker:
         
         # 3. Volume spike before crash
         if len(recent_volume) >= 5:
-            recent_avg_volume = statistics.mean(recent_volume[-5:-1])
+            recent_avg_volume = sum(recent_volume[-5:-1]) / 4
             latest_volume = recent_volume[-1]
             if latest_volume > recent_avg_volume * 5:  # 500% volume spike
                 rug_indicators += 2
@@ -718,6 +744,23 @@ class AnomalyDetectionSystem:
         
         return alert
     
+    def attach_price_bus(self, tick_bus) -> None:
+        """Feed USD-denominated price bus ticks into the token trackers."""
+        tick_bus.subscribe(
+            "anomaly_detection",
+            self._on_price_tick,
+            accept=lambda tick: tick.price_usd is not None,
+        )
+    
+    async def _on_price_tick(self, tick) -> None:
+        """Price bus handler."""
+        await self.process_price_update(
+            tick.token_address,
+            tick.chain,
+            tick.price_usd,
+            datetime.utcfromtimestamp(tick.timestamp)
+        )
+    
     async def process_volume_update(self,
                                   token_address: str,
                                   chain: str,
@@ -20,20 +20,20 @@ import asyncio
 import json
 import logging
 import math
-import statistics
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-from scipy import stats
-from scipy.stats import entropy
 
 import logging
 from ..core.settings import settings
+from . import indicators
+from .indicators import IndicatorStream
+from .rolling_stats import RollingWindow
 
 logger = logging.getLogger(__name__)
 
@@ -121,6 +121,80 @@ class MarketFeatures:
     token_address: str = ""
 
 
+# Numeric MarketFeatures fields, in FeatureMatrix column order
+FEATURE_COLUMNS: Tuple[str, ...] = (
+    "price", "price_change_1m", "price_change_5m", "price_change_15m", "price_change_1h",
+    "volatility_5m", "volatility_1h",
+    "volume", "volume_ma_5", "volume_ma_15", "volume_ratio_5m", "volume_trend",
+    "liquidity", "liquidity_change_5m", "liquidity_change_1h", "bid_ask_spread", "market_depth",
+    "rsi_14", "macd", "macd_signal", "bb_upper", "bb_lower", "bb_position",
+    "holder_count", "top_10_concentration", "whale_activity_1h", "new_buyers_5m",
+    "social_score", "fear_greed_index", "news_sentiment",
+    "btc_correlation", "eth_correlation",
+)
+_COLUMN_INDEX = {name: index for index, name in enumerate(FEATURE_COLUMNS)}
+_DECIMAL_COLUMNS = frozenset({
+    "price", "volume", "volume_ma_5", "volume_ma_15", "liquidity", "market_depth", "bb_upper", "bb_lower",
+})
+_INT_COLUMNS = frozenset({"holder_count", "whale_activity_1h", "new_buyers_5m"})
+
+
+@dataclass
+class FeatureMatrix:
+    """Engineered features for a batch of tokens as one float64 matrix.
+    
+    Row i holds token ``tokens[i]``; columns follow ``FEATURE_COLUMNS``.
+    Exact Decimal prices are kept alongside for price arithmetic.
+    """
+    
+    tokens: List[Tuple[str, str]]  # (token_address, chain)
+    values: np.ndarray
+    prices: List[Decimal]
+    market_cap_ranks: List[Optional[int]]
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    
+    def __len__(self) -> int:
+        return len(self.tokens)
+    
+    def column(self, name: str) -> np.ndarray:
+        """One feature across all tokens."""
+        return self.values[:, _COLUMN_INDEX[name]]
+    
+    @classmethod
+    def from_features(cls, features: List[MarketFeatures]) -> "FeatureMatrix":
+        """Stack per-token MarketFeatures into a matrix."""
+        values = np.array(
+            [[float(getattr(f, name)) for name in FEATURE_COLUMNS] for f in features],
+            dtype=np.float64
+        ).reshape(len(features), len(FEATURE_COLUMNS))
+        return cls(
+            tokens=[(f.token_address, f.chain) for f in features],
+            values=values,
+            prices=[f.price for f in features],
+            market_cap_ranks=[f.market_cap_rank for f in features],
+        )
+    
+    def features(self, index: int) -> MarketFeatures:
+        """Rebuild the MarketFeatures of one row."""
+        kwargs: Dict[str, Any] = {}
+        for name, value in zip(FEATURE_COLUMNS, self.values[index].tolist()):
+            if name in _DECIMAL_COLUMNS:
+                kwargs[name] = Decimal(str(value))
+            elif name in _INT_COLUMNS:
+                kwargs[name] = int(value)
+            else:
+                kwargs[name] = value
+        kwargs["price"] = self.prices[index]
+        token_address, chain = self.tokens[index]
+        return MarketFeatures(
+            **kwargs,
+            market_cap_rank=self.market_cap_ranks[index],
+            timestamp=self.timestamp,
+            chain=chain,
+            token_address=token_address
+        )
+
+
 @dataclass
 class PredictionResult:
     """Result from a single model prediction."""
@@ -173,6 +247,9 @@ class FeatureEngineering:
     def __init__(self) -> None:
         """Initialize feature engineering system."""
         self.feature_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=1000))
+        # Indicators kept in step with feature_history, one tick at a time
+        self.indicator_streams: Dict[str, IndicatorStream] = defaultdict(self._new_indicator_stream)
+        self.volume_windows: Dict[str, RollingWindow] = defaultdict(lambda: RollingWindow(1000))
         self.feature_importance_cache: Dict[str, Dict[str, float]] = {}
         
         logger.info("Feature engineering system initialized")
@@ -195,102 +272,141 @@ class FeatureEngineering:
             MarketFeatures: Engineered features for ML models
         """
         try:
-            # Extract basic price/volume data
-            price = Decimal(str(raw_data.get("price", 1.0)))
-            volume = Decimal(str(raw_data.get("volume", 0)))
-            liquidity = Decimal(str(raw_data.get("liquidity", 0)))
+            return MarketFeatures(**self._feature_values(token_address, chain, raw_data))
+        except Exception as e:
+            logger.error(f"Feature engineering failed for {token_address}: {e}")
+            # Return minimal features on error
+            return self._create_minimal_features(token_address, chain, raw_data)
+    
+    async def engineer_feature_matrix(
+        self,
+        requests: List[Tuple[str, str, Dict[str, Any]]]
+    ) -> FeatureMatrix:
+        """
+        Engineer features for many tokens into one matrix.
+        
+        Rows follow ``requests`` order; a token listed twice sees its first
+        row's update in its second. Per-token work is constant time (streaming
+        indicators and rolling volume windows), so a burst of new pairs costs
+        one call rather than one ``engineer_features`` await per token.
+        
+        Args:
+            requests: (token_address, chain, raw_data) per token
             
-            # Get historical data for calculations
-            history_key = f"{chain}:{token_address}"
-            price_history = self._get_price_history(history_key)
-            volume_history = self._get_volume_history(history_key)
+        Returns:
+            FeatureMatrix: Engineered features, one row per request
+        """
+        rows: List[List[float]] = []
+        prices: List[Decimal] = []
+        ranks: List[Optional[int]] = []
+        for token_address, chain, raw_data in requests:
+            try:
+                values = self._feature_values(token_address, chain, raw_data)
+            except Exception as e:
+                logger.error(f"Feature engineering failed for {token_address}: {e}")
+                values = vars(self._create_minimal_features(token_address, chain, raw_data))
+            rows.append([float(values[name]) for name in FEATURE_COLUMNS])
+            prices.append(values["price"])
+            ranks.append(values["market_cap_rank"])
+        
+        return FeatureMatrix(
+            tokens=[(token_address, chain) for token_address, chain, _ in requests],
+            values=np.array(rows, dtype=np.float64).reshape(len(rows), len(FEATURE_COLUMNS)),
+            prices=prices,
+            market_cap_ranks=ranks,
+        )
+    
+    def _feature_values(self, token_address: str, chain: str, raw_data: Dict[str, Any]) -> Dict[str, Any]:
+        """MarketFeatures field values for one token; records the token's new price and volume."""
+        # Extract basic price/volume data
+        price = Decimal(str(raw_data.get("price", 1.0)))
+        volume = Decimal(str(raw_data.get("volume", 0)))
+        liquidity = Decimal(str(raw_data.get("liquidity", 0)))
+        
+        # Recent history and rolling state for calculations
+        history_key = f"{chain}:{token_address}"
+        price_history = self._get_price_history(history_key, count=4)
+        stream = self.indicator_streams.get(history_key)
+        volume_window = self.volume_windows.get(history_key)
+        
+        # Calculate price features
+        price_changes = self._calculate_price_changes(price, price_history)
+        volatility_metrics = self._calculate_volatility(price_history, stream)
+        
+        # Calculate volume features
+        volume_metrics = self._calculate_volume_metrics(volume, volume_window or [])
+        
+        # Calculate technical indicators
+        technical_indicators = self._calculate_technical_indicators(price_history, stream)
+        
+        # Calculate market structure features
+        market_structure = self._calculate_market_structure(raw_data)
+        
+        # Update history
+        self._update_history(history_key, price, volume)
+        
+        return dict(
+            # Price features
+            price=price,
+            price_change_1m=price_changes.get("1m", 0.0),
+            price_change_5m=price_changes.get("5m", 0.0),
+            price_change_15m=price_changes.get("15m", 0.0),
+            price_change_1h=price_changes.get("1h", 0.0),
+            volatility_5m=volatility_metrics.get("5m", 0.0),
+            volatility_1h=volatility_metrics.get("1h", 0.0),
             
-            # Calculate price features
-            price_changes = self._calculate_price_changes(price, price_history)
-            volatility_metrics = self._calculate_volatility(price_history)
+            # Volume features
+            volume=volume,
+            volume_ma_5=volume_metrics.get("ma_5", volume),
+            volume_ma_15=volume_metrics.get("ma_15", volume),
+            volume_ratio_5m=volume_metrics.get("ratio_5m", 1.0),
+            volume_trend=volume_metrics.get("trend", 0.0),
             
-            # Calculate volume features
-            volume_metrics = self._calculate_volume_metrics(volume, volume_history)
+            # Liquidity features
+            liquidity=liquidity,
+            liquidity_change_5m=raw_data.get("liquidity_change_5m", 0.0),
+            liquidity_change_1h=raw_data.get("liquidity_change_1h", 0.0),
+            bid_ask_spread=raw_data.get("bid_ask_spread", 0.01),
+            market_depth=Decimal(str(raw_data.get("market_depth", liquidity))),
             
-            # Calculate technical indicators
-            technical_indicators = self._calculate_technical_indicators(price_history)
+            # Technical indicators
+            rsi_14=technical_indicators.get("rsi_14", 50.0),
+            macd=technical_indicators.get("macd", 0.0),
+            macd_signal=technical_indicators.get("macd_signal", 0.0),
+            bb_upper=technical_indicators.get("bb_upper", price * Decimal("1.02")),
+            bb_lower=technical_indicators.get("bb_lower", price * Decimal("0.98")),
+            bb_position=technical_indicators.get("bb_position", 0.5),
             
-            # Calculate market structure features
-            market_structure = self._calculate_market_structure(raw_data)
+            # Market structure
+            holder_count=market_structure.get("holder_count", 1000),
+            top_10_concentration=market_structure.get("top_10_concentration", 0.3),
+            whale_activity_1h=market_structure.get("whale_activity_1h", 0),
+            new_buyers_5m=market_structure.get("new_buyers_5m", 0),
             
-            # Update history
-            self._update_history(history_key, price, volume)
+            # Sentiment (mock values for now)
+            social_score=raw_data.get("social_score", 0.5),
+            fear_greed_index=raw_data.get("fear_greed_index", 50.0),
+            news_sentiment=raw_data.get("news_sentiment", 0.5),
             
-            return MarketFeatures(
-                # Price features
-                price=price,
-                price_change_1m=price_changes.get("1m", 0.0),
-                price_change_5m=price_changes.get("5m", 0.0),
-                price_change_15m=price_changes.get("15m", 0.0),
-                price_change_1h=price_changes.get("1h", 0.0),
-                volatility_5m=volatility_metrics.get("5m", 0.0),
-                volatility_1h=volatility_metrics.get("1h", 0.0),
-                
-                # Volume features
-                volume=volume,
-                volume_ma_5=volume_metrics.get("ma_5", volume),
-                volume_ma_15=volume_metrics.get("ma_15", volume),
-                volume_ratio_5m=volume_metrics.get("ratio_5m", 1.0),
-                volume_trend=volume_metrics.get("trend", 0.0),
-                
-                # Liquidity features
-                liquidity=liquidity,
-                liquidity_change_5m=raw_data.get("liquidity_change_5m", 0.0),
-                liquidity_change_1h=raw_data.get("liquidity_change_1h", 0.0),
-                bid_ask_spread=raw_data.get("bid_ask_spread", 0.01),
-                market_depth=Decimal(str(raw_data.get("market_depth", liquidity))),
-                
-                # Technical indicators
-                rsi_14=technical_indicators.get("rsi_14", 50.0),
-                macd=technical_indicators.get("macd", 0.0),
-                macd_signal=technical_indicators.get("macd_signal", 0.0),
-                bb_upper=technical_indicators.get("bb_upper", price * Decimal("1.02")),
-                bb_lower=technical_indicators.get("bb_lower", price * Decimal("0.98")),
-                bb_position=technical_indicators.get("bb_position", 0.5),
-                
-                # Market structure
-                holder_count=market_structure.get("holder_count", 1000),
-                top_10_concentration=market_structure.get("top_10_concentration", 0.3),
-                whale_activity_1h=market_structure.get("whale_activity_1h", 0),
-                new_buyers_5m=market_structure.get("new_buyers_5m", 0),
-                
-                # Sentiment (mock values for now)
-                social_score=raw_data.get("social_score", 0.5),
-                fear_greed_index=raw_data.get("fear_greed_index", 50.0),
-                news_sentiment=raw_data.get("news_sentiment", 0.5),
-                
-                # Correlations (mock values)
-                btc_correlation=raw_data.get("btc_correlation", 0.3),
-                eth_correlation=raw_data.get("eth_correlation", 0.5),
-                market_cap_rank=raw_data.get("market_cap_rank"),
-                
-                # Metadata
-                timestamp=datetime.utcnow(),
-                chain=chain,
-                token_address=token_address
-            )
+            # Correlations (mock values)
+            btc_correlation=raw_data.get("btc_correlation", 0.3),
+            eth_correlation=raw_data.get("eth_correlation", 0.5),
+            market_cap_rank=raw_data.get("market_cap_rank"),
             
-        except Exception as e:
-            logger.error(f"Feature engineering failed for {token_address}: {e}")
-            # Return minimal features on error
-            return self._create_minimal_features(token_address, chain, raw_data)
-    
-    def _get_price_history(self, history_key: str) -> List[float]:
-        """Get price history for calculations."""
-        if history_key not in self.feature_history:
-            return []
-        return [float(p) for p, v, t in self.feature_history[history_key]]
+            # Metadata
+            timestamp=datetime.utcnow(),
+            chain=chain,
+            token_address=token_address
+        )
     
-    def _get_volume_history(self, history_key: str) -> List[float]:
-        """Get volume history for calculations."""
+    def _get_price_history(self, history_key: str, count: Optional[int] = None) -> List[float]:
+        """Get price history (or its last ``count`` entries) for calculations."""
         if history_key not in self.feature_history:
             return []
-        return [float(v) for p, v, t in self.feature_history[history_key]]
+        history = self.feature_history[history_key]
+        if count is not None and count < len(history):
+            return [float(history[i][0]) for i in range(len(history) - count, len(history))]
+        return [float(p) for p, v, t in history]
     
     def _calculate_price_changes(self, current_price: Decimal, history: List[float]) -> Dict[str, float]:
         """Calculate price changes over different timeframes."""
@@ -310,31 +426,33 @@ class FeatureEngineering:
         
         return changes
     
-    def _calculate_volatility(self, history: List[float]) -> Dict[str, float]:
+    def _calculate_volatility(
+        self,
+        history: List[float],
+        stream: Optional[IndicatorStream] = None
+    ) -> Dict[str, float]:
         """Calculate volatility over different timeframes."""
         if len(history) < 2:
             return {"5m": 0.0, "1h": 0.0}
         
-        # Calculate returns
-        returns = []
-        for i in range(1, len(history)):
-            if history[i-1] > 0:
-                returns.append((history[i] - history[i-1]) / history[i-1])
-        
-        if not returns:
-            return {"5m": 0.0, "1h": 0.0}
-        
-        # Calculate volatility (standard deviation of returns)
-        volatility = statistics.stdev(returns) if len(returns) > 1 else 0.0
+        # Standard deviation of returns
+        if stream is not None:
+            volatility = stream.volatility
+        else:
+            volatility = float(indicators.volatility(history)[0])
         
         return {
             "5m": volatility,
             "1h": volatility * math.sqrt(12)  # Scale for longer timeframe
         }
     
-    def _calculate_volume_metrics(self, current_volume: Decimal, history: List[float]) -> Dict[str, Any]:
-        """Calculate volume-based metrics."""
-        if not history:
+    def _calculate_volume_metrics(
+        self,
+        current_volume: Decimal,
+        history: Union[List[float], RollingWindow]
+    ) -> Dict[str, Any]:
+        """Calculate volume-based metrics from a volume history or its rolling window."""
+        if not len(history):
             return {
                 "ma_5": current_volume,
                 "ma_15": current_volume,
@@ -342,22 +460,21 @@ class FeatureEngineering:
                 "trend": 0.0
             }
         
+        window = history if isinstance(history, RollingWindow) else None
+        if window is None:
+            window = RollingWindow(len(history))
+            for value in history:
+                window.append(value)
+        
         # Moving averages
-        ma_5 = statistics.mean(history[-5:]) if len(history) >= 5 else float(current_volume)
-        ma_15 = statistics.mean(history[-15:]) if len(history) >= 15 else float(current_volume)
+        ma_5 = float(window.tail(5).mean()) if len(window) >= 5 else float(current_volume)
+        ma_15 = float(window.tail(15).mean()) if len(window) >= 15 else float(current_volume)
         
         # Volume ratio
         ratio_5m = float(current_volume) / ma_5 if ma_5 > 0 else 1.0
         
         # Volume trend (simple linear regression slope)
-        trend = 0.0
-        if len(history) >= 3:
-            x = list(range(len(history)))
-            try:
-                slope, _, _, _, _ = stats.linregress(x, history)
-                trend = slope
-            except Exception:
-                trend = 0.0
+        trend = window.slope() if len(window) >= 3 else 0.0
         
         return {
             "ma_5": Decimal(str(ma_5)),
@@ -366,9 +483,18 @@ class FeatureEngineering:
             "trend": trend
         }
     
-    def _calculate_technical_indicators(self, history: List[float]) -> Dict[str, Any]:
-        """Calculate technical indicators."""
-        if len(history) < 14:
+    def _calculate_technical_indicators(
+        self,
+        history: List[float],
+        stream: Optional[IndicatorStream] = None
+    ) -> Dict[str, Any]:
+        """Calculate technical indicators.
+        
+        Reads the token's streaming indicators when given (they cover the same
+        history), otherwise computes them from the history in one batch.
+        """
+        count = stream.count if stream is not None else len(history)
+        if count < 14:
             current_price = history[-1] if history else 1.0
             return {
                 "rsi_14": 50.0,
@@ -379,80 +505,42 @@ class FeatureEngineering:
                 "bb_position": 0.5
             }
         
-        # RSI calculation (simplified)
-        rsi = self._calculate_rsi(history, 14)
-        
-        # MACD calculation (simplified)
-        ema_12 = self._calculate_ema(history, 12)
-        ema_26 = self._calculate_ema(history, 26)
-        macd = ema_12 - ema_26
+        current_price = history[-1]
+        if stream is not None:
+            rsi = stream.rsi
+            macd = stream.ema(12) - stream.ema(26)
+            bands = stream.bollinger()
+        else:
+            prices = np.asarray(history, dtype=np.float64)
+            rsi = float(indicators.rsi_last(prices, 14)[0])
+            macd = float(indicators.ema(prices, 12, seed="first")[0, -1] - indicators.ema(prices, 26, seed="first")[0, -1])
+            middle, upper, lower, position = indicators.bollinger_last(prices, 20, ddof=1)
+            bands = None if np.isnan(middle[0]) else (middle[0], upper[0], lower[0], position[0])
+        
+        if rsi is None or math.isnan(rsi):
+            rsi = 50.0
         macd_signal = macd * 0.9  # Simplified signal line
         
-        # Bollinger Bands
-        sma_20 = statistics.mean(history[-20:]) if len(history) >= 20 else history[-1]
-        std_20 = statistics.stdev(history[-20:]) if len(history) >= 20 else 0.0
-        bb_upper = Decimal(str(sma_20 + 2 * std_20))
-        bb_lower = Decimal(str(sma_20 - 2 * std_20))
-        
-        # BB position (where current price sits in the bands)
-        current_price = history[-1]
-        bb_position = 0.5
-        if bb_upper > bb_lower:
-            bb_position = (current_price - float(bb_lower)) / (float(bb_upper) - float(bb_lower))
-            bb_position = max(0.0, min(1.0, bb_position))
+        # Bollinger Bands (collapsed onto the last price until 20 points exist)
+        if bands is None:
+            bands = (current_price, current_price, current_price, 0.5)
+        _, upper_band, lower_band, bb_position = bands
+        bb_upper = Decimal(str(float(upper_band)))
+        bb_lower = Decimal(str(float(lower_band)))
         
         return {
-            "rsi_14": rsi,
-            "macd": macd,
-            "macd_signal": macd_signal,
+            "rsi_14": float(rsi),
+            "macd": float(macd),
+            "macd_signal": float(macd_signal),
             "bb_upper": bb_upper,
             "bb_lower": bb_lower,
-            "bb_position": bb_position
+            "bb_position": max(0.0, min(1.0, float(bb_position)))
         }
     
-    def _calculate_rsi(self, prices: List[float], period: int) -> float:
-        """Calculate RSI (Relative Strength Index)."""
-        if len(prices) < period + 1:
-            return 50.0
-        
-        gains = []
-        losses = []
-        
-        for i in range(1, len(prices)):
-            change = prices[i] - prices[i-1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(-change)
-        
-        if len(gains) < period:
-            return 50.0
-        
-        avg_gain = statistics.mean(gains[-period:])
-        avg_loss = statistics.mean(losses[-period:])
-        
-        if avg_loss == 0:
-            return 100.0
-        
-        rs = avg_gain / avg_loss
-        rsi = 100 - (100 / (1 + rs))
-        
-        return rsi
-    
-    def _calculate_ema(self, prices: List[float], period: int) -> float:
-        """Calculate Exponential Moving Average."""
-        if len(prices) < period:
-            return statistics.mean(prices) if prices else 0.0
-        
-        multiplier = 2 / (period + 1)
-        ema = prices[0]
-        
-        for price in prices[1:]:
-            ema = (price * multiplier) + (ema * (1 - multiplier))
-        
-        return ema
+    @staticmethod
+    def _new_indicator_stream() -> IndicatorStream:
+        """Streaming indicators with this module's conventions (first-price EMA seed, sample band deviation)."""
+        return IndicatorStream(ema_periods=(12, 26), ema_seed="first", bb_ddof=1, volatility_window=999)
     
     def _calculate_market_structure(self, raw_data: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate market structure features."""
@@ -467,6 +555,8 @@ class FeatureEngineering:
         """Update price/volume history."""
         timestamp = datetime.utcnow()
         self.feature_history[history_key].append((price, volume, timestamp))
+        self.indicator_streams[history_key].update(float(price))
+        self.volume_windows[history_key].append(float(volume))
     
     def _create_minimal_features(self, token_address: str, chain: str, raw_data: Dict[str, Any]) -> MarketFeatures:
         """Create minimal features when engineering fails."""
@@ -513,6 +603,62 @@ class FeatureEngineering:
         )
 
 
+_erf = np.vectorize(math.erf, otypes=[float])
+
+
+def _prediction_results(
+    model_type: ModelType,
+    horizon: PredictionHorizon,
+    matrix: FeatureMatrix,
+    model_version: str,
+    price_change: np.ndarray,
+    confidence: np.ndarray,
+    probability_up: np.ndarray,
+    risk_estimate: np.ndarray,
+    feature_importance: Dict[str, np.ndarray],
+    fallback: Callable[[MarketFeatures, PredictionHorizon], PredictionResult]
+) -> List[PredictionResult]:
+    """Turn per-token model output arrays into PredictionResults.
+    
+    Rows with non-finite output get the model's fallback prediction, as a
+    failed single-token prediction would.
+    """
+    predicted = matrix.column("price") * (1 + price_change)
+    valid = (
+        np.isfinite(predicted) & np.isfinite(confidence)
+        & np.isfinite(probability_up) & np.isfinite(risk_estimate)
+    )
+    names = list(feature_importance)
+    importance_rows = np.column_stack(
+        [np.broadcast_to(feature_importance[name], predicted.shape) for name in names]
+    ).tolist() if names else [[] for _ in range(len(matrix))]
+    
+    now = datetime.utcnow()
+    results = []
+    for index, (ok, price, change, conf, prob_up, risk, importance) in enumerate(zip(
+        valid.tolist(), predicted.tolist(), price_change.tolist(), confidence.tolist(),
+        probability_up.tolist(), risk_estimate.tolist(), importance_rows
+    )):
+        if not ok:
+            logger.error(f"{model_type.value} prediction failed for {matrix.tokens[index][0]}: non-finite output")
+            results.append(fallback(matrix.features(index), horizon))
+            continue
+        results.append(PredictionResult(
+            model_type=model_type,
+            prediction_horizon=horizon,
+            predicted_price=Decimal(str(price)),
+            confidence=conf,
+            probability_up=prob_up,
+            probability_down=1.0 - prob_up,
+            expected_return=change,
+            risk_estimate=risk,
+            feature_importance=dict(zip(names, importance)),
+            model_version=model_version,
+            timestamp=now
+        ))
+    return results
+
+
 class StatisticalModel:
     """Statistical prediction model using traditional time series analysis."""
     
@@ -534,90 +680,88 @@ class StatisticalModel:
         Args:
             features: Engineered market features
             horizon: Prediction time horizon
-            
+        
         Returns:
             PredictionResult: Statistical model prediction
         """
         try:
-            # Simple statistical model using multiple indicators
-            current_price = float(features.price)
-            
-            # Momentum indicators
-            momentum_score = (
-                features.price_change_5m * 0.3 +
-                features.price_change_15m * 0.5 +
-                features.price_change_1h * 0.2
-            )
-            
-            # Mean reversion indicators
-            mean_reversion_score = 0.0
-            if features.bb_position > 0.8:  # Overbought
-                mean_reversion_score = -0.1
-            elif features.bb_position < 0.2:  # Oversold
-                mean_reversion_score = 0.1
-            
-            # RSI signal
-            rsi_signal = 0.0
-            if features.rsi_14 > 70:  # Overbought
-                rsi_signal = -0.05
-            elif features.rsi_14 < 30:  # Oversold
-                rsi_signal = 0.05
-            
-            # Volume confirmation
-            volume_confirmation = min(features.volume_ratio_5m - 1.0, 0.1) * 0.1
-            
-            # Liquidity impact
-            liquidity_impact = min(features.liquidity_change_1h, 0.05) * 0.1
-            
-            # Combine signals
-            total_signal = (
-                momentum_score * 0.4 +
-                mean_reversion_score * 0.2 +
-                rsi_signal * 0.2 +
-                volume_confirmation * 0.1 +
-                liquidity_impact * 0.1
-            )
-            
-            # Calculate predicted price
-            horizon_multiplier = self._get_horizon_multiplier(horizon)
-            price_change = total_signal * horizon_multiplier
-            predicted_price = Decimal(str(current_price * (1 + price_change)))
-            
-            # Calculate probabilities
-            volatility = max(features.volatility_1h, 0.01)
-            prob_up = self._calculate_probability_up(total_signal, volatility)
-            prob_down = 1.0 - prob_up
-            
-            # Calculate confidence based on signal strength and data quality
-            confidence = self._calculate_confidence(features, total_signal)
-            
-            # Feature importance
-            feature_importance = {
-                "momentum": abs(momentum_score * 0.4),
-                "mean_reversion": abs(mean_reversion_score * 0.2),
-                "rsi": abs(rsi_signal * 0.2),
-                "volume": abs(volume_confirmation * 0.1),
-                "liquidity": abs(liquidity_impact * 0.1)
-            }
-            
-            return PredictionResult(
-                model_type=ModelType.STATISTICAL,
-                prediction_horizon=horizon,
-                predicted_price=predicted_price,
-                confidence=confidence,
-                probability_up=prob_up,
-                probability_down=prob_down,
-                expected_return=price_change,
-                risk_estimate=volatility * horizon_multiplier,
-                feature_importance=feature_importance,
-                model_version=self.model_version,
-                timestamp=datetime.utcnow()
-            )
-            
+            return (await self.predict_batch(FeatureMatrix.from_features([features]), horizon))[0]
         except Exception as e:
             logger.error(f"Statistical prediction failed: {e}")
             return self._create_fallback_prediction(features, horizon)
     
+    async def predict_batch(self, matrix: FeatureMatrix, horizon: PredictionHorizon) -> List[PredictionResult]:
+        """
+        Make statistical predictions for every token in a feature matrix.
+        
+        Args:
+            matrix: Engineered features, one row per token
+            horizon: Prediction time horizon
+        
+        Returns:
+            List[PredictionResult]: One prediction per row
+        """
+        price_change_5m = matrix.column("price_change_5m")
+        bb_position = matrix.column("bb_position")
+        rsi = matrix.column("rsi_14")
+        volume_ratio = matrix.column("volume_ratio_5m")
+        volatility_1h = matrix.column("volatility_1h")
+        
+        # Momentum indicators
+        momentum_score = (
+            price_change_5m * 0.3 +
+            matrix.column("price_change_15m") * 0.5 +
+            matrix.column("price_change_1h") * 0.2
+        )
+        
+        # Mean reversion indicators (overbought / oversold bands)
+        mean_reversion_score = np.select([bb_position > 0.8, bb_position < 0.2], [-0.1, 0.1], 0.0)
+        
+        # RSI signal
+        rsi_signal = np.select([rsi > 70, rsi < 30], [-0.05, 0.05], 0.0)
+        
+        # Volume confirmation
+        volume_confirmation = np.minimum(volume_ratio - 1.0, 0.1) * 0.1
+        
+        # Liquidity impact
+        liquidity_impact = np.minimum(matrix.column("liquidity_change_1h"), 0.05) * 0.1
+        
+        # Combine signals
+        total_signal = (
+            momentum_score * 0.4 +
+            mean_reversion_score * 0.2 +
+            rsi_signal * 0.2 +
+            volume_confirmation * 0.1 +
+            liquidity_impact * 0.1
+        )
+        
+        # Calculate predicted price change
+        horizon_multiplier = self._get_horizon_multiplier(horizon)
+        price_change = total_signal * horizon_multiplier
+        
+        # Calculate probabilities
+        volatility = np.maximum(volatility_1h, 0.01)
+        prob_up = self._calculate_probability_up(total_signal, volatility)
+        
+        # Calculate confidence based on signal strength and data quality
+        confidence = self._calculate_confidence(volume_ratio, volatility_1h, total_signal)
+        
+        return _prediction_results(
+            ModelType.STATISTICAL, horizon, matrix, self.model_version,
+            price_change=price_change,
+            confidence=confidence,
+            probability_up=prob_up,
+            risk_estimate=volatility * horizon_multiplier,
+            feature_importance={
+                "momentum": np.abs(momentum_score * 0.4),
+                "mean_reversion": np.abs(mean_reversion_score * 0.2),
+                "rsi": np.abs(rsi_signal * 0.2),
+                "volume": np.abs(volume_confirmation * 0.1),
+                "liquidity": np.abs(liquidity_impact * 0.1)
+            },
+            fallback=self._create_fallback_prediction
+        )
+    
     def _get_horizon_multiplier(self, horizon: PredictionHorizon) -> float:
         """Get multiplier based on prediction horizon."""
         multipliers = {
@@ -629,28 +773,34 @@ class StatisticalModel:
         }
         return multipliers.get(horizon, 1.0)
     
-    def _calculate_probability_up(self, signal: float, volatility: float) -> float:
+    def _calculate_probability_up(self, signal: np.ndarray, volatility: np.ndarray) -> np.ndarray:
         """Calculate probability of price increase."""
         # Use normal distribution to estimate probability
-        z_score = signal / volatility if volatility > 0 else 0
-        prob_up = 0.5 + 0.5 * math.erf(z_score / math.sqrt(2))
-        return max(0.1, min(0.9, prob_up))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z_score = np.where(volatility > 0, signal / volatility, 0.0)
+        prob_up = 0.5 + 0.5 * _erf(z_score / math.sqrt(2))
+        return np.clip(prob_up, 0.1, 0.9)
     
-    def _calculate_confidence(self, features: MarketFeatures, signal: float) -> float:
+    def _calculate_confidence(
+        self,
+        volume_ratio: np.ndarray,
+        volatility_1h: np.ndarray,
+        signal: np.ndarray
+    ) -> np.ndarray:
         """Calculate prediction confidence."""
         base_confidence = 0.6
         
         # Higher confidence with stronger signals
-        signal_confidence = min(abs(signal) * 2, 0.2)
+        signal_confidence = np.minimum(np.abs(signal) * 2, 0.2)
         
         # Higher confidence with more volume
-        volume_confidence = min(features.volume_ratio_5m - 1.0, 0.1) * 0.1
+        volume_confidence = np.minimum(volume_ratio - 1.0, 0.1) * 0.1
         
         # Lower confidence with high volatility
-        volatility_penalty = min(features.volatility_1h * 2, 0.2)
+        volatility_penalty = np.minimum(volatility_1h * 2, 0.2)
         
         confidence = base_confidence + signal_confidence + volume_confidence - volatility_penalty
-        return max(0.1, min(0.9, confidence))
+        return np.clip(confidence, 0.1, 0.9)
     
     def _create_fallback_prediction(self, features: MarketFeatures, horizon: PredictionHorizon) -> PredictionResult:
         """Create fallback prediction when main prediction fails."""
@@ -692,106 +842,86 @@ class LSTMModel:
         use TensorFlow/PyTorch for actual LSTM implementation.
         """
         try:
-            # Convert features to sequence (simplified)
-            feature_vector = self._features_to_vector(features)
-            
-            # Simulate LSTM prediction using weighted moving average with trend
-            current_price = float(features.price)
-            
-            # LSTM-style prediction using recent price changes and patterns
-            trend_component = (
-                features.price_change_5m * 0.4 +
-                features.price_change_15m * 0.3 +
-                features.price_change_1h * 0.3
-            )
-            
-            # Pattern recognition (simplified)
-            pattern_component = self._detect_patterns(features)
-            
-            # Long-term memory component
-            memory_component = features.price_change_1h * 0.2
-            
-            # Combine components
-            total_prediction = (
-                trend_component * 0.5 +
-                pattern_component * 0.3 +
-                memory_component * 0.2
-            )
-            
-            # Apply horizon scaling
-            horizon_scale = self._get_lstm_horizon_scale(horizon)
-            price_change = total_prediction * horizon_scale
-            
-            predicted_price = Decimal(str(current_price * (1 + price_change)))
-            
-            # Calculate confidence (LSTM typically has higher confidence with more data)
-            confidence = self._calculate_lstm_confidence(features)
-            
-            # Probabilities based on prediction strength
-            if price_change > 0:
-                prob_up = 0.5 + min(abs(price_change) * 10, 0.4)
-            else:
-                prob_up = 0.5 - min(abs(price_change) * 10, 0.4)
-            prob_down = 1.0 - prob_up
-            
-            feature_importance = {
-                "trend": abs(trend_component * 0.5),
-                "patterns": abs(pattern_component * 0.3),
-                "memory": abs(memory_component * 0.2),
-                "volume_pattern": features.volume_ratio_5m * 0.1
-            }
-            
-            return PredictionResult(
-                model_type=ModelType.LSTM,
-                prediction_horizon=horizon,
-                predicted_price=predicted_price,
-                confidence=confidence,
-                probability_up=prob_up,
-                probability_down=prob_down,
-                expected_return=price_change,
-                risk_estimate=features.volatility_1h * horizon_scale,
-                feature_importance=feature_importance,
-                model_version=self.model_version,
-                timestamp=datetime.utcnow()
-            )
-            
+            return (await self.predict_batch(FeatureMatrix.from_features([features]), horizon))[0]
         except Exception as e:
             logger.error(f"LSTM prediction failed: {e}")
             return self._create_lstm_fallback(features, horizon)
     
-    def _features_to_vector(self, features: MarketFeatures) -> List[float]:
-        """Convert features to numerical vector."""
-        return [
-            features.price_change_1m,
-            features.price_change_5m,
-            features.price_change_15m,
-            features.price_change_1h,
-            features.volatility_5m,
-            features.volume_ratio_5m,
-            features.rsi_14 / 100.0,
-            features.bb_position,
-            features.liquidity_change_5m
-        ]
-    
-    def _detect_patterns(self, features: MarketFeatures) -> float:
+    async def predict_batch(self, matrix: FeatureMatrix, horizon: PredictionHorizon) -> List[PredictionResult]:
+        """Make LSTM-based predictions for every token in a feature matrix."""
+        price_change_5m = matrix.column("price_change_5m")
+        price_change_15m = matrix.column("price_change_15m")
+        price_change_1h = matrix.column("price_change_1h")
+        volume_ratio = matrix.column("volume_ratio_5m")
+        
+        # LSTM-style prediction using recent price changes and patterns
+        trend_component = (
+            price_change_5m * 0.4 +
+            price_change_15m * 0.3 +
+            price_change_1h * 0.3
+        )
+        
+        # Pattern recognition (simplified)
+        pattern_component = self._detect_patterns(matrix)
+        
+        # Long-term memory component
+        memory_component = price_change_1h * 0.2
+        
+        # Combine components
+        total_prediction = (
+            trend_component * 0.5 +
+            pattern_component * 0.3 +
+            memory_component * 0.2
+        )
+        
+        # Apply horizon scaling
+        horizon_scale = self._get_lstm_horizon_scale(horizon)
+        price_change = total_prediction * horizon_scale
+        
+        # Calculate confidence (LSTM typically has higher confidence with more data)
+        confidence = self._calculate_lstm_confidence(matrix)
+        
+        # Probabilities based on prediction strength
+        step = np.minimum(np.abs(price_change) * 10, 0.4)
+        prob_up = np.where(price_change > 0, 0.5 + step, 0.5 - step)
+        
+        return _prediction_results(
+            ModelType.LSTM, horizon, matrix, self.model_version,
+            price_change=price_change,
+            confidence=confidence,
+            probability_up=prob_up,
+            risk_estimate=matrix.column("volatility_1h") * horizon_scale,
+            feature_importance={
+                "trend": np.abs(trend_component * 0.5),
+                "patterns": np.abs(pattern_component * 0.3),
+                "memory": np.abs(memory_component * 0.2),
+                "volume_pattern": volume_ratio * 0.1
+            },
+            fallback=self._create_lstm_fallback
+        )
+    
+    def _detect_patterns(self, matrix: FeatureMatrix) -> np.ndarray:
         """Detect price patterns (simplified pattern recognition)."""
-        pattern_score = 0.0
+        price_change_5m = matrix.column("price_change_5m")
+        price_change_15m = matrix.column("price_change_15m")
+        rsi = matrix.column("rsi_14")
         
         # Momentum pattern
-        if features.price_change_5m > 0 and features.price_change_15m > 0:
-            pattern_score += 0.05
-        elif features.price_change_5m < 0 and features.price_change_15m < 0:
-            pattern_score -= 0.05
+        pattern_score = np.select(
+            [(price_change_5m > 0) & (price_change_15m > 0), (price_change_5m < 0) & (price_change_15m < 0)],
+            [0.05, -0.05],
+            0.0
+        )
         
         # Volume pattern
-        if features.volume_ratio_5m > 1.5 and features.price_change_5m > 0:
-            pattern_score += 0.03
+        pattern_score = pattern_score + np.where((matrix.column("volume_ratio_5m") > 1.5) & (price_change_5m > 0), 0.03, 0.0)
         
-        # RSI pattern
-        if features.rsi_14 < 30 and features.price_change_5m > 0:
-            pattern_score += 0.04  # Oversold bounce
-        elif features.rsi_14 > 70 and features.price_change_5m < 0:
-            pattern_score -= 0.04  # Overbought decline
+        # RSI pattern: oversold bounce / overbought decline
+        pattern_score = pattern_score + np.select(
+            [(rsi < 30) & (price_change_5m > 0), (rsi > 70) & (price_change_5m < 0)],
+            [0.04, -0.04],
+            0.0
+        )
         
         return pattern_score
     
@@ -806,22 +936,22 @@ class LSTMModel:
         }
         return scales.get(horizon, 1.0)
     
-    def _calculate_lstm_confidence(self, features: MarketFeatures) -> float:
+    def _calculate_lstm_confidence(self, matrix: FeatureMatrix) -> np.ndarray:
         """Calculate LSTM model confidence."""
         base_confidence = 0.7  # LSTM typically more confident than statistical
         
         # More confident with clear trends
-        trend_strength = abs(features.price_change_15m) + abs(features.price_change_1h)
-        trend_confidence = min(trend_strength * 5, 0.15)
+        trend_strength = np.abs(matrix.column("price_change_15m")) + np.abs(matrix.column("price_change_1h"))
+        trend_confidence = np.minimum(trend_strength * 5, 0.15)
         
         # More confident with volume confirmation
-        volume_confidence = min((features.volume_ratio_5m - 1.0) * 0.1, 0.1)
+        volume_confidence = np.minimum((matrix.column("volume_ratio_5m") - 1.0) * 0.1, 0.1)
         
         # Less confident with high volatility
-        volatility_penalty = min(features.volatility_1h * 3, 0.25)
+        volatility_penalty = np.minimum(matrix.column("volatility_1h") * 3, 0.25)
         
         confidence = base_confidence + trend_confidence + volume_confidence - volatility_penalty
-        return max(0.2, min(0.9, confidence))
+        return np.clip(confidence, 0.2, 0.9)
     
     def _create_lstm_fallback(self, features: MarketFeatures, horizon: PredictionHorizon) -> PredictionResult:
         """Create fallback LSTM prediction."""
@@ -843,6 +973,9 @@ class LSTMModel:
 class TransformerModel:
     """Simplified Transformer model for price prediction."""
     
+    # Attention heads, in the column order of the weight matrix
+    ATTENTION_HEADS = ("price_momentum", "volume_pattern", "technical_signals", "market_structure")
+    
     def __init__(self) -> None:
         """Initialize Transformer model."""
         self.model_version = "1.0"
@@ -861,130 +994,96 @@ class TransformerModel:
         Note: This is a simplified implementation focusing on attention mechanisms.
         """
         try:
-            # Simulate attention mechanism by weighting different features
-            attention_weights = self._calculate_attention_weights(features)
-            
-            # Apply attention to features
-            weighted_features = self._apply_attention(features, attention_weights)
-            
-            # Transformer prediction based on weighted features
-            current_price = float(features.price)
-            
-            # Multi-head attention simulation (different aspects)
-            price_attention = weighted_features.get("price_momentum", 0.0)
-            volume_attention = weighted_features.get("volume_pattern", 0.0)
-            technical_attention = weighted_features.get("technical_signals", 0.0)
-            market_attention = weighted_features.get("market_structure", 0.0)
-            
-            # Combine attention heads
-            combined_signal = (
-                price_attention * 0.4 +
-                volume_attention * 0.2 +
-                technical_attention * 0.3 +
-                market_attention * 0.1
-            )
-            
-            # Apply positional encoding (time-based adjustments)
-            positional_adjustment = self._get_positional_encoding(horizon)
-            final_signal = combined_signal * positional_adjustment
-            
-            # Calculate predicted price
-            price_change = final_signal
-            predicted_price = Decimal(str(current_price * (1 + price_change)))
-            
-            # Transformer confidence (typically high due to attention mechanism)
-            confidence = self._calculate_transformer_confidence(attention_weights, features)
-            
-            # Calculate probabilities
-            signal_strength = abs(final_signal)
-            if final_signal > 0:
-                prob_up = 0.5 + min(signal_strength * 8, 0.45)
-            else:
-                prob_up = 0.5 - min(signal_strength * 8, 0.45)
-            prob_down = 1.0 - prob_up
-            
-            # Feature importance based on attention weights
-            feature_importance = {
-                "price_momentum_attention": attention_weights.get("price_momentum", 0.0),
-                "volume_pattern_attention": attention_weights.get("volume_pattern", 0.0),
-                "technical_signals_attention": attention_weights.get("technical_signals", 0.0),
-                "market_structure_attention": attention_weights.get("market_structure", 0.0)
-            }
-            
-            return PredictionResult(
-                model_type=ModelType.TRANSFORMER,
-                prediction_horizon=horizon,
-                predicted_price=predicted_price,
-                confidence=confidence,
-                probability_up=prob_up,
-                probability_down=prob_down,
-                expected_return=price_change,
-                risk_estimate=features.volatility_1h * positional_adjustment,
-                feature_importance=feature_importance,
-                model_version=self.model_version,
-                timestamp=datetime.utcnow()
-            )
-            
+            return (await self.predict_batch(FeatureMatrix.from_features([features]), horizon))[0]
         except Exception as e:
             logger.error(f"Transformer prediction failed: {e}")
             return self._create_transformer_fallback(features, horizon)
     
-    def _calculate_attention_weights(self, features: MarketFeatures) -> Dict[str, float]:
-        """Calculate attention weights for different feature groups."""
-        weights = {}
-        
+    async def predict_batch(self, matrix: FeatureMatrix, horizon: PredictionHorizon) -> List[PredictionResult]:
+        """Make Transformer-based predictions for every token in a feature matrix."""
+        # Simulate attention mechanism by weighting different features
+        attention_weights = self._calculate_attention_weights(matrix)
+        
+        # Apply attention to features: one column per head
+        weighted_features = self._apply_attention(matrix, attention_weights)
+        
+        # Multi-head attention simulation: combine heads
+        combined_signal = weighted_features @ np.array([0.4, 0.2, 0.3, 0.1])
+        
+        # Apply positional encoding (time-based adjustments)
+        positional_adjustment = self._get_positional_encoding(horizon)
+        final_signal = combined_signal * positional_adjustment
+        
+        # Transformer confidence (typically high due to attention mechanism)
+        confidence = self._calculate_transformer_confidence(attention_weights, matrix)
+        
+        # Calculate probabilities
+        step = np.minimum(np.abs(final_signal) * 8, 0.45)
+        prob_up = np.where(final_signal > 0, 0.5 + step, 0.5 - step)
+        
+        return _prediction_results(
+            ModelType.TRANSFORMER, horizon, matrix, self.model_version,
+            price_change=final_signal,
+            confidence=confidence,
+            probability_up=prob_up,
+            risk_estimate=matrix.column("volatility_1h") * positional_adjustment,
+            # Feature importance based on attention weights
+            feature_importance={
+                f"{head}_attention": attention_weights[:, index]
+                for index, head in enumerate(self.ATTENTION_HEADS)
+            },
+            fallback=self._create_transformer_fallback
+        )
+    
+    def _calculate_attention_weights(self, matrix: FeatureMatrix) -> np.ndarray:
+        """Calculate attention weights per token, one column per head in ``ATTENTION_HEADS``."""
         # Price momentum attention
-        price_momentum_strength = abs(features.price_change_5m) + abs(features.price_change_15m)
-        weights["price_momentum"] = min(price_momentum_strength * 2, 1.0)
+        price_momentum_strength = np.abs(matrix.column("price_change_5m")) + np.abs(matrix.column("price_change_15m"))
         
         # Volume pattern attention
-        volume_anomaly = abs(features.volume_ratio_5m - 1.0)
-        weights["volume_pattern"] = min(volume_anomaly, 1.0)
+        volume_anomaly = np.abs(matrix.column("volume_ratio_5m") - 1.0)
         
-        # Technical signals attention
-        rsi_signal = abs(features.rsi_14 - 50) / 50  # Distance from neutral
-        bb_signal = abs(features.bb_position - 0.5) * 2  # Distance from center
-        weights["technical_signals"] = min((rsi_signal + bb_signal) / 2, 1.0)
+        # Technical signals attention: distance from neutral RSI and band center
+        rsi_signal = np.abs(matrix.column("rsi_14") - 50) / 50
+        bb_signal = np.abs(matrix.column("bb_position") - 0.5) * 2
         
         # Market structure attention
-        whale_activity = features.whale_activity_1h / 10.0  # Normalize
-        liquidity_change = abs(features.liquidity_change_1h)
-        weights["market_structure"] = min((whale_activity + liquidity_change) / 2, 1.0)
+        whale_activity = matrix.column("whale_activity_1h") / 10.0  # Normalize
+        liquidity_change = np.abs(matrix.column("liquidity_change_1h"))
         
-        # Normalize weights (softmax-like)
-        total_weight = sum(weights.values())
-        if total_weight > 0:
-            weights = {k: v / total_weight for k, v in weights.items()}
+        weights = np.column_stack([
+            np.minimum(price_momentum_strength * 2, 1.0),
+            np.minimum(volume_anomaly, 1.0),
+            np.minimum((rsi_signal + bb_signal) / 2, 1.0),
+            np.minimum((whale_activity + liquidity_change) / 2, 1.0),
+        ])
         
-        return weights
+        # Normalize weights (softmax-like)
+        total_weight = weights.sum(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(total_weight > 0, weights / total_weight, weights)
     
-    def _apply_attention(self, features: MarketFeatures, weights: Dict[str, float]) -> Dict[str, float]:
-        """Apply attention weights to features."""
-        weighted = {}
-        
+    def _apply_attention(self, matrix: FeatureMatrix, weights: np.ndarray) -> np.ndarray:
+        """Apply attention weights to features, one column per head."""
         # Price momentum with attention
         price_signal = (
-            features.price_change_5m * 0.5 + 
-            features.price_change_15m * 0.3 + 
-            features.price_change_1h * 0.2
+            matrix.column("price_change_5m") * 0.5 +
+            matrix.column("price_change_15m") * 0.3 +
+            matrix.column("price_change_1h") * 0.2
         )
-        weighted["price_momentum"] = price_signal * weights.get("price_momentum", 0.25)
         
         # Volume pattern with attention
-        volume_signal = (features.volume_ratio_5m - 1.0) * 0.1  # Normalize
-        weighted["volume_pattern"] = volume_signal * weights.get("volume_pattern", 0.25)
+        volume_signal = (matrix.column("volume_ratio_5m") - 1.0) * 0.1  # Normalize
         
         # Technical signals with attention
-        rsi_signal = (50 - features.rsi_14) / 500  # RSI signal normalized
-        bb_signal = (0.5 - features.bb_position) * 0.2  # Mean reversion signal
+        rsi_signal = (50 - matrix.column("rsi_14")) / 500  # RSI signal normalized
+        bb_signal = (0.5 - matrix.column("bb_position")) * 0.2  # Mean reversion signal
         technical_signal = rsi_signal + bb_signal
-        weighted["technical_signals"] = technical_signal * weights.get("technical_signals", 0.25)
         
         # Market structure with attention
-        structure_signal = features.liquidity_change_1h * 0.1
-        weighted["market_structure"] = structure_signal * weights.get("market_structure", 0.25)
+        structure_signal = matrix.column("liquidity_change_1h") * 0.1
         
-        return weighted
+        return np.column_stack([price_signal, volume_signal, technical_signal, structure_signal]) * weights
     
     def _get_positional_encoding(self, horizon: PredictionHorizon) -> float:
         """Get positional encoding for time horizon."""
@@ -998,23 +1097,22 @@ class TransformerModel:
         }
         return encodings.get(horizon, 1.0)
     
-    def _calculate_transformer_confidence(self, weights: Dict[str, float], features: MarketFeatures) -> float:
+    def _calculate_transformer_confidence(self, weights: np.ndarray, matrix: FeatureMatrix) -> np.ndarray:
         """Calculate Transformer model confidence."""
         base_confidence = 0.75  # Transformers typically confident due to attention
         
         # Higher confidence when attention is focused (not uniform)
-        weight_variance = statistics.variance(weights.values()) if len(weights) > 1 else 0
-        focus_bonus = min(weight_variance * 2, 0.1)
+        weight_variance = weights.var(axis=1, ddof=1)
+        focus_bonus = np.minimum(weight_variance * 2, 0.1)
         
         # Higher confidence with stronger signals
-        max_weight = max(weights.values()) if weights else 0
-        signal_bonus = min(max_weight * 0.15, 0.15)
+        signal_bonus = np.minimum(weights.max(axis=1) * 0.15, 0.15)
         
         # Lower confidence with high volatility
-        volatility_penalty = min(features.volatility_1h * 2, 0.2)
+        volatility_penalty = np.minimum(matrix.column("volatility_1h") * 2, 0.2)
         
         confidence = base_confidence + focus_bonus + signal_bonus - volatility_penalty
-        return max(0.3, min(0.95, confidence))
+        return np.clip(confidence, 0.3, 0.95)
     
     def _create_transformer_fallback(self, features: MarketFeatures, horizon: PredictionHorizon) -> PredictionResult:
         """Create fallback Transformer prediction."""
@@ -1075,153 +1173,178 @@ class EnsemblePredictionEngine:
             EnsemblePrediction: Combined ensemble prediction
         """
         try:
-            # Engineer features
-            features = await self.feature_engineering.engineer_features(
-                token_address, chain, raw_market_data
-            )
-            
-            # Get predictions from all models
-            predictions = {}
-            
-            # Statistical model prediction
-            stat_prediction = await self.statistical_model.predict(features, horizon)
-            predictions[ModelType.STATISTICAL] = stat_prediction
-            
-            # LSTM model prediction
-            lstm_prediction = await self.lstm_model.predict(features, horizon)
-            predictions[ModelType.LSTM] = lstm_prediction
-            
-            # Transformer model prediction
-            transformer_prediction = await self.transformer_model.predict(features, horizon)
-            predictions[ModelType.TRANSFORMER] = transformer_prediction
-            
-            # Combine predictions
-            ensemble_result = self._combine_predictions(predictions, features)
-            
-            # Create final ensemble prediction
-            ensemble_prediction = EnsemblePrediction(
-                token_address=token_address,
-                chain=chain,
-                prediction_horizon=horizon,
-                ensemble_price=ensemble_result["price"],
-                ensemble_confidence=ensemble_result["confidence"],
-                consensus_strength=ensemble_result["consensus"],
-                model_predictions=predictions,
-                downside_risk=ensemble_result["downside_risk"],
-                upside_potential=ensemble_result["upside_potential"],
-                volatility_forecast=ensemble_result["volatility"],
-                recommendation=ensemble_result["recommendation"],
-                risk_level=ensemble_result["risk_level"],
-                key_factors=ensemble_result["key_factors"],
-                timestamp=datetime.utcnow()
-            )
-            
-            # Store for performance tracking
-            self.prediction_history.append((ensemble_prediction, None))
-            
-            return ensemble_prediction
-            
+            return (await self.predict_batch([(token_address, chain, raw_market_data)], horizon))[0]
         except Exception as e:
             logger.error(f"Ensemble prediction failed for {token_address}: {e}")
             return self._create_fallback_ensemble(token_address, chain, raw_market_data, horizon)
     
-    def _combine_predictions(self, predictions: Dict[ModelType, PredictionResult], features: MarketFeatures) -> Dict[str, Any]:
-        """Combine individual model predictions into ensemble result."""
-        # Weighted price prediction
-        weighted_price = Decimal("0")
-        total_weight = Decimal("0")
-        total_confidence = 0.0
+    async def predict_batch(
+        self,
+        requests: List[Tuple[str, str, Dict[str, Any]]],
+        horizon: PredictionHorizon = PredictionHorizon.MINUTES_15
+    ) -> List[EnsemblePrediction]:
+        """
+        Generate ensemble predictions for many tokens in one pass.
         
-        for model_type, prediction in predictions.items():
-            weight = Decimal(str(self.model_weights[model_type]))
-            confidence_weight = weight * Decimal(str(prediction.confidence))
-            
-            weighted_price += prediction.predicted_price * confidence_weight
-            total_weight += confidence_weight
-            total_confidence += prediction.confidence * self.model_weights[model_type]
+        Features are assembled into a single matrix and every model runs over
+        the whole matrix, so scoring a discovery burst costs one call.
         
-        if total_weight > 0:
-            ensemble_price = weighted_price / total_weight
-        else:
-            ensemble_price = features.price
+        Args:
+            requests: (token_address, chain, raw_market_data) per token
+            horizon: Prediction time horizon
+            
+        Returns:
+            List[EnsemblePrediction]: One prediction per request, in order
+        """
+        if not requests:
+            return []
         
-        # Calculate consensus strength (how much models agree)
-        prices = [float(p.predicted_price) for p in predictions.values()]
-        current_price = float(features.price)
+        # Engineer features
+        matrix = await self.feature_engineering.engineer_feature_matrix(requests)
         
-        # Normalize price predictions as percentage changes
-        price_changes = [(p - current_price) / current_price for p in prices]
+        # Get predictions from all models
+        model_predictions = {
+            ModelType.STATISTICAL: await self.statistical_model.predict_batch(matrix, horizon),
+            ModelType.LSTM: await self.lstm_model.predict_batch(matrix, horizon),
+            ModelType.TRANSFORMER: await self.transformer_model.predict_batch(matrix, horizon),
+        }
         
-        if len(price_changes) > 1:
-            price_std = statistics.stdev(price_changes)
-            consensus_strength = max(0.0, 1.0 - price_std * 10)  # Lower std = higher consensus
-        else:
-            consensus_strength = 1.0
+        # Combine predictions
+        combined = self._combine_predictions(model_predictions, matrix)
         
-        # Risk assessment
-        volatilities = [p.risk_estimate for p in predictions.values()]
-        avg_volatility = statistics.mean(volatilities)
+        now = datetime.utcnow()
+        ensemble_predictions = []
+        for index, (token_address, chain, raw_market_data) in enumerate(requests):
+            result = combined[index]
+            if result is None:
+                logger.error(f"Ensemble prediction failed for {token_address}: non-finite ensemble output")
+                ensemble_prediction = self._create_fallback_ensemble(token_address, chain, raw_market_data, horizon)
+            else:
+                predictions = {model_type: results[index] for model_type, results in model_predictions.items()}
+                ensemble_prediction = EnsemblePrediction(
+                    token_address=token_address,
+                    chain=chain,
+                    prediction_horizon=horizon,
+                    ensemble_price=result["price"],
+                    ensemble_confidence=result["confidence"],
+                    consensus_strength=result["consensus"],
+                    model_predictions=predictions,
+                    downside_risk=result["downside_risk"],
+                    upside_potential=result["upside_potential"],
+                    volatility_forecast=result["volatility"],
+                    recommendation=result["recommendation"],
+                    risk_level=result["risk_level"],
+                    key_factors=self._extract_key_factors(predictions, matrix, index),
+                    timestamp=now
+                )
+            
+            # Store for performance tracking
+            self.prediction_history.append((ensemble_prediction, None))
+            ensemble_predictions.append(ensemble_prediction)
         
-        downside_risk = avg_volatility * 2  # VaR-style metric
-        upside_potential = abs(float(ensemble_price) / float(features.price) - 1.0)
+        return ensemble_predictions
+    
+    def _combine_predictions(
+        self,
+        model_predictions: Dict[ModelType, List[PredictionResult]],
+        matrix: FeatureMatrix
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Combine per-model predictions into ensemble results, one per token (None if unusable)."""
+        model_types = list(model_predictions)
+        weights = np.array([self.model_weights[model_type] for model_type in model_types])
+        
+        # Token x model matrices of the model outputs
+        predicted = np.array(
+            [[float(p.predicted_price) for p in model_predictions[m]] for m in model_types]
+        ).T
+        confidence = np.array([[p.confidence for p in model_predictions[m]] for m in model_types]).T
+        risk = np.array([[p.risk_estimate for p in model_predictions[m]] for m in model_types]).T
+        current_price = matrix.column("price")
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # Confidence-weighted price prediction
+            confidence_weight = confidence * weights
+            total_weight = confidence_weight.sum(axis=1)
+            ensemble_price = np.where(
+                total_weight > 0, (predicted * confidence_weight).sum(axis=1) / total_weight, current_price
+            )
+            total_confidence = confidence_weight.sum(axis=1)
+            
+            # Consensus strength: lower spread of predicted changes = higher consensus
+            price_changes = (predicted - current_price[:, None]) / current_price[:, None]
+            if len(model_types) > 1:
+                consensus_strength = np.maximum(0.0, 1.0 - price_changes.std(axis=1, ddof=1) * 10)
+            else:
+                consensus_strength = np.ones(len(matrix))
+            
+            # Risk assessment
+            avg_volatility = risk.mean(axis=1)
+            price_change = ensemble_price / current_price - 1.0
         
-        # Generate recommendation
-        price_change = float(ensemble_price) / float(features.price) - 1.0
         recommendation = self._generate_recommendation(price_change, total_confidence, consensus_strength)
-        
-        # Risk level
         risk_level = self._assess_risk_level(avg_volatility, consensus_strength, total_confidence)
-        
-        # Key factors
-        key_factors = self._extract_key_factors(predictions, features)
-        
-        return {
-            "price": ensemble_price,
-            "confidence": total_confidence,
-            "consensus": consensus_strength,
-            "downside_risk": downside_risk,
-            "upside_potential": upside_potential,
-            "volatility": avg_volatility,
-            "recommendation": recommendation,
-            "risk_level": risk_level,
-            "key_factors": key_factors
-        }
+        valid = np.isfinite(price_change) & np.isfinite(consensus_strength) & np.isfinite(avg_volatility)
+        
+        results: List[Optional[Dict[str, Any]]] = []
+        for index in range(len(matrix)):
+            if not valid[index]:
+                results.append(None)
+                continue
+            price = Decimal(str(float(ensemble_price[index]))) if total_weight[index] > 0 else matrix.prices[index]
+            results.append({
+                "price": price,
+                "confidence": float(total_confidence[index]),
+                "consensus": float(consensus_strength[index]),
+                "downside_risk": float(avg_volatility[index]) * 2,  # VaR-style metric
+                "upside_potential": abs(float(price_change[index])),
+                "volatility": float(avg_volatility[index]),
+                "recommendation": str(recommendation[index]),
+                "risk_level": str(risk_level[index]),
+            })
+        return results
     
-    def _generate_recommendation(self, price_change: float, confidence: float, consensus: float) -> str:
-        """Generate trading recommendation based on ensemble results."""
+    def _generate_recommendation(
+        self,
+        price_change: np.ndarray,
+        confidence: np.ndarray,
+        consensus: np.ndarray
+    ) -> np.ndarray:
+        """Generate trading recommendations based on ensemble results."""
         # Adjust thresholds based on confidence and consensus
         threshold_multiplier = confidence * consensus
         
-        if price_change > 0.05 * threshold_multiplier:
-            return "strong_buy"
-        elif price_change > 0.02 * threshold_multiplier:
-            return "buy"
-        elif price_change < -0.05 * threshold_multiplier:
-            return "strong_sell"
-        elif price_change < -0.02 * threshold_multiplier:
-            return "sell"
-        else:
-            return "hold"
+        return np.select(
+            [
+                price_change > 0.05 * threshold_multiplier,
+                price_change > 0.02 * threshold_multiplier,
+                price_change < -0.05 * threshold_multiplier,
+                price_change < -0.02 * threshold_multiplier,
+            ],
+            ["strong_buy", "buy", "strong_sell", "sell"],
+            "hold"
+        )
     
-    def _assess_risk_level(self, volatility: float, consensus: float, confidence: float) -> str:
-        """Assess overall risk level."""
+    def _assess_risk_level(self, volatility: np.ndarray, consensus: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+        """Assess overall risk levels."""
         # Higher volatility = higher risk
         # Lower consensus = higher risk
         # Lower confidence = higher risk
         
         risk_score = volatility * 10 + (1 - consensus) * 5 + (1 - confidence) * 3
         
-        if risk_score > 10:
-            return "extreme"
-        elif risk_score > 7:
-            return "high"
-        elif risk_score > 4:
-            return "moderate"
-        else:
-            return "low"
+        return np.select(
+            [risk_score > 10, risk_score > 7, risk_score > 4],
+            ["extreme", "high", "moderate"],
+            "low"
+        )
     
-    def _extract_key_factors(self, predictions: Dict[ModelType, PredictionResult], features: MarketFeatures) -> List[str]:
-        """Extract key factors driving the prediction."""
+    def _extract_key_factors(
+        self,
+        predictions: Dict[ModelType, PredictionResult],
+        matrix: FeatureMatrix,
+        index: int
+    ) -> List[str]:
+        """Extract key factors driving one token's prediction."""
         factors = []
         
         # Combine feature importance from all models
@@ -1240,15 +1363,17 @@ class EnsemblePredictionEngine:
                 factors.append(factor.replace("_", " ").title())
         
         # Add market condition factors
-        if features.volume_ratio_5m > 1.5:
+        row = matrix.values[index]
+        if row[_COLUMN_INDEX["volume_ratio_5m"]] > 1.5:
             factors.append("High Volume Activity")
         
-        if features.rsi_14 > 70:
+        rsi = row[_COLUMN_INDEX["rsi_14"]]
+        if rsi > 70:
             factors.append("Overbought Conditions")
-        elif features.rsi_14 < 30:
+        elif rsi < 30:
             factors.append("Oversold Conditions")
         
-        if abs(features.liquidity_change_1h) > 0.1:
+        if abs(row[_COLUMN_INDEX["liquidity_change_1h"]]) > 0.1:
             factors.append("Liquidity Changes")
         
         return factors[:5]  # Limit to top 5 factors
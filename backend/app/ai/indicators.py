@@ -0,0 +1,449 @@
+"""
+Vectorized technical indicators shared by timing, ensemble and regime code.
+
+Batch functions take a 2-D float64 price matrix with one row per token and
+one column per observation, oldest first. Tokens with shorter histories are
+left-padded with NaN (see ``price_matrix``); indicators that need more data
+than a row has come out as NaN for that row. A 1-D series is treated as a
+single-row matrix.
+
+Recursive indicators (EMA, and MACD built on it) walk the columns once with
+every token updated together; window indicators (SMA, Bollinger bands, RSI,
+return volatility) read only the trailing columns they need.
+
+``IndicatorStream`` keeps the same indicators for one token with constant-time
+updates per tick, for callers that see prices one at a time.
+
+File: backend/app/ai/indicators.py
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .rolling_stats import RollingWindow
+
+# EMA seeding: "sma" starts from the mean of the first ``period`` prices,
+# "first" starts from the first price and is defined from the first column
+EMA_SEEDS = ("sma", "first")
+
+
+def price_matrix(series: Iterable[Sequence[float]], length: Optional[int] = None) -> np.ndarray:
+    """
+    Stack per-token series into a NaN left-padded matrix.
+
+    Args:
+        series: One price (or volume) sequence per token, oldest first
+        length: Columns to keep (default: longest series); longer series keep their tail
+
+    Returns:
+        Array of shape (tokens, length)
+    """
+    rows = [np.asarray(values, dtype=np.float64) for values in series]
+    if length is None:
+        length = max((len(row) for row in rows), default=0)
+    matrix = np.full((len(rows), length), np.nan)
+    for index, row in enumerate(rows):
+        row = row[-length:] if length else row[:0]
+        if len(row):
+            matrix[index, length - len(row):] = row
+    return matrix
+
+
+def _as_matrix(prices: np.ndarray) -> np.ndarray:
+    matrix = np.asarray(prices, dtype=np.float64)
+    return matrix.reshape(1, -1) if matrix.ndim == 1 else matrix
+
+
+def valid_counts(prices: np.ndarray) -> np.ndarray:
+    """Number of observations per row."""
+    return np.count_nonzero(~np.isnan(_as_matrix(prices)), axis=1)
+
+
+def ema(prices: np.ndarray, period: int, seed: str = "sma") -> np.ndarray:
+    """
+    Exponential moving average series, updated as ``price * k + ema * (1 - k)``.
+
+    Args:
+        prices: Price matrix
+        period: EMA period; k = 2 / (period + 1)
+        seed: "sma" or "first" (see ``EMA_SEEDS``)
+
+    Returns:
+        Matrix of the same shape; NaN until a row's EMA is defined
+    """
+    if seed not in EMA_SEEDS:
+        raise ValueError(f"unknown EMA seed {seed!r}")
+    matrix = _as_matrix(prices)
+    rows, columns = matrix.shape
+    k = 2 / (period + 1)
+    out = np.full((rows, columns), np.nan)
+    state = np.full(rows, np.nan)
+
+    if seed == "first":
+        for column in range(columns):
+            price = matrix[:, column]
+            state = np.where(np.isnan(state), price, price * k + state * (1 - k))
+            out[:, column] = state
+        return out
+
+    counts = np.cumsum(~np.isnan(matrix), axis=1)
+    sums = np.cumsum(np.nan_to_num(matrix), axis=1)
+    for column in range(columns):
+        price = matrix[:, column]
+        state = price * k + state * (1 - k)  # NaN rows stay NaN until seeded
+        seeding = counts[:, column] == period
+        if seeding.any():
+            window_sum = sums[:, column] - (sums[:, column - period] if column >= period else 0.0)
+            state = np.where(seeding, window_sum / period, state)
+        out[:, column] = state
+    return out
+
+
+def macd(
+    prices: np.ndarray,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    seed: str = "sma",
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    MACD line, signal line and histogram series.
+
+    The signal line is an EMA of the MACD line, seeded once the line exists.
+    """
+    line = ema(prices, fast, seed) - ema(prices, slow, seed)
+    signal_line = ema(line, signal, seed)
+    return line, signal_line, line - signal_line
+
+
+def sma_last(prices: np.ndarray, period: int) -> np.ndarray:
+    """Simple moving average of each row's last ``period`` prices."""
+    matrix = _as_matrix(prices)
+    if matrix.shape[1] < period:
+        return np.full(matrix.shape[0], np.nan)
+    return matrix[:, -period:].mean(axis=1)
+
+
+def std_last(prices: np.ndarray, period: int, ddof: int = 0) -> np.ndarray:
+    """Standard deviation of each row's last ``period`` prices."""
+    matrix = _as_matrix(prices)
+    if matrix.shape[1] < period or period <= ddof:
+        return np.full(matrix.shape[0], np.nan)
+    return matrix[:, -period:].std(axis=1, ddof=ddof)
+
+
+def bollinger_last(
+    prices: np.ndarray,
+    period: int = 20,
+    num_std: float = 2.0,
+    ddof: int = 0,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Bollinger bands over each row's last ``period`` prices.
+
+    Returns:
+        (middle, upper, lower, position) where position is the last price's
+        place in the band, 0 at the lower band and 1 at the upper band (0.5
+        for a zero-width band)
+    """
+    matrix = _as_matrix(prices)
+    middle = sma_last(matrix, period)
+    deviation = std_last(matrix, period, ddof)
+    upper = middle + num_std * deviation
+    lower = middle - num_std * deviation
+    width = upper - lower
+    with np.errstate(divide="ignore", invalid="ignore"):
+        position = np.where(width > 0, (matrix[:, -1] - lower) / width, 0.5)
+    position[np.isnan(middle)] = np.nan
+    return middle, upper, lower, position
+
+
+def gain_loss_last(prices: np.ndarray, period: int = 14) -> Tuple[np.ndarray, np.ndarray]:
+    """Simple average gain and loss over each row's last ``period`` changes (NaN if too short)."""
+    matrix = _as_matrix(prices)
+    if matrix.shape[1] < period + 1:
+        missing = np.full(matrix.shape[0], np.nan)
+        return missing, missing.copy()
+    changes = np.diff(matrix[:, -(period + 1):], axis=1)
+    return np.clip(changes, 0, None).mean(axis=1), np.clip(-changes, 0, None).mean(axis=1)
+
+
+def rsi_from_averages(avg_gain: np.ndarray, avg_loss: np.ndarray) -> np.ndarray:
+    """RSI from average gains and losses; 100 where there were no losses."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    rsi[np.isnan(avg_gain)] = np.nan
+    return rsi
+
+
+def rsi_last(prices: np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    RSI from the simple average gain and loss over each row's last ``period`` changes.
+
+    Rows with no losses in the window read 100; rows with fewer than
+    ``period + 1`` prices are NaN.
+    """
+    return rsi_from_averages(*gain_loss_last(prices, period))
+
+
+def returns(prices: np.ndarray) -> np.ndarray:
+    """Simple returns between consecutive prices; NaN where the earlier price is not positive."""
+    matrix = _as_matrix(prices)
+    previous = matrix[:, :-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = (matrix[:, 1:] - previous) / previous
+    result[~(previous > 0)] = np.nan
+    return result
+
+
+def volatility(prices: np.ndarray, period: Optional[int] = None, ddof: int = 1) -> np.ndarray:
+    """
+    Standard deviation of simple returns, over all returns or the last ``period``.
+
+    Rows with too few returns for ``ddof`` read 0.
+    """
+    period_returns = returns(prices)
+    if period is not None:
+        period_returns = period_returns[:, -period:]
+    counts = np.count_nonzero(~np.isnan(period_returns), axis=1)
+    result = np.zeros(period_returns.shape[0])
+    enough = counts > ddof
+    if enough.any():
+        result[enough] = np.nanstd(period_returns[enough], axis=1, ddof=ddof)
+    return result
+
+
+def change_fractions(prices: np.ndarray, period: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Share of rising and of falling steps, over all steps or the last ``period``.
+
+    Returns:
+        (up, down) fractions per row; 0 for rows with no steps
+    """
+    matrix = _as_matrix(prices)
+    if period is not None:
+        matrix = matrix[:, -(period + 1):]
+    changes = np.diff(matrix, axis=1)
+    counts = np.count_nonzero(~np.isnan(changes), axis=1)
+    safe_counts = np.maximum(counts, 1)
+    return (changes > 0).sum(axis=1) / safe_counts, (changes < 0).sum(axis=1) / safe_counts
+
+
+def momentum_last(prices: np.ndarray, lag: int) -> np.ndarray:
+    """Return of the last price over the price ``lag`` steps earlier."""
+    matrix = _as_matrix(prices)
+    if matrix.shape[1] <= lag:
+        return np.full(matrix.shape[0], np.nan)
+    base = matrix[:, -lag - 1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (matrix[:, -1] - base) / base
+
+
+@dataclass
+class IndicatorSnapshot:
+    """Latest indicator values for a batch of tokens, one array entry per row."""
+
+    price: np.ndarray
+    ema_fast: np.ndarray
+    ema_slow: np.ndarray
+    macd: np.ndarray
+    macd_signal: np.ndarray
+    rsi: np.ndarray
+    bb_middle: np.ndarray
+    bb_upper: np.ndarray
+    bb_lower: np.ndarray
+    bb_position: np.ndarray
+    volatility: np.ndarray
+    momentum_5: np.ndarray
+    momentum_10: np.ndarray
+    up_fraction: np.ndarray
+    count: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    def row(self, index: int) -> Dict[str, float]:
+        """Indicator values of one token."""
+        return {name: float(values[index]) for name, values in self.__dict__.items()}
+
+
+def compute_indicators(
+    prices: np.ndarray,
+    fast: int = 12,
+    slow: int = 26,
+    signal: int = 9,
+    rsi_period: int = 14,
+    bb_period: int = 20,
+    bb_ddof: int = 0,
+    ema_seed: str = "sma",
+) -> IndicatorSnapshot:
+    """
+    Compute the standard indicator set for every row of a price matrix in one pass.
+
+    Args:
+        prices: Price matrix (tokens x observations, NaN left-padded)
+        fast: Fast EMA period (MACD)
+        slow: Slow EMA period (MACD)
+        signal: MACD signal EMA period
+        rsi_period: RSI period
+        bb_period: Bollinger band period
+        bb_ddof: Delta degrees of freedom of the band deviation
+        ema_seed: EMA seeding mode
+
+    Returns:
+        IndicatorSnapshot with the latest values per token
+    """
+    matrix = _as_matrix(prices)
+    ema_fast = ema(matrix, fast, ema_seed)
+    ema_slow = ema(matrix, slow, ema_seed)
+    line = ema_fast - ema_slow
+    signal_line = ema(line, signal, ema_seed)
+    middle, upper, lower, position = bollinger_last(matrix, bb_period, ddof=bb_ddof)
+    up_fraction, _ = change_fractions(matrix)
+    return IndicatorSnapshot(
+        price=matrix[:, -1].copy(),
+        ema_fast=ema_fast[:, -1],
+        ema_slow=ema_slow[:, -1],
+        macd=line[:, -1],
+        macd_signal=signal_line[:, -1],
+        rsi=rsi_last(matrix, rsi_period),
+        bb_middle=middle,
+        bb_upper=upper,
+        bb_lower=lower,
+        bb_position=position,
+        volatility=volatility(matrix),
+        momentum_5=momentum_last(matrix, 5),
+        momentum_10=momentum_last(matrix, 10),
+        up_fraction=up_fraction,
+        count=valid_counts(matrix),
+    )
+
+
+class IndicatorStream:
+    """
+    Streaming indicators for a single token.
+
+    Each ``update`` is constant time: EMAs carry their state, RSI and
+    Bollinger bands use rolling windows of the last gains/losses and prices,
+    and volatility keeps a rolling window of returns. Values match the batch
+    functions over the same history (up to ``volatility_window`` returns).
+    """
+
+    def __init__(
+        self,
+        ema_periods: Sequence[int] = (12, 26),
+        rsi_period: int = 14,
+        bb_period: int = 20,
+        bb_ddof: int = 0,
+        ema_seed: str = "sma",
+        volatility_window: int = 1000,
+    ) -> None:
+        """
+        Initialize stream.
+
+        Args:
+            ema_periods: EMA periods to maintain
+            rsi_period: RSI period
+            bb_period: Bollinger band period
+            bb_ddof: Delta degrees of freedom of the band deviation
+            ema_seed: EMA seeding mode (see ``EMA_SEEDS``)
+            volatility_window: Returns kept for volatility
+        """
+        if ema_seed not in EMA_SEEDS:
+            raise ValueError(f"unknown EMA seed {ema_seed!r}")
+        self.ema_seed = ema_seed
+        self.bb_ddof = bb_ddof
+        self.count = 0
+        self.last: Optional[float] = None
+
+        self._emas: Dict[int, Optional[float]] = {period: None for period in ema_periods}
+        self._seed_sums: Dict[int, float] = {period: 0.0 for period in ema_periods}
+        self._gains = RollingWindow(rsi_period)
+        self._losses = RollingWindow(rsi_period)
+        self._band = RollingWindow(bb_period)
+        self._returns = RollingWindow(volatility_window)
+
+    def update(self, price: float) -> None:
+        """Add the next price."""
+        price = float(price)
+        self.count += 1
+
+        for period, value in self._emas.items():
+            if value is not None:
+                k = 2 / (period + 1)
+                self._emas[period] = price * k + value * (1 - k)
+            elif self.ema_seed == "first":
+                self._emas[period] = price
+            else:
+                self._seed_sums[period] += price
+                if self.count == period:
+                    self._emas[period] = self._seed_sums[period] / period
+
+        previous = self.last
+        if previous is not None:
+            change = price - previous
+            self._gains.append(max(change, 0.0))
+            self._losses.append(max(-change, 0.0))
+            if previous > 0:
+                self._returns.append(change / previous)
+        self._band.append(price)
+        self.last = price
+
+    def ema(self, period: int) -> Optional[float]:
+        """EMA for a maintained period, None until defined."""
+        return self._emas[period]
+
+    @property
+    def rsi(self) -> Optional[float]:
+        """RSI over the last ``rsi_period`` changes, None until the window is full."""
+        if len(self._gains) < self._gains.capacity:
+            return None
+        avg_loss = self._losses.mean
+        if avg_loss == 0:
+            return 100.0
+        return 100 - 100 / (1 + self._gains.mean / avg_loss)
+
+    def bollinger(self, num_std: float = 2.0) -> Optional[Tuple[float, float, float, float]]:
+        """(middle, upper, lower, position) once ``bb_period`` prices are in, else None."""
+        band = self._band
+        n = len(band)
+        if n < band.capacity:
+            return None
+        deviation = math.sqrt(band.variance * (n - 1) / (n - self.bb_ddof))
+        middle = band.mean
+        upper = middle + num_std * deviation
+        lower = middle - num_std * deviation
+        position = (self.last - lower) / (upper - lower) if upper > lower else 0.5
+        return middle, upper, lower, position
+
+    @property
+    def volatility(self) -> float:
+        """Sample standard deviation of the kept returns (0 with fewer than two)."""
+        return self._returns.std
+
+
+__all__ = [
+    "EMA_SEEDS",
+    "IndicatorSnapshot",
+    "IndicatorStream",
+    "bollinger_last",
+    "change_fractions",
+    "compute_indicators",
+    "ema",
+    "gain_loss_last",
+    "macd",
+    "momentum_last",
+    "price_matrix",
+    "returns",
+    "rsi_from_averages",
+    "rsi_last",
+    "sma_last",
+    "std_last",
+    "valid_counts",
+    "volatility",
+]
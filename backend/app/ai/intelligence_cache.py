@@ -0,0 +1,230 @@
+"""
+Shared result cache for market intelligence analyses.
+
+The event processor, autotrade pipeline, AI-informed executor and the
+intelligence WebSocket hub often ask for the same token within seconds.
+``IntelligenceCache`` keeps one result per (kind, chain, token):
+
+- fresh for ``ttl`` seconds, served directly
+- then stale for ``stale_ttl`` more seconds, served immediately while one
+  background task recomputes it (stale-while-revalidate), so tokens that
+  keep being asked for never pay the analysis latency again
+- concurrent misses for the same key share one computation (single-flight)
+- bounded by ``max_entries`` with least-recently-used eviction
+
+File: backend/app/ai/intelligence_cache.py
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from ..core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str, str]
+
+
+def intelligence_key(chain: str, token_address: str, kind: str = "pair") -> CacheKey:
+    """
+    Build a cache key for one token's analysis.
+
+    EVM addresses are lower-cased so checksummed and plain spellings share
+    an entry; other addresses (e.g. base58) are case-sensitive and kept.
+
+    Args:
+        chain: Blockchain network
+        token_address: Token contract address
+        kind: Analysis flavour, so different reports do not collide
+
+    Returns:
+        Cache key tuple
+    """
+    if token_address.startswith("0x"):
+        token_address = token_address.lower()
+    return kind, chain.lower(), token_address
+
+
+class _Entry:
+    """Cached value with its freshness deadlines (monotonic seconds)."""
+
+    __slots__ = ("value", "fresh_until", "stale_until")
+
+    def __init__(self, value: Any, fresh_until: float, stale_until: float) -> None:
+        self.value = value
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class IntelligenceCache:
+    """
+    TTL + LRU cache with single-flight misses and stale-while-revalidate.
+
+    Values of ``None`` are never cached, so a failed analysis is retried on
+    the next request. Cached values are shared between callers and must be
+    treated as read-only.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        stale_ttl: float = 300.0,
+        max_entries: int = 5000,
+        enabled: bool = True
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Seconds a result is served without recomputation
+            stale_ttl: Further seconds a result may be served while refreshing
+            max_entries: Largest number of cached results
+            enabled: When False every request computes directly
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: "OrderedDict[CacheKey, _Entry]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Task] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.evictions = 0
+
+    def get(self, key: CacheKey) -> Tuple[bool, Any]:
+        """
+        Look up a fresh result without computing.
+
+        Returns:
+            Tuple of (hit, value)
+        """
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() >= entry.fresh_until:
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry.value
+
+    def put(self, key: CacheKey, value: Any) -> None:
+        """Store a result, evicting the least recently used beyond ``max_entries``."""
+        if value is None:
+            return
+        now = time.monotonic()
+        self._entries[key] = _Entry(value, now + self.ttl, now + self.ttl + self.stale_ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_compute(self, key: CacheKey, compute: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return a cached result, computing it at most once across concurrent callers.
+
+        A stale result is returned immediately and refreshed in the
+        background; a missing or expired one is computed while callers wait.
+
+        Args:
+            key: Key from ``intelligence_key``
+            compute: Coroutine factory producing the result
+
+        Returns:
+            The cached or freshly computed result
+        """
+        if not self.enabled:
+            return await compute()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            now = time.monotonic()
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                if key not in self._inflight:
+                    self.refreshes += 1
+                    self._start(key, compute, background=True)
+                return entry.value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._start(key, compute, background=False)
+
+        # Shield so one cancelled caller does not cancel the shared computation
+        return await asyncio.shield(task)
+
+    def _start(self, key: CacheKey, compute: Callable[[], Awaitable[Any]], background: bool) -> asyncio.Task:
+        """Run ``compute`` as the single in-flight task for ``key``."""
+        async def _compute_and_store() -> Any:
+            try:
+                result = await compute()
+            except Exception as e:
+                if not background:
+                    raise
+                self.refresh_failures += 1
+                logger.warning(f"Background intelligence refresh failed for {key}: {e}")
+                return None
+            self.put(key, result)
+            return result
+
+        task = asyncio.create_task(_compute_and_store())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    def invalidate(self, key: CacheKey) -> None:
+        """Drop one cached result."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        served = self.hits + self.stale_hits + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "inflight": len(self._inflight),
+        }
+
+
+_intelligence_cache: Optional[IntelligenceCache] = None
+
+
+def get_intelligence_cache() -> IntelligenceCache:
+    """Get the process-wide intelligence cache shared by all engines."""
+    global _intelligence_cache
+    if _intelligence_cache is None:
+        _intelligence_cache = IntelligenceCache(
+            ttl=settings.intelligence_cache_ttl_seconds,
+            stale_ttl=settings.intelligence_cache_stale_seconds,
+            max_entries=settings.intelligence_cache_max_entries,
+            enabled=settings.intelligence_cache_enabled,
+        )
+    return _intelligence_cache
@@ -35,6 +35,19 @@ from scipy.stats import pearsonr, zscore
 
 
 from ..core.settings import settings
+from . import indicators
+from .intelligence_cache import IntelligenceCache, get_intelligence_cache, intelligence_key
+from .transaction_batch import (
+    NO_ADDRESS,
+    TransactionBatch,
+    cv_similarity,
+    group_alternation,
+    group_by,
+    group_distinct,
+    group_sums,
+    interval_regularity,
+    to_datetime,
+)
 
 import logging
 logger = logging.getLogger(__name__)
@@ -1005,34 +1018,26 @@ class MarketRegimeDetector:
         if len(prices) < 5:
             return "sideways", 0.0
         
+        series = np.array(prices, dtype=np.float64)
+        
         # Calculate moving averages
-        short_ma = sum(prices[-5:]) / 5
-        long_ma = sum(prices[-10:]) / 10 if len(prices) >= 10 else sum(prices) / len(prices)
+        short_ma = indicators.sma_last(series, 5)[0]
+        long_ma = indicators.sma_last(series, min(10, len(series)))[0]
         
         # Determine trend direction
-        if short_ma > long_ma * Decimal("1.02"):
+        if short_ma > long_ma * 1.02:
             direction = "up"
-        elif short_ma < long_ma * Decimal("0.98"):
+        elif short_ma < long_ma * 0.98:
             direction = "down"
         else:
             direction = "sideways"
         
-        # Calculate trend strength
-        price_changes = []
-        for i in range(1, len(prices)):
-            change = float((prices[i] - prices[i-1]) / prices[i-1])
-            price_changes.append(change)
-        
-        if not price_changes:
-            return direction, 0.0
-        
         # Trend strength based on consistency of direction
+        up_fraction, down_fraction = indicators.change_fractions(series)
         if direction == "up":
-            positive_changes = [c for c in price_changes if c > 0]
-            strength = len(positive_changes) / len(price_changes)
+            strength = float(up_fraction[0])
         elif direction == "down":
-            negative_changes = [c for c in price_changes if c < 0]
-            strength = len(negative_changes) / len(price_changes)
+            strength = float(down_fraction[0])
         else:
             strength = 0.5
         
@@ -1043,17 +1048,8 @@ class MarketRegimeDetector:
         if len(prices) < 5:
             return "normal"
         
-        # Calculate returns
-        returns = []
-        for i in range(1, len(prices)):
-            ret = float((prices[i] - prices[i-1]) / prices[i-1])
-            returns.append(ret)
-        
-        if not returns:
-            return "normal"
-        
-        # Calculate volatility (standard deviation)
-        volatility = statistics.stdev(returns) if len(returns) > 1 else 0.0
+        # Volatility (standard deviation of returns)
+        volatility = float(indicators.volatility(np.array(prices, dtype=np.float64))[0])
         
         # Classify volatility level
         if volatility < 0.02:
@@ -1254,6 +1250,9 @@ class MarketRegimeDetector:
 
 
 class CoordinationDetector:
+    # USD amounts bots commonly trade in
+    COMMON_BOT_AMOUNTS = np.array([100, 200, 500, 1000, 2000, 5000], dtype=np.float64)
+    
     def __init__(self) -> None:
         """Initialize coordination detector."""
         self.coordination_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
@@ -1271,9 +1270,9 @@ class CoordinationDetector:
     async def detect_coordination(
             self,
             token_address: str,
-            transaction_data: List[Dict[str, Any]]
+            transaction_data: Union[List[Dict[str, Any]], TransactionBatch]
         ) -> List[CoordinationAlert]:
-            """Detect coordination patterns in transaction data."""
+            """Detect coordination patterns in transaction data (dicts or a prebuilt batch)."""
             try:
                 if len(transaction_data) < 5:
                     return []
@@ -1282,23 +1281,28 @@ class CoordinationDetector:
                     f"Detecting coordination patterns for {token_address} with {len(transaction_data)} transactions"
                 )
                 
+                if isinstance(transaction_data, TransactionBatch):
+                    batch = transaction_data
+                else:
+                    batch = TransactionBatch.from_transactions(transaction_data)
+                
                 alerts = []
                 
                 # Detect different types of coordination
                 try:
-                    pump_alerts = await self._detect_pump_coordination(transaction_data)
+                    pump_alerts = await self._detect_pump_coordination(batch)
                     alerts.extend(pump_alerts)
                 except Exception as e:
                     self.logger.error(f"Pump coordination detection failed: {e}")
                 
                 try:
-                    wash_alerts = await self._detect_wash_trading(transaction_data)
+                    wash_alerts = await self._detect_wash_trading(batch)
                     alerts.extend(wash_alerts)
                 except Exception as e:
                     self.logger.error(f"Wash trading detection failed: {e}")
                 
                 try:
-                    bot_alerts = await self._detect_bot_clusters(transaction_data)
+                    bot_alerts = await self._detect_bot_clusters(batch)
                     alerts.extend(bot_alerts)
                 except Exception as e:
                     self.logger.error(f"Bot cluster detection failed: {e}")
@@ -1317,171 +1321,167 @@ class CoordinationDetector:
                 self.logger.error(f"Coordination detection failed for {token_address}: {e}")
                 return []
 
-    async def _detect_pump_coordination(self, transactions: List[Dict[str, Any]]) -> List[CoordinationAlert]:
+    async def _detect_pump_coordination(self, batch: TransactionBatch) -> List[CoordinationAlert]:
         """Detect pump coordination patterns."""
         alerts = []
         
-        # Group transactions by time windows (5-minute windows)
-        time_windows = defaultdict(list)
-        for tx in transactions:
-            timestamp = tx.get("timestamp", datetime.utcnow())
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            
-            window_key = timestamp.replace(minute=timestamp.minute//5*5, second=0, microsecond=0)
-            time_windows[window_key].append(tx)
+        # Group buy transactions by 5-minute windows, time-ordered within each
+        buy_rows = np.flatnonzero(batch.buys)
+        if len(buy_rows) < 5:
+            return alerts
+        
+        times = batch.timestamps[buy_rows]
+        windows = np.floor(times / 300) * 300
+        groups = group_by([windows], within=times)
+        rows = buy_rows[groups.order]
+        
+        # Suspicious if many transactions from different addresses in short time
+        unique_addresses = group_distinct(batch.from_codes[rows], groups)
+        # Similar amounts and precise timing suggest coordinated bots
+        amount_similarity = cv_similarity(batch.amounts[rows], groups.ids, len(groups))
+        timing_precision = interval_regularity(batch.timestamps[rows], groups)
+        volumes = group_sums(batch.amounts[rows], groups)
+        
+        candidates = (
+            (groups.counts >= 5) & (unique_addresses >= 3)
+            & ((amount_similarity > 0.7) | (timing_precision > 0.8))
+        )
         
-        # Analyze each time window for pump patterns
-        for window_time, window_txs in time_windows.items():
-            if len(window_txs) < 5:
-                continue
-            
-            # Check for coordinated buying
-            buy_txs = [tx for tx in window_txs if tx.get("type", "").lower() in ["buy", "swap_in"]]
+        for group in np.flatnonzero(candidates):
+            group_rows = buy_rows[groups.rows(group)]
+            similarity = float(amount_similarity[group])
+            precision = float(timing_precision[group])
+            confidence = (similarity + precision) / 2
+            tx_count = int(groups.counts[group])
+            
+            alert = CoordinationAlert(
+                pattern_type=CoordinationPattern.PUMP_COORDINATION,
+                severity="high" if confidence > 0.8 else "medium",
+                confidence=confidence,
+                involved_addresses=batch.address_list(np.unique(batch.from_codes[group_rows])),
+                suspicious_transactions=batch.hashes[group_rows].tolist(),
+                time_window=timedelta(minutes=5),
+                statistical_evidence={
+                    "amount_similarity": similarity,
+                    "timing_precision": precision,
+                    "transaction_count": tx_count,
+                    "unique_addresses": int(unique_addresses[group])
+                },
+                behavioral_patterns=[
+                    f"{tx_count} coordinated buy transactions",
+                    f"Amount similarity: {similarity:.2f}",
+                    f"Timing precision: {precision:.2f}"
+                ],
+                potential_price_impact=self._estimate_coordination_impact(float(volumes[group])),
+                manipulation_risk=confidence * 0.8,
+                timestamp=to_datetime(windows[groups.order[groups.starts[group]]])
+            )
             
-            if len(buy_txs) >= 5:
-                # Calculate statistical indicators
-                addresses = [tx.get("from_address", "") for tx in buy_txs]
-                unique_addresses = set(addresses)
-                
-                # Suspicious if many transactions from different addresses in short time
-                if len(unique_addresses) >= 3 and len(buy_txs) >= 5:
-                    # Check transaction amounts for similarity (potential coordination)
-                    amounts = [float(tx.get("usd_value", 0)) for tx in buy_txs]
-                    amount_similarity = self._calculate_amount_similarity(amounts)
-                    
-                    # Check timing precision (coordinated bots often have precise timing)
-                    timing_precision = self._calculate_timing_precision(buy_txs)
-                    
-                    if amount_similarity > 0.7 or timing_precision > 0.8:
-                        confidence = (amount_similarity + timing_precision) / 2
-                        
-                        alert = CoordinationAlert(
-                            pattern_type=CoordinationPattern.PUMP_COORDINATION,
-                            severity="high" if confidence > 0.8 else "medium",
-                            confidence=confidence,
-                            involved_addresses=list(unique_addresses),
-                            suspicious_transactions=[tx.get("hash", "") for tx in buy_txs],
-                            time_window=timedelta(minutes=5),
-                            statistical_evidence={
-                                "amount_similarity": amount_similarity,
-                                "timing_precision": timing_precision,
-                                "transaction_count": len(buy_txs),
-                                "unique_addresses": len(unique_addresses)
-                            },
-                            behavioral_patterns=[
-                                f"{len(buy_txs)} coordinated buy transactions",
-                                f"Amount similarity: {amount_similarity:.2f}",
-                                f"Timing precision: {timing_precision:.2f}"
-                            ],
-                            potential_price_impact=self._estimate_coordination_impact(buy_txs),
-                            manipulation_risk=confidence * 0.8,
-                            timestamp=window_time
-                        )
-                        
-                        alerts.append(alert)
+            alerts.append(alert)
         
         return alerts
     
-    async def _detect_wash_trading(self, transactions: List[Dict[str, Any]]) -> List[CoordinationAlert]:
+    async def _detect_wash_trading(self, batch: TransactionBatch) -> List[CoordinationAlert]:
         """Detect wash trading patterns."""
         alerts = []
         
-        # Group transactions by address pairs
-        address_pairs = defaultdict(list)
-        for tx in transactions:
-            from_addr = tx.get("from_address", "")
-            to_addr = tx.get("to_address", "")
+        # Group transactions by unordered address pair, time-ordered within each
+        pair_rows = np.flatnonzero((batch.from_codes != NO_ADDRESS) & (batch.to_codes != NO_ADDRESS))
+        if len(pair_rows) < 3:
+            return alerts
+        
+        from_codes, to_codes = batch.from_codes[pair_rows], batch.to_codes[pair_rows]
+        pair_keys = np.minimum(from_codes, to_codes) * len(batch.addresses) + np.maximum(from_codes, to_codes)
+        groups = group_by([pair_keys], within=batch.timestamps[pair_rows])
+        rows = pair_rows[groups.order]
+        
+        # Back-and-forth trading, consistent amounts and regular timing
+        alternating_pattern = group_alternation(batch.directions[rows], groups)
+        amount_consistency = cv_similarity(batch.amounts[rows], groups.ids, len(groups))
+        time_regularity = interval_regularity(batch.timestamps[rows], groups)
+        
+        # Wash trading indicators
+        wash_score = (alternating_pattern + amount_consistency + time_regularity) / 3
+        candidates = (groups.counts >= 3) & (wash_score > 0.6)
+        
+        for group in np.flatnonzero(candidates):
+            group_rows = pair_rows[groups.rows(group)]
+            first = group_rows[0]
+            addr1, addr2 = sorted(batch.address_list(np.array([batch.from_codes[first], batch.to_codes[first]])))
+            score = float(wash_score[group])
+            alternating = float(alternating_pattern[group])
+            consistency = float(amount_consistency[group])
+            
+            alert = CoordinationAlert(
+                pattern_type=CoordinationPattern.WASH_TRADING,
+                severity="critical" if score > 0.8 else "high",
+                confidence=score,
+                involved_addresses=[addr1, addr2],
+                suspicious_transactions=batch.hashes[group_rows].tolist(),
+                time_window=timedelta(hours=1),
+                statistical_evidence={
+                    "alternating_pattern": alternating,
+                    "amount_consistency": consistency,
+                    "time_regularity": float(time_regularity[group]),
+                    "transaction_count": int(groups.counts[group])
+                },
+                behavioral_patterns=[
+                    f"Back-and-forth trading between {addr1[:8]}... and {addr2[:8]}...",
+                    f"Pattern score: {alternating:.2f}",
+                    f"Amount consistency: {consistency:.2f}"
+                ],
+                manipulation_risk=score * 0.9,
+                timestamp=datetime.utcnow()
+            )
             
-            if from_addr and to_addr:
-                pair_key = tuple(sorted([from_addr, to_addr]))
-                address_pairs[pair_key].append(tx)
-        
-        # Analyze each address pair for wash trading
-        for (addr1, addr2), pair_txs in address_pairs.items():
-            if len(pair_txs) < 3:
-                continue
-            
-            # Check for back-and-forth trading
-            alternating_pattern = self._detect_alternating_pattern(pair_txs)
-            amount_consistency = self._calculate_wash_amount_consistency(pair_txs)
-            time_regularity = self._calculate_wash_time_regularity(pair_txs)
-            
-            # Wash trading indicators
-            wash_score = (alternating_pattern + amount_consistency + time_regularity) / 3
-            
-            if wash_score > 0.6:
-                alert = CoordinationAlert(
-                    pattern_type=CoordinationPattern.WASH_TRADING,
-                    severity="critical" if wash_score > 0.8 else "high",
-                    confidence=wash_score,
-                    involved_addresses=[addr1, addr2],
-                    suspicious_transactions=[tx.get("hash", "") for tx in pair_txs],
-                    time_window=timedelta(hours=1),
-                    statistical_evidence={
-                        "alternating_pattern": alternating_pattern,
-                        "amount_consistency": amount_consistency,
-                        "time_regularity": time_regularity,
-                        "transaction_count": len(pair_txs)
-                    },
-                    behavioral_patterns=[
-                        f"Back-and-forth trading between {addr1[:8]}... and {addr2[:8]}...",
-                        f"Pattern score: {alternating_pattern:.2f}",
-                        f"Amount consistency: {amount_consistency:.2f}"
-                    ],
-                    manipulation_risk=wash_score * 0.9,
-                    timestamp=datetime.utcnow()
-                )
-                
-                alerts.append(alert)
+            alerts.append(alert)
         
         return alerts
     
-    async def _detect_bot_clusters(self, transactions: List[Dict[str, Any]]) -> List[CoordinationAlert]:
+    async def _detect_bot_clusters(self, batch: TransactionBatch) -> List[CoordinationAlert]:
         """Detect bot cluster patterns."""
         alerts = []
         
-        # Group transactions by behavioral patterns
-        bot_indicators = defaultdict(list)
-        for tx in transactions:
-            address = tx.get("from_address", "")
-            if not address:
-                continue
-            
-            # Calculate bot behavior indicators
-            bot_score = self._calculate_bot_behavior_score(tx)
-            if bot_score > 0.7:
-                bot_indicators[address].append((tx, bot_score))
+        # Score every transaction, keep bot-like ones with a known sender
+        bot_scores = self._calculate_bot_behavior_scores(batch)
+        bot_rows = np.flatnonzero((bot_scores > 0.7) & (batch.from_codes != NO_ADDRESS))
+        if len(bot_rows) == 0:
+            return alerts
+        
+        # Per-address average score, addresses in order of first bot transaction
+        codes, first_rows, inverse = np.unique(
+            batch.from_codes[bot_rows], return_index=True, return_inverse=True
+        )
         
         # Find clusters of bot-like addresses
-        if len(bot_indicators) >= 3:
-            addresses = list(bot_indicators.keys())
-            bot_transactions = []
-            total_bot_score = 0
-            
-            for addr, txs_scores in bot_indicators.items():
-                bot_transactions.extend([tx for tx, score in txs_scores])
-                total_bot_score += statistics.mean([score for tx, score in txs_scores])
-            
-            avg_bot_score = total_bot_score / len(bot_indicators)
+        if len(codes) >= 3:
+            address_scores = (
+                np.bincount(inverse, weights=bot_scores[bot_rows]) / np.bincount(inverse)
+            )
+            avg_bot_score = float(address_scores.mean())
             
             if avg_bot_score > 0.75:
+                by_first_seen = np.argsort(first_rows)
+                rank = np.empty_like(by_first_seen)
+                rank[by_first_seen] = np.arange(len(by_first_seen))
+                bot_transactions = bot_rows[np.argsort(rank[inverse], kind="stable")]
+                
                 alert = CoordinationAlert(
                     pattern_type=CoordinationPattern.BOT_CLUSTER,
                     severity="medium",
                     confidence=avg_bot_score,
-                    involved_addresses=addresses,
-                    suspicious_transactions=[tx.get("hash", "") for tx in bot_transactions],
+                    involved_addresses=batch.address_list(codes[by_first_seen]),
+                    suspicious_transactions=batch.hashes[bot_transactions].tolist(),
                     time_window=timedelta(hours=2),
                     statistical_evidence={
-                        "bot_cluster_size": len(bot_indicators),
+                        "bot_cluster_size": len(codes),
                         "average_bot_score": avg_bot_score,
-                        "total_bot_transactions": len(bot_transactions)
+                        "total_bot_transactions": len(bot_rows)
                     },
                     behavioral_patterns=[
-                        f"Cluster of {len(bot_indicators)} bot-like addresses",
+                        f"Cluster of {len(codes)} bot-like addresses",
                         f"Average bot score: {avg_bot_score:.2f}",
-                        f"Total transactions: {len(bot_transactions)}"
+                        f"Total transactions: {len(bot_rows)}"
                     ],
                     manipulation_risk=avg_bot_score * 0.6,
                     timestamp=datetime.utcnow()
@@ -1493,131 +1493,31 @@ class CoordinationDetector:
     
     def _calculate_amount_similarity(self, amounts: List[float]) -> float:
         """Calculate similarity in transaction amounts."""
-        if len(amounts) < 2:
-            return 0.0
-        
-        # Calculate coefficient of variation (lower = more similar)
-        mean_amount = statistics.mean(amounts)
-        if mean_amount == 0:
-            return 0.0
-        
-        std_amount = statistics.stdev(amounts) if len(amounts) > 1 else 0.0
-        cv = std_amount / mean_amount
+        values = np.asarray(amounts, dtype=np.float64)
         
-        # Convert to similarity score (0-1, higher = more similar)
-        similarity = max(0.0, 1.0 - cv)
-        return similarity
+        # Coefficient of variation (lower = more similar) as a 0-1 similarity score
+        return float(cv_similarity(values, np.zeros(len(values), dtype=np.int64), 1)[0])
     
-    def _calculate_timing_precision(self, transactions: List[Dict[str, Any]]) -> float:
-        """Calculate timing precision of transactions."""
-        if len(transactions) < 2:
-            return 0.0
+    def _calculate_bot_behavior_scores(self, batch: TransactionBatch) -> np.ndarray:
+        """Calculate bot behavior score for every transaction in a batch."""
+        amounts = batch.amounts
+        positive = amounts > 0
         
-        timestamps = []
-        for tx in transactions:
-            timestamp = tx.get("timestamp", datetime.utcnow())
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-            timestamps.append(timestamp)
-        
-        timestamps.sort()
+        # Bots often use round numbers and common amounts
+        round_amount = positive & (amounts == np.round(amounts))
+        common_amount = positive & (np.abs(amounts[:, None] - self.COMMON_BOT_AMOUNTS) < 1).any(axis=1)
         
-        # Calculate intervals between transactions
-        intervals = []
-        for i in range(1, len(timestamps)):
-            interval = (timestamps[i] - timestamps[i-1]).total_seconds()
-            intervals.append(interval)
+        # Consistent gas prices (simplified - in production would compare to historical patterns)
+        has_gas_price = batch.gas_prices > 0
         
-        if not intervals:
-            return 0.0
+        # Execution at precise minute boundaries
+        on_minute = np.floor(batch.timestamps) % 60 == 0
         
-        # Check for regular intervals (bot-like behavior)
-        mean_interval = statistics.mean(intervals)
-        if mean_interval == 0:
-            return 0.0
-        
-        std_interval = statistics.stdev(intervals) if len(intervals) > 1 else 0.0
-        cv = std_interval / mean_interval
-        
-        # High precision = low coefficient of variation
-        precision = max(0.0, 1.0 - cv)
-        return precision
+        bot_scores = 0.2 * round_amount + 0.3 * common_amount + 0.1 * has_gas_price + 0.2 * on_minute
+        return np.minimum(1.0, bot_scores)
     
-    def _detect_alternating_pattern(self, transactions: List[Dict[str, Any]]) -> float:
-        """Detect alternating buy/sell pattern."""
-        if len(transactions) < 3:
-            return 0.0
-        
-        # Sort by timestamp
-        sorted_txs = sorted(transactions, key=lambda x: x.get("timestamp", datetime.utcnow()))
-        
-        # Check for alternating pattern
-        directions = []
-        for tx in sorted_txs:
-            tx_type = tx.get("type", "").lower()
-            if "buy" in tx_type or "swap_in" in tx_type:
-                directions.append(1)
-            elif "sell" in tx_type or "swap_out" in tx_type:
-                directions.append(-1)
-            else:
-                directions.append(0)
-        
-        # Calculate alternation score
-        alternations = 0
-        for i in range(1, len(directions)):
-            if directions[i] != 0 and directions[i-1] != 0 and directions[i] != directions[i-1]:
-                alternations += 1
-        
-        max_alternations = len(directions) - 1
-        return alternations / max_alternations if max_alternations > 0 else 0.0
-    
-    def _calculate_wash_amount_consistency(self, transactions: List[Dict[str, Any]]) -> float:
-        """Calculate amount consistency in wash trading."""
-        amounts = [float(tx.get("usd_value", 0)) for tx in transactions]
-        return self._calculate_amount_similarity(amounts)
-    
-    def _calculate_wash_time_regularity(self, transactions: List[Dict[str, Any]]) -> float:
-        """Calculate time regularity in wash trading."""
-        return self._calculate_timing_precision(transactions)
-    
-    def _calculate_bot_behavior_score(self, transaction: Dict[str, Any]) -> float:
-        """Calculate bot behavior score for a transaction."""
-        bot_score = 0.0
-        
-        # Check transaction amount (bots often use round numbers)
-        usd_value = float(transaction.get("usd_value", 0))
-        if usd_value > 0:
-            # Check if amount is a round number
-            if usd_value == round(usd_value):
-                bot_score += 0.2
-            
-            # Check for common bot amounts
-            common_amounts = [100, 200, 500, 1000, 2000, 5000]
-            if any(abs(usd_value - amount) < 1 for amount in common_amounts):
-                bot_score += 0.3
-        
-        # Check gas price (bots often use consistent gas prices)
-        gas_price = transaction.get("gas_price", 0)
-        if gas_price > 0:
-            # This is simplified - in production would compare to historical patterns
-            bot_score += 0.1
-        
-        # Check transaction timing (bots often execute at precise intervals)
-        timestamp = transaction.get("timestamp", datetime.utcnow())
-        if isinstance(timestamp, datetime):
-            # Check if transaction was made at precise minute/second boundaries
-            if timestamp.second == 0:
-                bot_score += 0.2
-        
-        return min(1.0, bot_score)
-    
-    def _estimate_coordination_impact(self, transactions: List[Dict[str, Any]]) -> float:
-        """Estimate price impact of coordination."""
-        if not transactions:
-            return 0.0
-        
-        total_volume = sum(float(tx.get("usd_value", 0)) for tx in transactions)
-        
+    def _estimate_coordination_impact(self, total_volume: float) -> float:
+        """Estimate price impact of coordination from its USD volume."""
         # Simplified impact calculation
         # In production, would use order book depth and liquidity analysis
         if total_volume < 10000:
@@ -1638,8 +1538,16 @@ class MarketIntelligenceEngine:
     and coordination pattern recognition into unified market intelligence.
     """
     
-    def __init__(self) -> None:
-        """Initialize advanced market intelligence system with safe logging."""
+    def __init__(self, intelligence_cache: Optional[IntelligenceCache] = None) -> None:
+        """
+        Initialize advanced market intelligence system with safe logging.
+        
+        Args:
+            intelligence_cache: Result cache (defaults to the process-wide shared cache)
+        """
+        # Results are shared with every other engine in the process
+        self.intelligence_cache = intelligence_cache or get_intelligence_cache()
+        
         try:
             # Initialize components with error handling
             logger.info("Initializing Market Intelligence components...")
@@ -1656,10 +1564,6 @@ class MarketIntelligenceEngine:
             self.coordination_detector = CoordinationDetector()
             logger.debug("CoordinationDetector initialized")
             
-            # Cache for intelligence data
-            self.intelligence_cache: Dict[str, Dict] = {}
-            self.cache_ttl = timedelta(minutes=15)
-            
             logger.info("Advanced market intelligence system initialized successfully")
             
         except Exception as e:
@@ -1669,8 +1573,6 @@ class MarketIntelligenceEngine:
             self.whale_tracker = None
             self.regime_detector = None
             self.coordination_detector = None
-            self.intelligence_cache = {}
-            self.cache_ttl = timedelta(minutes=15)
             raise
     
     async def analyze_market_intelligence(
@@ -1695,182 +1597,13 @@ class MarketIntelligenceEngine:
             Comprehensive market intelligence report
         """
         try:
-            cache_key = f"{token_address}:{chain}"
-            
-            # Check cache
-            if (cache_key in self.intelligence_cache and 
-                datetime.utcnow() - self.intelligence_cache[cache_key]["timestamp"] < self.cache_ttl):
-                return self.intelligence_cache[cache_key]["data"]
-            
-            logger.info(
-                f"Analyzing market intelligence for {token_address}",
-                extra={"module": "market_intelligence", "token": token_address}
-            )
-            
-            # Run all analysis components in parallel
-            sentiment_task = self.sentiment_analyzer.analyze_social_sentiment(
-                token_address, social_data
-            )
-            
-            whale_task = self.whale_tracker.track_whale_activity(
-                token_address, chain, transaction_data
-            )
-            
-            regime_task = self.regime_detector.detect_market_regime(
-                token_address,
-                market_data.get("price_history", []),
-                market_data.get("volume_history", [])
-            )
-            
-            coordination_task = self.coordination_detector.detect_coordination(
-                token_address, transaction_data
-            )
-            
-            # Wait for all analysis to complete
-            sentiment_metrics, whale_activity, regime_indicators, coordination_alerts = await asyncio.gather(
-                sentiment_task,
-                whale_task,
-                regime_task,
-                coordination_task,
-                return_exceptions=True
-            )
-            
-            # Handle any exceptions
-            if isinstance(sentiment_metrics, Exception):
-                logger.error(f"Sentiment analysis failed: {sentiment_metrics}")
-                sentiment_metrics = SocialMetrics(timestamp=datetime.utcnow())
-            
-            if isinstance(whale_activity, Exception):
-                logger.error(f"Whale tracking failed: {whale_activity}")
-                whale_activity = WhaleActivity(timestamp=datetime.utcnow())
-            
-            if isinstance(regime_indicators, Exception):
-                logger.error(f"Regime detection failed: {regime_indicators}")
-                regime_indicators = RegimeIndicators(
-                    current_regime=MarketRegime.CRAB_MARKET,
-                    timestamp=datetime.utcnow()
+            return await self.intelligence_cache.get_or_compute(
+                intelligence_key(chain, token_address, "market"),
+                lambda: self._compute_market_intelligence(
+                    token_address, chain, market_data, social_data, transaction_data
                 )
-            
-            if isinstance(coordination_alerts, Exception):
-                logger.error(f"Coordination detection failed: {coordination_alerts}")
-                coordination_alerts = []
-            
-            # Calculate composite intelligence score
-            intelligence_score = self._calculate_intelligence_score(
-                sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
-            )
-            
-            # Generate recommendations
-            recommendations = self._generate_recommendations(
-                sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
             )
             
-            # Create comprehensive intelligence report
-            intelligence_report = {
-                # Timestamp and metadata
-                "timestamp": datetime.utcnow().isoformat(),
-                "token_address": token_address,
-                "chain": chain,
-                "analysis_version": "1.0.0",
-                
-                # Social sentiment analysis
-                "social_sentiment": {
-                    "overall_sentiment": self._classify_sentiment_signal(sentiment_metrics.sentiment_score),
-                    "sentiment_score": sentiment_metrics.sentiment_score,
-                    "mention_count": sentiment_metrics.mention_count,
-                    "engagement_rate": sentiment_metrics.engagement_rate,
-                    "viral_coefficient": sentiment_metrics.viral_coefficient,
-                    "mention_velocity": sentiment_metrics.mention_velocity,
-                    "trend_strength": sentiment_metrics.trend_strength,
-                    "bot_percentage": sentiment_metrics.bot_percentage,
-                    "spam_percentage": sentiment_metrics.spam_percentage,
-                    "influencer_mentions": sentiment_metrics.influencer_mentions,
-                    "quality_score": self._calculate_sentiment_quality(sentiment_metrics)
-                },
-                
-                # Whale behavior analysis
-                "whale_activity": {
-                    "total_transactions": whale_activity.total_transactions,
-                    "net_flow": float(whale_activity.net_flow),
-                    "dominant_action": whale_activity.dominant_action.value if whale_activity.dominant_action else None,
-                    "whale_confidence": whale_activity.whale_confidence,
-                    "predicted_direction": whale_activity.predicted_direction,
-                    "direction_confidence": whale_activity.confidence_score,
-                    "coordination_detected": whale_activity.coordination_detected,
-                    "manipulation_risk": whale_activity.manipulation_risk,
-                    "most_active_whales": whale_activity.most_active_whales[:3],  # Top 3
-                    "largest_transaction_value": float(max(
-                        (tx.usd_value for tx in whale_activity.largest_transactions),
-                        default=0
-                    ))
-                },
-                
-                # Market regime analysis
-                "market_regime": {
-                    "current_regime": regime_indicators.current_regime.value,
-                    "regime_confidence": regime_indicators.regime_confidence,
-                    "regime_strength": regime_indicators.regime_strength,
-                    "trend_direction": regime_indicators.trend_direction,
-                    "trend_strength": regime_indicators.trend_strength,
-                    "volatility_level": regime_indicators.volatility_level,
-                    "volume_trend": regime_indicators.volume_trend,
-                    "breakout_probability": regime_indicators.breakout_probability,
-                    "regime_change_probability": regime_indicators.regime_change_probability,
-                    "next_likely_regime": regime_indicators.next_likely_regime.value if regime_indicators.next_likely_regime else None,
-                    "key_levels": [float(level) for level in regime_indicators.key_levels[:3]]
-                },
-                
-                # Coordination detection
-                "coordination_analysis": {
-                    "patterns_detected": len(coordination_alerts),
-                    "pattern_types": list(set([alert.pattern_type.value for alert in coordination_alerts])),
-                    "highest_risk_level": self._get_highest_risk_level(coordination_alerts),
-                    "manipulation_risk": self._assess_coordination_risk(coordination_alerts),
-                    "suspicious_addresses": list(set([
-                        addr for alert in coordination_alerts 
-                        for addr in alert.involved_addresses
-                    ]))[:10]  # Top 10 suspicious addresses
-                },
-                
-                # Composite intelligence
-                "intelligence_score": intelligence_score,
-                "market_health": self._assess_market_health(intelligence_score, coordination_alerts),
-                "confidence_level": self._calculate_overall_confidence(
-                    sentiment_metrics, regime_indicators, coordination_alerts
-                ),
-                
-                # Recommendations and insights
-                "recommendations": recommendations,
-                "key_insights": self._generate_key_insights(
-                    sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
-                ),
-                "risk_factors": self._identify_risk_factors(
-                    sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
-                ),
-                "opportunity_factors": self._identify_opportunity_factors(
-                    sentiment_metrics, whale_activity, regime_indicators
-                )
-            }
-            
-            # Cache the result
-            self.intelligence_cache[cache_key] = {
-                "data": intelligence_report,
-                "timestamp": datetime.utcnow()
-            }
-            
-            logger.info(
-                f"Market intelligence analysis complete for {token_address}: "
-                f"score {intelligence_score:.2f}, health {intelligence_report['market_health']}",
-                extra={
-                    "module": "market_intelligence",
-                    "token": token_address,
-                    "intelligence_score": intelligence_score,
-                    "market_health": intelligence_report["market_health"]
-                }
-            )
-            
-            return intelligence_report
-            
         except Exception as e:
             logger.error(
                 f"Market intelligence analysis failed for {token_address}: {e}",
@@ -1878,6 +1611,178 @@ class MarketIntelligenceEngine:
             )
             return self._create_fallback_report(token_address, chain)
     
+    async def _compute_market_intelligence(
+        self,
+        token_address: str,
+        chain: str,
+        market_data: Dict[str, Any],
+        social_data: List[Dict[str, Any]],
+        transaction_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run every analysis component and assemble the report (raises on failure)."""
+        logger.info(
+            f"Analyzing market intelligence for {token_address}",
+            extra={"module": "market_intelligence", "token": token_address}
+        )
+        
+        # Run all analysis components in parallel
+        sentiment_task = self.sentiment_analyzer.analyze_social_sentiment(
+            token_address, social_data
+        )
+        
+        whale_task = self.whale_tracker.track_whale_activity(
+            token_address, chain, transaction_data
+        )
+        
+        regime_task = self.regime_detector.detect_market_regime(
+            token_address,
+            market_data.get("price_history", []),
+            market_data.get("volume_history", [])
+        )
+        
+        coordination_task = self.coordination_detector.detect_coordination(
+            token_address, transaction_data
+        )
+        
+        # Wait for all analysis to complete
+        sentiment_metrics, whale_activity, regime_indicators, coordination_alerts = await asyncio.gather(
+            sentiment_task,
+            whale_task,
+            regime_task,
+            coordination_task,
+            return_exceptions=True
+        )
+        
+        # Handle any exceptions
+        if isinstance(sentiment_metrics, Exception):
+            logger.error(f"Sentiment analysis failed: {sentiment_metrics}")
+            sentiment_metrics = SocialMetrics(timestamp=datetime.utcnow())
+        
+        if isinstance(whale_activity, Exception):
+            logger.error(f"Whale tracking failed: {whale_activity}")
+            whale_activity = WhaleActivity(timestamp=datetime.utcnow())
+        
+        if isinstance(regime_indicators, Exception):
+            logger.error(f"Regime detection failed: {regime_indicators}")
+            regime_indicators = RegimeIndicators(
+                current_regime=MarketRegime.CRAB_MARKET,
+                timestamp=datetime.utcnow()
+            )
+        
+        if isinstance(coordination_alerts, Exception):
+            logger.error(f"Coordination detection failed: {coordination_alerts}")
+            coordination_alerts = []
+        
+        # Calculate composite intelligence score
+        intelligence_score = self._calculate_intelligence_score(
+            sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
+        )
+        
+        # Generate recommendations
+        recommendations = self._generate_recommendations(
+            sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
+        )
+        
+        # Create comprehensive intelligence report
+        intelligence_report = {
+            # Timestamp and metadata
+            "timestamp": datetime.utcnow().isoformat(),
+            "token_address": token_address,
+            "chain": chain,
+            "analysis_version": "1.0.0",
+        
+            # Social sentiment analysis
+            "social_sentiment": {
+                "overall_sentiment": self._classify_sentiment_signal(sentiment_metrics.sentiment_score),
+                "sentiment_score": sentiment_metrics.sentiment_score,
+                "mention_count": sentiment_metrics.mention_count,
+                "engagement_rate": sentiment_metrics.engagement_rate,
+                "viral_coefficient": sentiment_metrics.viral_coefficient,
+                "mention_velocity": sentiment_metrics.mention_velocity,
+                "trend_strength": sentiment_metrics.trend_strength,
+                "bot_percentage": sentiment_metrics.bot_percentage,
+                "spam_percentage": sentiment_metrics.spam_percentage,
+                "influencer_mentions": sentiment_metrics.influencer_mentions,
+                "quality_score": self._calculate_sentiment_quality(sentiment_metrics)
+            },
+        
+            # Whale behavior analysis
+            "whale_activity": {
+                "total_transactions": whale_activity.total_transactions,
+                "net_flow": float(whale_activity.net_flow),
+                "dominant_action": whale_activity.dominant_action.value if whale_activity.dominant_action else None,
+                "whale_confidence": whale_activity.whale_confidence,
+                "predicted_direction": whale_activity.predicted_direction,
+                "direction_confidence": whale_activity.confidence_score,
+                "coordination_detected": whale_activity.coordination_detected,
+                "manipulation_risk": whale_activity.manipulation_risk,
+                "most_active_whales": whale_activity.most_active_whales[:3],  # Top 3
+                "largest_transaction_value": float(max(
+                    (tx.usd_value for tx in whale_activity.largest_transactions),
+                    default=0
+                ))
+            },
+        
+            # Market regime analysis
+            "market_regime": {
+                "current_regime": regime_indicators.current_regime.value,
+                "regime_confidence": regime_indicators.regime_confidence,
+                "regime_strength": regime_indicators.regime_strength,
+                "trend_direction": regime_indicators.trend_direction,
+                "trend_strength": regime_indicators.trend_strength,
+                "volatility_level": regime_indicators.volatility_level,
+                "volume_trend": regime_indicators.volume_trend,
+                "breakout_probability": regime_indicators.breakout_probability,
+                "regime_change_probability": regime_indicators.regime_change_probability,
+                "next_likely_regime": regime_indicators.next_likely_regime.value if regime_indicators.next_likely_regime else None,
+                "key_levels": [float(level) for level in regime_indicators.key_levels[:3]]
+            },
+        
+            # Coordination detection
+            "coordination_analysis": {
+                "patterns_detected": len(coordination_alerts),
+                "pattern_types": list(set([alert.pattern_type.value for alert in coordination_alerts])),
+                "highest_risk_level": self._get_highest_risk_level(coordination_alerts),
+                "manipulation_risk": self._assess_coordination_risk(coordination_alerts),
+                "suspicious_addresses": list(set([
+                    addr for alert in coordination_alerts 
+                    for addr in alert.involved_addresses
+                ]))[:10]  # Top 10 suspicious addresses
+            },
+        
+            # Composite intelligence
+            "intelligence_score": intelligence_score,
+            "market_health": self._assess_market_health(intelligence_score, coordination_alerts),
+            "confidence_level": self._calculate_overall_confidence(
+                sentiment_metrics, regime_indicators, coordination_alerts
+            ),
+        
+            # Recommendations and insights
+            "recommendations": recommendations,
+            "key_insights": self._generate_key_insights(
+                sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
+            ),
+            "risk_factors": self._identify_risk_factors(
+                sentiment_metrics, whale_activity, regime_indicators, coordination_alerts
+            ),
+            "opportunity_factors": self._identify_opportunity_factors(
+                sentiment_metrics, whale_activity, regime_indicators
+            )
+        }
+        
+        logger.info(
+            f"Market intelligence analysis complete for {token_address}: "
+            f"score {intelligence_score:.2f}, health {intelligence_report['market_health']}",
+            extra={
+                "module": "market_intelligence",
+                "token": token_address,
+                "intelligence_score": intelligence_score,
+                "market_health": intelligence_report["market_health"]
+            }
+        )
+        
+        return intelligence_report
+    
 
 
 
@@ -1898,9 +1803,26 @@ class MarketIntelligenceEngine:
             
         Returns:
             Dict containing complete intelligence analysis or None if analysis fails
+        """
+        if not token_address or not chain:
+            logger.error("Intelligence analysis failed: token address and chain are required")
+            return None
+        
+        return await self.intelligence_cache.get_or_compute(
+            intelligence_key(chain, token_address, "pair"),
+            lambda: self._compute_pair_intelligence(token_address, chain)
+        )
+    
+    async def _compute_pair_intelligence(self, token_address: str, chain: str) -> Optional[Dict[str, Any]]:
+        """
+        Run the pair intelligence analysis (uncached).
+        
+        Args:
+            token_address: Token contract address to analyze
+            chain: Blockchain network (ethereum, bsc, etc.)
             
-        Raises:
-            ValueError: When token_address or chain is invalid
+        Returns:
+            Dict containing complete intelligence analysis or None if analysis fails
         """
         analysis_start = time.time()
         
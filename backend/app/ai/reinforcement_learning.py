@@ -22,11 +22,11 @@ import json
 import logging
 import math
 import random
-from collections import defaultdict, deque
-from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from collections import defaultdict
+from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
+from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
@@ -128,56 +128,92 @@ class MarketState:
     
     def discretize(self, bins: int = 10) -> str:
         """Convert continuous state to discrete representation for Q-learning."""
-        # Discretize key features
-        price_change_bin = min(int((self.price_change_5m + 0.1) * bins / 0.2), bins - 1)
-        rsi_bin = min(int(self.rsi / 100 * bins), bins - 1)
-        volume_bin = min(int(max(0, min(self.volume_ratio, 3.0)) / 3.0 * bins), bins - 1)
-        position_bin = min(int(max(0, min(self.current_position_size, 1.0)) * bins), bins - 1)
-        volatility_bin = min(int(max(0, min(self.volatility, 0.1)) / 0.1 * bins), bins - 1)
-        
-        return f"{price_change_bin}_{rsi_bin}_{volume_bin}_{position_bin}_{volatility_bin}"
-
-
-@dataclass
-class Experience:
-    """Experience tuple for replay buffer."""
+        return "_".join(str(b) for b in self.bin_indices(bins))
     
-    state: MarketState
-    action: ActionType
-    reward: float
-    next_state: MarketState
-    done: bool
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    def bin_indices(self, bins: int = 10) -> Tuple[int, int, int, int, int]:
+        """Bin the key features (price change, RSI, volume, position, volatility) into [0, bins)."""
+        def clamp(value: float) -> int:
+            return max(0, min(int(value), bins - 1))
+        
+        return (
+            clamp((self.price_change_5m + 0.1) * bins / 0.2),
+            clamp(self.rsi / 100 * bins),
+            clamp(max(0, min(self.volume_ratio, 3.0)) / 3.0 * bins),
+            clamp(max(0, min(self.current_position_size, 1.0)) * bins),
+            clamp(max(0, min(self.volatility, 0.1)) / 0.1 * bins),
+        )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert experience to dictionary for storage."""
-        return {
-            "state_vector": self.state.to_vector().tolist(),
-            "action": self.action.value,
-            "reward": self.reward,
-            "next_state_vector": self.next_state.to_vector().tolist(),
-            "done": self.done,
-            "timestamp": self.timestamp.isoformat()
-        }
+    def state_index(self, bins: int = 10, n_states: Optional[int] = None) -> int:
+        """
+        Integer row of this state in an array-backed Q-table.
+        
+        The feature bins are read as the digits of a base-``bins`` number, so
+        with the default ``n_states = bins ** 5`` every discrete state gets its
+        own row; a smaller table folds states together by modulo.
+        
+        Args:
+            bins: Bins per feature
+            n_states: Number of table rows (defaults to ``bins ** 5``)
+            
+        Returns:
+            int: Row index in ``[0, n_states)``
+        """
+        index = 0
+        for digit in self.bin_indices(bins):
+            index = index * bins + digit
+        return index % n_states if n_states else index
 
 
-@dataclass
-class QValue:
-    """Q-value with confidence tracking."""
+class ReplayMemory:
+    """Fixed-capacity ring buffer of transitions stored as parallel arrays."""
     
-    value: float
-    visit_count: int
-    last_updated: datetime
-    confidence: float = 0.5
+    def __init__(self, capacity: int = 10000) -> None:
+        """
+        Preallocate replay storage.
+        
+        Args:
+            capacity: Maximum transitions kept; the oldest is overwritten first
+        """
+        self.capacity = capacity
+        self.states = np.zeros(capacity, dtype=np.int64)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float64)
+        self.next_states = np.zeros(capacity, dtype=np.int64)
+        self.dones = np.zeros(capacity, dtype=bool)
+        self._position = 0
+        self._size = 0
     
-    def update(self, new_value: float, learning_rate: float = 0.1) -> None:
-        """Update Q-value using learning rate."""
-        self.value = (1 - learning_rate) * self.value + learning_rate * new_value
-        self.visit_count += 1
-        self.last_updated = datetime.utcnow()
-        
-        # Update confidence based on visit count
-        self.confidence = min(0.95, self.visit_count / 100)
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, state: int, action: int, reward: float, next_state: int, done: bool) -> None:
+        """Store one transition in the next slot."""
+        slot = self._position
+        self.states[slot] = state
+        self.actions[slot] = action
+        self.rewards[slot] = reward
+        self.next_states[slot] = next_state
+        self.dones[slot] = done
+        self._position = (slot + 1) % self.capacity
+        self._size = min(self._size + 1, self.capacity)
+    
+    def sample(
+        self, batch_size: int, rng: np.random.Generator
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Draw a uniform batch of stored transitions (with replacement).
+        
+        Returns:
+            Tuple of (states, actions, rewards, next_states, dones) arrays
+        """
+        slots = rng.integers(0, self._size, size=batch_size)
+        return (
+            self.states[slots],
+            self.actions[slots],
+            self.rewards[slots],
+            self.next_states[slots],
+            self.dones[slots],
+        )
 
 
 class QLearningAgent:
@@ -189,7 +225,11 @@ class QLearningAgent:
         learning_rate: float = 0.1,
         discount_factor: float = 0.95,
         exploration_rate: float = 0.1,
-        exploration_decay: float = 0.995
+        exploration_decay: float = 0.995,
+        state_bins: int = 10,
+        n_states: Optional[int] = None,
+        replay_capacity: int = 10000,
+        table_path: Optional[Union[str, Path]] = None
     ) -> None:
         """
         Initialize Q-Learning agent.
@@ -200,21 +240,31 @@ class QLearningAgent:
             discount_factor: Future reward discount factor
             exploration_rate: Initial exploration rate (epsilon)
             exploration_decay: Exploration rate decay factor
+            state_bins: Bins per discretized state feature
+            n_states: Q-table rows (defaults to one per discrete state)
+            replay_capacity: Experience replay ring buffer size
+            table_path: ``.npy`` file to memory-map the Q-table from, so
+                learning survives restarts; in-memory only when omitted
         """
         self.actions = actions or [ActionType.BUY, ActionType.SELL, ActionType.HOLD]
+        self.action_index = {action: index for index, action in enumerate(self.actions)}
         self.learning_rate = learning_rate
         self.discount_factor = discount_factor
         self.exploration_rate = exploration_rate
         self.initial_exploration_rate = exploration_rate
         self.exploration_decay = exploration_decay
+        self.state_bins = state_bins
+        self.n_states = n_states or state_bins ** 5
+        self.table_path = Path(table_path) if table_path is not None else None
         
-        # Q-table: state -> action -> QValue
-        self.q_table: Dict[str, Dict[ActionType, QValue]] = defaultdict(
-            lambda: {action: QValue(0.0, 0, datetime.utcnow()) for action in self.actions}
-        )
+        # Q-table: plane 0 holds Q-values, plane 1 visit counts, [state, action]
+        self._table = self._open_table()
+        self.q_values: np.ndarray = self._table[0]
+        self.visit_counts: np.ndarray = self._table[1]
         
         # Experience replay buffer
-        self.experience_buffer: deque = deque(maxlen=10000)
+        self.experience_buffer = ReplayMemory(replay_capacity)
+        self._rng = np.random.default_rng()
         
         # Performance tracking
         self.episode_rewards: List[float] = []
@@ -222,6 +272,36 @@ class QLearningAgent:
         
         logger.info(f"Q-Learning agent initialized with {len(self.actions)} actions")
     
+    def _open_table(self) -> np.ndarray:
+        """Allocate the Q-table, memory-mapping it from ``table_path`` when set."""
+        shape = (2, self.n_states, len(self.actions))
+        if self.table_path is None:
+            return np.zeros(shape, dtype=np.float64)
+        
+        if self.table_path.exists():
+            try:
+                table = np.lib.format.open_memmap(self.table_path, mode="r+")
+                if table.shape == shape and table.dtype == np.float64:
+                    logger.info(f"Loaded Q-table from {self.table_path}")
+                    return table
+                logger.warning(
+                    f"Q-table {self.table_path} has shape {table.shape}, expected {shape}; starting fresh"
+                )
+                del table
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not load Q-table {self.table_path}: {e}; starting fresh")
+        
+        self.table_path.parent.mkdir(parents=True, exist_ok=True)
+        return np.lib.format.open_memmap(self.table_path, mode="w+", dtype=np.float64, shape=shape)
+    
+    def state_index(self, state: MarketState) -> int:
+        """Q-table row for a market state."""
+        return state.state_index(self.state_bins, self.n_states)
+    
+    def action_values(self, state: MarketState) -> np.ndarray:
+        """Q-values of every action in a state, ordered like ``self.actions``."""
+        return self.q_values[self.state_index(state)]
+    
     def get_action(self, state: MarketState, training: bool = True) -> ActionType:
         """
         Select action using epsilon-greedy policy.
@@ -233,8 +313,6 @@ class QLearningAgent:
         Returns:
             ActionType: Selected action
         """
-        state_key = state.discretize()
-        
         # Epsilon-greedy action selection
         if training and random.random() < self.exploration_rate:
             # Explore: random action
@@ -242,10 +320,10 @@ class QLearningAgent:
             logger.debug(f"Exploration action: {action.value}")
         else:
             # Exploit: best known action
-            q_values = self.q_table[state_key]
-            best_action = max(q_values.keys(), key=lambda a: q_values[a].value)
-            action = best_action
-            logger.debug(f"Exploitation action: {action.value} (Q={q_values[action].value:.3f})")
+            q_values = self.action_values(state)
+            best = int(np.argmax(q_values))
+            action = self.actions[best]
+            logger.debug(f"Exploitation action: {action.value} (Q={q_values[best]:.3f})")
         
         return action
     
@@ -267,28 +345,27 @@ class QLearningAgent:
             next_state: New state after action
             done: Whether episode is done
         """
-        state_key = state.discretize()
-        next_state_key = next_state.discretize()
+        state_index = self.state_index(state)
+        next_state_index = self.state_index(next_state)
+        action_index = self.action_index[action]
         
         # Current Q-value
-        current_q = self.q_table[state_key][action].value
+        current_q = self.q_values[state_index, action_index]
         
         # Max Q-value for next state
-        if done:
-            next_max_q = 0.0
-        else:
-            next_q_values = self.q_table[next_state_key]
-            next_max_q = max(q_val.value for q_val in next_q_values.values())
+        next_max_q = 0.0 if done else self.q_values[next_state_index].max()
         
         # Q-learning update rule
         target_q = reward + self.discount_factor * next_max_q
         
         # Update Q-value
-        self.q_table[state_key][action].update(target_q, self.learning_rate)
+        self.q_values[state_index, action_index] = (
+            (1 - self.learning_rate) * current_q + self.learning_rate * target_q
+        )
+        self.visit_counts[state_index, action_index] += 1
         
         # Store experience for replay
-        experience = Experience(state, action, reward, next_state, done)
-        self.experience_buffer.append(experience)
+        self.experience_buffer.append(state_index, action_index, reward, next_state_index, done)
         
         # Update exploration rate
         if self.exploration_rate > 0.01:
@@ -296,46 +373,45 @@ class QLearningAgent:
         
         self.total_steps += 1
         
-        logger.debug(f"Updated Q({state_key}, {action.value}): {current_q:.3f} -> {target_q:.3f}")
+        logger.debug(f"Updated Q({state_index}, {action.value}): {current_q:.3f} -> {target_q:.3f}")
     
     def experience_replay(self, batch_size: int = 32) -> None:
-        """Perform experience replay to improve learning."""
+        """
+        Perform experience replay to improve learning.
+        
+        Replays a sampled batch against the current table in one vectorized
+        step. Replayed transitions are not re-stored and do not decay the
+        exploration rate. Targets are taken from the table before the batch
+        is applied, and repeated state-action pairs accumulate their updates.
+        """
         if len(self.experience_buffer) < batch_size:
             return
         
-        # Sample random batch from experience buffer
-        batch = random.sample(list(self.experience_buffer), batch_size)
-        
-        for experience in batch:
-            # Re-update Q-values with current knowledge
-            self.update_q_value(
-                experience.state,
-                experience.action,
-                experience.reward,
-                experience.next_state,
-                experience.done
-            )
+        states, actions, rewards, next_states, dones = self.experience_buffer.sample(batch_size, self._rng)
+        
+        next_max_q = np.where(dones, 0.0, self.q_values[next_states].max(axis=1))
+        target_q = rewards + self.discount_factor * next_max_q
+        td_error = target_q - self.q_values[states, actions]
+        
+        np.add.at(self.q_values, (states, actions), self.learning_rate * td_error)
+        np.add.at(self.visit_counts, (states, actions), 1)
+    
+    def flush(self) -> None:
+        """Write a memory-mapped Q-table through to disk."""
+        if isinstance(self._table, np.memmap):
+            self._table.flush()
     
     def get_q_table_summary(self) -> Dict[str, Any]:
         """Get summary of Q-table for analysis."""
-        if not self.q_table:
+        visited = self.visit_counts.any(axis=1)
+        states = int(np.count_nonzero(visited))
+        if not states:
             return {"states": 0, "total_updates": 0, "exploration_rate": self.exploration_rate}
         
-        total_visits = sum(
-            sum(q_val.visit_count for q_val in state_actions.values())
-            for state_actions in self.q_table.values()
-        )
-        
-        avg_q_value = np.mean([
-            q_val.value
-            for state_actions in self.q_table.values()
-            for q_val in state_actions.values()
-        ])
-        
         return {
-            "states": len(self.q_table),
-            "total_updates": total_visits,
-            "average_q_value": avg_q_value,
+            "states": states,
+            "total_updates": int(self.visit_counts.sum()),
+            "average_q_value": float(self.q_values[visited].mean()),
             "exploration_rate": self.exploration_rate,
             "experience_buffer_size": len(self.experience_buffer)
         }
@@ -767,10 +843,15 @@ class ActorCriticAgent:
 class ReinforcementLearningSystem:
     """Main reinforcement learning system integrating all RL components."""
     
-    def __init__(self) -> None:
-        """Initialize reinforcement learning system."""
+    def __init__(self, q_table_path: Optional[Union[str, Path]] = None) -> None:
+        """
+        Initialize reinforcement learning system.
+        
+        Args:
+            q_table_path: File to persist the Q-learning table in (in-memory when omitted)
+        """
         # Initialize agents
-        self.q_learning_agent = QLearningAgent()
+        self.q_learning_agent = QLearningAgent(table_path=q_table_path)
         self.bandit_agent = MultiArmedBandit([
             "conservative", "balanced", "aggressive", "scalping", "momentum", "mean_reversion"
         ])
@@ -887,6 +968,7 @@ class ReinforcementLearningSystem:
             
             if episode_done:
                 self.episode_count += 1
+                self.q_learning_agent.flush()
                 logger.info(f"Episode {self.episode_count} completed, avg reward: {np.mean(self.total_rewards[-100:]):.3f}")
             
         except Exception as e:
@@ -909,15 +991,9 @@ class ReinforcementLearningSystem:
     def _calculate_decision_confidence(self, state: MarketState) -> float:
         """Calculate confidence in trading decision."""
         # Base confidence from Q-learning
-        state_key = state.discretize()
-        q_values = self.q_learning_agent.q_table[state_key]
-        
-        if q_values:
-            max_q = max(q_val.value for q_val in q_values.values())
-            min_q = min(q_val.value for q_val in q_values.values())
-            q_confidence = (max_q - min_q) if max_q != min_q else 0.5
-        else:
-            q_confidence = 0.5
+        q_values = self.q_learning_agent.action_values(state)
+        max_q, min_q = float(q_values.max()), float(q_values.min())
+        q_confidence = (max_q - min_q) if max_q != min_q else 0.5
         
         # Strategy selection confidence from bandit
         best_strategy = self.bandit_agent._get_best_strategy()
@@ -957,13 +1033,10 @@ class ReinforcementLearningSystem:
     
     def _predict_reward(self, state: MarketState, action: ActionType) -> float:
         """Predict expected reward for state-action pair."""
-        state_key = state.discretize()
-        q_values = self.q_learning_agent.q_table[state_key]
-        
-        if action in q_values:
-            return q_values[action].value
-        else:
+        action_index = self.q_learning_agent.action_index.get(action)
+        if action_index is None:
             return 0.0
+        return float(self.q_learning_agent.action_values(state)[action_index])
     
     def _get_fallback_decision(self) -> Dict[str, Any]:
         """Get fallback decision when RL fails."""
@@ -1011,7 +1084,7 @@ async def get_rl_system() -> ReinforcementLearningSystem:
     """Get or create global reinforcement learning system."""
     global _rl_system
     if _rl_system is None:
-        _rl_system = ReinforcementLearningSystem()
+        _rl_system = ReinforcementLearningSystem(q_table_path=settings.data_dir / "rl" / "q_table.npy")
     return _rl_system
 
 
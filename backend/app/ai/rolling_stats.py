@@ -0,0 +1,223 @@
+"""Incremental rolling statistics for fixed-size numeric windows.
+
+``RollingWindow`` keeps the last ``capacity`` values in a NumPy float64 ring
+and updates its summaries as values enter and leave, so every read is
+constant time (or logarithmic for order statistics) instead of a pass over
+the window:
+
+- mean / sample variance via sliding Welford updates
+- least-squares slope over (0..n-1, values) via running sums
+- quartiles, median and MAD from a sorted copy of the window maintained
+  with bisection; MAD is a k-th-smallest selection over two sorted runs of
+  deviations, so it needs no sort either
+
+Floating point drift in the running sums is bounded by an exact recompute
+from the ring once per ``capacity`` updates.
+"""
+
+from __future__ import annotations
+
+import math
+from bisect import bisect_left, insort
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+class RollingWindow:
+    """Fixed-capacity float64 ring buffer with incremental statistics."""
+
+    __slots__ = (
+        "capacity", "_ring", "_start", "_count",
+        "_mean", "_m2", "_sum_y", "_sum_xy",
+        "_sorted", "_since_refresh",
+    )
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize window.
+
+        Args:
+            capacity: Number of most recent values kept
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self._ring = np.zeros(capacity, dtype=np.float64)
+        self._start = 0
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0  # sum(i * y_i), i = 0 for the oldest value
+        self._sorted: List[float] = []
+        self._since_refresh = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, value: float) -> Optional[float]:
+        """Add a value, returning the one it evicted (if the window was full)."""
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"non-finite value {value!r}")
+
+        if self._count < self.capacity:
+            self._ring[(self._start + self._count) % self.capacity] = value
+            self._count += 1
+            n = self._count
+            delta = value - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean)
+            self._sum_xy += (n - 1) * value
+            self._sum_y += value
+            evicted = None
+        else:
+            evicted = float(self._ring[self._start])
+            self._ring[self._start] = value
+            self._start = (self._start + 1) % self.capacity
+            n = self._count
+            old_mean = self._mean
+            delta = value - evicted
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean + evicted - old_mean)
+            # Every remaining index shifts down by one, the new value lands at n - 1
+            self._sum_xy += -(self._sum_y - evicted) + (n - 1) * value
+            self._sum_y += delta
+            del self._sorted[bisect_left(self._sorted, evicted)]
+
+        insort(self._sorted, value)
+
+        self._since_refresh += 1
+        if self._since_refresh >= self.capacity:
+            self._refresh()
+        return evicted
+
+    def values(self) -> np.ndarray:
+        """Window contents, oldest first."""
+        end = self._start + self._count
+        if end <= self.capacity:
+            return self._ring[self._start:end].copy()
+        return np.concatenate((self._ring[self._start:], self._ring[:end - self.capacity]))
+
+    def tail(self, count: int) -> np.ndarray:
+        """The most recent ``count`` values, oldest first."""
+        return self.values()[-count:] if count < self._count else self.values()
+
+    @property
+    def last(self) -> Optional[float]:
+        """Most recent value."""
+        if not self._count:
+            return None
+        return float(self._ring[(self._start + self._count - 1) % self.capacity])
+
+    @property
+    def mean(self) -> float:
+        return self._mean if self._count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (n - 1 denominator)."""
+        if self._count < 2 or self._sorted[0] == self._sorted[-1]:
+            return 0.0  # Constant windows are exact zero, not accumulated drift
+        return max(self._m2, 0.0) / (self._count - 1)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def z_score(self, value: float) -> float:
+        """Z-score of ``value`` against the window."""
+        std = self.std
+        return (value - self.mean) / std if std > 0 else 0.0
+
+    def slope(self) -> float:
+        """Least-squares slope of the values against their position."""
+        n = self._count
+        if n < 2:
+            return 0.0
+        sum_x = n * (n - 1) / 2
+        sum_xx = (n - 1) * n * (2 * n - 1) / 6
+        denominator = n * sum_xx - sum_x * sum_x
+        return (n * self._sum_xy - sum_x * self._sum_y) / denominator
+
+    def median(self) -> float:
+        """Median of the window."""
+        data = self._sorted
+        n = len(data)
+        if not n:
+            return 0.0
+        mid = n // 2
+        return data[mid] if n % 2 else (data[mid - 1] + data[mid]) / 2
+
+    def quartiles(self) -> Tuple[float, float, float]:
+        """Q1, Q2, Q3 matching ``statistics.quantiles(values, n=4)``."""
+        data = self._sorted
+        n = len(data)
+        if n < 2:
+            raise ValueError("quartiles need at least two values")
+        result = []
+        for i in range(1, 4):
+            # "exclusive" method, as in the statistics module
+            j = min(max(i * (n + 1) // 4, 1), n - 1)
+            delta = i * (n + 1) - j * 4
+            result.append((data[j - 1] * (4 - delta) + data[j] * delta) / 4)
+        return result[0], result[1], result[2]
+
+    def mad(self, median: Optional[float] = None) -> float:
+        """Median absolute deviation from the median."""
+        data = self._sorted
+        n = len(data)
+        if not n:
+            return 0.0
+        center = self.median() if median is None else median
+
+        # Deviations below the center, nearest first, and above it, nearest first
+        split = bisect_left(data, center)
+        below = lambda k: center - data[split - 1 - k]
+        above = lambda k: data[split + k] - center
+
+        mid = n // 2
+        if n % 2:
+            return _kth_of_two(below, split, above, n - split, mid)
+        return (
+            _kth_of_two(below, split, above, n - split, mid - 1)
+            + _kth_of_two(below, split, above, n - split, mid)
+        ) / 2
+
+    def _refresh(self) -> None:
+        """Recompute running sums exactly from the ring."""
+        values = self.values()
+        n = len(values)
+        self._mean = float(values.mean()) if n else 0.0
+        self._m2 = float(((values - self._mean) ** 2).sum()) if n else 0.0
+        self._sum_y = float(values.sum())
+        self._sum_xy = float(np.dot(np.arange(n, dtype=np.float64), values))
+        self._since_refresh = 0
+
+
+def _kth_of_two(
+    first: Callable[[int], float],
+    first_len: int,
+    second: Callable[[int], float],
+    second_len: int,
+    k: int,
+) -> float:
+    """k-th smallest (0-based) of two ascending sequences given by index functions."""
+    while True:
+        if not first_len:
+            return second(k)
+        if not second_len:
+            return first(k)
+        if k == 0:
+            return min(first(0), second(0))
+
+        step_first = min(first_len, (k + 1) // 2)
+        step_second = min(second_len, (k + 1) // 2)
+        if first(step_first - 1) <= second(step_second - 1):
+            # The first step_first items of ``first`` are all below the answer
+            offset = step_first
+            first, first_len = (lambda i, f=first, o=offset: f(i + o)), first_len - offset
+        else:
+            offset = step_second
+            second, second_len = (lambda i, s=second, o=offset: s(i + o)), second_len - offset
+        k -= offset
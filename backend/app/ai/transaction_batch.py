@@ -0,0 +1,310 @@
+"""Columnar transaction batches for coordination analysis.
+
+``TransactionBatch`` turns the list-of-dicts transaction feeds the market
+intelligence detectors receive into parallel NumPy columns, parsing every
+timestamp once and interning addresses to integer codes. Detectors then
+group rows by sorting (``group_by``) and reduce each group with
+``np.bincount`` instead of building Python dicts of lists, so a token with
+tens of thousands of recent transfers is scored in a few array passes.
+
+File: backend/app/ai/transaction_batch.py
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+NO_ADDRESS = -1
+
+BUY_TYPES = ("buy", "swap_in")
+
+_UTC_SUFFIXES = ("Z", "+00:00")
+_OFFSET_SUFFIX = re.compile(r"[+-]\d{2}:\d{2}$")
+_EPOCH = datetime(1970, 1, 1)
+
+
+def to_datetime(seconds: float) -> datetime:
+    """Naive UTC datetime for epoch seconds (the ``datetime.utcnow`` convention)."""
+    return datetime.fromtimestamp(float(seconds), timezone.utc).replace(tzinfo=None)
+
+
+def _datetime_seconds(value: datetime) -> float:
+    """Epoch seconds, reading naive datetimes as UTC."""
+    if value.tzinfo is None:
+        return (value - _EPOCH).total_seconds()
+    return value.timestamp()
+
+
+def _parse_iso_strings(values: List[str]) -> np.ndarray:
+    """Parse ISO-8601 strings to epoch seconds, vectorized when all are UTC."""
+    stripped = []
+    for value in values:
+        for suffix in _UTC_SUFFIXES:
+            if value.endswith(suffix):
+                value = value[:-len(suffix)]
+                break
+        stripped.append(value)
+    if not any(_OFFSET_SUFFIX.search(value) for value in stripped):
+        try:
+            micros = np.array(stripped, dtype="datetime64[us]").astype(np.int64)
+            return micros / 1e6
+        except ValueError:
+            pass
+    return np.array([
+        _datetime_seconds(datetime.fromisoformat(value.replace("Z", "+00:00"))) for value in values
+    ])
+
+
+def epoch_seconds(values: Sequence[Any], now: Optional[float] = None) -> np.ndarray:
+    """
+    Convert mixed timestamp values to a float64 array of epoch seconds.
+
+    Args:
+        values: datetimes (naive read as UTC), ISO strings, epoch numbers or None
+        now: Epoch seconds used for missing timestamps (defaults to the current time)
+
+    Returns:
+        np.ndarray: Epoch seconds per value
+    """
+    if now is None:
+        now = datetime.now(timezone.utc).timestamp()
+    seconds = np.empty(len(values), dtype=np.float64)
+    string_rows: List[int] = []
+    strings: List[str] = []
+    for row, value in enumerate(values):
+        if isinstance(value, datetime):
+            seconds[row] = _datetime_seconds(value)
+        elif isinstance(value, str):
+            string_rows.append(row)
+            strings.append(value)
+        elif value is None:
+            seconds[row] = now
+        else:
+            seconds[row] = float(value)
+    if strings:
+        seconds[string_rows] = _parse_iso_strings(strings)
+    return seconds
+
+
+@dataclass
+class TransactionBatch:
+    """Transactions of one token as parallel columns.
+
+    Addresses are interned in order of first appearance (sender before
+    recipient); ``NO_ADDRESS`` marks a missing one.
+    """
+
+    timestamps: np.ndarray   # float64 epoch seconds
+    amounts: np.ndarray      # float64 USD value
+    gas_prices: np.ndarray   # float64
+    from_codes: np.ndarray   # int64 address codes
+    to_codes: np.ndarray     # int64 address codes
+    directions: np.ndarray   # int8: +1 buy-like, -1 sell-like, 0 other
+    buys: np.ndarray         # bool: type is exactly one of BUY_TYPES
+    hashes: np.ndarray       # object array of transaction hashes
+    addresses: List[str]     # code -> address
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @classmethod
+    def from_transactions(
+        cls,
+        transactions: Sequence[Dict[str, Any]],
+        now: Optional[float] = None
+    ) -> "TransactionBatch":
+        """
+        Build a batch from transaction dicts.
+
+        Args:
+            transactions: Dicts with hash, from_address, to_address, type,
+                usd_value, gas_price and timestamp keys (all optional)
+            now: Epoch seconds used for transactions without a timestamp
+
+        Returns:
+            TransactionBatch: Columnar view of the transactions
+        """
+        codes: Dict[str, int] = {}
+        addresses: List[str] = []
+
+        def intern(address: Optional[str]) -> int:
+            if not address:
+                return NO_ADDRESS
+            code = codes.get(address)
+            if code is None:
+                code = codes[address] = len(addresses)
+                addresses.append(address)
+            return code
+
+        from_codes: List[int] = []
+        to_codes: List[int] = []
+        directions: List[int] = []
+        buys: List[bool] = []
+        amounts: List[float] = []
+        gas_prices: List[float] = []
+        timestamps: List[Any] = []
+        hashes: List[str] = []
+        for tx in transactions:
+            get = tx.get
+            from_codes.append(intern(get("from_address")))
+            to_codes.append(intern(get("to_address")))
+            tx_type = (get("type") or "").lower()
+            if "buy" in tx_type or "swap_in" in tx_type:
+                directions.append(1)
+            elif "sell" in tx_type or "swap_out" in tx_type:
+                directions.append(-1)
+            else:
+                directions.append(0)
+            buys.append(tx_type in BUY_TYPES)
+            amounts.append(float(get("usd_value") or 0))
+            gas_prices.append(float(get("gas_price") or 0))
+            timestamps.append(get("timestamp"))
+            hashes.append(get("hash", ""))
+
+        hash_column = np.empty(len(hashes), dtype=object)
+        hash_column[:] = hashes
+
+        return cls(
+            timestamps=epoch_seconds(timestamps, now),
+            amounts=np.array(amounts, dtype=np.float64),
+            gas_prices=np.array(gas_prices, dtype=np.float64),
+            from_codes=np.array(from_codes, dtype=np.int64),
+            to_codes=np.array(to_codes, dtype=np.int64),
+            directions=np.array(directions, dtype=np.int8),
+            buys=np.array(buys, dtype=bool),
+            hashes=hash_column,
+            addresses=addresses,
+        )
+
+    def address_list(self, codes: np.ndarray) -> List[str]:
+        """Addresses for codes, with ``""`` for ``NO_ADDRESS``."""
+        return [self.addresses[code] if code != NO_ADDRESS else "" for code in codes.tolist()]
+
+
+@dataclass
+class Groups:
+    """Rows partitioned into contiguous groups after sorting.
+
+    ``order`` sorts the input rows; in that order, group ``g`` occupies
+    ``starts[g]:starts[g] + counts[g]`` and ``ids`` holds each row's group.
+    """
+
+    order: np.ndarray
+    ids: np.ndarray
+    starts: np.ndarray
+    counts: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def rows(self, group: int) -> np.ndarray:
+        """Input row indices of one group, in sorted order."""
+        start = self.starts[group]
+        return self.order[start:start + self.counts[group]]
+
+
+def group_by(keys: Sequence[np.ndarray], within: Optional[np.ndarray] = None) -> Groups:
+    """
+    Group rows by equal key tuples with one stable sort.
+
+    Args:
+        keys: Equal-length key columns, most significant first
+        within: Optional column to order rows by inside each group
+
+    Returns:
+        Groups: Sort order and group boundaries
+    """
+    sort_keys = list(reversed(keys))
+    if within is not None:
+        sort_keys.insert(0, within)
+    order = np.lexsort(sort_keys)
+    if len(order) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return Groups(order, empty, empty, empty)
+
+    changed = np.zeros(len(order), dtype=bool)
+    changed[0] = True
+    for key in keys:
+        ordered = key[order]
+        changed[1:] |= ordered[1:] != ordered[:-1]
+    starts = np.flatnonzero(changed)
+    ids = np.cumsum(changed) - 1
+    counts = np.diff(np.append(starts, len(order)))
+    return Groups(order, ids, starts, counts)
+
+
+def group_sums(values: np.ndarray, groups: Groups) -> np.ndarray:
+    """Per-group sum of a column given in sorted order."""
+    return np.bincount(groups.ids, weights=values, minlength=len(groups))
+
+
+def group_distinct(values: np.ndarray, groups: Groups) -> np.ndarray:
+    """Per-group number of distinct values of an integer column given in sorted order."""
+    offset = values - values.min(initial=0)
+    width = int(offset.max(initial=0)) + 1
+    pairs = np.unique(groups.ids * width + offset)
+    return np.bincount(pairs // width, minlength=len(groups))
+
+
+def cv_similarity(values: np.ndarray, ids: np.ndarray, n_groups: int) -> np.ndarray:
+    """
+    Per-group ``max(0, 1 - stdev / mean)`` of a column.
+
+    Groups with fewer than two values or a zero mean score 0.
+
+    Args:
+        values: Values in group order
+        ids: Group of each value
+        n_groups: Number of groups
+
+    Returns:
+        np.ndarray: Similarity in [0, 1] per group
+    """
+    counts = np.bincount(ids, minlength=n_groups)
+    sums = np.bincount(ids, weights=values, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        deviations = values - means[ids]
+        variances = np.bincount(ids, weights=deviations * deviations, minlength=n_groups) / (counts - 1)
+        similarity = np.maximum(0.0, 1.0 - np.sqrt(variances) / means)
+    valid = (counts >= 2) & (means != 0)
+    return np.where(valid, similarity, 0.0)
+
+
+def interval_regularity(timestamps: np.ndarray, groups: Groups) -> np.ndarray:
+    """
+    Per-group regularity of the gaps between consecutive timestamps.
+
+    Args:
+        timestamps: Timestamps in sorted group order, ascending within each group
+        groups: Grouping of the rows
+
+    Returns:
+        np.ndarray: ``cv_similarity`` of each group's inter-arrival intervals
+    """
+    same_group = groups.ids[1:] == groups.ids[:-1]
+    intervals = np.diff(timestamps)[same_group]
+    return cv_similarity(intervals, groups.ids[1:][same_group], len(groups))
+
+
+def group_alternation(directions: np.ndarray, groups: Groups) -> np.ndarray:
+    """
+    Per-group share of consecutive steps that flip between buy and sell.
+
+    Args:
+        directions: +1/-1/0 directions in sorted group order
+        groups: Grouping of the rows
+
+    Returns:
+        np.ndarray: Flips divided by ``count - 1`` (0 for single-row groups)
+    """
+    previous, current = directions[:-1], directions[1:]
+    flips = (groups.ids[1:] == groups.ids[:-1]) & (previous != 0) & (current != 0) & (previous != current)
+    flip_counts = np.bincount(groups.ids[1:], weights=flips, minlength=len(groups))
+    steps = groups.counts - 1
+    return np.divide(flip_counts, steps, out=np.zeros(len(groups)), where=steps > 0)
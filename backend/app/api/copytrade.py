@@ -145,7 +145,7 @@ class CopySignalResponse(BaseModel):
     token_symbol: str
     trade_type: str
     amount: Decimal
-    price: Decimal
+    price: Optional[Decimal] = None
     timestamp: datetime
     chain: str
     dex: str
@@ -323,6 +323,7 @@ async def rpc_health_detail(request: Request) -> Dict[str, Any]:
                 "failed": failed_providers,
             },
             "providers": rpc_health,
+            "cache": rpc_pool.get_cache_stats() if hasattr(rpc_pool, "get_cache_stats") else None,
             "timestamp": datetime.utcnow().isoformat(),
         }
     except Exception as exc:
@@ -8,6 +8,7 @@ from __future__ import annotations
 from typing import Dict, List, Optional, Set, Tuple
 import asyncio
 import logging
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
@@ -19,8 +20,10 @@ from pydantic import BaseModel, Field
 from ..api.analytics import PerformanceAnalytics
 from ..api.presets import get_builtin_preset
 
+from ..monitoring.latency import LatencyHistogram
 from ..strategy.risk_manager import RiskManager
 from ..strategy.safety_controls import SafetyControls
+from .scheduler import OpportunityScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +118,10 @@ class AutotradeEngine:
     Core automated trading engine.
     
     Manages opportunity discovery, filtering, prioritization, and execution.
+    
+    Accepted opportunities go to an ``OpportunityScheduler``; the processing
+    loop sleeps until an insert, a finished trade or the next expiry tick,
+    so a CRITICAL opportunity is dispatched as soon as it is accepted.
     """
 
     from typing import Dict, List, Optional, Set, Tuple, Any
@@ -143,7 +150,7 @@ class AutotradeEngine:
         # Engine state
         self.mode = AutotradeMode.DISABLED
         self.is_running = False
-        self.opportunity_queue: List[TradeOpportunity] = []
+        self.scheduler = OpportunityScheduler()
         self.active_trades: Dict[str, TradeOpportunity] = {}
         self.conflict_cache: Set[str] = set()  # Tokens with active trades
         
@@ -151,10 +158,16 @@ class AutotradeEngine:
         self.max_concurrent_trades = 5
         self.max_queue_size = 50
         self.opportunity_timeout = timedelta(minutes=10)
-        self.execution_batch_size = 3
+        self.execution_batch_size = 3  # Dispatched per wake-up before yielding
+        self.shutdown_timeout = 30.0  # Seconds to let running trades finish on stop
+        
+        # Background tasks
+        self._processor_task: Optional[asyncio.Task] = None
+        self._execution_tasks: Set[asyncio.Task] = set()
         
         # Metrics
         self.metrics = AutotradeMetrics()
+        self.scheduling_latency = LatencyHistogram()  # Enqueue to execution start
         self.start_time = datetime.utcnow()
         
         # Event handlers
@@ -179,9 +192,10 @@ class AutotradeEngine:
         
         # Reset metrics
         self.metrics = AutotradeMetrics()
+        self.scheduling_latency = LatencyHistogram()
         
         # Start background processing
-        asyncio.create_task(self._process_opportunities())
+        self._processor_task = asyncio.create_task(self._process_opportunities())
         
         logger.info(f"Autotrade engine started in {mode.value} mode")
     
@@ -194,7 +208,20 @@ class AutotradeEngine:
         self.mode = AutotradeMode.DISABLED
         
         # Clear pending opportunities
-        self.opportunity_queue.clear()
+        self.scheduler.clear()
+        
+        # Stop the dispatcher, then let running trades finish
+        if self._processor_task is not None:
+            self._processor_task.cancel()
+            await asyncio.gather(self._processor_task, return_exceptions=True)
+            self._processor_task = None
+        
+        if self._execution_tasks:
+            _, still_running = await asyncio.wait(self._execution_tasks, timeout=self.shutdown_timeout)
+            for task in still_running:
+                logger.warning(f"Cancelling trade still running after {self.shutdown_timeout}s shutdown grace")
+                task.cancel()
+            await asyncio.gather(*still_running, return_exceptions=True)
         
         logger.info("Autotrade engine stopped")
     
@@ -227,7 +254,7 @@ class AutotradeEngine:
                 return False
             
             # Check queue capacity
-            if len(self.opportunity_queue) >= self.max_queue_size:
+            if len(self.scheduler) >= self.max_queue_size:
                 logger.warning(f"Opportunity rejected - queue full: {opportunity.id}")
                 self.metrics.opportunities_rejected += 1
                 return False
@@ -245,9 +272,8 @@ class AutotradeEngine:
                 self.metrics.opportunities_rejected += 1
                 return False
             
-            # Add to queue with priority sorting
-            self.opportunity_queue.append(opportunity)
-            self._sort_opportunity_queue()
+            # Add to the scheduler, waking the dispatcher
+            self.scheduler.push(opportunity)
             
             # Update metrics
             self.metrics.opportunities_found += 1
@@ -260,19 +286,6 @@ class AutotradeEngine:
             logger.error(f"Failed to add opportunity {opportunity.id}: {e}")
             return False
     
-    def _sort_opportunity_queue(self) -> None:
-        """Sort opportunity queue by priority and discovery time."""
-        priority_order = {
-            OpportunityPriority.CRITICAL: 0,
-            OpportunityPriority.HIGH: 1,
-            OpportunityPriority.MEDIUM: 2,
-            OpportunityPriority.LOW: 3
-        }
-        
-        self.opportunity_queue.sort(
-            key=lambda opp: (priority_order[opp.priority], opp.discovered_at)
-        )
-    
     async def _assess_opportunity_risk(self, opportunity: TradeOpportunity) -> Dict[str, any]:
         """
         Assess risk for a trading opportunity.
@@ -326,14 +339,24 @@ class AutotradeEngine:
             }
     
     async def _process_opportunities(self) -> None:
-        """Background task to process opportunities from the queue."""
+        """Background task dispatching opportunities whenever the scheduler signals."""
         logger.info("Opportunity processing task started")
         
         while self.is_running:
             try:
+                self.scheduler.wakeup.clear()
                 await self._process_queue_batch()
-                await asyncio.sleep(1.0)  # Process every second
                 
+                # Sleep until an insert, a finished trade or the next expiry tick
+                try:
+                    await asyncio.wait_for(
+                        self.scheduler.wakeup.wait(), timeout=self.scheduler.expiry.tick_seconds
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                
+            except asyncio.CancelledError:
+                break
             except Exception as e:
                 logger.error(f"Error in opportunity processing: {e}")
                 await asyncio.sleep(5.0)  # Wait longer on error
@@ -341,56 +364,71 @@ class AutotradeEngine:
         logger.info("Opportunity processing task stopped")
     
     async def _process_queue_batch(self) -> None:
-        """Process a batch of opportunities from the queue."""
-        if not self.opportunity_queue:
-            return
-        
+        """Drop expired opportunities and dispatch the highest priority ones."""
         # Remove expired opportunities
-        current_time = datetime.utcnow()
-        expired_count = 0
-        
-        self.opportunity_queue = [
-            opp for opp in self.opportunity_queue 
-            if opp.expires_at > current_time or (expired_count := expired_count + 1, False)[1]
-        ]
-        
-        if expired_count > 0:
-            self.metrics.opportunities_expired += expired_count
-            logger.info(f"Removed {expired_count} expired opportunities")
+        expired_count = len(self.scheduler.expire())
         
         # Check if we can execute more trades
-        active_trade_count = len(self.active_trades)
-        if active_trade_count >= self.max_concurrent_trades:
-            logger.debug(f"Max concurrent trades reached: {active_trade_count}")
-            return
+        free_slots = self.max_concurrent_trades - len(self.active_trades)
+        if free_slots <= 0:
+            logger.debug(f"Max concurrent trades reached: {len(self.active_trades)}")
         
-        # Process highest priority opportunities
-        batch_size = min(
-            self.execution_batch_size,
-            self.max_concurrent_trades - active_trade_count,
-            len(self.opportunity_queue)
-        )
+        batch_size = min(self.execution_batch_size, free_slots)
+        dispatched = 0
+        current_time = datetime.utcnow()
         
-        for _ in range(batch_size):
-            if not self.opportunity_queue:
+        while dispatched < batch_size:
+            entry = self.scheduler.pop()
+            if entry is None:
                 break
             
-            opportunity = self.opportunity_queue.pop(0)
+            opportunity, enqueued_at = entry
             
-            # Add to conflict cache
+            # The wheel ticks once a second; catch deadlines passed since
+            if opportunity.expires_at <= current_time:
+                expired_count += 1
+                continue
+            
+            # Reserve the slot and token before the task starts
+            self.active_trades[opportunity.id] = opportunity
             self.conflict_cache.add(opportunity.token_address)
             
-            # Execute in background
-            asyncio.create_task(self._execute_opportunity(opportunity))
+            self._track_task(asyncio.create_task(self._execute_opportunity(opportunity, enqueued_at)))
+            dispatched += 1
+        
+        if expired_count > 0:
+            self.metrics.opportunities_expired += expired_count
+            logger.info(f"Removed {expired_count} expired opportunities")
+        
+        # Yield, then keep dispatching if slots and work remain
+        if dispatched == batch_size and dispatched < free_slots and len(self.scheduler):
+            self.scheduler.wakeup.set()
+    
+    def _track_task(self, task: asyncio.Task) -> None:
+        """Keep a reference to an execution task and wake the dispatcher when it ends."""
+        self._execution_tasks.add(task)
+        
+        def _on_done(finished: asyncio.Task) -> None:
+            self._execution_tasks.discard(finished)
+            self.scheduler.wakeup.set()
+        
+        task.add_done_callback(_on_done)
     
-    async def _execute_opportunity(self, opportunity: TradeOpportunity) -> None:
+    async def _execute_opportunity(
+        self,
+        opportunity: TradeOpportunity,
+        enqueued_at: Optional[float] = None
+    ) -> None:
         """
         Execute a trading opportunity.
         
         Args:
             opportunity: Opportunity to execute
+            enqueued_at: Monotonic time the opportunity was queued
         """
         execution_start = datetime.utcnow()
+        if enqueued_at is not None:
+            self.scheduling_latency.record((time.monotonic() - enqueued_at) * 1000)
         
         try:
             # Add to active trades
@@ -475,9 +513,11 @@ class AutotradeEngine:
             "mode": self.mode,
             "is_running": self.is_running,
             "uptime_seconds": uptime_seconds,
-            "queue_size": len(self.opportunity_queue),
+            "queue_size": len(self.scheduler),
             "active_trades": len(self.active_trades),
+            "background_tasks": len(self._execution_tasks),
             "metrics": self.metrics,
+            "scheduling_latency": self.scheduling_latency.snapshot(),
             "configuration": {
                 "max_concurrent_trades": self.max_concurrent_trades,
                 "max_queue_size": self.max_queue_size,
@@ -501,8 +541,7 @@ class AutotradeEngine:
         Returns:
             Number of opportunities cleared
         """
-        cleared_count = len(self.opportunity_queue)
-        self.opportunity_queue.clear()
+        cleared_count = self.scheduler.clear()
         
         logger.info(f"Cleared {cleared_count} opportunities from queue")
         return cleared_count
@@ -514,20 +553,23 @@ class AutotradeEngine:
         Returns:
             Queue status information
         """
+        pending = self.scheduler.opportunities()
+        discovered = [o.discovered_at for o in pending]
+        
         return {
-            "total_count": len(self.opportunity_queue),
+            "total_count": len(pending),
             "by_priority": {
-                "critical": len([o for o in self.opportunity_queue if o.priority == OpportunityPriority.CRITICAL]),
-                "high": len([o for o in self.opportunity_queue if o.priority == OpportunityPriority.HIGH]),
-                "medium": len([o for o in self.opportunity_queue if o.priority == OpportunityPriority.MEDIUM]),
-                "low": len([o for o in self.opportunity_queue if o.priority == OpportunityPriority.LOW])
+                "critical": len([o for o in pending if o.priority == OpportunityPriority.CRITICAL]),
+                "high": len([o for o in pending if o.priority == OpportunityPriority.HIGH]),
+                "medium": len([o for o in pending if o.priority == OpportunityPriority.MEDIUM]),
+                "low": len([o for o in pending if o.priority == OpportunityPriority.LOW])
             },
             "by_type": {
-                "new_pair_snipe": len([o for o in self.opportunity_queue if o.opportunity_type == OpportunityType.NEW_PAIR_SNIPE]),
-                "trending_reentry": len([o for o in self.opportunity_queue if o.opportunity_type == OpportunityType.TRENDING_REENTRY]),
-                "arbitrage": len([o for o in self.opportunity_queue if o.opportunity_type == OpportunityType.ARBITRAGE]),
-                "momentum": len([o for o in self.opportunity_queue if o.opportunity_type == OpportunityType.MOMENTUM])
+                "new_pair_snipe": len([o for o in pending if o.opportunity_type == OpportunityType.NEW_PAIR_SNIPE]),
+                "trending_reentry": len([o for o in pending if o.opportunity_type == OpportunityType.TRENDING_REENTRY]),
+                "arbitrage": len([o for o in pending if o.opportunity_type == OpportunityType.ARBITRAGE]),
+                "momentum": len([o for o in pending if o.opportunity_type == OpportunityType.MOMENTUM])
             },
-            "oldest_opportunity": self.opportunity_queue[0].discovered_at.isoformat() if self.opportunity_queue else None,
-            "newest_opportunity": self.opportunity_queue[-1].discovered_at.isoformat() if self.opportunity_queue else None
-        }
\ No newline at end of file
+            "oldest_opportunity": min(discovered).isoformat() if discovered else None,
+            "newest_opportunity": max(discovered).isoformat() if discovered else None
+        }
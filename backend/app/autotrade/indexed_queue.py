@@ -0,0 +1,204 @@
+"""
+Indexed double-ended priority queue for trade scheduling.
+
+Entries live in a max-heap and a min-heap at once, so the highest and the
+lowest priority entry are both reachable in O(log n). Removal and priority
+changes go through a per-key handle: the old handle is tombstoned and
+skipped when it surfaces, and the heaps are compacted once tombstones
+outnumber live entries. Secondary hash indexes map attribute values (token,
+DEX, chain, ...) to the keys currently queued under them.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Callable, Dict, Generic, Hashable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Rebuild the heaps when dead entries exceed this multiple of live ones
+COMPACTION_RATIO = 2
+MIN_COMPACTION_SIZE = 64
+
+
+class PriorityHandle(Generic[T]):
+    """Live position of a key in the queue."""
+
+    __slots__ = ("key", "item", "score", "seq", "alive")
+
+    def __init__(self, key: str, item: T, score: float, seq: int) -> None:
+        self.key = key
+        self.item = item
+        self.score = score
+        self.seq = seq
+        self.alive = True
+
+
+# (sort score, sort sequence, entry id, handle)
+HeapEntry = Tuple[float, int, int, PriorityHandle]
+
+
+class IndexedPriorityQueue(Generic[T]):
+    """
+    Keyed priority queue with max and min access and secondary indexes.
+
+    Higher scores come first; equal scores keep insertion order. The
+    lowest entry is the lowest score, newest first among equals.
+    """
+
+    def __init__(self, indexes: Optional[Dict[str, Callable[[T], Hashable]]] = None) -> None:
+        """
+        Initialize queue.
+
+        Args:
+            indexes: Secondary index name -> function deriving the index value from an item
+        """
+        self._handles: Dict[str, PriorityHandle[T]] = {}
+        self._max_heap: List[HeapEntry] = []
+        self._min_heap: List[HeapEntry] = []
+        self._seq = itertools.count()
+        # Breaks ties between a tombstone and its replacement
+        self._entry_ids = itertools.count()
+        self._index_funcs = dict(indexes or {})
+        # Index name -> value -> keys (dicts keep insertion order)
+        self._indexes: Dict[str, Dict[Hashable, Dict[str, None]]] = {
+            name: {} for name in self._index_funcs
+        }
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._handles
+
+    def __iter__(self) -> Iterator[Tuple[str, T]]:
+        """Iterate (key, item) pairs in insertion order."""
+        return ((key, handle.item) for key, handle in self._handles.items())
+
+    def get(self, key: str) -> Optional[T]:
+        """Get a queued item by key."""
+        handle = self._handles.get(key)
+        return handle.item if handle else None
+
+    def score(self, key: str) -> Optional[float]:
+        """Get a queued key's score."""
+        handle = self._handles.get(key)
+        return handle.score if handle else None
+
+    def push(self, key: str, item: T, score: float) -> None:
+        """Add an item, replacing any entry with the same key."""
+        if key in self._handles:
+            self.remove(key)
+        handle = PriorityHandle(key, item, score, next(self._seq))
+        self._handles[key] = handle
+        self._push_handle(handle)
+        for name, func in self._index_funcs.items():
+            self._indexes[name].setdefault(func(item), {})[key] = None
+
+    def update(self, key: str, score: float) -> bool:
+        """
+        Change a queued key's score, keeping its insertion order.
+
+        Returns:
+            True if the key was queued
+        """
+        handle = self._handles.get(key)
+        if handle is None:
+            return False
+        if score == handle.score:
+            return True
+        handle.alive = False
+        new_handle = PriorityHandle(key, handle.item, score, handle.seq)
+        self._handles[key] = new_handle
+        self._push_handle(new_handle)
+        self._maybe_compact()
+        return True
+
+    def remove(self, key: str) -> Optional[T]:
+        """Remove a key and return its item."""
+        handle = self._handles.pop(key, None)
+        if handle is None:
+            return None
+        handle.alive = False
+        self._unindex(key, handle.item)
+        self._maybe_compact()
+        return handle.item
+
+    def peek_max(self) -> Optional[Tuple[str, T, float]]:
+        """Get the highest priority (key, item, score) without removing it."""
+        handle = self._top(self._max_heap)
+        return (handle.key, handle.item, handle.score) if handle else None
+
+    def peek_min(self) -> Optional[Tuple[str, T, float]]:
+        """Get the lowest priority (key, item, score) without removing it."""
+        handle = self._top(self._min_heap)
+        return (handle.key, handle.item, handle.score) if handle else None
+
+    def pop_max(self) -> Optional[Tuple[str, T, float]]:
+        """Remove and return the highest priority (key, item, score)."""
+        entry = self.peek_max()
+        if entry is not None:
+            self.remove(entry[0])
+        return entry
+
+    def pop_min(self) -> Optional[Tuple[str, T, float]]:
+        """Remove and return the lowest priority (key, item, score)."""
+        entry = self.peek_min()
+        if entry is not None:
+            self.remove(entry[0])
+        return entry
+
+    def members(self, index: str, value: Hashable) -> Iterator[Tuple[str, T]]:
+        """Iterate queued (key, item) pairs under a secondary index value, oldest first."""
+        for key in list(self._indexes[index].get(value, ())):
+            yield key, self._handles[key].item
+
+    def index_size(self, index: str, value: Hashable) -> int:
+        """Count keys under a secondary index value."""
+        return len(self._indexes[index].get(value, ()))
+
+    def ordered(self) -> List[Tuple[str, T, float]]:
+        """Get all entries, highest priority first."""
+        handles = sorted(self._handles.values(), key=lambda handle: (-handle.score, handle.seq))
+        return [(handle.key, handle.item, handle.score) for handle in handles]
+
+    def rescore(self, score_fn: Callable[[T], float]) -> None:
+        """Recompute every score and rebuild both heaps in O(n)."""
+        for handle in self._handles.values():
+            handle.score = score_fn(handle.item)
+        self._rebuild()
+
+    def _push_handle(self, handle: PriorityHandle[T]) -> None:
+        entry_id = next(self._entry_ids)
+        heapq.heappush(self._max_heap, (-handle.score, handle.seq, entry_id, handle))
+        heapq.heappush(self._min_heap, (handle.score, -handle.seq, entry_id, handle))
+
+    @staticmethod
+    def _top(heap: List[HeapEntry]) -> Optional[PriorityHandle[T]]:
+        """Drop tombstones from the top of a heap and return the live top."""
+        while heap and not heap[0][3].alive:
+            heapq.heappop(heap)
+        return heap[0][3] if heap else None
+
+    def _unindex(self, key: str, item: T) -> None:
+        for name, func in self._index_funcs.items():
+            value = func(item)
+            keys = self._indexes[name].get(value)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._indexes[name][value]
+
+    def _maybe_compact(self) -> None:
+        dead = max(len(self._max_heap), len(self._min_heap)) - len(self._handles)
+        if dead > MIN_COMPACTION_SIZE and dead > COMPACTION_RATIO * len(self._handles):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        handles = list(self._handles.values())
+        entry_ids = [next(self._entry_ids) for _ in handles]
+        self._max_heap = [(-h.score, h.seq, entry_id, h) for h, entry_id in zip(handles, entry_ids)]
+        self._min_heap = [(h.score, -h.seq, entry_id, h) for h, entry_id in zip(handles, entry_ids)]
+        heapq.heapify(self._max_heap)
+        heapq.heapify(self._min_heap)
@@ -11,15 +11,15 @@ import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, Tuple, Union, Any, Callable
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Union, Any, Callable
 from dataclasses import dataclass, field
 from enum import Enum
 import uuid
-import heapq
 from collections import defaultdict
 
 from pydantic import BaseModel, Field
 
+from .indexed_queue import IndexedPriorityQueue
 from .engine import TradeOpportunity, QueuedTrade, TradePriority, TradeStatus, ConflictResolution
 from ..strategy.base import StrategyType
 
@@ -83,15 +83,6 @@ class PriorityQueueItem:
     priority_score: float
     queued_at: datetime
     trade: QueuedTrade
-    
-    def __lt__(self, other: 'PriorityQueueItem') -> bool:
-        """Compare items for priority queue ordering."""
-        # Higher priority score comes first (min-heap, so negate)
-        if self.priority_score != other.priority_score:
-            return self.priority_score > other.priority_score
-        
-        # If equal priority, earlier timestamp comes first
-        return self.queued_at < other.queued_at
 
 
 @dataclass
@@ -170,6 +161,11 @@ class TradeQueueManager:
     
     Provides priority-based queuing, batching optimization, load balancing,
     and intelligent scheduling for optimal trade execution.
+    
+    Trades are held in an ``IndexedPriorityQueue`` keyed by trade ID, so
+    enqueue, dequeue, eviction of the lowest priority trade and removal are
+    O(log n). Token, DEX and chain indexes narrow batching candidates to
+    trades that can actually share a batch.
     """
     
     def __init__(self, config: QueueConfig):
@@ -183,10 +179,15 @@ class TradeQueueManager:
         self.logger = logging.getLogger(f"{__name__}.{self.__class__.__name__}")
         
         # Queue storage
-        self._priority_queue: List[PriorityQueueItem] = []
-        self._trade_lookup: Dict[str, QueuedTrade] = {}
+        self._queue: IndexedPriorityQueue[PriorityQueueItem] = IndexedPriorityQueue({
+            "token": lambda item: (item.trade.opportunity.chain, item.trade.opportunity.token_address),
+            "dex": lambda item: (item.trade.opportunity.chain, item.trade.opportunity.dex),
+            "chain": lambda item: item.trade.opportunity.chain,
+        })
         self._batches: Dict[str, TradeBatch] = {}
         self._pending_batches: List[TradeBatch] = []
+        self._trade_batches: Dict[str, str] = {}  # Trade ID -> pending batch ID
+        self._open_batches: Dict[Hashable, str] = {}  # Batching group -> pending batch ID
         
         # Load balancing
         self._wallet_loads: Dict[str, int] = defaultdict(int)
@@ -240,7 +241,7 @@ class TradeQueueManager:
         Raises:
             QueueManagerError: If queue is full or trade is invalid
         """
-        if len(self._priority_queue) >= self.config.max_queue_size:
+        if len(self._queue) >= self.config.max_queue_size:
             # Remove lowest priority trade if queue is full
             await self._evict_lowest_priority()
         
@@ -255,11 +256,10 @@ class TradeQueueManager:
         )
         
         # Add to priority queue
-        heapq.heappush(self._priority_queue, queue_item)
-        self._trade_lookup[trade.trade_id] = trade
+        self._queue.push(trade.trade_id, queue_item, priority_score)
         
         # Update metrics
-        self.metrics.current_queue_depth = len(self._priority_queue)
+        self.metrics.current_queue_depth = len(self._queue)
         self.metrics.peak_queue_size = max(
             self.metrics.peak_queue_size,
             self.metrics.current_queue_depth
@@ -280,7 +280,7 @@ class TradeQueueManager:
             extra={
                 "trade_id": trade.trade_id,
                 "priority": trade.opportunity.priority.value,
-                "queue_size": len(self._priority_queue),
+                "queue_size": len(self._queue),
                 "module": "queue_manager"
             }
         )
@@ -298,17 +298,18 @@ class TradeQueueManager:
             return ready_batch
         
         # Get individual trade
-        if not self._priority_queue:
+        entry = self._queue.pop_max()
+        if entry is None:
             return None
         
-        queue_item = heapq.heappop(self._priority_queue)
+        queue_item = entry[1]
         trade = queue_item.trade
         
-        # Remove from lookup
-        del self._trade_lookup[trade.trade_id]
+        # A trade executed on its own must not also run with its batch
+        await self._remove_from_batches(trade.trade_id)
         
         # Update metrics
-        self.metrics.current_queue_depth = len(self._priority_queue)
+        self.metrics.current_queue_depth = len(self._queue)
         wait_time = (datetime.now(timezone.utc) - queue_item.queued_at).total_seconds() * 1000
         self._update_wait_time_metric(wait_time)
         
@@ -333,27 +334,16 @@ class TradeQueueManager:
         Returns:
             QueuedTrade: Removed trade, or None if not found
         """
-        if trade_id not in self._trade_lookup:
+        queue_item = self._queue.remove(trade_id)
+        if queue_item is None:
             return None
         
-        trade = self._trade_lookup[trade_id]
-        
-        # Remove from priority queue (mark as invalid)
-        for item in self._priority_queue:
-            if item.trade.trade_id == trade_id:
-                item.trade.status = TradeStatus.CANCELLED
-                break
-        
-        # Remove from lookup
-        del self._trade_lookup[trade_id]
+        trade = queue_item.trade
         
         # Remove from any batches
         await self._remove_from_batches(trade_id)
         
-        # Clean up invalid items
-        await self._cleanup_invalid_items()
-        
-        self.metrics.current_queue_depth = len(self._priority_queue)
+        self.metrics.current_queue_depth = len(self._queue)
         
         self.logger.debug(
             f"Trade removed from queue",
@@ -374,10 +364,11 @@ class TradeQueueManager:
         if ready_batch:
             return ready_batch
         
-        if not self._priority_queue:
+        entry = self._queue.peek_max()
+        if entry is None:
             return None
         
-        return self._priority_queue[0].trade
+        return entry[1].trade
     
     async def get_queue_status(self) -> List[Dict[str, Any]]:
         """
@@ -388,10 +379,8 @@ class TradeQueueManager:
         """
         status = []
         
-        for item in sorted(self._priority_queue, key=lambda x: x.priority_score, reverse=True):
+        for _, item, _ in self._queue.ordered():
             trade = item.trade
-            if trade.status == TradeStatus.CANCELLED:
-                continue
             
             wait_time = (datetime.now(timezone.utc) - item.queued_at).total_seconds()
             
@@ -405,7 +394,7 @@ class TradeQueueManager:
                 "amount_usd": float(trade.opportunity.amount_in),
                 "wait_time_seconds": wait_time,
                 "expires_at": trade.opportunity.expires_at.isoformat() if trade.opportunity.expires_at else None,
-                "batch_id": await self._get_trade_batch_id(trade.trade_id)
+                "batch_id": self._trade_batches.get(trade.trade_id)
             })
         
         return status
@@ -493,10 +482,19 @@ class TradeQueueManager:
         return trade.opportunity.risk_score
     
     async def _check_batching_opportunity(self, new_trade: QueuedTrade) -> None:
-        """Check if new trade can be batched with existing trades."""
-        if self.config.batching_strategy == BatchingStrategy.NONE:
+        """Add a new trade to its group's open batch, or open one if enough trades match."""
+        group = self._batch_group(new_trade)
+        if group is None:
             return
         
+        # Grow the group's pending batch incrementally
+        open_batch = self._batches.get(self._open_batches.get(group, ""))
+        if open_batch is not None and len(open_batch.trades) < self.config.max_batch_size:
+            if await self._are_trades_compatible(open_batch.trades[0], new_trade):
+                open_batch.trades.append(new_trade)
+                self._trade_batches[new_trade.trade_id] = open_batch.batch_id
+                return
+        
         # Find compatible trades for batching
         compatible_trades = await self._find_compatible_trades(new_trade)
         
@@ -515,6 +513,9 @@ class TradeQueueManager:
             
             self._batches[batch.batch_id] = batch
             self._pending_batches.append(batch)
+            self._open_batches[group] = batch.batch_id
+            for trade in batch.trades:
+                self._trade_batches[trade.trade_id] = batch.batch_id
             
             self.logger.debug(
                 f"Created batch with {len(batch.trades)} trades",
@@ -525,12 +526,30 @@ class TradeQueueManager:
                 }
             )
     
+    def _batch_group(self, trade: QueuedTrade) -> Optional[Tuple[str, Hashable]]:
+        """Get the (index, value) whose trades may share a batch with this one."""
+        opportunity = trade.opportunity
+        strategy = self.config.batching_strategy
+        
+        if strategy == BatchingStrategy.SAME_TOKEN:
+            return "token", (opportunity.chain, opportunity.token_address)
+        elif strategy == BatchingStrategy.SAME_DEX:
+            return "dex", (opportunity.chain, opportunity.dex)
+        elif strategy in (BatchingStrategy.SAME_CHAIN, BatchingStrategy.OPTIMAL_GAS):
+            return "chain", opportunity.chain
+        
+        return None
+    
     async def _find_compatible_trades(self, trade: QueuedTrade) -> List[QueuedTrade]:
-        """Find trades compatible for batching."""
+        """Find unbatched queued trades compatible for batching."""
+        group = self._batch_group(trade)
+        if group is None:
+            return []
+        
         compatible = []
         
-        for item in self._priority_queue:
-            if item.trade.trade_id == trade.trade_id:
+        for trade_id, item in self._queue.members(*group):
+            if trade_id == trade.trade_id or trade_id in self._trade_batches:
                 continue
             
             if item.trade.status != TradeStatus.QUEUED:
@@ -589,12 +608,12 @@ class TradeQueueManager:
                 datetime.now(timezone.utc) >= batch.target_execution_time):
                 
                 # Remove from pending
-                self._pending_batches.remove(batch)
+                self._close_batch(batch)
                 
                 # Remove trades from individual queue
                 for trade in batch.trades:
-                    if trade.trade_id in self._trade_lookup:
-                        await self.remove(trade.trade_id)
+                    self._queue.remove(trade.trade_id)
+                self.metrics.current_queue_depth = len(self._queue)
                 
                 self.logger.debug(
                     f"Batch ready for execution",
@@ -609,60 +628,54 @@ class TradeQueueManager:
         
         return None
     
-    async def _get_trade_batch_id(self, trade_id: str) -> Optional[str]:
-        """Get batch ID for a trade if it's batched."""
-        for batch in self._batches.values():
-            if any(trade.trade_id == trade_id for trade in batch.trades):
-                return batch.batch_id
-        return None
+    def _close_batch(self, batch: TradeBatch) -> None:
+        """Stop tracking a batch as pending and release its trades."""
+        if batch in self._pending_batches:
+            self._pending_batches.remove(batch)
+        for group, batch_id in list(self._open_batches.items()):
+            if batch_id == batch.batch_id:
+                del self._open_batches[group]
+        for trade in batch.trades:
+            if self._trade_batches.get(trade.trade_id) == batch.batch_id:
+                del self._trade_batches[trade.trade_id]
     
     async def _remove_from_batches(self, trade_id: str) -> None:
-        """Remove a trade from all batches."""
-        batches_to_remove = []
+        """Remove a trade from its pending batch."""
+        batch_id = self._trade_batches.pop(trade_id, None)
+        if batch_id is None:
+            return
         
-        for batch_id, batch in self._batches.items():
-            batch.trades = [trade for trade in batch.trades if trade.trade_id != trade_id]
-            
-            # Remove batch if too few trades remain
-            if len(batch.trades) < self.config.min_batch_size:
-                batches_to_remove.append(batch_id)
+        batch = self._batches.get(batch_id)
+        if batch is None:
+            return
         
-        # Clean up empty batches
-        for batch_id in batches_to_remove:
-            batch = self._batches.pop(batch_id, None)
-            if batch in self._pending_batches:
-                self._pending_batches.remove(batch)
+        batch.trades = [trade for trade in batch.trades if trade.trade_id != trade_id]
+        
+        # Remove batch if too few trades remain
+        if len(batch.trades) < self.config.min_batch_size:
+            self._close_batch(batch)
+            del self._batches[batch_id]
     
     async def _evict_lowest_priority(self) -> None:
         """Remove the lowest priority trade when queue is full."""
-        if not self._priority_queue:
+        lowest = self._queue.peek_min()
+        if lowest is None:
             return
         
-        # Find lowest priority item
-        lowest_item = min(self._priority_queue, key=lambda x: x.priority_score)
+        trade_id, lowest_item, priority_score = lowest
         
         # Remove it
-        await self.remove(lowest_item.trade.trade_id)
+        await self.remove(trade_id)
         
         self.logger.warning(
             f"Evicted lowest priority trade due to queue full",
             extra={
-                "trade_id": lowest_item.trade.trade_id,
-                "priority_score": lowest_item.priority_score,
+                "trade_id": trade_id,
+                "priority_score": priority_score,
                 "module": "queue_manager"
             }
         )
     
-    async def _cleanup_invalid_items(self) -> None:
-        """Remove cancelled/invalid items from the priority queue."""
-        valid_items = [
-            item for item in self._priority_queue
-            if item.trade.status == TradeStatus.QUEUED
-        ]
-        
-        self._priority_queue = valid_items
-        heapq.heapify(self._priority_queue)
-    
     async def _optimization_loop(self) -> None:
         """Background optimization loop."""
         while True:
@@ -707,25 +720,15 @@ class TradeQueueManager:
     
     async def _optimize_queue_order(self) -> None:
         """Optimize the order of trades in the queue."""
-        if len(self._priority_queue) < 2:
+        if len(self._queue) < 2:
             return
         
         # Recalculate priority scores for all trades
-        updated_items = []
-        
-        for item in self._priority_queue:
-            if item.trade.status == TradeStatus.QUEUED:
-                new_score = await self._calculate_priority_score(item.trade)
-                updated_item = PriorityQueueItem(
-                    priority_score=new_score,
-                    queued_at=item.queued_at,
-                    trade=item.trade
-                )
-                updated_items.append(updated_item)
+        for _, item in list(self._queue):
+            item.priority_score = await self._calculate_priority_score(item.trade)
         
-        # Rebuild the heap
-        self._priority_queue = updated_items
-        heapq.heapify(self._priority_queue)
+        # Rebuild both heaps in one pass
+        self._queue.rescore(lambda item: item.priority_score)
         
         self._last_optimization = datetime.now(timezone.utc)
     
@@ -782,42 +785,31 @@ class TradeQueueManager:
                 expired_batches.append(batch)
         
         for batch in expired_batches:
-            self._pending_batches.remove(batch)
-            
             # If batch has minimum trades, keep it ready
             if len(batch.trades) >= self.config.min_batch_size:
                 # Batch is ready for execution - it will be picked up by _get_ready_batch()
                 pass
             else:
-                # Dissolve batch and return trades to individual queue
-                for trade in batch.trades:
-                    await self.enqueue(trade)
-                
+                # Dissolve batch; its trades are still queued individually
+                self._close_batch(batch)
                 del self._batches[batch.batch_id]
     
     async def _optimize_batches(self) -> None:
         """Optimize existing batches for better performance."""
         for batch in self._pending_batches[:]:
-            # Try to add more compatible trades
-            additional_trades = []
+            if not batch.trades or len(batch.trades) >= self.config.max_batch_size:
+                continue
             
-            for item in self._priority_queue:
+            # Try to add more compatible unbatched trades
+            for trade in await self._find_compatible_trades(batch.trades[0]):
                 if len(batch.trades) >= self.config.max_batch_size:
                     break
-                
-                if item.trade.status == TradeStatus.QUEUED:
-                    if batch.trades and await self._are_trades_compatible(batch.trades[0], item.trade):
-                        additional_trades.append(item.trade)
-            
-            # Add compatible trades to batch
-            for trade in additional_trades:
-                if len(batch.trades) < self.config.max_batch_size:
-                    batch.trades.append(trade)
-                    await self.remove(trade.trade_id)
+                batch.trades.append(trade)
+                self._trade_batches[trade.trade_id] = batch.batch_id
     
     async def _update_metrics(self) -> None:
         """Update queue performance metrics."""
-        self.metrics.current_queue_depth = len(self._priority_queue)
+        self.metrics.current_queue_depth = len(self._queue)
         
         # Calculate throughput
         current_time = datetime.now(timezone.utc)
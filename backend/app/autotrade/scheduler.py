@@ -0,0 +1,185 @@
+"""
+Event-driven opportunity scheduler for the autotrade engine.
+
+Opportunities wait in a heap ordered by (priority, discovered_at) and their
+expiry deadlines sit in a hashed timing wheel, so inserting, popping and
+expiring are O(log n) or O(1) instead of re-sorting a list. Inserts set a
+wake-up event so the engine dispatches a CRITICAL opportunity as soon as it
+is accepted rather than on its next poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .engine import TradeOpportunity
+
+# Keyed by OpportunityPriority value
+PRIORITY_RANK = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+}
+
+DEFAULT_TICK_SECONDS = 1.0
+DEFAULT_WHEEL_SLOTS = 512
+
+
+class ExpiryWheel:
+    """
+    Hashed timing wheel of expiry deadlines.
+
+    Each key is filed under the slot of the tick at which it expires; a
+    slot holds keys for every lap of the wheel and only those whose tick
+    has passed fire. Advancing costs one slot per elapsed tick.
+    """
+
+    def __init__(self, tick_seconds: float = DEFAULT_TICK_SECONDS, slots: int = DEFAULT_WHEEL_SLOTS) -> None:
+        """Initialize wheel."""
+        self.tick_seconds = tick_seconds
+        self._slots: List[Dict[str, int]] = [{} for _ in range(slots)]
+        self._targets: Dict[str, int] = {}
+        self._current_tick = int(time.monotonic() / tick_seconds)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def add(self, key: str, delay_seconds: float, now: Optional[float] = None) -> None:
+        """Schedule a key to expire after ``delay_seconds``."""
+        now = time.monotonic() if now is None else now
+        self.cancel(key)
+        target = max(math.ceil((now + delay_seconds) / self.tick_seconds), self._current_tick + 1)
+        self._slots[target % len(self._slots)][key] = target
+        self._targets[key] = target
+
+    def cancel(self, key: str) -> bool:
+        """Unschedule a key."""
+        target = self._targets.pop(key, None)
+        if target is None:
+            return False
+        self._slots[target % len(self._slots)].pop(key, None)
+        return True
+
+    def advance(self, now: Optional[float] = None) -> List[str]:
+        """Move to the current tick and return keys that expired."""
+        now = time.monotonic() if now is None else now
+        now_tick = int(now / self.tick_seconds)
+        if now_tick <= self._current_tick:
+            return []
+
+        expired: List[str] = []
+        first = max(self._current_tick + 1, now_tick - len(self._slots) + 1)
+        for tick in range(first, now_tick + 1):
+            slot = self._slots[tick % len(self._slots)]
+            due = [key for key, target in slot.items() if target <= now_tick]
+            for key in due:
+                del slot[key]
+                del self._targets[key]
+            expired.extend(due)
+        self._current_tick = now_tick
+        return expired
+
+
+class OpportunityScheduler:
+    """
+    Priority heap of pending opportunities with expiry and wake-up signalling.
+
+    Removed and expired opportunities leave stale heap entries that are
+    skipped when they reach the top.
+    """
+
+    def __init__(self, tick_seconds: float = DEFAULT_TICK_SECONDS) -> None:
+        """Initialize scheduler."""
+        self._heap: List[Tuple[int, datetime, int, str]] = []
+        # Opportunity ID -> (opportunity, monotonic enqueue time, heap sequence)
+        self._pending: Dict[str, Tuple[TradeOpportunity, float, int]] = {}
+        self._seq = itertools.count()
+        self.expiry = ExpiryWheel(tick_seconds)
+        self.wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __contains__(self, opportunity_id: object) -> bool:
+        return opportunity_id in self._pending
+
+    def push(self, opportunity: TradeOpportunity) -> None:
+        """Queue an opportunity and wake the dispatcher."""
+        now = time.monotonic()
+        if opportunity.id in self._pending:
+            self.remove(opportunity.id)
+        seq = next(self._seq)
+        self._pending[opportunity.id] = (opportunity, now, seq)
+        heapq.heappush(
+            self._heap,
+            (PRIORITY_RANK[opportunity.priority], opportunity.discovered_at, seq, opportunity.id),
+        )
+        self.expiry.add(opportunity.id, (opportunity.expires_at - datetime.utcnow()).total_seconds(), now)
+        self.wakeup.set()
+
+    def pop(self) -> Optional[Tuple[TradeOpportunity, float]]:
+        """
+        Remove the next opportunity in priority order.
+
+        Returns:
+            Tuple of (opportunity, monotonic enqueue time), or None when empty
+        """
+        while self._heap:
+            _, _, seq, opportunity_id = heapq.heappop(self._heap)
+            entry = self._pending.get(opportunity_id)
+            if entry is not None and entry[2] == seq:
+                del self._pending[opportunity_id]
+                self.expiry.cancel(opportunity_id)
+                return entry[0], entry[1]
+        return None
+
+    def remove(self, opportunity_id: str) -> Optional[TradeOpportunity]:
+        """Drop a pending opportunity."""
+        entry = self._pending.pop(opportunity_id, None)
+        if entry is None:
+            return None
+        self.expiry.cancel(opportunity_id)
+        self._compact()
+        return entry[0]
+
+    def expire(self, now: Optional[float] = None) -> List[TradeOpportunity]:
+        """Drop and return opportunities whose deadline has passed."""
+        expired = [
+            self._pending.pop(opportunity_id)[0]
+            for opportunity_id in self.expiry.advance(now)
+            if opportunity_id in self._pending
+        ]
+        if expired:
+            self._compact()
+        return expired
+
+    def clear(self) -> int:
+        """Drop every pending opportunity."""
+        count = len(self._pending)
+        self._heap.clear()
+        self._pending.clear()
+        self.expiry = ExpiryWheel(self.expiry.tick_seconds)
+        return count
+
+    def opportunities(self) -> List[TradeOpportunity]:
+        """Pending opportunities in dispatch order."""
+        live = sorted(entry for entry in self._heap if self._is_live(entry))
+        return [self._pending[entry[3]][0] for entry in live]
+
+    def _is_live(self, entry: Tuple[int, datetime, int, str]) -> bool:
+        pending = self._pending.get(entry[3])
+        return pending is not None and pending[2] == entry[2]
+
+    def _compact(self) -> None:
+        """Rebuild the heap once stale entries dominate it."""
+        if len(self._heap) > 2 * len(self._pending) + 64:
+            self._heap = [entry for entry in self._heap if self._is_live(entry)]
+            heapq.heapify(self._heap)
@@ -61,6 +61,11 @@ class CircuitBreaker:
         if self._state == CircuitState.HALF_OPEN:
             self._allow_half_open_probe = False
 
+    def release_probe(self) -> None:
+        """Give back a probe whose request was abandoned without a result."""
+        if self._state == CircuitState.HALF_OPEN:
+            self._allow_half_open_probe = True
+
     def state(self) -> CircuitState:
         return self._state
 
@@ -0,0 +1,274 @@
+"""
+Native async contract reads over the pooled JSON-RPC client.
+
+Calldata is built from pre-computed selectors and sent as ``eth_call``
+through ``RpcPool.make_request``, so DEX adapter reads share the pool's
+batching, hedging and response cache instead of occupying default
+thread-pool workers with a synchronous Web3 provider.
+"""
+from __future__ import annotations
+
+import logging
+import weakref
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .multicall import (
+    ERC20_DECIMALS_SELECTOR,
+    PAIR_GET_RESERVES_SELECTOR,
+    PAIR_TOKEN0_SELECTOR,
+    decode_address,
+    decode_int,
+    decode_reserves,
+    decode_uint,
+    encode_address,
+    encode_call,
+    encode_uint,
+)
+from .rpc_pool import RpcPool, rpc_pool
+
+logger = logging.getLogger(__name__)
+
+# Function selectors
+ROUTER_GET_AMOUNTS_OUT_SELECTOR = "d06ca61f"  # getAmountsOut(uint256,address[])
+ROUTER_WETH_SELECTOR = "ad5c4648"  # WETH()
+FACTORY_GET_PAIR_SELECTOR = "e6a43905"  # getPair(address,address)
+FACTORY_GET_POOL_SELECTOR = "1698ee82"  # getPool(address,address,uint24)
+POOL_SLOT0_SELECTOR = "3850c7bd"  # slot0()
+POOL_LIQUIDITY_SELECTOR = "1a686502"  # liquidity()
+# quoteExactInputSingle((address,address,uint256,uint24,uint160)) on QuoterV2
+QUOTER_V2_QUOTE_EXACT_INPUT_SINGLE_SELECTOR = "c6a5026a"
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+_WORD = 32
+
+
+class ContractCallError(Exception):
+    """Raised when a contract read returns no data."""
+    pass
+
+
+class AsyncContractCaller:
+    """
+    Typed contract reads issued as raw ``eth_call`` requests.
+
+    Each helper encodes its calldata by hand from a fixed selector, so no
+    ABI objects are built per call. Concurrent reads on a chain are
+    coalesced into JSON-RPC batches by the pool.
+    """
+
+    def __init__(self, pool: Optional[RpcPool] = None) -> None:
+        """Initialize caller."""
+        self.pool = pool or rpc_pool
+        self._contracts: "weakref.WeakKeyDictionary[Any, Dict[Tuple[str, int], Tuple[Any, Any]]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    async def supports_chain(self, chain: str) -> bool:
+        """Check whether the pool has providers configured for a chain."""
+        if not getattr(self.pool, "_initialized", True):
+            await self.pool.initialize()
+        providers = getattr(self.pool, "providers", {})
+        return bool(providers.get(chain))
+
+    async def call(
+        self,
+        chain: str,
+        to: str,
+        data: str,
+        block_identifier: str = "latest",
+    ) -> bytes:
+        """
+        Execute an ``eth_call`` and return the raw return data.
+
+        Args:
+            chain: Chain name
+            to: Contract address
+            data: Hex calldata
+            block_identifier: Block tag or hex block number
+
+        Returns:
+            Return data bytes
+
+        Raises:
+            ContractCallError: If the call returns no data
+        """
+        result = await self.pool.make_request(
+            chain=chain,
+            method="eth_call",
+            params=[{"to": to, "data": data}, block_identifier],
+        )
+        if not result or result == "0x":
+            raise ContractCallError(f"Empty return data from {to} on {chain}")
+        return bytes.fromhex(result[2:] if result.startswith("0x") else result)
+
+    # ------------------------------------------------------------------
+    # Typed reads
+    # ------------------------------------------------------------------
+
+    async def gas_price(self, chain: str) -> int:
+        """Get the current gas price in wei."""
+        result = await self.pool.make_request(chain=chain, method="eth_gasPrice", params=[])
+        return int(result, 16)
+
+    async def decimals(self, chain: str, token_address: str) -> int:
+        """Get ERC-20 decimals."""
+        data = await self.call(chain, token_address, encode_call(ERC20_DECIMALS_SELECTOR))
+        return decode_uint(data)
+
+    async def get_amounts_out(
+        self,
+        chain: str,
+        router_address: str,
+        amount_in: int,
+        path: Sequence[str],
+    ) -> List[int]:
+        """Call a V2 router's ``getAmountsOut``."""
+        calldata = encode_call(
+            ROUTER_GET_AMOUNTS_OUT_SELECTOR,
+            encode_uint(amount_in),
+            encode_uint(2 * _WORD),
+            encode_uint(len(path)),
+            *[encode_address(token) for token in path],
+        )
+        data = await self.call(chain, router_address, calldata)
+        return decode_uint_array(data)
+
+    async def weth(self, chain: str, router_address: str) -> str:
+        """Get a V2 router's wrapped native token."""
+        data = await self.call(chain, router_address, encode_call(ROUTER_WETH_SELECTOR))
+        return decode_address(data)
+
+    async def get_pair(self, chain: str, factory_address: str, token_a: str, token_b: str) -> str:
+        """Get a V2 pair address (zero address when missing)."""
+        data = await self.call(
+            chain,
+            factory_address,
+            encode_call(FACTORY_GET_PAIR_SELECTOR, encode_address(token_a), encode_address(token_b)),
+        )
+        return decode_address(data)
+
+    async def get_reserves(self, chain: str, pair_address: str) -> Tuple[int, int, int]:
+        """Get V2 pair reserves and the last update timestamp."""
+        data = await self.call(chain, pair_address, encode_call(PAIR_GET_RESERVES_SELECTOR))
+        return decode_reserves(data)
+
+    async def token0(self, chain: str, pair_address: str) -> str:
+        """Get a pair or pool's token0."""
+        data = await self.call(chain, pair_address, encode_call(PAIR_TOKEN0_SELECTOR))
+        return decode_address(data)
+
+    async def get_pool(
+        self,
+        chain: str,
+        factory_address: str,
+        token_a: str,
+        token_b: str,
+        fee: int,
+    ) -> str:
+        """Get a V3 pool address (zero address when missing)."""
+        data = await self.call(
+            chain,
+            factory_address,
+            encode_call(
+                FACTORY_GET_POOL_SELECTOR,
+                encode_address(token_a),
+                encode_address(token_b),
+                encode_uint(fee),
+            ),
+        )
+        return decode_address(data)
+
+    async def slot0(self, chain: str, pool_address: str) -> Tuple[int, int]:
+        """Get a V3 pool's (sqrtPriceX96, tick)."""
+        data = await self.call(chain, pool_address, encode_call(POOL_SLOT0_SELECTOR))
+        return decode_uint(data), decode_int(data, _WORD)
+
+    async def liquidity(self, chain: str, pool_address: str) -> int:
+        """Get a V3 pool's in-range liquidity."""
+        data = await self.call(chain, pool_address, encode_call(POOL_LIQUIDITY_SELECTOR))
+        return decode_uint(data)
+
+    async def quote_exact_input_single(
+        self,
+        chain: str,
+        quoter_address: str,
+        token_in: str,
+        token_out: str,
+        fee: int,
+        amount_in: int,
+        sqrt_price_limit_x96: int = 0,
+    ) -> Tuple[int, int, int, int]:
+        """
+        Quote an exact-input single-pool swap on QuoterV2.
+
+        Returns:
+            Tuple of (amount_out, sqrt_price_x96_after, initialized_ticks_crossed, gas_estimate)
+        """
+        # A struct of static fields is encoded inline like flat arguments
+        calldata = encode_call(
+            QUOTER_V2_QUOTE_EXACT_INPUT_SINGLE_SELECTOR,
+            encode_address(token_in),
+            encode_address(token_out),
+            encode_uint(amount_in),
+            encode_uint(fee),
+            encode_uint(sqrt_price_limit_x96),
+        )
+        data = await self.call(chain, quoter_address, calldata)
+        if len(data) < 4 * _WORD:
+            raise ContractCallError(f"Unexpected quoter return size: {len(data)} bytes")
+        return tuple(
+            int.from_bytes(data[index * _WORD:(index + 1) * _WORD], "big") for index in range(4)
+        )
+
+    async def get_block_timestamp(self, chain: str, block_number: int) -> int:
+        """Get a block's timestamp."""
+        block = await self.pool.make_request(
+            chain=chain, method="eth_getBlockByNumber", params=[hex(block_number), False]
+        )
+        if not block:
+            raise ContractCallError(f"Block {block_number} not found on {chain}")
+        return int(block["timestamp"], 16)
+
+    # ------------------------------------------------------------------
+    # Sync fallback
+    # ------------------------------------------------------------------
+
+    def get_contract(self, w3: Any, address: str, abi: List[Dict[str, Any]]) -> Any:
+        """
+        Get a cached Web3 ``Contract`` for the synchronous fallback path.
+
+        Contracts are cached per Web3 instance and keyed by address and ABI
+        identity, so repeated quotes skip ABI parsing.
+        """
+        contracts = self._contracts.get(w3)
+        if contracts is None:
+            contracts = {}
+            self._contracts[w3] = contracts
+
+        key = (address.lower(), id(abi))
+        entry = contracts.get(key)
+        if entry is None or entry[0] is not abi:
+            contract = w3.eth.contract(address=w3.to_checksum_address(address), abi=abi)
+            entry = (abi, contract)
+            contracts[key] = entry
+        return entry[1]
+
+
+def decode_uint_array(data: bytes) -> List[int]:
+    """Decode a single dynamic ``uint256[]`` return value."""
+    if len(data) < 2 * _WORD:
+        raise ValueError("Return data too short for uint256[]")
+    start = int.from_bytes(data[:_WORD], "big")
+    count = int.from_bytes(data[start:start + _WORD], "big")
+    body = start + _WORD
+    if len(data) < body + count * _WORD:
+        raise ValueError("Return data too short for uint256[] length")
+    return [
+        int.from_bytes(data[body + index * _WORD:body + (index + 1) * _WORD], "big")
+        for index in range(count)
+    ]
+
+
+# Global caller instance
+contract_caller = AsyncContractCaller()
@@ -15,6 +15,12 @@ from web3.exceptions import TransactionNotFound
 from web3.types import TxParams, TxReceipt
 
 from ..core.settings import settings
+from .multicall import (
+    MulticallError,
+    balance_call,
+    multicall_aggregator,
+    token_metadata_calls,
+)
 from .rpc_pool import RpcProvider, rpc_pool
 
 logger = logging.getLogger(__name__)
@@ -242,39 +248,47 @@ class EvmClient:
             await self.initialize()
         
         try:
-            if token_address is None:
-                # Native token balance
-                result = await rpc_pool.make_request(
-                    chain=chain,
-                    method="eth_getBalance",
-                    params=[address, "latest"]
-                )
-                balance_wei = int(result, 16)
-                return Decimal(balance_wei)
-            else:
-                # ERC-20 token balance
-                # balanceOf(address) function signature
-                data = "0x70a08231" + address[2:].zfill(64)
-                
-                result = await rpc_pool.make_request(
-                    chain=chain,
-                    method="eth_call",
-                    params=[
-                        {
-                            "to": token_address,
-                            "data": data
-                        },
-                        "latest"
-                    ]
-                )
-                
-                balance = int(result, 16) if result != "0x" else 0
-                return Decimal(balance)
-                
+            return await self._read_balance(address, chain, token_address)
         except Exception as e:
             logger.error(f"Failed to get balance for {address} on {chain}: {e}")
             return Decimal(0)
     
+    async def _read_balance(
+        self,
+        address: str,
+        chain: str,
+        token_address: Optional[str] = None,
+    ) -> Decimal:
+        """Read one balance, raising on RPC errors."""
+        if token_address is None:
+            # Native token balance
+            result = await rpc_pool.make_request(
+                chain=chain,
+                method="eth_getBalance",
+                params=[address, "latest"]
+            )
+            balance_wei = int(result, 16)
+            return Decimal(balance_wei)
+        
+        # ERC-20 token balance
+        # balanceOf(address) function signature
+        data = "0x70a08231" + address[2:].zfill(64)
+        
+        result = await rpc_pool.make_request(
+            chain=chain,
+            method="eth_call",
+            params=[
+                {
+                    "to": token_address,
+                    "data": data
+                },
+                "latest"
+            ]
+        )
+        
+        balance = int(result, 16) if result != "0x" else 0
+        return Decimal(balance)
+    
     async def get_token_info(
         self,
         token_address: str,
@@ -300,6 +314,19 @@ class EvmClient:
             "name": None,
         }
         
+        # Single block-consistent round trip when Multicall3 is available
+        if multicall_aggregator.supports_chain(chain):
+            try:
+                symbol, decimals, name = await multicall_aggregator.aggregate(
+                    chain, token_metadata_calls(token_address)
+                )
+                token_info["symbol"] = symbol.value if symbol.success else None
+                token_info["decimals"] = decimals.value if decimals.success else None
+                token_info["name"] = name.value if name.success else None
+                return token_info
+            except MulticallError as e:
+                logger.debug(f"Multicall token info failed for {token_address}, falling back: {e}")
+        
         try:
             # Get symbol
             try:
@@ -351,6 +378,59 @@ class EvmClient:
         
         return token_info
     
+    async def get_token_balances(
+        self,
+        address: str,
+        chain: str,
+        token_addresses: List[Optional[str]],
+    ) -> Dict[Optional[str], Decimal]:
+        """
+        Get balances for many tokens in one Multicall3 round trip.
+        
+        Args:
+            address: Wallet address
+            chain: Chain name
+            token_addresses: Token contract addresses (None for native token)
+            
+        Returns:
+            Balance in smallest unit keyed by token address; tokens whose
+            balance could not be read are omitted rather than reported as zero
+        """
+        if not self._initialized:
+            await self.initialize()
+        
+        if not token_addresses:
+            return {}
+        
+        balances: Dict[Optional[str], Decimal] = {}
+        retry: List[Optional[str]] = list(token_addresses)
+        if multicall_aggregator.supports_chain(chain):
+            try:
+                results = await multicall_aggregator.aggregate(
+                    chain,
+                    [balance_call(token, address) for token in token_addresses],
+                )
+                retry = []
+                for token, result in zip(token_addresses, results):
+                    if result.success:
+                        balances[token] = Decimal(result.value)
+                    else:
+                        retry.append(token)
+            except MulticallError as e:
+                logger.debug(f"Multicall balances failed on {chain}, falling back: {e}")
+        
+        # Failed sub-calls (or the whole batch) are retried one by one
+        singles = await asyncio.gather(
+            *[self._read_balance(address, chain, token) for token in retry],
+            return_exceptions=True,
+        )
+        for token, balance in zip(retry, singles):
+            if isinstance(balance, Exception):
+                logger.warning(f"Failed to get balance of {token or 'native'} for {address} on {chain}: {balance}")
+            else:
+                balances[token] = balance
+        return balances
+    
     async def build_transaction(
         self,
         chain: str,
@@ -0,0 +1,428 @@
+"""
+Multicall3 read aggregation for EVM chains.
+
+Packs many contract reads into ``aggregate3`` calls against the canonical
+Multicall3 deployment so a batch of view calls costs one ``eth_call`` and
+every result comes from the same block.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .rpc_pool import RpcPool, rpc_pool
+
+logger = logging.getLogger(__name__)
+
+# Multicall3 is deployed at the same address on every supported EVM chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ADDRESSES: Dict[str, str] = {
+    "ethereum": MULTICALL3_ADDRESS,
+    "bsc": MULTICALL3_ADDRESS,
+    "polygon": MULTICALL3_ADDRESS,
+    "base": MULTICALL3_ADDRESS,
+    "arbitrum": MULTICALL3_ADDRESS,
+}
+
+# Function selectors
+AGGREGATE3_SELECTOR = "82ad56cb"  # aggregate3((address,bool,bytes)[])
+GET_ETH_BALANCE_SELECTOR = "4d2301cc"  # getEthBalance(address)
+ERC20_NAME_SELECTOR = "06fdde03"  # name()
+ERC20_SYMBOL_SELECTOR = "95d89b41"  # symbol()
+ERC20_DECIMALS_SELECTOR = "313ce567"  # decimals()
+ERC20_BALANCE_OF_SELECTOR = "70a08231"  # balanceOf(address)
+ERC20_ALLOWANCE_SELECTOR = "dd62ed3e"  # allowance(address,address)
+PAIR_GET_RESERVES_SELECTOR = "0902f1ac"  # getReserves()
+PAIR_TOKEN0_SELECTOR = "0dfe1681"  # token0()
+PAIR_TOKEN1_SELECTOR = "d21220a7"  # token1()
+
+# Batch sizing limits
+DEFAULT_CALL_GAS = 40_000  # Budget per view call when sizing batches
+MAX_CALLS_PER_BATCH = 500
+MAX_CALLDATA_BYTES = 120_000
+MAX_GAS_PER_BATCH = 25_000_000
+
+_WORD = 32
+
+
+class MulticallError(Exception):
+    """Raised when a Multicall3 aggregate call fails as a whole."""
+    pass
+
+
+@dataclass
+class MulticallCall:
+    """Single contract read to include in an aggregate call."""
+    target: str
+    call_data: str
+    decoder: Optional[Callable[[bytes], Any]] = None
+    allow_failure: bool = True
+    gas_estimate: int = DEFAULT_CALL_GAS
+
+
+@dataclass
+class MulticallResult:
+    """Outcome of a single aggregated read."""
+    success: bool
+    value: Any = None
+    return_data: bytes = b""
+    error: Optional[str] = None
+
+
+# ---------------------------------------------------------------------------
+# ABI helpers
+# ---------------------------------------------------------------------------
+
+def encode_address(address: str) -> str:
+    """Encode an address as a 32-byte ABI word (hex, no prefix)."""
+    return address.lower().replace("0x", "").zfill(64)
+
+
+def encode_uint(value: int) -> str:
+    """Encode an unsigned integer as a 32-byte ABI word (hex, no prefix)."""
+    return format(value, "064x")
+
+
+def encode_int(value: int) -> str:
+    """Encode a signed integer as a 32-byte two's complement ABI word."""
+    return format(value % (1 << 256), "064x")
+
+
+def encode_call(selector: str, *words: str) -> str:
+    """Build calldata from a selector and pre-encoded static words."""
+    return "0x" + selector.replace("0x", "") + "".join(words)
+
+
+def _read_word(data: bytes, offset: int) -> int:
+    """Read a 32-byte big-endian word as an integer."""
+    return int.from_bytes(data[offset:offset + _WORD], "big")
+
+
+def _pad32(data: bytes) -> bytes:
+    """Right-pad bytes to a multiple of 32."""
+    remainder = len(data) % _WORD
+    if remainder:
+        data += b"\x00" * (_WORD - remainder)
+    return data
+
+
+def decode_uint(data: bytes) -> int:
+    """Decode a uint256 return value."""
+    if len(data) < _WORD:
+        raise ValueError("Return data too short for uint256")
+    return _read_word(data, 0)
+
+
+def decode_int(data: bytes, offset: int = 0) -> int:
+    """Decode a signed (two's complement) integer word."""
+    if len(data) < offset + _WORD:
+        raise ValueError("Return data too short for int256")
+    value = _read_word(data, offset)
+    return value - (1 << 256) if value >> 255 else value
+
+
+def decode_bool(data: bytes) -> bool:
+    """Decode a bool return value."""
+    return decode_uint(data) != 0
+
+
+def decode_address(data: bytes) -> str:
+    """Decode an address return value (lowercase hex)."""
+    if len(data) < _WORD:
+        raise ValueError("Return data too short for address")
+    return "0x" + data[12:_WORD].hex()
+
+
+def decode_string(data: bytes) -> str:
+    """
+    Decode a string return value.
+
+    Handles both ABI dynamic strings and legacy ``bytes32`` strings
+    (e.g. MKR-style tokens).
+    """
+    if len(data) >= 3 * _WORD and _read_word(data, 0) == _WORD:
+        length = _read_word(data, _WORD)
+        raw = data[2 * _WORD:2 * _WORD + length]
+    else:
+        raw = data[:_WORD]
+    return raw.decode("utf-8", errors="ignore").strip("\x00")
+
+
+def decode_reserves(data: bytes) -> Tuple[int, int, int]:
+    """Decode a V2 pair ``getReserves()`` return value."""
+    if len(data) < 3 * _WORD:
+        raise ValueError("Return data too short for getReserves")
+    return _read_word(data, 0), _read_word(data, _WORD), _read_word(data, 2 * _WORD)
+
+
+def encode_aggregate3(calls: List[MulticallCall]) -> str:
+    """Encode ``aggregate3`` calldata for a list of calls."""
+    encoded_items: List[bytes] = []
+    for call in calls:
+        call_bytes = bytes.fromhex(call.call_data.replace("0x", ""))
+        item = (
+            bytes.fromhex(encode_address(call.target))
+            + (1 if call.allow_failure else 0).to_bytes(_WORD, "big")
+            + (3 * _WORD).to_bytes(_WORD, "big")
+            + len(call_bytes).to_bytes(_WORD, "big")
+            + _pad32(call_bytes)
+        )
+        encoded_items.append(item)
+
+    # Offsets are relative to the start of the array body (after length)
+    offsets: List[bytes] = []
+    position = len(calls) * _WORD
+    for item in encoded_items:
+        offsets.append(position.to_bytes(_WORD, "big"))
+        position += len(item)
+
+    body = (
+        _WORD.to_bytes(_WORD, "big")
+        + len(calls).to_bytes(_WORD, "big")
+        + b"".join(offsets)
+        + b"".join(encoded_items)
+    )
+    return "0x" + AGGREGATE3_SELECTOR + body.hex()
+
+
+def decode_aggregate3(data: bytes) -> List[Tuple[bool, bytes]]:
+    """Decode the ``(bool success, bytes returnData)[]`` result of ``aggregate3``."""
+    if len(data) < 2 * _WORD:
+        raise MulticallError("Empty aggregate3 response (is Multicall3 deployed?)")
+
+    array_start = _read_word(data, 0)
+    count = _read_word(data, array_start)
+    body_start = array_start + _WORD
+
+    results: List[Tuple[bool, bytes]] = []
+    for index in range(count):
+        item_start = body_start + _read_word(data, body_start + index * _WORD)
+        success = _read_word(data, item_start) != 0
+        bytes_start = item_start + _read_word(data, item_start + _WORD)
+        length = _read_word(data, bytes_start)
+        return_data = data[bytes_start + _WORD:bytes_start + _WORD + length]
+        results.append((success, return_data))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Aggregator
+# ---------------------------------------------------------------------------
+
+class MulticallAggregator:
+    """
+    Aggregates contract reads into block-consistent Multicall3 calls.
+
+    Calls are split into chunks that respect per-batch call count, calldata
+    size and gas limits. All chunks of one ``aggregate`` are pinned to the
+    same block and dispatched concurrently, so the RPC pool can coalesce
+    them into a single HTTP round trip.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[RpcPool] = None,
+        max_calls_per_batch: int = MAX_CALLS_PER_BATCH,
+        max_calldata_bytes: int = MAX_CALLDATA_BYTES,
+        max_gas_per_batch: int = MAX_GAS_PER_BATCH,
+    ) -> None:
+        """Initialize aggregator."""
+        self.pool = pool or rpc_pool
+        self.max_calls_per_batch = max_calls_per_batch
+        self.max_calldata_bytes = max_calldata_bytes
+        self.max_gas_per_batch = max_gas_per_batch
+
+    def supports_chain(self, chain: str) -> bool:
+        """Check whether Multicall3 is known to be deployed on a chain."""
+        return chain in MULTICALL3_ADDRESSES
+
+    async def aggregate(
+        self,
+        chain: str,
+        calls: List[MulticallCall],
+        block_identifier: str = "latest",
+    ) -> List[MulticallResult]:
+        """
+        Execute calls through Multicall3 and decode each result.
+
+        Args:
+            chain: Chain name
+            calls: Contract reads to aggregate
+            block_identifier: Block tag or hex block number
+
+        Returns:
+            Results in the same order as ``calls``
+
+        Raises:
+            MulticallError: If an aggregate call fails as a whole
+        """
+        if not calls:
+            return []
+
+        multicall_address = MULTICALL3_ADDRESSES.get(chain)
+        if multicall_address is None:
+            raise MulticallError(f"Multicall3 not available on chain: {chain}")
+
+        chunks = self._chunk_calls(calls)
+
+        # Pin every chunk to one block so results are mutually consistent
+        if len(chunks) > 1 and block_identifier in ("latest", "pending"):
+            block_identifier = await self.pool.make_request(
+                chain=chain, method="eth_blockNumber", params=[]
+            )
+
+        chunk_results = await asyncio.gather(*[
+            self._execute_chunk(chain, multicall_address, chunk, block_identifier)
+            for chunk in chunks
+        ])
+
+        results = [result for chunk in chunk_results for result in chunk]
+
+        logger.debug(
+            f"Multicall aggregated {len(calls)} calls in {len(chunks)} batches on {chain}",
+            extra={'extra_data': {
+                'chain': chain,
+                'call_count': len(calls),
+                'batch_count': len(chunks),
+                'block': block_identifier
+            }}
+        )
+
+        return results
+
+    def _chunk_calls(self, calls: List[MulticallCall]) -> List[List[MulticallCall]]:
+        """Split calls into batches respecting count, calldata and gas limits."""
+        chunks: List[List[MulticallCall]] = []
+        current: List[MulticallCall] = []
+        current_bytes = 0
+        current_gas = 0
+
+        for call in calls:
+            # Tuple head + target/flag/offset/length words + padded calldata
+            call_bytes = 5 * _WORD + len(_pad32(bytes.fromhex(call.call_data.replace("0x", ""))))
+            if current and (
+                len(current) >= self.max_calls_per_batch
+                or current_bytes + call_bytes > self.max_calldata_bytes
+                or current_gas + call.gas_estimate > self.max_gas_per_batch
+            ):
+                chunks.append(current)
+                current, current_bytes, current_gas = [], 0, 0
+
+            current.append(call)
+            current_bytes += call_bytes
+            current_gas += call.gas_estimate
+
+        if current:
+            chunks.append(current)
+        return chunks
+
+    async def _execute_chunk(
+        self,
+        chain: str,
+        multicall_address: str,
+        calls: List[MulticallCall],
+        block_identifier: str,
+    ) -> List[MulticallResult]:
+        """Execute one aggregate3 call and decode its results."""
+        try:
+            raw = await self.pool.make_request(
+                chain=chain,
+                method="eth_call",
+                params=[
+                    {"to": multicall_address, "data": encode_aggregate3(calls)},
+                    block_identifier,
+                ],
+            )
+        except Exception as e:
+            raise MulticallError(f"aggregate3 call failed on {chain}: {e}") from e
+
+        if not raw or raw == "0x":
+            raise MulticallError(f"Empty aggregate3 response on {chain}")
+
+        decoded = decode_aggregate3(bytes.fromhex(raw[2:]))
+        if len(decoded) != len(calls):
+            raise MulticallError(
+                f"aggregate3 returned {len(decoded)} results for {len(calls)} calls"
+            )
+
+        results: List[MulticallResult] = []
+        for call, (success, return_data) in zip(calls, decoded):
+            if not success:
+                results.append(MulticallResult(
+                    success=False, return_data=return_data, error="call reverted"
+                ))
+                continue
+
+            if call.decoder is None:
+                results.append(MulticallResult(
+                    success=True, value=return_data, return_data=return_data
+                ))
+                continue
+
+            try:
+                value = call.decoder(return_data)
+            except Exception as e:
+                results.append(MulticallResult(
+                    success=False, return_data=return_data, error=f"decode failed: {e}"
+                ))
+            else:
+                results.append(MulticallResult(
+                    success=True, value=value, return_data=return_data
+                ))
+
+        return results
+
+
+# ---------------------------------------------------------------------------
+# Common call builders
+# ---------------------------------------------------------------------------
+
+def token_metadata_calls(token_address: str) -> List[MulticallCall]:
+    """Build symbol/decimals/name reads for a token."""
+    return [
+        MulticallCall(token_address, encode_call(ERC20_SYMBOL_SELECTOR), decode_string),
+        MulticallCall(token_address, encode_call(ERC20_DECIMALS_SELECTOR), decode_uint),
+        MulticallCall(token_address, encode_call(ERC20_NAME_SELECTOR), decode_string),
+    ]
+
+
+def balance_call(token_address: Optional[str], owner_address: str) -> MulticallCall:
+    """Build a balance read; ``None`` token reads the native balance."""
+    if token_address is None:
+        return MulticallCall(
+            MULTICALL3_ADDRESS,
+            encode_call(GET_ETH_BALANCE_SELECTOR, encode_address(owner_address)),
+            decode_uint,
+        )
+    return MulticallCall(
+        token_address,
+        encode_call(ERC20_BALANCE_OF_SELECTOR, encode_address(owner_address)),
+        decode_uint,
+    )
+
+
+def allowance_call(token_address: str, owner_address: str, spender_address: str) -> MulticallCall:
+    """Build an ERC-20 allowance read."""
+    return MulticallCall(
+        token_address,
+        encode_call(
+            ERC20_ALLOWANCE_SELECTOR,
+            encode_address(owner_address),
+            encode_address(spender_address),
+        ),
+        decode_uint,
+    )
+
+
+def pair_state_calls(pair_address: str) -> List[MulticallCall]:
+    """Build getReserves/token0 reads for a V2-style pair."""
+    return [
+        MulticallCall(pair_address, encode_call(PAIR_GET_RESERVES_SELECTOR), decode_reserves),
+        MulticallCall(pair_address, encode_call(PAIR_TOKEN0_SELECTOR), decode_address),
+    ]
+
+
+# Global aggregator instance
+multicall_aggregator = MulticallAggregator()
@@ -0,0 +1,300 @@
+"""
+Block-scoped RPC response cache with single-flight deduplication.
+
+Sits in front of ``RpcPool.make_request`` and classifies each call as
+immutable (cached until evicted), block-scoped (valid until the chain head
+advances) or uncacheable. Identical requests already in flight share one
+upstream call.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class CachePolicy(Enum):
+    """How long an RPC response may be reused."""
+    IMMUTABLE = "immutable"
+    BLOCK = "block"
+    UNCACHEABLE = "uncacheable"
+
+
+# Methods whose answer never changes for a chain
+IMMUTABLE_METHODS = frozenset({
+    "eth_chainId",
+    "net_version",
+})
+
+# Methods whose answer is fixed for a given head block. Nonces and gas
+# estimates are left out: two sends from one wallet inside a block must not
+# reuse them.
+BLOCK_SCOPED_METHODS = frozenset({
+    "eth_call",
+    "eth_getBalance",
+    "eth_getCode",
+    "eth_getStorageAt",
+    "eth_gasPrice",
+    "eth_maxPriorityFeePerGas",
+    "eth_feeHistory",
+})
+
+# View functions whose return value is fixed once the contract exists
+IMMUTABLE_CALL_SELECTORS = frozenset({
+    "0x313ce567",  # decimals()
+    "0x95d89b41",  # symbol()
+    "0x06fdde03",  # name()
+    "0x0dfe1681",  # token0()
+    "0xd21220a7",  # token1()
+    "0xc45a0155",  # factory()
+    "0xe6a43905",  # getPair(address,address)
+    "0x1698ee82",  # getPool(address,address,uint24)
+    "0xddca3f43",  # fee()
+    "0xd0c93a7c",  # tickSpacing()
+})
+
+# Block tags that make a call depend on mempool state
+UNCACHEABLE_BLOCK_TAGS = frozenset({"pending"})
+
+# Approximate block times, bounding block-scoped entries when no new-head
+# notification arrives
+CHAIN_BLOCK_TIMES: Dict[str, float] = {
+    "ethereum": 12.0,
+    "bsc": 3.0,
+    "polygon": 2.0,
+    "base": 2.0,
+    "arbitrum": 0.25,
+}
+DEFAULT_BLOCK_TIME = 2.0
+
+_EMPTY_RESULTS = frozenset({
+    "0x",
+    "0x" + "0" * 64,
+})
+
+
+class RpcResponseCache:
+    """
+    Cache for JSON-RPC responses keyed by (chain, method, params, block).
+
+    Immutable entries live in a bounded LRU. Block-scoped entries are keyed
+    by the last observed head and dropped when it advances (or after about
+    one block time if no head is observed).
+    """
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        """Initialize cache."""
+        self.max_entries = max_entries
+        self._immutable: "OrderedDict[Tuple, Any]" = OrderedDict()
+        self._block: Dict[str, Dict[Tuple, Tuple[Any, float]]] = {}
+        self._heads: Dict[str, int] = {}
+        self._inflight: Dict[Tuple, asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    # ------------------------------------------------------------------
+    # Classification
+    # ------------------------------------------------------------------
+
+    def classify(self, method: str, params: List) -> CachePolicy:
+        """
+        Classify an RPC call for caching.
+
+        Args:
+            method: RPC method name
+            params: RPC parameters
+
+        Returns:
+            Cache policy for the call
+        """
+        if method in IMMUTABLE_METHODS:
+            return CachePolicy.IMMUTABLE
+
+        if method not in BLOCK_SCOPED_METHODS:
+            return CachePolicy.UNCACHEABLE
+
+        if any(isinstance(param, str) and param in UNCACHEABLE_BLOCK_TAGS for param in params):
+            return CachePolicy.UNCACHEABLE
+
+        if method == "eth_call" and params and isinstance(params[0], dict):
+            data = params[0].get("data") or params[0].get("input") or ""
+            if data[:10].lower() in IMMUTABLE_CALL_SELECTORS:
+                return CachePolicy.IMMUTABLE
+
+        return CachePolicy.BLOCK
+
+    # ------------------------------------------------------------------
+    # Lookup and storage
+    # ------------------------------------------------------------------
+
+    def _make_key(self, chain: str, method: str, params: List) -> Tuple:
+        """Build a stable cache key."""
+        return chain, method, json.dumps(params, sort_keys=True, default=str)
+
+    def get(self, chain: str, method: str, params: List, policy: CachePolicy) -> Tuple[bool, Any]:
+        """
+        Look up a cached response.
+
+        Returns:
+            Tuple of (hit, value)
+        """
+        key = self._make_key(chain, method, params)
+
+        if policy is CachePolicy.IMMUTABLE:
+            if key in self._immutable:
+                self._immutable.move_to_end(key)
+                return True, self._immutable[key]
+            return False, None
+
+        if policy is CachePolicy.BLOCK:
+            entries = self._block.get(chain)
+            entry = entries.get(key + (self._heads.get(chain),)) if entries else None
+            if entry is not None:
+                value, expires_at = entry
+                if time.monotonic() < expires_at:
+                    return True, value
+                del entries[key + (self._heads.get(chain),)]
+
+        return False, None
+
+    def put(
+        self,
+        chain: str,
+        method: str,
+        params: List,
+        policy: CachePolicy,
+        value: Any,
+        head: Optional[int] = None,
+    ) -> None:
+        """
+        Store a response according to its policy.
+
+        Block-scoped responses are stored under ``head``, the chain head
+        observed when the request was issued; if the head has advanced since,
+        the entry is simply never read.
+        """
+        if value is None:
+            return
+
+        key = self._make_key(chain, method, params)
+
+        if policy is CachePolicy.IMMUTABLE:
+            # Empty results may become valid once the contract is deployed
+            if isinstance(value, str) and value.lower() in _EMPTY_RESULTS:
+                return
+            self._immutable[key] = value
+            self._immutable.move_to_end(key)
+            while len(self._immutable) > self.max_entries:
+                self._immutable.popitem(last=False)
+            return
+
+        if policy is CachePolicy.BLOCK:
+            entries = self._block.setdefault(chain, {})
+            if len(entries) >= self.max_entries:
+                entries.clear()
+            ttl = CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+            entries[key + (head,)] = (value, time.monotonic() + ttl)
+
+    async def get_or_fetch(
+        self,
+        chain: str,
+        method: str,
+        params: List,
+        policy: CachePolicy,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return a cached response or fetch it once for all concurrent callers.
+
+        Args:
+            chain: Chain name
+            method: RPC method name
+            params: RPC parameters
+            policy: Cache policy from ``classify``
+            fetch: Coroutine factory performing the upstream request
+
+        Returns:
+            RPC result
+        """
+        hit, value = self.get(chain, method, params, policy)
+        if hit:
+            self.hits += 1
+            return value
+
+        head = self._heads.get(chain)
+        inflight_key = self._make_key(chain, method, params) + (head,)
+        task = self._inflight.get(inflight_key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        self.misses += 1
+
+        async def _fetch_and_store() -> Any:
+            result = await fetch()
+            self.put(chain, method, params, policy, result, head)
+            return result
+
+        task = asyncio.create_task(_fetch_and_store())
+        self._inflight[inflight_key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(inflight_key, None))
+
+        # Shield so one cancelled caller does not fail the others
+        return await asyncio.shield(task)
+
+    # ------------------------------------------------------------------
+    # Invalidation
+    # ------------------------------------------------------------------
+
+    def observe_head(self, chain: str, block_number: int) -> None:
+        """
+        Record the chain head, dropping block-scoped entries when it advances.
+
+        Args:
+            chain: Chain name
+            block_number: Latest block number
+        """
+        current = self._heads.get(chain)
+        if current is not None and block_number <= current:
+            return
+
+        self._heads[chain] = block_number
+        entries = self._block.get(chain)
+        if entries:
+            self.invalidations += len(entries)
+            entries.clear()
+
+    def clear(self, chain: Optional[str] = None) -> None:
+        """Clear cached entries for one chain or all chains."""
+        if chain is None:
+            self._immutable.clear()
+            self._block.clear()
+            return
+
+        for key in [key for key in self._immutable if key[0] == chain]:
+            del self._immutable[key]
+        self._block.pop(chain, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache hit/miss statistics."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": round((self.hits + self.coalesced) / lookups, 3) if lookups else 0.0,
+            "invalidations": self.invalidations,
+            "immutable_entries": len(self._immutable),
+            "block_entries": sum(len(entries) for entries in self._block.values()),
+            "inflight": len(self._inflight),
+            "heads": dict(self._heads),
+        }
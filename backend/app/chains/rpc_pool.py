@@ -4,20 +4,47 @@ Enhanced RPC Pool Manager with proper circuit breaker integration.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import httpx
 from httpx import AsyncClient
 
 from ..core.settings import settings
+from ..monitoring.latency import LatencyHistogram
 from .circuit_breaker import CircuitBreaker, CircuitState
+from .rpc_cache import CachePolicy, RpcResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Methods that must never wait in a coalescing window or share a payload
+UNBATCHABLE_METHODS = frozenset({
+    "eth_sendRawTransaction",
+    "eth_sendTransaction",
+    "eth_subscribe",
+    "eth_unsubscribe",
+})
+
+# Latency-critical methods eligible for hedged (raced) requests
+HEDGED_METHODS = frozenset({
+    "eth_call",
+    "eth_sendRawTransaction",
+    "eth_getTransactionReceipt",
+})
+
+# Pseudo-method under which coalesced batch latency is tracked
+BATCH_METHOD = "batch"
+
+# Samples needed before latency percentiles are trusted
+MIN_LATENCY_SAMPLES = 5
+
+# Score bonus for primary providers, worth ~1s of blended latency
+PRIMARY_PROVIDER_BONUS = 100.0
+
 
 class ProviderStatus(Enum):
     """RPC provider status."""
@@ -48,6 +75,102 @@ class ProviderMetrics:
     last_request_time: float = 0.0
     last_success_time: float = 0.0
     status: ProviderStatus = ProviderStatus.HEALTHY
+    batch_requests: int = 0
+    batched_calls: int = 0
+
+
+@dataclass
+class PendingRpcCall:
+    """JSON-RPC call waiting in a batch window."""
+    request_id: int
+    method: str
+    params: List
+    max_retries: int
+    future: asyncio.Future = field(repr=False)
+
+
+class RpcBatcher:
+    """
+    Coalesces concurrent JSON-RPC calls for one chain into array payloads.
+
+    Calls submitted within ``window_ms`` of the first pending call (or until
+    ``max_batch_size`` calls are pending) are sent as a single HTTP POST and
+    the responses are demultiplexed back to callers by JSON-RPC id.
+    """
+
+    def __init__(
+        self,
+        pool: "RpcPool",
+        chain: str,
+        window_ms: float,
+        max_batch_size: int,
+    ) -> None:
+        """Initialize batcher for a chain."""
+        self.pool = pool
+        self.chain = chain
+        self.window_seconds = max(window_ms, 0.0) / 1000
+        self.max_batch_size = max(max_batch_size, 1)
+        self._pending: List[PendingRpcCall] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, method: str, params: List, max_retries: int) -> Any:
+        """
+        Queue a call for the next batch and wait for its result.
+
+        Args:
+            method: RPC method name
+            params: RPC parameters
+            max_retries: Retry budget for this call if the batch fails
+
+        Returns:
+            RPC result for this call
+        """
+        loop = asyncio.get_running_loop()
+        call = PendingRpcCall(
+            request_id=self.pool.next_request_id(),
+            method=method,
+            params=params,
+            max_retries=max_retries,
+            future=loop.create_future(),
+        )
+        self._pending.append(call)
+
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._flush_handle is None:
+            if self.window_seconds > 0:
+                self._flush_handle = loop.call_later(self.window_seconds, self.flush)
+            else:
+                # Coalesce everything submitted within the current loop tick
+                self._flush_handle = loop.call_soon(self.flush)
+
+        return await call.future
+
+    def flush(self) -> None:
+        """Send all pending calls as one batch."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if not self._pending:
+            return
+
+        calls, self._pending = self._pending, []
+        task = asyncio.create_task(self.pool._execute_batch(self.chain, calls))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def close(self) -> None:
+        """Flush pending calls and wait for in-flight batches."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of calls waiting for the next flush."""
+        return len(self._pending)
 
 
 class RpcPool:
@@ -64,6 +187,20 @@ class RpcPool:
         self.metrics: Dict[str, ProviderMetrics] = {}
         self.circuit_breakers: Dict[str, CircuitBreaker] = {}
         self.client: Optional[AsyncClient] = None
+        self.batch_enabled = settings.rpc_batch_enabled
+        self.batch_window_ms = settings.rpc_batch_window_ms
+        self.batch_max_size = settings.rpc_batch_max_size
+        self._batchers: Dict[str, RpcBatcher] = {}
+        self._request_ids = itertools.count(1)
+        self.hedge_enabled = settings.rpc_hedge_enabled
+        self.hedge_min_delay_ms = settings.rpc_hedge_min_delay_ms
+        self.hedge_max_delay_ms = settings.rpc_hedge_max_delay_ms
+        self.hedge_default_delay_ms = settings.rpc_hedge_default_delay_ms
+        self.latency: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self.cache_enabled = settings.rpc_cache_enabled
+        self.response_cache = RpcResponseCache(max_entries=settings.rpc_cache_max_entries)
+        self.hedge_legs: Dict[str, int] = {}
+        self.hedge_wins: Dict[str, int] = {}
         self._initialized = False
     
     async def initialize(self) -> None:
@@ -90,6 +227,10 @@ class RpcPool:
     
     async def close(self) -> None:
         """Close RPC pool and cleanup resources."""
+        for batcher in self._batchers.values():
+            await batcher.close()
+        self._batchers.clear()
+        
         if self.client:
             await self.client.aclose()
         self._initialized = False
@@ -143,12 +284,19 @@ class RpcPool:
 
 
 
-    async def get_best_provider(self, chain: str) -> Optional[RpcProvider]:
+    async def get_best_provider(
+        self,
+        chain: str,
+        method: Optional[str] = None,
+        exclude: Optional[Set[str]] = None,
+    ) -> Optional[RpcProvider]:
         """
         Get the best available provider for a chain.
         
         Args:
             chain: Blockchain name
+            method: RPC method, to rank by that method's latency profile
+            exclude: Provider names to skip (e.g. the leg already in flight)
             
         Returns:
             Best available provider or None
@@ -168,6 +316,9 @@ class RpcPool:
         available_providers = []
         
         for provider in providers:
+            if exclude and provider.name in exclude:
+                continue
+            
             provider_key = f"{chain}:{provider.name}"
             metrics = self.metrics[provider_key]
             circuit_breaker = self.circuit_breakers[provider_key]
@@ -185,10 +336,12 @@ class RpcPool:
                 continue
             
             # Calculate provider score (lower is better)
-            score = self._calculate_provider_score(provider, metrics)
+            score = self._calculate_provider_score(provider, metrics, method)
             available_providers.append((score, provider))
         
         if not available_providers:
+            if exclude:
+                return None
             logger.error(
                 f"No healthy providers available for chain: {chain}",
                 extra={'extra_data': {'chain': chain}}
@@ -209,21 +362,31 @@ class RpcPool:
         )
         return best_provider
     
-    def _calculate_provider_score(self, provider: RpcProvider, metrics: ProviderMetrics) -> float:
+    def _calculate_provider_score(
+        self,
+        provider: RpcProvider,
+        metrics: ProviderMetrics,
+        method: Optional[str] = None,
+    ) -> float:
         """Calculate provider priority score (lower is better)."""
         score = 0.0
         
-        # Primary providers get huge boost
+        # Primary providers are preferred unless clearly slower
         if provider.is_primary:
-            score -= 1000.0
+            score -= PRIMARY_PROVIDER_BONUS
         
         # Factor in success rate
         if metrics.total_requests > 0:
             success_rate = metrics.successful_requests / metrics.total_requests
             score += (1 - success_rate) * 100
         
-        # Factor in average response time
-        score += metrics.avg_response_time_ms / 10
+        # Factor in response time, weighting the tail over the median
+        histogram = self._get_latency_histogram(f"{provider.chain}:{provider.name}", method)
+        if histogram is not None:
+            latency_ms = 0.4 * histogram.percentile(0.50) + 0.6 * histogram.percentile(0.95)
+        else:
+            latency_ms = metrics.avg_response_time_ms
+        score += latency_ms / 10
         
         # Penalize providers that haven't been successful recently
         now = time.time()
@@ -241,6 +404,9 @@ class RpcPool:
         params: List = None,
         provider: Optional[RpcProvider] = None,
         max_retries: int = 2,
+        batch: Optional[bool] = None,
+        hedge: Optional[bool] = None,
+        cache: Optional[bool] = None,
     ) -> any:
         """
         Make RPC request with automatic failover and circuit breaker protection.
@@ -251,6 +417,10 @@ class RpcPool:
             params: RPC parameters
             provider: Specific provider to use (optional)
             max_retries: Maximum retry attempts across providers
+            batch: Coalesce into a JSON-RPC batch (None uses pool default)
+            hedge: Race a second provider if the first is slow (None hedges
+                latency-critical methods when no provider is pinned)
+            cache: Serve from the response cache (None uses pool default)
             
         Returns:
             RPC response data
@@ -264,13 +434,40 @@ class RpcPool:
         if params is None:
             params = []
         
+        if provider is None and (cache if cache is not None else self.cache_enabled):
+            if method == "eth_blockNumber":
+                result = await self.make_request(
+                    chain, method, params, max_retries=max_retries,
+                    batch=batch, hedge=hedge, cache=False,
+                )
+                self.notify_new_head(chain, int(result, 16))
+                return result
+            
+            policy = self.response_cache.classify(method, params)
+            if policy is not CachePolicy.UNCACHEABLE:
+                return await self.response_cache.get_or_fetch(
+                    chain,
+                    method,
+                    params,
+                    policy,
+                    lambda: self.make_request(
+                        chain, method, params, max_retries=max_retries,
+                        batch=batch, hedge=hedge, cache=False,
+                    ),
+                )
+        
+        if provider is None and self._should_batch(method, batch):
+            return await self._get_batcher(chain).submit(method, params, max_retries)
+        
+        use_hedge = provider is None and self._should_hedge(method, hedge)
+        
         last_exception = None
         attempt = 0
         
         while attempt <= max_retries:
             # Get provider if not specified
             if provider is None:
-                provider = await self.get_best_provider(chain)
+                provider = await self.get_best_provider(chain, method)
                 if provider is None:
                     raise Exception(f"No providers available for chain: {chain}")
             
@@ -297,10 +494,19 @@ class RpcPool:
                 circuit_breaker.record_probe_attempt()
             
             try:
-                result = await self._execute_request(provider, method, params)
-                
-                # Record success
-                self._record_success(provider_key, metrics, circuit_breaker)
+                if use_hedge:
+                    # Legs record their own success/failure
+                    provider, result = await self._execute_hedged(
+                        chain,
+                        provider,
+                        method,
+                        lambda leg: self._execute_request(leg, method, params),
+                    )
+                else:
+                    result = await self._execute_request(provider, method, params)
+                    
+                    # Record success
+                    self._record_success(provider_key, metrics, circuit_breaker)
                 
                 logger.debug(
                     f"RPC request successful: {method} on {provider.name}",
@@ -318,7 +524,8 @@ class RpcPool:
                 last_exception = e
                 
                 # Record failure
-                self._record_failure(provider_key, metrics, circuit_breaker, str(e))
+                if not use_hedge:
+                    self._record_failure(provider_key, metrics, circuit_breaker, str(e))
                 
                 logger.warning(
                     f"RPC request failed: {method} on {provider.name}: {e}",
@@ -348,13 +555,229 @@ class RpcPool:
         
         raise Exception(f"All providers failed for {chain}: {last_exception}")
     
+    def notify_new_head(self, chain: str, block_number: int) -> None:
+        """
+        Advance the known chain head, invalidating block-scoped cache entries.
+        
+        Args:
+            chain: Blockchain name
+            block_number: Latest block number
+        """
+        self.response_cache.observe_head(chain, block_number)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get response cache hit/miss statistics."""
+        return {"enabled": self.cache_enabled, **self.response_cache.get_stats()}
+    
+    def next_request_id(self) -> int:
+        """Allocate a JSON-RPC request id unique within this pool."""
+        return next(self._request_ids)
+    
+    def _should_batch(self, method: str, batch: Optional[bool]) -> bool:
+        """Decide whether a request goes through the chain batcher."""
+        if method in UNBATCHABLE_METHODS:
+            return False
+        if batch is None:
+            return self.batch_enabled
+        return batch
+    
+    def _get_batcher(self, chain: str) -> RpcBatcher:
+        """Get or create the batcher for a chain."""
+        batcher = self._batchers.get(chain)
+        if batcher is None:
+            batcher = RpcBatcher(
+                pool=self,
+                chain=chain,
+                window_ms=self.batch_window_ms,
+                max_batch_size=self.batch_max_size,
+            )
+            self._batchers[chain] = batcher
+        return batcher
+    
+    async def _execute_batch(self, chain: str, calls: List[PendingRpcCall]) -> None:
+        """
+        Send coalesced calls as one JSON-RPC array and resolve each caller.
+        
+        The batch counts as a single request for provider metrics and the
+        circuit breaker. Per-item RPC errors fail only their own caller; a
+        transport-level failure falls back to individual requests.
+        """
+        provider = await self.get_best_provider(chain, BATCH_METHOD)
+        if provider is None:
+            error = Exception(f"No providers available for chain: {chain}")
+            for call in calls:
+                if not call.future.done():
+                    call.future.set_exception(error)
+            return
+        
+        provider_key = f"{chain}:{provider.name}"
+        metrics = self.metrics[provider_key]
+        circuit_breaker = self.circuit_breakers[provider_key]
+        
+        use_hedge = self.hedge_enabled and any(call.method in HEDGED_METHODS for call in calls)
+        
+        if not use_hedge and circuit_breaker.state() == CircuitState.HALF_OPEN:
+            circuit_breaker.record_probe_attempt()
+        
+        try:
+            if use_hedge:
+                provider, responses = await self._execute_hedged(
+                    chain,
+                    provider,
+                    BATCH_METHOD,
+                    lambda leg: self._execute_batch_request(leg, calls),
+                )
+                provider_key = f"{chain}:{provider.name}"
+                metrics = self.metrics[provider_key]
+            else:
+                responses = await self._execute_batch_request(provider, calls)
+        except Exception as e:
+            if not use_hedge:
+                self._record_failure(provider_key, metrics, circuit_breaker, str(e))
+            
+            logger.warning(
+                f"RPC batch failed on {provider.name}, falling back to single requests: {e}",
+                extra={'extra_data': {
+                    'provider': provider.name,
+                    'chain': chain,
+                    'batch_size': len(calls),
+                    'error': str(e)
+                }}
+            )
+            
+            for call in calls:
+                if call.max_retries > 0:
+                    self._retry_unbatched(chain, call)
+                elif not call.future.done():
+                    call.future.set_exception(
+                        Exception(f"All providers failed for {chain}: {e}")
+                    )
+            return
+        
+        if not use_hedge:
+            self._record_success(provider_key, metrics, circuit_breaker)
+        metrics.batch_requests += 1
+        metrics.batched_calls += len(calls)
+        
+        logger.debug(
+            f"RPC batch of {len(calls)} calls successful on {provider.name}",
+            extra={'extra_data': {
+                'provider': provider.name,
+                'chain': chain,
+                'batch_size': len(calls)
+            }}
+        )
+        
+        for call in calls:
+            if call.future.done():
+                continue
+            
+            item = responses.get(call.request_id)
+            if item is None:
+                call.future.set_exception(
+                    Exception(f"RPC Error: missing response for {call.method}")
+                )
+            elif "error" in item:
+                call.future.set_exception(Exception(f"RPC Error: {item['error']}"))
+            else:
+                call.future.set_result(item.get("result"))
+    
+    def _retry_unbatched(self, chain: str, call: PendingRpcCall) -> None:
+        """Resolve a call from a failed batch through the single-request path."""
+        async def _retry() -> None:
+            try:
+                result = await self.make_request(
+                    chain=chain,
+                    method=call.method,
+                    params=call.params,
+                    max_retries=call.max_retries - 1,
+                    batch=False,
+                    # The original call holds the cache single-flight entry
+                    cache=False,
+                )
+            except Exception as e:
+                if not call.future.done():
+                    call.future.set_exception(e)
+            else:
+                if not call.future.done():
+                    call.future.set_result(result)
+        
+        batcher = self._get_batcher(chain)
+        task = asyncio.create_task(_retry())
+        batcher._tasks.add(task)
+        task.add_done_callback(batcher._tasks.discard)
+    
+    async def _execute_batch_request(
+        self,
+        provider: RpcProvider,
+        calls: List[PendingRpcCall],
+    ) -> Dict[int, Dict[str, Any]]:
+        """Execute a JSON-RPC array request and index responses by id."""
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": call.method,
+                "params": call.params,
+                "id": call.request_id,
+            }
+            for call in calls
+        ]
+        
+        start_time = time.time()
+        
+        response = await self.client.post(
+            provider.url,
+            json=payload,
+            timeout=provider.timeout_seconds,
+        )
+        
+        response_time_ms = (time.time() - start_time) * 1000
+        
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        
+        data = response.json()
+        
+        # Providers without batch support answer with a single error object
+        if not isinstance(data, list):
+            if isinstance(data, dict) and "error" in data:
+                raise Exception(f"RPC Error: {data['error']}")
+            raise Exception("RPC Error: invalid batch response")
+        
+        self._update_response_time(provider, response_time_ms, BATCH_METHOD)
+        
+        return {
+            item["id"]: item
+            for item in data
+            if isinstance(item, dict) and "id" in item
+        }
+    
+    def _update_response_time(
+        self,
+        provider: RpcProvider,
+        response_time_ms: float,
+        method: Optional[str] = None,
+    ) -> None:
+        """Update the provider's latency histograms and moving average."""
+        provider_key = f"{provider.chain}:{provider.name}"
+        self._record_latency(provider_key, method, response_time_ms)
+        
+        metrics = self.metrics[provider_key]
+        if metrics.avg_response_time_ms == 0:
+            metrics.avg_response_time_ms = response_time_ms
+        else:
+            # Exponential moving average
+            metrics.avg_response_time_ms = (
+                0.8 * metrics.avg_response_time_ms + 0.2 * response_time_ms
+            )
+    
     async def _execute_request(self, provider: RpcProvider, method: str, params: List) -> any:
         """Execute single RPC request to provider."""
         payload = {
             "jsonrpc": "2.0",
             "method": method,
             "params": params,
-            "id": 1,
+            "id": self.next_request_id(),
         }
         
         start_time = time.time()
@@ -376,18 +799,151 @@ class RpcPool:
             raise Exception(f"RPC Error: {data['error']}")
         
         # Update response time metric
-        provider_key = f"{provider.chain}:{provider.name}"
-        metrics = self.metrics[provider_key]
-        if metrics.avg_response_time_ms == 0:
-            metrics.avg_response_time_ms = response_time_ms
-        else:
-            # Exponential moving average
-            metrics.avg_response_time_ms = (
-                0.8 * metrics.avg_response_time_ms + 0.2 * response_time_ms
-            )
+        self._update_response_time(provider, response_time_ms, method)
         
         return data.get("result")
     
+    def _should_hedge(self, method: str, hedge: Optional[bool]) -> bool:
+        """Decide whether a request is raced across two providers."""
+        if hedge is None:
+            return self.hedge_enabled and method in HEDGED_METHODS
+        return hedge
+    
+    def _record_latency(self, provider_key: str, method: Optional[str], latency_ms: float) -> None:
+        """Record a latency sample for a provider overall and per method."""
+        histograms = self.latency.setdefault(provider_key, {})
+        for name in ("all", method):
+            if name is None:
+                continue
+            histogram = histograms.get(name)
+            if histogram is None:
+                histogram = histograms[name] = LatencyHistogram()
+            histogram.record(latency_ms)
+    
+    def _get_latency_histogram(
+        self,
+        provider_key: str,
+        method: Optional[str] = None,
+    ) -> Optional[LatencyHistogram]:
+        """Get the method histogram, falling back to the provider-wide one."""
+        histograms = self.latency.get(provider_key, {})
+        for name in (method, "all"):
+            histogram = histograms.get(name) if name else None
+            if histogram is not None and histogram.count >= MIN_LATENCY_SAMPLES:
+                return histogram
+        return None
+    
+    def _get_hedge_delay(self, provider: RpcProvider, method: str) -> float:
+        """Get the hedge delay in seconds from the provider's p95 latency."""
+        histogram = self._get_latency_histogram(f"{provider.chain}:{provider.name}", method)
+        if histogram is None:
+            delay_ms = self.hedge_default_delay_ms
+        else:
+            delay_ms = histogram.percentile(0.95)
+        delay_ms = min(max(delay_ms, self.hedge_min_delay_ms), self.hedge_max_delay_ms)
+        return delay_ms / 1000
+    
+    async def _execute_hedged(
+        self,
+        chain: str,
+        provider: RpcProvider,
+        method: str,
+        execute: Callable[[RpcProvider], Awaitable[Any]],
+    ) -> Tuple[RpcProvider, Any]:
+        """
+        Run a request on one provider and race a second if it is slow.
+        
+        The hedge leg starts once the first leg exceeds its p95 latency for
+        the method, or immediately if the first leg fails. The first
+        successful leg wins and the other is cancelled; the loser's elapsed
+        time is recorded as a latency sample so slow tails stay visible.
+        
+        Args:
+            chain: Blockchain name
+            provider: Provider for the first leg
+            method: Method name used for latency tracking
+            execute: Coroutine factory performing the request on a provider
+            
+        Returns:
+            Tuple of (winning provider, result)
+            
+        Raises:
+            Exception: Last leg error if every leg failed
+        """
+        legs: Dict[asyncio.Task, Tuple[RpcProvider, float]] = {}
+        probes: Set[asyncio.Task] = set()
+        
+        def start_leg(leg_provider: RpcProvider) -> None:
+            breaker = self.circuit_breakers[f"{chain}:{leg_provider.name}"]
+            task = asyncio.create_task(execute(leg_provider))
+            if breaker.state() == CircuitState.HALF_OPEN:
+                breaker.record_probe_attempt()
+                probes.add(task)
+            legs[task] = (leg_provider, time.time())
+        
+        start_leg(provider)
+        hedge_started = False
+        timeout: Optional[float] = self._get_hedge_delay(provider, method)
+        last_exception: Optional[Exception] = None
+        
+        try:
+            while legs:
+                done, _ = await asyncio.wait(
+                    legs.keys(), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for task in done:
+                    leg_provider, _ = legs.pop(task)
+                    leg_key = f"{chain}:{leg_provider.name}"
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        last_exception = e
+                        self._record_failure(
+                            leg_key, self.metrics[leg_key], self.circuit_breakers[leg_key], str(e)
+                        )
+                        continue
+                    
+                    self._record_success(
+                        leg_key, self.metrics[leg_key], self.circuit_breakers[leg_key]
+                    )
+                    if leg_provider is not provider:
+                        self.hedge_wins[leg_key] = self.hedge_wins.get(leg_key, 0) + 1
+                    return leg_provider, result
+                
+                # First leg is slow or failed: race one more provider
+                if not hedge_started:
+                    hedge_started = True
+                    timeout = None
+                    hedge_provider = await self.get_best_provider(
+                        chain, method, exclude={provider.name}
+                    )
+                    if hedge_provider is not None:
+                        hedge_key = f"{chain}:{hedge_provider.name}"
+                        self.hedge_legs[hedge_key] = self.hedge_legs.get(hedge_key, 0) + 1
+                        logger.debug(
+                            f"Hedging {method} on {chain}: {provider.name} -> {hedge_provider.name}",
+                            extra={'extra_data': {
+                                'method': method,
+                                'chain': chain,
+                                'provider': provider.name,
+                                'hedge_provider': hedge_provider.name
+                            }}
+                        )
+                        start_leg(hedge_provider)
+        finally:
+            # Cancel losers and record how long they had been running
+            now = time.time()
+            for task, (leg_provider, started_at) in legs.items():
+                task.cancel()
+                leg_key = f"{chain}:{leg_provider.name}"
+                self._record_latency(leg_key, method, (now - started_at) * 1000)
+                if task in probes:
+                    # A cancelled half-open probe has no verdict; let the next request probe
+                    self.circuit_breakers[leg_key].release_probe()
+        
+        raise last_exception or Exception(f"All hedged legs failed for {chain}")
+    
     def _record_success(
         self, 
         provider_key: str, 
@@ -463,12 +1019,24 @@ class RpcPool:
                     "success_rate": round(success_rate, 3),
                     "avg_response_time_ms": round(metrics.avg_response_time_ms, 2),
                     "is_primary": provider.is_primary,
+                    "batch_requests": metrics.batch_requests,
+                    "avg_batch_size": (
+                        round(metrics.batched_calls / metrics.batch_requests, 2)
+                        if metrics.batch_requests > 0 else 0.0
+                    ),
                     "last_success_ago_seconds": (
                         round(time.time() - metrics.last_success_time) 
                         if metrics.last_success_time > 0 else None
                     ),
                 }
                 
+                latency = self.latency.get(provider_key, {})
+                provider_health["hedge_legs"] = self.hedge_legs.get(provider_key, 0)
+                provider_health["hedge_wins"] = self.hedge_wins.get(provider_key, 0)
+                provider_health["latency_ms"] = {
+                    name: histogram.snapshot() for name, histogram in latency.items()
+                }
+                
                 if circuit_breaker:
                     provider_health.update(circuit_breaker.snapshot())
                 
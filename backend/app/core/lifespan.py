@@ -193,6 +193,58 @@ async def setup_intelligence_autotrade_bridge(app: FastAPI) -> bool:
         return False
 
 
+async def setup_price_tick_bus(app: FastAPI) -> bool:
+    """
+    Attach price tick bus consumers.
+
+    Producers (reserve mirror, Dexscreener, Jupiter) publish on their own;
+    this wires the anomaly detector, open position marking and the
+    WebSocket prices channel. The order trigger monitor subscribes itself
+    when it starts.
+
+    Args:
+        app: FastAPI application instance
+
+    Returns:
+        bool: True if the bus is operational
+    """
+    try:
+        from ..ai.anomaly_detector import get_anomaly_detector
+        from ..services.price_bus import price_bus
+        from ..storage.repos import PositionRepository
+
+        detector = await get_anomaly_detector()
+        detector.attach_price_bus(price_bus)
+
+        position_repo = PositionRepository()
+
+        async def mark_positions(tick) -> None:
+            await position_repo.update_token_positions_price(
+                tick.token_address, tick.chain, tick.price_usd
+            )
+
+        price_bus.subscribe(
+            "position_marks",
+            mark_positions,
+            accept=lambda tick: tick.price_usd is not None,
+        )
+
+        ws_hub = getattr(app.state, "ws_hub", None)
+        if ws_hub:
+            ws_hub.attach_price_bus(price_bus)
+
+        await price_bus.start()
+        app.state.price_bus = price_bus
+        app.state.price_bus_status = "operational"
+        logger.info("Price tick bus operational")
+        return True
+
+    except Exception as e:
+        logger.error("Failed to set up price tick bus: %s", e)
+        app.state.price_bus_status = f"failed - {str(e)}"
+        return False
+
+
 async def start_live_opportunities_system(app: FastAPI) -> bool:
     """
     Start the live opportunities broadcasting system.
@@ -645,6 +697,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             )
             app.state.bridge_status = "not_available"
 
+        # 9.6 Attach price tick bus consumers
+        try:
+            if not await setup_price_tick_bus(app):
+                startup_warnings.append("Price tick bus setup failed")
+        except Exception as e:  # pragma: no cover - defensive
+            logger.error("Price tick bus setup error: %s", e)
+            startup_warnings.append(f"Price tick bus error: {e}")
+
         # 10. Initialize Event Processor
         try:
             event_processor_success = await initialize_event_processor(app)
@@ -940,6 +1000,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         shutdown_errors.append(f"Solana client shutdown: {e}")
 
+    try:
+        # 8.5 Stop price tick bus consumers before the hub they feed
+        if hasattr(app.state, "price_bus"):
+            await app.state.price_bus.stop()
+            logger.info("Price tick bus stopped successfully")
+    except Exception as e:
+        shutdown_errors.append(f"Price tick bus shutdown: {e}")
+
     try:
         # 9. Stop WebSocket hub
         if hasattr(app.state, "ws_hub"):
@@ -52,6 +52,10 @@ class Settings(BaseSettings):
     ledger_retention_days: int = 730
     log_export_enabled: bool = False
     
+    # Ledger export (streamed in chunks from a server-side cursor)
+    ledger_export_chunk_rows: int = 5000
+    ledger_archive_compression: str = "gzip"  # gzip or zstd (needs zstandard)
+    
     # CRITICAL: Security settings that were missing - causing API router failures
     jwt_secret: str = secrets.token_urlsafe(32)
     encryption_key: str = secrets.token_urlsafe(32)
@@ -95,12 +99,55 @@ class Settings(BaseSettings):
     base_rpc_url: Optional[str] = "https://mainnet.base.org"
     arbitrum_rpc_url: Optional[str] = "https://arb1.arbitrum.io/rpc"
     
+    # WebSocket RPC URLs (eth_subscribe; discovery polls when unset)
+    ethereum_ws_url: Optional[str] = None
+    bsc_ws_url: Optional[str] = None
+    polygon_ws_url: Optional[str] = None
+    base_ws_url: Optional[str] = None
+    arbitrum_ws_url: Optional[str] = None
+    
     # Legacy RPC URL lists (for backward compatibility)
     evm_rpc_urls_ethereum: Optional[str] = None
     evm_rpc_urls_bsc: Optional[str] = None
     evm_rpc_urls_polygon: Optional[str] = None
     sol_rpc_urls: Optional[str] = None
-    
+
+    # RPC batching (JSON-RPC array payloads)
+    rpc_batch_enabled: bool = True
+    rpc_batch_window_ms: float = 0.0  # 0 = coalesce within one event loop tick
+    rpc_batch_max_size: int = 50  # Flush immediately at this many calls
+
+    # RPC hedging (race a second provider for latency-critical calls)
+    rpc_hedge_enabled: bool = True
+    rpc_hedge_min_delay_ms: float = 20.0
+    rpc_hedge_max_delay_ms: float = 1500.0
+    rpc_hedge_default_delay_ms: float = 250.0  # Until p95 data is available
+
+    # RPC response cache (immutable + block-scoped reads)
+    rpc_cache_enabled: bool = True
+    rpc_cache_max_entries: int = 10000
+
+    # Market intelligence result cache (shared across engines)
+    intelligence_cache_enabled: bool = True
+    intelligence_cache_ttl_seconds: float = 60.0  # Served without recomputation
+    intelligence_cache_stale_seconds: float = 300.0  # Then served while refreshing in background
+    intelligence_cache_max_entries: int = 5000
+
+    # DexScreener client (multi-address batches behind a shared rate limit)
+    dexscreener_batch_window_ms: float = 25.0  # Background lookups wait this long to batch
+    dexscreener_requests_per_minute: float = 300.0  # Upstream pair/token endpoint limit
+    dexscreener_burst: int = 5
+    dexscreener_cache_max_entries: int = 5000
+    dexscreener_negative_cache_seconds: float = 60.0  # Lookups that found no pairs
+
+    # Discovery log scanner (eth_getLogs head follower)
+    discovery_poll_interval_ms: float = 500.0
+    discovery_reorg_depth: int = 12  # Blocks re-checked for reorgs each poll
+    discovery_log_chunk_blocks: int = 2000  # Largest eth_getLogs block range
+    discovery_max_backfill_blocks: int = 50000  # Largest gap replayed after downtime
+    discovery_ws_enabled: bool = True  # Use eth_subscribe when a WS URL is set
+    discovery_ws_head_timeout_ms: float = 15000.0  # Poll if no head arrives within this
+
     # API Keys
     coingecko_api_key: Optional[str] = None
     zerox_api_key: Optional[str] = None
@@ -176,6 +223,26 @@ class Settings(BaseSettings):
         
         return []
     
+    def get_ws_url(self, chain: str) -> Optional[str]:
+        """
+        Get the WebSocket RPC URL for a chain.
+        
+        Args:
+            chain: Chain identifier (eth, ethereum, bsc, polygon, base, arbitrum)
+            
+        Returns:
+            WebSocket URL or None if not configured
+        """
+        url_mapping = {
+            "eth": self.ethereum_ws_url,
+            "ethereum": self.ethereum_ws_url,
+            "bsc": self.bsc_ws_url,
+            "polygon": self.polygon_ws_url,
+            "base": self.base_ws_url,
+            "arbitrum": self.arbitrum_ws_url,
+        }
+        return url_mapping.get(chain)
+    
     def generate_development_secrets(self) -> Dict[str, str]:
         """
         Generate development secrets if not provided.
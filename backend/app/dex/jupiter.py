@@ -11,7 +11,7 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
-import logging
+from ..services.price_bus import PriceTick, price_bus
 
 logger = logging.getLogger(__name__)
 
@@ -115,6 +115,14 @@ class JupiterAdapter:
             
             # Calculate price
             price = amount_out / amount_in if amount_in > 0 else Decimal("0")
+            if price > 0:
+                price_bus.publish(PriceTick(
+                    chain=chain,
+                    token_address=token_in,
+                    quote_token=token_out,
+                    price=price,
+                    source=self.dex_name,
+                ))
             
             # Extract routing information
             route_info = self._parse_route_plan(route_plan)
@@ -21,6 +21,10 @@ except ImportError as e:
 
 import logging
 
+from ..chains.contract_calls import ZERO_ADDRESS, contract_caller
+from ..chains.multicall import multicall_aggregator, pair_state_calls
+from .reserve_mirror import DEFAULT_V2_FEE_BPS, V2_FEE_BPS, reserve_mirror
+
 logger = logging.getLogger(__name__)
 
 # Module-level constants
@@ -46,6 +50,8 @@ class PancakeAdapter:
         self.dex_name = dex_name
         self.router_addresses = self._get_router_addresses()
         self.factory_addresses = self._get_factory_addresses()
+        self.fee_bps = V2_FEE_BPS.get(dex_name, DEFAULT_V2_FEE_BPS)
+        self.uses_reserve_mirror = "v3" not in dex_name
         
         # Router ABI for getAmountsOut (V2 style)
         self.router_abi = [
@@ -186,28 +192,33 @@ class PancakeAdapter:
             raise ValueError(f"Chain {chain} not supported by {self.dex_name}")
         
         try:
-            # Get Web3 instance
-            w3 = await self._get_web3_instance(chain, chain_clients)
+            # Read through the pooled async RPC client; a sync Web3 instance
+            # is only needed for chains the pool has no providers for
+            w3 = None
+            if not await contract_caller.supports_chain(chain):
+                w3 = await self._get_web3_instance(chain, chain_clients)
             
             # Get router contract
             router_address = self.router_addresses[chain]
-            router_contract = w3.eth.contract(
-                address=w3.to_checksum_address(router_address),
-                abi=self.router_abi
+            router_contract = (
+                contract_caller.get_contract(w3, router_address, self.router_abi)
+                if w3 is not None else None
             )
             
             # Convert addresses and amount
-            token_in_addr = w3.to_checksum_address(token_in)
-            token_out_addr = w3.to_checksum_address(token_out)
+            token_in_addr = Web3.to_checksum_address(token_in)
+            token_out_addr = Web3.to_checksum_address(token_out)
             amount_in_wei = int(amount_in * Decimal(10**18))
             
             # Get quote using V2 router
             path = [token_in_addr, token_out_addr]
             
-            # Try direct path first
-            quote_result = await self._get_v2_quote(
-                router_contract, amount_in_wei, path
-            )
+            # Try direct path first, locally from mirrored reserves when warm
+            quote_result = self._get_local_v2_quote(chain, amount_in_wei, path)
+            if not quote_result:
+                quote_result = await self._get_v2_quote(
+                    router_contract, amount_in_wei, path, chain
+                )
             
             if not quote_result:
                 # Try routing through WETH/WBNB
@@ -215,7 +226,7 @@ class PancakeAdapter:
                 if weth_address and weth_address.lower() not in [token_in.lower(), token_out.lower()]:
                     path = [token_in_addr, weth_address, token_out_addr]
                     quote_result = await self._get_v2_quote(
-                        router_contract, amount_in_wei, path
+                        router_contract, amount_in_wei, path, chain
                     )
             
             if not quote_result:
@@ -306,27 +317,61 @@ class PancakeAdapter:
         
         return Web3(HTTPProvider(rpc_url))
     
+    def _get_local_v2_quote(
+        self,
+        chain: str,
+        amount_in: int,
+        path: List[str],
+    ) -> Optional[List[int]]:
+        """
+        Get quote from mirrored pair reserves.
+        
+        Args:
+            chain: Blockchain network
+            amount_in: Input amount in wei
+            path: Token address path
+            
+        Returns:
+            List of amounts out for each step in path, or None if any pair
+            is cold or stale
+        """
+        if not self.uses_reserve_mirror:
+            return None
+        
+        local = reserve_mirror.get_amounts_out(
+            chain, self.factory_addresses[chain], path, amount_in
+        )
+        return local[0] if local else None
+    
     async def _get_v2_quote(
         self,
         router_contract: Any,
         amount_in: int,
         path: List[str],
+        chain: str,
     ) -> Optional[List[int]]:
         """
         Get quote using V2 router getAmountsOut.
         
         Args:
-            router_contract: Router contract instance
+            router_contract: Router contract instance (None reads through
+                the async RPC pool)
             amount_in: Input amount in wei
             path: Token address path
+            chain: Blockchain network
             
         Returns:
             List of amounts out for each step in path, or None if failed
         """
         try:
-            result = await asyncio.to_thread(
-                router_contract.functions.getAmountsOut(amount_in, path).call
-            )
+            if router_contract is None:
+                result = await contract_caller.get_amounts_out(
+                    chain, self.router_addresses[chain], amount_in, path
+                )
+            else:
+                result = await asyncio.to_thread(
+                    router_contract.functions.getAmountsOut(amount_in, path).call
+                )
             
             if result and len(result) > 1:
                 return result
@@ -344,6 +389,9 @@ class PancakeAdapter:
     ) -> Optional[str]:
         """Get WETH/WBNB address from router."""
         try:
+            if router_contract is None:
+                weth_address = await contract_caller.weth(chain, self.router_addresses[chain])
+                return Web3.to_checksum_address(weth_address)
             weth_address = await asyncio.to_thread(
                 router_contract.functions.WETH().call
             )
@@ -359,7 +407,7 @@ class PancakeAdapter:
     
     async def _calculate_v2_price_impact(
         self,
-        w3: Web3,
+        w3: Optional[Web3],
         token_in: str,
         token_out: str,
         amount_in: Decimal,
@@ -370,7 +418,7 @@ class PancakeAdapter:
         Calculate price impact for V2 swap using reserves.
         
         Args:
-            w3: Web3 instance
+            w3: Web3 instance (None reads through the async RPC pool)
             token_in: Input token address
             token_out: Output token address
             amount_in: Input amount
@@ -381,36 +429,44 @@ class PancakeAdapter:
             Price impact as decimal (0.05 = 5%)
         """
         try:
-            # Get factory and pair address
             factory_address = self.factory_addresses[chain]
-            factory_contract = w3.eth.contract(
-                address=w3.to_checksum_address(factory_address),
-                abi=self.factory_abi
+            mirrored = (
+                reserve_mirror.get_pair(chain, factory_address, token_in, token_out)
+                if self.uses_reserve_mirror else None
             )
             
-            pair_address = await asyncio.to_thread(
-                factory_contract.functions.getPair(token_in, token_out).call
-            )
-            
-            if pair_address == "0x0000000000000000000000000000000000000000":
-                # No direct pair, return conservative estimate
-                return self._estimate_price_impact_by_size(amount_in)
-            
-            # Get pair contract and reserves
-            pair_contract = w3.eth.contract(
-                address=w3.to_checksum_address(pair_address),
-                abi=self.pair_abi
-            )
-            
-            reserves = await asyncio.to_thread(
-                pair_contract.functions.getReserves().call
-            )
-            reserve0, reserve1 = reserves[0], reserves[1]
-            
-            # Determine which token is token0
-            token0 = await asyncio.to_thread(
-                pair_contract.functions.token0().call
-            )
+            if mirrored is not None:
+                reserve0, reserve1, token0 = mirrored.reserve0, mirrored.reserve1, mirrored.token0
+            else:
+                # Get factory and pair address
+                if w3 is None:
+                    pair_address = await contract_caller.get_pair(
+                        chain, factory_address, token_in, token_out
+                    )
+                else:
+                    factory_contract = contract_caller.get_contract(
+                        w3, factory_address, self.factory_abi
+                    )
+                    pair_address = await asyncio.to_thread(
+                        factory_contract.functions.getPair(token_in, token_out).call
+                    )
+                
+                if pair_address.lower() == ZERO_ADDRESS:
+                    # No direct pair, return conservative estimate
+                    return self._estimate_price_impact_by_size(amount_in)
+                
+                # Get reserves and token order in one round trip
+                reserve0, reserve1, token0 = await self._get_pair_state(
+                    w3, pair_address, chain
+                )
+                
+                # Track the pair so later quotes are served locally
+                if self.uses_reserve_mirror:
+                    token1 = token_out if token0.lower() == token_in.lower() else token_in
+                    reserve_mirror.register_pair(
+                        chain, factory_address, pair_address, token0, token1,
+                        reserve0, reserve1, fee_bps=self.fee_bps,
+                    )
             
             if token0.lower() == token_in.lower():
                 input_reserve = Decimal(reserve0)
@@ -440,6 +496,50 @@ class PancakeAdapter:
             logger.debug(f"V2 price impact calculation failed: {e}")
             return self._estimate_price_impact_by_size(amount_in)
     
+    async def _get_pair_state(
+        self,
+        w3: Optional[Web3],
+        pair_address: str,
+        chain: str,
+    ) -> Tuple[int, int, str]:
+        """
+        Get pair reserves and token0 address.
+        
+        Args:
+            w3: Web3 instance (None reads through the async RPC pool)
+            pair_address: Pair contract address
+            chain: Blockchain network
+            
+        Returns:
+            Tuple of (reserve0, reserve1, token0)
+        """
+        if multicall_aggregator.supports_chain(chain):
+            try:
+                reserves, token0 = await multicall_aggregator.aggregate(
+                    chain, pair_state_calls(pair_address)
+                )
+                if reserves.success and token0.success:
+                    return reserves.value[0], reserves.value[1], token0.value
+            except Exception as e:
+                logger.debug(f"Multicall pair read failed, using direct calls: {e}")
+        
+        if w3 is None:
+            reserves, token0 = await asyncio.gather(
+                contract_caller.get_reserves(chain, pair_address),
+                contract_caller.token0(chain, pair_address),
+            )
+            return reserves[0], reserves[1], token0
+        
+        pair_contract = contract_caller.get_contract(w3, pair_address, self.pair_abi)
+        
+        reserves = await asyncio.to_thread(
+            pair_contract.functions.getReserves().call
+        )
+        token0 = await asyncio.to_thread(
+            pair_contract.functions.token0().call
+        )
+        return reserves[0], reserves[1], token0
+    
     def _estimate_price_impact_by_size(self, amount_in: Decimal) -> Decimal:
         """
         Estimate price impact based on trade size.
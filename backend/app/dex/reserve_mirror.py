@@ -0,0 +1,537 @@
+"""
+Local reserve mirror for Uniswap V2-style pairs.
+
+Keeps an in-memory copy of reserves for pairs the adapters have quoted,
+seeded once through Multicall3 and then kept current from ``Sync`` logs,
+so repeat quotes and price impact are computed locally with constant
+product math instead of router/pair RPC calls.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from ..chains.multicall import (
+    PAIR_GET_RESERVES_SELECTOR,
+    MulticallAggregator,
+    MulticallCall,
+    decode_reserves,
+    encode_call,
+    multicall_aggregator,
+)
+from ..chains.rpc_cache import CHAIN_BLOCK_TIMES, DEFAULT_BLOCK_TIME
+from ..chains.rpc_pool import RpcPool, rpc_pool
+from ..services.price_bus import PriceTick, PriceTickBus, price_bus
+
+logger = logging.getLogger(__name__)
+
+# keccak256("Sync(uint112,uint112)")
+SYNC_TOPIC = "0x1c411e9a96e071241c2f21f7726b17ae89e3cab4c78be50e062b03a9fffbbad1"
+
+# Swap fees in basis points as charged by each router's getAmountsOut
+V2_FEE_BPS: Dict[str, int] = {
+    "uniswap_v2": 30,
+    "quickswap": 30,
+    "pancake": 25,
+    "pancake_v2": 25,
+}
+DEFAULT_V2_FEE_BPS = 30
+
+# Sync bookkeeping
+MAX_PAIRS_PER_CHAIN = 5000
+MAX_ADDRESSES_PER_QUERY = 500
+MAX_LOG_BLOCK_RANGE = 2000  # Larger gaps are re-seeded instead of replayed
+STALE_AFTER_BLOCKS = 5
+
+_SEEDED_LOG_INDEX = 2 ** 31  # Seeds reflect state at the end of their block
+
+
+@dataclass
+class PairState:
+    """Mirrored state of a V2-style pair."""
+    pair_address: str
+    factory: str
+    token0: str
+    token1: str
+    reserve0: int
+    reserve1: int
+    fee_bps: int = DEFAULT_V2_FEE_BPS
+    block_number: int = -1
+    log_index: int = -1
+    updated_at: float = field(default_factory=time.monotonic)
+    needs_seed: bool = True
+
+    def reserves_for(self, token_in: str) -> Optional[Tuple[int, int]]:
+        """Get (reserve_in, reserve_out) for a swap from ``token_in``."""
+        token_in = token_in.lower()
+        if token_in == self.token0:
+            return self.reserve0, self.reserve1
+        if token_in == self.token1:
+            return self.reserve1, self.reserve0
+        return None
+
+
+def get_amount_out(amount_in: int, reserve_in: int, reserve_out: int, fee_bps: int) -> int:
+    """
+    Constant product output amount, matching UniswapV2Library.getAmountOut.
+
+    Args:
+        amount_in: Input amount in wei
+        reserve_in: Input token reserve
+        reserve_out: Output token reserve
+        fee_bps: Swap fee in basis points
+
+    Returns:
+        Output amount in wei (0 for empty pools or inputs)
+    """
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return 0
+    amount_in_with_fee = amount_in * (10_000 - fee_bps)
+    numerator = amount_in_with_fee * reserve_out
+    denominator = reserve_in * 10_000 + amount_in_with_fee
+    return numerator // denominator
+
+
+def _pair_index_key(factory: str, token_a: str, token_b: str) -> Tuple[str, str, str]:
+    """Order-independent index key for a factory pair."""
+    token_a, token_b = token_a.lower(), token_b.lower()
+    if token_b < token_a:
+        token_a, token_b = token_b, token_a
+    return factory.lower(), token_a, token_b
+
+
+class ReserveMirror:
+    """
+    Per-chain in-memory reserve store for tracked V2-style pairs.
+
+    Pairs are registered by the adapters after an RPC read, then re-seeded
+    at an exact block and followed through ``Sync`` logs by one
+    ``eth_getLogs`` poll per chain per block. Quotes fall back to RPC when
+    a pair is unknown or the follower has fallen behind.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[RpcPool] = None,
+        aggregator: Optional[MulticallAggregator] = None,
+        max_pairs_per_chain: int = MAX_PAIRS_PER_CHAIN,
+        stale_after_blocks: int = STALE_AFTER_BLOCKS,
+        auto_sync: bool = True,
+        tick_bus: Optional[PriceTickBus] = None,
+    ) -> None:
+        """
+        Initialize reserve mirror.
+
+        Args:
+            pool: RPC pool for head and log queries
+            aggregator: Multicall aggregator for seeding reserves
+            max_pairs_per_chain: Tracked pair limit per chain (LRU evicted)
+            stale_after_blocks: Blocks without a successful sync before
+                mirrored reserves stop being served
+            auto_sync: Start a background Sync follower when pairs are registered
+            tick_bus: Bus that receives a price tick for every applied Sync
+        """
+        self.pool = pool or rpc_pool
+        self.aggregator = aggregator or multicall_aggregator
+        self.max_pairs_per_chain = max_pairs_per_chain
+        self.stale_after_blocks = stale_after_blocks
+        self.auto_sync = auto_sync
+        self.tick_bus = tick_bus or price_bus
+
+        self._pairs: Dict[str, "OrderedDict[str, PairState]"] = {}
+        self._index: Dict[str, Dict[Tuple[str, str, str], str]] = {}
+        self._decimals: Dict[str, Dict[str, int]] = {}
+        self._synced_blocks: Dict[str, int] = {}
+        self._last_synced_at: Dict[str, float] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        self.local_quotes = 0
+        self.sync_logs_applied = 0
+
+    # ------------------------------------------------------------------
+    # Registration
+    # ------------------------------------------------------------------
+
+    def register_pair(
+        self,
+        chain: str,
+        factory: str,
+        pair_address: str,
+        token0: str,
+        token1: str,
+        reserve0: int,
+        reserve1: int,
+        fee_bps: int = DEFAULT_V2_FEE_BPS,
+    ) -> PairState:
+        """
+        Start tracking a pair using reserves just read over RPC.
+
+        The pair is usable immediately and is re-seeded at an exact block on
+        the next sync so subsequent ``Sync`` logs apply consistently.
+
+        Args:
+            chain: Blockchain network
+            factory: Factory address the pair belongs to
+            pair_address: Pair contract address
+            token0: Pair token0 address
+            token1: Pair token1 address
+            reserve0: Current reserve of token0
+            reserve1: Current reserve of token1
+            fee_bps: Swap fee in basis points
+
+        Returns:
+            Tracked pair state
+        """
+        pairs = self._pairs.setdefault(chain, OrderedDict())
+        index = self._index.setdefault(chain, {})
+        pair_address = pair_address.lower()
+
+        state = pairs.get(pair_address)
+        if state is None:
+            state = PairState(
+                pair_address=pair_address,
+                factory=factory.lower(),
+                token0=token0.lower(),
+                token1=token1.lower(),
+                reserve0=int(reserve0),
+                reserve1=int(reserve1),
+                fee_bps=fee_bps,
+            )
+            pairs[pair_address] = state
+            index[_pair_index_key(factory, token0, token1)] = pair_address
+            self._evict(chain)
+        elif state.needs_seed:
+            state.reserve0, state.reserve1 = int(reserve0), int(reserve1)
+            state.updated_at = time.monotonic()
+
+        if self.auto_sync:
+            self.ensure_running(chain)
+        return state
+
+    def set_token_decimals(self, chain: str, token_address: str, decimals: int) -> None:
+        """Remember token decimals so local quotes need no metadata reads."""
+        self._decimals.setdefault(chain, {})[token_address.lower()] = int(decimals)
+
+    def get_token_decimals(self, chain: str, token_address: str) -> Optional[int]:
+        """Get remembered token decimals."""
+        return self._decimals.get(chain, {}).get(token_address.lower())
+
+    def _evict(self, chain: str) -> None:
+        """Drop least recently quoted pairs beyond the per-chain limit."""
+        pairs = self._pairs[chain]
+        index = self._index[chain]
+        while len(pairs) > self.max_pairs_per_chain:
+            _, state = pairs.popitem(last=False)
+            index.pop(_pair_index_key(state.factory, state.token0, state.token1), None)
+
+    # ------------------------------------------------------------------
+    # Local quoting
+    # ------------------------------------------------------------------
+
+    def is_chain_fresh(self, chain: str) -> bool:
+        """Check whether the Sync follower for a chain is keeping up."""
+        last_synced = self._last_synced_at.get(chain)
+        if last_synced is None:
+            return False
+        block_time = CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+        return time.monotonic() - last_synced < block_time * self.stale_after_blocks
+
+    def get_pair(
+        self,
+        chain: str,
+        factory: str,
+        token_a: str,
+        token_b: str,
+    ) -> Optional[PairState]:
+        """
+        Get a usable pair state, or None if cold or stale.
+
+        Args:
+            chain: Blockchain network
+            factory: Factory address
+            token_a: One pair token
+            token_b: The other pair token
+
+        Returns:
+            Pair state safe to quote from
+        """
+        pair_address = self._index.get(chain, {}).get(_pair_index_key(factory, token_a, token_b))
+        if pair_address is None:
+            return None
+
+        pairs = self._pairs[chain]
+        state = pairs[pair_address]
+
+        block_time = CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+        if state.needs_seed:
+            # RPC-read reserves are trusted for about one block
+            if time.monotonic() - state.updated_at > block_time:
+                return None
+        elif not self.is_chain_fresh(chain):
+            return None
+
+        pairs.move_to_end(pair_address)
+        return state
+
+    def get_amounts_out(
+        self,
+        chain: str,
+        factory: str,
+        path: List[str],
+        amount_in: int,
+    ) -> Optional[Tuple[List[int], List[PairState]]]:
+        """
+        Quote a swap path locally.
+
+        Args:
+            chain: Blockchain network
+            factory: Factory address of the DEX
+            path: Token addresses from input to output
+            amount_in: Input amount in wei
+
+        Returns:
+            Tuple of (amounts per hop like getAmountsOut, pair states per
+            hop), or None if any hop is cold, stale or empty
+        """
+        if len(path) < 2:
+            return None
+
+        amounts = [amount_in]
+        hops: List[PairState] = []
+        for token_in, token_out in zip(path, path[1:]):
+            state = self.get_pair(chain, factory, token_in, token_out)
+            if state is None:
+                return None
+            reserves = state.reserves_for(token_in)
+            if reserves is None:
+                return None
+            amount_out = get_amount_out(amounts[-1], reserves[0], reserves[1], state.fee_bps)
+            if amount_out <= 0:
+                return None
+            amounts.append(amount_out)
+            hops.append(state)
+
+        self.local_quotes += 1
+        return amounts, hops
+
+    # ------------------------------------------------------------------
+    # Sync following
+    # ------------------------------------------------------------------
+
+    def apply_sync_log(self, chain: str, log: Dict) -> bool:
+        """
+        Apply a ``Sync`` log to the mirrored pair.
+
+        Logs older than the pair's current state are ignored; a removed
+        (reorged) log forces a re-seed.
+
+        Args:
+            chain: Blockchain network
+            log: Raw JSON-RPC log object
+
+        Returns:
+            True if the pair state changed
+        """
+        state = self._pairs.get(chain, {}).get(log.get("address", "").lower())
+        if state is None:
+            return False
+
+        topics = log.get("topics") or []
+        if not topics or topics[0].lower() != SYNC_TOPIC:
+            return False
+
+        if log.get("removed"):
+            state.needs_seed = True
+            return False
+
+        block_number = int(log["blockNumber"], 16)
+        log_index = int(log["logIndex"], 16)
+        if (block_number, log_index) <= (state.block_number, state.log_index):
+            return False
+
+        data = bytes.fromhex(log["data"][2:])
+        state.reserve0 = int.from_bytes(data[0:32], "big")
+        state.reserve1 = int.from_bytes(data[32:64], "big")
+        state.block_number = block_number
+        state.log_index = log_index
+        state.updated_at = time.monotonic()
+        self.sync_logs_applied += 1
+        self._publish_tick(chain, state)
+        return True
+
+    def _publish_tick(self, chain: str, state: PairState) -> None:
+        """
+        Publish token0's price in token1 once both decimals are known.
+
+        Only this one direction is published: the bus conflates ticks per
+        (chain, pair), so an inverse tick for the same pair would replace
+        it. Consumers needing token1 in token0 take ``1 / price``.
+        """
+        decimals0 = self.get_token_decimals(chain, state.token0)
+        decimals1 = self.get_token_decimals(chain, state.token1)
+        if decimals0 is None or decimals1 is None or state.reserve0 <= 0:
+            return
+
+        price = (Decimal(state.reserve1) / Decimal(state.reserve0)).scaleb(decimals0 - decimals1)
+        self.tick_bus.publish(PriceTick(
+            chain=chain,
+            token_address=state.token0,
+            quote_token=state.token1,
+            pair_address=state.pair_address,
+            price=price,
+            source="reserve_mirror",
+            block_number=state.block_number,
+        ))
+
+    async def sync_once(self, chain: str) -> int:
+        """
+        Advance one chain to the current head.
+
+        Fetches ``Sync`` logs for all tracked pairs since the last synced
+        block and seeds newly registered pairs at the head block.
+
+        Args:
+            chain: Blockchain network
+
+        Returns:
+            Number of Sync logs applied
+        """
+        pairs = self._pairs.get(chain)
+        if not pairs:
+            return 0
+
+        head = int(await self.pool.make_request(chain, "eth_blockNumber", []), 16)
+        last_synced = self._synced_blocks.get(chain)
+
+        applied = 0
+        if last_synced is None or head - last_synced > MAX_LOG_BLOCK_RANGE:
+            # First sync or too far behind: re-seed everything at head
+            for state in pairs.values():
+                state.needs_seed = True
+        elif head > last_synced:
+            applied = await self._apply_logs(chain, list(pairs), last_synced + 1, head)
+
+        await self._seed_pairs(chain, [state for state in pairs.values() if state.needs_seed], head)
+
+        self._synced_blocks[chain] = head
+        self._last_synced_at[chain] = time.monotonic()
+        return applied
+
+    async def _apply_logs(
+        self,
+        chain: str,
+        addresses: List[str],
+        from_block: int,
+        to_block: int,
+    ) -> int:
+        """Fetch and apply Sync logs for addresses over a block range."""
+        logs: List[Dict] = []
+        for start in range(0, len(addresses), MAX_ADDRESSES_PER_QUERY):
+            chunk = addresses[start:start + MAX_ADDRESSES_PER_QUERY]
+            result = await self.pool.make_request(
+                chain,
+                "eth_getLogs",
+                [{
+                    "fromBlock": hex(from_block),
+                    "toBlock": hex(to_block),
+                    "address": chunk,
+                    "topics": [SYNC_TOPIC],
+                }],
+            )
+            logs.extend(result or [])
+
+        logs.sort(key=lambda log: (int(log["blockNumber"], 16), int(log["logIndex"], 16)))
+        return sum(1 for log in logs if self.apply_sync_log(chain, log))
+
+    async def _seed_pairs(self, chain: str, states: List[PairState], block_number: int) -> None:
+        """Read reserves for pairs at an exact block."""
+        if not states:
+            return
+
+        results = await self.aggregator.aggregate(
+            chain,
+            [
+                MulticallCall(
+                    state.pair_address,
+                    encode_call(PAIR_GET_RESERVES_SELECTOR),
+                    decode_reserves,
+                )
+                for state in states
+            ],
+            block_identifier=hex(block_number),
+        )
+
+        now = time.monotonic()
+        for state, result in zip(states, results):
+            if not result.success:
+                continue
+            state.reserve0, state.reserve1, _ = result.value
+            state.block_number = block_number
+            state.log_index = _SEEDED_LOG_INDEX
+            state.updated_at = now
+            state.needs_seed = False
+
+    async def _sync_loop(self, chain: str) -> None:
+        """Follow Sync logs for a chain once per block."""
+        block_time = CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+        logger.info(
+            f"Reserve mirror started for {chain}",
+            extra={'extra_data': {'chain': chain, 'interval_seconds': block_time}}
+        )
+
+        while self._pairs.get(chain):
+            try:
+                await self.sync_once(chain)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Reserve mirror sync failed for {chain}: {e}",
+                    extra={'extra_data': {'chain': chain, 'error': str(e)}}
+                )
+            await asyncio.sleep(block_time)
+
+        self._tasks.pop(chain, None)
+
+    def ensure_running(self, chain: str) -> None:
+        """Start the Sync follower for a chain if it is not running."""
+        task = self._tasks.get(chain)
+        if task is not None and not task.done():
+            return
+        try:
+            self._tasks[chain] = asyncio.get_running_loop().create_task(self._sync_loop(chain))
+        except RuntimeError:
+            # No running loop (e.g. synchronous tests); sync_once can be driven manually
+            pass
+
+    async def stop(self) -> None:
+        """Stop all Sync followers."""
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get mirror statistics."""
+        return {
+            "chains": {
+                chain: {
+                    "tracked_pairs": len(pairs),
+                    "synced_block": self._synced_blocks.get(chain),
+                    "fresh": self.is_chain_fresh(chain),
+                }
+                for chain, pairs in self._pairs.items()
+            },
+            "local_quotes": self.local_quotes,
+            "sync_logs_applied": self.sync_logs_applied,
+        }
+
+
+# Global reserve mirror instance
+reserve_mirror = ReserveMirror()
@@ -13,6 +13,10 @@ from typing import Any, Dict, List, Optional, Tuple
 from web3 import Web3
 from web3.exceptions import ContractLogicError, Web3Exception
 
+from ..chains.contract_calls import ZERO_ADDRESS, contract_caller
+from ..chains.multicall import multicall_aggregator, pair_state_calls
+from .reserve_mirror import DEFAULT_V2_FEE_BPS, V2_FEE_BPS, reserve_mirror
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -21,6 +25,7 @@ logger = logging.getLogger(__name__)
 DEFAULT_SLIPPAGE_TOLERANCE = Decimal("0.005")  # 0.5%
 UNISWAP_V2_FEE = Decimal("0.003")  # 0.3%
 GAS_ESTIMATE_SWAP = 150000  # Standard Uniswap V2 swap gas units
+GAS_PRICE_CACHE_SECONDS = 10.0  # Reuse fetched gas prices across quotes
 DEFAULT_TOKEN_DECIMALS = 18
 
 # Native token placeholder address used in quotes.py
@@ -60,6 +65,10 @@ class UniswapV2Adapter:
         self.router_addresses = self._get_router_addresses()
         self.factory_addresses = self._get_factory_addresses()
         self.weth_addresses = self._get_weth_addresses()
+        self.fee_bps = V2_FEE_BPS.get(dex_name, DEFAULT_V2_FEE_BPS)
+        
+        # Gas price cache per chain: (fetched_at, gas_price_gwei)
+        self._gas_price_cache: Dict[str, Tuple[float, Decimal]] = {}
         
         # Minimal ABIs for essential functions
         self.router_abi = [
@@ -226,22 +235,30 @@ class UniswapV2Adapter:
                 raise ValueError(f"No wrapped native token address for chain {chain}")
         return token_address
     
-    async def _get_current_gas_price(self, w3: Web3, chain: str, trace_id: str) -> Dict[str, Any]:
+    async def _get_current_gas_price(self, w3: Optional[Web3], chain: str, trace_id: str) -> Dict[str, Any]:
         """
         Get current gas price and calculate costs.
         
         Args:
-            w3: Web3 instance
+            w3: Web3 instance (None reads through the async RPC pool)
             chain: Blockchain network
             trace_id: Trace ID for logging
             
         Returns:
             Dictionary with gas price info and cost calculations
         """
+        cached = self._gas_price_cache.get(chain)
         try:
-            # Try to get current gas price from the network
-            gas_price_wei = await asyncio.to_thread(w3.eth.gas_price)
-            gas_price_gwei = Decimal(gas_price_wei) / Decimal(10**9)
+            if cached and time.monotonic() - cached[0] < GAS_PRICE_CACHE_SECONDS:
+                gas_price_gwei = cached[1]
+            else:
+                # Try to get current gas price from the network
+                if w3 is None:
+                    gas_price_wei = await contract_caller.gas_price(chain)
+                else:
+                    gas_price_wei = await asyncio.to_thread(lambda: w3.eth.gas_price)
+                gas_price_gwei = Decimal(gas_price_wei) / Decimal(10**9)
+                self._gas_price_cache[chain] = (time.monotonic(), gas_price_gwei)
             
             logger.debug(
                 f"Current gas price fetched: {gas_price_gwei} gwei",
@@ -365,8 +382,11 @@ class UniswapV2Adapter:
                 }
             )
             
-            # Get Web3 instance from chain clients
-            w3 = await self._get_web3_instance(chain, chain_clients, trace_id)
+            # Read through the pooled async RPC client; a sync Web3 instance
+            # is only needed for chains the pool has no providers for
+            w3 = None
+            if not await contract_caller.supports_chain(chain):
+                w3 = await self._get_web3_instance(chain, chain_clients, trace_id)
             
             # Get current gas prices early
             gas_info = await self._get_current_gas_price(w3, chain, trace_id)
@@ -388,19 +408,14 @@ class UniswapV2Adapter:
                 }
             )
             
-            router_contract = w3.eth.contract(
-                address=w3.to_checksum_address(router_address),
-                abi=self.router_abi
-            )
-            
-            factory_contract = w3.eth.contract(
-                address=w3.to_checksum_address(factory_address),
-                abi=self.factory_abi
-            )
+            router_contract = factory_contract = None
+            if w3 is not None:
+                router_contract = contract_caller.get_contract(w3, router_address, self.router_abi)
+                factory_contract = contract_caller.get_contract(w3, factory_address, self.factory_abi)
             
             # Convert addresses to checksum format
-            token_in_addr = w3.to_checksum_address(token_in_routing)
-            token_out_addr = w3.to_checksum_address(token_out_routing)
+            token_in_addr = Web3.to_checksum_address(token_in_routing)
+            token_out_addr = Web3.to_checksum_address(token_out_routing)
             
             # Get token decimals dynamically
             # Native tokens always use 18 decimals
@@ -412,7 +427,7 @@ class UniswapV2Adapter:
                 )
             else:
                 token_in_decimals = await self._get_token_decimals(
-                    w3, token_in_addr, trace_id
+                    w3, token_in_addr, trace_id, chain=chain
                 )
             
             if is_token_out_native:
@@ -423,7 +438,7 @@ class UniswapV2Adapter:
                 )
             else:
                 token_out_decimals = await self._get_token_decimals(
-                    w3, token_out_addr, trace_id
+                    w3, token_out_addr, trace_id, chain=chain
                 )
             
             # Convert amount to wei units using actual decimals
@@ -441,20 +456,26 @@ class UniswapV2Adapter:
                 }
             )
             
-            # Try direct path first
+            # Try direct path first, locally from mirrored reserves when warm
             path = [token_in_addr, token_out_addr]
-            amounts_out = await self._try_get_amounts_out(
-                router_contract, amount_in_wei, path, trace_id
+            quote_source = "local"
+            amounts_out = self._try_local_amounts_out(
+                chain, factory_address, amount_in_wei, path, trace_id
             )
+            if amounts_out is None:
+                quote_source = "rpc"
+                amounts_out = await self._try_get_amounts_out(
+                    router_contract, amount_in_wei, path, trace_id, chain=chain
+                )
             
             # If direct path fails, try through WETH
             if amounts_out is None:
                 weth_address = self.weth_addresses.get(chain)
                 if weth_address and token_in_addr != weth_address and token_out_addr != weth_address:
-                    weth_checksum = w3.to_checksum_address(weth_address)
+                    weth_checksum = Web3.to_checksum_address(weth_address)
                     path = [token_in_addr, weth_checksum, token_out_addr]
                     amounts_out = await self._try_get_amounts_out(
-                        router_contract, amount_in_wei, path, trace_id
+                        router_contract, amount_in_wei, path, trace_id, chain=chain
                     )
                     logger.debug(
                         f"Trying WETH route: {path}",
@@ -493,7 +514,8 @@ class UniswapV2Adapter:
             # Get pair reserves for price impact calculation
             price_impact = await self._calculate_price_impact(
                 factory_contract, w3, token_in_addr, token_out_addr, 
-                amount_in, amount_out, token_in_decimals, token_out_decimals, trace_id
+                amount_in, amount_out, token_in_decimals, token_out_decimals, trace_id,
+                chain=chain,
             )
             
             # Calculate minimum amount out with slippage
@@ -535,7 +557,8 @@ class UniswapV2Adapter:
                     "input_is_native": is_token_in_native,
                     "output_is_native": is_token_out_native,
                     "routing_path": [addr.lower() for addr in path]
-                }
+                },
+                "quote_source": quote_source,
             }
             
             logger.info(
@@ -548,6 +571,7 @@ class UniswapV2Adapter:
                         'gas_cost_usd': gas_info['gas_cost_usd'],
                         'gas_price_gwei': gas_info['gas_price_gwei'],
                         'execution_time_ms': execution_time_ms,
+                        'quote_source': quote_source,
                         'native_conversion_applied': is_token_in_native or is_token_out_native
                     }
                 }
@@ -692,36 +716,44 @@ class UniswapV2Adapter:
     
     async def _get_token_decimals(
         self, 
-        w3: Web3, 
+        w3: Optional[Web3], 
         token_address: str, 
-        trace_id: str
+        trace_id: str,
+        chain: Optional[str] = None,
     ) -> int:
         """
         Get token decimals from contract.
         
         Args:
-            w3: Web3 instance
+            w3: Web3 instance (None reads through the async RPC pool)
             token_address: Token contract address
             trace_id: Trace ID for logging
+            chain: Blockchain network (enables the reserve mirror's decimals store)
             
         Returns:
             Token decimals (defaults to 18 if query fails)
         """
+        if chain:
+            cached = reserve_mirror.get_token_decimals(chain, token_address)
+            if cached is not None:
+                return cached
+        
         try:
-            token_contract = w3.eth.contract(
-                address=token_address,
-                abi=self.erc20_abi
-            )
-            
-            decimals = await asyncio.to_thread(
-                token_contract.functions.decimals().call
-            )
+            if w3 is None:
+                decimals = await contract_caller.decimals(chain, token_address)
+            else:
+                token_contract = contract_caller.get_contract(w3, token_address, self.erc20_abi)
+                decimals = await asyncio.to_thread(
+                    token_contract.functions.decimals().call
+                )
             
             logger.debug(
                 f"Token decimals retrieved: {decimals}",
                 extra={'extra_data': {'trace_id': trace_id, 'token_address': token_address, 'decimals': decimals}}
             )
             
+            if chain:
+                reserve_mirror.set_token_decimals(chain, token_address, decimals)
             return int(decimals)
             
         except Exception as e:
@@ -731,29 +763,76 @@ class UniswapV2Adapter:
             )
             return DEFAULT_TOKEN_DECIMALS
     
+    def _try_local_amounts_out(
+        self,
+        chain: str,
+        factory_address: str,
+        amount_in: int,
+        path: List[str],
+        trace_id: str,
+    ) -> Optional[List[int]]:
+        """
+        Try to compute amounts out from mirrored reserves.
+        
+        Args:
+            chain: Blockchain network
+            factory_address: Factory the path's pairs belong to
+            amount_in: Input amount in wei
+            path: Token swap path
+            trace_id: Trace ID for logging
+            
+        Returns:
+            Amounts out array or None if any pair is cold or stale
+        """
+        local = reserve_mirror.get_amounts_out(chain, factory_address, path, amount_in)
+        if local is None:
+            return None
+        
+        amounts_out, _ = local
+        logger.debug(
+            f"Local amounts out from mirrored reserves",
+            extra={
+                'extra_data': {
+                    'trace_id': trace_id,
+                    'path': path,
+                    'amount_in': amount_in,
+                    'amounts_out': amounts_out
+                }
+            }
+        )
+        return amounts_out
+    
     async def _try_get_amounts_out(
         self,
         router_contract: Any,
         amount_in: int,
         path: List[str],
         trace_id: str,
+        chain: Optional[str] = None,
     ) -> Optional[List[int]]:
         """
         Try to get amounts out from router contract.
         
         Args:
-            router_contract: Router contract instance
+            router_contract: Router contract instance (None reads through
+                the async RPC pool)
             amount_in: Input amount in wei
             path: Token swap path
             trace_id: Trace ID for logging
+            chain: Blockchain network
             
         Returns:
             Amounts out array or None if failed
         """
         try:
-            amounts_out = await asyncio.to_thread(
-                router_contract.functions.getAmountsOut(amount_in, path).call
-            )
+            if router_contract is None:
+                amounts_out = await contract_caller.get_amounts_out(
+                    chain, self.router_addresses[chain], amount_in, path
+                )
+            else:
+                amounts_out = await asyncio.to_thread(
+                    router_contract.functions.getAmountsOut(amount_in, path).call
+                )
             
             logger.debug(
                 f"getAmountsOut successful",
@@ -785,7 +864,7 @@ class UniswapV2Adapter:
     async def _calculate_price_impact(
         self,
         factory_contract: Any,
-        w3: Web3,
+        w3: Optional[Web3],
         token_in: str,
         token_out: str,
         amount_in: Decimal,
@@ -793,13 +872,15 @@ class UniswapV2Adapter:
         token_in_decimals: int,
         token_out_decimals: int,
         trace_id: str,
+        chain: Optional[str] = None,
     ) -> Decimal:
         """
         Calculate price impact for the trade.
         
         Args:
-            factory_contract: Factory contract instance
-            w3: Web3 instance
+            factory_contract: Factory contract instance (None when reading
+                through the async RPC pool)
+            w3: Web3 instance (None reads through the async RPC pool)
             token_in: Input token address
             token_out: Output token address
             amount_in: Input amount
@@ -807,39 +888,51 @@ class UniswapV2Adapter:
             token_in_decimals: Input token decimals
             token_out_decimals: Output token decimals
             trace_id: Trace ID for logging
+            chain: Blockchain network (enables Multicall3 pair reads)
             
         Returns:
             Price impact as decimal (0.05 = 5%)
         """
         try:
-            # Get pair address
-            pair_address = await asyncio.to_thread(
-                factory_contract.functions.getPair(token_in, token_out).call
+            factory_address = self.factory_addresses.get(chain) if chain else None
+            mirrored = (
+                reserve_mirror.get_pair(chain, factory_address, token_in, token_out)
+                if factory_address else None
             )
             
-            if pair_address == "0x0000000000000000000000000000000000000000":
-                # No direct pair exists, estimate impact as moderate
-                logger.debug(
-                    f"No direct pair found, using default price impact",
-                    extra={'extra_data': {'trace_id': trace_id, 'token_in': token_in, 'token_out': token_out}}
+            if mirrored is not None:
+                reserve0, reserve1, token0 = mirrored.reserve0, mirrored.reserve1, mirrored.token0
+            else:
+                # Get pair address
+                if factory_contract is None:
+                    pair_address = await contract_caller.get_pair(
+                        chain, factory_address, token_in, token_out
+                    )
+                else:
+                    pair_address = await asyncio.to_thread(
+                        factory_contract.functions.getPair(token_in, token_out).call
+                    )
+                
+                if pair_address.lower() == ZERO_ADDRESS:
+                    # No direct pair exists, estimate impact as moderate
+                    logger.debug(
+                        f"No direct pair found, using default price impact",
+                        extra={'extra_data': {'trace_id': trace_id, 'token_in': token_in, 'token_out': token_out}}
+                    )
+                    return Decimal("0.02")  # 2% default estimate
+                
+                # Get reserves and token order in one round trip
+                reserve0, reserve1, token0 = await self._get_pair_state(
+                    w3, pair_address, trace_id, chain
                 )
-                return Decimal("0.02")  # 2% default estimate
-            
-            # Get pair contract and reserves
-            pair_contract = w3.eth.contract(
-                address=w3.to_checksum_address(pair_address),
-                abi=self.pair_abi
-            )
-            
-            reserves = await asyncio.to_thread(
-                pair_contract.functions.getReserves().call
-            )
-            reserve0, reserve1, _ = reserves
-            
-            # Get token order in pair
-            token0 = await asyncio.to_thread(
-                pair_contract.functions.token0().call
-            )
+                
+                # Track the pair so later quotes are served locally
+                if factory_address:
+                    token1 = token_out if token0.lower() == token_in.lower() else token_in
+                    reserve_mirror.register_pair(
+                        chain, factory_address, pair_address, token0, token1,
+                        reserve0, reserve1, fee_bps=self.fee_bps,
+                    )
             
             # Determine which reserve corresponds to input token
             if token0.lower() == token_in.lower():
@@ -912,6 +1005,59 @@ class UniswapV2Adapter:
             trade_size_ratio = amount_in / Decimal("1000")  # Assume 1000 token pool
             return min(trade_size_ratio * Decimal("0.01"), Decimal("0.1"))  # Max 10%
     
+    async def _get_pair_state(
+        self,
+        w3: Optional[Web3],
+        pair_address: str,
+        trace_id: str,
+        chain: Optional[str] = None,
+    ) -> Tuple[int, int, str]:
+        """
+        Get pair reserves and token0 address.
+        
+        Uses a single Multicall3 read when the chain supports it and falls
+        back to individual contract calls otherwise.
+        
+        Args:
+            w3: Web3 instance (None reads through the async RPC pool)
+            pair_address: Pair contract address
+            trace_id: Trace ID for logging
+            chain: Blockchain network
+            
+        Returns:
+            Tuple of (reserve0, reserve1, token0)
+        """
+        if chain and multicall_aggregator.supports_chain(chain):
+            try:
+                reserves, token0 = await multicall_aggregator.aggregate(
+                    chain, pair_state_calls(pair_address)
+                )
+                if reserves.success and token0.success:
+                    reserve0, reserve1, _ = reserves.value
+                    return reserve0, reserve1, token0.value
+            except Exception as e:
+                logger.debug(
+                    f"Multicall pair read failed, using direct calls: {e}",
+                    extra={'extra_data': {'trace_id': trace_id, 'pair_address': pair_address}}
+                )
+        
+        if w3 is None:
+            (reserve0, reserve1, _), token0 = await asyncio.gather(
+                contract_caller.get_reserves(chain, pair_address),
+                contract_caller.token0(chain, pair_address),
+            )
+            return reserve0, reserve1, token0
+        
+        pair_contract = contract_caller.get_contract(w3, pair_address, self.pair_abi)
+        
+        reserve0, reserve1, _ = await asyncio.to_thread(
+            pair_contract.functions.getReserves().call
+        )
+        token0 = await asyncio.to_thread(
+            pair_contract.functions.token0().call
+        )
+        return reserve0, reserve1, token0
+    
     def supports_chain(self, chain: str) -> bool:
         """
         Check if adapter supports the given chain.
@@ -12,6 +12,9 @@ from typing import Any, Dict, List, Optional, Tuple
 from web3 import Web3
 from web3.exceptions import ContractLogicError
 
+from ..chains.contract_calls import ZERO_ADDRESS, contract_caller
+from .v3_pool_mirror import v3_pool_mirror
+
 import logging
 
 logger = logging.getLogger(__name__)
@@ -127,6 +130,17 @@ class UniswapV3Adapter:
                 "type": "function"
             }
         ]
+        
+        # ERC20 decimals ABI
+        self.decimals_abi = [{
+            "constant": True,
+            "inputs": [],
+            "name": "decimals",
+            "outputs": [{"name": "", "type": "uint8"}],
+            "payable": False,
+            "stateMutability": "view",
+            "type": "function"
+        }]
     
     def _get_quoter_addresses(self) -> Dict[str, str]:
         """Get Quoter V2 addresses for each chain."""
@@ -200,8 +214,11 @@ class UniswapV3Adapter:
             raise ValueError(f"Chain {chain} not supported by {self.dex_name}")
         
         try:
-            # Get Web3 instance
-            w3 = await self._get_web3_instance(chain, chain_clients)
+            # Read through the pooled async RPC client; a sync Web3 instance
+            # is only needed for chains the pool has no providers for
+            w3 = None
+            if not await contract_caller.supports_chain(chain):
+                w3 = await self._get_web3_instance(chain, chain_clients)
             
             # CRITICAL FIX: Resolve token symbols to addresses
             token_in_addr = await self._resolve_token_address(token_in, chain, w3)
@@ -215,30 +232,65 @@ class UniswapV3Adapter:
             token_out_addr = self._convert_native_to_wrapped(token_out_addr, chain)
             
             # Get token decimals for proper amount conversion
-            token_in_decimals = await self._get_token_decimals(token_in_addr, w3)
-            token_out_decimals = await self._get_token_decimals(token_out_addr, w3)
+            token_in_decimals, token_out_decimals = await asyncio.gather(
+                self._get_token_decimals(token_in_addr, w3, chain),
+                self._get_token_decimals(token_out_addr, w3, chain),
+            )
             
             # Convert amount to wei using actual token decimals
             amount_in_wei = int(amount_in * Decimal(10**token_in_decimals))
             
-            # Phase 1: Try quoter contracts first
             best_quote = None
             best_fee_tier = None
             best_gas_estimate = GAS_ESTIMATE_V3_SWAP
             quotes_by_tier = {}
             quoter_success = False
+            quote_method = "direct_pool"
+            local_price_impact = None
             
+            # Phase 0: Simulate locally from mirrored pool state when every tier is warm
+            factory_address = self.factory_addresses.get(chain)
+            local_quotes = None
+            if factory_address:
+                local_quotes = v3_pool_mirror.quote(
+                    chain, factory_address, token_in_addr, token_out_addr,
+                    amount_in_wei, self.fee_tiers
+                )
+                if local_quotes is None:
+                    v3_pool_mirror.watch_pair(
+                        chain, factory_address, token_in_addr, token_out_addr, self.fee_tiers
+                    )
+            
+            for fee_tier, local_quote in (local_quotes or {}).items():
+                if local_quote.amount_out <= 0:
+                    continue
+                quotes_by_tier[fee_tier] = {
+                    "amount_out": local_quote.amount_out,
+                    "sqrt_price_after": local_quote.sqrt_price_after,
+                    "ticks_crossed": local_quote.initialized_ticks_crossed,
+                    "gas_estimate": GAS_ESTIMATE_V3_SWAP,
+                }
+                if best_quote is None or local_quote.amount_out > best_quote:
+                    best_quote = local_quote.amount_out
+                    best_fee_tier = fee_tier
+                    quote_method = "local_tick_math"
+                    local_price_impact = min(
+                        max(Decimal(str(local_quote.price_impact)), Decimal("0")), Decimal("1")
+                    )
+            
+            # Phase 1: Try quoter contracts (skipped when simulated locally)
+            quoter_fee_tiers = self.fee_tiers if best_quote is None else []
             quoter_address = self.quoter_addresses[chain]
-            quoter_contract = w3.eth.contract(
-                address=w3.to_checksum_address(quoter_address),
-                abi=self.quoter_abi
+            quoter_contract = (
+                contract_caller.get_contract(w3, quoter_address, self.quoter_abi)
+                if w3 is not None else None
             )
             
-            for fee_tier in self.fee_tiers:
+            for fee_tier in quoter_fee_tiers:
                 try:
                     quote_result = await self._get_single_quote(
                         quoter_contract, token_in_addr, token_out_addr,
-                        fee_tier, amount_in_wei
+                        fee_tier, amount_in_wei, chain=chain
                     )
                     
                     if quote_result:
@@ -258,6 +310,7 @@ class UniswapV3Adapter:
                                 best_fee_tier = fee_tier
                                 best_gas_estimate = gas_est
                                 quoter_success = True
+                                quote_method = "quoter"
                                 
                 except Exception as fee_error:
                     logger.debug(
@@ -333,11 +386,14 @@ class UniswapV3Adapter:
             # Calculate price and price impact
             price = amount_out / amount_in if amount_in > 0 else Decimal("0")
             
-            # Calculate price impact for V3
-            price_impact = await self._calculate_v3_price_impact(
-                w3, token_in_addr, token_out_addr, best_fee_tier,
-                amount_in, amount_out, chain
-            )
+            # Calculate price impact for V3 (exact when simulated locally)
+            if local_price_impact is not None:
+                price_impact = local_price_impact
+            else:
+                price_impact = await self._calculate_v3_price_impact(
+                    w3, token_in_addr, token_out_addr, best_fee_tier,
+                    amount_in, amount_out, chain
+                )
             
             # Calculate minimum amount out with slippage
             min_amount_out = amount_out * (Decimal("1") - slippage_tolerance)
@@ -353,7 +409,7 @@ class UniswapV3Adapter:
                     'fee_tier': best_fee_tier,
                     'amount_in': str(amount_in),
                     'amount_out': str(amount_out),
-                    'method': 'quoter' if quoter_success else 'direct_pool',
+                    'method': quote_method,
                     'execution_time_ms': execution_time_ms
                 }}
             )
@@ -382,7 +438,7 @@ class UniswapV3Adapter:
                     for tier, data in quotes_by_tier.items()
                 },
                 "execution_time_ms": execution_time_ms,
-                "quote_method": "quoter" if quoter_success else "direct_pool"
+                "quote_method": quote_method
             }
             
         except Exception as e:
@@ -407,14 +463,14 @@ class UniswapV3Adapter:
                 "execution_time_ms": (time.time() - start_time) * 1000,
             }
 
-    async def _resolve_token_address(self, token: str, chain: str, w3: Web3) -> Optional[str]:
+    async def _resolve_token_address(self, token: str, chain: str, w3: Optional[Web3]) -> Optional[str]:
         """
         Resolve token symbol to contract address.
         
         Args:
             token: Token symbol or address
             chain: Blockchain network
-            w3: Web3 instance
+            w3: Web3 instance (unused; kept for interface compatibility)
             
         Returns:
             Checksum address or None if not found
@@ -422,7 +478,7 @@ class UniswapV3Adapter:
         # If already a valid address, return it
         if token.startswith("0x") and len(token) == 42:
             try:
-                return w3.to_checksum_address(token)
+                return Web3.to_checksum_address(token)
             except ValueError:
                 pass
         
@@ -467,17 +523,23 @@ class UniswapV3Adapter:
         # Look up token address by symbol
         if chain in TOKEN_ADDRESSES and token.upper() in TOKEN_ADDRESSES[chain]:
             address = TOKEN_ADDRESSES[chain][token.upper()]
-            return w3.to_checksum_address(address)
+            return Web3.to_checksum_address(address)
         
         return None
 
-    async def _get_token_decimals(self, token_address: str, w3: Web3) -> int:
+    async def _get_token_decimals(
+        self,
+        token_address: str,
+        w3: Optional[Web3],
+        chain: Optional[str] = None,
+    ) -> int:
         """
         Get token decimals from contract.
         
         Args:
             token_address: Token contract address
-            w3: Web3 instance
+            w3: Web3 instance (None reads through the async RPC pool)
+            chain: Blockchain network
             
         Returns:
             Token decimals (default 18 if not found)
@@ -487,29 +549,19 @@ class UniswapV3Adapter:
             if token_address == "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE":
                 return 18
             
-            # ERC20 decimals ABI
-            decimals_abi = [{
-                "constant": True,
-                "inputs": [],
-                "name": "decimals",
-                "outputs": [{"name": "", "type": "uint8"}],
-                "payable": False,
-                "stateMutability": "view",
-                "type": "function"
-            }]
-            
-            contract = w3.eth.contract(
-                address=w3.to_checksum_address(token_address),
-                abi=decimals_abi
-            )
-            
-            decimals = await asyncio.to_thread(contract.functions.decimals().call)
-            return int(decimals)
+            return await self._read_decimals(w3, chain, token_address)
             
         except Exception as e:
             logger.debug(f"Failed to get decimals for {token_address}: {e}")
             return 18  # Default to 18 decimals
 
+    async def _read_decimals(self, w3: Optional[Web3], chain: str, token_address: str) -> int:
+        """Read token decimals, raising on failure."""
+        if w3 is None:
+            return await contract_caller.decimals(chain, token_address)
+        contract = contract_caller.get_contract(w3, token_address, self.decimals_abi)
+        return int(await asyncio.to_thread(contract.functions.decimals().call))
+
     def _convert_native_to_wrapped(self, token_address: str, chain: str) -> str:
         """
         Convert native token addresses to wrapped token addresses for Uniswap V3.
@@ -564,7 +616,7 @@ class UniswapV3Adapter:
 
     async def _get_quote_from_pool_direct(
         self,
-        w3: Web3,
+        w3: Optional[Web3],
         token_in_addr: str,
         token_out_addr: str,
         fee_tier: int,
@@ -578,7 +630,7 @@ class UniswapV3Adapter:
         without relying on quoter contracts.
         
         Args:
-            w3: Web3 instance
+            w3: Web3 instance (None reads through the async RPC pool)
             token_in_addr: Input token address (checksum)
             token_out_addr: Output token address (checksum)
             fee_tier: Fee tier (500, 3000, 10000)
@@ -611,11 +663,6 @@ class UniswapV3Adapter:
                 }}
             )
             
-            factory_contract = w3.eth.contract(
-                address=w3.to_checksum_address(factory_address),
-                abi=self.factory_abi
-            )
-            
             logger.info(
                 f"Getting pool for {token_in_addr}/{token_out_addr} fee {fee_tier}",
                 extra={'extra_data': {
@@ -626,11 +673,17 @@ class UniswapV3Adapter:
                 }}
             )
             
-            pool_address = await asyncio.to_thread(
-                factory_contract.functions.getPool(
-                    token_in_addr, token_out_addr, fee_tier
-                ).call
-            )
+            if w3 is None:
+                pool_address = await contract_caller.get_pool(
+                    chain, factory_address, token_in_addr, token_out_addr, fee_tier
+                )
+            else:
+                factory_contract = contract_caller.get_contract(w3, factory_address, self.factory_abi)
+                pool_address = await asyncio.to_thread(
+                    factory_contract.functions.getPool(
+                        token_in_addr, token_out_addr, fee_tier
+                    ).call
+                )
             
             logger.info(
                 f"Pool address for fee tier {fee_tier}: {pool_address}",
@@ -638,11 +691,11 @@ class UniswapV3Adapter:
                     'pool_address': pool_address,
                     'fee_tier': fee_tier,
                     'dex_name': self.dex_name,
-                    'is_zero': pool_address == "0x0000000000000000000000000000000000000000"
+                    'is_zero': pool_address.lower() == ZERO_ADDRESS
                 }}
             )
             
-            if pool_address == "0x0000000000000000000000000000000000000000":
+            if pool_address.lower() == ZERO_ADDRESS:
                 logger.info(
                     f"No pool exists for fee tier {fee_tier} on {self.dex_name}",
                     extra={'extra_data': {
@@ -653,12 +706,6 @@ class UniswapV3Adapter:
                 )
                 return None
                 
-            # Get pool contract and state
-            pool_contract = w3.eth.contract(
-                address=w3.to_checksum_address(pool_address),
-                abi=self.pool_abi
-            )
-            
             logger.info(
                 f"Fetching pool state for {pool_address}",
                 extra={'extra_data': {
@@ -669,9 +716,15 @@ class UniswapV3Adapter:
             
             # Fetch pool state in parallel
             try:
-                slot0_task = asyncio.to_thread(pool_contract.functions.slot0().call)
-                token0_task = asyncio.to_thread(pool_contract.functions.token0().call)
-                liquidity_task = asyncio.to_thread(pool_contract.functions.liquidity().call)
+                if w3 is None:
+                    slot0_task = contract_caller.slot0(chain, pool_address)
+                    token0_task = contract_caller.token0(chain, pool_address)
+                    liquidity_task = contract_caller.liquidity(chain, pool_address)
+                else:
+                    pool_contract = contract_caller.get_contract(w3, pool_address, self.pool_abi)
+                    slot0_task = asyncio.to_thread(pool_contract.functions.slot0().call)
+                    token0_task = asyncio.to_thread(pool_contract.functions.token0().call)
+                    liquidity_task = asyncio.to_thread(pool_contract.functions.liquidity().call)
                 
                 slot0, token0, liquidity = await asyncio.gather(
                     slot0_task, token0_task, liquidity_task
@@ -718,14 +771,10 @@ class UniswapV3Adapter:
             decimals_out = 18  # Default
             
             try:
-                # Simple decimals ABI
-                decimals_abi = [{"constant":True,"inputs":[],"name":"decimals","outputs":[{"name":"","type":"uint8"}],"type":"function"}]
-                
                 # Try to get decimals for input token (skip for WETH as it might not have decimals function)
                 if token_in_addr.lower() != "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2":  # Not WETH
                     try:
-                        token_in_contract = w3.eth.contract(address=w3.to_checksum_address(token_in_addr), abi=decimals_abi)
-                        decimals_in = await asyncio.to_thread(token_in_contract.functions.decimals().call)
+                        decimals_in = await self._read_decimals(w3, chain, token_in_addr)
                         logger.info(f"Token in decimals: {decimals_in}")
                     except Exception as e:
                         logger.debug(f"Could not fetch decimals for token_in (using 18): {e}")
@@ -733,8 +782,7 @@ class UniswapV3Adapter:
                 
                 # Try to get decimals for output token
                 try:
-                    token_out_contract = w3.eth.contract(address=w3.to_checksum_address(token_out_addr), abi=decimals_abi)
-                    decimals_out = await asyncio.to_thread(token_out_contract.functions.decimals().call)
+                    decimals_out = await self._read_decimals(w3, chain, token_out_addr)
                     logger.info(f"Token out decimals: {decimals_out}")
                 except Exception as e:
                     logger.debug(f"Could not fetch decimals for token_out (using 18): {e}")
@@ -920,21 +968,29 @@ class UniswapV3Adapter:
         token_out: str,
         fee_tier: int,
         amount_in: int,
+        chain: Optional[str] = None,
     ) -> Optional[Tuple[int, int, int, int]]:
         """
         Get quote for a single fee tier using quoter contract.
         
         Args:
-            quoter_contract: Quoter contract instance
+            quoter_contract: Quoter contract instance (None calls QuoterV2
+                through the async RPC pool)
             token_in: Input token address
             token_out: Output token address
             fee_tier: Fee tier (500, 3000, 10000)
             amount_in: Input amount in wei
+            chain: Blockchain network
             
         Returns:
             Tuple of (amount_out, sqrt_price_after, ticks_crossed, gas_estimate) or None
         """
         try:
+            if quoter_contract is None:
+                return await contract_caller.quote_exact_input_single(
+                    chain, self.quoter_addresses[chain], token_in, token_out, fee_tier, amount_in
+                )
+            
             result = await asyncio.to_thread(
                 quoter_contract.functions.quoteExactInputSingle(
                     token_in,
@@ -966,7 +1022,7 @@ class UniswapV3Adapter:
     
     async def _calculate_v3_price_impact(
         self,
-        w3: Web3,
+        w3: Optional[Web3],
         token_in: str,
         token_out: str,
         fee_tier: int,
@@ -978,7 +1034,7 @@ class UniswapV3Adapter:
         Calculate price impact for V3 swap using concentrated liquidity.
         
         Args:
-            w3: Web3 instance
+            w3: Web3 instance (None reads through the async RPC pool)
             token_in: Input token address
             token_out: Output token address
             fee_tier: Fee tier used
@@ -992,29 +1048,28 @@ class UniswapV3Adapter:
         try:
             # Get factory and pool address
             factory_address = self.factory_addresses[chain]
-            factory_contract = w3.eth.contract(
-                address=w3.to_checksum_address(factory_address),
-                abi=self.factory_abi
-            )
-            
-            pool_address = await asyncio.to_thread(
-                factory_contract.functions.getPool(token_in, token_out, fee_tier).call
-            )
+            if w3 is None:
+                pool_address = await contract_caller.get_pool(
+                    chain, factory_address, token_in, token_out, fee_tier
+                )
+            else:
+                factory_contract = contract_caller.get_contract(w3, factory_address, self.factory_abi)
+                pool_address = await asyncio.to_thread(
+                    factory_contract.functions.getPool(token_in, token_out, fee_tier).call
+                )
             
-            if pool_address == "0x0000000000000000000000000000000000000000":
+            if pool_address.lower() == ZERO_ADDRESS:
                 # No pool exists, return conservative estimate
                 return self._estimate_price_impact_by_size(amount_in, fee_tier)
             
-            # Get pool contract and current state
-            pool_contract = w3.eth.contract(
-                address=w3.to_checksum_address(pool_address),
-                abi=self.pool_abi
-            )
-            
             # Get current liquidity and price
-            liquidity = await asyncio.to_thread(
-                pool_contract.functions.liquidity().call
-            )
+            if w3 is None:
+                liquidity = await contract_caller.liquidity(chain, pool_address)
+            else:
+                pool_contract = contract_caller.get_contract(w3, pool_address, self.pool_abi)
+                liquidity = await asyncio.to_thread(
+                    pool_contract.functions.liquidity().call
+                )
             
             if liquidity == 0:
                 return self._estimate_price_impact_by_size(amount_in, fee_tier)
@@ -1074,6 +1129,47 @@ class UniswapV3Adapter:
         
         return base_impact * fee_multiplier
     
+    def quote_size_curve(
+        self,
+        chain: str,
+        token_in: str,
+        token_out: str,
+        amounts_in: List[int],
+    ) -> Optional[List[Optional[Tuple[int, int]]]]:
+        """
+        Quote a whole curve of trade sizes from mirrored pool state.
+        
+        Args:
+            chain: Blockchain network
+            token_in: Input token address
+            token_out: Output token address
+            amounts_in: Candidate input amounts in wei
+            
+        Returns:
+            Best (amount_out, fee_tier) per size, None per size that no tier
+            can fill locally, or None overall when the pools are not warm
+        """
+        factory_address = self.factory_addresses.get(chain)
+        if not factory_address:
+            return None
+        
+        curves = v3_pool_mirror.quote_curve(
+            chain, factory_address, token_in, token_out, amounts_in, self.fee_tiers
+        )
+        if curves is None:
+            v3_pool_mirror.watch_pair(chain, factory_address, token_in, token_out, self.fee_tiers)
+            return None
+        
+        best: List[Optional[Tuple[int, int]]] = []
+        for index in range(len(amounts_in)):
+            candidates = [
+                (quotes[index].amount_out, fee_tier)
+                for fee_tier, quotes in curves.items()
+                if quotes[index] is not None and quotes[index].amount_out > 0
+            ]
+            best.append(max(candidates) if candidates else None)
+        return best
+    
     def supports_chain(self, chain: str) -> bool:
         """
         Check if adapter supports the given chain.
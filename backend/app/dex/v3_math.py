@@ -0,0 +1,506 @@
+"""
+Integer ports of the Uniswap V3 core math libraries.
+
+TickMath, SqrtPriceMath, SwapMath and TickBitmap reproduced with Python
+integers so local swap simulation matches the pool contract to the wei.
+Only exact-input swaps are supported.
+"""
+from __future__ import annotations
+
+import math
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+MIN_TICK = -887272
+MAX_TICK = 887272
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+Q96 = 1 << 96
+MAX_UINT160 = (1 << 160) - 1
+MAX_UINT256 = (1 << 256) - 1
+FEE_DENOMINATOR = 1_000_000
+
+# TickMath.getSqrtRatioAtTick multipliers for each bit of |tick|
+_TICK_RATIO_FACTORS: Tuple[Tuple[int, int], ...] = (
+    (0x2, 0xfff97272373d413259a46990580e213a),
+    (0x4, 0xfff2e50f5f656932ef12357cf3c7fdcc),
+    (0x8, 0xffe5caca7e10e4e61c3624eaa0941cd0),
+    (0x10, 0xffcb9843d60f6159c9db58835c926644),
+    (0x20, 0xff973b41fa98c081472e6896dfb254c0),
+    (0x40, 0xff2ea16466c96a3843ec78b326b52861),
+    (0x80, 0xfe5dee046a99a2a811c461f1969c3053),
+    (0x100, 0xfcbe86c7900a88aedcffc83b479aa3a4),
+    (0x200, 0xf987a7253ac413176f2b074cf7815e54),
+    (0x400, 0xf3392b0822b70005940c7a398e4b70f3),
+    (0x800, 0xe7159475a2c29b7443b29c7fa6e889d9),
+    (0x1000, 0xd097f3bdfd2022b8845ad8f792aa5825),
+    (0x2000, 0xa9f746462d870fdf8a65dc1f90e061e5),
+    (0x4000, 0x70d869a156d2a1b890bb3df62baf32f7),
+    (0x8000, 0x31be135f97d08fd981231505542fcfa6),
+    (0x10000, 0x9aa508b5b7a84e1c677de54f3e99bc9),
+    (0x20000, 0x5d6af8dedb81196699c329225ee604),
+    (0x40000, 0x2216e584f5fa1ea926041bedfe98),
+    (0x80000, 0x48a170391f7dc42444e8fa2),
+)
+
+_LOG_SQRT_10001 = math.log(1.0001) / 2
+
+
+class TickWordNotLoaded(Exception):
+    """Raised when a swap walks into a tick bitmap word that is not cached."""
+    pass
+
+
+# ----------------------------------------------------------------------
+# FullMath / TickMath
+# ----------------------------------------------------------------------
+
+def mul_div(a: int, b: int, denominator: int) -> int:
+    """floor(a * b / denominator)."""
+    return a * b // denominator
+
+
+def mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    """ceil(a * b / denominator)."""
+    return -(-a * b // denominator)
+
+
+def div_rounding_up(a: int, b: int) -> int:
+    """ceil(a / b)."""
+    return -(-a // b)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    """
+    Calculate sqrt(1.0001^tick) * 2^96.
+
+    Args:
+        tick: Tick index in [MIN_TICK, MAX_TICK]
+
+    Returns:
+        Q64.96 square root price
+    """
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise ValueError(f"Tick {tick} out of range")
+
+    ratio = 0xfffcb933bd6fad37aa2d162d1a594001 if abs_tick & 0x1 else 1 << 128
+    for bit, factor in _TICK_RATIO_FACTORS:
+        if abs_tick & bit:
+            ratio = (ratio * factor) >> 128
+
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    return (ratio >> 32) + (1 if ratio & 0xffffffff else 0)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    """
+    Get the greatest tick whose sqrt ratio is at or below ``sqrt_price_x96``.
+
+    Args:
+        sqrt_price_x96: Q64.96 square root price
+
+    Returns:
+        Tick index
+    """
+    if not MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO:
+        raise ValueError("sqrt price out of range")
+
+    # Float estimate, then exact correction against TickMath
+    tick = math.floor(math.log(sqrt_price_x96 / Q96) / _LOG_SQRT_10001)
+    tick = max(MIN_TICK, min(MAX_TICK, tick))
+    while tick > MIN_TICK and get_sqrt_ratio_at_tick(tick) > sqrt_price_x96:
+        tick -= 1
+    while tick < MAX_TICK and get_sqrt_ratio_at_tick(tick + 1) <= sqrt_price_x96:
+        tick += 1
+    return tick
+
+
+# ----------------------------------------------------------------------
+# SqrtPriceMath
+# ----------------------------------------------------------------------
+
+def get_next_sqrt_price_from_amount0_rounding_up(
+    sqrt_price_x96: int,
+    liquidity: int,
+    amount: int,
+    add: bool,
+) -> int:
+    """Next sqrt price after adding or removing ``amount`` of token0."""
+    if amount == 0:
+        return sqrt_price_x96
+    numerator1 = liquidity << 96
+    product = amount * sqrt_price_x96
+
+    if add:
+        denominator = numerator1 + product
+        if product <= MAX_UINT256 and denominator <= MAX_UINT256:
+            return mul_div_rounding_up(numerator1, sqrt_price_x96, denominator)
+        return div_rounding_up(numerator1, numerator1 // sqrt_price_x96 + amount)
+
+    if product > MAX_UINT256 or numerator1 <= product:
+        raise ValueError("Insufficient liquidity for output")
+    return mul_div_rounding_up(numerator1, sqrt_price_x96, numerator1 - product)
+
+
+def get_next_sqrt_price_from_amount1_rounding_down(
+    sqrt_price_x96: int,
+    liquidity: int,
+    amount: int,
+    add: bool,
+) -> int:
+    """Next sqrt price after adding or removing ``amount`` of token1."""
+    if add:
+        return sqrt_price_x96 + mul_div(amount, Q96, liquidity)
+
+    quotient = mul_div_rounding_up(amount, Q96, liquidity)
+    if sqrt_price_x96 <= quotient:
+        raise ValueError("Insufficient liquidity for output")
+    return sqrt_price_x96 - quotient
+
+
+def get_next_sqrt_price_from_input(
+    sqrt_price_x96: int,
+    liquidity: int,
+    amount_in: int,
+    zero_for_one: bool,
+) -> int:
+    """Next sqrt price after swapping ``amount_in`` into the pool."""
+    if zero_for_one:
+        return get_next_sqrt_price_from_amount0_rounding_up(sqrt_price_x96, liquidity, amount_in, True)
+    return get_next_sqrt_price_from_amount1_rounding_down(sqrt_price_x96, liquidity, amount_in, True)
+
+
+def get_amount0_delta(sqrt_a: int, sqrt_b: int, liquidity: int, round_up: bool) -> int:
+    """Amount of token0 between two sqrt prices for a liquidity amount."""
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+    numerator1 = liquidity << 96
+    numerator2 = sqrt_b - sqrt_a
+
+    if round_up:
+        return div_rounding_up(mul_div_rounding_up(numerator1, numerator2, sqrt_b), sqrt_a)
+    return mul_div(numerator1, numerator2, sqrt_b) // sqrt_a
+
+
+def get_amount1_delta(sqrt_a: int, sqrt_b: int, liquidity: int, round_up: bool) -> int:
+    """Amount of token1 between two sqrt prices for a liquidity amount."""
+    if sqrt_a > sqrt_b:
+        sqrt_a, sqrt_b = sqrt_b, sqrt_a
+    if round_up:
+        return mul_div_rounding_up(liquidity, sqrt_b - sqrt_a, Q96)
+    return mul_div(liquidity, sqrt_b - sqrt_a, Q96)
+
+
+# ----------------------------------------------------------------------
+# SwapMath
+# ----------------------------------------------------------------------
+
+def compute_swap_step(
+    sqrt_price_current: int,
+    sqrt_price_target: int,
+    liquidity: int,
+    amount_remaining: int,
+    fee_pips: int,
+) -> Tuple[int, int, int, int]:
+    """
+    Compute one exact-input swap step within a single tick range.
+
+    Args:
+        sqrt_price_current: Current Q64.96 sqrt price
+        sqrt_price_target: Price that cannot be exceeded in this step
+        liquidity: Active liquidity
+        amount_remaining: Remaining input amount (including fee)
+        fee_pips: Pool fee in hundredths of a bip
+
+    Returns:
+        Tuple of (sqrt_price_next, amount_in, amount_out, fee_amount)
+    """
+    zero_for_one = sqrt_price_current >= sqrt_price_target
+
+    amount_remaining_less_fee = mul_div(amount_remaining, FEE_DENOMINATOR - fee_pips, FEE_DENOMINATOR)
+    if zero_for_one:
+        amount_in = get_amount0_delta(sqrt_price_target, sqrt_price_current, liquidity, True)
+    else:
+        amount_in = get_amount1_delta(sqrt_price_current, sqrt_price_target, liquidity, True)
+
+    if amount_remaining_less_fee >= amount_in:
+        sqrt_price_next = sqrt_price_target
+    else:
+        sqrt_price_next = get_next_sqrt_price_from_input(
+            sqrt_price_current, liquidity, amount_remaining_less_fee, zero_for_one
+        )
+
+    reached_target = sqrt_price_next == sqrt_price_target
+    if zero_for_one:
+        if not reached_target:
+            amount_in = get_amount0_delta(sqrt_price_next, sqrt_price_current, liquidity, True)
+        amount_out = get_amount1_delta(sqrt_price_next, sqrt_price_current, liquidity, False)
+    else:
+        if not reached_target:
+            amount_in = get_amount1_delta(sqrt_price_current, sqrt_price_next, liquidity, True)
+        amount_out = get_amount0_delta(sqrt_price_current, sqrt_price_next, liquidity, False)
+
+    if not reached_target:
+        fee_amount = amount_remaining - amount_in
+    else:
+        fee_amount = mul_div_rounding_up(amount_in, fee_pips, FEE_DENOMINATOR - fee_pips)
+
+    return sqrt_price_next, amount_in, amount_out, fee_amount
+
+
+# ----------------------------------------------------------------------
+# TickBitmap
+# ----------------------------------------------------------------------
+
+def _most_significant_bit(x: int) -> int:
+    return x.bit_length() - 1
+
+
+def _least_significant_bit(x: int) -> int:
+    return (x & -x).bit_length() - 1
+
+
+def next_initialized_tick_within_one_word(
+    bitmap: Dict[int, int],
+    tick: int,
+    tick_spacing: int,
+    lte: bool,
+) -> Tuple[int, bool]:
+    """
+    Find the next initialized tick in the same bitmap word.
+
+    Args:
+        bitmap: Loaded bitmap words keyed by word position
+        tick: Starting tick
+        tick_spacing: Pool tick spacing
+        lte: Search left (at or below ``tick``) instead of right
+
+    Returns:
+        Tuple of (next tick, whether it is initialized)
+
+    Raises:
+        TickWordNotLoaded: If the needed bitmap word is not cached
+    """
+    compressed = tick // tick_spacing
+    if not lte:
+        compressed += 1
+
+    word_pos = compressed >> 8
+    bit_pos = compressed & 0xff
+    if word_pos not in bitmap:
+        raise TickWordNotLoaded(word_pos)
+    word = bitmap[word_pos]
+
+    if lte:
+        masked = word & ((1 << (bit_pos + 1)) - 1)
+        if masked:
+            return (compressed - (bit_pos - _most_significant_bit(masked))) * tick_spacing, True
+        return (compressed - bit_pos) * tick_spacing, False
+
+    masked = word & ~((1 << bit_pos) - 1) & MAX_UINT256
+    if masked:
+        return (compressed + (_least_significant_bit(masked) - bit_pos)) * tick_spacing, True
+    return (compressed + (255 - bit_pos)) * tick_spacing, False
+
+
+def tick_position(tick: int, tick_spacing: int) -> Tuple[int, int]:
+    """Get (word position, bit position) of a tick in the bitmap."""
+    compressed = tick // tick_spacing
+    return compressed >> 8, compressed & 0xff
+
+
+# ----------------------------------------------------------------------
+# Swap simulation
+# ----------------------------------------------------------------------
+
+@dataclass
+class PoolSnapshot:
+    """Pool state needed to simulate swaps."""
+    sqrt_price_x96: int
+    tick: int
+    liquidity: int
+    fee: int
+    tick_spacing: int
+    bitmap: Dict[int, int] = field(default_factory=dict)
+    liquidity_net: Dict[int, int] = field(default_factory=dict)
+
+
+@dataclass
+class SwapQuote:
+    """Result of a simulated exact-input swap."""
+    amount_in: int
+    amount_out: int
+    sqrt_price_before: int
+    sqrt_price_after: int
+    tick_after: int
+    initialized_ticks_crossed: int
+    zero_for_one: bool
+
+    @property
+    def price_impact(self) -> float:
+        """Relative move of the pool's marginal price, as output per input."""
+        ratio = (self.sqrt_price_after / self.sqrt_price_before) ** 2
+        if self.zero_for_one:
+            return 1.0 - ratio
+        return 1.0 - 1.0 / ratio
+
+
+@dataclass
+class _SwapStep:
+    """One tick-range segment of a swap walk."""
+    sqrt_price_start: int
+    tick_start: int
+    sqrt_price_target: int
+    liquidity: int
+    gross_in_before: int  # Cumulative input incl. fees before this step
+    out_before: int
+    crossed_before: int
+    tick_next: int
+    initialized: bool
+
+
+def _walk_steps(
+    pool: PoolSnapshot,
+    zero_for_one: bool,
+    max_amount_in: int,
+) -> Tuple[List[_SwapStep], List[int]]:
+    """
+    Walk full tick-range steps until ``max_amount_in`` is used up.
+
+    The walk also stops at unloaded bitmap words and at the price limit;
+    sizes beyond the last step are then unquotable.
+
+    Returns:
+        Tuple of (steps, cumulative gross input after each step)
+    """
+    sqrt_price_limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    sqrt_price, tick, liquidity = pool.sqrt_price_x96, pool.tick, pool.liquidity
+    consumed = out = crossed = 0
+
+    steps: List[_SwapStep] = []
+    thresholds: List[int] = []
+
+    while sqrt_price != sqrt_price_limit and consumed < max_amount_in:
+        try:
+            tick_next, initialized = next_initialized_tick_within_one_word(
+                pool.bitmap, tick, pool.tick_spacing, zero_for_one
+            )
+        except TickWordNotLoaded:
+            break
+        tick_next = max(MIN_TICK, min(MAX_TICK, tick_next))
+
+        sqrt_price_next = get_sqrt_ratio_at_tick(tick_next)
+        if zero_for_one:
+            target = max(sqrt_price_next, sqrt_price_limit)
+            full_in = get_amount0_delta(target, sqrt_price, liquidity, True)
+            full_out = get_amount1_delta(target, sqrt_price, liquidity, False)
+        else:
+            target = min(sqrt_price_next, sqrt_price_limit)
+            full_in = get_amount1_delta(sqrt_price, target, liquidity, True)
+            full_out = get_amount0_delta(sqrt_price, target, liquidity, False)
+        full_fee = mul_div_rounding_up(full_in, pool.fee, FEE_DENOMINATOR - pool.fee)
+
+        steps.append(_SwapStep(
+            sqrt_price_start=sqrt_price,
+            tick_start=tick,
+            sqrt_price_target=target,
+            liquidity=liquidity,
+            gross_in_before=consumed,
+            out_before=out,
+            crossed_before=crossed,
+            tick_next=tick_next,
+            initialized=initialized and target == sqrt_price_next,
+        ))
+
+        # A step is fully crossed exactly when the input left covers its
+        # gross cost, so the cumulative cost is the crossing threshold
+        consumed += full_in + full_fee
+        out += full_out
+        thresholds.append(consumed)
+
+        sqrt_price = target
+        if target == sqrt_price_next:
+            if initialized:
+                crossed += 1
+                net = pool.liquidity_net.get(tick_next, 0)
+                liquidity += -net if zero_for_one else net
+            tick = tick_next - 1 if zero_for_one else tick_next
+        else:
+            tick = get_tick_at_sqrt_ratio(sqrt_price)
+
+    return steps, thresholds
+
+
+def quote_exact_input_curve(
+    pool: PoolSnapshot,
+    zero_for_one: bool,
+    amounts_in: Sequence[int],
+) -> List[Optional[SwapQuote]]:
+    """
+    Simulate exact-input swaps for many input sizes in one tick walk.
+
+    Full tick-range steps do not depend on the input size, so the walk is
+    done once up to the largest size and each size only computes its own
+    final step.
+
+    Args:
+        pool: Pool snapshot
+        zero_for_one: Swap token0 for token1
+        amounts_in: Input amounts in wei (fee inclusive)
+
+    Returns:
+        Quote per input amount, None where the swap leaves the loaded
+        bitmap range or exhausts the pool
+    """
+    if not amounts_in:
+        return []
+
+    steps, thresholds = _walk_steps(pool, zero_for_one, max(amounts_in))
+
+    quotes: List[Optional[SwapQuote]] = []
+    for amount_in in amounts_in:
+        # First step whose cumulative cost reaches the input is the last one
+        index = bisect_left(thresholds, amount_in)
+        if amount_in <= 0 or index >= len(steps):
+            quotes.append(None)
+            continue
+
+        step = steps[index]
+        sqrt_price_after, _, step_out, _ = compute_swap_step(
+            step.sqrt_price_start,
+            step.sqrt_price_target,
+            step.liquidity,
+            amount_in - step.gross_in_before,
+            pool.fee,
+        )
+
+        crossed = step.crossed_before
+        if sqrt_price_after == step.sqrt_price_target == get_sqrt_ratio_at_tick(step.tick_next):
+            tick_after = step.tick_next - 1 if zero_for_one else step.tick_next
+            crossed += step.initialized
+        elif sqrt_price_after == step.sqrt_price_start:
+            tick_after = step.tick_start
+        else:
+            tick_after = get_tick_at_sqrt_ratio(sqrt_price_after)
+
+        quotes.append(SwapQuote(
+            amount_in=amount_in,
+            amount_out=step.out_before + step_out,
+            sqrt_price_before=pool.sqrt_price_x96,
+            sqrt_price_after=sqrt_price_after,
+            tick_after=tick_after,
+            initialized_ticks_crossed=crossed,
+            zero_for_one=zero_for_one,
+        ))
+
+    return quotes
+
+
+def quote_exact_input(pool: PoolSnapshot, zero_for_one: bool, amount_in: int) -> Optional[SwapQuote]:
+    """Simulate a single exact-input swap."""
+    return quote_exact_input_curve(pool, zero_for_one, [amount_in])[0]
@@ -0,0 +1,701 @@
+"""
+Local pool state mirror for Uniswap V3-style pools.
+
+Loads ``slot0``, active liquidity and the initialized ticks around the
+current price for each tracked pool once through Multicall3, then follows
+Swap/Mint/Burn logs so swaps can be simulated locally with the exact tick
+math in ``v3_math`` across every fee tier and many trade sizes at once.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..chains.multicall import (
+    MulticallAggregator,
+    MulticallCall,
+    decode_address,
+    decode_int,
+    decode_uint,
+    encode_address,
+    encode_call,
+    encode_int,
+    encode_uint,
+    multicall_aggregator,
+)
+from ..chains.rpc_cache import CHAIN_BLOCK_TIMES, DEFAULT_BLOCK_TIME
+from ..chains.rpc_pool import RpcPool, rpc_pool
+from .reserve_mirror import MAX_ADDRESSES_PER_QUERY, MAX_LOG_BLOCK_RANGE, STALE_AFTER_BLOCKS
+from .v3_math import PoolSnapshot, SwapQuote, quote_exact_input_curve, tick_position
+
+logger = logging.getLogger(__name__)
+
+# Pool and factory view selectors
+POOL_SLOT0_SELECTOR = "3850c7bd"  # slot0()
+POOL_LIQUIDITY_SELECTOR = "1a686502"  # liquidity()
+POOL_TICK_SPACING_SELECTOR = "d0c93a7c"  # tickSpacing()
+POOL_TICK_BITMAP_SELECTOR = "5339c296"  # tickBitmap(int16)
+POOL_TICKS_SELECTOR = "f30dba93"  # ticks(int24)
+FACTORY_GET_POOL_SELECTOR = "1698ee82"  # getPool(address,address,uint24)
+
+# Event topics
+SWAP_TOPIC = "0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67"
+PANCAKE_V3_SWAP_TOPIC = "0x19b47279256b2a23a1665c810c8d55a1758940ee09377d4f8d26497a3577dc83"
+MINT_TOPIC = "0x7a53080ba414158be7ec69b987b5fb7d07dee101fe85488f0853ae16239d0bde"
+BURN_TOPIC = "0x0c396cd989a39f4459b5fa1aed6a9a8dcdbc45908acfd67e028cd568da98982c"
+POOL_EVENT_TOPICS = [SWAP_TOPIC, PANCAKE_V3_SWAP_TOPIC, MINT_TOPIC, BURN_TOPIC]
+
+ZERO_ADDRESS = "0x" + "0" * 40
+
+# Bitmap words loaded on each side of the current tick's word
+BITMAP_WORDS_PER_SIDE = 2
+MAX_POOLS_PER_CHAIN = 2000
+MISSING_POOL_TTL_SECONDS = 300.0
+
+_SEEDED_LOG_INDEX = 2 ** 31  # Seeds reflect state at the end of their block
+_WORD = 32
+
+
+@dataclass
+class V3PoolState:
+    """Mirrored state of a V3-style pool."""
+    pool_address: str
+    factory: str
+    token0: str
+    token1: str
+    fee: int
+    snapshot: Optional[PoolSnapshot] = None
+    liquidity_gross: Dict[int, int] = field(default_factory=dict)
+    word_range: Tuple[int, int] = (0, -1)
+    block_number: int = -1
+    log_index: int = -1
+    updated_at: float = field(default_factory=time.monotonic)
+    needs_seed: bool = True
+
+
+def _pool_index_key(factory: str, token_a: str, token_b: str, fee: int) -> Tuple[str, str, str, int]:
+    """Order-independent index key for a factory pool."""
+    token_a, token_b = token_a.lower(), token_b.lower()
+    if token_b < token_a:
+        token_a, token_b = token_b, token_a
+    return factory.lower(), token_a, token_b, fee
+
+
+def _decode_slot0(data: bytes) -> Tuple[int, int]:
+    """Decode (sqrtPriceX96, tick) from ``slot0()``."""
+    return decode_uint(data), decode_int(data, _WORD)
+
+
+def _decode_tick_info(data: bytes) -> Tuple[int, int]:
+    """Decode (liquidityGross, liquidityNet) from ``ticks(int24)``."""
+    return decode_uint(data), decode_int(data, _WORD)
+
+
+class V3PoolMirror:
+    """
+    Per-chain in-memory pool store for tracked V3-style pools.
+
+    Pools are discovered per token pair across fee tiers, seeded at an
+    exact block (slot0, liquidity, bitmap words around the price and their
+    initialized ticks) and followed through Swap/Mint/Burn logs once per
+    block. Quotes that would leave the loaded tick range return None so
+    callers fall back to the Quoter contract.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[RpcPool] = None,
+        aggregator: Optional[MulticallAggregator] = None,
+        words_per_side: int = BITMAP_WORDS_PER_SIDE,
+        max_pools_per_chain: int = MAX_POOLS_PER_CHAIN,
+        stale_after_blocks: int = STALE_AFTER_BLOCKS,
+        auto_sync: bool = True,
+    ) -> None:
+        """
+        Initialize pool mirror.
+
+        Args:
+            pool: RPC pool for head and log queries
+            aggregator: Multicall aggregator for seeding pool state
+            words_per_side: Bitmap words loaded each side of the current tick
+            max_pools_per_chain: Tracked pool limit per chain (LRU evicted)
+            stale_after_blocks: Blocks without a successful sync before
+                mirrored state stops being served
+            auto_sync: Start a background log follower when pools are tracked
+        """
+        self.pool = pool or rpc_pool
+        self.aggregator = aggregator or multicall_aggregator
+        self.words_per_side = words_per_side
+        self.max_pools_per_chain = max_pools_per_chain
+        self.stale_after_blocks = stale_after_blocks
+        self.auto_sync = auto_sync
+
+        self._pools: Dict[str, "OrderedDict[str, V3PoolState]"] = {}
+        self._index: Dict[str, Dict[Tuple[str, str, str, int], str]] = {}
+        self._missing: Dict[str, Dict[Tuple[str, str, str, int], float]] = {}
+        self._discovering: Dict[str, asyncio.Task] = {}
+        self._synced_blocks: Dict[str, int] = {}
+        self._last_synced_at: Dict[str, float] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+        self.local_quotes = 0
+        self.logs_applied = 0
+
+    # ------------------------------------------------------------------
+    # Registration and discovery
+    # ------------------------------------------------------------------
+
+    def register_pool(
+        self,
+        chain: str,
+        factory: str,
+        pool_address: str,
+        token0: str,
+        token1: str,
+        fee: int,
+    ) -> V3PoolState:
+        """
+        Start tracking a pool; its state is loaded on the next sync.
+
+        Args:
+            chain: Blockchain network
+            factory: Factory address the pool belongs to
+            pool_address: Pool contract address
+            token0: Pool token0 address
+            token1: Pool token1 address
+            fee: Pool fee in hundredths of a bip
+
+        Returns:
+            Tracked pool state
+        """
+        pools = self._pools.setdefault(chain, OrderedDict())
+        pool_address = pool_address.lower()
+
+        state = pools.get(pool_address)
+        if state is None:
+            state = V3PoolState(
+                pool_address=pool_address,
+                factory=factory.lower(),
+                token0=token0.lower(),
+                token1=token1.lower(),
+                fee=fee,
+            )
+            pools[pool_address] = state
+            self._index.setdefault(chain, {})[_pool_index_key(factory, token0, token1, fee)] = pool_address
+            self._evict(chain)
+
+        if self.auto_sync:
+            self.ensure_running(chain)
+        return state
+
+    def _evict(self, chain: str) -> None:
+        """Drop least recently quoted pools beyond the per-chain limit."""
+        pools = self._pools[chain]
+        index = self._index[chain]
+        while len(pools) > self.max_pools_per_chain:
+            _, state = pools.popitem(last=False)
+            index.pop(_pool_index_key(state.factory, state.token0, state.token1, state.fee), None)
+
+    def _is_known_missing(self, chain: str, key: Tuple[str, str, str, int]) -> bool:
+        """Check whether a pool was recently confirmed not to exist."""
+        expires_at = self._missing.get(chain, {}).get(key)
+        return expires_at is not None and time.monotonic() < expires_at
+
+    async def discover_pools(
+        self,
+        chain: str,
+        factory: str,
+        token_a: str,
+        token_b: str,
+        fee_tiers: Iterable[int],
+    ) -> Dict[int, str]:
+        """
+        Look up and track a pair's pools across fee tiers in one round trip.
+
+        Args:
+            chain: Blockchain network
+            factory: Factory address
+            token_a: One pool token
+            token_b: The other pool token
+            fee_tiers: Fee tiers to look up
+
+        Returns:
+            Pool address per existing fee tier
+        """
+        token0, token1 = sorted((token_a.lower(), token_b.lower()))
+        index = self._index.get(chain, {})
+        found: Dict[int, str] = {}
+        unknown: List[int] = []
+
+        for fee in fee_tiers:
+            key = _pool_index_key(factory, token0, token1, fee)
+            if key in index:
+                found[fee] = index[key]
+            elif not self._is_known_missing(chain, key):
+                unknown.append(fee)
+
+        if not unknown:
+            return found
+
+        results = await self.aggregator.aggregate(
+            chain,
+            [
+                MulticallCall(
+                    factory,
+                    encode_call(
+                        FACTORY_GET_POOL_SELECTOR,
+                        encode_address(token0),
+                        encode_address(token1),
+                        encode_uint(fee),
+                    ),
+                    decode_address,
+                )
+                for fee in unknown
+            ],
+        )
+
+        missing = self._missing.setdefault(chain, {})
+        for fee, result in zip(unknown, results):
+            if not result.success:
+                continue
+            if result.value == ZERO_ADDRESS:
+                missing[_pool_index_key(factory, token0, token1, fee)] = (
+                    time.monotonic() + MISSING_POOL_TTL_SECONDS
+                )
+                continue
+            self.register_pool(chain, factory, result.value, token0, token1, fee)
+            found[fee] = result.value
+
+        return found
+
+    def watch_pair(
+        self,
+        chain: str,
+        factory: str,
+        token_a: str,
+        token_b: str,
+        fee_tiers: Iterable[int],
+    ) -> None:
+        """Discover a pair's pools in the background so later quotes are local."""
+        key = "|".join((chain, *_pool_index_key(factory, token_a, token_b, 0)[:3]))
+        task = self._discovering.get(key)
+        if task is not None and not task.done():
+            return
+
+        async def _discover() -> None:
+            try:
+                await self.discover_pools(chain, factory, token_a, token_b, fee_tiers)
+            except Exception as e:
+                logger.debug(
+                    f"V3 pool discovery failed on {chain}: {e}",
+                    extra={'extra_data': {'chain': chain, 'error': str(e)}}
+                )
+            finally:
+                self._discovering.pop(key, None)
+
+        try:
+            self._discovering[key] = asyncio.get_running_loop().create_task(_discover())
+        except RuntimeError:
+            pass
+
+    # ------------------------------------------------------------------
+    # Local quoting
+    # ------------------------------------------------------------------
+
+    def is_chain_fresh(self, chain: str) -> bool:
+        """Check whether the log follower for a chain is keeping up."""
+        last_synced = self._last_synced_at.get(chain)
+        if last_synced is None:
+            return False
+        block_time = CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+        return time.monotonic() - last_synced < block_time * self.stale_after_blocks
+
+    def get_pool(
+        self,
+        chain: str,
+        factory: str,
+        token_a: str,
+        token_b: str,
+        fee: int,
+    ) -> Optional[V3PoolState]:
+        """Get a usable pool state, or None if cold or stale."""
+        pool_address = self._index.get(chain, {}).get(_pool_index_key(factory, token_a, token_b, fee))
+        if pool_address is None:
+            return None
+
+        state = self._pools[chain][pool_address]
+        if state.needs_seed or state.snapshot is None or not self.is_chain_fresh(chain):
+            return None
+
+        self._pools[chain].move_to_end(pool_address)
+        return state
+
+    def quote_curve(
+        self,
+        chain: str,
+        factory: str,
+        token_in: str,
+        token_out: str,
+        amounts_in: Sequence[int],
+        fee_tiers: Iterable[int],
+    ) -> Optional[Dict[int, List[Optional[SwapQuote]]]]:
+        """
+        Simulate exact-input swaps for every fee tier and input size.
+
+        Args:
+            chain: Blockchain network
+            factory: Factory address of the DEX
+            token_in: Input token address
+            token_out: Output token address
+            amounts_in: Input amounts in wei
+            fee_tiers: Fee tiers to consider
+
+        Returns:
+            Quotes per size for each existing fee tier, or None unless every
+            tier is either warm or known not to exist
+        """
+        states: List[V3PoolState] = []
+        for fee in fee_tiers:
+            key = _pool_index_key(factory, token_in, token_out, fee)
+            if self._is_known_missing(chain, key):
+                continue
+            state = self.get_pool(chain, factory, token_in, token_out, fee)
+            if state is None:
+                return None
+            states.append(state)
+
+        zero_for_one = token_in.lower() < token_out.lower()
+        self.local_quotes += 1
+        return {
+            state.fee: quote_exact_input_curve(state.snapshot, zero_for_one, amounts_in)
+            for state in states
+        }
+
+    def quote(
+        self,
+        chain: str,
+        factory: str,
+        token_in: str,
+        token_out: str,
+        amount_in: int,
+        fee_tiers: Iterable[int],
+    ) -> Optional[Dict[int, SwapQuote]]:
+        """
+        Simulate one exact-input swap across fee tiers.
+
+        Returns:
+            Quote per fee tier that can fill the size, or None when any
+            tier is cold
+        """
+        curves = self.quote_curve(chain, factory, token_in, token_out, [amount_in], fee_tiers)
+        if curves is None:
+            return None
+        return {fee: quotes[0] for fee, quotes in curves.items() if quotes[0] is not None}
+
+    # ------------------------------------------------------------------
+    # Log following
+    # ------------------------------------------------------------------
+
+    def apply_log(self, chain: str, log: Dict) -> bool:
+        """
+        Apply a Swap, Mint or Burn log to the mirrored pool.
+
+        Logs older than the pool's current state are ignored; a removed
+        (reorged) log forces a re-seed.
+
+        Args:
+            chain: Blockchain network
+            log: Raw JSON-RPC log object
+
+        Returns:
+            True if the pool state changed
+        """
+        state = self._pools.get(chain, {}).get(log.get("address", "").lower())
+        if state is None or state.snapshot is None:
+            return False
+
+        if log.get("removed"):
+            state.needs_seed = True
+            return False
+
+        block_number = int(log["blockNumber"], 16)
+        log_index = int(log["logIndex"], 16)
+        if (block_number, log_index) <= (state.block_number, state.log_index):
+            return False
+
+        topics = [topic.lower() for topic in log.get("topics") or []]
+        data = bytes.fromhex(log["data"][2:])
+        snapshot = state.snapshot
+
+        if topics[0] in (SWAP_TOPIC, PANCAKE_V3_SWAP_TOPIC):
+            snapshot.sqrt_price_x96 = decode_uint(data[2 * _WORD:])
+            snapshot.liquidity = decode_uint(data[3 * _WORD:])
+            snapshot.tick = decode_int(data, 4 * _WORD)
+            word_pos, _ = tick_position(snapshot.tick, snapshot.tick_spacing)
+            low, high = state.word_range
+            if not low < word_pos < high:
+                # Price moved to the edge of the loaded ticks: reload around it
+                state.needs_seed = True
+        elif topics[0] in (MINT_TOPIC, BURN_TOPIC):
+            tick_lower = decode_int(bytes.fromhex(topics[2][2:]))
+            tick_upper = decode_int(bytes.fromhex(topics[3][2:]))
+            if topics[0] == MINT_TOPIC:
+                amount = decode_uint(data[_WORD:])
+            else:
+                amount = -decode_uint(data)
+            self._update_position(state, tick_lower, tick_upper, amount)
+        else:
+            return False
+
+        state.block_number = block_number
+        state.log_index = log_index
+        state.updated_at = time.monotonic()
+        self.logs_applied += 1
+        return True
+
+    def _update_position(self, state: V3PoolState, tick_lower: int, tick_upper: int, delta: int) -> None:
+        """Apply a liquidity change for a position, as Pool._modifyPosition does."""
+        if delta == 0:
+            return
+
+        snapshot = state.snapshot
+        low, high = state.word_range
+        for tick, net_delta in ((tick_lower, delta), (tick_upper, -delta)):
+            word_pos, bit_pos = tick_position(tick, snapshot.tick_spacing)
+            if not low <= word_pos <= high:
+                continue
+
+            gross_before = state.liquidity_gross.get(tick, 0)
+            gross_after = gross_before + delta
+            if gross_after <= 0:
+                state.liquidity_gross.pop(tick, None)
+                snapshot.liquidity_net.pop(tick, None)
+                snapshot.bitmap[word_pos] &= ~(1 << bit_pos)
+                continue
+
+            state.liquidity_gross[tick] = gross_after
+            snapshot.liquidity_net[tick] = snapshot.liquidity_net.get(tick, 0) + net_delta
+            if gross_before == 0:
+                snapshot.bitmap[word_pos] |= 1 << bit_pos
+
+        if tick_lower <= snapshot.tick < tick_upper:
+            snapshot.liquidity += delta
+
+    async def sync_once(self, chain: str) -> int:
+        """
+        Advance one chain to the current head.
+
+        Fetches pool logs for all tracked pools since the last synced block
+        and (re)loads pools that need seeding at the head block.
+
+        Args:
+            chain: Blockchain network
+
+        Returns:
+            Number of logs applied
+        """
+        pools = self._pools.get(chain)
+        if not pools:
+            return 0
+
+        head = int(await self.pool.make_request(chain, "eth_blockNumber", []), 16)
+        last_synced = self._synced_blocks.get(chain)
+
+        applied = 0
+        if last_synced is None or head - last_synced > MAX_LOG_BLOCK_RANGE:
+            for state in pools.values():
+                state.needs_seed = True
+        elif head > last_synced:
+            applied = await self._apply_logs(chain, list(pools), last_synced + 1, head)
+
+        await self._seed_pools(chain, [state for state in pools.values() if state.needs_seed], head)
+
+        self._synced_blocks[chain] = head
+        self._last_synced_at[chain] = time.monotonic()
+        return applied
+
+    async def _apply_logs(
+        self,
+        chain: str,
+        addresses: List[str],
+        from_block: int,
+        to_block: int,
+    ) -> int:
+        """Fetch and apply pool logs for addresses over a block range."""
+        logs: List[Dict] = []
+        for start in range(0, len(addresses), MAX_ADDRESSES_PER_QUERY):
+            result = await self.pool.make_request(
+                chain,
+                "eth_getLogs",
+                [{
+                    "fromBlock": hex(from_block),
+                    "toBlock": hex(to_block),
+                    "address": addresses[start:start + MAX_ADDRESSES_PER_QUERY],
+                    "topics": [POOL_EVENT_TOPICS],
+                }],
+            )
+            logs.extend(result or [])
+
+        logs.sort(key=lambda log: (int(log["blockNumber"], 16), int(log["logIndex"], 16)))
+        return sum(1 for log in logs if self.apply_log(chain, log))
+
+    async def _seed_pools(self, chain: str, states: List[V3PoolState], block_number: int) -> None:
+        """
+        Load pool state at an exact block.
+
+        Three aggregated reads: slot0/liquidity/tickSpacing, then the bitmap
+        words around each pool's tick, then the initialized ticks in them.
+        """
+        if not states:
+            return
+        block = hex(block_number)
+
+        calls: List[MulticallCall] = []
+        for state in states:
+            calls.extend([
+                MulticallCall(state.pool_address, encode_call(POOL_SLOT0_SELECTOR), _decode_slot0),
+                MulticallCall(state.pool_address, encode_call(POOL_LIQUIDITY_SELECTOR), decode_uint),
+                MulticallCall(state.pool_address, encode_call(POOL_TICK_SPACING_SELECTOR), decode_int),
+            ])
+        results = await self.aggregator.aggregate(chain, calls, block_identifier=block)
+
+        snapshots: List[Tuple[V3PoolState, PoolSnapshot]] = []
+        for position, state in enumerate(states):
+            slot0, liquidity, tick_spacing = results[3 * position:3 * position + 3]
+            if not (slot0.success and liquidity.success and tick_spacing.success):
+                continue
+            sqrt_price_x96, tick = slot0.value
+            snapshots.append((state, PoolSnapshot(
+                sqrt_price_x96=sqrt_price_x96,
+                tick=tick,
+                liquidity=liquidity.value,
+                fee=state.fee,
+                tick_spacing=tick_spacing.value,
+            )))
+
+        # Bitmap words around the current tick
+        word_calls: List[MulticallCall] = []
+        word_keys: List[Tuple[int, int]] = []
+        for position, (state, snapshot) in enumerate(snapshots):
+            center, _ = tick_position(snapshot.tick, snapshot.tick_spacing)
+            for word_pos in range(center - self.words_per_side, center + self.words_per_side + 1):
+                word_calls.append(MulticallCall(
+                    state.pool_address,
+                    encode_call(POOL_TICK_BITMAP_SELECTOR, encode_int(word_pos)),
+                    decode_uint,
+                ))
+                word_keys.append((position, word_pos))
+        word_results = await self.aggregator.aggregate(chain, word_calls, block_identifier=block) if word_calls else []
+
+        failed = set()
+        for (position, word_pos), result in zip(word_keys, word_results):
+            if not result.success:
+                failed.add(position)
+                continue
+            snapshots[position][1].bitmap[word_pos] = result.value
+
+        # Initialized ticks within the loaded words
+        tick_calls: List[MulticallCall] = []
+        tick_keys: List[Tuple[int, int]] = []
+        for position, (state, snapshot) in enumerate(snapshots):
+            if position in failed:
+                continue
+            for word_pos, word in snapshot.bitmap.items():
+                while word:
+                    bit_pos = (word & -word).bit_length() - 1
+                    word &= word - 1
+                    tick = ((word_pos << 8) + bit_pos) * snapshot.tick_spacing
+                    tick_calls.append(MulticallCall(
+                        state.pool_address,
+                        encode_call(POOL_TICKS_SELECTOR, encode_int(tick)),
+                        _decode_tick_info,
+                    ))
+                    tick_keys.append((position, tick))
+        tick_results = await self.aggregator.aggregate(chain, tick_calls, block_identifier=block) if tick_calls else []
+
+        gross: Dict[int, Dict[int, int]] = {}
+        for (position, tick), result in zip(tick_keys, tick_results):
+            if not result.success:
+                failed.add(position)
+                continue
+            liquidity_gross, liquidity_net = result.value
+            snapshots[position][1].liquidity_net[tick] = liquidity_net
+            gross.setdefault(position, {})[tick] = liquidity_gross
+
+        now = time.monotonic()
+        for position, (state, snapshot) in enumerate(snapshots):
+            if position in failed:
+                continue
+            center, _ = tick_position(snapshot.tick, snapshot.tick_spacing)
+            state.snapshot = snapshot
+            state.liquidity_gross = gross.get(position, {})
+            state.word_range = (center - self.words_per_side, center + self.words_per_side)
+            state.block_number = block_number
+            state.log_index = _SEEDED_LOG_INDEX
+            state.updated_at = now
+            state.needs_seed = False
+
+    async def _sync_loop(self, chain: str) -> None:
+        """Follow pool logs for a chain once per block."""
+        block_time = CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+        logger.info(
+            f"V3 pool mirror started for {chain}",
+            extra={'extra_data': {'chain': chain, 'interval_seconds': block_time}}
+        )
+
+        while self._pools.get(chain):
+            try:
+                await self.sync_once(chain)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"V3 pool mirror sync failed for {chain}: {e}",
+                    extra={'extra_data': {'chain': chain, 'error': str(e)}}
+                )
+            await asyncio.sleep(block_time)
+
+        self._tasks.pop(chain, None)
+
+    def ensure_running(self, chain: str) -> None:
+        """Start the log follower for a chain if it is not running."""
+        task = self._tasks.get(chain)
+        if task is not None and not task.done():
+            return
+        try:
+            self._tasks[chain] = asyncio.get_running_loop().create_task(self._sync_loop(chain))
+        except RuntimeError:
+            # No running loop (e.g. synchronous tests); sync_once can be driven manually
+            pass
+
+    async def stop(self) -> None:
+        """Stop all log followers and pending discoveries."""
+        tasks = list(self._tasks.values()) + list(self._discovering.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._discovering.clear()
+
+    def get_stats(self) -> Dict[str, object]:
+        """Get mirror statistics."""
+        return {
+            "chains": {
+                chain: {
+                    "tracked_pools": len(pools),
+                    "synced_block": self._synced_blocks.get(chain),
+                    "fresh": self.is_chain_fresh(chain),
+                }
+                for chain, pools in self._pools.items()
+            },
+            "local_quotes": self.local_quotes,
+            "logs_applied": self.logs_applied,
+        }
+
+
+# Global pool mirror instance
+v3_pool_mirror = V3PoolMirror()
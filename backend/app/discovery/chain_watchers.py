@@ -11,11 +11,16 @@ from dataclasses import dataclass
 from enum import Enum
 
 from web3 import Web3
-from web3.types import FilterParams, LogReceipt
 from websockets.exceptions import ConnectionClosed
 
 import logging
+from ..chains.contract_calls import contract_caller
 from ..core.settings import settings
+from .log_scanner import LogScanner
+from .ws_subscriber import WsSubscriber
+
+# Raw JSON-RPC log as returned by eth_getLogs
+LogReceipt = Dict[str, Any]
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +28,7 @@ logger = logging.getLogger(__name__)
 class EventType(str, Enum):
     """Types of events we monitor."""
     PAIR_CREATED = "pair_created"
+    PAIR_REMOVED = "pair_removed"  # PairCreated retracted by a reorg
     LIQUIDITY_ADDED = "liquidity_added"
     FIRST_SWAP = "first_swap"
     LARGE_SWAP = "large_swap"
@@ -70,19 +76,21 @@ class ChainWatcher:
     to identify new tokens immediately for early trading opportunities.
     """
     
-    def __init__(self, chain: str, w3: Web3):
+    def __init__(self, chain: str, w3: Web3, ws_url: Optional[str] = None):
         """
         Initialize chain watcher.
         
         Args:
             chain: Blockchain network (ethereum, bsc, polygon, etc.)
-            w3: Web3 instance for this chain
+            w3: Web3 instance for this chain (logs are read through the RPC pool)
+            ws_url: WebSocket RPC URL for eth_subscribe (defaults to settings)
         """
         self.chain = chain
         self.w3 = w3
         self.is_running = False
         self.event_callbacks: Dict[EventType, List[Callable]] = {
             EventType.PAIR_CREATED: [],
+            EventType.PAIR_REMOVED: [],
             EventType.LIQUIDITY_ADDED: [],
             EventType.FIRST_SWAP: [],
             EventType.LARGE_SWAP: [],
@@ -90,9 +98,23 @@ class ChainWatcher:
         
         # Factory contracts for different DEXs
         self.factory_configs = self._get_factory_configs()
+        self.factory_dexes: Dict[str, str] = {
+            config["address"].lower(): dex_name
+            for dex_name, config in self.factory_configs.items()
+        }
+        
+        # Head-following eth_getLogs scanner over all factories
+        self.scanner: Optional[LogScanner] = None
+        self.poll_interval = settings.discovery_poll_interval_ms / 1000
         
-        # Event filters
-        self.active_filters: Dict[str, Any] = {}
+        # Optional eth_subscribe transport; without it the scanner polls
+        if ws_url is None and settings.discovery_ws_enabled:
+            ws_url = settings.get_ws_url(chain)
+        self.ws_url = ws_url
+        self.subscriber: Optional[WsSubscriber] = None
+        self.subscriber_task: Optional[asyncio.Task] = None
+        self.head_timeout = settings.discovery_ws_head_timeout_ms / 1000
+        self._head_event = asyncio.Event()
         
         # Performance tracking
         self.events_processed = 0
@@ -193,8 +215,9 @@ class ChainWatcher:
         logger.info(f"Starting chain watcher for {self.chain}")
         
         try:
-            # Create event filters for all configured factories
-            await self._setup_event_filters()
+            # One log scanner covers every configured factory
+            self._setup_scanner()
+            self._start_subscriber()
             
             # Start the main event loop
             await self._event_loop()
@@ -208,45 +231,77 @@ class ChainWatcher:
         """Stop watching for events."""
         logger.info(f"Stopping chain watcher for {self.chain}")
         self.is_running = False
+        self._head_event.set()
         
-        # Clean up active filters
-        for filter_id in self.active_filters:
-            try:
-                self.w3.eth.uninstall_filter(filter_id)
-            except Exception as e:
-                logger.warning(f"Failed to uninstall filter {filter_id}: {e}")
+        if self.subscriber_task is not None:
+            self.subscriber.stop()
+            self.subscriber_task.cancel()
+            await asyncio.gather(self.subscriber_task, return_exceptions=True)
+            self.subscriber_task = None
+    
+    def _setup_scanner(self):
+        """Create the log scanner for all DEX factories on this chain."""
+        if self.scanner is not None:
+            return
+        
+        self.scanner = LogScanner(
+            chain=self.chain,
+            addresses=[config["address"] for config in self.factory_configs.values()],
+            topics=sorted({config["pair_created_topic"] for config in self.factory_configs.values()}),
+            on_logs=self._process_new_entries,
+            on_rollback=self._process_rollback,
+            name="pair_discovery",
+            reorg_depth=settings.discovery_reorg_depth,
+            max_chunk_blocks=settings.discovery_log_chunk_blocks,
+            max_backfill_blocks=settings.discovery_max_backfill_blocks,
+        )
         
-        self.active_filters.clear()
+        logger.info(
+            f"Created log scanner for {len(self.factory_configs)} factories on {self.chain}",
+            extra={
+                'extra_data': {
+                    'chain': self.chain,
+                    'factories': list(self.factory_configs.keys()),
+                    'reorg_depth': settings.discovery_reorg_depth,
+                }
+            }
+        )
     
-    async def _setup_event_filters(self):
-        """Setup event filters for all DEX factories on this chain."""
-        for dex_name, config in self.factory_configs.items():
-            try:
-                # Create filter for PairCreated events
-                filter_params = FilterParams(
-                    address=config["address"],
-                    topics=[config["pair_created_topic"]],
-                    fromBlock="latest"
-                )
-                
-                event_filter = self.w3.eth.filter(filter_params)
-                filter_id = event_filter.filter_id
-                self.active_filters[f"{dex_name}_pair_created"] = event_filter
-                
-                logger.info(
-                    f"Created event filter for {config['name']} on {self.chain}",
-                    extra={
-                        'extra_data': {
-                            'chain': self.chain,
-                            'dex': dex_name,
-                            'factory_address': config["address"],
-                            'filter_id': filter_id,
-                        }
-                    }
-                )
-                
-            except Exception as e:
-                logger.error(f"Failed to create filter for {dex_name}: {e}")
+    def _start_subscriber(self):
+        """Start the eth_subscribe transport when a WebSocket URL is set."""
+        if not self.ws_url or self.subscriber_task is not None:
+            return
+        
+        self.subscriber = WsSubscriber(
+            chain=self.chain,
+            url=self.ws_url,
+            addresses=self.scanner.addresses,
+            topics=self.scanner.topics,
+            on_head=self._on_new_head,
+            on_logs=self.scanner.push_logs,
+        )
+        self.subscriber_task = asyncio.create_task(self.subscriber.run())
+        logger.info(f"Started WebSocket subscriber for {self.chain}")
+    
+    async def _on_new_head(self, block_number: int):
+        """Wake the event loop for a pushed head."""
+        self._head_event.set()
+    
+    async def _wait_for_next_head(self):
+        """
+        Wait until the next scan is due.
+        
+        With a live subscription the loop wakes on each pushed head, with
+        the head timeout as a safety net; otherwise it polls.
+        """
+        if self.subscriber is None or not self.subscriber.is_connected:
+            await asyncio.sleep(self.poll_interval)
+            return
+        
+        try:
+            await asyncio.wait_for(self._head_event.wait(), self.head_timeout)
+        except asyncio.TimeoutError:
+            logger.debug(f"No head pushed on {self.chain} within {self.head_timeout}s, scanning")
     
     async def _event_loop(self):
         """Main event processing loop."""
@@ -259,17 +314,11 @@ class ChainWatcher:
                     await asyncio.sleep(1)
                     continue
                 
-                # Process events from all active filters
-                events_found = 0
-                for filter_name, event_filter in self.active_filters.items():
-                    try:
-                        new_entries = event_filter.get_new_entries()
-                        if new_entries:
-                            events_found += len(new_entries)
-                            await self._process_new_entries(filter_name, new_entries)
-                    
-                    except Exception as e:
-                        logger.warning(f"Error processing filter {filter_name}: {e}")
+                # Heads pushed during the scan trigger the next one
+                self._head_event.clear()
+                
+                # Scan from the persisted cursor up to the current head
+                events_found = await self.scanner.scan_once()
                 
                 # Track performance
                 if events_found > 0:
@@ -281,12 +330,13 @@ class ChainWatcher:
                                 'chain': self.chain,
                                 'events_count': events_found,
                                 'total_processed': self.events_processed,
+                                'cursor_block': self.scanner.cursor.last_block,
                             }
                         }
                     )
                 
-                # Sleep to prevent excessive polling
-                await asyncio.sleep(0.5)  # Poll every 500ms
+                # Wait for a pushed head, or poll
+                await self._wait_for_next_head()
                 
             except Exception as e:
                 logger.error(f"Event loop error on {self.chain}: {e}")
@@ -310,119 +360,154 @@ class ChainWatcher:
         self.event_timestamps.append(current_time)
         return True
     
-    async def _process_new_entries(self, filter_name: str, log_entries: List[LogReceipt]):
+    async def _process_new_entries(self, log_entries: List[LogReceipt]):
         """
-        Process new log entries from event filter.
+        Process new log entries from the scanner.
         
         Args:
-            filter_name: Name of the filter that generated these entries
-            log_entries: List of log entries to process
+            log_entries: Raw logs in chain order
         """
+        block_timestamps = await self._get_block_timestamps(log_entries)
+        
         for log_entry in log_entries:
             try:
-                await self._process_log_entry(filter_name, log_entry)
+                pair_event = self._decode_pair_created(log_entry, block_timestamps)
+                if pair_event is not None:
+                    await self._emit_pair_created(pair_event)
             except Exception as e:
                 logger.error(
                     f"Failed to process log entry: {e}",
                     extra={
                         'extra_data': {
                             'chain': self.chain,
-                            'filter_name': filter_name,
+                            'factory_address': log_entry.get('address'),
                             'block_number': log_entry.get('blockNumber'),
-                            'transaction_hash': log_entry.get('transactionHash', '').hex() if log_entry.get('transactionHash') else None,
+                            'transaction_hash': log_entry.get('transactionHash'),
                         }
                     }
                 )
     
-    async def _process_log_entry(self, filter_name: str, log_entry: LogReceipt):
-        """Process a single log entry."""
-        # Extract DEX name from filter name
-        dex_name = filter_name.split('_')[0] + '_' + filter_name.split('_')[1]  # e.g., "uniswap_v2"
-        
-        # Generate trace ID for this event
-        trace_id = f"{self.chain}_{log_entry['blockNumber']}_{log_entry['logIndex']}"
+    async def _process_rollback(self, fork_block: int, retracted: List[LogReceipt]):
+        """
+        Retract pairs whose PairCreated logs were reorged out.
         
-        if "pair_created" in filter_name:
-            await self._process_pair_created_event(dex_name, log_entry, trace_id)
-    
-    async def _process_pair_created_event(self, dex_name: str, log_entry: LogReceipt, trace_id: str):
-        """Process a PairCreated event."""
-        try:
-            # Decode the event data
-            topics = log_entry['topics']
-            data = log_entry['data']
-            
-            # For V2 factories: PairCreated(indexed token0, indexed token1, pair, uint)
-            # For V3 factories: PoolCreated(indexed token0, indexed token1, indexed fee, int24, address)
-            
-            if len(topics) < 3:
-                logger.warning(f"Insufficient topics in PairCreated event: {len(topics)}")
-                return
-            
-            # Extract token addresses from topics
-            token0 = self.w3.to_checksum_address('0x' + topics[1].hex()[26:])  # Remove 0x and padding
-            token1 = self.w3.to_checksum_address('0x' + topics[2].hex()[26:])
-            
-            # Extract pair address from data
-            if dex_name.endswith('_v2'):
-                # V2: pair address is in data
-                pair_address = self.w3.to_checksum_address('0x' + data[26:66])
-            else:
-                # V3: pool address is at the end of data
-                pool_address_offset = len(data) - 40  # 20 bytes = 40 hex chars
-                pair_address = self.w3.to_checksum_address('0x' + data[pool_address_offset:])
-            
-            # Get block information
-            block_number = log_entry['blockNumber']
-            transaction_hash = log_entry['transactionHash'].hex()
-            
-            # Get block timestamp
-            try:
-                block = self.w3.eth.get_block(block_number)
-                block_timestamp = block['timestamp']
-            except Exception as e:
-                logger.warning(f"Failed to get block timestamp: {e}")
-                block_timestamp = int(time.time())
-            
-            # Create event object
-            pair_event = PairCreatedEvent(
-                chain=self.chain,
-                dex=dex_name,
-                factory_address=log_entry['address'],
-                pair_address=pair_address,
-                token0=token0,
-                token1=token1,
-                block_number=block_number,
-                block_timestamp=block_timestamp,
-                transaction_hash=transaction_hash,
-                log_index=log_entry['logIndex'],
-                trace_id=trace_id,
-            )
-            
-            # Update tracking
-            self.last_block_processed = max(self.last_block_processed, block_number)
+        Args:
+            fork_block: Last block still on the canonical chain
+            retracted: Logs emitted above the fork block
+        """
+        for log_entry in retracted:
+            pair_event = self._decode_pair_created(log_entry, {})
+            if pair_event is None:
+                continue
             
-            logger.info(
-                f"New pair discovered: {token0}/{token1} on {dex_name}",
+            logger.warning(
+                f"Pair retracted by reorg: {pair_event.pair_address} on {pair_event.dex}",
                 extra={
                     'extra_data': {
                         'chain': self.chain,
-                        'dex': dex_name,
-                        'pair_address': pair_address,
-                        'token0': token0,
-                        'token1': token1,
-                        'block_number': block_number,
-                        'transaction_hash': transaction_hash,
-                        'trace_id': trace_id,
+                        'pair_address': pair_event.pair_address,
+                        'block_number': pair_event.block_number,
+                        'fork_block': fork_block,
+                        'trace_id': pair_event.trace_id,
                     }
                 }
             )
-            
-            # Call registered callbacks
-            await self._notify_callbacks(EventType.PAIR_CREATED, pair_event)
-            
-        except Exception as e:
-            logger.error(f"Failed to process PairCreated event: {e}")
+            await self._notify_callbacks(EventType.PAIR_REMOVED, pair_event)
+    
+    async def _get_block_timestamps(self, log_entries: List[LogReceipt]) -> Dict[int, int]:
+        """Get timestamps for the blocks of a log batch."""
+        timestamps: Dict[int, int] = {}
+        missing = set()
+        for log_entry in log_entries:
+            block_number = int(log_entry['blockNumber'], 16)
+            if log_entry.get('blockTimestamp'):
+                timestamps[block_number] = int(log_entry['blockTimestamp'], 16)
+            else:
+                missing.add(block_number)
+        
+        missing -= timestamps.keys()
+        if missing:
+            ordered = sorted(missing)
+            results = await asyncio.gather(
+                *[contract_caller.get_block_timestamp(self.chain, number) for number in ordered],
+                return_exceptions=True,
+            )
+            for number, result in zip(ordered, results):
+                if isinstance(result, Exception):
+                    logger.warning(f"Failed to get block timestamp: {result}")
+                    result = int(time.time())
+                timestamps[number] = result
+        
+        return timestamps
+    
+    def _decode_pair_created(
+        self,
+        log_entry: LogReceipt,
+        block_timestamps: Dict[int, int],
+    ) -> Optional[PairCreatedEvent]:
+        """Decode a raw PairCreated/PoolCreated log."""
+        dex_name = self.factory_dexes.get(log_entry['address'].lower())
+        if dex_name is None:
+            return None
+        
+        # For V2 factories: PairCreated(indexed token0, indexed token1, pair, uint)
+        # For V3 factories: PoolCreated(indexed token0, indexed token1, indexed fee, int24, address)
+        topics = log_entry['topics']
+        if len(topics) < 3:
+            logger.warning(f"Insufficient topics in PairCreated event: {len(topics)}")
+            return None
+        
+        # Extract token addresses from topics
+        token0 = Web3.to_checksum_address('0x' + topics[1][-40:])
+        token1 = Web3.to_checksum_address('0x' + topics[2][-40:])
+        
+        # Pair address is the first data word for V2 and the last for V3
+        data = log_entry['data'][2:]
+        if dex_name.endswith('_v2'):
+            pair_address = Web3.to_checksum_address('0x' + data[24:64])
+        else:
+            pair_address = Web3.to_checksum_address('0x' + data[-40:])
+        
+        block_number = int(log_entry['blockNumber'], 16)
+        log_index = int(log_entry['logIndex'], 16)
+        
+        return PairCreatedEvent(
+            chain=self.chain,
+            dex=dex_name,
+            factory_address=Web3.to_checksum_address(log_entry['address']),
+            pair_address=pair_address,
+            token0=token0,
+            token1=token1,
+            block_number=block_number,
+            block_timestamp=block_timestamps.get(block_number, int(time.time())),
+            transaction_hash=log_entry['transactionHash'],
+            log_index=log_index,
+            trace_id=f"{self.chain}_{block_number}_{log_index}",
+        )
+    
+    async def _emit_pair_created(self, pair_event: PairCreatedEvent):
+        """Record and publish a new pair."""
+        # Update tracking
+        self.last_block_processed = max(self.last_block_processed, pair_event.block_number)
+        
+        logger.info(
+            f"New pair discovered: {pair_event.token0}/{pair_event.token1} on {pair_event.dex}",
+            extra={
+                'extra_data': {
+                    'chain': self.chain,
+                    'dex': pair_event.dex,
+                    'pair_address': pair_event.pair_address,
+                    'token0': pair_event.token0,
+                    'token1': pair_event.token1,
+                    'block_number': pair_event.block_number,
+                    'transaction_hash': pair_event.transaction_hash,
+                    'trace_id': pair_event.trace_id,
+                }
+            }
+        )
+        
+        # Call registered callbacks
+        await self._notify_callbacks(EventType.PAIR_CREATED, pair_event)
     
     async def _notify_callbacks(self, event_type: EventType, event_data: Any):
         """Notify all registered callbacks for an event type."""
@@ -449,7 +534,8 @@ class ChainWatcher:
             "uptime_seconds": uptime,
             "events_processed": self.events_processed,
             "last_block_processed": self.last_block_processed,
-            "active_filters": len(self.active_filters),
+            "scanner": self.scanner.get_stats() if self.scanner else None,
+            "subscriber": self.subscriber.get_stats() if self.subscriber else None,
             "events_per_minute": len([
                 ts for ts in self.event_timestamps 
                 if time.time() - ts < 60
@@ -470,6 +556,7 @@ class DiscoveryEngine:
         
         # Discovery callbacks
         self.discovery_callbacks: List[Callable] = []
+        self.removed_pairs = 0
     
     def add_chain_watcher(self, chain: str, w3: Web3):
         """Add a chain watcher to the discovery engine."""
@@ -480,8 +567,9 @@ class DiscoveryEngine:
         watcher = ChainWatcher(chain, w3)
         self.watchers[chain] = watcher
         
-        # Register discovery callback
+        # Register discovery callbacks
         watcher.add_event_callback(EventType.PAIR_CREATED, self._on_pair_discovered)
+        watcher.add_event_callback(EventType.PAIR_REMOVED, self._on_pair_removed)
         
         logger.info(f"Added chain watcher for {chain}")
     
@@ -546,6 +634,22 @@ class DiscoveryEngine:
             except Exception as e:
                 logger.error(f"Discovery callback error: {e}")
     
+    async def _on_pair_removed(self, pair_event: PairCreatedEvent):
+        """Handle a discovered pair being reorged out."""
+        self.removed_pairs += 1
+        logger.warning(
+            f"Discovered pair reorged out: {pair_event.pair_address} on {pair_event.dex}",
+            extra={
+                'extra_data': {
+                    'chain': pair_event.chain,
+                    'dex': pair_event.dex,
+                    'pair_address': pair_event.pair_address,
+                    'block_number': pair_event.block_number,
+                    'trace_id': pair_event.trace_id,
+                }
+            }
+        )
+    
     def get_discovery_stats(self) -> Dict[str, Any]:
         """Get discovery statistics across all chains."""
         stats = {
@@ -554,6 +658,7 @@ class DiscoveryEngine:
             "total_events_processed": sum(
                 watcher.events_processed for watcher in self.watchers.values()
             ),
+            "removed_pairs": self.removed_pairs,
             "chain_stats": {
                 chain: watcher.get_stats() 
                 for chain, watcher in self.watchers.items()
@@ -1,14 +1,22 @@
 """
 Dexscreener API integration for pair validation and market data enrichment.
+
+Pair and token lookups are coalesced: concurrent requests on a chain are
+collected for a short window and sent as one multi-address request (up to
+``MAX_ADDRESSES_PER_REQUEST``), behind a shared token-bucket rate limit in
+which execution-path lookups are served before background enrichment.
+Results, including lookups that found nothing, are kept in a bounded
+LRU + TTL cache.
 """
 from __future__ import annotations
 
 import asyncio
 import time
+from collections import OrderedDict, deque
 from decimal import Decimal
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 
 import httpx
 
@@ -81,6 +89,284 @@ class DexscreenerResponse:
     error_message: Optional[str] = None
 
 
+class LookupPriority(IntEnum):
+    """Rate-limit lane; lower values are served first."""
+    EXECUTION = 0  # Lookups a trade decision is waiting on
+    BACKGROUND = 1  # Discovery enrichment and validation
+
+
+# Largest number of comma-separated addresses the API accepts per request
+MAX_ADDRESSES_PER_REQUEST = 30
+
+LookupKey = Tuple[str, str, str]
+
+
+def address_key(address: str) -> str:
+    """Normalize an address for matching (EVM lower-cased, others kept)."""
+    return address.lower() if address.startswith("0x") else address
+
+
+class TokenBucketLimiter:
+    """
+    Async token bucket with priority lanes.
+
+    ``rate`` tokens are added per second up to ``burst``. Callers that find
+    the bucket empty queue in their lane and are woken in lane order as
+    tokens refill, so a burst of background lookups cannot delay an
+    execution-path lookup by more than one refill interval.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize limiter.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity
+        """
+        self.rate = rate
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._waiters: Dict[LookupPriority, Deque[asyncio.Future]] = {
+            priority: deque() for priority in LookupPriority
+        }
+        self._wake_handle: Optional[asyncio.TimerHandle] = None
+
+        self.acquired = 0
+        self.waited = 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _has_waiters(self) -> bool:
+        return any(self._waiters.values())
+
+    async def acquire(self, priority: LookupPriority = LookupPriority.BACKGROUND) -> None:
+        """Wait for one token."""
+        self.acquired += 1
+        self._refill()
+        if self.tokens >= 1 and not self._has_waiters():
+            self.tokens -= 1
+            return
+
+        self.waited += 1
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        self._schedule_wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Granted just as the caller was cancelled: hand the token back
+                self.tokens += 1
+                self._wake()
+            raise
+
+    def _schedule_wake(self) -> None:
+        if self._wake_handle is None:
+            delay = max(0.0, (1 - self.tokens) / self.rate)
+            self._wake_handle = asyncio.get_running_loop().call_later(delay, self._wake)
+
+    def _wake(self) -> None:
+        """Grant refilled tokens to waiters, most urgent lane first."""
+        if self._wake_handle is not None:
+            self._wake_handle.cancel()
+            self._wake_handle = None
+        self._refill()
+        for priority in LookupPriority:
+            lane = self._waiters[priority]
+            while lane and self.tokens >= 1:
+                future = lane.popleft()
+                if future.done():
+                    continue
+                self.tokens -= 1
+                future.set_result(None)
+        if self._has_waiters():
+            self._schedule_wake()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics."""
+        return {
+            "rate_per_second": self.rate,
+            "burst": self.burst,
+            "acquired": self.acquired,
+            "waited": self.waited,
+            "waiting": {priority.name.lower(): len(self._waiters[priority]) for priority in LookupPriority},
+        }
+
+
+class DexscreenerCache:
+    """
+    LRU + TTL cache of lookup results.
+
+    Lookups that found pairs live for ``ttl`` seconds; lookups that found
+    none (negative entries) for ``negative_ttl``, so unknown addresses are
+    not re-requested on every discovery event but new listings still show
+    up soon. Failed requests are never cached.
+    """
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 60.0, max_entries: int = 5000) -> None:
+        """Initialize cache."""
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[LookupKey, Tuple[List[PairInfo], float]]" = OrderedDict()
+
+        self.hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: LookupKey) -> Tuple[bool, Optional[List[PairInfo]]]:
+        """
+        Look up a result.
+
+        Returns:
+            Tuple of (hit, pairs)
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        pairs, expires_at = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        if pairs:
+            self.hits += 1
+        else:
+            self.negative_hits += 1
+        return True, pairs
+
+    def put(self, key: LookupKey, pairs: List[PairInfo]) -> None:
+        """Store a result, evicting the least recently used beyond ``max_entries``."""
+        ttl = self.ttl if pairs else self.negative_ttl
+        self._entries[key] = (pairs, time.monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        now = time.monotonic()
+        expired = sum(1 for _, expires_at in self._entries.values() if now >= expires_at)
+        negative = sum(1 for pairs, _ in self._entries.values() if not pairs)
+        lookups = self.hits + self.negative_hits + self.misses
+        return {
+            "total_entries": len(self._entries),
+            "valid_entries": len(self._entries) - expired,
+            "expired_entries": expired,
+            "negative_entries": negative,
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round((self.hits + self.negative_hits) / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "cache_ttl_seconds": self.ttl,
+            "negative_ttl_seconds": self.negative_ttl,
+        }
+
+
+class DexscreenerBatcher:
+    """
+    Coalesces concurrent lookups of one kind on one chain.
+
+    Addresses submitted within ``window_ms`` of the first pending one (or
+    until ``MAX_ADDRESSES_PER_REQUEST`` are pending) are fetched with one
+    multi-address request. An address already pending or in flight is not
+    requested twice. Execution-priority lookups flush on the next loop tick
+    instead of waiting for the window.
+    """
+
+    def __init__(self, client: "DexscreenerClient", kind: str, chain: str, window_ms: float) -> None:
+        """Initialize batcher."""
+        self.client = client
+        self.kind = kind
+        self.chain = chain
+        self.window_seconds = max(window_ms, 0.0) / 1000
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._priority = LookupPriority.BACKGROUND
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._flush_urgent = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def submit(self, address: str, priority: LookupPriority) -> asyncio.Future:
+        """
+        Queue an address for the next batch.
+
+        Returns:
+            Future resolving to the address's ``(pairs, error)``
+        """
+        key = address_key(address)
+        future = self._pending.get(key) or self._inflight.get(key)
+        if future is not None:
+            self.client.coalesced_lookups += 1
+            if key in self._pending:
+                self._raise_priority(priority)
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        self._raise_priority(priority)
+        if len(self._pending) >= MAX_ADDRESSES_PER_REQUEST:
+            self.flush()
+        return future
+
+    def _raise_priority(self, priority: LookupPriority) -> None:
+        """Record the most urgent pending lookup and schedule the flush."""
+        self._priority = min(self._priority, priority)
+        loop = asyncio.get_running_loop()
+        urgent = self._priority is LookupPriority.EXECUTION or self.window_seconds == 0
+        if self._flush_handle is not None and (self._flush_urgent or not urgent):
+            return
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush_urgent = urgent
+        self._flush_handle = (
+            loop.call_soon(self.flush) if urgent else loop.call_later(self.window_seconds, self.flush)
+        )
+
+    def flush(self) -> None:
+        """Send all pending addresses as one request."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, {}
+        priority, self._priority = self._priority, LookupPriority.BACKGROUND
+        self._inflight.update(batch)
+
+        task = asyncio.create_task(self.client._execute_batch(self.kind, self.chain, batch, priority))
+        self._tasks.add(task)
+
+        def _done(finished: asyncio.Task) -> None:
+            self._tasks.discard(finished)
+            for key in batch:
+                self._inflight.pop(key, None)
+
+        task.add_done_callback(_done)
+
+    async def close(self) -> None:
+        """Flush pending lookups and wait for in-flight requests."""
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
 class DexscreenerClient:
     """
     Client for Dexscreener API integration.
@@ -94,12 +380,24 @@ class DexscreenerClient:
         self.base_url = "https://api.dexscreener.com/latest"
         self.timeout = httpx.Timeout(10.0, connect=3.0)
         self.max_retries = 3
-        self.rate_limit_delay = 1.0  # 1 second between requests
-        self.last_request_time = 0.0
+        self.batch_window_ms = settings.dexscreener_batch_window_ms
+        self.limiter = TokenBucketLimiter(
+            rate=settings.dexscreener_requests_per_minute / 60,
+            burst=settings.dexscreener_burst,
+        )
         
         # Cache for reducing API calls
         self.cache_ttl = 300  # 5 minutes
-        self.pair_cache: Dict[str, Dict[str, Any]] = {}
+        self.cache = DexscreenerCache(
+            ttl=self.cache_ttl,
+            negative_ttl=settings.dexscreener_negative_cache_seconds,
+            max_entries=settings.dexscreener_cache_max_entries,
+        )
+        self._batchers: Dict[Tuple[str, str], DexscreenerBatcher] = {}
+        
+        self.upstream_requests = 0
+        self.batched_lookups = 0
+        self.coalesced_lookups = 0
         
         # Chain mapping for Dexscreener
         self.chain_mapping = {
@@ -115,205 +413,174 @@ class DexscreenerClient:
         self,
         token_address: str,
         chain: str,
+        priority: LookupPriority = LookupPriority.BACKGROUND,
     ) -> DexscreenerResponse:
         """
         Search for pairs by token address.
         
+        Concurrent searches on a chain share one multi-token request.
+        
         Args:
             token_address: Token contract address
             chain: Blockchain network
+            priority: Rate-limit lane for the request
             
         Returns:
             DexscreenerResponse: API response with pair information
         """
-        start_time = time.time()
-        
-        try:
-            # Check cache first
-            cache_key = f"{chain}:{token_address.lower()}"
-            if cache_key in self.pair_cache:
-                cached_data = self.pair_cache[cache_key]
-                if time.time() - cached_data["timestamp"] < self.cache_ttl:
-                    logger.debug(f"Using cached Dexscreener data for {token_address}")
-                    cached_data["data"].response_time_ms = (time.time() - start_time) * 1000
-                    return cached_data["data"]
-            
-            # Map chain to Dexscreener format
-            dex_chain = self.chain_mapping.get(chain)
-            if not dex_chain:
-                return DexscreenerResponse(
-                    pairs=[],
-                    success=False,
-                    response_time_ms=(time.time() - start_time) * 1000,
-                    error_message=f"Chain {chain} not supported by Dexscreener"
-                )
-            
-            # Rate limiting
-            await self._enforce_rate_limit()
-            
-            # Make API request
-            url = f"{self.base_url}/dex/tokens/{token_address}"
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-            
-            # Parse response
-            pairs = []
-            if "pairs" in data and data["pairs"]:
-                for pair_data in data["pairs"]:
-                    # Filter by chain
-                    if pair_data.get("chainId") == dex_chain.value:
-                        pair_info = self._parse_pair_data(pair_data)
-                        if pair_info:
-                            pairs.append(pair_info)
-            
-            result = DexscreenerResponse(
-                pairs=pairs,
-                success=True,
-                response_time_ms=(time.time() - start_time) * 1000
-            )
-            
-            # Cache the result
-            self.pair_cache[cache_key] = {
-                "data": result,
-                "timestamp": time.time(),
-            }
-            
-            logger.info(
-                f"Dexscreener search completed: {len(pairs)} pairs found for {token_address}",
-                extra={
-                    'extra_data': {
-                        'token_address': token_address,
-                        'chain': chain,
-                        'pairs_found': len(pairs),
-                        'response_time_ms': result.response_time_ms,
-                    }
-                }
-            )
-            
-            return result
-            
-        except httpx.TimeoutException:
-            logger.warning(f"Dexscreener API timeout for {token_address}")
-            return DexscreenerResponse(
-                pairs=[],
-                success=False,
-                response_time_ms=(time.time() - start_time) * 1000,
-                error_message="API request timeout"
-            )
-        except httpx.HTTPStatusError as e:
-            logger.warning(f"Dexscreener API error {e.response.status_code} for {token_address}")
-            return DexscreenerResponse(
-                pairs=[],
-                success=False,
-                response_time_ms=(time.time() - start_time) * 1000,
-                error_message=f"HTTP {e.response.status_code}"
-            )
-        except Exception as e:
-            logger.error(f"Dexscreener API error for {token_address}: {e}")
-            return DexscreenerResponse(
-                pairs=[],
-                success=False,
-                response_time_ms=(time.time() - start_time) * 1000,
-                error_message=str(e)
-            )
+        return await self._lookup("tokens", token_address, chain, priority)
     
     async def get_pair_by_address(
         self,
         pair_address: str,
         chain: str,
+        priority: LookupPriority = LookupPriority.BACKGROUND,
     ) -> DexscreenerResponse:
         """
         Get pair information by pair address.
         
+        Concurrent lookups on a chain share one multi-pair request.
+        
         Args:
             pair_address: Pair contract address
             chain: Blockchain network
+            priority: Rate-limit lane for the request
             
         Returns:
             DexscreenerResponse: API response with pair information
         """
+        return await self._lookup("pairs", pair_address, chain, priority)
+    
+    async def _lookup(
+        self,
+        kind: str,
+        address: str,
+        chain: str,
+        priority: LookupPriority,
+    ) -> DexscreenerResponse:
+        """Serve one address from the cache or its chain's next batch."""
         start_time = time.time()
         
-        try:
-            # Check cache first
-            cache_key = f"pair:{chain}:{pair_address.lower()}"
-            if cache_key in self.pair_cache:
-                cached_data = self.pair_cache[cache_key]
-                if time.time() - cached_data["timestamp"] < self.cache_ttl:
-                    logger.debug(f"Using cached Dexscreener data for pair {pair_address}")
-                    cached_data["data"].response_time_ms = (time.time() - start_time) * 1000
-                    return cached_data["data"]
-            
-            # Map chain to Dexscreener format
-            dex_chain = self.chain_mapping.get(chain)
-            if not dex_chain:
+        # Map chain to Dexscreener format
+        if chain not in self.chain_mapping:
+            return DexscreenerResponse(
+                pairs=[],
+                success=False,
+                response_time_ms=(time.time() - start_time) * 1000,
+                error_message=f"Chain {chain} not supported by Dexscreener"
+            )
+        
+        hit, pairs = self.cache.get((kind, chain, address_key(address)))
+        if hit:
+            logger.debug(f"Using cached Dexscreener data for {address}")
+        else:
+            batcher = self._batchers.get((kind, chain))
+            if batcher is None:
+                batcher = self._batchers[(kind, chain)] = DexscreenerBatcher(
+                    self, kind, chain, self.batch_window_ms
+                )
+            # Shield so one cancelled caller does not fail the others
+            pairs, error = await asyncio.shield(batcher.submit(address, priority))
+            if error is not None:
                 return DexscreenerResponse(
                     pairs=[],
                     success=False,
                     response_time_ms=(time.time() - start_time) * 1000,
-                    error_message=f"Chain {chain} not supported by Dexscreener"
+                    error_message=error
                 )
-            
-            # Rate limiting
-            await self._enforce_rate_limit()
-            
-            # Make API request
-            url = f"{self.base_url}/dex/pairs/{dex_chain.value}/{pair_address}"
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-            
-            # Parse response
-            pairs = []
-            if "pair" in data and data["pair"]:
-                pair_info = self._parse_pair_data(data["pair"])
-                if pair_info:
-                    pairs.append(pair_info)
-            elif "pairs" in data and data["pairs"]:
-                for pair_data in data["pairs"]:
-                    pair_info = self._parse_pair_data(pair_data)
-                    if pair_info:
-                        pairs.append(pair_info)
-            
-            result = DexscreenerResponse(
-                pairs=pairs,
-                success=True,
-                response_time_ms=(time.time() - start_time) * 1000
-            )
-            
-            # Cache the result
-            self.pair_cache[cache_key] = {
-                "data": result,
-                "timestamp": time.time(),
-            }
-            
-            logger.info(
-                f"Dexscreener pair lookup completed: {len(pairs)} pairs found for {pair_address}",
-                extra={
-                    'extra_data': {
-                        'pair_address': pair_address,
-                        'chain': chain,
-                        'pairs_found': len(pairs),
-                        'response_time_ms': result.response_time_ms,
-                    }
-                }
-            )
-            
-            return result
-            
+        
+        return DexscreenerResponse(
+            pairs=list(pairs),
+            success=True,
+            response_time_ms=(time.time() - start_time) * 1000
+        )
+    
+    async def _execute_batch(
+        self,
+        kind: str,
+        chain: str,
+        batch: Dict[str, asyncio.Future],
+        priority: LookupPriority,
+    ) -> None:
+        """
+        Fetch one multi-address request and resolve each address's future.
+        
+        Args:
+            kind: "pairs" or "tokens"
+            chain: Blockchain network
+            batch: Address key -> future awaiting its result
+            priority: Rate-limit lane
+        """
+        dex_chain = self.chain_mapping[chain]
+        addresses = ",".join(batch)
+        if kind == "pairs":
+            url = f"{self.base_url}/dex/pairs/{dex_chain.value}/{addresses}"
+        else:
+            url = f"{self.base_url}/dex/tokens/{addresses}"
+        
+        start_time = time.time()
+        try:
+            await self.limiter.acquire(priority)
+            self.upstream_requests += 1
+            self.batched_lookups += len(batch)
+            data = await self._get_json(url)
         except Exception as e:
-            logger.error(f"Dexscreener pair lookup error for {pair_address}: {e}")
-            return DexscreenerResponse(
-                pairs=[],
-                success=False,
-                response_time_ms=(time.time() - start_time) * 1000,
-                error_message=str(e)
-            )
+            if isinstance(e, httpx.TimeoutException):
+                error = "API request timeout"
+            elif isinstance(e, httpx.HTTPStatusError):
+                error = f"HTTP {e.response.status_code}"
+            else:
+                error = str(e)
+            logger.warning(f"Dexscreener {kind} lookup failed for {len(batch)} addresses on {chain}: {error}")
+            for future in batch.values():
+                if not future.done():
+                    future.set_result(([], error))
+            return
+        
+        results: Dict[str, List[PairInfo]] = {key: [] for key in batch}
+        pairs_data = data.get("pairs") or ([data["pair"]] if data.get("pair") else [])
+        for pair_data in pairs_data:
+            if kind == "pairs":
+                keys = [address_key(pair_data.get("pairAddress", ""))]
+            else:
+                # Filter by chain; a pair matches each searched token it contains
+                if pair_data.get("chainId") != dex_chain.value:
+                    continue
+                keys = list(dict.fromkeys(
+                    address_key(pair_data.get(side, {}).get("address", ""))
+                    for side in ("baseToken", "quoteToken")
+                ))
+            keys = [key for key in keys if key in results]
+            if not keys:
+                continue
+            pair_info = self._parse_pair_data(pair_data)
+            if pair_info:
+                for key in keys:
+                    results[key].append(pair_info)
+        
+        for key, future in batch.items():
+            self.cache.put((kind, chain, key), results[key])
+            if not future.done():
+                future.set_result((results[key], None))
+        
+        logger.info(
+            f"Dexscreener {kind} batch completed: {len(batch)} addresses on {chain}",
+            extra={
+                'extra_data': {
+                    'chain': chain,
+                    'addresses': len(batch),
+                    'found': sum(1 for pairs in results.values() if pairs),
+                    'response_time_ms': (time.time() - start_time) * 1000,
+                }
+            }
+        )
+    
+    async def _get_json(self, url: str) -> Dict[str, Any]:
+        """GET a Dexscreener endpoint and decode its JSON body."""
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(url)
+            response.raise_for_status()
+            return response.json()
     
     async def get_latest_pairs(
         self,
@@ -344,15 +611,12 @@ class DexscreenerClient:
                 )
             
             # Rate limiting
-            await self._enforce_rate_limit()
+            await self.limiter.acquire(LookupPriority.BACKGROUND)
+            self.upstream_requests += 1
             
             # Make API request
             url = f"{self.base_url}/dex/search/?q={dex_chain.value}"
-            
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
+            data = await self._get_json(url)
             
             # Parse response
             pairs = []
@@ -397,6 +661,7 @@ class DexscreenerClient:
         token0: str,
         token1: str,
         chain: str,
+        priority: LookupPriority = LookupPriority.BACKGROUND,
     ) -> Dict[str, Any]:
         """
         Validate a discovered pair against Dexscreener data.
@@ -406,6 +671,7 @@ class DexscreenerClient:
             token0: First token address
             token1: Second token address
             chain: Blockchain network
+            priority: Rate-limit lane for the lookup
             
         Returns:
             Dict containing validation results and enriched data
@@ -414,7 +680,7 @@ class DexscreenerClient:
         
         try:
             # Search for the pair by address
-            pair_response = await self.get_pair_by_address(pair_address, chain)
+            pair_response = await self.get_pair_by_address(pair_address, chain, priority)
             
             validation_result = {
                 "pair_address": pair_address,
@@ -602,40 +868,26 @@ class DexscreenerClient:
             logger.warning(f"Failed to parse pair data: {e}")
             return None
     
-    async def _enforce_rate_limit(self):
-        """Enforce rate limiting between API requests."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        
-        if time_since_last_request < self.rate_limit_delay:
-            sleep_time = self.rate_limit_delay - time_since_last_request
-            await asyncio.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-    
     def clear_cache(self):
         """Clear the internal cache."""
-        self.pair_cache.clear()
+        self.cache.clear()
         logger.info("Dexscreener cache cleared")
     
+    async def close(self) -> None:
+        """Flush pending lookups and wait for in-flight requests."""
+        for batcher in self._batchers.values():
+            await batcher.close()
+    
     def get_cache_stats(self) -> Dict[str, Any]:
-        """Get cache statistics."""
-        current_time = time.time()
-        valid_entries = 0
-        expired_entries = 0
-        
-        for entry in self.pair_cache.values():
-            if current_time - entry["timestamp"] < self.cache_ttl:
-                valid_entries += 1
-            else:
-                expired_entries += 1
-        
-        return {
-            "total_entries": len(self.pair_cache),
-            "valid_entries": valid_entries,
-            "expired_entries": expired_entries,
-            "cache_ttl_seconds": self.cache_ttl,
-        }
+        """Get cache, batching and rate-limit statistics."""
+        stats = self.cache.get_stats()
+        stats.update({
+            "upstream_requests": self.upstream_requests,
+            "batched_lookups": self.batched_lookups,
+            "coalesced_lookups": self.coalesced_lookups,
+            "rate_limiter": self.limiter.get_stats(),
+        })
+        return stats
 
 
 # Global Dexscreener client
@@ -8,11 +8,12 @@ import asyncio
 import time
 import uuid
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Callable
+from typing import Awaitable, Dict, List, Optional, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 
 from .chain_watchers import PairCreatedEvent, LiquidityEvent
+from ..monitoring.latency import LatencyHistogram
 from .dexscreener import dexscreener_client, DexscreenerResponse
 from ..strategy.risk_manager import risk_manager, RiskAssessment
 from ..services.security_providers import security_provider
@@ -218,18 +219,76 @@ class ProcessedPair:
         }
 
 
+@dataclass
+class PipelineJob:
+    """Pair moving through the processing stages."""
+    processed_pair: ProcessedPair
+    enqueued_at: float
+
+
+class PipelineStage:
+    """Bounded queue and worker pool for one processing step."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[PipelineJob], Awaitable[Optional[str]]],
+        workers: int,
+        queue_size: int,
+    ) -> None:
+        """
+        Initialize stage.
+
+        Args:
+            name: Stage name
+            handler: Processes a job and returns the next stage name, or None when done
+            workers: Concurrent workers draining the queue
+            queue_size: Queue bound; upstream stages wait while it is full
+        """
+        self.name = name
+        self.handler = handler
+        self.workers = workers
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.latency = LatencyHistogram()
+        self.in_flight = 0
+        self.processed = 0
+        self.shed = 0
+        self.errors = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, throughput and latency for the stage."""
+        return {
+            "workers": self.workers,
+            "queue_size": self.queue.qsize(),
+            "queue_capacity": self.queue.maxsize,
+            "in_flight": self.in_flight,
+            "processed": self.processed,
+            "shed": self.shed,
+            "errors": self.errors,
+            "latency": self.latency.snapshot(),
+        }
+
+
 class EventProcessor:
     """
     Event processing pipeline that combines discovery, validation, and risk assessment.
 
     Takes raw PairCreated events and produces fully analyzed trading opportunities
     with comprehensive risk assessment and AI-enhanced opportunity scoring.
+
+    Pairs flow through three stages, each with its own worker pool and
+    bounded queue: ``screen`` (Dexscreener validation and security
+    providers), ``analyze`` (market intelligence and on-chain risk, for pairs
+    with liquidity) and ``finalize`` (classification and callbacks). Lookups
+    within a stage run concurrently. A full downstream queue makes upstream
+    workers wait, so overload surfaces at intake, where the oldest queued
+    pair is shed; pairs older than ``max_opportunity_age`` are shed by
+    whichever stage picks them up.
     """
 
     def __init__(self) -> None:
         """Initialize event processor with Market Intelligence integration."""
         self.is_running = False
-        self.processing_queue = asyncio.Queue(maxsize=1000)
         self.processed_pairs: Dict[str, ProcessedPair] = {}
 
         # Phase 2.2: Initialize Market Intelligence Engine
@@ -255,12 +314,22 @@ class EventProcessor:
 
         # Performance tracking
         self.pairs_processed = 0
+        self.pairs_shed = 0
         self.processing_times: List[float] = []
         self.start_time = time.time()
 
         # Configuration
-        self.max_concurrent_processing = 10
-        self.processing_timeout = 30.0  # 30 seconds max per pair
+        self.max_opportunity_age = 120.0  # Seconds from discovery before a pair is shed
+        self.intake_queue_size = 1000
+        self.stage_queue_size = 100
+
+        # Processing stages
+        self.stages: Dict[str, PipelineStage] = {
+            "screen": PipelineStage("screen", self._screen_stage, workers=10, queue_size=self.intake_queue_size),
+            "analyze": PipelineStage("analyze", self._analyze_stage, workers=10, queue_size=self.stage_queue_size),
+            "finalize": PipelineStage("finalize", self._finalize_stage, workers=4, queue_size=self.stage_queue_size),
+        }
+        self.worker_tasks: List[asyncio.Task] = []
 
         # Phase 2.2: AI-enhanced quality thresholds
         self.liquidity_thresholds = {
@@ -280,8 +349,10 @@ class EventProcessor:
             "negative_sentiment": -0.4,    # Risk warning
         }
 
-        # Active processing tasks
-        self.active_tasks: Dict[str, asyncio.Task] = {}
+    @property
+    def processing_queue(self) -> asyncio.Queue:
+        """Intake queue of the first stage."""
+        return self.stages["screen"].queue
 
     def add_processing_callback(self, status: ProcessingStatus, callback: Callable) -> None:
         """
@@ -298,29 +369,79 @@ class EventProcessor:
         """
         Queue a discovered pair for processing.
 
+        Never waits: when the intake queue is full the oldest queued pair is
+        shed to make room, since a fresh pair is the better opportunity.
+
         Args:
             pair_event: PairCreated event from chain watcher
         """
-        try:
-            await self.processing_queue.put(pair_event)
-            logger.debug(
-                "Queued pair for processing: %s",
-                pair_event.pair_address,
-                extra={
-                    "extra_data": {
-                        "pair_address": pair_event.pair_address,
-                        "chain": pair_event.chain,
-                        "dex": pair_event.dex,
-                        "queue_size": self.processing_queue.qsize(),
-                    }
-                },
-            )
-        except asyncio.QueueFull:
-            logger.warning(
-                "Processing queue full, dropping pair: %s",
-                pair_event.pair_address,
-                extra={"extra_data": {"pair_address": pair_event.pair_address}},
-            )
+        job = PipelineJob(
+            processed_pair=self._create_processed_pair(pair_event),
+            enqueued_at=time.time(),
+        )
+        intake = self.stages["screen"]
+
+        while True:
+            try:
+                intake.queue.put_nowait(job)
+                break
+            except asyncio.QueueFull:
+                oldest = intake.queue.get_nowait()
+                intake.queue.task_done()
+                await self._shed(intake, oldest, "intake queue full")
+
+        logger.debug(
+            "Queued pair for processing: %s",
+            pair_event.pair_address,
+            extra={
+                "extra_data": {
+                    "pair_address": pair_event.pair_address,
+                    "chain": pair_event.chain,
+                    "dex": pair_event.dex,
+                    "queue_size": intake.queue.qsize(),
+                }
+            },
+        )
+
+    def _create_processed_pair(self, pair_event: PairCreatedEvent) -> ProcessedPair:
+        """Create the processing record for a discovered pair."""
+        return ProcessedPair(
+            pair_address=pair_event.pair_address,
+            chain=pair_event.chain,
+            dex=pair_event.dex,
+            token0=pair_event.token0,
+            token1=pair_event.token1,
+            block_number=pair_event.block_number,
+            block_timestamp=pair_event.block_timestamp,
+            transaction_hash=pair_event.transaction_hash,
+            discovery_trace_id=pair_event.trace_id,
+            processing_id=str(uuid.uuid4()),
+            processing_status=ProcessingStatus.DISCOVERED,
+            processing_start_time=time.time(),
+        )
+
+    async def _shed(self, stage: PipelineStage, job: PipelineJob, reason: str) -> None:
+        """Drop a pair that can no longer be processed in time and notify error callbacks."""
+        stage.shed += 1
+        self.pairs_shed += 1
+        logger.warning(
+            "Shedding pair %s at %s stage: %s",
+            job.processed_pair.pair_address,
+            stage.name,
+            reason,
+            extra={
+                "extra_data": {
+                    "pair_address": job.processed_pair.pair_address,
+                    "stage": stage.name,
+                    "age_seconds": time.time() - job.enqueued_at,
+                    "reason": reason,
+                }
+            },
+        )
+        processed_pair = job.processed_pair
+        processed_pair.processing_status = ProcessingStatus.ERROR
+        processed_pair.errors.append(f"Shed at {stage.name} stage: {reason}")
+        await self._notify_callbacks(ProcessingStatus.ERROR, processed_pair)
 
     async def start_processing(self) -> None:
         """Start the event processing pipeline."""
@@ -332,18 +453,21 @@ class EventProcessor:
         self.start_time = time.time()
 
         logger.info(
-            "Starting AI-enhanced event processor with %d concurrent workers",
-            self.max_concurrent_processing,
+            "Starting AI-enhanced event processor with stages: %s",
+            ", ".join(f"{name}={stage.workers}" for name, stage in self.stages.items()),
         )
 
-        # Start worker tasks
-        worker_tasks = [
-            asyncio.create_task(self._processing_worker(f"worker_{i}"))
-            for i in range(self.max_concurrent_processing)
+        # Start worker tasks for every stage
+        self.worker_tasks = [
+            asyncio.create_task(self._stage_worker(stage, f"{name}_{i}"))
+            for name, stage in self.stages.items()
+            for i in range(stage.workers)
         ]
 
         try:
-            await asyncio.gather(*worker_tasks)
+            await asyncio.gather(*self.worker_tasks)
+        except asyncio.CancelledError:
+            pass
         except Exception as e:
             logger.error("Event processor error: %s", e)
             await self.stop_processing()
@@ -354,159 +478,155 @@ class EventProcessor:
         logger.info("Stopping AI-enhanced event processor")
         self.is_running = False
 
-        # Cancel active processing tasks
-        for task_id, task in list(self.active_tasks.items()):
+        # Cancel stage workers, including any mid-pair
+        for task in self.worker_tasks:
             if not task.done():
                 task.cancel()
-                logger.debug("Cancelled processing task: %s", task_id)
 
-        # Wait for tasks to complete
-        if self.active_tasks:
-            await asyncio.gather(*self.active_tasks.values(), return_exceptions=True)
+        if self.worker_tasks:
+            await asyncio.gather(*self.worker_tasks, return_exceptions=True)
 
-        self.active_tasks.clear()
+        self.worker_tasks.clear()
 
-    async def _processing_worker(self, worker_id: str) -> None:
-        """Processing worker that handles pairs from the queue."""
+    async def _stage_worker(self, stage: PipelineStage, worker_id: str) -> None:
+        """Worker that runs one stage's handler on jobs from its queue."""
         logger.info("Started AI-enhanced processing worker: %s", worker_id)
 
         while self.is_running:
+            # Get next pair from queue with timeout
             try:
-                # Get next pair from queue with timeout
-                try:
-                    pair_event = await asyncio.wait_for(
-                        self.processing_queue.get(), timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
+                job = await asyncio.wait_for(stage.queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
 
-                # Process the pair
-                await self._process_pair_complete(pair_event, worker_id)
+            try:
+                if time.time() - job.enqueued_at > self.max_opportunity_age:
+                    await self._shed(stage, job, "opportunity expired")
+                    continue
 
+                stage.in_flight += 1
+                stage_start = time.perf_counter()
+                try:
+                    next_stage = await stage.handler(job)
+                finally:
+                    stage.in_flight -= 1
+                    stage.latency.record((time.perf_counter() - stage_start) * 1000)
+                stage.processed += 1
+
+                # Waits while the next stage is saturated
+                if next_stage is not None:
+                    await self.stages[next_stage].queue.put(job)
+
+            except asyncio.CancelledError:
+                raise
             except Exception as e:
-                logger.error("Processing worker %s error: %s", worker_id, e)
-                await asyncio.sleep(1)
-
-    async def _process_pair_complete(
-        self, pair_event: PairCreatedEvent, worker_id: str
-    ) -> None:
-        """Complete processing pipeline for a single pair with AI enhancement."""
-        processing_id = str(uuid.uuid4())
-        start_time = time.time()
-
-        # Create initial processed pair object
-        processed_pair = ProcessedPair(
-            pair_address=pair_event.pair_address,
-            chain=pair_event.chain,
-            dex=pair_event.dex,
-            token0=pair_event.token0,
-            token1=pair_event.token1,
-            block_number=pair_event.block_number,
-            block_timestamp=pair_event.block_timestamp,
-            transaction_hash=pair_event.transaction_hash,
-            discovery_trace_id=pair_event.trace_id,
-            processing_id=processing_id,
-            processing_status=ProcessingStatus.DISCOVERED,
-            processing_start_time=start_time,
+                stage.errors += 1
+                await self._fail_job(job, stage, e)
+            finally:
+                stage.queue.task_done()
+
+    async def _fail_job(self, job: PipelineJob, stage: PipelineStage, error: Exception) -> None:
+        """Mark a pair as failed and notify error callbacks."""
+        processed_pair = job.processed_pair
+        processed_pair.processing_status = ProcessingStatus.ERROR
+        processed_pair.errors.append(f"Processing error: {str(error)}")
+        logger.error(
+            "Processing error for pair %s at %s stage: %s",
+            processed_pair.pair_address,
+            stage.name,
+            error,
         )
+        await self._notify_callbacks(ProcessingStatus.ERROR, processed_pair)
 
-        # Store in active processing
-        self.active_tasks[processing_id] = asyncio.current_task()  # type: ignore[arg-type]
+    async def _screen_stage(self, job: PipelineJob) -> Optional[str]:
+        """Validate with Dexscreener; only pairs with liquidity go on to analysis."""
+        processed_pair = job.processed_pair
 
-        try:
-            logger.info(
-                "Starting AI-enhanced processing: %s",
-                pair_event.pair_address,
-                extra={
-                    "extra_data": {
-                        "processing_id": processing_id,
-                        "pair_address": pair_event.pair_address,
-                        "chain": pair_event.chain,
-                        "dex": pair_event.dex,
-                        "worker_id": worker_id,
-                    }
-                },
-            )
-
-            # Notify discovery callbacks
-            await self._notify_callbacks(ProcessingStatus.DISCOVERED, processed_pair)
-
-            # Step 1: Validate with Dexscreener
-            await self._validate_with_dexscreener(processed_pair)
-
-            # Step 2: AI Intelligence Analysis (Phase 2.2 Enhancement)
-            if processed_pair.dexscreener_found and processed_pair.has_liquidity:
-                await self._analyze_with_market_intelligence(processed_pair)
-
-            # Step 3: Risk assessment
-            if processed_pair.dexscreener_found and processed_pair.has_liquidity:
-                await self._assess_risk(processed_pair)
-
-            # Step 4: AI-Enhanced Final Classification (Phase 2.2)
-            self._classify_ai_enhanced_opportunity(processed_pair)
-
-            # Complete processing
-            processed_pair.processing_end_time = time.time()
-            processed_pair.processing_time_ms = (
-                processed_pair.processing_end_time
-                - processed_pair.processing_start_time
-            ) * 1000
-
-            # Store result
-            self.processed_pairs[pair_event.pair_address] = processed_pair
-            self.pairs_processed += 1
-            self.processing_times.append(processed_pair.processing_time_ms)
+        logger.info(
+            "Starting AI-enhanced processing: %s",
+            processed_pair.pair_address,
+            extra={
+                "extra_data": {
+                    "processing_id": processed_pair.processing_id,
+                    "pair_address": processed_pair.pair_address,
+                    "chain": processed_pair.chain,
+                    "dex": processed_pair.dex,
+                }
+            },
+        )
 
-            # Notify final status callbacks
-            if processed_pair.tradeable:
-                processed_pair.processing_status = ProcessingStatus.APPROVED
-                await self._notify_callbacks(ProcessingStatus.APPROVED, processed_pair)
-            else:
-                processed_pair.processing_status = ProcessingStatus.REJECTED
-                await self._notify_callbacks(ProcessingStatus.REJECTED, processed_pair)
+        # Notify discovery callbacks
+        await self._notify_callbacks(ProcessingStatus.DISCOVERED, processed_pair)
 
-            logger.info(
-                "AI-enhanced processing completed: %s",
-                processed_pair.opportunity_level.value,
-                extra={
-                    "extra_data": {
-                        "processing_id": processing_id,
-                        "pair_address": pair_event.pair_address,
-                        "opportunity_level": processed_pair.opportunity_level.value,
-                        "tradeable": processed_pair.tradeable,
-                        "processing_time_ms": processed_pair.processing_time_ms,
-                        "liquidity_usd": float(processed_pair.liquidity_usd)
-                        if processed_pair.liquidity_usd
-                        else None,
-                        "ai_opportunity_score": processed_pair.ai_opportunity_score,
-                        "ai_confidence": processed_pair.ai_confidence,
-                        "risk_level": (
-                            processed_pair.risk_assessment.overall_risk.value
-                            if processed_pair.risk_assessment
-                            else None
-                        ),
-                    }
-                },
-            )
+        await self._validate_with_dexscreener(processed_pair)
 
-        except asyncio.TimeoutError:
-            processed_pair.processing_status = ProcessingStatus.ERROR
-            processed_pair.errors.append("Processing timeout")
-            logger.warning("Processing timeout for pair: %s", pair_event.pair_address)
-            await self._notify_callbacks(ProcessingStatus.ERROR, processed_pair)
+        if processed_pair.dexscreener_found and processed_pair.has_liquidity:
+            return "analyze"
+        return "finalize"
 
-        except Exception as e:
-            processed_pair.processing_status = ProcessingStatus.ERROR
-            processed_pair.errors.append(f"Processing error: {str(e)}")
-            logger.error(
-                "Processing error for pair %s: %s", pair_event.pair_address, e
-            )
-            await self._notify_callbacks(ProcessingStatus.ERROR, processed_pair)
+    async def _analyze_stage(self, job: PipelineJob) -> Optional[str]:
+        """Run AI intelligence, on-chain risk and security provider lookups concurrently."""
+        processed_pair = job.processed_pair
+        # Remote security APIs are only queried for pairs that passed screening
+        target_token = self._determine_target_token_for_risk_assessment(processed_pair)
+        await asyncio.gather(
+            self._analyze_with_market_intelligence(processed_pair),
+            self._assess_risk(processed_pair),
+            self._get_security_provider_data(processed_pair, target_token),
+        )
+        return "finalize"
+
+    async def _finalize_stage(self, job: PipelineJob) -> Optional[str]:
+        """Classify the pair, store it and notify final status callbacks."""
+        processed_pair = job.processed_pair
+
+        # AI-Enhanced Final Classification (Phase 2.2)
+        self._classify_ai_enhanced_opportunity(processed_pair)
+
+        # Complete processing
+        processed_pair.processing_end_time = time.time()
+        processed_pair.processing_time_ms = (
+            processed_pair.processing_end_time
+            - processed_pair.processing_start_time
+        ) * 1000
+
+        # Store result
+        self.processed_pairs[processed_pair.pair_address] = processed_pair
+        self.pairs_processed += 1
+        self.processing_times.append(processed_pair.processing_time_ms)
+
+        # Notify final status callbacks
+        if processed_pair.tradeable:
+            processed_pair.processing_status = ProcessingStatus.APPROVED
+            await self._notify_callbacks(ProcessingStatus.APPROVED, processed_pair)
+        else:
+            processed_pair.processing_status = ProcessingStatus.REJECTED
+            await self._notify_callbacks(ProcessingStatus.REJECTED, processed_pair)
 
-        finally:
-            # Clean up active task
-            if processing_id in self.active_tasks:
-                del self.active_tasks[processing_id]
+        logger.info(
+            "AI-enhanced processing completed: %s",
+            processed_pair.opportunity_level.value,
+            extra={
+                "extra_data": {
+                    "processing_id": processed_pair.processing_id,
+                    "pair_address": processed_pair.pair_address,
+                    "opportunity_level": processed_pair.opportunity_level.value,
+                    "tradeable": processed_pair.tradeable,
+                    "processing_time_ms": processed_pair.processing_time_ms,
+                    "liquidity_usd": float(processed_pair.liquidity_usd)
+                    if processed_pair.liquidity_usd
+                    else None,
+                    "ai_opportunity_score": processed_pair.ai_opportunity_score,
+                    "ai_confidence": processed_pair.ai_confidence,
+                    "risk_level": (
+                        processed_pair.risk_assessment.overall_risk.value
+                        if processed_pair.risk_assessment
+                        else None
+                    ),
+                }
+            },
+        )
+        return None
 
     async def _validate_with_dexscreener(self, processed_pair: ProcessedPair) -> None:
         """Validate pair with Dexscreener and enrich with market data."""
@@ -1119,9 +1239,6 @@ class EventProcessor:
                 time.time() - risk_start
             ) * 1000
 
-            # Get additional security provider data for EVM chains
-            await self._get_security_provider_data(processed_pair, target_token)
-
             # Extract warnings and recommendations from risk assessment
             if risk_assessment and risk_assessment.warnings:
                 processed_pair.risk_warnings.extend(risk_assessment.warnings)
@@ -1634,7 +1751,9 @@ class EventProcessor:
             "uptime_seconds": uptime,
             "pairs_processed": self.pairs_processed,
             "queue_size": self.processing_queue.qsize(),
-            "active_processing": len(self.active_tasks),
+            "active_processing": sum(stage.in_flight for stage in self.stages.values()),
+            "pairs_shed": self.pairs_shed,
+            "stages": {name: stage.get_stats() for name, stage in self.stages.items()},
             "avg_processing_time_ms": avg_processing_time,
             "opportunity_counts": opportunity_counts,
             "total_stored_pairs": len(self.processed_pairs),
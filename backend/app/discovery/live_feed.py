@@ -11,11 +11,13 @@ import asyncio
 import logging
 import time
 import uuid
+from decimal import Decimal, InvalidOperation
 from typing import Dict, List, Set, Optional, Any
 from dataclasses import dataclass
 
 import httpx
 
+from ..services.price_bus import PriceTick, price_bus
 from .chain_watchers import PairCreatedEvent
 from .event_processor import event_processor
 
@@ -306,6 +308,7 @@ class DexscreenerLiveFeed:
                 fdv=pair_raw.get("fdv"),
                 market_cap=pair_raw.get("marketCap"),
             )
+            self._publish_price(pair)
 
             return pair
 
@@ -313,6 +316,27 @@ class DexscreenerLiveFeed:
             logger.error("Error parsing Dexscreener pair: %s", e)
             return None
 
+    def _publish_price(self, pair: DexscreenerPair) -> None:
+        """Publish the polled pair price to the price tick bus."""
+        base_address = pair.base_token.get("address")
+        try:
+            price_native = Decimal(str(pair.price_native or "0"))
+            price_usd = Decimal(str(pair.price_usd or "0"))
+        except InvalidOperation:
+            return
+        if not base_address or price_native <= 0:
+            return
+
+        price_bus.publish(PriceTick(
+            chain=pair.chain_id,
+            token_address=base_address,
+            quote_token=pair.quote_token.get("address"),
+            pair_address=pair.pair_address,
+            price=price_native,
+            price_usd=price_usd if price_usd > 0 else None,
+            source="dexscreener",
+        ))
+
     def _convert_to_pair_event(self, pair: DexscreenerPair) -> Optional[PairCreatedEvent]:
         """
         Convert DexscreenerPair to PairCreatedEvent.
@@ -0,0 +1,386 @@
+"""
+Head-following ``eth_getLogs`` scanner with a persisted per-chain cursor.
+
+One ``eth_getLogs`` per block range covers every watched address and topic
+on a chain. The last processed block and recent block hashes are persisted,
+so a restart backfills the gap in adaptively sized chunks, and reorgs up to
+a configurable depth are rolled back and rescanned.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from ..chains.rpc_pool import RpcPool, rpc_pool
+from ..core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REORG_DEPTH = 12
+DEFAULT_MAX_CHUNK_BLOCKS = 2000
+MIN_CHUNK_BLOCKS = 1
+DEFAULT_MAX_BACKFILL_BLOCKS = 50_000
+CHUNK_GROWTH_MAX_LOGS = 1000  # Only widen the range after light responses
+
+LogsHandler = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+RollbackHandler = Callable[[int, List[Dict[str, Any]]], Awaitable[None]]
+
+
+class ReorgDetected(Exception):
+    """Raised when a scanned range disagrees with its block header."""
+    pass
+
+
+def log_position(log: Dict[str, Any]) -> Tuple[int, int]:
+    """Get the (block number, log index) ordering key of a raw log."""
+    return int(log["blockNumber"], 16), int(log["logIndex"], 16)
+
+
+def log_key(log: Dict[str, Any]) -> Tuple[str, int]:
+    """Get the identity of a raw log within its block."""
+    return log.get("blockHash", ""), int(log["logIndex"], 16)
+
+
+@dataclass
+class ScanCursor:
+    """Scan progress for one chain."""
+    chain: str
+    last_block: int
+    block_hashes: Dict[int, str] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for persistence."""
+        return {
+            "chain": self.chain,
+            "last_block": self.last_block,
+            "block_hashes": {str(number): block_hash for number, block_hash in self.block_hashes.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanCursor":
+        """Deserialize a persisted cursor."""
+        return cls(
+            chain=data["chain"],
+            last_block=int(data["last_block"]),
+            block_hashes={int(number): block_hash for number, block_hash in data.get("block_hashes", {}).items()},
+        )
+
+
+class CursorStore:
+    """JSON file store for scan cursors, one file per scanner and chain."""
+
+    def __init__(self, directory: Optional[Path] = None) -> None:
+        """Initialize store."""
+        self.directory = Path(directory) if directory else Path(settings.data_dir) / "discovery"
+
+    def _path(self, name: str, chain: str) -> Path:
+        return self.directory / f"{name}_{chain}_cursor.json"
+
+    def load(self, name: str, chain: str) -> Optional[ScanCursor]:
+        """Load a cursor, returning None when missing or unreadable."""
+        path = self._path(name, chain)
+        try:
+            return ScanCursor.from_dict(json.loads(path.read_text()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Ignoring unreadable scan cursor {path}: {e}")
+            return None
+
+    def save(self, name: str, cursor: ScanCursor) -> None:
+        """Atomically persist a cursor."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(name, cursor.chain)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cursor.to_dict()))
+        os.replace(tmp_path, path)
+
+
+class LogScanner:
+    """
+    Lossless log follower for a set of contract addresses on one chain.
+
+    Each ``scan_once`` checks the stored recent block hashes for a reorg,
+    then fetches logs from the cursor to the current head. Ranges start at
+    ``max_chunk_blocks``, halve when a provider rejects them and grow back
+    after light responses. Logs from the last ``reorg_depth`` blocks are
+    kept so a rollback can report exactly what was retracted before the
+    new canonical range is re-emitted.
+
+    A push transport may hand logs to ``push_logs`` as soon as they are
+    seen; range scans then skip them, so every log is emitted once.
+    """
+
+    def __init__(
+        self,
+        chain: str,
+        addresses: Sequence[str],
+        topics: Sequence[str],
+        on_logs: LogsHandler,
+        on_rollback: Optional[RollbackHandler] = None,
+        name: str = "discovery",
+        pool: Optional[RpcPool] = None,
+        store: Optional[CursorStore] = None,
+        reorg_depth: int = DEFAULT_REORG_DEPTH,
+        max_chunk_blocks: int = DEFAULT_MAX_CHUNK_BLOCKS,
+        max_backfill_blocks: int = DEFAULT_MAX_BACKFILL_BLOCKS,
+    ) -> None:
+        """
+        Initialize scanner.
+
+        Args:
+            chain: Chain name
+            addresses: Contract addresses to watch (empty: any address)
+            topics: Event signature topics to match (any of)
+            on_logs: Called with each range's logs in chain order
+            on_rollback: Called with the fork block and retracted logs
+            name: Cursor name, unique per scanner on a chain
+            pool: RPC pool (defaults to the global pool)
+            store: Cursor store (defaults to the data directory)
+            reorg_depth: Blocks below head that are checked for reorgs
+            max_chunk_blocks: Largest block range per ``eth_getLogs``
+            max_backfill_blocks: Largest gap backfilled after downtime
+        """
+        self.chain = chain
+        self.addresses = [address.lower() for address in addresses]
+        self.topics = [topic.lower() for topic in topics]
+        self.on_logs = on_logs
+        self.on_rollback = on_rollback
+        self.name = name
+        self.pool = pool or rpc_pool
+        self.store = store or CursorStore()
+        self.reorg_depth = reorg_depth
+        self.max_chunk_blocks = max_chunk_blocks
+        self.max_backfill_blocks = max_backfill_blocks
+
+        self.chunk_blocks = max_chunk_blocks
+        self.cursor: Optional[ScanCursor] = None
+        self._recent_logs: Dict[int, List[Dict[str, Any]]] = {}
+        self._seen: Set[Tuple[str, int]] = set()
+
+        # Stats
+        self.ranges_scanned = 0
+        self.logs_emitted = 0
+        self.logs_pushed = 0
+        self.reorgs = 0
+        self.logs_retracted = 0
+        self.blocks_skipped = 0
+
+    async def scan_once(self) -> int:
+        """
+        Follow the chain up to the current head.
+
+        Returns:
+            Number of logs emitted
+        """
+        head = int(await self.pool.make_request(self.chain, "eth_blockNumber", []), 16)
+
+        if self.cursor is None:
+            self.cursor = self.store.load(self.name, self.chain) or ScanCursor(self.chain, head - 1)
+            logger.info(
+                f"Log scanner {self.name} on {self.chain} resuming after block {self.cursor.last_block}",
+                extra={'extra_data': {'chain': self.chain, 'head': head, 'cursor': self.cursor.last_block}}
+            )
+
+        await self._check_reorg()
+
+        start = self.cursor.last_block + 1
+        if head - start + 1 > self.max_backfill_blocks:
+            skipped = head - self.max_backfill_blocks + 1 - start
+            self.blocks_skipped += skipped
+            logger.warning(
+                f"Scan gap on {self.chain} exceeds {self.max_backfill_blocks} blocks, skipping {skipped}",
+                extra={'extra_data': {'chain': self.chain, 'cursor': self.cursor.last_block, 'head': head}}
+            )
+            start = head - self.max_backfill_blocks + 1
+
+        emitted = 0
+        while start <= head:
+            end = min(head, start + self.chunk_blocks - 1)
+            try:
+                logs, end_hash = await self._fetch_range(start, end, track_hash=end > head - self.reorg_depth)
+            except ReorgDetected:
+                logger.info(f"Reorg detected mid-scan on {self.chain} at block {end}")
+                break
+            except Exception as e:
+                if self.chunk_blocks <= MIN_CHUNK_BLOCKS:
+                    raise
+                self.chunk_blocks = max(MIN_CHUNK_BLOCKS, (end - start + 1) // 2)
+                logger.debug(
+                    f"eth_getLogs over {end - start + 1} blocks failed on {self.chain}, "
+                    f"retrying with {self.chunk_blocks}: {e}"
+                )
+                continue
+
+            logs = [log for log in logs if log_key(log) not in self._seen]
+            self._remember(logs, end, end_hash)
+            if logs:
+                await self.on_logs(logs)
+                emitted += len(logs)
+
+            self.cursor.last_block = end
+            self._prune()
+            self.store.save(self.name, self.cursor)
+            self.ranges_scanned += 1
+
+            if len(logs) < CHUNK_GROWTH_MAX_LOGS:
+                self.chunk_blocks = min(self.max_chunk_blocks, self.chunk_blocks * 2)
+            start = end + 1
+
+        self.logs_emitted += emitted
+        return emitted
+
+    async def push_logs(self, logs: List[Dict[str, Any]]) -> int:
+        """
+        Emit logs delivered by a subscription ahead of the next range scan.
+
+        Logs at or below the cursor, already emitted, or flagged ``removed``
+        are skipped; reorgs are detected by the next ``scan_once``.
+
+        Returns:
+            Number of logs emitted
+        """
+        if self.cursor is None:
+            return 0
+
+        fresh = [
+            log for log in sorted(logs, key=log_position)
+            if not log.get("removed")
+            and int(log["blockNumber"], 16) > self.cursor.last_block
+            and log_key(log) not in self._seen
+        ]
+        if not fresh:
+            return 0
+
+        self._remember(fresh)
+        await self.on_logs(fresh)
+        self.logs_pushed += len(fresh)
+        self.logs_emitted += len(fresh)
+        return len(fresh)
+
+    async def _fetch_range(
+        self,
+        start: int,
+        end: int,
+        track_hash: bool,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Fetch logs for a block range.
+
+        Args:
+            start: First block (inclusive)
+            end: Last block (inclusive)
+            track_hash: Also read the hash of ``end`` for reorg tracking
+
+        Returns:
+            Tuple of (logs sorted in chain order, hash of ``end`` or None)
+
+        Raises:
+            ReorgDetected: If logs in ``end`` belong to a different block
+        """
+        end_hash = await self._get_block_hash(end) if track_hash else None
+
+        log_filter: Dict[str, Any] = {"fromBlock": hex(start), "toBlock": hex(end), "topics": [self.topics]}
+        if self.addresses:
+            log_filter["address"] = self.addresses
+        logs = await self.pool.make_request(self.chain, "eth_getLogs", [log_filter])
+        logs = sorted((log for log in logs or [] if not log.get("removed")), key=log_position)
+
+        if end_hash is not None:
+            for log in logs:
+                if int(log["blockNumber"], 16) == end and log.get("blockHash", end_hash) != end_hash:
+                    raise ReorgDetected(end)
+
+        return logs, end_hash
+
+    async def _get_block_hash(self, number: int) -> Optional[str]:
+        """Get the canonical hash of a block, or None past the head."""
+        block = await self.pool.make_request(self.chain, "eth_getBlockByNumber", [hex(number), False])
+        return block["hash"] if block else None
+
+    def _remember(
+        self,
+        logs: List[Dict[str, Any]],
+        end: Optional[int] = None,
+        end_hash: Optional[str] = None,
+    ) -> None:
+        """Record emitted logs and hashes of blocks inside the reorg window."""
+        floor = (end if end is not None else self.cursor.last_block) - self.reorg_depth
+        for log in logs:
+            number = int(log["blockNumber"], 16)
+            if number <= floor:
+                continue
+            # Only logs kept for reorg replay are deduplicated; _prune forgets both together
+            self._seen.add(log_key(log))
+            self._recent_logs.setdefault(number, []).append(log)
+            if log.get("blockHash"):
+                self.cursor.block_hashes[number] = log["blockHash"]
+        if end_hash is not None:
+            self.cursor.block_hashes[end] = end_hash
+
+    def _prune(self) -> None:
+        """Forget blocks that fell out of the reorg window."""
+        floor = self.cursor.last_block - self.reorg_depth
+        for number in [number for number in self.cursor.block_hashes if number <= floor]:
+            del self.cursor.block_hashes[number]
+        for number in [number for number in self._recent_logs if number <= floor]:
+            self._forget(self._recent_logs.pop(number))
+
+    def _forget(self, logs: List[Dict[str, Any]]) -> None:
+        """Drop logs from the emitted set."""
+        for log in logs:
+            self._seen.discard(log_key(log))
+
+    async def _check_reorg(self) -> None:
+        """Roll the cursor back to the fork point if recent blocks changed."""
+        if not self.cursor.block_hashes:
+            return
+
+        numbers = sorted(self.cursor.block_hashes, reverse=True)
+        fork = min(numbers) - 1
+        for index, number in enumerate(numbers):
+            if await self._get_block_hash(number) == self.cursor.block_hashes[number]:
+                if index == 0:
+                    return
+                fork = number
+                break
+
+        retracted = [
+            log
+            for number in sorted(self._recent_logs)
+            if number > fork
+            for log in self._recent_logs.pop(number)
+        ]
+        self._forget(retracted)
+        for number in [number for number in self.cursor.block_hashes if number > fork]:
+            del self.cursor.block_hashes[number]
+
+        self.cursor.last_block = min(self.cursor.last_block, fork)
+        self.store.save(self.name, self.cursor)
+        self.reorgs += 1
+        self.logs_retracted += len(retracted)
+
+        logger.warning(
+            f"Reorg on {self.chain}: rolling back to block {fork}, retracting {len(retracted)} logs",
+            extra={'extra_data': {'chain': self.chain, 'fork_block': fork, 'retracted': len(retracted)}}
+        )
+
+        if self.on_rollback is not None:
+            await self.on_rollback(fork, retracted)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scanner statistics."""
+        return {
+            "cursor_block": self.cursor.last_block if self.cursor else None,
+            "chunk_blocks": self.chunk_blocks,
+            "ranges_scanned": self.ranges_scanned,
+            "logs_emitted": self.logs_emitted,
+            "logs_pushed": self.logs_pushed,
+            "reorgs": self.reorgs,
+            "logs_retracted": self.logs_retracted,
+            "blocks_skipped": self.blocks_skipped,
+        }
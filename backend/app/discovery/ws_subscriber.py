@@ -0,0 +1,188 @@
+"""
+WebSocket ``eth_subscribe`` transport for chain watchers.
+
+A subscriber keeps one socket per chain open with a ``newHeads`` and a
+``logs`` subscription. Heads wake the watcher's scanner immediately instead
+of waiting out a poll interval, and logs are handed over as soon as the node
+sees them. The ``eth_getLogs`` scanner stays the source of truth: it
+backfills heads missed while the socket was down and de-duplicates logs the
+subscription already delivered.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+import websockets
+from websockets.exceptions import ConnectionClosed, InvalidHandshake, InvalidURI
+
+logger = logging.getLogger(__name__)
+
+MIN_RECONNECT_DELAY = 1.0
+MAX_RECONNECT_DELAY = 30.0
+SUBSCRIBE_TIMEOUT = 10.0
+
+HeadHandler = Callable[[int], Awaitable[None]]
+LogsHandler = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+class SubscriptionError(Exception):
+    """Raised when a node rejects an ``eth_subscribe`` request."""
+    pass
+
+
+class WsSubscriber:
+    """
+    Resubscribing ``newHeads`` + ``logs`` client for one chain.
+
+    The connection is re-established with exponential backoff whenever it
+    drops, and both subscriptions are re-created on the new socket. Head
+    numbers are compared against the previous head so skipped heads are
+    counted as gaps; recovering them is left to the caller's range scan.
+    """
+
+    def __init__(
+        self,
+        chain: str,
+        url: str,
+        addresses: Sequence[str],
+        topics: Sequence[str],
+        on_head: HeadHandler,
+        on_logs: Optional[LogsHandler] = None,
+    ) -> None:
+        """
+        Initialize subscriber.
+
+        Args:
+            chain: Chain name
+            url: WebSocket RPC URL
+            addresses: Contract addresses for the logs subscription
+            topics: Event signature topics to match (any of)
+            on_head: Called with each new head's block number
+            on_logs: Called with logs pushed by the node
+        """
+        self.chain = chain
+        self.url = url
+        self.addresses = [address.lower() for address in addresses]
+        self.topics = [topic.lower() for topic in topics]
+        self.on_head = on_head
+        self.on_logs = on_logs
+
+        self.is_running = False
+        self.connected = asyncio.Event()
+        self.last_head: Optional[int] = None
+        self._subscriptions: Dict[str, str] = {}
+        self._next_id = 0
+
+        # Stats
+        self.connections = 0
+        self.disconnects = 0
+        self.heads_received = 0
+        self.logs_received = 0
+        self.gaps_detected = 0
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether both subscriptions are live."""
+        return self.connected.is_set()
+
+    async def run(self) -> None:
+        """Connect, subscribe and dispatch notifications until stopped."""
+        self.is_running = True
+        delay = MIN_RECONNECT_DELAY
+
+        while self.is_running:
+            try:
+                async with websockets.connect(self.url, max_size=None) as ws:
+                    await self._subscribe(ws)
+                    self.connections += 1
+                    self.connected.set()
+                    delay = MIN_RECONNECT_DELAY
+                    logger.info(
+                        f"WebSocket subscriptions active on {self.chain}",
+                        extra={'extra_data': {'chain': self.chain, 'subscriptions': list(self._subscriptions.values())}}
+                    )
+
+                    async for message in ws:
+                        await self._dispatch(json.loads(message))
+
+            except asyncio.CancelledError:
+                raise
+            except (ConnectionClosed, InvalidHandshake, InvalidURI, OSError,
+                    SubscriptionError, asyncio.TimeoutError) as e:
+                logger.warning(f"WebSocket connection on {self.chain} lost: {e}")
+            except Exception as e:
+                logger.error(f"WebSocket subscriber error on {self.chain}: {e}")
+            finally:
+                if self.connected.is_set():
+                    self.disconnects += 1
+                self.connected.clear()
+                self._subscriptions.clear()
+
+            if self.is_running:
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, MAX_RECONNECT_DELAY)
+
+    def stop(self) -> None:
+        """Stop after the current message."""
+        self.is_running = False
+
+    async def _subscribe(self, ws: Any) -> None:
+        """Create the newHeads and logs subscriptions on a fresh socket."""
+        requests = {"newHeads": ["newHeads"]}
+        if self.on_logs is not None:
+            requests["logs"] = ["logs", {"address": self.addresses, "topics": [self.topics]}]
+
+        for kind, params in requests.items():
+            self._next_id += 1
+            request_id = self._next_id
+            await ws.send(json.dumps({
+                "jsonrpc": "2.0", "id": request_id, "method": "eth_subscribe", "params": params,
+            }))
+            # Notifications for an earlier subscription may arrive first
+            while True:
+                response = json.loads(await asyncio.wait_for(ws.recv(), SUBSCRIBE_TIMEOUT))
+                if response.get("id") == request_id:
+                    break
+                await self._dispatch(response)
+            if "error" in response:
+                raise SubscriptionError(f"eth_subscribe {kind} failed: {response['error']}")
+            self._subscriptions[response["result"]] = kind
+
+    async def _dispatch(self, message: Dict[str, Any]) -> None:
+        """Route an ``eth_subscription`` notification by subscription ID."""
+        if message.get("method") != "eth_subscription":
+            return
+        params = message.get("params", {})
+        kind = self._subscriptions.get(params.get("subscription"))
+        result = params.get("result")
+
+        if kind == "newHeads":
+            number = int(result["number"], 16)
+            self.heads_received += 1
+            if self.last_head is not None and number > self.last_head + 1:
+                self.gaps_detected += 1
+                logger.info(
+                    f"Missed {number - self.last_head - 1} heads on {self.chain}",
+                    extra={'extra_data': {'chain': self.chain, 'last_head': self.last_head, 'head': number}}
+                )
+            self.last_head = max(number, self.last_head or 0)
+            await self.on_head(number)
+        elif kind == "logs" and self.on_logs is not None:
+            self.logs_received += 1
+            await self.on_logs([result])
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get subscription statistics."""
+        return {
+            "chain": self.chain,
+            "connected": self.is_connected,
+            "connections": self.connections,
+            "disconnects": self.disconnects,
+            "last_head": self.last_head,
+            "heads_received": self.heads_received,
+            "logs_received": self.logs_received,
+            "gaps_detected": self.gaps_detected,
+        }
@@ -6,6 +6,7 @@ policy, providing compression, verification, and cleanup functionality.
 """
 from __future__ import annotations
 
+import asyncio
 import gzip
 import logging
 import shutil
@@ -22,6 +23,7 @@ from ..storage.database import get_session_context
 from ..storage.models import LedgerEntry
 from ..storage.repositories import LedgerRepository
 from .exporters import LedgerExporter
+from .streaming import file_sha256, open_archive_text
 
 logger = logging.getLogger(__name__)
 
@@ -85,6 +87,7 @@ class LedgerArchivalManager:
             'original_size_mb': 0,
             'compressed_size_mb': 0,
             'compression_ratio': 0.0,
+            'checksums': {},
             'verification_passed': False,
             'errors': [],
         }
@@ -120,6 +123,7 @@ class LedgerArchivalManager:
                     archive_results['total_entries'] += user_results['entries_count']
                     archive_results['files_created'].extend(user_results['files_created'])
                     archive_results['original_size_mb'] += user_results['original_size_mb']
+                    archive_results['checksums'].update(user_results['checksums'])
                     
                     if compress:
                         archive_results['compressed_files'].extend(user_results['compressed_files'])
@@ -138,7 +142,9 @@ class LedgerArchivalManager:
             
             # Verify archives if requested
             if verify_after_archive and archive_results['files_created']:
-                verification_results = await self._verify_archives(archive_results['files_created'])
+                verification_results = await self._verify_archives(
+                    archive_results['files_created'], archive_results['checksums']
+                )
                 archive_results['verification_passed'] = verification_results['all_passed']
                 if not verification_results['all_passed']:
                     archive_results['errors'].extend(verification_results['errors'])
@@ -274,31 +280,23 @@ class LedgerArchivalManager:
             if not archive_file_path.exists():
                 raise FileNotFoundError(f"Archive file not found: {archive_file_path}")
             
-            # Determine if file is compressed
-            is_compressed = archive_file_path.suffix == '.gz'
-            
             # Read archive file
-            if is_compressed:
-                with gzip.open(archive_file_path, 'rt', encoding='utf-8') as f:
-                    if archive_file_path.name.endswith('.csv.gz'):
-                        df = pd.read_csv(f)
-                    elif archive_file_path.name.endswith('.xlsx.gz'):
-                        # For compressed Excel, need to decompress first
-                        temp_file = self.temp_dir / f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                        with gzip.open(archive_file_path, 'rb') as gz_file:
-                            with open(temp_file, 'wb') as temp_xlsx:
-                                shutil.copyfileobj(gz_file, temp_xlsx)
-                        df = pd.read_excel(temp_file)
-                        temp_file.unlink()  # Clean up temp file
-                    else:
-                        raise ValueError(f"Unsupported compressed file format: {archive_file_path}")
+            name = archive_file_path.name
+            if name.endswith(('.csv', '.csv.gz', '.csv.zst')):
+                with open_archive_text(archive_file_path) as f:
+                    df = await asyncio.to_thread(pd.read_csv, f)
+            elif name.endswith('.xlsx.gz'):
+                # For compressed Excel, need to decompress first
+                temp_file = self.temp_dir / f"temp_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+                with gzip.open(archive_file_path, 'rb') as gz_file:
+                    with open(temp_file, 'wb') as temp_xlsx:
+                        shutil.copyfileobj(gz_file, temp_xlsx)
+                df = pd.read_excel(temp_file)
+                temp_file.unlink()  # Clean up temp file
+            elif name.endswith('.xlsx'):
+                df = pd.read_excel(archive_file_path)
             else:
-                if archive_file_path.suffix == '.csv':
-                    df = pd.read_csv(archive_file_path)
-                elif archive_file_path.suffix == '.xlsx':
-                    df = pd.read_excel(archive_file_path)
-                else:
-                    raise ValueError(f"Unsupported file format: {archive_file_path}")
+                raise ValueError(f"Unsupported file format: {archive_file_path}")
             
             # Process and restore entries
             async with get_session_context() as session:
@@ -425,7 +423,7 @@ class LedgerArchivalManager:
                         'name': archive_file.name,
                         'size_mb': file_size_mb,
                         'date': file_date,
-                        'is_compressed': archive_file.suffix == '.gz',
+                        'is_compressed': archive_file.suffix in ('.gz', '.zst'),
                     }
                     
                     archive_files.append(archive_info)
@@ -506,69 +504,60 @@ class LedgerArchivalManager:
             'compressed_files': [],
             'original_size_mb': 0,
             'compressed_size_mb': 0,
+            'checksums': {},
         }
         
-        # Export user's data for the month
-        csv_file = await self.exporter.export_user_ledger_csv(
+        # Stream the month straight into the archive, compressing, counting
+        # and hashing in the same pass
+        result = await self.exporter.stream_user_ledger_csv(
             user_id=user_id,
+            path=self.archive_dir / f"ledger_user_{user_id}_{month_str}.csv",
             start_date=start_date,
             end_date=end_date,
+            compression=settings.ledger_archive_compression if compress else None,
         )
         
-        # Move to archive directory with proper naming
-        archive_filename = f"ledger_user_{user_id}_{month_str}.csv"
-        archive_path = self.archive_dir / archive_filename
-        shutil.move(str(csv_file), str(archive_path))
+        user_results['entries_count'] = result.rows
+        user_results['files_created'].append(str(result.path))
+        user_results['original_size_mb'] = result.raw_bytes / (1024 * 1024)
+        user_results['checksums'] = {str(result.path): result.sha256}
         
-        user_results['files_created'].append(str(archive_path))
-        user_results['original_size_mb'] = archive_path.stat().st_size / (1024 * 1024)
-        
-        # Count entries
-        with open(archive_path, 'r', encoding='utf-8') as f:
-            user_results['entries_count'] = sum(1 for line in f) - 1  # Subtract header
-        
-        # Compress if requested
-        if compress:
-            compressed_path = Path(str(archive_path) + '.gz')
-            with open(archive_path, 'rb') as f_in:
-                with gzip.open(compressed_path, 'wb') as f_out:
-                    shutil.copyfileobj(f_in, f_out)
-            
-            user_results['compressed_files'].append(str(compressed_path))
-            user_results['compressed_size_mb'] = compressed_path.stat().st_size / (1024 * 1024)
-            
-            # Remove uncompressed file
-            archive_path.unlink()
-            user_results['files_created'] = [str(compressed_path)]
+        if result.compression:
+            user_results['compressed_files'].append(str(result.path))
+            user_results['compressed_size_mb'] = result.bytes_written / (1024 * 1024)
         
         return user_results
     
-    async def _verify_archives(self, archive_files: List[str]) -> Dict[str, Any]:
-        """Verify integrity of archive files."""
+    async def _verify_archives(
+        self,
+        archive_files: List[str],
+        checksums: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Verify integrity of archive files.
+        
+        Files with a recorded checksum are re-hashed in full; others are
+        checked for readability. File reads run off the event loop.
+        """
         verification_results = {
             'all_passed': True,
             'files_verified': 0,
             'files_failed': 0,
             'errors': [],
         }
+        checksums = checksums or {}
         
         for file_path_str in archive_files:
             try:
                 file_path = Path(file_path_str)
+                expected = checksums.get(file_path_str)
                 
-                if file_path.suffix == '.gz':
-                    # Verify compressed file can be opened
-                    with gzip.open(file_path, 'rt', encoding='utf-8') as f:
-                        # Try to read first few lines
-                        for i, line in enumerate(f):
-                            if i >= 5:  # Read first 5 lines as verification
-                                break
+                if expected:
+                    actual = await asyncio.to_thread(file_sha256, file_path)
+                    if actual != expected:
+                        raise ValueError(f"checksum mismatch (expected {expected}, got {actual})")
                 else:
-                    # Verify uncompressed file
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        for i, line in enumerate(f):
-                            if i >= 5:
-                                break
+                    await asyncio.to_thread(self._read_archive_head, file_path)
                 
                 verification_results['files_verified'] += 1
                 
@@ -581,6 +570,13 @@ class LedgerArchivalManager:
         
         return verification_results
     
+    def _read_archive_head(self, file_path: Path, lines: int = 5) -> None:
+        """Read the first lines of an archive to check it can be opened."""
+        with open_archive_text(file_path) as f:
+            for i, line in enumerate(f):
+                if i >= lines:
+                    break
+    
     def _extract_date_from_filename(self, filename: str) -> Optional[datetime]:
         """Extract date from archive filename."""
         try:
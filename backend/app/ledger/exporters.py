@@ -6,21 +6,28 @@ ledger system, supporting CSV, XLSX, and specialized tax export formats.
 """
 from __future__ import annotations
 
-import csv
+import asyncio
 import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
 import pandas as pd
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..core.settings import settings
 from ..storage.database import get_session_context
 from ..storage.models import LedgerEntry
-from ..storage.repositories import LedgerRepository
+from .streaming import (
+    ExportResult,
+    LedgerSummary,
+    ledger_csv_row,
+    ledger_xlsx_row,
+    write_csv_stream,
+    write_xlsx_stream,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +59,7 @@ class LedgerExporter:
         chains: Optional[List[str]] = None,
         min_amount_gbp: Optional[Decimal] = None,
         include_gas_fees: bool = True,
+        compression: Optional[str] = None,
     ) -> Path:
         """
         Export user's ledger to CSV with advanced filtering.
@@ -64,15 +72,12 @@ class LedgerExporter:
             chains: Optional chain filter (e.g., ['ethereum', 'bsc'])
             min_amount_gbp: Optional minimum GBP amount filter
             include_gas_fees: Whether to include gas fee entries
+            compression: Optional on-the-fly compression ("gzip" or "zstd")
             
         Returns:
             Path to created CSV file
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ledger_user_{user_id}_{timestamp}.csv"
-        filepath = self.export_dir / filename
-        
-        entries = await self._get_filtered_entries(
+        result = await self.stream_user_ledger_csv(
             user_id=user_id,
             start_date=start_date,
             end_date=end_date,
@@ -80,55 +85,71 @@ class LedgerExporter:
             chains=chains,
             min_amount_gbp=min_amount_gbp,
             include_gas_fees=include_gas_fees,
+            compression=compression,
         )
+        return result.path
+    
+    async def stream_user_ledger_csv(
+        self,
+        user_id: int,
+        path: Optional[Path] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        entry_types: Optional[List[str]] = None,
+        chains: Optional[List[str]] = None,
+        min_amount_gbp: Optional[Decimal] = None,
+        include_gas_fees: bool = True,
+        compression: Optional[str] = None,
+    ) -> ExportResult:
+        """
+        Stream user's ledger to CSV in constant memory.
         
-        # Write CSV with comprehensive headers
-        with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'timestamp', 'trace_id', 'entry_type', 'description',
-                'chain', 'wallet_address', 'amount_gbp', 'amount_native',
-                'currency', 'fx_rate_gbp', 'pnl_gbp', 'pnl_native',
-                'transaction_id', 'gas_fee_gbp', 'gas_fee_native',
-                'token_symbol', 'token_address', 'dex', 'pair_address',
-                'slippage_percent', 'notes', 'created_at'
-            ]
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+        Entries are fetched through a server-side cursor in chunks of
+        ``ledger_export_chunk_rows`` and written (and optionally compressed)
+        as they arrive, with the row count and checksum taken in the same pass.
+        
+        Args:
+            user_id: User ID
+            path: Output path without compression suffix (defaults to a
+                timestamped file in the export directory)
+            start_date: Optional start date filter
+            end_date: Optional end date filter
+            entry_types: Optional entry type filter
+            chains: Optional chain filter
+            min_amount_gbp: Optional minimum GBP amount filter
+            include_gas_fees: Whether to include gas fee entries
+            compression: Optional on-the-fly compression ("gzip" or "zstd")
             
-            for entry in entries:
-                writer.writerow({
-                    'timestamp': entry.created_at.isoformat(),
-                    'trace_id': entry.trace_id,
-                    'entry_type': entry.entry_type,
-                    'description': entry.description,
-                    'chain': entry.chain,
-                    'wallet_address': entry.wallet_address,
-                    'amount_gbp': str(entry.amount_gbp),
-                    'amount_native': str(entry.amount_native),
-                    'currency': entry.currency,
-                    'fx_rate_gbp': str(entry.fx_rate_gbp),
-                    'pnl_gbp': str(entry.pnl_gbp) if entry.pnl_gbp else '',
-                    'pnl_native': str(entry.pnl_native) if entry.pnl_native else '',
-                    'transaction_id': entry.transaction_id or '',
-                    'gas_fee_gbp': str(entry.metadata.get('gas_fee_gbp', '')) if entry.metadata else '',
-                    'gas_fee_native': str(entry.metadata.get('gas_fee_native', '')) if entry.metadata else '',
-                    'token_symbol': entry.metadata.get('token_symbol', '') if entry.metadata else '',
-                    'token_address': entry.metadata.get('token_address', '') if entry.metadata else '',
-                    'dex': entry.metadata.get('dex', '') if entry.metadata else '',
-                    'pair_address': entry.metadata.get('pair_address', '') if entry.metadata else '',
-                    'slippage_percent': str(entry.metadata.get('slippage', '')) if entry.metadata else '',
-                    'notes': entry.metadata.get('notes', '') if entry.metadata else '',
-                    'created_at': entry.created_at.isoformat(),
-                })
+        Returns:
+            Export result with path, row count, sizes and SHA-256
+        """
+        if path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            path = self.export_dir / f"ledger_user_{user_id}_{timestamp}.csv"
+        
+        async def rows() -> AsyncIterator[List[Dict[str, str]]]:
+            async for chunk in self._iter_entry_chunks(
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                entry_types=entry_types,
+                chains=chains,
+                min_amount_gbp=min_amount_gbp,
+                include_gas_fees=include_gas_fees,
+            ):
+                yield [ledger_csv_row(entry) for entry in chunk]
+        
+        result = await write_csv_stream(path, rows(), compression=compression)
         
         logger.info(
-            f"CSV export created: {filepath}",
+            f"CSV export created: {result.path}",
             extra={
                 'extra_data': {
                     'user_id': user_id,
-                    'entries_count': len(entries),
-                    'file_size_kb': filepath.stat().st_size // 1024,
+                    'entries_count': result.rows,
+                    'file_size_kb': result.bytes_written // 1024,
+                    'compression': result.compression,
+                    'sha256': result.sha256,
                     'filters_applied': {
                         'date_range': bool(start_date or end_date),
                         'entry_types': bool(entry_types),
@@ -139,7 +160,7 @@ class LedgerExporter:
             }
         )
         
-        return filepath
+        return result
     
     async def export_user_ledger_xlsx(
         self,
@@ -171,106 +192,35 @@ class LedgerExporter:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"ledger_user_{user_id}_{timestamp}.xlsx"
         filepath = self.export_dir / filename
+        summary = LedgerSummary() if include_summary else None
         
-        entries = await self._get_filtered_entries(
-            user_id=user_id,
-            start_date=start_date,
-            end_date=end_date,
-            entry_types=entry_types,
-            chains=chains,
-            min_amount_gbp=min_amount_gbp,
-            include_gas_fees=include_gas_fees,
-        )
-        
-        # Convert to DataFrame
-        data = []
-        for entry in entries:
-            data.append({
-                'Timestamp': entry.created_at,
-                'Trace ID': entry.trace_id,
-                'Type': entry.entry_type,
-                'Description': entry.description,
-                'Chain': entry.chain,
-                'Wallet': entry.wallet_address,
-                'Amount (GBP)': float(entry.amount_gbp),
-                'Amount (Native)': float(entry.amount_native),
-                'Currency': entry.currency,
-                'FX Rate (GBP)': float(entry.fx_rate_gbp),
-                'PnL (GBP)': float(entry.pnl_gbp) if entry.pnl_gbp else None,
-                'PnL (Native)': float(entry.pnl_native) if entry.pnl_native else None,
-                'Transaction ID': entry.transaction_id,
-                'Gas Fee (GBP)': float(entry.metadata.get('gas_fee_gbp', 0)) if entry.metadata and entry.metadata.get('gas_fee_gbp') else None,
-                'Gas Fee (Native)': float(entry.metadata.get('gas_fee_native', 0)) if entry.metadata and entry.metadata.get('gas_fee_native') else None,
-                'Token Symbol': entry.metadata.get('token_symbol', '') if entry.metadata else '',
-                'Token Address': entry.metadata.get('token_address', '') if entry.metadata else '',
-                'DEX': entry.metadata.get('dex', '') if entry.metadata else '',
-                'Pair Address': entry.metadata.get('pair_address', '') if entry.metadata else '',
-                'Slippage (%)': float(entry.metadata.get('slippage', 0)) if entry.metadata and entry.metadata.get('slippage') else None,
-                'Notes': entry.metadata.get('notes', '') if entry.metadata else '',
-            })
-        
-        # Create DataFrame
-        if not data:
-            df = pd.DataFrame(columns=[
-                'Timestamp', 'Trace ID', 'Type', 'Description', 'Chain',
-                'Wallet', 'Amount (GBP)', 'Amount (Native)', 'Currency',
-                'FX Rate (GBP)', 'PnL (GBP)', 'PnL (Native)', 'Transaction ID',
-                'Gas Fee (GBP)', 'Gas Fee (Native)', 'Token Symbol',
-                'Token Address', 'DEX', 'Pair Address', 'Slippage (%)', 'Notes'
-            ])
-        else:
-            df = pd.DataFrame(data)
+        async def rows() -> AsyncIterator[List[List[Any]]]:
+            async for chunk in self._iter_entry_chunks(
+                user_id=user_id,
+                start_date=start_date,
+                end_date=end_date,
+                entry_types=entry_types,
+                chains=chains,
+                min_amount_gbp=min_amount_gbp,
+                include_gas_fees=include_gas_fees,
+            ):
+                if summary is not None:
+                    for entry in chunk:
+                        summary.add(entry)
+                yield [ledger_xlsx_row(entry) for entry in chunk]
         
-        # Export to Excel with formatting and optional summary
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # Main ledger sheet
-            df.to_excel(writer, sheet_name='Ledger', index=False)
-            
-            # Format main sheet
-            workbook = writer.book
-            worksheet = writer.sheets['Ledger']
-            
-            # Auto-adjust column widths
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
-            
-            # Create summary sheet if requested and data exists
-            if include_summary and data:
-                summary_data = await self._create_summary_data(entries)
-                summary_df = pd.DataFrame(summary_data)
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-                
-                # Format summary sheet
-                summary_worksheet = writer.sheets['Summary']
-                for column in summary_worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 30)
-                    summary_worksheet.column_dimensions[column_letter].width = adjusted_width
+        # Write-only workbook: rows stream to disk instead of a cell tree
+        result = await write_xlsx_stream(filepath, rows(), summary=summary)
         
         logger.info(
             f"XLSX export created: {filepath}",
             extra={
                 'extra_data': {
                     'user_id': user_id,
-                    'entries_count': len(entries),
-                    'file_size_kb': filepath.stat().st_size // 1024,
+                    'entries_count': result.rows,
+                    'file_size_kb': result.bytes_written // 1024,
                     'include_summary': include_summary,
+                    'sha256': result.sha256,
                 }
             }
         )
@@ -321,34 +271,38 @@ class LedgerExporter:
         # Process entries for tax reporting
         tax_data = await self._process_tax_data(entries, country_code)
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # Disposals (sales) sheet
-            if tax_data['disposals']:
-                disposals_df = pd.DataFrame(tax_data['disposals'])
-                disposals_df.to_excel(writer, sheet_name='Disposals', index=False)
+        def write_report() -> None:
+            with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+                # Disposals (sales) sheet
+                if tax_data['disposals']:
+                    disposals_df = pd.DataFrame(tax_data['disposals'])
+                    disposals_df.to_excel(writer, sheet_name='Disposals', index=False)
             
-            # Acquisitions (purchases) sheet
-            if tax_data['acquisitions']:
-                acquisitions_df = pd.DataFrame(tax_data['acquisitions'])
-                acquisitions_df.to_excel(writer, sheet_name='Acquisitions', index=False)
+                # Acquisitions (purchases) sheet
+                if tax_data['acquisitions']:
+                    acquisitions_df = pd.DataFrame(tax_data['acquisitions'])
+                    acquisitions_df.to_excel(writer, sheet_name='Acquisitions', index=False)
             
-            # Summary sheet
-            summary_df = pd.DataFrame(tax_data['summary'])
-            summary_df.to_excel(writer, sheet_name='Tax Summary', index=False)
+                # Summary sheet
+                summary_df = pd.DataFrame(tax_data['summary'])
+                summary_df.to_excel(writer, sheet_name='Tax Summary', index=False)
             
-            # Format all sheets
-            for sheet_name, worksheet in writer.sheets.items():
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
-                    adjusted_width = min(max_length + 2, 40)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
+                # Format all sheets
+                for sheet_name, worksheet in writer.sheets.items():
+                    for column in worksheet.columns:
+                        max_length = 0
+                        column_letter = column[0].column_letter
+                        for cell in column:
+                            try:
+                                if len(str(cell.value)) > max_length:
+                                    max_length = len(str(cell.value))
+                            except:
+                                pass
+                        adjusted_width = min(max_length + 2, 40)
+                        worksheet.column_dimensions[column_letter].width = adjusted_width
+        
+        # Workbook assembly is blocking file I/O; keep it off the event loop
+        await asyncio.to_thread(write_report)
         
         logger.info(
             f"Tax report created: {filepath}",
@@ -377,74 +331,78 @@ class LedgerExporter:
         include_gas_fees: bool = True,
     ) -> List[LedgerEntry]:
         """Get filtered ledger entries based on criteria."""
-        async with get_session_context() as session:
-            ledger_repo = LedgerRepository(session)
-            
-            # Build filters
-            filters = []
-            
-            if start_date:
-                filters.append(LedgerEntry.created_at >= start_date)
-            
-            if end_date:
-                filters.append(LedgerEntry.created_at <= end_date)
-            
-            if entry_types:
-                filters.append(LedgerEntry.entry_type.in_(entry_types))
-            
-            if chains:
-                filters.append(LedgerEntry.chain.in_(chains))
-            
-            if min_amount_gbp:
-                filters.append(LedgerEntry.amount_gbp >= min_amount_gbp)
-            
-            if not include_gas_fees:
-                filters.append(LedgerEntry.entry_type != 'gas_fee')
-            
-            # Get filtered entries
-            entries = await ledger_repo.get_user_ledger(
+        return [
+            entry
+            async for chunk in self._iter_entry_chunks(
                 user_id=user_id,
-                limit=50000,  # Large limit for export
-                additional_filters=filters if filters else None,
+                start_date=start_date,
+                end_date=end_date,
+                entry_types=entry_types,
+                chains=chains,
+                min_amount_gbp=min_amount_gbp,
+                include_gas_fees=include_gas_fees,
             )
-            
-            return entries
+            for entry in chunk
+        ]
+    
+    async def _iter_entry_chunks(
+        self,
+        user_id: int,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        entry_types: Optional[List[str]] = None,
+        chains: Optional[List[str]] = None,
+        min_amount_gbp: Optional[Decimal] = None,
+        include_gas_fees: bool = True,
+        chunk_size: Optional[int] = None,
+    ) -> AsyncIterator[List[LedgerEntry]]:
+        """
+        Yield filtered ledger entries in chronological chunks.
+        
+        Uses a streaming (server-side cursor) result with ``yield_per`` so
+        only one chunk of rows is buffered at a time.
+        """
+        chunk_size = chunk_size or settings.ledger_export_chunk_rows
+        
+        # Build filters
+        filters = [LedgerEntry.user_id == user_id]
+        
+        if start_date:
+            filters.append(LedgerEntry.created_at >= start_date)
+        
+        if end_date:
+            filters.append(LedgerEntry.created_at <= end_date)
+        
+        if entry_types:
+            filters.append(LedgerEntry.entry_type.in_(entry_types))
+        
+        if chains:
+            filters.append(LedgerEntry.chain.in_(chains))
+        
+        if min_amount_gbp:
+            filters.append(LedgerEntry.amount_gbp >= min_amount_gbp)
+        
+        if not include_gas_fees:
+            filters.append(LedgerEntry.entry_type != 'gas_fee')
+        
+        stmt = (
+            select(LedgerEntry)
+            .where(and_(*filters))
+            .order_by(LedgerEntry.created_at)
+            .execution_options(yield_per=chunk_size)
+        )
+        
+        async with get_session_context() as session:
+            result = await session.stream_scalars(stmt)
+            async for chunk in result.partitions(chunk_size):
+                yield chunk
     
     async def _create_summary_data(self, entries: List[LedgerEntry]) -> List[Dict[str, Any]]:
         """Create summary data for XLSX export."""
-        summary = []
-        
-        # Group by entry type
-        type_groups = {}
+        summary = LedgerSummary()
         for entry in entries:
-            entry_type = entry.entry_type
-            if entry_type not in type_groups:
-                type_groups[entry_type] = []
-            type_groups[entry_type].append(entry)
-        
-        # Calculate summaries by type
-        for entry_type, type_entries in type_groups.items():
-            total_gbp = sum(float(entry.amount_gbp) for entry in type_entries)
-            total_pnl_gbp = sum(float(entry.pnl_gbp or 0) for entry in type_entries)
-            
-            summary.append({
-                'Entry Type': entry_type.title(),
-                'Count': len(type_entries),
-                'Total Amount (GBP)': total_gbp,
-                'Total PnL (GBP)': total_pnl_gbp,
-                'Average Amount (GBP)': total_gbp / len(type_entries) if type_entries else 0,
-            })
-        
-        # Add overall totals
-        summary.append({
-            'Entry Type': 'TOTAL',
-            'Count': len(entries),
-            'Total Amount (GBP)': sum(float(entry.amount_gbp) for entry in entries),
-            'Total PnL (GBP)': sum(float(entry.pnl_gbp or 0) for entry in entries),
-            'Average Amount (GBP)': sum(float(entry.amount_gbp) for entry in entries) / len(entries) if entries else 0,
-        })
-        
-        return summary
+            summary.add(entry)
+        return summary.rows()
     
     async def _process_tax_data(
         self, 
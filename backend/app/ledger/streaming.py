@@ -0,0 +1,445 @@
+"""
+Constant-memory ledger export writers.
+
+Rows arrive in chunks (from a server-side cursor) and are written straight
+to disk, so an export holds one chunk at a time regardless of ledger size.
+CSV output can be compressed on the fly with gzip or zstd; the row count,
+uncompressed size and SHA-256 of the bytes on disk are all taken in that
+same pass. XLSX output uses openpyxl's write-only mode, which streams rows
+to the sheet's temporary XML instead of building a cell tree.
+
+Writers are blocking objects; ``write_csv_stream``/``write_xlsx_stream``
+drive them from async code with each chunk's formatting, compression and
+file I/O offloaded to a worker thread. Files are written under a ``.part``
+name and renamed when complete, so a failed export never leaves a
+truncated file at the final path.
+"""
+from __future__ import annotations
+
+import asyncio
+import csv
+import gzip
+import hashlib
+import io
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, IO, Iterable, List, Optional, Sequence
+
+try:
+    import zstandard
+except ImportError:  # Optional: zstd archives fall back to gzip
+    zstandard = None
+
+try:
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+HASH_BLOCK_SIZE = 1024 * 1024
+
+CSV_FIELDNAMES = [
+    'timestamp', 'trace_id', 'entry_type', 'description',
+    'chain', 'wallet_address', 'amount_gbp', 'amount_native',
+    'currency', 'fx_rate_gbp', 'pnl_gbp', 'pnl_native',
+    'transaction_id', 'gas_fee_gbp', 'gas_fee_native',
+    'token_symbol', 'token_address', 'dex', 'pair_address',
+    'slippage_percent', 'notes', 'created_at'
+]
+
+XLSX_COLUMNS = [
+    'Timestamp', 'Trace ID', 'Type', 'Description', 'Chain',
+    'Wallet', 'Amount (GBP)', 'Amount (Native)', 'Currency',
+    'FX Rate (GBP)', 'PnL (GBP)', 'PnL (Native)', 'Transaction ID',
+    'Gas Fee (GBP)', 'Gas Fee (Native)', 'Token Symbol',
+    'Token Address', 'DEX', 'Pair Address', 'Slippage (%)', 'Notes'
+]
+
+# Write-only sheets cannot be measured after writing, so widths are fixed
+XLSX_COLUMN_WIDTHS = {
+    'Timestamp': 20, 'Trace ID': 38, 'Description': 40, 'Wallet': 44,
+    'Transaction ID': 20, 'Token Address': 44, 'Pair Address': 44, 'Notes': 50,
+}
+
+
+def ledger_csv_row(entry: Any) -> Dict[str, str]:
+    """Map a ledger entry to a CSV export row."""
+    metadata = entry.metadata or {}
+    return {
+        'timestamp': entry.created_at.isoformat(),
+        'trace_id': entry.trace_id,
+        'entry_type': entry.entry_type,
+        'description': entry.description,
+        'chain': entry.chain,
+        'wallet_address': entry.wallet_address,
+        'amount_gbp': str(entry.amount_gbp),
+        'amount_native': str(entry.amount_native),
+        'currency': entry.currency,
+        'fx_rate_gbp': str(entry.fx_rate_gbp),
+        'pnl_gbp': str(entry.pnl_gbp) if entry.pnl_gbp else '',
+        'pnl_native': str(entry.pnl_native) if entry.pnl_native else '',
+        'transaction_id': entry.transaction_id or '',
+        'gas_fee_gbp': str(metadata.get('gas_fee_gbp', '')),
+        'gas_fee_native': str(metadata.get('gas_fee_native', '')),
+        'token_symbol': metadata.get('token_symbol', ''),
+        'token_address': metadata.get('token_address', ''),
+        'dex': metadata.get('dex', ''),
+        'pair_address': metadata.get('pair_address', ''),
+        'slippage_percent': str(metadata.get('slippage', '')),
+        'notes': metadata.get('notes', ''),
+        'created_at': entry.created_at.isoformat(),
+    }
+
+
+def ledger_xlsx_row(entry: Any) -> List[Any]:
+    """Map a ledger entry to an XLSX row in ``XLSX_COLUMNS`` order."""
+    metadata = entry.metadata or {}
+    return [
+        entry.created_at,
+        entry.trace_id,
+        entry.entry_type,
+        entry.description,
+        entry.chain,
+        entry.wallet_address,
+        float(entry.amount_gbp),
+        float(entry.amount_native),
+        entry.currency,
+        float(entry.fx_rate_gbp),
+        float(entry.pnl_gbp) if entry.pnl_gbp else None,
+        float(entry.pnl_native) if entry.pnl_native else None,
+        entry.transaction_id,
+        float(metadata['gas_fee_gbp']) if metadata.get('gas_fee_gbp') else None,
+        float(metadata['gas_fee_native']) if metadata.get('gas_fee_native') else None,
+        metadata.get('token_symbol', ''),
+        metadata.get('token_address', ''),
+        metadata.get('dex', ''),
+        metadata.get('pair_address', ''),
+        float(metadata['slippage']) if metadata.get('slippage') else None,
+        metadata.get('notes', ''),
+    ]
+
+
+class LedgerSummary:
+    """Per-entry-type totals accumulated while rows stream past."""
+
+    def __init__(self) -> None:
+        """Initialize empty totals."""
+        self.by_type: Dict[str, List[float]] = {}  # type -> [count, amount, pnl]
+
+    def add(self, entry: Any) -> None:
+        """Account for one ledger entry."""
+        totals = self.by_type.setdefault(entry.entry_type, [0, 0.0, 0.0])
+        totals[0] += 1
+        totals[1] += float(entry.amount_gbp)
+        totals[2] += float(entry.pnl_gbp or 0)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Summary rows by entry type followed by the overall total."""
+        summary = []
+        count, amount, pnl = 0, 0.0, 0.0
+        for entry_type, (type_count, type_amount, type_pnl) in self.by_type.items():
+            summary.append({
+                'Entry Type': entry_type.title(),
+                'Count': type_count,
+                'Total Amount (GBP)': type_amount,
+                'Total PnL (GBP)': type_pnl,
+                'Average Amount (GBP)': type_amount / type_count,
+            })
+            count += type_count
+            amount += type_amount
+            pnl += type_pnl
+        summary.append({
+            'Entry Type': 'TOTAL',
+            'Count': count,
+            'Total Amount (GBP)': amount,
+            'Total PnL (GBP)': pnl,
+            'Average Amount (GBP)': amount / count if count else 0,
+        })
+        return summary
+
+
+@dataclass
+class ExportResult:
+    """Outcome of a streamed export."""
+    path: Path
+    rows: int
+    raw_bytes: int  # Uncompressed size
+    bytes_written: int  # Size on disk
+    sha256: str  # Of the bytes on disk
+    compression: Optional[str] = None
+
+    @property
+    def compression_ratio(self) -> float:
+        """On-disk size relative to the uncompressed size."""
+        return self.bytes_written / self.raw_bytes if self.raw_bytes else 0.0
+
+
+class _HashingFile(io.RawIOBase):
+    """Write-only file wrapper that hashes and counts bytes on their way to disk."""
+
+    def __init__(self, target: IO[bytes]) -> None:
+        self.target = target
+        self.sha256 = hashlib.sha256()
+        self.bytes_written = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.bytes_written += len(data)
+        return self.target.write(data)
+
+    def flush(self) -> None:
+        self.target.flush()
+
+
+def resolve_compression(compression: Optional[str]) -> Optional[str]:
+    """Validate a compression name, falling back to gzip when zstd is unavailable."""
+    if compression is None:
+        return None
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unsupported compression: {compression}")
+    if compression == "zstd" and zstandard is None:
+        logger.warning("zstandard is not installed, compressing with gzip instead")
+        return "gzip"
+    return compression
+
+
+def compressed_path(path: Path, compression: Optional[str]) -> Path:
+    """Append the suffix of ``compression`` to ``path``."""
+    return Path(str(path) + COMPRESSION_SUFFIXES[compression]) if compression else path
+
+
+def open_archive_text(path: Path) -> IO[str]:
+    """Open a plain, ``.gz`` or ``.zst`` text file for reading."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise ImportError("zstandard is required to read .zst archives")
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True),
+            encoding="utf-8", newline="",
+        )
+    return open(path, "r", encoding="utf-8", newline="")
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in fixed-size blocks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CsvStreamWriter:
+    """Blocking CSV writer with on-the-fly compression, hashing and row counting."""
+
+    def __init__(
+        self,
+        path: Path,
+        fieldnames: Sequence[str],
+        compression: Optional[str] = None,
+        zstd_level: int = 10,
+    ) -> None:
+        """
+        Open the output and write the header.
+
+        Args:
+            path: Final path, without the compression suffix
+            fieldnames: CSV columns
+            compression: None, "gzip" or "zstd"
+            zstd_level: zstd compression level
+        """
+        self.compression = resolve_compression(compression)
+        self.path = compressed_path(Path(path), self.compression)
+        self.part_path = self.path.with_name(self.path.name + ".part")
+        self.fieldnames = list(fieldnames)
+        self.rows = 0
+        self.raw_bytes = 0
+
+        self._file = open(self.part_path, "wb")
+        self._hashing = _HashingFile(self._file)
+        if self.compression == "gzip":
+            self._stream: Any = gzip.GzipFile(fileobj=self._hashing, mode="wb", mtime=0)
+        elif self.compression == "zstd":
+            self._stream = zstandard.ZstdCompressor(level=zstd_level).stream_writer(self._hashing, closefd=False)
+        else:
+            self._stream = self._hashing
+        self._buffer = io.StringIO()
+        self._writer = csv.DictWriter(self._buffer, fieldnames=self.fieldnames)
+        self._writer.writeheader()
+        self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        data = self._buffer.getvalue().encode("utf-8")
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        self.raw_bytes += len(data)
+        self._stream.write(data)
+
+    def write_rows(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Format, compress and write a chunk of rows."""
+        before = self.rows
+        for row in rows:
+            self._writer.writerow(row)
+            self.rows += 1
+        if self.rows != before:
+            self._flush_buffer()
+
+    def close(self) -> ExportResult:
+        """Finish the stream and move the file to its final path."""
+        if self._stream is not self._hashing:
+            self._stream.close()
+        self._file.close()
+        os.replace(self.part_path, self.path)
+        return ExportResult(
+            path=self.path,
+            rows=self.rows,
+            raw_bytes=self.raw_bytes,
+            bytes_written=self._hashing.bytes_written,
+            sha256=self._hashing.sha256.hexdigest(),
+            compression=self.compression,
+        )
+
+    def abort(self) -> None:
+        """Discard a partially written export."""
+        try:
+            if self._stream is not self._hashing:
+                self._stream.close()
+        finally:
+            try:
+                self._file.close()
+            finally:
+                self.part_path.unlink(missing_ok=True)
+
+
+class XlsxStreamWriter:
+    """Blocking XLSX writer using an openpyxl write-only workbook."""
+
+    def __init__(self, path: Path, sheet_name: str, columns: Sequence[str]) -> None:
+        """
+        Create the workbook and the header of the main sheet.
+
+        Args:
+            path: Final path
+            sheet_name: Main sheet title
+            columns: Main sheet header
+        """
+        if Workbook is None:
+            raise ImportError("openpyxl is required for XLSX exports")
+        self.path = Path(path)
+        self.part_path = self.path.with_name(self.path.name + ".part")
+        self.rows = 0
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._create_sheet(sheet_name, columns)
+
+    def _create_sheet(self, title: str, columns: Sequence[str], max_width: int = 50) -> Any:
+        from openpyxl.utils import get_column_letter
+
+        sheet = self._workbook.create_sheet(title)
+        for index, column in enumerate(columns, start=1):
+            width = XLSX_COLUMN_WIDTHS.get(column, max(len(column) + 2, 12))
+            sheet.column_dimensions[get_column_letter(index)].width = min(width, max_width)
+        sheet.append(list(columns))
+        return sheet
+
+    def write_rows(self, rows: Iterable[Sequence[Any]]) -> None:
+        """Append a chunk of rows to the main sheet."""
+        for row in rows:
+            self._sheet.append(row)
+            self.rows += 1
+
+    def add_sheet(self, title: str, records: List[Dict[str, Any]]) -> None:
+        """Append a small sheet of records (e.g. a summary) after the main one."""
+        if not records:
+            return
+        columns = list(records[0])
+        sheet = self._create_sheet(title, columns, max_width=30)
+        for record in records:
+            sheet.append([record.get(column) for column in columns])
+
+    def close(self) -> ExportResult:
+        """Save the workbook and move it to its final path."""
+        self._workbook.save(self.part_path)
+        os.replace(self.part_path, self.path)
+        # The zip container is assembled by openpyxl, so it is hashed once after saving
+        size = self.path.stat().st_size
+        return ExportResult(
+            path=self.path,
+            rows=self.rows,
+            raw_bytes=size,
+            bytes_written=size,
+            sha256=file_sha256(self.path),
+        )
+
+    def abort(self) -> None:
+        """Discard a partially written export."""
+        self.part_path.unlink(missing_ok=True)
+
+
+async def write_csv_stream(
+    path: Path,
+    chunks: AsyncIterator[List[Dict[str, Any]]],
+    fieldnames: Sequence[str] = CSV_FIELDNAMES,
+    compression: Optional[str] = None,
+) -> ExportResult:
+    """
+    Write chunks of CSV rows without holding more than one chunk.
+
+    Args:
+        path: Final path, without the compression suffix
+        chunks: Async iterator of row chunks
+        fieldnames: CSV columns
+        compression: None, "gzip" or "zstd"
+
+    Returns:
+        Export result with row count, sizes and checksum
+    """
+    writer = await asyncio.to_thread(CsvStreamWriter, path, fieldnames, compression)
+    try:
+        async for rows in chunks:
+            await asyncio.to_thread(writer.write_rows, rows)
+        return await asyncio.to_thread(writer.close)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
+
+
+async def write_xlsx_stream(
+    path: Path,
+    chunks: AsyncIterator[List[Sequence[Any]]],
+    columns: Sequence[str] = XLSX_COLUMNS,
+    sheet_name: str = "Ledger",
+    summary: Optional[LedgerSummary] = None,
+) -> ExportResult:
+    """
+    Write chunks of XLSX rows through a write-only workbook.
+
+    Args:
+        path: Final path
+        chunks: Async iterator of row chunks
+        columns: Main sheet header
+        sheet_name: Main sheet title
+        summary: Totals filled in while the chunks are produced; written
+            as a "Summary" sheet if any rows were exported
+
+    Returns:
+        Export result with row count, size and checksum
+    """
+    writer = await asyncio.to_thread(XlsxStreamWriter, path, sheet_name, columns)
+    try:
+        async for rows in chunks:
+            await asyncio.to_thread(writer.write_rows, rows)
+        if summary is not None and writer.rows:
+            writer.add_sheet("Summary", summary.rows())
+        return await asyncio.to_thread(writer.close)
+    except BaseException:
+        await asyncio.to_thread(writer.abort)
+        raise
@@ -0,0 +1,48 @@
+"""
+Rolling latency histograms shared by the RPC pool, event processing and trading.
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional
+
+# Samples kept per latency histogram
+LATENCY_WINDOW_SIZE = 256
+
+
+class LatencyHistogram:
+    """Rolling window of response times with percentile queries."""
+
+    def __init__(self, window_size: int = LATENCY_WINDOW_SIZE) -> None:
+        """Initialize histogram."""
+        self._samples: Deque[float] = deque(maxlen=window_size)
+        self._sorted: Optional[List[float]] = None
+
+    def record(self, latency_ms: float) -> None:
+        """Add a latency sample."""
+        self._samples.append(latency_ms)
+        self._sorted = None
+
+    @property
+    def count(self) -> int:
+        """Number of samples in the window."""
+        return len(self._samples)
+
+    def percentile(self, fraction: float) -> float:
+        """Get a percentile (0-1) using nearest-rank; 0.0 when empty."""
+        if not self._samples:
+            return 0.0
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        rank = max(math.ceil(fraction * len(self._sorted)) - 1, 0)
+        return self._sorted[rank]
+
+    def snapshot(self) -> Dict[str, float]:
+        """Get p50/p95/p99 summary."""
+        return {
+            "p50_ms": round(self.percentile(0.50), 2),
+            "p95_ms": round(self.percentile(0.95), 2),
+            "p99_ms": round(self.percentile(0.99), 2),
+            "samples": self.count,
+        }
@@ -0,0 +1,555 @@
+"""
+Local honeypot and tax detection by simulating a buy/sell round trip.
+
+``HoneypotSimulator`` sends one ``eth_call`` to a throwaway contract that
+exists only in the call's state override. Funded with native currency, the
+contract:
+
+1. quotes ``getAmountsOut(amountIn, [weth, token])`` on the router
+2. buys through ``swapExactETHForTokensSupportingFeeOnTransferTokens``
+3. measures the tokens it actually received with ``balanceOf``
+4. approves the router and quotes selling everything back
+5. sells through ``swapExactTokensForETHSupportingFeeOnTransferTokens``
+6. measures the native currency it actually received
+
+and returns a status code, both quotes, both received amounts and the gas
+of each swap. Buy tax is the shortfall of tokens received against the
+quote, sell tax the shortfall of native currency received against the
+quote, and a token that can be bought but not sold is a honeypot. The
+result depends only on chain state at the simulated block, so it is
+deterministic and costs one RPC instead of several third-party API calls.
+
+Results are shared for about one block time, and concurrent requests for
+the same token share a single simulation, so the honeypot and tax checks
+of one risk assessment cost one ``eth_call`` between them.
+
+File: backend/app/services/honeypot_simulator.py
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from ..chains.contract_calls import ROUTER_GET_AMOUNTS_OUT_SELECTOR
+from ..chains.multicall import encode_address, encode_uint
+from ..chains.rpc_cache import CHAIN_BLOCK_TIMES, DEFAULT_BLOCK_TIME
+from ..chains.rpc_pool import RpcPool, rpc_pool
+
+logger = logging.getLogger(__name__)
+
+# Function selectors used by the simulation contract
+ERC20_BALANCE_OF_SELECTOR = "70a08231"  # balanceOf(address)
+ERC20_APPROVE_SELECTOR = "095ea7b3"  # approve(address,uint256)
+# swapExactETHForTokensSupportingFeeOnTransferTokens(uint256,address[],address,uint256)
+ROUTER_SWAP_ETH_FOR_TOKENS_SELECTOR = "b6f9de95"
+# swapExactTokensForETHSupportingFeeOnTransferTokens(uint256,uint256,address[],address,uint256)
+ROUTER_SWAP_TOKENS_FOR_ETH_SELECTOR = "791ac947"
+
+# Address the simulation contract is injected at; no code lives there on-chain
+SIMULATOR_ADDRESS = "0x000000000000000000000000000000000000a7e5"
+
+SIMULATION_GAS = 8_000_000
+
+# Sell tax at or above which a sellable token is still treated as a honeypot
+HONEYPOT_SELL_TAX = 0.9
+
+# V2 router and wrapped native token simulated against per chain
+DEFAULT_ROUTERS: Dict[str, Tuple[str, str]] = {
+    "ethereum": (
+        "0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D",  # Uniswap V2
+        "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2",  # WETH
+    ),
+    "bsc": (
+        "0x10ED43C718714eb63d5aA57B78B54704E256024E",  # PancakeSwap V2
+        "0xbb4CdB9CBd36B01bD1cBaEBF2De08d9173bc095c",  # WBNB
+    ),
+    "polygon": (
+        "0xa5E0829CaCEd8fFDD4De3c43696c57F7D7A678ff",  # QuickSwap
+        "0x0d500B1d8E8eF31E21C99d1Db9A6444d3ADf1270",  # WMATIC
+    ),
+    "base": (
+        "0x4752ba5DBc23f44D87826276BF6Fd6b1C372aD24",  # Uniswap V2
+        "0x4200000000000000000000000000000000000006",  # WETH
+    ),
+    "arbitrum": (
+        "0x1b02dA8Cb0d097eB8D57A175b88c7D8b47997506",  # SushiSwap
+        "0x82aF49447D8a07e3bd95BD0d56f35241523fBab1",  # WETH
+    ),
+}
+
+# Native amount (wei) bought per simulation: small next to real pools
+DEFAULT_AMOUNTS_IN: Dict[str, int] = {
+    "ethereum": 10**16,  # 0.01 ETH
+    "bsc": 5 * 10**16,  # 0.05 BNB
+    "polygon": 20 * 10**18,  # 20 MATIC
+    "base": 10**16,
+    "arbitrum": 10**16,
+}
+
+
+class SimulationStatus(str, Enum):
+    """Outcome of a round-trip simulation."""
+    OK = "ok"
+    NO_LIQUIDITY = "no_liquidity"  # Router could not quote the buy
+    BUY_FAILED = "buy_failed"  # Buy swap (or balanceOf) reverted
+    NOTHING_RECEIVED = "nothing_received"  # Buy succeeded but no tokens arrived
+    APPROVE_FAILED = "approve_failed"
+    SELL_QUOTE_FAILED = "sell_quote_failed"
+    SELL_FAILED = "sell_failed"  # Sell swap reverted
+    ERROR = "error"  # The eth_call itself failed
+
+
+# Status codes returned by the contract, in SimulationStatus order
+_STATUS_CODES: Tuple[SimulationStatus, ...] = (
+    SimulationStatus.OK,
+    SimulationStatus.NO_LIQUIDITY,
+    SimulationStatus.BUY_FAILED,
+    SimulationStatus.NOTHING_RECEIVED,
+    SimulationStatus.APPROVE_FAILED,
+    SimulationStatus.SELL_QUOTE_FAILED,
+    SimulationStatus.SELL_FAILED,
+)
+
+_HONEYPOT_STATUSES = frozenset({
+    SimulationStatus.NOTHING_RECEIVED,
+    SimulationStatus.APPROVE_FAILED,
+    SimulationStatus.SELL_QUOTE_FAILED,
+    SimulationStatus.SELL_FAILED,
+})
+
+
+@dataclass
+class SimulationResult:
+    """Decoded buy/sell round trip for one token."""
+    token_address: str
+    chain: str
+    router: str
+    status: SimulationStatus
+    amount_in: int  # Native wei spent on the buy
+    expected_buy: int = 0  # Tokens quoted for amount_in
+    received: int = 0  # Tokens actually received
+    expected_sell: int = 0  # Native wei quoted for received
+    eth_received: int = 0  # Native wei actually received
+    buy_gas: int = 0
+    sell_gas: int = 0
+    error: Optional[str] = None
+
+    @property
+    def simulated(self) -> bool:
+        """True if the contract ran against a tradeable pool."""
+        return self.status not in (SimulationStatus.ERROR, SimulationStatus.NO_LIQUIDITY)
+
+    @property
+    def buy_tax(self) -> Optional[float]:
+        """Share of quoted tokens withheld on the buy, if measured."""
+        if self.status is SimulationStatus.NOTHING_RECEIVED:
+            return 1.0
+        if not self.received or not self.expected_buy:
+            return None
+        return _shortfall(self.received, self.expected_buy)
+
+    @property
+    def sell_tax(self) -> Optional[float]:
+        """Share of quoted native currency withheld on the sell, if measured."""
+        if self.status is not SimulationStatus.OK or not self.expected_sell:
+            return None
+        return _shortfall(self.eth_received, self.expected_sell)
+
+    @property
+    def is_honeypot(self) -> bool:
+        """True if tokens can be bought but not (meaningfully) sold."""
+        if self.status in _HONEYPOT_STATUSES:
+            return True
+        sell_tax = self.sell_tax
+        return sell_tax is not None and sell_tax >= HONEYPOT_SELL_TAX
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable summary for risk details and logs."""
+        return {
+            "status": self.status.value,
+            "router": self.router,
+            "amount_in": str(self.amount_in),
+            "buy_tax": self.buy_tax,
+            "sell_tax": self.sell_tax,
+            "is_honeypot": self.is_honeypot,
+            "buy_gas_used": self.buy_gas,
+            "sell_gas_used": self.sell_gas,
+            "error": self.error,
+        }
+
+
+def _shortfall(actual: int, expected: int) -> float:
+    """Fraction of ``expected`` missing from ``actual``, clamped to [0, 1]."""
+    return min(1.0, max(0.0, 1.0 - actual / expected))
+
+
+# ---------------------------------------------------------------------------
+# Simulation contract
+# ---------------------------------------------------------------------------
+
+_OPCODES = {
+    "STOP": 0x00, "SUB": 0x03, "ISZERO": 0x15, "NOT": 0x19,
+    "ADDRESS": 0x30, "CALLDATALOAD": 0x35, "CALLDATASIZE": 0x36,
+    "SELFBALANCE": 0x47, "MLOAD": 0x51, "MSTORE": 0x52, "JUMP": 0x56,
+    "JUMPI": 0x57, "GAS": 0x5a, "JUMPDEST": 0x5b, "CALL": 0xf1,
+    "RETURN": 0xf3, "STATICCALL": 0xfa,
+}
+
+Instruction = Union[int, str]
+
+
+def assemble(program: List[Instruction]) -> bytes:
+    """
+    Assemble a tiny EVM program.
+
+    Integers become the shortest PUSH (PUSH0 is avoided for chains without
+    Shanghai), ``":name"`` defines a jump label and ``"@name"`` pushes its
+    offset as PUSH2; other strings are opcode names.
+
+    Args:
+        program: Instructions in order
+
+    Returns:
+        Runtime bytecode
+    """
+    labels: Dict[str, int] = {}
+    offset = 0
+    for item in program:
+        if isinstance(item, int):
+            offset += 1 + max(1, (item.bit_length() + 7) // 8)
+        elif item.startswith(":"):
+            labels[item[1:]] = offset
+            offset += 1
+        elif item.startswith("@"):
+            offset += 3
+        else:
+            offset += 1
+
+    code = bytearray()
+    for item in program:
+        if isinstance(item, int):
+            size = max(1, (item.bit_length() + 7) // 8)
+            code.append(0x5f + size)
+            code += item.to_bytes(size, "big")
+        elif item.startswith(":"):
+            code.append(_OPCODES["JUMPDEST"])
+        elif item.startswith("@"):
+            code.append(0x61)  # PUSH2
+            code += labels[item[1:]].to_bytes(2, "big")
+        else:
+            code.append(_OPCODES[item])
+    return bytes(code)
+
+
+# Calldata words: router, token, weth, amountIn
+_ROUTER = [0x00, "CALLDATALOAD"]
+_TOKEN = [0x20, "CALLDATALOAD"]
+_WETH = [0x40, "CALLDATALOAD"]
+_AMOUNT_IN = [0x60, "CALLDATALOAD"]
+_MAX_UINT = [0, "NOT"]
+
+# Memory: calldata is built at 0x000, call results land at 0x200,
+# locals live at 0x300 and the returned words at 0x400
+_RETURN_AREA = 0x200
+_BALANCE_BEFORE = 0x300
+_GAS_MARK = 0x320
+_NATIVE_BEFORE = 0x340
+_RESULT = 0x400
+_RESULT_WORDS = 7  # status, expectedBuy, received, expectedSell, ethReceived, buyGas, sellGas
+
+
+def _result(index: int) -> int:
+    """Memory offset of one returned word."""
+    return _RESULT + 32 * index
+
+
+def _mstore(offset: int, value: List[Instruction]) -> List[Instruction]:
+    return [*value, offset, "MSTORE"]
+
+
+def _calldata(selector: str, *words: List[Instruction]) -> List[Instruction]:
+    """Lay out ``selector`` followed by ABI words from memory offset 0."""
+    program = _mstore(0, [int(selector, 16) << 224])
+    for index, word in enumerate(words):
+        program += _mstore(4 + 32 * index, word)
+    return program
+
+
+def _call(target: List[Instruction], args_size: int, value: List[Instruction], ret_size: int = 0) -> List[Instruction]:
+    return [ret_size, _RETURN_AREA, args_size, 0, *value, *target, "GAS", "CALL"]
+
+
+def _staticcall(target: List[Instruction], args_size: int, ret_size: int) -> List[Instruction]:
+    return [ret_size, _RETURN_AREA, args_size, 0, *target, "GAS", "STATICCALL"]
+
+
+def _fail_unless(status: int) -> List[Instruction]:
+    """Consume a call's success flag, bailing out with ``status`` on failure."""
+    return ["ISZERO", f"@fail{status}", "JUMPI"]
+
+
+def _measured_call(call: List[Instruction], gas_word: int) -> List[Instruction]:
+    """Run a call, storing the gas it consumed and leaving its success flag."""
+    return [
+        *_mstore(_GAS_MARK, ["GAS"]),
+        *call,
+        "GAS", _GAS_MARK, "MLOAD", "SUB", _result(gas_word), "MSTORE",
+    ]
+
+
+def _quote(amount: List[Instruction], path: Tuple[List[Instruction], List[Instruction]], status: int, word: int) -> List[Instruction]:
+    """getAmountsOut(amount, path) into a result word."""
+    return [
+        *_calldata(ROUTER_GET_AMOUNTS_OUT_SELECTOR, amount, [0x40], [2], *path),
+        *_staticcall(_ROUTER, 4 + 32 * 5, ret_size=32 * 4),
+        *_fail_unless(status),
+        *_mstore(_result(word), [_RETURN_AREA + 32 * 3, "MLOAD"]),
+    ]
+
+
+def _token_balance(status: int) -> List[Instruction]:
+    """balanceOf(this) into the return area."""
+    return [
+        *_calldata(ERC20_BALANCE_OF_SELECTOR, ["ADDRESS"]),
+        *_staticcall(_TOKEN, 4 + 32, ret_size=32),
+        *_fail_unless(status),
+    ]
+
+
+def _simulator_program() -> List[Instruction]:
+    """The round-trip contract; status codes index ``_STATUS_CODES``."""
+    received = [_result(2), "MLOAD"]
+    program: List[Instruction] = [
+        # Plain native transfers (the router paying out the sell) just succeed
+        "CALLDATASIZE", "@main", "JUMPI", "STOP",
+        ":main",
+        *_quote(_AMOUNT_IN, (_WETH, _TOKEN), status=1, word=1),
+        *_token_balance(status=2),
+        *_mstore(_BALANCE_BEFORE, [_RETURN_AREA, "MLOAD"]),
+        *_calldata(
+            ROUTER_SWAP_ETH_FOR_TOKENS_SELECTOR,
+            [0], [0x80], ["ADDRESS"], _MAX_UINT, [2], _WETH, _TOKEN,
+        ),
+        *_measured_call(_call(_ROUTER, 4 + 32 * 7, value=_AMOUNT_IN), gas_word=5),
+        *_fail_unless(2),
+        *_token_balance(status=2),
+        *_mstore(_result(2), [_BALANCE_BEFORE, "MLOAD", _RETURN_AREA, "MLOAD", "SUB"]),
+        *received, "ISZERO", "@fail3", "JUMPI",
+        *_calldata(ERC20_APPROVE_SELECTOR, _ROUTER, received),
+        *_call(_TOKEN, 4 + 32 * 2, value=[0], ret_size=32),
+        *_fail_unless(4),
+        *_quote(received, (_TOKEN, _WETH), status=5, word=3),
+        *_mstore(_NATIVE_BEFORE, ["SELFBALANCE"]),
+        *_calldata(
+            ROUTER_SWAP_TOKENS_FOR_ETH_SELECTOR,
+            received, [0], [0xa0], ["ADDRESS"], _MAX_UINT, [2], _TOKEN, _WETH,
+        ),
+        *_measured_call(_call(_ROUTER, 4 + 32 * 8, value=[0]), gas_word=6),
+        *_fail_unless(6),
+        *_mstore(_result(4), [_NATIVE_BEFORE, "MLOAD", "SELFBALANCE", "SUB"]),
+        ":done",
+        32 * _RESULT_WORDS, _RESULT, "RETURN",
+    ]
+    for status in range(1, len(_STATUS_CODES)):
+        program += [f":fail{status}", *_mstore(_result(0), [status]), "@done", "JUMP"]
+    return program
+
+
+SIMULATOR_CODE = "0x" + assemble(_simulator_program()).hex()
+
+
+# ---------------------------------------------------------------------------
+# Simulator
+# ---------------------------------------------------------------------------
+
+class HoneypotSimulator:
+    """
+    Buy/sell round-trip simulation over the pooled JSON-RPC client.
+
+    Results are cached per (chain, token) for about one block time and
+    concurrent requests share one in-flight ``eth_call``.
+    """
+
+    def __init__(
+        self,
+        pool: Optional[RpcPool] = None,
+        routers: Optional[Dict[str, Tuple[str, str]]] = None,
+        amounts_in: Optional[Dict[str, int]] = None,
+        ttl: Optional[float] = None,
+        max_entries: int = 5_000,
+    ) -> None:
+        """
+        Initialize simulator.
+
+        Args:
+            pool: RPC pool (defaults to the shared pool)
+            routers: chain -> (V2 router, wrapped native token)
+            amounts_in: chain -> native wei spent on the simulated buy
+            ttl: Seconds results are reused (defaults to the chain's block time)
+            max_entries: Cached results kept before least recently used ones are evicted
+        """
+        self.pool = pool or rpc_pool
+        self.routers = routers if routers is not None else DEFAULT_ROUTERS
+        self.amounts_in = amounts_in if amounts_in is not None else DEFAULT_AMOUNTS_IN
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._results: "OrderedDict[Tuple[str, str], Tuple[SimulationResult, float]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Task] = {}
+
+        self.simulations = 0
+        self.hits = 0
+        self.coalesced = 0
+        self.evictions = 0
+
+    def supports_chain(self, chain: str) -> bool:
+        """Check whether a router is configured for a chain."""
+        return chain in self.routers
+
+    async def simulate(self, token_address: str, chain: str) -> SimulationResult:
+        """
+        Simulate buying and selling a token.
+
+        Args:
+            token_address: Token contract address
+            chain: Blockchain network
+
+        Returns:
+            SimulationResult: Decoded round trip (status ``ERROR`` if the
+            call could not be made)
+
+        Raises:
+            ValueError: If no router is configured for the chain
+        """
+        if not self.supports_chain(chain):
+            raise ValueError(f"Honeypot simulation not supported on {chain}")
+
+        key = (chain, token_address.lower())
+        cached = self._results.get(key)
+        if cached is not None and time.monotonic() < cached[1]:
+            self._results.move_to_end(key)
+            self.hits += 1
+            return cached[0]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.create_task(self._simulate_and_store(key, token_address, chain))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _simulate_and_store(self, key: Tuple[str, str], token_address: str, chain: str) -> SimulationResult:
+        result = await self._run(token_address, chain)
+        if result.status is not SimulationStatus.ERROR:
+            ttl = self.ttl if self.ttl is not None else CHAIN_BLOCK_TIMES.get(chain, DEFAULT_BLOCK_TIME)
+            self._store(key, result, ttl)
+        return result
+
+    def _store(self, key: Tuple[str, str], result: SimulationResult, ttl: float) -> None:
+        """Cache a result; past the bound, drop expired entries and then the least recently used."""
+        now = time.monotonic()
+        self._results[key] = (result, now + ttl)
+        self._results.move_to_end(key)
+        if len(self._results) <= self.max_entries:
+            return
+        expired = [k for k, (_, expires_at) in self._results.items() if expires_at <= now]
+        for k in expired:
+            del self._results[k]
+        while len(self._results) > self.max_entries:
+            self._results.popitem(last=False)
+            self.evictions += 1
+
+    async def _run(self, token_address: str, chain: str) -> SimulationResult:
+        """Issue the state-override ``eth_call`` and decode its words."""
+        router, weth = self.routers[chain]
+        amount_in = self.amounts_in.get(chain, 10**16)
+        self.simulations += 1
+
+        call = {
+            "to": SIMULATOR_ADDRESS,
+            "data": "0x" + encode_address(router) + encode_address(token_address)
+                    + encode_address(weth) + encode_uint(amount_in),
+            "gas": hex(SIMULATION_GAS),
+        }
+        overrides = {
+            SIMULATOR_ADDRESS: {"code": SIMULATOR_CODE, "balance": hex(amount_in)},
+        }
+        try:
+            raw = await self.pool.make_request(
+                chain=chain,
+                method="eth_call",
+                params=[call, "latest", overrides],
+            )
+            words = decode_words(raw, _RESULT_WORDS)
+        except Exception as e:
+            logger.warning(f"Honeypot simulation failed for {token_address} on {chain}: {e}")
+            return SimulationResult(
+                token_address=token_address,
+                chain=chain,
+                router=router,
+                status=SimulationStatus.ERROR,
+                amount_in=amount_in,
+                error=str(e),
+            )
+
+        status_code = words[0]
+        if status_code >= len(_STATUS_CODES):
+            status, error = SimulationStatus.ERROR, f"Unknown simulation status {status_code}"
+        else:
+            status, error = _STATUS_CODES[status_code], None
+        return SimulationResult(
+            token_address=token_address,
+            chain=chain,
+            router=router,
+            status=status,
+            amount_in=amount_in,
+            expected_buy=words[1],
+            received=words[2],
+            expected_sell=words[3],
+            eth_received=words[4],
+            buy_gas=words[5],
+            sell_gas=words[6],
+            error=error,
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get simulation and cache statistics."""
+        return {
+            "simulations": self.simulations,
+            "hits": self.hits,
+            "coalesced": self.coalesced,
+            "evictions": self.evictions,
+            "entries": len(self._results),
+            "inflight": len(self._inflight),
+        }
+
+
+def decode_words(raw: Optional[str], count: int) -> List[int]:
+    """
+    Decode ``count`` 32-byte words from hex return data.
+
+    Raises:
+        ValueError: If the data is shorter than ``count`` words
+    """
+    raw = raw or ""
+    data = bytes.fromhex(raw[2:] if raw.startswith("0x") else raw)
+    if len(data) < 32 * count:
+        raise ValueError(f"Expected {count} words of return data, got {len(data)} bytes")
+    return [int.from_bytes(data[32 * i:32 * (i + 1)], "big") for i in range(count)]
+
+
+_honeypot_simulator: Optional[HoneypotSimulator] = None
+
+
+def get_honeypot_simulator() -> HoneypotSimulator:
+    """Get the process-wide simulator shared by risk checks and security providers."""
+    global _honeypot_simulator
+    if _honeypot_simulator is None:
+        _honeypot_simulator = HoneypotSimulator()
+    return _honeypot_simulator
@@ -0,0 +1,325 @@
+"""
+In-process price tick bus.
+
+Producers (reserve mirror Sync updates, DexScreener polls, Jupiter quotes)
+publish each normalized ``PriceTick`` once; subscribers (order triggers,
+anomaly trackers, position marking, the WebSocket hub) consume it through
+their own worker task.
+
+Each subscription holds a bounded, conflating queue keyed by (chain, pair):
+a newer tick for a pair overwrites the one still waiting, so a slow
+consumer sees the latest price per pair rather than a backlog, and
+``publish`` never awaits a consumer.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PENDING = 4096  # Distinct pairs waiting per subscriber
+MAX_LATEST_TICKS = 50_000
+
+# (chain, pair address or token address)
+TickKey = Tuple[str, str]
+
+TickHandler = Callable[["PriceTick"], Awaitable[Any]]
+TickFilter = Callable[["PriceTick"], bool]
+
+
+def normalize_address(address: str) -> str:
+    """Lower-case EVM addresses; other chains' addresses are case-sensitive."""
+    return address.lower() if address.startswith("0x") else address
+
+
+@dataclass(frozen=True)
+class PriceTick:
+    """
+    A single price observation.
+
+    Attributes:
+        chain: Blockchain network
+        token_address: Token being priced
+        price: Price of the token in ``quote_token`` units (USD when no quote token)
+        source: Producer name (e.g. reserve_mirror, dexscreener, jupiter)
+        pair_address: Pool the price came from, if any
+        quote_token: Token the price is denominated in
+        price_usd: USD price when the producer knows it
+        block_number: Block the price reflects, for on-chain producers
+        timestamp: Unix time of the observation
+    """
+    chain: str
+    token_address: str
+    price: Decimal
+    source: str
+    pair_address: Optional[str] = None
+    quote_token: Optional[str] = None
+    price_usd: Optional[Decimal] = None
+    block_number: Optional[int] = None
+    timestamp: float = field(default_factory=time.time)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "token_address", normalize_address(self.token_address))
+        if self.pair_address:
+            object.__setattr__(self, "pair_address", normalize_address(self.pair_address))
+        if self.quote_token:
+            object.__setattr__(self, "quote_token", normalize_address(self.quote_token))
+
+    @property
+    def key(self) -> TickKey:
+        """Conflation key: the pair when known, otherwise the token."""
+        return self.chain, self.pair_address or self.token_address
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe representation."""
+        return {
+            "chain": self.chain,
+            "token_address": self.token_address,
+            "pair_address": self.pair_address,
+            "quote_token": self.quote_token,
+            "price": str(self.price),
+            "price_usd": str(self.price_usd) if self.price_usd is not None else None,
+            "source": self.source,
+            "block_number": self.block_number,
+            "timestamp": self.timestamp,
+        }
+
+
+class PriceSubscription:
+    """
+    One consumer of the bus with its own conflating queue and worker.
+
+    The queue holds at most one tick per key in first-arrival order; when
+    ``max_pending`` distinct keys are waiting the oldest one is dropped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        handler: TickHandler,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        accept: Optional[TickFilter] = None,
+    ) -> None:
+        """
+        Initialize subscription.
+
+        Args:
+            name: Subscriber name (unique per bus)
+            handler: Coroutine called with each delivered tick
+            max_pending: Distinct keys that may wait before the oldest is dropped
+            accept: Optional predicate; rejected ticks are never queued
+        """
+        self.name = name
+        self.handler = handler
+        self.max_pending = max_pending
+        self.accept = accept
+
+        self._pending: "OrderedDict[TickKey, PriceTick]" = OrderedDict()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+        self.received = 0
+        self.delivered = 0
+        self.conflated = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_lag_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def offer(self, tick: PriceTick) -> None:
+        """Queue a tick without blocking, replacing any older tick for its key."""
+        if self.accept is not None and not self.accept(tick):
+            return
+        self.received += 1
+
+        key = tick.key
+        if key in self._pending:
+            self.conflated += 1
+        elif len(self._pending) >= self.max_pending:
+            self._pending.popitem(last=False)
+            self.dropped += 1
+        self._pending[key] = tick
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the worker on the running loop."""
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(), name=f"price-bus-{self.name}")
+
+    async def stop(self) -> None:
+        """Cancel the worker; ticks still queued are discarded."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def drain(self) -> None:
+        """Deliver everything queued right now on the caller's task."""
+        while self._pending:
+            _, tick = self._pending.popitem(last=False)
+            await self._deliver(tick)
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            await self.drain()
+
+    async def _deliver(self, tick: PriceTick) -> None:
+        self.max_lag_ms = max(self.max_lag_ms, (time.time() - tick.timestamp) * 1000)
+        try:
+            await self.handler(tick)
+            self.delivered += 1
+        except Exception as e:
+            self.errors += 1
+            logger.error(f"Price bus subscriber {self.name} failed on {tick.key}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue and delivery counters."""
+        return {
+            "running": self.is_running,
+            "pending": len(self._pending),
+            "received": self.received,
+            "delivered": self.delivered,
+            "conflated": self.conflated,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "max_lag_ms": round(self.max_lag_ms, 3),
+        }
+
+
+class PriceTickBus:
+    """
+    Fan-out of price ticks to named subscribers.
+
+    ``publish`` is synchronous and O(subscribers): it records the tick as
+    the latest for its key and offers it to every subscription queue.
+    Subscription workers start as soon as a loop is running.
+    """
+
+    def __init__(self, default_max_pending: int = DEFAULT_MAX_PENDING, max_latest: int = MAX_LATEST_TICKS) -> None:
+        """
+        Initialize bus.
+
+        Args:
+            default_max_pending: Queue bound for subscriptions that do not set one
+            max_latest: Number of keys whose latest tick is remembered
+        """
+        self.default_max_pending = default_max_pending
+        self.max_latest = max_latest
+        self._subscriptions: Dict[str, PriceSubscription] = {}
+        self._latest: Dict[TickKey, PriceTick] = {}
+        self.published = 0
+
+    def subscribe(
+        self,
+        name: str,
+        handler: TickHandler,
+        max_pending: Optional[int] = None,
+        accept: Optional[TickFilter] = None,
+    ) -> PriceSubscription:
+        """
+        Register a consumer, replacing any subscription with the same name.
+
+        Args:
+            name: Subscriber name
+            handler: Coroutine called with each delivered tick
+            max_pending: Queue bound (default: bus default)
+            accept: Optional predicate filtering ticks before queueing
+
+        Returns:
+            The new subscription
+        """
+        previous = self._subscriptions.pop(name, None)
+        if previous is not None and previous._task is not None:
+            previous._task.cancel()
+
+        subscription = PriceSubscription(name, handler, max_pending or self.default_max_pending, accept)
+        self._subscriptions[name] = subscription
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass  # Started by start() once a loop exists
+        else:
+            subscription.start()
+
+        logger.info(f"Price bus subscriber registered: {name}")
+        return subscription
+
+    async def unsubscribe(self, name: str) -> bool:
+        """Remove a consumer and stop its worker."""
+        subscription = self._subscriptions.pop(name, None)
+        if subscription is None:
+            return False
+        await subscription.stop()
+        return True
+
+    def publish(self, tick: PriceTick) -> None:
+        """Record a tick and offer it to every subscriber without blocking."""
+        self.published += 1
+
+        key = tick.key
+        latest = self._latest
+        previous = latest.get(key)
+        # Replay needs USD prices: a quote-denominated tick never replaces a USD one
+        if tick.price_usd is not None or previous is None or previous.price_usd is None:
+            if latest.pop(key, None) is None and len(latest) >= self.max_latest:
+                del latest[next(iter(latest))]
+            latest[key] = tick
+
+        for subscription in self._subscriptions.values():
+            subscription.offer(tick)
+
+    def latest(self, chain: str, address: str) -> Optional[PriceTick]:
+        """Most recent tick for a pair (or token) address, USD-priced if one was seen."""
+        return self._latest.get((chain, normalize_address(address)))
+
+    async def start(self) -> None:
+        """Start workers of subscriptions registered before a loop was running."""
+        for subscription in self._subscriptions.values():
+            subscription.start()
+
+    async def stop(self) -> None:
+        """Stop every subscription worker."""
+        for subscription in list(self._subscriptions.values()):
+            await subscription.stop()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Bus and per-subscriber counters."""
+        return {
+            "published": self.published,
+            "tracked_keys": len(self._latest),
+            "subscribers": {
+                name: subscription.get_stats()
+                for name, subscription in self._subscriptions.items()
+            },
+        }
+
+
+# Global price tick bus
+price_bus = PriceTickBus()
+
+
+__all__ = [
+    "PriceTick",
+    "PriceSubscription",
+    "PriceTickBus",
+    "normalize_address",
+    "price_bus",
+]
@@ -17,6 +17,7 @@ from pydantic import BaseModel
 
 from ..core.settings import settings
 from ..dex.uniswap_v2 import pancake_adapter, quickswap_adapter, uniswap_v2_adapter
+from .price_bus import PriceTick, price_bus
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,16 @@ logger = logging.getLogger(__name__)
 MIN_LIQUIDITY_THRESHOLD_USD = Decimal("10000")  # $10k minimum liquidity
 MAX_PRICE_DEVIATION = Decimal("1.5")  # 1.5x max deviation from AMM mid
 
+# CoinGecko coin ids of each chain's native currency
+NATIVE_COINGECKO_IDS = {
+    "ethereum": "ethereum",
+    "bsc": "binancecoin",
+    "polygon": "matic-network",
+    "base": "ethereum",
+    "arbitrum": "ethereum",
+    "solana": "solana",
+}
+
 
 class PriceSource(str, Enum):
     """Price data sources."""
@@ -101,6 +112,7 @@ class PricingService:
         self.coingecko_api = "https://api.coingecko.com/api/v3"
         self.dexscreener_api = "https://api.dexscreener.com/latest"
         self._http_client = None
+        self._native_gbp: Dict[str, Tuple[Decimal, datetime]] = {}
     
     async def get_token_price(
         self,
@@ -141,6 +153,13 @@ class PricingService:
             if price:
                 price.last_updated = datetime.utcnow()
                 self.cache[cache_key] = price
+                price_bus.publish(PriceTick(
+                    chain=chain,
+                    token_address=token_address,
+                    price=price.price_usd,
+                    price_usd=price.price_usd,
+                    source=price.source.value,
+                ))
                 return price
                 
         except Exception as e:
@@ -233,6 +252,43 @@ class PricingService:
         
         return native_prices.get(chain.lower(), Decimal("1"))
     
+    async def get_native_token_price_gbp(self, chain: str) -> Optional[Decimal]:
+        """
+        Get native token price in GBP from CoinGecko.
+        
+        Quotes are cached for ``cache_ttl`` seconds per coin; failures are
+        not cached.
+        
+        Args:
+            chain: Blockchain network
+            
+        Returns:
+            Native token price in GBP, or None if no quote is available
+        """
+        coin_id = NATIVE_COINGECKO_IDS.get(chain.lower())
+        if coin_id is None:
+            return None
+        
+        cached = self._native_gbp.get(coin_id)
+        if cached is not None and (datetime.utcnow() - cached[1]).total_seconds() < self.cache_ttl:
+            return cached[0]
+        
+        try:
+            async with httpx.AsyncClient() as client:
+                response = await client.get(
+                    f"{self.coingecko_api}/simple/price",
+                    params={"ids": coin_id, "vs_currencies": "gbp"},
+                    timeout=10,
+                )
+                response.raise_for_status()
+                price = Decimal(str(response.json()[coin_id]["gbp"]))
+        except Exception as e:
+            logger.warning(f"Failed to fetch GBP price for {coin_id}: {e}")
+            return None
+        
+        self._native_gbp[coin_id] = (price, datetime.utcnow())
+        return price
+    
     def calculate_price_impact(
         self,
         amount_in: Decimal,
@@ -14,12 +14,14 @@ import httpx
 
 import logging
 from ..core.settings import settings
+from .honeypot_simulator import HoneypotSimulator, SimulationStatus, get_honeypot_simulator
 
 logger = logging.getLogger(__name__)
 
 
 class SecurityProvider(str, Enum):
     """Supported security provider services."""
+    LOCAL_SIMULATION = "local_simulation"
     HONEYPOT_IS = "honeypot_is"
     TOKEN_SNIFFER = "token_sniffer"
     RUGDOC = "rugdoc"
@@ -66,8 +68,14 @@ class SecurityProviderClient:
     from multiple external services with fallback and aggregation.
     """
     
-    def __init__(self):
-        """Initialize security provider client."""
+    def __init__(self, simulator: Optional[HoneypotSimulator] = None):
+        """
+        Initialize security provider client.
+        
+        Args:
+            simulator: Local buy/sell round-trip simulator (defaults to the shared one)
+        """
+        self.simulator = simulator or get_honeypot_simulator()
         self.timeout = httpx.Timeout(5.0, connect=2.0)
         self.max_retries = 2
         self.cache_ttl_seconds = 300  # 5 minute cache
@@ -126,15 +134,18 @@ class SecurityProviderClient:
         Args:
             token_address: Token contract address
             chain: Blockchain network
-            providers: Specific providers to check (default: all)
+            providers: Specific providers to check (default: the local
+                simulation, falling back to remote providers if it cannot run)
             
         Returns:
             AggregatedSecurityResult: Aggregated security assessment
         """
         start_time = time.time()
         
+        fallback_providers: List[SecurityProvider] = []
         if providers is None:
-            providers = [
+            providers = [SecurityProvider.LOCAL_SIMULATION]
+            fallback_providers = [
                 SecurityProvider.HONEYPOT_IS,
                 SecurityProvider.GOPLUSLAB,
                 SecurityProvider.TOKEN_SNIFFER,
@@ -168,6 +179,14 @@ class SecurityProviderClient:
         
         results = await asyncio.gather(*tasks, return_exceptions=True)
         
+        if fallback_providers and not any(
+            isinstance(result, SecurityProviderResult) and result.success for result in results
+        ):
+            results += await asyncio.gather(
+                *[self._check_provider(provider, token_address, chain) for provider in fallback_providers],
+                return_exceptions=True,
+            )
+        
         # Process results
         provider_results = {}
         successful_results = []
@@ -232,7 +251,9 @@ class SecurityProviderClient:
         start_time = time.time()
         
         try:
-            if provider == SecurityProvider.HONEYPOT_IS:
+            if provider == SecurityProvider.LOCAL_SIMULATION:
+                result = await self._check_local_simulation(token_address, chain)
+            elif provider == SecurityProvider.HONEYPOT_IS:
                 result = await self._check_honeypot_is(token_address, chain)
             elif provider == SecurityProvider.GOPLUSLAB:
                 result = await self._check_gopluslab(token_address, chain)
@@ -262,6 +283,80 @@ class SecurityProviderClient:
                 error_message=str(e),
             )
     
+    async def _check_local_simulation(
+        self,
+        token_address: str,
+        chain: str,
+    ) -> SecurityProviderResult:
+        """
+        Simulate a buy/sell round trip with one state-override eth_call.
+        
+        Args:
+            token_address: Token contract address
+            chain: Blockchain network
+            
+        Returns:
+            SecurityProviderResult: Simulation result (taxes in percent, as honeypot.is)
+        """
+        if not self.simulator.supports_chain(chain):
+            raise ValueError(f"Chain {chain} not supported by local simulation")
+        
+        simulation = await self.simulator.simulate(token_address, chain)
+        if not simulation.simulated:
+            raise ValueError(simulation.error or f"Simulation unavailable: {simulation.status.value}")
+        
+        is_honeypot = simulation.is_honeypot
+        buy_tax = (simulation.buy_tax or 0.0) * 100
+        sell_tax = (simulation.sell_tax or 0.0) * 100
+        
+        risk_factors = []
+        if is_honeypot:
+            risk_factors.append("honeypot_detected")
+        if simulation.status is SimulationStatus.BUY_FAILED:
+            risk_factors.append("buy_reverted")
+        if buy_tax > 10:
+            risk_factors.append("high_buy_tax")
+        if sell_tax > 10:
+            risk_factors.append("high_sell_tax")
+        if sell_tax > 50:
+            risk_factors.append("excessive_sell_tax")
+        
+        if is_honeypot:
+            risk_score = 0.95
+        elif simulation.status is SimulationStatus.BUY_FAILED:
+            risk_score = 0.7
+        else:
+            max_tax = max(buy_tax, sell_tax)
+            if max_tax > 20:
+                risk_score = 0.8
+            elif max_tax > 10:
+                risk_score = 0.6
+            elif max_tax > 5:
+                risk_score = 0.3
+            else:
+                risk_score = 0.1
+        
+        return SecurityProviderResult(
+            provider=SecurityProvider.LOCAL_SIMULATION,
+            token_address=token_address,
+            chain=chain,
+            is_honeypot=is_honeypot,
+            # Measured on-chain rather than reported, so near-certain either way
+            honeypot_confidence=0.95 if is_honeypot else 0.05,
+            risk_score=risk_score,
+            risk_factors=risk_factors,
+            details={
+                "buy_tax": buy_tax,
+                "sell_tax": sell_tax,
+                "simulation_status": simulation.status.value,
+                "router": simulation.router,
+                "buy_gas_used": simulation.buy_gas,
+                "sell_gas_used": simulation.sell_gas,
+            },
+            response_time_ms=0,  # Will be set by caller
+            success=True,
+        )
+    
     async def _check_honeypot_is(
         self,
         token_address: str,
@@ -728,6 +823,7 @@ class SecurityProviderClient:
         
         # Provider reliability weights
         provider_weights = {
+            SecurityProvider.LOCAL_SIMULATION: 1.0,  # Highest weight - measured on-chain
             SecurityProvider.HONEYPOT_IS: 1.0,    # Highest weight - specialized
             SecurityProvider.GOPLUSLAB: 0.9,      # High weight - comprehensive
             SecurityProvider.TOKEN_SNIFFER: 0.7,  # Medium weight - reputation based
@@ -256,13 +256,19 @@ class TokenMetadataService:
             if include_native:
                 tokens_to_query.insert(0, None)  # None represents native token
             
-            # Query all balances concurrently
-            balance_tasks = [
-                self.get_balance(chain, wallet_address, token_addr)
-                for token_addr in tokens_to_query
-            ]
-            
-            balance_results = await asyncio.gather(*balance_tasks, return_exceptions=True)
+            if chain.lower() != "solana":
+                # EVM chains: one Multicall3 sweep instead of one RPC per token
+                balance_results = await self._get_evm_balances_batched(
+                    chain, wallet_address, tokens_to_query
+                )
+            else:
+                # Query all balances concurrently
+                balance_tasks = [
+                    self.get_balance(chain, wallet_address, token_addr)
+                    for token_addr in tokens_to_query
+                ]
+
+                balance_results = await asyncio.gather(*balance_tasks, return_exceptions=True)
             
             # Process results
             for i, result in enumerate(balance_results):
@@ -290,6 +296,49 @@ class TokenMetadataService:
             logger.error(f"Failed to get multiple balances: {e}")
             raise TokenMetadataError(f"Multiple balance query failed: {e}")
     
+    async def _get_evm_balances_batched(
+        self,
+        chain: str,
+        wallet_address: str,
+        tokens_to_query: List[Optional[str]],
+    ) -> List[Decimal]:
+        """
+        Get EVM balances, serving fresh entries from cache and batching the rest.
+
+        Args:
+            chain: Blockchain network
+            wallet_address: Wallet address to check
+            tokens_to_query: Token addresses (None for native token)
+
+        Returns:
+            Balances in the same order as tokens_to_query
+        """
+        now = time.time()
+        cached: Dict[Optional[str], Decimal] = {}
+        missing: List[Optional[str]] = []
+
+        for token_addr in tokens_to_query:
+            cache_key = f"{chain}:{wallet_address}:{token_addr or 'native'}"
+            cached_data = self._balance_cache.get(cache_key)
+            if cached_data and now - cached_data["timestamp"] < self.balance_cache_ttl:
+                cached[token_addr] = cached_data["balance"]
+            else:
+                missing.append(token_addr)
+
+        if missing:
+            evm_client = await self.get_evm_client()
+            fetched = await evm_client.get_token_balances(wallet_address, chain, missing)
+
+            for token_addr, balance in fetched.items():
+                cache_key = f"{chain}:{wallet_address}:{token_addr or 'native'}"
+                self._balance_cache[cache_key] = {
+                    "balance": balance,
+                    "timestamp": now
+                }
+                cached[token_addr] = balance
+
+        return [cached.get(token_addr, Decimal(0)) for token_addr in tokens_to_query]
+
     async def validate_token(
         self,
         chain: str,
@@ -0,0 +1,427 @@
+"""
+DEX Sniper Pro - Columnar storage for simulation snapshots.
+
+Snapshots are stored column by column, partitioned by chain and day:
+
+    <root>/chain=<chain>/date=<YYYY-MM-DD>/part-<id>/<column>.npy
+
+Each part holds its rows sorted by timestamp plus a ``_meta.json`` with the
+row count, time bounds and the set of pair addresses it contains. Queries
+skip whole partitions by chain and date, skip parts by their time bounds
+and pairs, then memory-map only the requested columns and binary-search
+the sorted timestamp column, so a range query touches only the pages it
+returns.
+
+Writes are buffered and flushed as one part per partition once
+``batch_rows`` snapshots are pending. Parts are written to a temporary
+directory and renamed into place, so readers never see a partial part.
+Reads can include the still-buffered rows, so querying does not force
+small parts to be written.
+
+Columns are plain ``.npy`` arrays (numpy is already a core dependency);
+decimal fields are stored as float64, which is ample precision for replay.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_ROWS = 10_000
+DEFAULT_FLUSH_INTERVAL = 5.0  # Seconds buffered rows may wait before a write
+META_FILE = "_meta.json"
+
+# Column name -> on-disk dtype (chain is the partition key, not a column)
+COLUMN_DTYPES: Dict[str, str] = {
+    "timestamp": "datetime64[us]",
+    "pair_address": "S64",
+    "dex": "S32",
+    "price": "float64",
+    "reserve0": "float64",
+    "reserve1": "float64",
+    "liquidity_usd": "float64",
+    "volume_24h": "float64",
+    "volatility": "float64",
+    "trade_count": "int64",
+    "avg_trade_size": "float64",
+    "gas_price": "float64",
+    "network_congestion": "float64",
+    "price_change_1h": "float64",
+    "liquidity_change_1h": "float64",
+}
+BYTES_COLUMNS = ("pair_address", "dex")
+OPTIONAL_COLUMNS = ("gas_price", "network_congestion", "price_change_1h", "liquidity_change_1h")  # NaN = None
+
+MIGRATED_SUFFIX = ".migrated"
+LEGACY_FILE_PATTERN = re.compile(r"^(?P<chain>.+)_(?P<date>\d{4}-\d{2}-\d{2})\.jsonl(?:\.gz)?$")
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _datetime64(value: datetime) -> np.datetime64:
+    return np.datetime64(_to_naive_utc(value), "us")
+
+
+def _columns_from_rows(rows: List[Dict[str, Any]], names: Iterable[str]) -> Dict[str, np.ndarray]:
+    return {name: np.array([row[name] for row in rows], dtype=COLUMN_DTYPES[name]) for name in names}
+
+
+@dataclass
+class PartInfo:
+    """Metadata of one stored part."""
+    path: Path
+    rows: int
+    min_ts: np.datetime64
+    max_ts: np.datetime64
+    pairs: frozenset
+
+
+@dataclass
+class SnapshotColumns:
+    """Query result: one array per selected column, rows sorted by timestamp."""
+    chain: np.ndarray
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.chain)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == "chain":
+            return self.chain
+        return self.columns[name]
+
+    def to_pylists(self) -> Dict[str, List[Any]]:
+        """Convert every column (and ``chain``) to a list of Python values, ``None`` for missing optionals."""
+        lists: Dict[str, List[Any]] = {"chain": np.char.decode(self.chain, "ascii").tolist()}
+        for name, column in self.columns.items():
+            if name in BYTES_COLUMNS:
+                lists[name] = np.char.decode(column, "ascii").tolist()
+            elif name in OPTIONAL_COLUMNS:
+                values = column.astype(object)
+                values[np.isnan(column)] = None
+                lists[name] = values.tolist()
+            else:
+                lists[name] = column.tolist()
+        return lists
+
+
+class ColumnarSnapshotStore:
+    """
+    Chain/day partitioned columnar store for simulation snapshots.
+
+    ``append`` only buffers; ``flush`` (or reaching ``batch_rows``) writes
+    the buffered rows. Blocking methods are meant to be called through
+    ``asyncio.to_thread`` from async code.
+    """
+
+    def __init__(self, root: Path, batch_rows: int = DEFAULT_BATCH_ROWS) -> None:
+        """
+        Initialize store.
+
+        Args:
+            root: Store directory
+            batch_rows: Buffered snapshots that trigger a flush
+        """
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.batch_rows = batch_rows
+        self._pending: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._pending_rows = 0
+
+        # Stats
+        self.parts_written = 0
+        self.rows_written = 0
+        self.parts_scanned = 0
+        self.parts_pruned = 0
+
+    # -- writes ---------------------------------------------------------------
+
+    @property
+    def pending_rows(self) -> int:
+        """Buffered snapshots not yet written."""
+        return self._pending_rows
+
+    def append(self, snapshot: Any) -> bool:
+        """
+        Buffer a snapshot (model instance or dict with the same fields).
+
+        Returns:
+            True if the buffer reached ``batch_rows`` and should be flushed
+        """
+        get = snapshot.get if isinstance(snapshot, dict) else (lambda name, default=None: getattr(snapshot, name, default))
+        timestamp = get("timestamp")
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+        timestamp = _to_naive_utc(timestamp)
+
+        row = {"timestamp": timestamp}
+        for name, dtype in COLUMN_DTYPES.items():
+            if name == "timestamp":
+                continue
+            value = get(name)
+            if name in BYTES_COLUMNS:
+                row[name] = str(value or "").encode("ascii")
+            elif dtype == "int64":
+                row[name] = int(value or 0)
+            elif value is None:
+                row[name] = np.nan if name in OPTIONAL_COLUMNS else 0.0
+            else:
+                row[name] = float(value)
+
+        key = (str(get("chain")), timestamp.strftime("%Y-%m-%d"))
+        self._pending.setdefault(key, []).append(row)
+        self._pending_rows += 1
+        return self._pending_rows >= self.batch_rows
+
+    def copy_pending(self) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """Copy the buffered rows (call on the writer's thread, then pass to ``scan``)."""
+        return {key: list(rows) for key, rows in self._pending.items()}
+
+    def take_pending(self) -> Dict[Tuple[str, str], List[Dict[str, Any]]]:
+        """Detach the buffered rows (call on the writer's thread, then ``write_pending``)."""
+        pending, self._pending, self._pending_rows = self._pending, {}, 0
+        return pending
+
+    def write_pending(self, pending: Dict[Tuple[str, str], List[Dict[str, Any]]]) -> int:
+        """Write detached rows as one part per partition. Returns rows written."""
+        written = 0
+        for (chain, day), rows in pending.items():
+            self._write_part(chain, day, rows)
+            written += len(rows)
+        return written
+
+    def flush(self) -> int:
+        """Write all buffered rows. Returns rows written."""
+        return self.write_pending(self.take_pending())
+
+    def _write_part(self, chain: str, day: str, rows: List[Dict[str, Any]]) -> Path:
+        partition = self.root / f"chain={chain}" / f"date={day}"
+        partition.mkdir(parents=True, exist_ok=True)
+        name = f"part-{uuid.uuid4().hex[:16]}"
+        staging = partition / f".{name}.tmp"
+        staging.mkdir()
+
+        try:
+            arrays = _columns_from_rows(rows, COLUMN_DTYPES)
+            timestamps = arrays["timestamp"]
+            order = np.argsort(timestamps, kind="stable")
+            for column, values in arrays.items():
+                np.save(staging / f"{column}.npy", values[order])
+
+            pairs = sorted({row["pair_address"].decode("ascii") for row in rows})
+            meta = {
+                "rows": len(rows),
+                "min_ts": str(timestamps[order[0]]),
+                "max_ts": str(timestamps[order[-1]]),
+                "pairs": pairs,
+            }
+            (staging / META_FILE).write_text(json.dumps(meta), encoding="utf-8")
+            final = partition / name
+            os.rename(staging, final)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self.parts_written += 1
+        self.rows_written += len(rows)
+        return final
+
+    # -- reads ----------------------------------------------------------------
+
+    def chains(self) -> List[str]:
+        """Chains with stored data."""
+        return sorted(path.name.split("=", 1)[1] for path in self.root.glob("chain=*") if path.is_dir())
+
+    def iter_parts(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        chains: Optional[Sequence[str]] = None,
+    ) -> Iterator[Tuple[str, PartInfo]]:
+        """Yield (chain, part) for every part in the chain/day partitions of a range."""
+        first, last = _to_naive_utc(start_time).date(), _to_naive_utc(end_time).date()
+        for chain in chains if chains is not None else self.chains():
+            chain_dir = self.root / f"chain={chain}"
+            if not chain_dir.is_dir():
+                continue
+            day = first
+            while day <= last:
+                partition = chain_dir / f"date={day.isoformat()}"
+                if partition.is_dir():
+                    for part in sorted(partition.glob("part-*")):
+                        yield chain, self._load_part_info(part)
+                day += timedelta(days=1)
+
+    def _load_part_info(self, part: Path) -> PartInfo:
+        meta = json.loads((part / META_FILE).read_text(encoding="utf-8"))
+        return PartInfo(
+            path=part,
+            rows=meta["rows"],
+            min_ts=np.datetime64(meta["min_ts"], "us"),
+            max_ts=np.datetime64(meta["max_ts"], "us"),
+            pairs=frozenset(meta["pairs"]),
+        )
+
+    def scan(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        chains: Optional[Sequence[str]] = None,
+        pairs: Optional[Iterable[str]] = None,
+        columns: Optional[Sequence[str]] = None,
+        pending: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None,
+    ) -> SnapshotColumns:
+        """
+        Read snapshots in ``[start_time, end_time]``.
+
+        Args:
+            start_time: Inclusive start
+            end_time: Inclusive end
+            chains: Only these chains (partition pruning)
+            pairs: Only these pair addresses (part pruning, then row filter)
+            columns: Columns to load (default all); timestamp is always loaded
+            pending: Buffered rows from ``copy_pending`` to include unwritten
+
+        Returns:
+            Selected columns with rows sorted by timestamp
+        """
+        start, end = _datetime64(start_time), _datetime64(end_time)
+        wanted = set(pairs) if pairs else None
+        wanted_bytes = np.array(sorted(wanted), dtype=COLUMN_DTYPES["pair_address"]) if wanted else None
+        names = list(columns) if columns else list(COLUMN_DTYPES)
+        if "timestamp" not in names:
+            names.insert(0, "timestamp")
+        unknown = set(names) - set(COLUMN_DTYPES)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+
+        chunks: Dict[str, List[np.ndarray]] = {name: [] for name in names}
+        chain_chunks: List[np.ndarray] = []
+        for chain, part in self.iter_parts(start_time, end_time, chains):
+            if part.max_ts < start or part.min_ts > end or (wanted and not wanted & part.pairs):
+                self.parts_pruned += 1
+                continue
+            self.parts_scanned += 1
+
+            timestamps = np.load(part.path / "timestamp.npy", mmap_mode="r")
+            lo = int(np.searchsorted(timestamps, start, side="left"))
+            hi = int(np.searchsorted(timestamps, end, side="right"))
+            if lo >= hi:
+                continue
+            selection: Any = slice(lo, hi)
+            if wanted_bytes is not None:
+                pair_column = np.load(part.path / "pair_address.npy", mmap_mode="r")
+                selection = lo + np.flatnonzero(np.isin(pair_column[lo:hi], wanted_bytes))
+                if not len(selection):
+                    continue
+
+            for name in names:
+                column = timestamps if name == "timestamp" else np.load(part.path / f"{name}.npy", mmap_mode="r")
+                chunks[name].append(np.array(column[selection]))
+            chain_chunks.append(np.full(len(chunks["timestamp"][-1]), chain.encode("ascii"), dtype="S32"))
+
+        # Buffered rows are served from memory rather than flushed as tiny parts
+        first, last = _to_naive_utc(start_time), _to_naive_utc(end_time)
+        for (chain, _), rows in (pending or {}).items():
+            if chains is not None and chain not in chains:
+                continue
+            rows = [
+                row for row in rows
+                if first <= row["timestamp"] <= last
+                and (wanted is None or row["pair_address"].decode("ascii") in wanted)
+            ]
+            if not rows:
+                continue
+            for name, values in _columns_from_rows(rows, names).items():
+                chunks[name].append(values)
+            chain_chunks.append(np.full(len(rows), chain.encode("ascii"), dtype="S32"))
+
+        if not chain_chunks:
+            return SnapshotColumns(
+                chain=np.empty(0, dtype="S32"),
+                columns={name: np.empty(0, dtype=COLUMN_DTYPES[name]) for name in names},
+            )
+
+        merged = {name: np.concatenate(parts) for name, parts in chunks.items()}
+        chain = np.concatenate(chain_chunks)
+        if len(chain_chunks) > 1:
+            order = np.argsort(merged["timestamp"], kind="stable")
+            merged = {name: values[order] for name, values in merged.items()}
+            chain = chain[order]
+        return SnapshotColumns(chain=chain, columns=merged)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {
+            "root": str(self.root),
+            "pending_rows": self._pending_rows,
+            "parts_written": self.parts_written,
+            "rows_written": self.rows_written,
+            "parts_scanned": self.parts_scanned,
+            "parts_pruned": self.parts_pruned,
+        }
+
+
+def migrate_jsonl_directory(
+    source_dir: Path,
+    store: ColumnarSnapshotStore,
+    remove_source: bool = False,
+) -> Dict[str, Any]:
+    """
+    Convert legacy ``<chain>_<YYYY-MM-DD>.jsonl[.gz]`` simulation files.
+
+    Each file is flushed as its own part once fully read, then renamed to
+    ``<name>.migrated`` (or deleted with ``remove_source``) so neither the
+    legacy reader nor a re-run of an interrupted migration picks it up again.
+
+    Args:
+        source_dir: Directory of legacy simulation JSONL files
+        store: Destination store
+        remove_source: Delete each file instead of renaming it
+
+    Returns:
+        Migration statistics
+    """
+    stats = {"files": 0, "rows": 0, "bad_lines": 0}
+    for path in sorted(Path(source_dir).iterdir()):
+        if not path.is_file() or not LEGACY_FILE_PATTERN.match(path.name):
+            continue
+        opener = gzip.open if path.suffix == ".gz" else open
+        rows = 0
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    store.append(json.loads(line))
+                    rows += 1
+                except (ValueError, TypeError, KeyError) as e:
+                    stats["bad_lines"] += 1
+                    logger.warning(f"Skipping unreadable snapshot in {path.name}: {e}")
+        store.flush()
+        stats["files"] += 1
+        stats["rows"] += rows
+        if remove_source:
+            path.unlink()
+        else:
+            path.rename(path.with_name(path.name + MIGRATED_SUFFIX))
+        logger.info(f"Migrated {rows} simulation snapshots from {path.name}")
+    return stats
@@ -11,14 +11,24 @@ import asyncio
 import gzip
 import json
 import logging
+import time
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from pydantic import BaseModel, Field
 
+from .columnar_store import (
+    DEFAULT_BATCH_ROWS,
+    DEFAULT_FLUSH_INTERVAL,
+    ColumnarSnapshotStore,
+    SnapshotColumns,
+    migrate_jsonl_directory,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -140,6 +150,53 @@ class SimulationSnapshot(BaseModel):
         }
 
 
+DECIMAL_FIELDS = (
+    "price", "reserve0", "reserve1", "liquidity_usd", "volume_24h",
+    "avg_trade_size", "gas_price", "price_change_1h", "liquidity_change_1h",
+)
+
+
+def snapshots_from_columns(batch: SnapshotColumns) -> List[SimulationSnapshot]:
+    """
+    Build snapshots from columnar rows without re-running validation.
+    
+    Values are converted column by column and the instances are filled in
+    directly (what ``model_construct`` does, minus its per-field default
+    handling), since the store already holds typed, validated data.
+    """
+    lists = batch.to_pylists()
+    columns = {name: lists[name] for name in SimulationSnapshot.model_fields if name in lists}
+    for name in DECIMAL_FIELDS:
+        if name in columns:
+            columns[name] = [None if v is None else Decimal(repr(v)) for v in columns[name]]
+    
+    names = tuple(columns)
+    fields_set = frozenset(names)
+    new = SimulationSnapshot.__new__
+    snapshots = []
+    for values in zip(*columns.values()):
+        snapshot = new(SimulationSnapshot)
+        object.__setattr__(snapshot, "__dict__", dict(zip(names, values)))
+        object.__setattr__(snapshot, "__pydantic_fields_set__", set(fields_set))
+        object.__setattr__(snapshot, "__pydantic_extra__", None)
+        object.__setattr__(snapshot, "__pydantic_private__", None)
+        snapshots.append(snapshot)
+    return snapshots
+
+
+@dataclass
+class HistoricalPerformanceData:
+    """Historical performance data for enhanced analysis."""
+    timestamp: datetime
+    portfolio_value: Decimal
+    daily_return: Decimal
+    cumulative_return: Decimal
+    volatility: Decimal
+    sharpe_ratio: Decimal
+    max_drawdown: Decimal
+    market_conditions: Dict[str, Any]
+
+
 class DataReplayIterator:
     """Efficient iterator for historical data replay."""
     
@@ -194,9 +251,22 @@ class HistoricalDataManager:
     optimized for backtesting and simulation engines.
     """
     
-    def __init__(self) -> None:
-        """Initialize historical data manager."""
-        self.data_dir = Path("data") / "historical"
+    def __init__(
+        self,
+        data_dir: Optional[Path] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL
+    ) -> None:
+        """
+        Initialize historical data manager.
+        
+        Args:
+            data_dir: Root data directory (default data/historical)
+            batch_rows: Buffered simulation snapshots per columnar write
+            flush_interval: Seconds the oldest buffered snapshot may wait
+                before the buffer is written regardless of its size
+        """
+        self.data_dir = Path(data_dir) if data_dir else Path("data") / "historical"
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # Create subdirectories
@@ -204,10 +274,16 @@ class HistoricalDataManager:
         (self.data_dir / "pairs").mkdir(exist_ok=True)
         (self.data_dir / "ohlcv").mkdir(exist_ok=True)
         (self.data_dir / "compressed").mkdir(exist_ok=True)
-        (self.data_dir / "simulation").mkdir(exist_ok=True)  # New: simulation data
+        (self.data_dir / "simulation").mkdir(exist_ok=True)  # Legacy JSONL simulation data
+        (self.data_dir / "performance").mkdir(exist_ok=True)
+        
+        # Columnar simulation store (chain/date partitions)
+        self.sim_store = ColumnarSnapshotStore(self.data_dir / "columnar", batch_rows=batch_rows)
+        self.flush_interval = flush_interval
+        self._pending_since: Optional[float] = None
         
         # Memory cache for frequently accessed data
-        self._cache: Dict[str, List[SimulationSnapshot]] = {}
+        self._cache: Dict[Tuple, List[SimulationSnapshot]] = {}
         self._cache_max_size = 1000  # Max cache entries
         
         logger.info(f"Enhanced historical data manager initialized: {self.data_dir}")
@@ -245,21 +321,93 @@ class HistoricalDataManager:
             return False
     
     async def store_simulation_snapshot(self, snapshot: SimulationSnapshot) -> bool:
-        """Store simulation snapshot for replay."""
+        """
+        Buffer simulation snapshot for replay.
+        
+        The buffer is written as a columnar part once it holds ``batch_rows``
+        snapshots or its oldest snapshot is ``flush_interval`` seconds old.
+        """
         try:
-            date_str = snapshot.timestamp.strftime("%Y-%m-%d")
-            filepath = self.data_dir / "simulation" / f"{snapshot.chain}_{date_str}.jsonl"
+            self._cache.clear()
+            now = time.monotonic()
+            if self._pending_since is None:
+                self._pending_since = now
+            full = self.sim_store.append(snapshot)
+            if full or now - self._pending_since >= self.flush_interval:
+                await self.flush_simulation_data()
+            return True
+            
+        except Exception as e:
+            logger.error(f"Failed to store simulation snapshot: {e}")
+            return False
+    
+    async def flush_simulation_data(self) -> int:
+        """
+        Write buffered simulation snapshots to the columnar store.
+        
+        Returns:
+            Number of snapshots written
+        """
+        pending = self.sim_store.take_pending()
+        self._pending_since = None
+        if not pending:
+            return 0
+        return await asyncio.to_thread(self.sim_store.write_pending, pending)
+    
+    async def close(self) -> None:
+        """Write any buffered simulation snapshots; call before discarding the manager."""
+        await self.flush_simulation_data()
+    
+    async def store_performance_data(self, perf_data: HistoricalPerformanceData) -> bool:
+        """Store historical performance data."""
+        try:
+            date_str = perf_data.timestamp.strftime("%Y-%m-%d")
+            filepath = self.data_dir / "performance" / f"performance_{date_str}.jsonl"
+            
+            # Convert to dict for JSON serialization
+            data_dict = {
+                "timestamp": perf_data.timestamp.isoformat(),
+                "portfolio_value": str(perf_data.portfolio_value),
+                "daily_return": str(perf_data.daily_return),
+                "cumulative_return": str(perf_data.cumulative_return),
+                "volatility": str(perf_data.volatility),
+                "sharpe_ratio": str(perf_data.sharpe_ratio),
+                "max_drawdown": str(perf_data.max_drawdown),
+                "market_conditions": perf_data.market_conditions
+            }
             
             # Append to daily file
             with open(filepath, "a", encoding="utf-8") as f:
-                f.write(snapshot.json() + "\n")
+                f.write(json.dumps(data_dict) + "\n")
             
             return True
             
         except Exception as e:
-            logger.error(f"Failed to store simulation snapshot: {e}")
+            logger.error(f"Failed to store performance data: {e}")
             return False
     
+    async def migrate_simulation_data(self, remove_source: bool = True) -> Dict[str, Any]:
+        """
+        Convert legacy JSONL simulation files into the columnar store.
+        
+        Args:
+            remove_source: Delete each JSONL file once its rows are written
+                (otherwise it is renamed to ``<name>.migrated``)
+            
+        Returns:
+            Migration statistics
+        """
+        await self.flush_simulation_data()
+        stats = await asyncio.to_thread(
+            migrate_jsonl_directory,
+            self.data_dir / "simulation",
+            self.sim_store,
+            remove_source
+        )
+        self._cache.clear()
+        logger.info(f"Simulation data migration complete: {stats}")
+        return stats
+    
     async def get_simulation_data(
         self,
         start_time: datetime,
@@ -281,16 +429,28 @@ class HistoricalDataManager:
         Returns:
             List of simulation snapshots
         """
-        cache_key = f"{start_time.isoformat()}_{end_time.isoformat()}_{chains}_{pairs}"
+        cache_key = (
+            start_time,
+            end_time,
+            tuple(sorted(chains)) if chains else None,
+            tuple(sorted(pairs)) if pairs else None,
+        )
         
         # Check cache first
         if use_cache and cache_key in self._cache:
             logger.debug(f"Using cached simulation data for {cache_key}")
             return self._cache[cache_key]
         
-        snapshots = []
+        # Columnar store: pruned by chain/date partition, time range and pairs,
+        # plus any rows still buffered in memory
+        batch = await asyncio.to_thread(
+            self.sim_store.scan, start_time, end_time, chains, pairs,
+            None, self.sim_store.copy_pending()
+        )
+        snapshots = snapshots_from_columns(batch)
         
-        # Determine date range to scan
+        # Legacy JSONL files not yet migrated
+        legacy: List[SimulationSnapshot] = []
         current_date = start_time.date()
         end_date = end_time.date()
         
@@ -305,7 +465,7 @@ class HistoricalDataManager:
                         day_snapshots = await self._read_simulation_snapshots(
                             filepath, start_time, end_time
                         )
-                        snapshots.extend(day_snapshots)
+                        legacy.extend(day_snapshots)
             else:
                 # Scan all simulation files for the date
                 pattern = f"*_{date_str}.jsonl"
@@ -313,16 +473,18 @@ class HistoricalDataManager:
                     day_snapshots = await self._read_simulation_snapshots(
                         filepath, start_time, end_time
                     )
-                    snapshots.extend(day_snapshots)
+                    legacy.extend(day_snapshots)
             
             current_date += timedelta(days=1)
         
-        # Filter by pairs if specified
-        if pairs:
-            snapshots = [s for s in snapshots if s.pair_address in pairs]
-        
-        # Sort by timestamp
-        snapshots.sort(key=lambda x: x.timestamp)
+        if legacy:
+            # Filter by pairs if specified
+            if pairs:
+                legacy = [s for s in legacy if s.pair_address in pairs]
+            snapshots.extend(legacy)
+            
+            # Sort by timestamp (columnar rows arrive sorted)
+            snapshots.sort(key=lambda x: x.timestamp)
         
         # Cache result
         if use_cache:
@@ -413,6 +575,7 @@ class HistoricalDataManager:
                 if await self.store_simulation_snapshot(sim_snapshot):
                     created_count += 1
             
+            await self.flush_simulation_data()
             logger.info(f"Created {created_count} simulation snapshots from pair data")
             return created_count
             
@@ -452,6 +615,32 @@ class HistoricalDataManager:
         
         return sorted(snapshots, key=lambda x: x.timestamp)
     
+    async def get_performance_data(
+        self,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[HistoricalPerformanceData]:
+        """Get historical performance data for time range."""
+        performance_data = []
+        
+        # Determine date range to scan
+        current_date = start_time.date()
+        end_date = end_time.date()
+        
+        while current_date <= end_date:
+            date_str = current_date.strftime("%Y-%m-%d")
+            filepath = self.data_dir / "performance" / f"performance_{date_str}.jsonl"
+            
+            if filepath.exists():
+                day_data = await self._read_performance_data(
+                    filepath, start_time, end_time
+                )
+                performance_data.extend(day_data)
+            
+            current_date += timedelta(days=1)
+        
+        return sorted(performance_data, key=lambda x: x.timestamp)
+    
     async def _read_simulation_snapshots(
         self,
         filepath: Path,
@@ -508,6 +697,45 @@ class HistoricalDataManager:
         
         return snapshots
     
+    async def _read_performance_data(
+        self,
+        filepath: Path,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[HistoricalPerformanceData]:
+        """Read and filter performance data from file."""
+        performance_data: List[HistoricalPerformanceData] = []
+        
+        try:
+            with open(filepath, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    
+                    data = json.loads(line)
+                    
+                    # Convert back from dict
+                    perf_data = HistoricalPerformanceData(
+                        timestamp=datetime.fromisoformat(data["timestamp"]),
+                        portfolio_value=Decimal(data["portfolio_value"]),
+                        daily_return=Decimal(data["daily_return"]),
+                        cumulative_return=Decimal(data["cumulative_return"]),
+                        volatility=Decimal(data["volatility"]),
+                        sharpe_ratio=Decimal(data["sharpe_ratio"]),
+                        max_drawdown=Decimal(data["max_drawdown"]),
+                        market_conditions=data["market_conditions"]
+                    )
+                    
+                    # Filter by time range
+                    if start_time <= perf_data.timestamp <= end_time:
+                        performance_data.append(perf_data)
+        
+        except Exception as e:
+            logger.error(f"Failed to read performance data from {filepath}: {e}")
+        
+        return performance_data
+    
     async def _calculate_volatility(
         self,
         pair_address: str,
@@ -528,7 +756,7 @@ class HistoricalDataManager:
             logger.error(f"Failed to calculate volatility: {e}")
             return 0.05
     
-    def _manage_cache(self, cache_key: str, data: List[SimulationSnapshot]) -> None:
+    def _manage_cache(self, cache_key: Tuple, data: List[SimulationSnapshot]) -> None:
         """Manage memory cache with size limits."""
         # Remove oldest entries if cache is full
         if len(self._cache) >= self._cache_max_size:
@@ -578,6 +806,10 @@ class HistoricalDataManager:
             if compressed_dir.exists():
                 stats["compressed_files"] = len(list(compressed_dir.glob("*.gz")))
             
+            # Columnar simulation store
+            stats["chains"].update(self.sim_store.chains())
+            stats["simulation_store"] = self.sim_store.get_stats()
+            
             # Convert sets to lists for JSON serialization
             stats["chains"] = list(stats["chains"])
             stats["dexs"] = list(stats["dexs"])
@@ -8,66 +8,29 @@ enhanced historical data management and replay capabilities.
 from __future__ import annotations
 
 import asyncio
-import gzip
-import json
 import logging
 import statistics
 from decimal import Decimal
 from datetime import datetime, timedelta
-from typing import List, Dict, Tuple, Optional, Any, Union
+from typing import List, Dict, Tuple, Optional, Any
 from dataclasses import dataclass
 from enum import Enum
-from pathlib import Path
 
-# Try to import pydantic, if not available, create a minimal replacement
-try:
-    from pydantic import BaseModel, Field
-except ImportError:
-    # Minimal BaseModel replacement if pydantic not available
-    class BaseModel:
-        def __init__(self, **kwargs):
-            for key, value in kwargs.items():
-                setattr(self, key, value)
-        
-        def json(self):
-            import json
-            data = {}
-            for key, value in self.__dict__.items():
-                if isinstance(value, Decimal):
-                    data[key] = str(value)
-                elif isinstance(value, datetime):
-                    data[key] = value.isoformat()
-                else:
-                    data[key] = value
-            return json.dumps(data)
-    
-    def Field(**kwargs):
-        return None
+from .historical_data import (
+    DataReplayIterator,
+    DataSource,
+    HistoricalDataManager,
+    HistoricalPerformanceData,
+    MarketDataPoint,
+    PairSnapshot,
+    SimulationSnapshot,
+    TimeFrame,
+    TokenSnapshot,
+)
 
 logger = logging.getLogger(__name__)
 
 
-# Historical Data Management Classes
-class DataSource(str, Enum):
-    """Historical data sources."""
-    DEXSCREENER = "dexscreener"
-    CHAIN_RPC = "chain_rpc"
-    COINGECKO = "coingecko"
-    UNISWAP_SUBGRAPH = "uniswap_subgraph"
-    MANUAL_IMPORT = "manual_import"
-    SIMULATION = "simulation"
-
-
-class TimeFrame(str, Enum):
-    """Data aggregation timeframes."""
-    MINUTE_1 = "1m"
-    MINUTE_5 = "5m"
-    MINUTE_15 = "15m"
-    HOUR_1 = "1h"
-    HOUR_4 = "4h"
-    DAY_1 = "1d"
-
-
 class MetricType(Enum):
     """Types of performance metrics."""
     RETURN = "return"
@@ -76,72 +39,6 @@ class MetricType(Enum):
     DRAWDOWN = "drawdown"
 
 
-class MarketDataPoint(BaseModel):
-    """Single market data point for OHLCV data."""
-    def __init__(self, **kwargs):
-        self.timestamp = kwargs.get('timestamp')
-        self.open_price = kwargs.get('open_price', Decimal('0'))
-        self.high_price = kwargs.get('high_price', Decimal('0'))
-        self.low_price = kwargs.get('low_price', Decimal('0'))
-        self.close_price = kwargs.get('close_price', Decimal('0'))
-        self.volume = kwargs.get('volume', Decimal('0'))
-        self.liquidity = kwargs.get('liquidity')
-        self.transactions = kwargs.get('transactions')
-
-
-class TokenSnapshot(BaseModel):
-    """Historical token snapshot."""
-    def __init__(self, **kwargs):
-        self.token_address = kwargs.get('token_address', '')
-        self.chain = kwargs.get('chain', '')
-        self.timestamp = kwargs.get('timestamp')
-        self.price_usd = kwargs.get('price_usd', Decimal('0'))
-        self.market_cap = kwargs.get('market_cap')
-        self.liquidity_usd = kwargs.get('liquidity_usd')
-        self.volume_24h = kwargs.get('volume_24h')
-        self.holder_count = kwargs.get('holder_count')
-        self.source = kwargs.get('source', DataSource.SIMULATION)
-
-
-class PairSnapshot(BaseModel):
-    """Historical pair snapshot."""
-    def __init__(self, **kwargs):
-        self.pair_address = kwargs.get('pair_address', '')
-        self.chain = kwargs.get('chain', '')
-        self.dex = kwargs.get('dex', '')
-        self.timestamp = kwargs.get('timestamp')
-        self.token0_address = kwargs.get('token0_address', '')
-        self.token1_address = kwargs.get('token1_address', '')
-        self.reserve0 = kwargs.get('reserve0', Decimal('0'))
-        self.reserve1 = kwargs.get('reserve1', Decimal('0'))
-        self.price = kwargs.get('price', Decimal('0'))
-        self.liquidity_usd = kwargs.get('liquidity_usd', Decimal('0'))
-        self.volume_24h = kwargs.get('volume_24h')
-        self.fee_tier = kwargs.get('fee_tier')
-        self.source = kwargs.get('source', DataSource.SIMULATION)
-
-
-class SimulationSnapshot(BaseModel):
-    """Enhanced snapshot for simulation replay."""
-    def __init__(self, **kwargs):
-        self.timestamp = kwargs.get('timestamp')
-        self.pair_address = kwargs.get('pair_address', '')
-        self.chain = kwargs.get('chain', '')
-        self.dex = kwargs.get('dex', '')
-        self.price = kwargs.get('price', Decimal('0'))
-        self.reserve0 = kwargs.get('reserve0', Decimal('0'))
-        self.reserve1 = kwargs.get('reserve1', Decimal('0'))
-        self.liquidity_usd = kwargs.get('liquidity_usd', Decimal('0'))
-        self.volume_24h = kwargs.get('volume_24h', Decimal('0'))
-        self.volatility = kwargs.get('volatility', 0.0)
-        self.trade_count = kwargs.get('trade_count', 0)
-        self.avg_trade_size = kwargs.get('avg_trade_size', Decimal('0'))
-        self.gas_price = kwargs.get('gas_price')
-        self.network_congestion = kwargs.get('network_congestion')
-        self.price_change_1h = kwargs.get('price_change_1h')
-        self.liquidity_change_1h = kwargs.get('liquidity_change_1h')
-
-
 @dataclass
 class TradeResult:
     """Individual trade result for analysis."""
@@ -230,648 +127,6 @@ class ComparisonMetrics:
     confidence_level: float
 
 
-@dataclass
-class HistoricalPerformanceData:
-    """Historical performance data for enhanced analysis."""
-    timestamp: datetime
-    portfolio_value: Decimal
-    daily_return: Decimal
-    cumulative_return: Decimal
-    volatility: Decimal
-    sharpe_ratio: Decimal
-    max_drawdown: Decimal
-    market_conditions: Dict[str, Any]
-
-
-class DataReplayIterator:
-    """Efficient iterator for historical data replay."""
-    
-    def __init__(
-        self,
-        snapshots: List[SimulationSnapshot],
-        start_time: datetime,
-        end_time: datetime,
-        time_step: timedelta = timedelta(minutes=1)
-    ):
-        """Initialize data replay iterator."""
-        self.snapshots = sorted(snapshots, key=lambda x: x.timestamp)
-        self.start_time = start_time
-        self.end_time = end_time
-        self.time_step = time_step
-        self.current_time = start_time
-        self.snapshot_index = 0
-        
-    def __iter__(self):
-        """Return iterator."""
-        return self
-    
-    def __next__(self) -> Tuple[datetime, List[SimulationSnapshot]]:
-        """Get next time step and available snapshots."""
-        if self.current_time >= self.end_time:
-            raise StopIteration
-        
-        # Find snapshots for current time window
-        window_snapshots = []
-        window_end = self.current_time + self.time_step
-        
-        while (self.snapshot_index < len(self.snapshots) and
-               self.snapshots[self.snapshot_index].timestamp < window_end):
-            
-            snapshot = self.snapshots[self.snapshot_index]
-            if snapshot.timestamp >= self.current_time:
-                window_snapshots.append(snapshot)
-            
-            self.snapshot_index += 1
-        
-        current_time = self.current_time
-        self.current_time += self.time_step
-        
-        return current_time, window_snapshots
-
-
-class HistoricalDataManager:
-    """
-    Enhanced historical market data management for simulation.
-    
-    Provides efficient data storage, retrieval, and replay capabilities
-    optimized for backtesting and simulation engines.
-    """
-    
-    def __init__(self) -> None:
-        """Initialize historical data manager."""
-        self.data_dir = Path("data") / "historical"
-        self.data_dir.mkdir(parents=True, exist_ok=True)
-        
-        # Create subdirectories
-        (self.data_dir / "tokens").mkdir(exist_ok=True)
-        (self.data_dir / "pairs").mkdir(exist_ok=True)
-        (self.data_dir / "ohlcv").mkdir(exist_ok=True)
-        (self.data_dir / "compressed").mkdir(exist_ok=True)
-        (self.data_dir / "simulation").mkdir(exist_ok=True)
-        (self.data_dir / "performance").mkdir(exist_ok=True)
-        
-        # Memory cache for frequently accessed data
-        self._cache: Dict[str, List[SimulationSnapshot]] = {}
-        self._cache_max_size = 1000  # Max cache entries
-        
-        logger.info(f"Enhanced historical data manager initialized: {self.data_dir}")
-    
-    async def store_token_snapshot(self, snapshot: TokenSnapshot) -> bool:
-        """Store a token snapshot to disk."""
-        try:
-            date_str = snapshot.timestamp.strftime("%Y-%m-%d")
-            filepath = self.data_dir / "tokens" / f"{snapshot.chain}_{date_str}.jsonl"
-            
-            # Append to daily file
-            with open(filepath, "a", encoding="utf-8") as f:
-                f.write(snapshot.json() + "\n")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to store token snapshot: {e}")
-            return False
-    
-    async def store_pair_snapshot(self, snapshot: PairSnapshot) -> bool:
-        """Store a pair snapshot to disk."""
-        try:
-            date_str = snapshot.timestamp.strftime("%Y-%m-%d")
-            filepath = self.data_dir / "pairs" / f"{snapshot.chain}_{snapshot.dex}_{date_str}.jsonl"
-            
-            # Append to daily file
-            with open(filepath, "a", encoding="utf-8") as f:
-                f.write(snapshot.json() + "\n")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to store pair snapshot: {e}")
-            return False
-    
-    async def store_simulation_snapshot(self, snapshot: SimulationSnapshot) -> bool:
-        """Store simulation snapshot for replay."""
-        try:
-            date_str = snapshot.timestamp.strftime("%Y-%m-%d")
-            filepath = self.data_dir / "simulation" / f"{snapshot.chain}_{date_str}.jsonl"
-            
-            # Append to daily file
-            with open(filepath, "a", encoding="utf-8") as f:
-                f.write(snapshot.json() + "\n")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to store simulation snapshot: {e}")
-            return False
-    
-    async def store_performance_data(self, perf_data: HistoricalPerformanceData) -> bool:
-        """Store historical performance data."""
-        try:
-            date_str = perf_data.timestamp.strftime("%Y-%m-%d")
-            filepath = self.data_dir / "performance" / f"performance_{date_str}.jsonl"
-            
-            # Convert to dict for JSON serialization
-            data_dict = {
-                "timestamp": perf_data.timestamp.isoformat(),
-                "portfolio_value": str(perf_data.portfolio_value),
-                "daily_return": str(perf_data.daily_return),
-                "cumulative_return": str(perf_data.cumulative_return),
-                "volatility": str(perf_data.volatility),
-                "sharpe_ratio": str(perf_data.sharpe_ratio),
-                "max_drawdown": str(perf_data.max_drawdown),
-                "market_conditions": perf_data.market_conditions
-            }
-            
-            # Append to daily file
-            with open(filepath, "a", encoding="utf-8") as f:
-                f.write(json.dumps(data_dict) + "\n")
-            
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to store performance data: {e}")
-            return False
-    
-    async def get_simulation_data(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        chains: Optional[List[str]] = None,
-        pairs: Optional[List[str]] = None,
-        use_cache: bool = True
-    ) -> List[SimulationSnapshot]:
-        """Get simulation data for time range with caching."""
-        cache_key = f"{start_time.isoformat()}_{end_time.isoformat()}_{chains}_{pairs}"
-        
-        # Check cache first
-        if use_cache and cache_key in self._cache:
-            logger.debug(f"Using cached simulation data for {cache_key}")
-            return self._cache[cache_key]
-        
-        snapshots = []
-        
-        # Determine date range to scan
-        current_date = start_time.date()
-        end_date = end_time.date()
-        
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Check each chain if specified
-            if chains:
-                for chain in chains:
-                    filepath = self.data_dir / "simulation" / f"{chain}_{date_str}.jsonl"
-                    if filepath.exists():
-                        day_snapshots = await self._read_simulation_snapshots(
-                            filepath, start_time, end_time
-                        )
-                        snapshots.extend(day_snapshots)
-            else:
-                # Scan all simulation files for the date
-                pattern = f"*_{date_str}.jsonl"
-                for filepath in (self.data_dir / "simulation").glob(pattern):
-                    day_snapshots = await self._read_simulation_snapshots(
-                        filepath, start_time, end_time
-                    )
-                    snapshots.extend(day_snapshots)
-            
-            current_date += timedelta(days=1)
-        
-        # Filter by pairs if specified
-        if pairs:
-            snapshots = [s for s in snapshots if s.pair_address in pairs]
-        
-        # Sort by timestamp
-        snapshots.sort(key=lambda x: x.timestamp)
-        
-        # Cache result
-        if use_cache:
-            self._manage_cache(cache_key, snapshots)
-        
-        logger.info(f"Retrieved {len(snapshots)} simulation snapshots")
-        return snapshots
-    
-    async def get_data_replay_iterator(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        time_step: timedelta = timedelta(minutes=1),
-        chains: Optional[List[str]] = None,
-        pairs: Optional[List[str]] = None
-    ) -> DataReplayIterator:
-        """Get efficient iterator for data replay."""
-        snapshots = await self.get_simulation_data(
-            start_time, end_time, chains, pairs
-        )
-        
-        return DataReplayIterator(snapshots, start_time, end_time, time_step)
-    
-    async def create_simulation_snapshots_from_pairs(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        chains: Optional[List[str]] = None
-    ) -> int:
-        """
-        Create simulation snapshots from existing pair data.
-        
-        Args:
-            start_time: Start time for conversion
-            end_time: End time for conversion
-            chains: Filter by chains
-            
-        Returns:
-            Number of simulation snapshots created
-        """
-        created_count = 0
-        
-        try:
-            # Get pair snapshots
-            pair_snapshots = await self.get_pair_snapshots(
-                start_time, end_time, chains
-            )
-            
-            # Convert to simulation snapshots
-            for pair_snapshot in pair_snapshots:
-                # Calculate additional metrics
-                volatility = await self._calculate_volatility(
-                    pair_snapshot.pair_address, pair_snapshot.timestamp
-                )
-                
-                sim_snapshot = SimulationSnapshot(
-                    timestamp=pair_snapshot.timestamp,
-                    pair_address=pair_snapshot.pair_address,
-                    chain=pair_snapshot.chain,
-                    dex=pair_snapshot.dex,
-                    price=pair_snapshot.price,
-                    reserve0=pair_snapshot.reserve0,
-                    reserve1=pair_snapshot.reserve1,
-                    liquidity_usd=pair_snapshot.liquidity_usd,
-                    volume_24h=pair_snapshot.volume_24h or Decimal("0"),
-                    volatility=volatility,
-                    trade_count=0,  # Default
-                    avg_trade_size=Decimal("1000"),  # Default
-                    gas_price=None,  # Optional field
-                    network_congestion=None,  # Optional field
-                    price_change_1h=None,  # Optional field
-                    liquidity_change_1h=None  # Optional field
-                )
-                
-                # Store simulation snapshot
-                if await self.store_simulation_snapshot(sim_snapshot):
-                    created_count += 1
-            
-            logger.info(f"Created {created_count} simulation snapshots from pair data")
-            return created_count
-            
-        except Exception as e:
-            logger.error(f"Failed to create simulation snapshots: {e}")
-            return created_count
-    
-    async def get_pair_snapshots(
-        self,
-        start_time: datetime,
-        end_time: datetime,
-        chains: Optional[List[str]] = None
-    ) -> List[PairSnapshot]:
-        """Get pair snapshots for time range."""
-        snapshots = []
-        
-        # Determine date range to scan
-        current_date = start_time.date()
-        end_date = end_time.date()
-        
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            
-            # Scan all pair files for the date
-            pattern = f"*_{date_str}.jsonl"
-            for filepath in (self.data_dir / "pairs").glob(pattern):
-                day_snapshots = await self._read_pair_snapshots(
-                    filepath, start_time, end_time
-                )
-                snapshots.extend(day_snapshots)
-            
-            current_date += timedelta(days=1)
-        
-        # Filter by chains if specified
-        if chains:
-            snapshots = [s for s in snapshots if s.chain in chains]
-        
-        return sorted(snapshots, key=lambda x: x.timestamp)
-    
-    async def get_performance_data(
-        self,
-        start_time: datetime,
-        end_time: datetime
-    ) -> List[HistoricalPerformanceData]:
-        """Get historical performance data for time range."""
-        performance_data = []
-        
-        # Determine date range to scan
-        current_date = start_time.date()
-        end_date = end_time.date()
-        
-        while current_date <= end_date:
-            date_str = current_date.strftime("%Y-%m-%d")
-            filepath = self.data_dir / "performance" / f"performance_{date_str}.jsonl"
-            
-            if filepath.exists():
-                day_data = await self._read_performance_data(
-                    filepath, start_time, end_time
-                )
-                performance_data.extend(day_data)
-            
-            current_date += timedelta(days=1)
-        
-        return sorted(performance_data, key=lambda x: x.timestamp)
-    
-    async def _read_simulation_snapshots(
-        self,
-        filepath: Path,
-        start_time: datetime,
-        end_time: datetime
-    ) -> List[SimulationSnapshot]:
-        """Read and filter simulation snapshots from file."""
-        snapshots: List[SimulationSnapshot] = []
-        
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    data = json.loads(line)
-                    snapshot = SimulationSnapshot(**data)
-                    
-                    # Filter by time range
-                    if start_time <= snapshot.timestamp <= end_time:
-                        snapshots.append(snapshot)
-        
-        except Exception as e:
-            logger.error(f"Failed to read simulation snapshots from {filepath}: {e}")
-        
-        return snapshots
-    
-    async def _read_pair_snapshots(
-        self,
-        filepath: Path,
-        start_time: datetime,
-        end_time: datetime
-    ) -> List[PairSnapshot]:
-        """Read and filter pair snapshots from file."""
-        snapshots: List[PairSnapshot] = []
-        
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    data = json.loads(line)
-                    snapshot = PairSnapshot(**data)
-                    
-                    # Filter by time range
-                    if start_time <= snapshot.timestamp <= end_time:
-                        snapshots.append(snapshot)
-        
-        except Exception as e:
-            logger.error(f"Failed to read pair snapshots from {filepath}: {e}")
-        
-        return snapshots
-    
-    async def _read_performance_data(
-        self,
-        filepath: Path,
-        start_time: datetime,
-        end_time: datetime
-    ) -> List[HistoricalPerformanceData]:
-        """Read and filter performance data from file."""
-        performance_data: List[HistoricalPerformanceData] = []
-        
-        try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    
-                    data = json.loads(line)
-                    
-                    # Convert back from dict
-                    perf_data = HistoricalPerformanceData(
-                        timestamp=datetime.fromisoformat(data["timestamp"]),
-                        portfolio_value=Decimal(data["portfolio_value"]),
-                        daily_return=Decimal(data["daily_return"]),
-                        cumulative_return=Decimal(data["cumulative_return"]),
-                        volatility=Decimal(data["volatility"]),
-                        sharpe_ratio=Decimal(data["sharpe_ratio"]),
-                        max_drawdown=Decimal(data["max_drawdown"]),
-                        market_conditions=data["market_conditions"]
-                    )
-                    
-                    # Filter by time range
-                    if start_time <= perf_data.timestamp <= end_time:
-                        performance_data.append(perf_data)
-        
-        except Exception as e:
-            logger.error(f"Failed to read performance data from {filepath}: {e}")
-        
-        return performance_data
-    
-    async def _calculate_volatility(
-        self,
-        pair_address: str,
-        timestamp: datetime,
-        window_hours: int = 24
-    ) -> float:
-        """Calculate price volatility for a pair."""
-        try:
-            # Get historical data for volatility calculation
-            start_time = timestamp - timedelta(hours=window_hours)
-            end_time = timestamp
-            
-            # This would typically fetch price data and calculate standard deviation
-            # For now, return a default volatility
-            return 0.05  # 5% default volatility
-            
-        except Exception as e:
-            logger.error(f"Failed to calculate volatility: {e}")
-            return 0.05
-    
-    def _manage_cache(self, cache_key: str, data: List[SimulationSnapshot]) -> None:
-        """Manage memory cache with size limits."""
-        # Remove oldest entries if cache is full
-        if len(self._cache) >= self._cache_max_size:
-            # Remove first (oldest) entry
-            oldest_key = next(iter(self._cache))
-            del self._cache[oldest_key]
-        
-        self._cache[cache_key] = data
-    
-    async def get_data_statistics(
-        self,
-        start_time: Optional[datetime] = None,
-        end_time: Optional[datetime] = None
-    ) -> Dict[str, any]:
-        """Get statistics about available historical data."""
-        stats = {
-            "total_files": 0,
-            "compressed_files": 0,
-            "data_size_mb": 0,
-            "date_range": {},
-            "chains": set(),
-            "dexs": set(),
-            "pairs_count": 0
-        }
-        
-        try:
-            # Scan all data directories
-            for subdir in ["tokens", "pairs", "ohlcv", "simulation"]:
-                data_subdir = self.data_dir / subdir
-                if data_subdir.exists():
-                    for filepath in data_subdir.iterdir():
-                        if filepath.is_file():
-                            stats["total_files"] += 1
-                            stats["data_size_mb"] += filepath.stat().st_size / (1024 * 1024)
-                            
-                            # Extract metadata from filename
-                            filename = filepath.stem
-                            if "_" in filename:
-                                parts = filename.split("_")
-                                if len(parts) >= 2:
-                                    stats["chains"].add(parts[0])
-                                if len(parts) >= 3 and subdir == "pairs":
-                                    stats["dexs"].add(parts[1])
-            
-            # Count compressed files
-            compressed_dir = self.data_dir / "compressed"
-            if compressed_dir.exists():
-                stats["compressed_files"] = len(list(compressed_dir.glob("*.gz")))
-            
-            # Convert sets to lists for JSON serialization
-            stats["chains"] = list(stats["chains"])
-            stats["dexs"] = list(stats["dexs"])
-            
-            return stats
-            
-        except Exception as e:
-            logger.error(f"Failed to get data statistics: {e}")
-            return stats
-    
-    async def compress_old_data(self, days_old: int = 30) -> Dict[str, int]:
-        """
-        Compress historical data older than specified days.
-        
-        Args:
-            days_old: Compress data older than this many days
-            
-        Returns:
-            Statistics about compression
-        """
-        stats = {"compressed_files": 0, "bytes_saved": 0}
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        
-        try:
-            # Compress in all subdirectories
-            for subdir in ["tokens", "pairs", "ohlcv", "simulation"]:
-                await self._compress_directory(
-                    self.data_dir / subdir,
-                    cutoff_date,
-                    stats
-                )
-            
-            logger.info(f"Compression complete: {stats}")
-            return stats
-            
-        except Exception as e:
-            logger.error(f"Failed to compress old data: {e}")
-            return stats
-    
-    async def _compress_directory(
-        self,
-        directory: Path,
-        cutoff_date: datetime,
-        stats: Dict[str, int]
-    ) -> None:
-        """Compress files in directory older than cutoff date."""
-        try:
-            for file_path in directory.iterdir():
-                if not file_path.is_file() or file_path.suffix == ".gz":
-                    continue
-                
-                file_date = datetime.fromtimestamp(file_path.stat().st_mtime)
-                if file_date < cutoff_date:
-                    await self._compress_file(file_path, stats)
-        
-        except Exception as e:
-            logger.error(f"Failed to compress directory {directory}: {e}")
-    
-    async def _compress_file(
-        self,
-        file_path: Path,
-        stats: Dict[str, int]
-    ) -> None:
-        """Compress individual file."""
-        try:
-            compressed_path = self.data_dir / "compressed" / f"{file_path.name}.gz"
-            
-            # Read original file
-            with open(file_path, "rb") as f_in:
-                original_data = f_in.read()
-            
-            # Write compressed file
-            with gzip.open(compressed_path, "wb") as f_out:
-                f_out.write(original_data)
-            
-            # Update stats
-            original_size = len(original_data)
-            compressed_size = compressed_path.stat().st_size
-            stats["compressed_files"] += 1
-            stats["bytes_saved"] += original_size - compressed_size
-            
-            # Remove original
-            file_path.unlink()
-            
-            logger.debug(f"Compressed {file_path.name}: {original_size} -> {compressed_size} bytes")
-            
-        except Exception as e:
-            logger.error(f"Failed to compress file {file_path}: {e}")
-    
-    async def cleanup_old_data(self, days_old: int = 365) -> int:
-        """
-        Remove historical data older than specified days.
-        
-        Args:
-            days_old: Remove data older than this many days
-            
-        Returns:
-            Number of files removed
-        """
-        removed_count = 0
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        
-        try:
-            # Clean up compressed data
-            compressed_dir = self.data_dir / "compressed"
-            if compressed_dir.exists():
-                for file_path in compressed_dir.iterdir():
-                    if file_path.is_file():
-                        file_date = datetime.fromtimestamp(file_path.stat().st_mtime)
-                        if file_date < cutoff_date:
-                            file_path.unlink()
-                            removed_count += 1
-            
-            logger.info(f"Removed {removed_count} old data files")
-            return removed_count
-            
-        except Exception as e:
-            logger.error(f"Failed to cleanup old data: {e}")
-            return removed_count
-
-
 class PerformanceAnalyzer:
     """
     Enhanced performance analysis engine with historical data integration.
@@ -7,7 +7,8 @@ comprehensive CRUD operations and query methods.
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict, Any
+import asyncio
+from typing import Callable, List, Optional, Dict, Any
 from decimal import Decimal
 from datetime import datetime
 import uuid
@@ -15,7 +16,7 @@ import logging
 
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import and_, or_, desc, asc
+from sqlalchemy import and_, or_, desc, asc, func, bindparam
 
 from .models import (
     AdvancedOrder, OrderExecution, Position, User, TradeExecution,
@@ -32,11 +33,17 @@ class RepositoryError(Exception):
     pass
 
 
+# Called with (event, order) after a committed write: created/status/parameters/execution
+OrderChangeListener = Callable[[str, AdvancedOrder], None]
+
+
 class AdvancedOrderRepository:
     """
     Repository for advanced order operations.
     
     Provides CRUD operations and specialized queries for AdvancedOrder model.
+    Writes are announced to registered change listeners so in-memory views
+    (the trigger books) stay in sync without reloading every order.
     """
     
     def __init__(self, session: Optional[Session] = None):
@@ -47,6 +54,7 @@ class AdvancedOrderRepository:
             session: Database session (optional, will create if not provided)
         """
         self._session = session
+        self._change_listeners: List[OrderChangeListener] = []
         
     def _get_session(self) -> Session:
         """Get database session."""
@@ -54,6 +62,48 @@ class AdvancedOrderRepository:
             return self._session
         return get_database_session()
     
+    def add_change_listener(self, listener: OrderChangeListener) -> None:
+        """
+        Register a callback for committed order changes.
+        
+        Args:
+            listener: Called with (event, order) after each committed write
+        """
+        if listener not in self._change_listeners:
+            self._change_listeners.append(listener)
+    
+    def remove_change_listener(self, listener: OrderChangeListener) -> None:
+        """Unregister a change callback."""
+        if listener in self._change_listeners:
+            self._change_listeners.remove(listener)
+    
+    def _notify_change(self, event: str, session: Session, order: AdvancedOrder) -> None:
+        """Reload a committed order and hand it to every listener."""
+        if not self._change_listeners:
+            return
+        
+        try:
+            session.refresh(order)
+        except SQLAlchemyError as e:
+            logger.warning("Failed to reload order for change listeners", extra={
+                "order_id": order.order_id,
+                "event": event,
+                "error": str(e),
+                "module": "advanced_order_repo"
+            })
+            return
+        
+        for listener in list(self._change_listeners):
+            try:
+                listener(event, order)
+            except Exception as e:
+                logger.error("Order change listener failed", extra={
+                    "order_id": order.order_id,
+                    "event": event,
+                    "error": str(e),
+                    "module": "advanced_order_repo"
+                })
+    
     async def create_order(self, order: AdvancedOrder) -> AdvancedOrder:
         """
         Create a new advanced order.
@@ -82,6 +132,7 @@ class AdvancedOrderRepository:
             session.add(order)
             session.commit()
             session.refresh(order)
+            self._notify_change("created", session, order)
             
             logger.info("Successfully created advanced order", extra={
                 "order_id": order.order_id,
@@ -285,6 +336,7 @@ class AdvancedOrderRepository:
                 order.tx_hash = tx_hash
             
             session.commit()
+            self._notify_change("status", session, order)
             
             logger.info("Updated order status", extra={
                 "order_id": order_id,
@@ -347,6 +399,7 @@ class AdvancedOrderRepository:
                 order.trace_id = trace_id
             
             session.commit()
+            self._notify_change("parameters", session, order)
             
             logger.info("Updated order parameters", extra={
                 "order_id": order_id,
@@ -434,6 +487,8 @@ class AdvancedOrderRepository:
                 )
             
             session.commit()
+            if order:
+                self._notify_change("execution", session, order)
             
             logger.info("Recorded order execution", extra={
                 "execution_id": execution_id,
@@ -603,14 +658,7 @@ class PositionRepository:
             if not position:
                 return False
             
-            # Calculate unrealized PnL
-            entry_price = Decimal(str(position.entry_price))
-            quantity = Decimal(str(position.quantity))
-            
-            if position.position_type == "long":
-                unrealized_pnl = (current_price - entry_price) * quantity
-            else:  # short
-                unrealized_pnl = (entry_price - current_price) * quantity
+            unrealized_pnl = self._unrealized_pnl(position, current_price)
             
             # Use session.execute for updates to avoid SQLAlchemy type issues
             session.execute(
@@ -639,6 +687,96 @@ class PositionRepository:
             if not self._session:
                 session.close()
     
+    async def update_token_positions_price(
+        self,
+        token_address: str,
+        chain: str,
+        current_price: Decimal
+    ) -> int:
+        """
+        Mark every open position in a token to a new price.
+        
+        Args:
+            token_address: Token address (matched case-insensitively)
+            chain: Chain name
+            current_price: New current price
+            
+        Returns:
+            Number of positions updated
+        """
+        # Runs for every USD tick, so keep the blocking query off the event loop
+        return await asyncio.to_thread(
+            self._mark_token_positions, token_address, chain, current_price
+        )
+    
+    def _mark_token_positions(
+        self,
+        token_address: str,
+        chain: str,
+        current_price: Decimal
+    ) -> int:
+        """Blocking part of update_token_positions_price: one batched UPDATE."""
+        session = self._get_session()
+        try:
+            positions = session.query(Position).filter(
+                and_(
+                    func.lower(Position.token_address) == token_address.lower(),
+                    Position.chain == chain,
+                    Position.is_open == True
+                )
+            ).all()
+            
+            if not positions:
+                return 0
+            
+            now = datetime.utcnow()
+            session.execute(
+                Position.__table__.update()
+                .where(Position.position_id == bindparam("b_position_id"))
+                .values(
+                    current_price=bindparam("b_current_price"),
+                    unrealized_pnl=bindparam("b_unrealized_pnl"),
+                    updated_at=bindparam("b_updated_at")
+                ),
+                [
+                    {
+                        "b_position_id": position.position_id,
+                        "b_current_price": current_price,
+                        "b_unrealized_pnl": self._unrealized_pnl(position, current_price),
+                        "b_updated_at": now,
+                    }
+                    for position in positions
+                ]
+            )
+            
+            session.commit()
+            return len(positions)
+            
+        except SQLAlchemyError as e:
+            session.rollback()
+            logger.error("Failed to update token positions price", extra={
+                "token_address": token_address,
+                "chain": chain,
+                "current_price": str(current_price),
+                "error": str(e),
+                "module": "position_repo"
+            })
+            return 0
+        finally:
+            if not self._session:
+                session.close()
+    
+    @staticmethod
+    def _unrealized_pnl(position: Position, current_price: Decimal) -> Decimal:
+        """Unrealized PnL of a position at a price."""
+        entry_price = Decimal(str(position.entry_price))
+        quantity = Decimal(str(position.quantity))
+        
+        if position.position_type == "long":
+            return (current_price - entry_price) * quantity
+        # short
+        return (entry_price - current_price) * quantity
+    
     async def create_or_update_position(
         self,
         user_id: int,
@@ -26,6 +26,9 @@ from ..storage.database import get_session_context
 
 # Core services
 from ..core.settings import get_settings
+from ..chains.contract_calls import contract_caller
+from ..discovery.log_scanner import LogScanner
+from .wallet_tracker import TRACKED_TOPICS, TrackedAddressIndex, TrackedTrade, WalletTracker
 
 # Safe imports with fallbacks
 try:
@@ -51,6 +54,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+COPYTRADE_CHAINS = ["ethereum", "bsc", "polygon", "base"]
+COPYTRADE_MAX_CHUNK_BLOCKS = 5  # Unfiltered Transfer/Swap logs are dense
+COPYTRADE_MAX_BACKFILL_BLOCKS = 20  # Older trades are too stale to copy
+SIGNAL_HISTORY_PER_TRADER = 1000
+NATIVE_UNIT = Decimal(10) ** 18  # Wrapped native tokens use 18 decimals
+
+V2_DEX_NAMES = {"ethereum": "uniswap_v2", "bsc": "pancakeswap", "polygon": "quickswap"}
+V3_DEX_NAMES = {"bsc": "pancakeswap_v3"}
+
 
 class CopyMode(str, Enum):
     """Copy trading execution modes."""
@@ -117,8 +129,8 @@ class CopyTradeSignal(BaseModel):
     token_address: str
     token_symbol: str
     trade_type: str  # "buy" or "sell"
-    amount: Decimal
-    price: Decimal
+    amount: Decimal  # Native currency paid or received
+    price: Optional[Decimal] = None  # Native currency per whole token; None until token decimals are known
     timestamp: datetime
     chain: str
     dex: str
@@ -126,6 +138,8 @@ class CopyTradeSignal(BaseModel):
     risk_score: Decimal = Decimal("5")
     processed: bool = False
     execution_delay_ms: Optional[int] = None
+    tx_hash: Optional[str] = None
+    block_number: Optional[int] = None
 
 
 class CopyTradeConfig(BaseModel):
@@ -167,14 +181,18 @@ class TraderDatabase:
     def __init__(self) -> None:
         """Initialize trader database."""
         self.trader_metrics: Dict[str, TraderMetrics] = {}
+        self.tracked_addresses = TrackedAddressIndex()
         self.recent_signals: deque = deque(maxlen=10000)
-        self.signal_history: Dict[str, List[CopyTradeSignal]] = defaultdict(list)
+        self.signal_history: Dict[str, deque] = defaultdict(lambda: deque(maxlen=SIGNAL_HISTORY_PER_TRADER))
+        self._signal_ids: Set[str] = set()
         self.performance_cache: Dict[str, Dict[str, Any]] = {}
     
     async def add_trader(self, trader_address: str) -> TraderMetrics:
         """Add or update trader in database."""
+        trader_address = trader_address.lower()
         if trader_address not in self.trader_metrics:
             self.trader_metrics[trader_address] = TraderMetrics(trader_address=trader_address)
+            self.tracked_addresses.add(trader_address)
         
         # Update metrics
         await self._update_trader_metrics(trader_address)
@@ -191,11 +209,22 @@ class TraderDatabase:
         # For demonstration, we'll use mock calculations
         pass
     
-    def add_signal(self, signal: CopyTradeSignal) -> None:
-        """Add a new copy trade signal."""
+    def add_signal(self, signal: CopyTradeSignal) -> bool:
+        """
+        Add a new copy trade signal.
+        
+        Returns:
+            False if a signal with the same ID was already added
+        """
+        if signal.signal_id in self._signal_ids:
+            return False
+        if len(self.recent_signals) == self.recent_signals.maxlen:
+            self._signal_ids.discard(self.recent_signals[0].signal_id)
+        self._signal_ids.add(signal.signal_id)
         self.recent_signals.append(signal)
         self.signal_history[signal.trader_address].append(signal)
         logger.debug(f"Added copy trade signal: {signal.signal_id}")
+        return True
     
     def get_recent_signals(
         self, 
@@ -203,12 +232,12 @@ class TraderDatabase:
         limit: int = 100
     ) -> List[CopyTradeSignal]:
         """Get recent signals, optionally filtered by trader."""
-        signals = list(self.recent_signals)
-        
         if trader_address:
-            signals = [s for s in signals if s.trader_address == trader_address]
+            signals = self.signal_history.get(trader_address.lower(), ())
+        else:
+            signals = self.recent_signals
         
-        return signals[-limit:]
+        return list(signals)[-limit:]
     
     def get_top_traders(self, limit: int = 20) -> List[TraderMetrics]:
         """Get top performing traders."""
@@ -229,14 +258,56 @@ class TraderDatabase:
 
 
 class SignalDetector:
-    """Detects and processes copy trade signals from monitored traders."""
-    
-    def __init__(self, trader_db: TraderDatabase) -> None:
-        """Initialize signal detector."""
+    """
+    Detects copy trade signals from monitored traders' on-chain swaps.
+    
+    One ``LogScanner`` per chain follows blocks and pulls every ERC-20
+    ``Transfer`` and V2/V3 ``Swap`` log in bulk; a ``WalletTracker`` matches
+    them against the trader database's tracked addresses and each decoded
+    trade becomes a signal within the scan of its block.
+    """
+    
+    def __init__(
+        self,
+        trader_db: TraderDatabase,
+        chains: Optional[List[str]] = None,
+        pool: Optional[Any] = None,
+        store: Optional[Any] = None,
+        caller: Optional[Any] = None,
+    ) -> None:
+        """
+        Initialize signal detector.
+        
+        Args:
+            trader_db: Trader database providing tracked addresses
+            chains: Chains to follow
+            pool: RPC pool for the log scanners (defaults to the global pool)
+            store: Scanner cursor store (defaults to the data directory)
+            caller: Contract reader for token decimals (defaults to the global caller)
+        """
         self.trader_db = trader_db
         self.settings = get_settings()
+        self.caller = caller or contract_caller
+        self._token_decimals: Dict[Tuple[str, str], int] = {}
         self._monitoring_active = False
         self._monitoring_task: Optional[asyncio.Task] = None
+        
+        self.trackers: Dict[str, WalletTracker] = {}
+        self.scanners: Dict[str, LogScanner] = {}
+        for chain in chains or COPYTRADE_CHAINS:
+            tracker = WalletTracker(chain, trader_db.tracked_addresses, on_trades=self._on_trades)
+            self.trackers[chain] = tracker
+            self.scanners[chain] = LogScanner(
+                chain,
+                addresses=[],  # Tracked traders are matched locally, not by the node
+                topics=list(TRACKED_TOPICS),
+                on_logs=tracker.process_logs,
+                name="copytrade",
+                pool=pool,
+                store=store,
+                max_chunk_blocks=COPYTRADE_MAX_CHUNK_BLOCKS,
+                max_backfill_blocks=COPYTRADE_MAX_BACKFILL_BLOCKS,
+            )
     
     async def start_monitoring(self) -> None:
         """Start monitoring for copy trade signals."""
@@ -272,40 +343,74 @@ class SignalDetector:
                 await asyncio.sleep(5)
     
     async def _scan_for_signals(self) -> None:
-        """Scan for new copy trade signals."""
-        # In a real implementation, this would:
-        # 1. Monitor mempool for transactions from tracked traders
-        # 2. Parse transaction data to extract trade information
-        # 3. Calculate confidence scores based on trader history
-        # 4. Generate signals for qualified trades
-        
-        # For demonstration, we'll generate sample signals
-        import random
-        import time
+        """Follow each chain's new blocks for tracked traders' swaps."""
+        if not len(self.trader_db.tracked_addresses):
+            return
         
-        if random.random() < 0.1:  # 10% chance of signal per scan
-            trader_address = f"0x{''.join(random.choices('0123456789abcdef', k=40))}"
+        results = await asyncio.gather(
+            *[scanner.scan_once() for scanner in self.scanners.values()],
+            return_exceptions=True,
+        )
+        for chain, result in zip(self.scanners, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Copy trade log scan failed on {chain}: {result}")
+    
+    async def _on_trades(self, trades: List[TrackedTrade]) -> None:
+        """Turn one block's tracked trades into signals."""
+        # One decimals lookup per token in the block, run concurrently
+        tokens = list({(trade.chain, trade.token_address) for trade in trades})
+        decimals_by_token = dict(zip(tokens, await asyncio.gather(
+            *[self._get_token_decimals(chain, token_address) for chain, token_address in tokens]
+        )))
+        
+        for trade in trades:
+            native_amount = Decimal(trade.native_amount) / NATIVE_UNIT
             
-            # Ensure trader exists in database
-            await self.trader_db.add_trader(trader_address)
+            price = None
+            decimals = decimals_by_token[(trade.chain, trade.token_address)]
+            if decimals is not None and trade.token_amount:
+                price = native_amount / (Decimal(trade.token_amount) / Decimal(10) ** decimals)
+            
+            if trade.dex_version == "v3":
+                dex = V3_DEX_NAMES.get(trade.chain, "uniswap_v3")
+            else:
+                dex = V2_DEX_NAMES.get(trade.chain, "uniswap_v2")
             
             signal = CopyTradeSignal(
-                signal_id=f"signal_{int(time.time())}_{random.randint(1000, 9999)}",
-                trader_address=trader_address,
-                token_address=f"0x{''.join(random.choices('0123456789abcdef', k=40))}",
-                token_symbol=random.choice(["PEPE", "DOGE", "SHIB", "FLOKI", "BONK"]),
-                trade_type=random.choice(["buy", "sell"]),
-                amount=Decimal(str(random.uniform(100, 5000))),
-                price=Decimal(str(random.uniform(0.001, 1.0))),
-                timestamp=datetime.utcnow(),
-                chain=random.choice(["ethereum", "bsc", "polygon", "base"]),
-                dex=random.choice(["uniswap_v3", "pancakeswap", "quickswap"]),
-                confidence_score=Decimal(str(random.uniform(0.5, 0.95))),
-                risk_score=Decimal(str(random.uniform(3, 8)))
+                signal_id=f"{trade.chain}:{trade.tx_hash}:{trade.log_index}",
+                trader_address=trade.trader_address,
+                token_address=trade.token_address,
+                token_symbol=f"{trade.token_address[:6]}...{trade.token_address[-4:]}",
+                trade_type=trade.side,
+                amount=native_amount,
+                price=price,
+                timestamp=trade.timestamp,
+                chain=trade.chain,
+                dex=dex,
+                tx_hash=trade.tx_hash,
+                block_number=trade.block_number,
             )
             
-            self.trader_db.add_signal(signal)
-            logger.info(f"Detected copy trade signal: {signal.token_symbol} {signal.trade_type} from {signal.trader_address[:8]}...")
+            if self.trader_db.add_signal(signal):
+                logger.info(f"Detected copy trade signal: {signal.token_symbol} {signal.trade_type} from {signal.trader_address[:8]}...")
+    
+    async def _get_token_decimals(self, chain: str, token_address: str) -> Optional[int]:
+        """ERC-20 decimals, cached per token; None if the read fails (retried next time)."""
+        key = (chain, token_address)
+        if key not in self._token_decimals:
+            try:
+                self._token_decimals[key] = await self.caller.decimals(chain, token_address)
+            except Exception as e:
+                logger.debug(f"Decimals lookup failed for {token_address} on {chain}: {e}")
+                return None
+        return self._token_decimals[key]
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get per-chain matching and scanner statistics."""
+        return {
+            chain: {**tracker.get_stats(), "scanner": self.scanners[chain].get_stats()}
+            for chain, tracker in self.trackers.items()
+        }
 
 
 class CopyTradeExecutor:
@@ -396,19 +501,43 @@ class CopyTradeExecutor:
         """Process recent signals for copy trading opportunities."""
         # Get recent unprocessed signals
         recent_signals = [s for s in list(self.trader_db.recent_signals)[-100:] if not s.processed]
+        if not recent_signals:
+            return
+        
+        # Signals are in native units; one GBP quote per chain for the batch
+        chains = list({signal.chain for signal in recent_signals})
+        native_prices_gbp = dict(zip(chains, await asyncio.gather(
+            *[self._get_native_price_gbp(chain) for chain in chains]
+        )))
         
         for signal in recent_signals:
-            for user_id, config in self.user_configs.items():
-                if config.enabled and config.mode != CopyMode.SIGNAL_ONLY:
-                    if await self._should_copy_signal(signal, config):
-                        await self._queue_copy_trade(user_id, signal, config)
+            native_price_gbp = native_prices_gbp[signal.chain]
+            if native_price_gbp is None:
+                logger.warning(f"No GBP price for {signal.chain}; not copying signal {signal.signal_id}")
+            else:
+                for user_id, config in self.user_configs.items():
+                    if config.enabled and config.mode != CopyMode.SIGNAL_ONLY:
+                        if await self._should_copy_signal(signal, config):
+                            await self._queue_copy_trade(user_id, signal, config, native_price_gbp)
             
             signal.processed = True
     
+    async def _get_native_price_gbp(self, chain: str) -> Optional[Decimal]:
+        """Native currency price in GBP from the pricing service, or None if unavailable."""
+        if self.pricing_service is None:
+            return None
+        try:
+            return await self.pricing_service.get_native_token_price_gbp(chain)
+        except Exception as e:
+            logger.debug(f"GBP price lookup failed on {chain}: {e}")
+            return None
+    
     async def _should_copy_signal(self, signal: CopyTradeSignal, config: CopyTradeConfig) -> bool:
         """Determine if a signal should be copied based on configuration."""
         # Check if trader is in followed list
-        if config.followed_traders and signal.trader_address not in config.followed_traders:
+        if config.followed_traders and signal.trader_address not in {
+            trader.lower() for trader in config.followed_traders
+        }:
             return False
         
         # Check confidence and risk scores
@@ -423,7 +552,9 @@ class CopyTradeExecutor:
             return False
         
         # Check token blocklist
-        if signal.token_symbol in config.blocked_tokens:
+        if signal.token_symbol in config.blocked_tokens or signal.token_address in {
+            token.lower() for token in config.blocked_tokens
+        }:
             return False
         
         # Check trader metrics
@@ -441,10 +572,11 @@ class CopyTradeExecutor:
         self, 
         user_id: int, 
         signal: CopyTradeSignal, 
-        config: CopyTradeConfig
+        config: CopyTradeConfig,
+        native_price_gbp: Decimal
     ) -> None:
-        """Queue a copy trade for execution."""
-        copy_amount = await self._calculate_copy_amount(signal, config)
+        """Queue a copy trade for execution, converting the signal to GBP."""
+        copy_amount = await self._calculate_copy_amount(signal, config, native_price_gbp)
         
         if copy_amount <= 0:
             return
@@ -458,25 +590,33 @@ class CopyTradeExecutor:
             "user_id": user_id,
             "signal": signal,
             "config": config,
-            "copy_amount": copy_amount
+            "copy_amount": copy_amount,
+            "price_gbp": signal.price * native_price_gbp if signal.price else None
         }
         
         await self.execution_queue.put(copy_trade)
         logger.info(f"Queued copy trade for user {user_id}: {signal.token_symbol} - {copy_amount} GBP")
     
-    async def _calculate_copy_amount(self, signal: CopyTradeSignal, config: CopyTradeConfig) -> Decimal:
-        """Calculate the amount to copy for a signal."""
+    async def _calculate_copy_amount(
+        self,
+        signal: CopyTradeSignal,
+        config: CopyTradeConfig,
+        native_price_gbp: Decimal
+    ) -> Decimal:
+        """Calculate the GBP amount to copy for a signal."""
+        signal_amount_gbp = signal.amount * native_price_gbp
+        
         if config.mode == CopyMode.FIXED_AMOUNT:
             return min(config.max_copy_amount_gbp, config.max_daily_copy_amount_gbp)
         
         elif config.mode == CopyMode.MIRROR:
             # Mirror the percentage of trader's portfolio
             # This would require knowing the trader's total portfolio value
-            return min(config.max_copy_amount_gbp, signal.amount * Decimal("0.1"))  # 10% mirror
+            return min(config.max_copy_amount_gbp, signal_amount_gbp * Decimal("0.1"))  # 10% mirror
         
         elif config.mode == CopyMode.SCALED:
             # Scale based on user's portfolio size vs trader's portfolio size
-            return min(config.max_copy_amount_gbp, signal.amount * Decimal("0.05"))  # 5% scale
+            return min(config.max_copy_amount_gbp, signal_amount_gbp * Decimal("0.05"))  # 5% scale
         
         return Decimal("0")
     
@@ -496,6 +636,11 @@ class CopyTradeExecutor:
             signal = copy_trade["signal"]
             config = copy_trade["config"]
             copy_amount = copy_trade["copy_amount"]
+            price_gbp = copy_trade["price_gbp"]
+            
+            if not price_gbp:
+                logger.warning(f"Skipping copy trade for user {user_id}: no token price for {signal.token_address}")
+                return
             
             # In a real implementation, this would:
             # 1. Get user's wallet and check balances
@@ -526,7 +671,7 @@ class CopyTradeExecutor:
             if signal.trade_type == "buy":
                 # Add to position
                 old_total = position["amount"] * position["avg_price"]
-                new_amount = copy_amount / signal.price
+                new_amount = copy_amount / price_gbp
                 new_total = old_total + copy_amount
                 
                 position["amount"] += new_amount
@@ -535,7 +680,7 @@ class CopyTradeExecutor:
             
             elif signal.trade_type == "sell" and position["amount"] > 0:
                 # Reduce position
-                sell_amount = min(position["amount"], copy_amount / signal.price)
+                sell_amount = min(position["amount"], copy_amount / price_gbp)
                 position["amount"] -= sell_amount
                 
                 if position["amount"] <= Decimal("0.001"):  # Close position if very small
@@ -603,6 +748,8 @@ class CopyTradeManager:
     
     async def set_user_config(self, user_id: int, config: CopyTradeConfig) -> None:
         """Set copy trading configuration for a user."""
+        for trader_address in config.followed_traders:
+            await self.trader_db.add_trader(trader_address)
         await self.executor.set_user_config(user_id, config)
     
     async def get_user_config(self, user_id: int) -> Optional[CopyTradeConfig]:
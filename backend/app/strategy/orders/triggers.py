@@ -3,18 +3,27 @@ Order trigger monitoring system for DEX Sniper Pro.
 
 This module implements real-time price monitoring and trigger detection
 for advanced orders (stop-loss, take-profit, DCA, bracket, trailing stop).
+
+Active orders are loaded once at start and kept in per-pair trigger books
+(see ``app.strategy.trigger_book``) that follow repository change
+notifications. Ticks from the price bus fire crossed orders with a range
+query; DCA orders wait in a heap keyed by their next due time.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, List, Optional, Set, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from datetime import datetime, timezone
 
 from backend.app.storage.models import AdvancedOrder, OrderStatus, OrderType, Position
+from backend.app.services.price_bus import PriceTick, PriceTickBus, normalize_address, price_bus
 from backend.app.storage.repos import AdvancedOrderRepository, PositionRepository
+from backend.app.strategy.trigger_book import PairKey, TriggerBookIndex, TriggerDirection, TriggerHit
 
 # Use TYPE_CHECKING to avoid circular imports
 if TYPE_CHECKING:
@@ -22,6 +31,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Parameter names differ between order writers; first present key wins
+STOP_PRICE_KEYS = ("stop_price", "stop_loss_price")
+TARGET_PRICE_KEYS = ("target_price", "take_profit_price")
+TRAIL_PERCENT_KEYS = ("trail_percent", "trailing_distance")
+
+# Failed executions are retried with exponential backoff, then marked failed
+MAX_EXECUTION_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 5.0
+
 
 class OrderTriggerError(Exception):
     """Exception raised when order trigger processing fails."""
@@ -32,14 +50,16 @@ class OrderTriggerMonitor:
     """
     Monitors active orders and executes them when trigger conditions are met.
     
-    This class continuously monitors price feeds for all active advanced orders
-    and executes trades when trigger conditions (price thresholds) are satisfied.
-    Integrates with the existing trading engine for order execution.
+    Orders rest in in-memory trigger books keyed by (chain, pair). Price ticks
+    arrive from the price bus (or directly through ``on_price_tick``) and only
+    the orders whose thresholds were crossed are touched. The books follow the order
+    repository's change notifications, so orders are read from the database
+    once at start rather than on every check.
     
     Examples:
-        >>> monitor = OrderTriggerMonitor(order_repo, position_repo, pricing_service, executor)
+        >>> monitor = OrderTriggerMonitor(order_repo, position_repo, executor)
         >>> await monitor.start()
-        >>> # Monitor will now watch all active orders and execute when triggered
+        >>> await monitor.on_price_tick("ethereum", pair_address, Decimal("1.02"))
         >>> await monitor.stop()
     """
 
@@ -49,6 +69,9 @@ class OrderTriggerMonitor:
         position_repo: PositionRepository,
         trade_executor: TradeExecutorProtocol,
         check_interval: float = 1.0,
+        tick_bus: Optional[PriceTickBus] = None,
+        max_execution_attempts: int = MAX_EXECUTION_ATTEMPTS,
+        retry_backoff: float = RETRY_BACKOFF_SECONDS,
     ) -> None:
         """
         Initialize the order trigger monitor.
@@ -57,32 +80,61 @@ class OrderTriggerMonitor:
             order_repo: Repository for advanced order operations
             position_repo: Repository for position operations
             trade_executor: Service for executing trades
-            check_interval: How often to check triggers (seconds)
+            check_interval: How often to check DCA schedules (seconds)
+            tick_bus: Price tick bus to consume (default: global bus)
+            max_execution_attempts: Failed executions before an order is marked failed
+            retry_backoff: Seconds before the first retry; doubles per failed attempt
         """
         self.order_repo = order_repo
         self.position_repo = position_repo
         self.trade_executor = trade_executor
         self.check_interval = check_interval
+        self.tick_bus = tick_bus or price_bus
+        self.max_execution_attempts = max_execution_attempts
+        self.retry_backoff = retry_backoff
         
         self._monitoring_task: Optional[asyncio.Task] = None
         self._shutdown_event = asyncio.Event()
         self._active_orders: Dict[str, AdvancedOrder] = {}
-        self._price_cache: Dict[str, Decimal] = {}
+        self._price_cache: Dict[PairKey, Decimal] = {}
+        
+        self._book = TriggerBookIndex()
+        # Trailing stops without a recorded high wait for their pair's first tick
+        self._unanchored: Dict[PairKey, Dict[str, Decimal]] = {}
+        # (due timestamp, order_id); stale entries are skipped via _dca_due_at
+        self._dca_heap: List[Tuple[float, str]] = []
+        self._dca_due_at: Dict[str, float] = {}
+        # Orders whose execution failed: attempts so far, and (retry time, order) while backing off
+        self._execution_attempts: Dict[str, int] = {}
+        self._backoff: Dict[str, Tuple[float, AdvancedOrder]] = {}
+        
+        self._ticks_processed = 0
+        self._orders_triggered = 0
+        self._last_tick_ms = 0.0
+        self._max_tick_ms = 0.0
         
         logger.info(f"OrderTriggerMonitor initialized with {check_interval}s check interval")
 
     async def start(self) -> None:
-        """Start the order trigger monitoring loop."""
+        """Load active orders, subscribe to changes and start the polling loop."""
         if self._monitoring_task is not None:
             logger.warning("Order trigger monitor already running")
             return
         
         logger.info("Starting order trigger monitor")
         self._shutdown_event.clear()
+        self.order_repo.add_change_listener(self._on_order_change)
+        await self._load_active_orders()
+        # Thresholds are USD prices, so quote-denominated ticks are not applied
+        self.tick_bus.subscribe(
+            "order_triggers",
+            self._on_bus_tick,
+            accept=lambda tick: tick.price_usd is not None,
+        )
         self._monitoring_task = asyncio.create_task(self._monitoring_loop())
 
     async def stop(self) -> None:
-        """Stop the order trigger monitoring loop."""
+        """Stop the monitoring loop and persist ratcheted trailing highs."""
         if self._monitoring_task is None:
             logger.warning("Order trigger monitor not running")
             return
@@ -97,18 +149,54 @@ class OrderTriggerMonitor:
             self._monitoring_task.cancel()
         
         self._monitoring_task = None
+        await self.tick_bus.unsubscribe("order_triggers")
+        self.order_repo.remove_change_listener(self._on_order_change)
+        await self._persist_trailing_highs()
         logger.info("Order trigger monitor stopped")
 
+    async def on_price_tick(self, chain: str, pair_address: str, price: Decimal) -> List[TriggerHit]:
+        """
+        Apply a price tick for a pair and execute every order it triggers.
+        
+        Parameters:
+            chain: Blockchain name
+            pair_address: Pair (or token) address the orders rest on
+            price: Latest price
+            
+        Returns:
+            Triggers fired by this tick
+        """
+        pair = (chain, normalize_address(pair_address))
+        self._price_cache[pair] = price
+        
+        started = time.perf_counter()
+        if pair in self._unanchored:
+            self._anchor_trailing(pair, price)
+        hits = self._book.match(pair, price)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        
+        self._ticks_processed += 1
+        self._last_tick_ms = elapsed_ms
+        self._max_tick_ms = max(self._max_tick_ms, elapsed_ms)
+        
+        for hit in hits:
+            order = self._active_orders.pop(hit.order_id, None)
+            if order is None:
+                continue
+            self._orders_triggered += 1
+            logger.info(
+                f"Order {hit.order_id} triggered ({hit.leg}): price {price} crossed {hit.level}"
+            )
+            await self._execute_triggered_order(order, price)
+        
+        return hits
+
     async def _monitoring_loop(self) -> None:
-        """Main monitoring loop that checks triggers continuously."""
+        """Run due DCA orders on a fixed interval; price triggers are tick-driven."""
         logger.info("Order trigger monitoring loop started")
         
         while not self._shutdown_event.is_set():
             try:
-                # Load active orders
-                await self._load_active_orders()
-                
-                # Check triggers for all active orders
                 await self._check_all_triggers()
                 
                 # Wait for next check interval
@@ -122,266 +210,294 @@ class OrderTriggerMonitor:
         logger.info("Order trigger monitoring loop stopped")
 
     async def _load_active_orders(self) -> None:
-        """Load all active orders that need monitoring."""
+        """Rebuild the trigger books from every active order in the repository."""
         try:
             active_orders = await self.order_repo.get_active_orders()
-            
-            # Update active orders dict
-            self._active_orders = {order.id: order for order in active_orders}
-            
-            logger.debug(f"Loaded {len(self._active_orders)} active orders for monitoring")
-            
         except Exception as e:
             logger.error(f"Failed to load active orders: {e}")
             raise OrderTriggerError(f"Failed to load active orders: {e}")
-
-    async def _check_all_triggers(self) -> None:
-        """Check trigger conditions for all active orders."""
-        if not self._active_orders:
-            return
         
-        # Get unique token pairs to minimize price API calls
-        token_pairs = set()
-        for order in self._active_orders.values():
-            pair_key = f"{order.base_token}_{order.quote_token}_{order.chain}"
-            token_pairs.add(pair_key)
+        self._active_orders = {}
+        self._book = TriggerBookIndex()
+        self._unanchored = {}
+        self._dca_heap = []
+        self._dca_due_at = {}
+        self._backoff = {}
         
-        # Update price cache for all required pairs
-        await self._update_price_cache(token_pairs)
+        for order in active_orders:
+            self._index_order(order)
         
-        # Check each order's trigger condition
-        for order_id, order in self._active_orders.items():
-            try:
-                await self._check_order_trigger(order)
-            except Exception as e:
-                logger.error(f"Failed to check trigger for order {order_id}: {e}")
-                # Continue checking other orders
+        logger.debug(
+            f"Loaded {len(self._active_orders)} active orders for monitoring "
+            f"({len(self._book)} resting triggers)"
+        )
 
-    async def _update_price_cache(self, token_pairs: Set[str]) -> None:
-        """Update price cache for required token pairs."""
-        for pair_key in token_pairs:
-            try:
-                base_token, quote_token, chain = pair_key.split('_')
-                # TODO: Implement actual price fetching service
-                # For now, use mock price - replace with real pricing service
-                price = Decimal('100.0')  # Mock price
-                self._price_cache[pair_key] = price
-                
-            except Exception as e:
-                logger.warning(f"Failed to get price for {pair_key}: {e}")
-                # Keep existing price in cache if available
+    async def _check_all_triggers(self) -> None:
+        """Release backed-off retries, run due DCA orders and replay the latest bus price."""
+        self._release_backoff()
+        await self._check_due_dca()
+        
+        for chain, pair_address in set(self._book.pairs()) | set(self._unanchored):
+            tick = self.tick_bus.latest(chain, pair_address)
+            if tick is not None and tick.price_usd is not None:
+                await self.on_price_tick(chain, pair_address, tick.price_usd)
 
-    async def _check_order_trigger(self, order: AdvancedOrder) -> None:
-        """Check if a specific order should trigger and execute if so."""
-        pair_key = f"{order.base_token}_{order.quote_token}_{order.chain}"
-        current_price = self._price_cache.get(pair_key)
-        
-        if current_price is None:
-            logger.warning(f"No price available for order {order.id} pair {pair_key}")
+    async def _on_bus_tick(self, tick: PriceTick) -> None:
+        """Price bus handler: apply a tick to its pair and to its token."""
+        price = tick.price_usd
+        # Orders without a pair address rest on their token
+        for address in {tick.pair_address, tick.token_address}:
+            if address and self._is_watched((tick.chain, address)):
+                await self.on_price_tick(tick.chain, address, price)
+
+    def _is_watched(self, pair: PairKey) -> bool:
+        """Whether any order is waiting on ticks for a pair."""
+        return self._book.book(pair) is not None or pair in self._unanchored
+
+    async def _check_due_dca(self) -> None:
+        """Execute DCA orders whose purchase interval has elapsed."""
+        now = time.time()
+        while self._dca_heap and self._dca_heap[0][0] <= now:
+            due_at, order_id = heapq.heappop(self._dca_heap)
+            if self._dca_due_at.get(order_id) != due_at:
+                continue
+            del self._dca_due_at[order_id]
+            
+            order = self._active_orders.pop(order_id, None)
+            if order is None:
+                continue
+            
+            self._orders_triggered += 1
+            logger.info(f"DCA order {order_id} triggered: purchase interval elapsed")
+            chain, pair_address = self._pair_key(order)
+            tick = self.tick_bus.latest(chain, pair_address)
+            price = tick.price_usd if tick is not None and tick.price_usd is not None else Decimal('0')
+            await self._execute_triggered_order(order, price)
+
+    def _on_order_change(self, event: str, order: AdvancedOrder) -> None:
+        """Repository change listener: re-index the order from its committed state."""
+        self._index_order(order)
+
+    def _index_order(self, order: AdvancedOrder) -> None:
+        """Place an order in (or drop it from) the trigger books."""
+        order_id = order.order_id
+        self._unindex_order(order_id)
+        
+        status = _enum_value(order.status)
+        if status != OrderStatus.ACTIVE.value:
+            # TRIGGERED is the in-flight execution; attempts carry over to its retry
+            if status != OrderStatus.TRIGGERED.value:
+                self._backoff.pop(order_id, None)
+                self._execution_attempts.pop(order_id, None)
             return
         
-        # Check trigger condition based on order type
-        should_trigger = False
-        
-        if order.order_type == OrderType.STOP_LOSS:
-            should_trigger = await self._check_stop_loss_trigger(order, current_price)
-        elif order.order_type == OrderType.TAKE_PROFIT:
-            should_trigger = await self._check_take_profit_trigger(order, current_price)
-        elif order.order_type == OrderType.DCA:
-            should_trigger = await self._check_dca_trigger(order, current_price)
-        elif order.order_type == OrderType.BRACKET:
-            should_trigger = await self._check_bracket_trigger(order, current_price)
-        elif order.order_type == OrderType.TRAILING_STOP:
-            should_trigger = await self._check_trailing_stop_trigger(order, current_price)
+        backoff = self._backoff.get(order_id)
+        if backoff is not None and backoff[0] > time.time():
+            # Held out of the books until the retry time; keep the latest state
+            self._backoff[order_id] = (backoff[0], order)
+            return
+        self._backoff.pop(order_id, None)
+        
+        order_type = _enum_value(order.order_type)
+        pair = self._pair_key(order)
+        parameters = order.parameters or {}
+        
+        if order_type == OrderType.DCA.value:
+            self._schedule_dca(order)
+        elif order_type == OrderType.TRAILING_STOP.value:
+            trail_percent = _first_decimal(parameters, TRAIL_PERCENT_KEYS)
+            if trail_percent is None:
+                logger.error(f"Trailing stop order {order_id} missing trail_percent parameter")
+                return
+            highest_price = _first_decimal(parameters, ("highest_price",))
+            if highest_price is None:
+                # First tick for the pair becomes the initial high
+                self._unanchored.setdefault(pair, {})[order_id] = trail_percent
+            else:
+                self._book.add_trailing(pair, order_id, trail_percent, highest_price)
+        else:
+            levels = self._trigger_levels(order, order_type, parameters)
+            if not levels:
+                return
+            self._book.add_levels(pair, order_id, levels)
         
-        if should_trigger:
-            await self._execute_triggered_order(order, current_price)
+        self._active_orders[order_id] = order
 
-    async def _check_stop_loss_trigger(self, order: AdvancedOrder, current_price: Decimal) -> bool:
-        """Check if stop-loss order should trigger."""
-        trigger_price = order.parameters.get('stop_price')
-        if trigger_price is None:
-            logger.error(f"Stop-loss order {order.id} missing stop_price parameter")
-            return False
-        
-        trigger_price = Decimal(str(trigger_price))
-        
-        # Stop-loss triggers when price falls below stop price
-        triggered = current_price <= trigger_price
-        
-        if triggered:
-            logger.info(f"Stop-loss order {order.id} triggered: price {current_price} <= stop {trigger_price}")
-        
-        return triggered
+    def _release_backoff(self) -> None:
+        """Put orders whose retry backoff has elapsed back in the books."""
+        now = time.time()
+        due = [order for retry_at, order in self._backoff.values() if retry_at <= now]
+        for order in due:
+            self._backoff.pop(order.order_id, None)
+            self._index_order(order)
 
-    async def _check_take_profit_trigger(self, order: AdvancedOrder, current_price: Decimal) -> bool:
-        """Check if take-profit order should trigger."""
-        trigger_price = order.parameters.get('target_price')
-        if trigger_price is None:
-            logger.error(f"Take-profit order {order.id} missing target_price parameter")
-            return False
-        
-        trigger_price = Decimal(str(trigger_price))
-        
-        # Take-profit triggers when price rises above target price
-        triggered = current_price >= trigger_price
-        
-        if triggered:
-            logger.info(f"Take-profit order {order.id} triggered: price {current_price} >= target {trigger_price}")
-        
-        return triggered
+    def _unindex_order(self, order_id: str) -> None:
+        """Forget an order everywhere; the DCA heap entry is dropped lazily."""
+        self._active_orders.pop(order_id, None)
+        self._book.remove(order_id)
+        self._dca_due_at.pop(order_id, None)
+        for pair, waiting in list(self._unanchored.items()):
+            if waiting.pop(order_id, None) is not None and not waiting:
+                del self._unanchored[pair]
 
-    async def _check_dca_trigger(self, order: AdvancedOrder, current_price: Decimal) -> bool:
-        """Check if DCA order should execute next purchase."""
-        interval_hours = order.parameters.get('interval_hours', 24)
-        last_execution = order.last_execution_at or order.created_at
-        
-        # Check if enough time has passed since last execution
-        time_since_last = datetime.now(timezone.utc) - last_execution
-        hours_passed = time_since_last.total_seconds() / 3600
-        
-        triggered = hours_passed >= interval_hours
-        
-        if triggered:
-            logger.info(f"DCA order {order.id} triggered: {hours_passed:.1f}h >= {interval_hours}h interval")
-        
-        return triggered
+    def _trigger_levels(
+        self,
+        order: AdvancedOrder,
+        order_type: str,
+        parameters: Dict[str, Any],
+    ) -> List[Tuple[str, TriggerDirection, Decimal]]:
+        """Translate a price-triggered order into book levels."""
+        # Sell-side stops fire on the way down and targets on the way up; buy side is mirrored
+        is_buy = getattr(order, "side", None) == "buy"
+        stop_direction = TriggerDirection.ABOVE if is_buy else TriggerDirection.BELOW
+        target_direction = TriggerDirection.BELOW if is_buy else TriggerDirection.ABOVE
+        
+        if order_type == OrderType.STOP_LOSS.value:
+            stop_price = _first_decimal(parameters, STOP_PRICE_KEYS)
+            if stop_price is None:
+                logger.error(f"Stop-loss order {order.order_id} missing stop_price parameter")
+                return []
+            return [("stop_loss", stop_direction, stop_price)]
+        
+        if order_type == OrderType.TAKE_PROFIT.value:
+            target_price = _first_decimal(parameters, TARGET_PRICE_KEYS)
+            if target_price is None:
+                logger.error(f"Take-profit order {order.order_id} missing target_price parameter")
+                return []
+            return [("take_profit", target_direction, target_price)]
+        
+        if order_type == OrderType.BRACKET.value:
+            stop_price = _first_decimal(parameters, STOP_PRICE_KEYS)
+            target_price = _first_decimal(parameters, TARGET_PRICE_KEYS)
+            if stop_price is None or target_price is None:
+                logger.error(f"Bracket order {order.order_id} missing stop_price or target_price")
+                return []
+            return [
+                ("stop_loss", stop_direction, stop_price),
+                ("take_profit", target_direction, target_price),
+            ]
+        
+        return []
 
-    async def _check_bracket_trigger(self, order: AdvancedOrder, current_price: Decimal) -> bool:
-        """Check if bracket order should trigger (either stop-loss or take-profit)."""
-        stop_price = order.parameters.get('stop_price')
-        target_price = order.parameters.get('target_price')
-        
-        if stop_price is None or target_price is None:
-            logger.error(f"Bracket order {order.id} missing stop_price or target_price")
-            return False
-        
-        stop_price = Decimal(str(stop_price))
-        target_price = Decimal(str(target_price))
-        
-        # Bracket triggers on either stop-loss or take-profit condition
-        stop_triggered = current_price <= stop_price
-        profit_triggered = current_price >= target_price
-        
-        triggered = stop_triggered or profit_triggered
-        
-        if triggered:
-            trigger_type = "stop-loss" if stop_triggered else "take-profit"
-            logger.info(f"Bracket order {order.id} triggered on {trigger_type}: price {current_price}")
-        
-        return triggered
+    def _schedule_dca(self, order: AdvancedOrder) -> None:
+        """Push a DCA order's next purchase time onto the due heap."""
+        interval_hours = float((order.parameters or {}).get('interval_hours', 24))
+        last_execution = getattr(order, "last_execution_at", None) or order.created_at or datetime.now(timezone.utc)
+        if last_execution.tzinfo is None:
+            # Stored timestamps are naive UTC
+            last_execution = last_execution.replace(tzinfo=timezone.utc)
+        
+        due_at = last_execution.timestamp() + interval_hours * 3600
+        self._dca_due_at[order.order_id] = due_at
+        heapq.heappush(self._dca_heap, (due_at, order.order_id))
 
-    async def _check_trailing_stop_trigger(self, order: AdvancedOrder, current_price: Decimal) -> bool:
-        """Check if trailing stop order should trigger."""
-        trail_percent = order.parameters.get('trail_percent')
-        if trail_percent is None:
-            logger.error(f"Trailing stop order {order.id} missing trail_percent parameter")
-            return False
-        
-        trail_percent = Decimal(str(trail_percent))
-        
-        # Get or initialize highest price seen
-        highest_price = order.parameters.get('highest_price')
-        if highest_price is None:
-            # First check - set current price as highest
-            order.parameters['highest_price'] = str(current_price)
-            await self.order_repo.update_order(order.id, {'parameters': order.parameters})
-            return False
-        
-        highest_price = Decimal(str(highest_price))
-        
-        # Update highest price if current price is higher
-        if current_price > highest_price:
-            order.parameters['highest_price'] = str(current_price)
-            await self.order_repo.update_order(order.id, {'parameters': order.parameters})
-            highest_price = current_price
-        
-        # Calculate trailing stop price
-        trail_amount = highest_price * (trail_percent / Decimal('100'))
-        stop_price = highest_price - trail_amount
-        
-        triggered = current_price <= stop_price
-        
-        if triggered:
-            logger.info(f"Trailing stop order {order.id} triggered: price {current_price} <= stop {stop_price} (trail: {trail_percent}%)")
-        
-        return triggered
+    def _anchor_trailing(self, pair: PairKey, price: Decimal) -> None:
+        """Rest trailing stops that were waiting for a first price."""
+        for order_id, trail_percent in self._unanchored.pop(pair, {}).items():
+            self._book.add_trailing(pair, order_id, trail_percent, price)
+
+    async def _persist_trailing_highs(self) -> None:
+        """Write in-memory trailing highs back so a restart resumes from them."""
+        for order_id, order in list(self._active_orders.items()):
+            if _enum_value(order.order_type) != OrderType.TRAILING_STOP.value:
+                continue
+            highest_price = self._book.trailing_high(order_id)
+            if highest_price is None:
+                continue
+            try:
+                await self.order_repo.update_order_parameters(order_id, {'highest_price': str(highest_price)})
+            except Exception as e:
+                logger.warning(f"Failed to persist trailing high for order {order_id}: {e}")
+
+    @staticmethod
+    def _pair_key(order: AdvancedOrder) -> PairKey:
+        """Book key for an order: its pair address, falling back to the token address."""
+        pair_address = getattr(order, "pair_address", None) or order.token_address
+        return order.chain, normalize_address(pair_address)
 
     async def _execute_triggered_order(self, order: AdvancedOrder, trigger_price: Decimal) -> None:
-        """Execute an order that has been triggered."""
+        """
+        Execute an order that has been triggered.
+        
+        The order has already left the books; if execution fails it is
+        retried after a backoff, up to ``max_execution_attempts`` times.
+        """
         try:
-            logger.info(f"Executing triggered order {order.id} at price {trigger_price}")
+            logger.info(f"Executing triggered order {order.order_id} at price {trigger_price}")
             
             # Mark order as triggered
-            await self.order_repo.update_order(
-                order.id, 
-                {
-                    'status': OrderStatus.TRIGGERED,
-                    'triggered_at': datetime.now(timezone.utc),
-                    'trigger_price': trigger_price
-                }
-            )
+            await self.order_repo.update_order_status(order.order_id, OrderStatus.TRIGGERED)
+            
+            trade_result = await self._submit_trade(order, trigger_price)
             
-            # Execute the trade through trade executor
-            # TODO: Implement actual trade execution method in TradeExecutor
-            # For now, create a mock trade result
-            from types import SimpleNamespace
-            trade_result = SimpleNamespace(
-                success=True,
-                execution_price=trigger_price,
-                tx_hash="0x" + "1" * 64,  # Mock transaction hash
-                error_message=None
+            if not trade_result.success:
+                logger.error(f"Failed to execute order {order.order_id}: {trade_result.error_message}")
+                await self._handle_failed_execution(order, trade_result.error_message or "execution failed")
+                return
+            
+            self._execution_attempts.pop(order.order_id, None)
+            
+            # Mark order as filled
+            await self.order_repo.update_order_status(
+                order.order_id, OrderStatus.FILLED, tx_hash=trade_result.tx_hash
             )
             
-            if trade_result.success:
-                # Mark order as completed
-                await self.order_repo.update_order(
-                    order.id,
-                    {
-                        'status': OrderStatus.COMPLETED,
-                        'executed_at': datetime.now(timezone.utc),
-                        'execution_price': trade_result.execution_price,
-                        'execution_tx_hash': trade_result.tx_hash
-                    }
-                )
-                
-                # Update position if this was a position-closing order
-                if order.position_id:
-                    await self._update_position_from_execution(order, trade_result)
-                
-                logger.info(f"Successfully executed order {order.id} - tx: {trade_result.tx_hash}")
-                
-            else:
-                # Mark order as failed
-                await self.order_repo.update_order(
-                    order.id,
-                    {
-                        'status': OrderStatus.FAILED,
-                        'failed_at': datetime.now(timezone.utc),
-                        'failure_reason': trade_result.error_message
-                    }
-                )
-                
-                logger.error(f"Failed to execute order {order.id}: {trade_result.error_message}")
+            # Update position if this was a position-closing order
+            if order.position_id:
+                await self._update_position_from_execution(order, trade_result)
             
-            # Remove from active orders cache
-            self._active_orders.pop(order.id, None)
+            logger.info(f"Successfully executed order {order.order_id} - tx: {trade_result.tx_hash}")
             
         except Exception as e:
-            logger.error(f"Error executing triggered order {order.id}: {e}", exc_info=True)
-            
-            # Mark order as failed
+            logger.error(f"Error executing triggered order {order.order_id}: {e}", exc_info=True)
+            await self._handle_failed_execution(order, str(e))
+
+    async def _submit_trade(self, order: AdvancedOrder, trigger_price: Decimal) -> Any:
+        """Execute the trade for a triggered order."""
+        # TODO: Implement actual trade execution method in TradeExecutor
+        # For now, create a mock trade result
+        from types import SimpleNamespace
+        return SimpleNamespace(
+            success=True,
+            execution_price=trigger_price,
+            tx_hash="0x" + "1" * 64,  # Mock transaction hash
+            error_message=None
+        )
+
+    async def _handle_failed_execution(self, order: AdvancedOrder, reason: str) -> None:
+        """Schedule a retry with backoff, or mark the order failed after the last attempt."""
+        order_id = order.order_id
+        attempts = self._execution_attempts.get(order_id, 0) + 1
+        
+        if attempts >= self.max_execution_attempts:
+            self._execution_attempts.pop(order_id, None)
+            self._backoff.pop(order_id, None)
+            logger.error(f"Order {order_id} failed after {attempts} execution attempts: {reason}")
             try:
-                await self.order_repo.update_order(
-                    order.id,
-                    {
-                        'status': OrderStatus.FAILED,
-                        'failed_at': datetime.now(timezone.utc),
-                        'failure_reason': str(e)
-                    }
+                await self.order_repo.update_order_status(
+                    order_id, OrderStatus.FAILED, error_message=reason
                 )
-            except Exception as update_error:
-                logger.error(f"Failed to update failed order status: {update_error}")
+            except Exception as e:
+                logger.error(f"Failed to mark order {order_id} as failed: {e}")
+            return
+        
+        self._execution_attempts[order_id] = attempts
+        delay = self.retry_backoff * 2 ** (attempts - 1)
+        order.status = OrderStatus.ACTIVE.value
+        self._backoff[order_id] = (time.time() + delay, order)
+        logger.warning(
+            f"Order {order_id} execution attempt {attempts} failed, retrying in {delay:.0f}s: {reason}"
+        )
+        await self._restore_order(order, reason)
+
+    async def _restore_order(self, order: AdvancedOrder, reason: str) -> None:
+        """Return an order whose execution failed to active; the backoff entry re-indexes it."""
+        try:
+            await self.order_repo.update_order_status(
+                order.order_id, OrderStatus.ACTIVE, error_message=reason
+            )
+        except Exception as e:
+            logger.error(f"Failed to reactivate order {order.order_id}: {e}")
 
     async def _update_position_from_execution(self, order: AdvancedOrder, trade_result) -> None:
         """Update position when an order execution affects it."""
@@ -417,7 +533,28 @@ class OrderTriggerMonitor:
         """Get current monitoring statistics."""
         return {
             'active_orders_count': len(self._active_orders),
+            'resting_triggers_count': len(self._book),
+            'pending_dca_count': len(self._dca_due_at),
+            'backoff_orders_count': len(self._backoff),
             'cached_prices_count': len(self._price_cache),
+            'ticks_processed': self._ticks_processed,
+            'orders_triggered': self._orders_triggered,
+            'last_tick_ms': round(self._last_tick_ms, 4),
+            'max_tick_ms': round(self._max_tick_ms, 4),
             'is_running': self._monitoring_task is not None and not self._monitoring_task.done(),
             'check_interval': self.check_interval
-        }
\ No newline at end of file
+        }
+
+
+def _enum_value(value: Any) -> Any:
+    """Column value for enum-or-string model fields."""
+    return getattr(value, "value", value)
+
+
+def _first_decimal(parameters: Dict[str, Any], keys: Tuple[str, ...]) -> Optional[Decimal]:
+    """First non-null parameter among ``keys`` as a Decimal."""
+    for key in keys:
+        value = parameters.get(key)
+        if value is not None:
+            return Decimal(str(value))
+    return None
\ No newline at end of file
@@ -19,6 +19,11 @@ from datetime import datetime, timezone
 
 import logging
 from ..core.settings import settings
+from ..services.honeypot_simulator import (
+    HoneypotSimulator,
+    SimulationStatus,
+    get_honeypot_simulator,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -88,8 +93,15 @@ class RiskManager:
     risk criteria including liquidity, contract security, and market conditions.
     """
     
-    def __init__(self):
-        """Initialize risk manager."""
+    def __init__(self, honeypot_simulator: Optional[HoneypotSimulator] = None):
+        """
+        Initialize risk manager.
+        
+        Args:
+            honeypot_simulator: Buy/sell round-trip simulator (defaults to the shared one)
+        """
+        self.honeypot_simulator = honeypot_simulator or get_honeypot_simulator()
+        
         self.risk_thresholds = {
             RiskLevel.LOW: 0.25,
             RiskLevel.MEDIUM: 0.50,
@@ -328,6 +340,10 @@ class RiskManager:
         """
         Check for honeypot characteristics.
         
+        Simulates buying and then selling the token through the chain's V2
+        router in one state-override ``eth_call``; a token that can be bought
+        but not sold (or only at a near-total sell tax) is a honeypot.
+        
         Args:
             token_address: Token contract address
             chain: Blockchain network
@@ -337,35 +353,49 @@ class RiskManager:
             Risk factor for honeypot assessment
         """
         try:
-            # For now, implement basic honeypot detection
-            # In production, this would integrate with external services
-            
-            # Check for suspicious transfer restrictions
-            risk_score = 0.0
-            details = {}
-            confidence = 0.7
-            
-            # Basic simulation attempt (simplified)
-            # In production, this would perform actual token transfer simulation
-            
-            # Placeholder logic - should be replaced with actual contract analysis
-            if "honey" in token_address.lower() or "pot" in token_address.lower():
-                risk_score = 0.9
-                details["reason"] = "Suspicious token name pattern"
+            if not self.honeypot_simulator.supports_chain(chain):
+                return RiskFactor(
+                    category=RiskCategory.HONEYPOT,
+                    level=RiskLevel.LOW,
+                    score=0.0,
+                    description="Honeypot simulation not available on this chain",
+                    details={},
+                    confidence=0.3
+                )
+            
+            simulation = await self.honeypot_simulator.simulate(token_address, chain)
+            details = simulation.to_dict()
+            
+            if simulation.status is SimulationStatus.ERROR:
+                raise RuntimeError(simulation.error or "simulation failed")
+            
+            if simulation.is_honeypot:
+                risk_score = 0.95
+                confidence = 0.95
+                description = f"Honeypot: round-trip simulation ended with {simulation.status.value}"
+                if simulation.status is SimulationStatus.OK:
+                    description = f"Honeypot: sell tax of {simulation.sell_tax*100:.1f}% in simulation"
+            elif simulation.status is SimulationStatus.BUY_FAILED:
+                risk_score = 0.7
                 confidence = 0.8
+                description = "Buy reverted in simulation"
+            elif simulation.status is SimulationStatus.NO_LIQUIDITY:
+                risk_score = 0.5
+                confidence = 0.5
+                description = "No router liquidity to simulate against"
+            else:
+                risk_score = 0.0
+                confidence = 0.9
+                description = "Buy and sell round trip succeeded in simulation"
             
             if risk_score > 0.8:
                 level = RiskLevel.CRITICAL
-                description = "High probability of honeypot token"
             elif risk_score > 0.5:
                 level = RiskLevel.HIGH
-                description = "Moderate honeypot risk detected"
             elif risk_score > 0.2:
                 level = RiskLevel.MEDIUM
-                description = "Low honeypot risk detected"
             else:
                 level = RiskLevel.LOW
-                description = "No honeypot characteristics detected"
             
             return RiskFactor(
                 category=RiskCategory.HONEYPOT,
@@ -393,17 +423,37 @@ class RiskManager:
         chain: str, 
         chain_clients: Dict
     ) -> RiskFactor:
-        """Check for excessive trading taxes."""
+        """
+        Check for excessive trading taxes.
+        
+        Taxes are measured from the same round-trip simulation as the
+        honeypot check (shared, so both cost one RPC): tokens and native
+        currency actually received against the router's quotes.
+        """
         try:
-            # Simulate tax detection
-            # In production, this would analyze contract code or perform test transactions
-            
-            risk_score = 0.0
-            details = {}
-            confidence = 0.6
-            
-            # Placeholder logic for tax detection
-            # Should analyze contract for tax-related functions
+            if not self.honeypot_simulator.supports_chain(chain):
+                return RiskFactor(
+                    category=RiskCategory.TAX_EXCESSIVE,
+                    level=RiskLevel.LOW,
+                    score=0.0,
+                    description="Tax simulation not available on this chain",
+                    details={},
+                    confidence=0.3
+                )
+            
+            simulation = await self.honeypot_simulator.simulate(token_address, chain)
+            details = simulation.to_dict()
+            buy_tax, sell_tax = simulation.buy_tax, simulation.sell_tax
+            
+            if simulation.status is SimulationStatus.OK:
+                risk_score = max(buy_tax or 0.0, sell_tax or 0.0)
+                confidence = 0.95
+            elif buy_tax is not None:
+                # Sell never completed: only the buy side was measured
+                risk_score = buy_tax
+                confidence = 0.5
+            else:
+                raise RuntimeError(simulation.error or f"no taxes measured ({simulation.status.value})")
             
             if risk_score > 0.15:  # >15% tax is excessive
                 level = RiskLevel.HIGH
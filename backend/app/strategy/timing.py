@@ -8,7 +8,6 @@ market momentum, and liquidity conditions.
 from __future__ import annotations
 
 import asyncio
-import math
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple, Union, Any
 from dataclasses import dataclass, field
@@ -17,6 +16,9 @@ from enum import Enum
 import statistics
 
 import logging
+import numpy as np
+
+from ..ai import indicators
 from ..strategy.risk_manager import RiskAssessment
 from .base import StrategySignal, TriggerCondition, SignalType
 
@@ -244,22 +246,10 @@ class TechnicalAnalyzer:
         if len(prices) < 15:
             return self._create_neutral_analysis(TechnicalIndicator.RSI, timeframe)
         
-        # Calculate price changes
-        price_changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        
-        gains = [change if change > 0 else 0 for change in price_changes]
-        losses = [-change if change < 0 else 0 for change in price_changes]
-        
-        # Calculate average gains and losses (14-period default)
-        period = min(14, len(gains))
-        avg_gain = sum(gains[-period:]) / period if gains else 0
-        avg_loss = sum(losses[-period:]) / period if losses else 0
-        
-        if avg_loss == 0:
-            rsi = 100.0
-        else:
-            rs = avg_gain / avg_loss
-            rsi = 100 - (100 / (1 + rs))
+        # Average gains and losses over the last 14 changes
+        gains, losses = indicators.gain_loss_last(prices, 14)
+        avg_gain, avg_loss = float(gains[0]), float(losses[0])
+        rsi = float(indicators.rsi_from_averages(gains, losses)[0])
         
         # Generate signal based on RSI levels
         if rsi > 70:
@@ -335,24 +325,14 @@ class TechnicalAnalyzer:
         if len(prices) < 20:
             return self._create_neutral_analysis(TechnicalIndicator.BOLLINGER_BANDS, timeframe)
         
-        period = 20
-        recent_prices = prices[-period:]
-        
-        sma = sum(recent_prices) / len(recent_prices)
-        variance = sum((price - sma) ** 2 for price in recent_prices) / len(recent_prices)
-        std_dev = math.sqrt(variance)
-        
-        upper_band = sma + (2 * std_dev)
-        lower_band = sma - (2 * std_dev)
+        middle, upper, lower, position = indicators.bollinger_last(prices, period=20)
+        sma = float(middle[0])
+        upper_band = float(upper[0])
+        lower_band = float(lower[0])
+        band_position = float(position[0])
+        std_dev = (upper_band - sma) / 2
         current_price = prices[-1]
         
-        # Calculate position within bands
-        band_width = upper_band - lower_band
-        if band_width > 0:
-            band_position = (current_price - lower_band) / band_width
-        else:
-            band_position = 0.5
-        
         # Generate signal based on band position
         if band_position > 0.8:
             signal_strength = -(band_position - 0.8) / 0.2  # Near upper band (sell)
@@ -395,7 +375,7 @@ class TechnicalAnalyzer:
         if total_volume == 0:
             return self._create_neutral_analysis(TechnicalIndicator.VOLUME_PROFILE, timeframe)
         
-        vwap = sum(price * volume for price, volume in zip(prices, volumes)) / total_volume
+        vwap = float(np.dot(prices, volumes)) / total_volume
         current_price = prices[-1]
         recent_volume = sum(volumes[-5:]) if len(volumes) >= 5 else sum(volumes)
         avg_volume = total_volume / len(volumes)
@@ -489,28 +469,16 @@ class TechnicalAnalyzer:
         if len(prices) < period:
             return None
         
-        # Use SMA for initial EMA value
-        sma = sum(prices[:period]) / period
-        ema = sma
-        
-        # Calculate smoothing factor
-        smoothing = 2 / (period + 1)
-        
-        # Calculate EMA for remaining periods
-        for price in prices[period:]:
-            ema = (price * smoothing) + (ema * (1 - smoothing))
-        
-        return ema
+        # SMA-seeded EMA
+        return float(indicators.ema(prices, period, seed="sma")[0, -1])
     
     def _calculate_trend_consistency(self, prices: List[float]) -> float:
         """Calculate trend consistency (0.0 to 1.0)."""
         if len(prices) < 3:
             return 0.0
         
-        changes = [prices[i] - prices[i-1] for i in range(1, len(prices))]
-        positive_changes = sum(1 for change in changes if change > 0)
-        
-        return positive_changes / len(changes) if changes else 0.0
+        up_fraction, _ = indicators.change_fractions(prices)
+        return float(up_fraction[0])
     
     def _create_neutral_analysis(self, indicator: TechnicalIndicator, timeframe: str) -> TechnicalAnalysis:
         """Create neutral technical analysis result."""
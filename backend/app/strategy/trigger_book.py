@@ -0,0 +1,346 @@
+"""
+In-memory trigger books for resting advanced orders.
+
+Each (chain, pair) gets a ``TriggerBook`` that keeps price thresholds in
+sorted arrays, so a price tick finds every crossed stop-loss, take-profit,
+bracket leg or trailing stop with a bisect instead of a walk over all
+orders:
+
+- "below" levels fire when price <= level (sell stops), "above" levels
+  fire when price >= level (sell targets, buy stops).
+- Trailing stops whose high has been overtaken by the market share one
+  running high and are ordered by trail percent; a tick fires the prefix
+  whose percent is within the drawdown from that high. Trailing stops
+  still above the market sit in the "below" array at their fixed stop.
+
+Books hold no storage objects; ``OrderTriggerMonitor`` translates orders
+into levels and keeps the books in sync with repository changes.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, Iterator, List, Optional, Tuple
+
+HUNDRED = Decimal("100")
+
+# (chain, pair address)
+PairKey = Tuple[str, str]
+
+
+class TriggerDirection(str, Enum):
+    """Side of the market a threshold is crossed from."""
+    BELOW = "below"
+    ABOVE = "above"
+
+
+@dataclass(frozen=True)
+class TriggerHit:
+    """An order whose threshold was crossed by a tick."""
+    order_id: str
+    leg: str
+    level: Decimal
+
+
+# Above this many changes in one call, rebuild the arrays in one pass
+BULK_THRESHOLD = 32
+
+
+class _SortedLevels:
+    """Parallel sorted key / order id arrays with duplicate keys allowed."""
+
+    __slots__ = ("keys", "ids")
+
+    def __init__(self) -> None:
+        self.keys: List[Decimal] = []
+        self.ids: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def insert(self, key: Decimal, order_id: str) -> None:
+        index = bisect_right(self.keys, key)
+        self.keys.insert(index, key)
+        self.ids.insert(index, order_id)
+
+    def remove(self, key: Decimal, order_id: str) -> None:
+        index = bisect_left(self.keys, key)
+        while self.ids[index] != order_id:
+            index += 1
+        del self.keys[index]
+        del self.ids[index]
+
+    def remove_many(self, entries: List[Tuple[Decimal, str]]) -> None:
+        if len(entries) <= BULK_THRESHOLD:
+            for key, order_id in entries:
+                self.remove(key, order_id)
+            return
+        drop = {order_id for _, order_id in entries}
+        kept = [(key, order_id) for key, order_id in zip(self.keys, self.ids) if order_id not in drop]
+        self.keys = [key for key, _ in kept]
+        self.ids = [order_id for _, order_id in kept]
+
+    def insert_many(self, entries: List[Tuple[Decimal, str]]) -> None:
+        if len(entries) <= BULK_THRESHOLD:
+            for key, order_id in entries:
+                self.insert(key, order_id)
+            return
+        merged = sorted(list(zip(self.keys, self.ids)) + entries, key=lambda entry: entry[0])
+        self.keys = [key for key, _ in merged]
+        self.ids = [order_id for _, order_id in merged]
+
+
+class TriggerBook:
+    """Sorted trigger thresholds for a single pair."""
+
+    def __init__(self) -> None:
+        """Initialize empty book."""
+        self._below = _SortedLevels()
+        self._above = _SortedLevels()
+        # order_id -> {direction: (leg, level)}
+        self._legs: Dict[str, Dict[TriggerDirection, Tuple[str, Decimal]]] = {}
+
+        # Trailing stops above the market: sorted by their own high
+        self._trail_pending = _SortedLevels()
+        # Trailing stops sharing ``_group_high``: sorted by trail percent
+        self._trail_group = _SortedLevels()
+        self._group_high: Optional[Decimal] = None
+        # order_id -> (trail percent, own high or None when grouped)
+        self._trailing: Dict[str, Tuple[Decimal, Optional[Decimal]]] = {}
+
+    def __len__(self) -> int:
+        # Pending trailing stops also hold a leg; grouped ones do not
+        return len(self._legs) + len(self._trail_group)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._legs or order_id in self._trailing
+
+    def add_level(self, order_id: str, leg: str, direction: TriggerDirection, level: Decimal) -> None:
+        """Rest a fixed threshold; an order may hold one level per direction."""
+        legs = self._legs.setdefault(order_id, {})
+        if direction in legs:
+            raise ValueError(f"Order {order_id} already has a {direction.value} level")
+        legs[direction] = (leg, level)
+        self._levels(direction).insert(level, order_id)
+
+    def add_trailing(self, order_id: str, trail_percent: Decimal, highest_price: Decimal) -> None:
+        """Rest a trailing stop that ratchets up from ``highest_price``."""
+        if order_id in self._trailing:
+            raise ValueError(f"Order {order_id} already has a trailing stop")
+        self._trailing[order_id] = (trail_percent, highest_price)
+        self._trail_pending.insert(highest_price, order_id)
+        self.add_level(order_id, "trailing_stop", TriggerDirection.BELOW, _trail_stop(highest_price, trail_percent))
+
+    def remove(self, order_id: str) -> bool:
+        """Drop every threshold of an order."""
+        found = False
+        trailing = self._trailing.pop(order_id, None)
+        if trailing is not None:
+            found = True
+            trail_percent, high = trailing
+            if high is None:
+                self._trail_group.remove(trail_percent, order_id)
+                if not self._trail_group:
+                    self._group_high = None
+            else:
+                self._trail_pending.remove(high, order_id)
+
+        legs = self._legs.pop(order_id, None)
+        if legs is not None:
+            found = True
+            for direction, (_, level) in legs.items():
+                self._levels(direction).remove(level, order_id)
+        return found
+
+    def trailing_high(self, order_id: str) -> Optional[Decimal]:
+        """Current high a trailing stop measures its drawdown from."""
+        trailing = self._trailing.get(order_id)
+        if trailing is None:
+            return None
+        return self._group_high if trailing[1] is None else trailing[1]
+
+    def match(self, price: Decimal) -> List[TriggerHit]:
+        """Apply a tick: ratchet trailing highs, then pop and return every crossed order."""
+        if self._trailing:
+            self._ratchet(price)
+
+        hits: List[TriggerHit] = []
+        fired: Dict[str, TriggerDirection] = {}
+
+        # Crossed entries form a contiguous run of each array and are cut out whole
+        below = self._below
+        start = bisect_left(below.keys, price)
+        for order_id in below.ids[start:]:
+            fired[order_id] = TriggerDirection.BELOW
+            leg, level = self._legs[order_id][TriggerDirection.BELOW]
+            hits.append(TriggerHit(order_id, leg, level))
+        del below.keys[start:]
+        del below.ids[start:]
+
+        above = self._above
+        end = bisect_right(above.keys, price)
+        for order_id in above.ids[:end]:
+            if order_id in fired:
+                # Both bracket legs crossed; the other cut already reported it
+                self._legs[order_id].pop(TriggerDirection.ABOVE)
+                continue
+            fired[order_id] = TriggerDirection.ABOVE
+            leg, level = self._legs[order_id][TriggerDirection.ABOVE]
+            hits.append(TriggerHit(order_id, leg, level))
+        del above.keys[:end]
+        del above.ids[:end]
+
+        group = self._trail_group
+        if group and self._group_high > 0:
+            drawdown = (Decimal(1) - price / self._group_high) * HUNDRED
+            end = bisect_right(group.keys, drawdown)
+            for order_id, trail_percent in zip(group.ids[:end], group.keys):
+                del self._trailing[order_id]
+                hits.append(TriggerHit(order_id, "trailing_stop", _trail_stop(self._group_high, trail_percent)))
+            del group.keys[:end]
+            del group.ids[:end]
+            if not group:
+                self._group_high = None
+
+        # Drop whatever else the fired orders still hold
+        stale_below: List[Tuple[Decimal, str]] = []
+        stale_above: List[Tuple[Decimal, str]] = []
+        stale_pending: List[Tuple[Decimal, str]] = []
+        for order_id, direction in fired.items():
+            for other, (_, level) in self._legs.pop(order_id).items():
+                if other is not direction:
+                    (stale_below if other is TriggerDirection.BELOW else stale_above).append((level, order_id))
+            trailing = self._trailing.pop(order_id, None)
+            if trailing is not None:
+                stale_pending.append((trailing[1], order_id))
+        if stale_below:
+            self._below.remove_many(stale_below)
+        if stale_above:
+            self._above.remove_many(stale_above)
+        if stale_pending:
+            self._trail_pending.remove_many(stale_pending)
+        return hits
+
+    def _ratchet(self, price: Decimal) -> None:
+        """Raise trailing highs the tick has overtaken."""
+        group_open = not self._trail_group or price >= self._group_high
+        if self._trail_group and price > self._group_high:
+            self._group_high = price
+
+        pending = self._trail_pending
+        if group_open:
+            # Every pending stop at or below the tick now shares its high
+            end = bisect_right(pending.keys, price)
+            if not end:
+                return
+            if not self._trail_group:
+                self._group_high = price
+            stale: List[Tuple[Decimal, str]] = []
+            joined: List[Tuple[Decimal, str]] = []
+            for order_id in pending.ids[:end]:
+                trail_percent, high = self._trailing[order_id]
+                self._legs.pop(order_id)
+                stale.append((_trail_stop(high, trail_percent), order_id))
+                self._trailing[order_id] = (trail_percent, None)
+                joined.append((trail_percent, order_id))
+            del pending.keys[:end]
+            del pending.ids[:end]
+            self._below.remove_many(stale)
+            self._trail_group.insert_many(joined)
+            return
+
+        # Tick is below the group high: re-key overtaken pending stops to it
+        end = bisect_left(pending.keys, price)
+        if not end:
+            return
+        stale = []
+        moved = []
+        for order_id in pending.ids[:end]:
+            trail_percent, high = self._trailing[order_id]
+            stop = _trail_stop(price, trail_percent)
+            self._trailing[order_id] = (trail_percent, price)
+            self._legs[order_id][TriggerDirection.BELOW] = ("trailing_stop", stop)
+            stale.append((_trail_stop(high, trail_percent), order_id))
+            moved.append((stop, order_id))
+        pending.keys[:end] = [price] * end
+        self._below.remove_many(stale)
+        self._below.insert_many(moved)
+
+    def _levels(self, direction: TriggerDirection) -> _SortedLevels:
+        return self._below if direction is TriggerDirection.BELOW else self._above
+
+
+class TriggerBookIndex:
+    """Trigger books keyed by (chain, pair) with an order -> pair index."""
+
+    def __init__(self) -> None:
+        """Initialize empty index."""
+        self._books: Dict[PairKey, TriggerBook] = {}
+        self._order_pairs: Dict[str, PairKey] = {}
+
+    def __len__(self) -> int:
+        return len(self._order_pairs)
+
+    def __contains__(self, order_id: str) -> bool:
+        return order_id in self._order_pairs
+
+    def pairs(self) -> Iterator[PairKey]:
+        """Pairs with resting triggers."""
+        return iter(list(self._books))
+
+    def book(self, pair: PairKey) -> Optional[TriggerBook]:
+        """Book for a pair, if any order rests on it."""
+        return self._books.get(pair)
+
+    def add_levels(self, pair: PairKey, order_id: str, levels: List[Tuple[str, TriggerDirection, Decimal]]) -> None:
+        """Rest an order's fixed thresholds, replacing any it already had."""
+        book = self._claim(pair, order_id)
+        for leg, direction, level in levels:
+            book.add_level(order_id, leg, direction, level)
+
+    def add_trailing(self, pair: PairKey, order_id: str, trail_percent: Decimal, highest_price: Decimal) -> None:
+        """Rest a trailing stop, replacing anything the order already had."""
+        self._claim(pair, order_id).add_trailing(order_id, trail_percent, highest_price)
+
+    def trailing_high(self, order_id: str) -> Optional[Decimal]:
+        """Current high of a resting trailing stop."""
+        pair = self._order_pairs.get(order_id)
+        return None if pair is None else self._books[pair].trailing_high(order_id)
+
+    def remove(self, order_id: str) -> bool:
+        """Drop an order from whichever book holds it."""
+        pair = self._order_pairs.pop(order_id, None)
+        if pair is None:
+            return False
+        book = self._books[pair]
+        book.remove(order_id)
+        if not len(book):
+            del self._books[pair]
+        return True
+
+    def match(self, pair: PairKey, price: Decimal) -> List[TriggerHit]:
+        """Apply a tick to a pair's book and return the orders it fired."""
+        book = self._books.get(pair)
+        if book is None:
+            return []
+        hits = book.match(price)
+        for hit in hits:
+            self._order_pairs.pop(hit.order_id, None)
+        if not len(book):
+            del self._books[pair]
+        return hits
+
+    def _claim(self, pair: PairKey, order_id: str) -> TriggerBook:
+        self.remove(order_id)
+        self._order_pairs[order_id] = pair
+        book = self._books.get(pair)
+        if book is None:
+            book = self._books[pair] = TriggerBook()
+        return book
+
+
+def _trail_stop(high: Decimal, trail_percent: Decimal) -> Decimal:
+    return high * (Decimal(1) - trail_percent / HUNDRED)
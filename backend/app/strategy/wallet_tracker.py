@@ -0,0 +1,283 @@
+"""
+Wallet tracking for copy trading: match block logs against tracked traders.
+
+``WalletTracker`` receives each block's ERC-20 ``Transfer`` and V2/V3
+``Swap`` logs in bulk (from a ``LogScanner`` with no address filter) and
+finds the trades of tracked addresses in the same pass:
+
+1. the indexed address topics of every log (``from``/``to`` of transfers,
+   ``sender``/``to`` of swaps) are looked up in a set of tracked addresses
+   kept in padded topic form, so no topic is sliced or decoded
+2. only transactions with a hit are decoded: a tracked address receiving a
+   token from a pool that swapped in the same transaction bought it, one
+   sending a token to such a pool sold it, and the wrapped native currency
+   moving through that pool gives the trade's value
+
+Per-block match latency is recorded so the copy-trade path can be
+monitored against the block time.
+
+File: backend/app/strategy/wallet_tracker.py
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+V2_SWAP_TOPIC = "0xd78ad95fa46c994b6551d0da85fc275fe613ce37657fb8d5e3d130840159d822"
+V3_SWAP_TOPIC = "0xc42079f94a6350d7e6235f29174924f928cc2ac818eb64fed8004e115fbcca67"
+TRACKED_TOPICS = (TRANSFER_TOPIC, V2_SWAP_TOPIC, V3_SWAP_TOPIC)
+
+# Wrapped native tokens whose movement through a pool prices a trade
+WRAPPED_NATIVE_TOKENS: Dict[str, str] = {
+    "ethereum": "0xc02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",  # WETH
+    "bsc": "0xbb4cdb9cbd36b01bd1cbaebf2de08d9173bc095c",  # WBNB
+    "polygon": "0x0d500b1d8e8ef31e21c99d1db9a6444d3adf1270",  # WMATIC
+    "base": "0x4200000000000000000000000000000000000006",  # WETH
+    "arbitrum": "0x82af49447d8a07e3bd95bd0d56f35241523fbab1",  # WETH
+}
+
+_TOPIC_PADDING = "0x" + "0" * 24
+_LATENCY_WINDOW = 1000
+
+
+def address_topic(address: str) -> str:
+    """Left-pad an address to the 32-byte topic form logs index it in."""
+    return _TOPIC_PADDING + address.lower().replace("0x", "").zfill(40)
+
+
+def topic_address(topic: str) -> str:
+    """Extract the address from an indexed address topic."""
+    return "0x" + topic[-40:].lower()
+
+
+class TrackedAddressIndex:
+    """
+    Set of tracked trader addresses, keyed by their padded topic form.
+
+    Log topics are checked as-is, without slicing or lowercasing.
+    """
+
+    def __init__(self, addresses: Iterable[str] = ()) -> None:
+        """Initialize index."""
+        self.topics: Set[str] = {address_topic(address) for address in addresses}
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def __contains__(self, address: str) -> bool:
+        return address_topic(address) in self.topics
+
+    def add(self, address: str) -> None:
+        """Track an address."""
+        self.topics.add(address_topic(address))
+
+    def remove(self, address: str) -> None:
+        """Stop tracking an address."""
+        self.topics.discard(address_topic(address))
+
+    @property
+    def addresses(self) -> List[str]:
+        """Tracked addresses."""
+        return [topic_address(topic) for topic in self.topics]
+
+
+@dataclass
+class TrackedTrade:
+    """A tracked trader's swap decoded from one transaction's logs."""
+    chain: str
+    trader_address: str
+    token_address: str
+    side: str  # "buy" or "sell"
+    token_amount: int  # Raw token units
+    native_amount: int  # Wrapped native wei paid or received through the pool
+    pool_address: str
+    dex_version: str  # "v2" or "v3"
+    tx_hash: str
+    log_index: int
+    block_number: int
+    timestamp: datetime
+
+
+TradesHandler = Callable[[List[TrackedTrade]], Awaitable[None]]
+
+
+class WalletTracker:
+    """
+    Decodes tracked traders' swaps from one chain's block logs.
+
+    ``process_logs`` is a ``LogScanner`` handler: logs arrive in chain
+    order, are matched block by block, and each block's trades are passed
+    to ``on_trades`` before the next block is looked at.
+    """
+
+    def __init__(
+        self,
+        chain: str,
+        index: TrackedAddressIndex,
+        on_trades: Optional[TradesHandler] = None,
+        quote_tokens: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Args:
+            chain: Chain name
+            index: Tracked addresses (shared, may change while tracking)
+            on_trades: Called with each block's trades
+            quote_tokens: Tokens that price trades (defaults to the chain's
+                wrapped native token)
+        """
+        self.chain = chain
+        self.index = index
+        self.on_trades = on_trades
+        if quote_tokens is None:
+            quote_tokens = [WRAPPED_NATIVE_TOKENS[chain]] if chain in WRAPPED_NATIVE_TOKENS else []
+        self.quote_tokens = {token.lower() for token in quote_tokens}
+
+        self._latencies_ms: Deque[float] = deque(maxlen=_LATENCY_WINDOW)
+        self.blocks = 0
+        self.logs_seen = 0
+        self.matched_transactions = 0
+        self.trades = 0
+
+    async def process_logs(self, logs: List[Dict[str, Any]]) -> List[TrackedTrade]:
+        """
+        Match logs block by block and hand each block's trades on.
+
+        Args:
+            logs: Raw logs in chain order
+
+        Returns:
+            All trades found
+        """
+        found: List[TrackedTrade] = []
+        start = 0
+        while start < len(logs):
+            number = logs[start]["blockNumber"]
+            end = start
+            while end < len(logs) and logs[end]["blockNumber"] == number:
+                end += 1
+            trades = self.match_block(logs[start:end])
+            if trades and self.on_trades is not None:
+                await self.on_trades(trades)
+            found.extend(trades)
+            start = end
+        return found
+
+    def match_block(self, logs: List[Dict[str, Any]]) -> List[TrackedTrade]:
+        """
+        Find tracked traders' swaps in one block's logs.
+
+        Args:
+            logs: Raw logs of a single block
+
+        Returns:
+            Trades in log order
+        """
+        started = time.perf_counter()
+
+        tracked = self.index.topics
+        matched: Set[str] = set()
+        for log in logs:
+            topics = log.get("topics") or ()
+            # ERC-20 Transfer and both Swap events index exactly two addresses
+            if len(topics) == 3 and (topics[1] in tracked or topics[2] in tracked) and topics[0] in TRACKED_TOPICS:
+                matched.add(log["transactionHash"])
+
+        trades: List[TrackedTrade] = []
+        if matched:
+            by_transaction: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+            for log in logs:
+                if log.get("transactionHash") in matched:
+                    by_transaction[log["transactionHash"]].append(log)
+            for transaction_logs in by_transaction.values():
+                trades.extend(self._decode_transaction(transaction_logs))
+            trades.sort(key=lambda trade: trade.log_index)
+
+        self._latencies_ms.append((time.perf_counter() - started) * 1000)
+        self.blocks += 1
+        self.logs_seen += len(logs)
+        self.matched_transactions += len(matched)
+        self.trades += len(trades)
+        return trades
+
+    def _decode_transaction(self, logs: List[Dict[str, Any]]) -> List[TrackedTrade]:
+        """Pair tracked traders' token transfers with the pools that swapped them."""
+        pools: Dict[str, str] = {}
+        for log in logs:
+            topic = log["topics"][0] if log.get("topics") else None
+            if topic == V2_SWAP_TOPIC:
+                pools[log["address"].lower()] = "v2"
+            elif topic == V3_SWAP_TOPIC:
+                pools[log["address"].lower()] = "v3"
+        if not pools:
+            return []
+
+        native_in: Dict[str, int] = defaultdict(int)
+        native_out: Dict[str, int] = defaultdict(int)
+        moves = []
+        for log in logs:
+            topics = log.get("topics") or ()
+            if len(topics) != 3 or topics[0] != TRANSFER_TOPIC:
+                continue
+            token = log["address"].lower()
+            source, destination = topic_address(topics[1]), topic_address(topics[2])
+            data = log.get("data") or "0x"
+            value = int(data, 16) if len(data) > 2 else 0
+            if token in self.quote_tokens:
+                if destination in pools:
+                    native_in[destination] += value
+                if source in pools:
+                    native_out[source] += value
+            elif source in pools and topics[2] in self.index.topics:
+                moves.append(("buy", destination, token, value, source, log))
+            elif destination in pools and topics[1] in self.index.topics:
+                moves.append(("sell", source, token, value, destination, log))
+
+        trades = []
+        for side, trader, token, value, pool, log in moves:
+            native = native_in[pool] if side == "buy" else native_out[pool]
+            if not native or not value:
+                continue  # Token-to-token legs cannot be priced in native currency
+            timestamp = log.get("blockTimestamp")
+            trades.append(TrackedTrade(
+                chain=self.chain,
+                trader_address=trader,
+                token_address=token,
+                side=side,
+                token_amount=value,
+                native_amount=native,
+                pool_address=pool,
+                dex_version=pools[pool],
+                tx_hash=log["transactionHash"],
+                log_index=int(log["logIndex"], 16),
+                block_number=int(log["blockNumber"], 16),
+                timestamp=datetime.utcfromtimestamp(int(timestamp, 16)) if timestamp else datetime.utcnow(),
+            ))
+        return trades
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get matching statistics, including per-block match latency."""
+        latencies = np.array(self._latencies_ms) if self._latencies_ms else np.zeros(1)
+        return {
+            "chain": self.chain,
+            "tracked_addresses": len(self.index),
+            "blocks": self.blocks,
+            "logs_seen": self.logs_seen,
+            "matched_transactions": self.matched_transactions,
+            "trades": self.trades,
+            "match_latency_ms": {
+                "p50": round(float(np.percentile(latencies, 50)), 3),
+                "p95": round(float(np.percentile(latencies, 95)), 3),
+                "max": round(float(latencies.max()), 3),
+            },
+        }
@@ -15,6 +15,7 @@ from eth_account.signers.local import LocalAccount
 from web3 import Web3
 
 from ..chains.evm_client import evm_client
+from ..chains.multicall import MulticallError, allowance_call, multicall_aggregator
 import logging
 from ..core.settings import settings
 from ..services.token_metadata import token_metadata_service
@@ -131,8 +132,8 @@ class ApprovalManager:
                     }}
                 )
                 
-                # Check if approval is sufficient
-                if current_allowance >= required_amount:
+                # Check if approval is sufficient (an unreadable allowance is not)
+                if current_allowance is not None and current_allowance >= required_amount:
                     # Update tracking
                     self._track_approval(
                         approval_key, current_allowance, spender_address, 
@@ -324,6 +325,12 @@ class ApprovalManager:
             if current_time > expires_at:
                 expired_keys.append(approval_key)
         
+        # Read all expired allowances on-chain in one sweep so approvals that
+        # are already spent or reset are dropped without a revoke transaction
+        onchain_allowances: Dict[str, Decimal] = {}
+        if settings.auto_revoke_expired_approvals and expired_keys:
+            onchain_allowances = await self._get_allowances_for_keys(expired_keys)
+        
         # Process expired approvals
         for approval_key in expired_keys:
             try:
@@ -334,8 +341,9 @@ class ApprovalManager:
                 if len(key_parts) == 4:
                     chain, wallet_address, token_address, spender_address = key_parts
                     
-                    # Attempt to revoke if configured
-                    if settings.auto_revoke_expired_approvals:
+                    # Attempt to revoke if configured and still non-zero
+                    already_zero = onchain_allowances.get(approval_key) == Decimal(0)
+                    if settings.auto_revoke_expired_approvals and not already_zero:
                         try:
                             await self.revoke_approval(
                                 chain, wallet_address, token_address, spender_address
@@ -389,8 +397,8 @@ class ApprovalManager:
         token_address: str,
         owner_address: str,
         spender_address: str,
-    ) -> Decimal:
-        """Get current token allowance."""
+    ) -> Optional[Decimal]:
+        """Get current token allowance, or None if it could not be read."""
         try:
             # allowance(address,address) function signature
             allowance_sig = "0xdd62ed3e"
@@ -423,7 +431,85 @@ class ApprovalManager:
             
         except Exception as e:
             logger.warning(f"Failed to get allowance: {e}")
-            return Decimal(0)
+            return None
+    
+    async def get_allowances(
+        self,
+        chain: str,
+        owner_address: str,
+        token_spender_pairs: List[Tuple[str, str]],
+    ) -> Dict[Tuple[str, str], Decimal]:
+        """
+        Get many token allowances for one owner in a single round trip.
+        
+        Args:
+            chain: Blockchain network
+            owner_address: Wallet address that owns tokens
+            token_spender_pairs: (token_address, spender_address) pairs
+            
+        Returns:
+            Allowance keyed by (token_address, spender_address); pairs whose
+            read failed are omitted
+        """
+        if not token_spender_pairs:
+            return {}
+        
+        if multicall_aggregator.supports_chain(chain):
+            try:
+                results = await multicall_aggregator.aggregate(
+                    chain,
+                    [
+                        allowance_call(token, owner_address, spender)
+                        for token, spender in token_spender_pairs
+                    ],
+                )
+                return {
+                    pair: Decimal(result.value)
+                    for pair, result in zip(token_spender_pairs, results)
+                    if result.success
+                }
+            except MulticallError as e:
+                logger.warning(f"Multicall allowance read failed on {chain}: {e}")
+                return {}
+        
+        allowances = await asyncio.gather(*[
+            self._get_allowance(chain, token, owner_address, spender)
+            for token, spender in token_spender_pairs
+        ])
+        return {
+            pair: allowance
+            for pair, allowance in zip(token_spender_pairs, allowances)
+            if allowance is not None
+        }
+    
+    async def _get_allowances_for_keys(self, approval_keys: List[str]) -> Dict[str, Decimal]:
+        """Read on-chain allowances for tracked approval keys, grouped by owner."""
+        grouped: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+        for approval_key in approval_keys:
+            key_parts = approval_key.split(":")
+            if len(key_parts) != 4:
+                continue
+            chain, wallet_address, token_address, spender_address = key_parts
+            grouped.setdefault((chain, wallet_address), []).append(
+                (approval_key, token_address, spender_address)
+            )
+        
+        allowances: Dict[str, Decimal] = {}
+        for (chain, wallet_address), entries in grouped.items():
+            try:
+                results = await self.get_allowances(
+                    chain, wallet_address, [(token, spender) for _, token, spender in entries]
+                )
+            except Exception as e:
+                logger.warning(f"Failed to read allowances on {chain}: {e}")
+                continue
+            
+            for approval_key, token_address, spender_address in entries:
+                allowance = results.get((token_address, spender_address))
+                if allowance is not None:
+                    allowances[approval_key] = allowance
+        
+        return allowances
     
     async def _approve_standard(
         self,
@@ -46,6 +46,9 @@ class MessageType(str, Enum):
     HIGH_INTELLIGENCE_SCORE = "high_intelligence_score"
     PROCESSING_STATS_UPDATE = "processing_stats_update"
     
+    # Market data messages
+    PRICE_UPDATE = "price_update"
+    
     # System messages
     SYSTEM_HEALTH = "system_health"
     CONNECTION_ACK = "connection_ack"
@@ -61,6 +64,7 @@ class Channel(str, Enum):
     AUTOTRADE = "autotrade"
     DISCOVERY = "discovery" 
     INTELLIGENCE = "intelligence"  # NEW: AI intelligence channel
+    PRICES = "prices"  # Conflated price ticks from the price bus
     SYSTEM = "system"
     ALL = "all"  # Special channel for system-wide broadcasts
 
@@ -145,6 +149,7 @@ class WebSocketHub:
             Channel.AUTOTRADE: set(),
             Channel.DISCOVERY: set(),
             Channel.INTELLIGENCE: set(),
+            Channel.PRICES: set(),
             Channel.SYSTEM: set(),
             Channel.ALL: set()
         }
@@ -330,6 +335,26 @@ class WebSocketHub:
         
         return sent_count
     
+    def attach_price_bus(self, tick_bus) -> None:
+        """Relay price bus ticks to the prices channel while it has subscribers."""
+        tick_bus.subscribe(
+            "websocket_hub",
+            self._broadcast_price_tick,
+            accept=lambda tick: bool(self.channel_subscribers[Channel.PRICES]),
+        )
+        logger.info("Price bus attached to WebSocket hub")
+    
+    async def _broadcast_price_tick(self, tick) -> None:
+        """Broadcast one conflated price tick."""
+        message = WebSocketMessage(
+            id=str(uuid.uuid4()),
+            type=MessageType.PRICE_UPDATE,
+            channel=Channel.PRICES,
+            data=tick.to_dict(),
+            timestamp=datetime.now(timezone.utc).isoformat()
+        )
+        await self.broadcast_to_channel(Channel.PRICES, message)
+    
     async def handle_client_message(self, client_id: str, message_data: str) -> None:
         """Handle incoming message from a WebSocket client."""
         try:
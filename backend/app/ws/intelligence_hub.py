@@ -597,7 +597,11 @@ class IntelligenceWebSocketHub:
             "bridge_active": len(self._autotrade_callbacks) > 0,
             "bridge_callbacks_registered": len(self._autotrade_callbacks),
             "bridge_events_sent": self.bridge_events_sent,
-            "market_intelligence_available": self.market_intelligence is not None
+            "market_intelligence_available": self.market_intelligence is not None,
+            "intelligence_cache": (
+                self.market_intelligence.intelligence_cache.get_stats()
+                if self.market_intelligence is not None else None
+            )
         }
 
 
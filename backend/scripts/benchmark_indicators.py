@@ -0,0 +1,94 @@
+"""
+Indicator microbenchmark: one batch over a price matrix vs per-token loops.
+
+Computes EMA(12/26), MACD, RSI(14), Bollinger bands and return volatility
+for every token. The "legacy" mode runs the pure-Python per-token loops the
+timing, ensemble and regime modules used before sharing ``app.ai.indicators``.
+
+Usage: python -m scripts.benchmark_indicators [--tokens 2000] [--points 200]
+
+File: backend/scripts/benchmark_indicators.py
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.ai import indicators
+from app.ai.indicators import IndicatorStream
+
+
+def build_prices(tokens: int, points: int, seed: int = 3) -> np.ndarray:
+    """Random walk per token."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(0, 0.02, size=(tokens, points))
+    return 100 * np.cumprod(1 + steps, axis=1)
+
+
+def legacy_token(prices: List[float]) -> None:
+    """Per-token scalar indicator loops."""
+    def ema(period: int) -> float:
+        value = sum(prices[:period]) / period
+        k = 2 / (period + 1)
+        for price in prices[period:]:
+            value = price * k + value * (1 - k)
+        return value
+
+    _ = ema(12) - ema(26)
+    changes = [prices[i] - prices[i - 1] for i in range(1, len(prices))]
+    gains = [c if c > 0 else 0 for c in changes][-14:]
+    losses = [-c if c < 0 else 0 for c in changes][-14:]
+    avg_loss = sum(losses) / 14
+    _ = 100 - 100 / (1 + (sum(gains) / 14) / avg_loss) if avg_loss else 100.0
+    recent = prices[-20:]
+    sma = sum(recent) / 20
+    _ = math.sqrt(sum((p - sma) ** 2 for p in recent) / 20)
+    returns = [(prices[i] - prices[i - 1]) / prices[i - 1] for i in range(1, len(prices))]
+    _ = statistics.stdev(returns)
+
+
+def main() -> None:
+    """Run batch, legacy and streaming modes and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tokens", type=int, default=2000)
+    parser.add_argument("--points", type=int, default=200)
+    args = parser.parse_args()
+
+    matrix = build_prices(args.tokens, args.points)
+    print(f"{args.tokens} tokens x {args.points} points")
+
+    start = time.perf_counter()
+    indicators.compute_indicators(matrix)
+    batch_s = time.perf_counter() - start
+    print(f"  batch matrix:     {batch_s * 1000:9.2f} ms ({args.tokens / batch_s:,.0f} tokens/s)")
+
+    rows = matrix.tolist()
+    start = time.perf_counter()
+    for row in rows:
+        legacy_token(row)
+    legacy_s = time.perf_counter() - start
+    print(f"  per-token loops:  {legacy_s * 1000:9.2f} ms ({args.tokens / legacy_s:,.0f} tokens/s, "
+          f"{legacy_s / batch_s:.1f}x)")
+
+    stream = IndicatorStream()
+    ticks = rows[0] * 50
+    start = time.perf_counter()
+    for price in ticks:
+        stream.update(price)
+    tick_us = (time.perf_counter() - start) / len(ticks) * 1e6
+    print(f"  streaming update: {tick_us:9.2f} us/tick")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Trade queue microbenchmark: indexed double-ended heap vs heap + linear scans.
+
+Drives a bounded queue with a mixed workload of enqueues (evicting the
+lowest priority entry when full), dequeues, cancellations and batching
+lookups by token. The "legacy" mode reproduces the previous
+``TradeQueueManager`` hot paths: ``min()`` over the heap to evict, a
+tombstone-and-rebuild on remove and a full walk to find batch partners.
+
+Usage: python -m scripts.benchmark_trade_queue [--ops 100000] [--capacity 1000] [--legacy-ops 20000]
+
+File: backend/scripts/benchmark_trade_queue.py
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.autotrade.indexed_queue import IndexedPriorityQueue
+
+TOKENS = [f"0x{index:040x}" for index in range(200)]
+
+# (op, trade id, score, token)
+Operation = Tuple[str, str, float, str]
+
+
+def build_workload(ops: int, seed: int = 7) -> List[Operation]:
+    """Generate a reproducible mix of queue operations."""
+    rng = random.Random(seed)
+    workload: List[Operation] = []
+    live: List[str] = []
+    for index in range(ops):
+        roll = rng.random()
+        if roll < 0.55 or not live:
+            trade_id = f"t{index}"
+            live.append(trade_id)
+            workload.append(("enqueue", trade_id, rng.uniform(0.1, 10.0), rng.choice(TOKENS)))
+        elif roll < 0.85:
+            workload.append(("dequeue", "", 0.0, ""))
+        else:
+            workload.append(("remove", live[rng.randrange(len(live))], 0.0, ""))
+    return workload
+
+
+def run_indexed(workload: List[Operation], capacity: int) -> float:
+    """Run the workload on ``IndexedPriorityQueue`` and return ops/second."""
+    queue: IndexedPriorityQueue[Tuple[str, str]] = IndexedPriorityQueue({"token": lambda item: item[1]})
+
+    start = time.perf_counter()
+    for op, trade_id, score, token in workload:
+        if op == "enqueue":
+            if len(queue) >= capacity:
+                queue.pop_min()
+            queue.push(trade_id, (trade_id, token), score)
+            sum(1 for _ in queue.members("token", token))
+        elif op == "dequeue":
+            queue.pop_max()
+        else:
+            queue.remove(trade_id)
+    return len(workload) / (time.perf_counter() - start)
+
+
+def run_legacy(workload: List[Operation], capacity: int) -> float:
+    """Run the workload on a plain heap with the old linear scans."""
+    heap: List[List] = []  # [-score, seq, trade_id, token, cancelled]
+    lookup: Dict[str, List] = {}
+
+    start = time.perf_counter()
+    for seq, (op, trade_id, score, token) in enumerate(workload):
+        if op == "enqueue":
+            if len(heap) >= capacity:
+                lowest = min(heap, key=lambda entry: -entry[0])
+                lookup.pop(lowest[2], None)
+                heap = [entry for entry in heap if entry is not lowest]
+                heapq.heapify(heap)
+            entry = [-score, seq, trade_id, token, False]
+            heapq.heappush(heap, entry)
+            lookup[trade_id] = entry
+            sum(1 for other in heap if other[3] == token and not other[4])
+        elif op == "dequeue":
+            if heap:
+                lookup.pop(heapq.heappop(heap)[2], None)
+        else:
+            entry = lookup.pop(trade_id, None)
+            if entry is not None:
+                entry[4] = True
+                heap = [other for other in heap if not other[4]]
+                heapq.heapify(heap)
+    return len(workload) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run both modes and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=100_000)
+    parser.add_argument("--capacity", type=int, default=1000)
+    parser.add_argument("--legacy-ops", type=int, default=20_000, help="Legacy scans are O(n); keep this smaller")
+    args = parser.parse_args()
+
+    workload = build_workload(args.ops)
+    print(f"{args.ops} mixed ops (55% enqueue, 30% dequeue, 15% remove), capacity {args.capacity}")
+
+    indexed = run_indexed(workload, args.capacity)
+    print(f"  indexed double-ended heap: {indexed:12,.0f} ops/s")
+
+    legacy = run_legacy(workload[:args.legacy_ops], args.capacity)
+    print(f"  heap + linear scans:       {legacy:12,.0f} ops/s  (first {args.legacy_ops} ops, {indexed / legacy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
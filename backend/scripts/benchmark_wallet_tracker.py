@@ -0,0 +1,115 @@
+"""
+Wallet tracker benchmark: per-block match latency for copy-trade signals.
+
+Builds blocks of random ERC-20 Transfer and V2 Swap logs at mainnet
+density, plants one tracked trader's buy in each, and reports the per-block
+latency of ``WalletTracker.match_block`` against thousands of tracked
+addresses. The "decoded lookup" line reproduces the usual approach of
+extracting and lowercasing each topic's address before a set lookup,
+instead of looking up the padded topics as they arrive.
+
+Usage: python -m scripts.benchmark_wallet_tracker [--tracked 5000] [--logs 1500] [--blocks 200]
+
+File: backend/scripts/benchmark_wallet_tracker.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.strategy.wallet_tracker import (
+    TRANSFER_TOPIC,
+    V2_SWAP_TOPIC,
+    WRAPPED_NATIVE_TOKENS,
+    TrackedAddressIndex,
+    WalletTracker,
+    address_topic,
+)
+
+WETH = WRAPPED_NATIVE_TOKENS["ethereum"]
+
+
+def random_address(rng: random.Random) -> str:
+    return "0x" + format(rng.getrandbits(160), "040x")
+
+
+def build_block(number: int, log_count: int, trader: str, rng: random.Random) -> List[Dict[str, Any]]:
+    """Random Transfer/Swap logs with one buy by ``trader`` in the middle."""
+    logs: List[Dict[str, Any]] = []
+
+    def add(address: str, topics: List[str], value: int, tx_hash: str) -> None:
+        logs.append({
+            "address": address,
+            "topics": topics,
+            "data": "0x" + format(value, "064x"),
+            "blockNumber": hex(number),
+            "transactionHash": tx_hash,
+            "logIndex": hex(len(logs)),
+        })
+
+    for index in range(log_count):
+        if index == log_count // 2:
+            pool, router, token = random_address(rng), random_address(rng), random_address(rng)
+            tx_hash = "0x" + format(rng.getrandbits(256), "064x")
+            add(WETH, [TRANSFER_TOPIC, address_topic(router), address_topic(pool)], 10 ** 17, tx_hash)
+            add(token, [TRANSFER_TOPIC, address_topic(pool), address_topic(trader)], 10 ** 21, tx_hash)
+            add(pool, [V2_SWAP_TOPIC, address_topic(router), address_topic(trader)], 0, tx_hash)
+            continue
+        topic = TRANSFER_TOPIC if index % 3 else V2_SWAP_TOPIC
+        add(
+            random_address(rng),
+            [topic, address_topic(random_address(rng)), address_topic(random_address(rng))],
+            rng.getrandbits(64),
+            "0x" + format(rng.getrandbits(256), "064x"),
+        )
+    return logs
+
+
+def run_decoded_lookup(addresses: List[str], blocks: List[List[Dict[str, Any]]]) -> float:
+    """Return mean ms/block for matching decoded topic addresses (no trade decoding)."""
+    tracked = {address.lower() for address in addresses}
+    start = time.perf_counter()
+    for logs in blocks:
+        matched = set()
+        for log in logs:
+            topics = log["topics"]
+            if len(topics) != 3:
+                continue
+            if "0x" + topics[1][-40:].lower() in tracked or "0x" + topics[2][-40:].lower() in tracked:
+                matched.add(log["transactionHash"])
+    return (time.perf_counter() - start) / len(blocks) * 1000
+
+
+def main() -> None:
+    """Run the benchmark and print per-block latency."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tracked", type=int, default=5000)
+    parser.add_argument("--logs", type=int, default=1500, help="Transfer/Swap logs per block")
+    parser.add_argument("--blocks", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(17)
+    tracked = [random_address(rng) for _ in range(args.tracked)]
+    index = TrackedAddressIndex(tracked)
+    blocks = [build_block(number, args.logs, rng.choice(tracked), rng) for number in range(args.blocks)]
+    print(f"{args.tracked} tracked addresses, {args.blocks} blocks of {args.logs} logs")
+
+    tracker = WalletTracker("ethereum", index)
+    trades = sum(len(tracker.match_block(logs)) for logs in blocks)
+    latency = tracker.get_stats()["match_latency_ms"]
+    print(f"  wallet tracker: p50 {latency['p50']:7.3f} ms, p95 {latency['p95']:7.3f} ms, "
+          f"max {latency['max']:7.3f} ms per block, {trades} trades")
+
+    print(f"  decoded lookup: {run_decoded_lookup(tracked, blocks):7.3f} ms/block mean (matching only)")
+
+
+if __name__ == "__main__":
+    main()
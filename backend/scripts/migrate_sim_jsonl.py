@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Migrate legacy JSONL simulation snapshots into the columnar store.
+
+Reads every ``<chain>_<YYYY-MM-DD>.jsonl`` (or ``.jsonl.gz``) file in the
+source directory and writes it as chain/date partitioned column files.
+Each source file is flushed as one part and then renamed to
+``<name>.migrated`` (or deleted with ``--remove-source``), so migrated rows
+are never read twice and an interrupted run can simply be started again.
+
+Usage:
+    python scripts/migrate_sim_jsonl.py [--data-dir data/historical] [--source DIR] [--dry-run] [--remove-source]
+
+File: backend/scripts/migrate_sim_jsonl.py
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to Python path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from app.sim.columnar_store import LEGACY_FILE_PATTERN, ColumnarSnapshotStore, migrate_jsonl_directory
+
+# Setup logging
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    """Main migration script."""
+    parser = argparse.ArgumentParser(description="Migrate JSONL simulation snapshots to the columnar store")
+    parser.add_argument("--data-dir", type=Path, default=Path("data") / "historical", help="Historical data root")
+    parser.add_argument("--source", type=Path, help="JSONL directory (default <data-dir>/simulation)")
+    parser.add_argument("--dry-run", action="store_true", help="List the files that would be migrated")
+    parser.add_argument("--remove-source", action="store_true", help="Delete each JSONL file instead of renaming it to .migrated")
+    args = parser.parse_args()
+
+    source = args.source or args.data_dir / "simulation"
+    if not source.is_dir():
+        logger.error(f"Source directory not found: {source}")
+        return 1
+
+    files = sorted(p for p in source.iterdir() if p.is_file() and LEGACY_FILE_PATTERN.match(p.name))
+    if args.dry_run:
+        total = sum(p.stat().st_size for p in files)
+        for path in files:
+            logger.info(f"Would migrate {path.name} ({path.stat().st_size / 1024:.1f} KB)")
+        logger.info(f"{len(files)} files, {total / (1024 * 1024):.1f} MB")
+        return 0
+
+    store = ColumnarSnapshotStore(args.data_dir / "columnar")
+    started = time.perf_counter()
+    stats = migrate_jsonl_directory(source, store, remove_source=args.remove_source)
+    logger.info(
+        f"Migrated {stats['rows']} snapshots from {stats['files']} files in "
+        f"{time.perf_counter() - started:.1f}s ({stats['bad_lines']} unreadable lines skipped)"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
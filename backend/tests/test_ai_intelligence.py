@@ -30,6 +30,7 @@ from app.ai.market_intelligence import (
     MarketRegime,
     WhaleActionType
 )
+from app.ai.intelligence_cache import IntelligenceCache
 
 
 class TestAIIntelligenceAPI:
@@ -194,7 +195,7 @@ class TestMarketIntelligenceEngine:
     def engine(self):
         """Create MarketIntelligenceEngine instance."""
         # Don't use async for fixture, just return the instance
-        return MarketIntelligenceEngine()
+        return MarketIntelligenceEngine(intelligence_cache=IntelligenceCache())
     
     @pytest.mark.asyncio
     async def test_analyze_bullish_market(self, engine):
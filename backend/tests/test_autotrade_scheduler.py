@@ -0,0 +1,84 @@
+"""
+Tests for the autotrade opportunity scheduler.
+
+File: backend/tests/test_autotrade_scheduler.py
+"""
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.autotrade.scheduler import ExpiryWheel, OpportunityScheduler
+
+
+def make_opportunity(opportunity_id: str, priority: str, age: float = 0.0, ttl: float = 60.0) -> SimpleNamespace:
+    """Create an opportunity stand-in discovered ``age`` seconds ago."""
+    now = datetime.utcnow()
+    return SimpleNamespace(
+        id=opportunity_id,
+        priority=priority,
+        discovered_at=now - timedelta(seconds=age),
+        expires_at=now + timedelta(seconds=ttl),
+    )
+
+
+def test_expiry_wheel_fires_due_keys_across_laps():
+    """Keys fire on their own tick even when the delay wraps the wheel."""
+    wheel = ExpiryWheel(tick_seconds=1.0, slots=8)
+    start = wheel._current_tick * 1.0
+    wheel.add("soon", 2.0, start)
+    wheel.add("later", 10.0, start)  # Same slot as "soon", one lap on
+    wheel.add("cancelled", 3.0, start)
+    assert wheel.cancel("cancelled")
+
+    assert wheel.advance(start + 1.0) == []
+    assert wheel.advance(start + 2.0) == ["soon"]
+    assert wheel.advance(start + 9.0) == []
+    assert wheel.advance(start + 10.0) == ["later"]
+    assert len(wheel) == 0
+
+
+def test_pops_by_priority_then_discovery_and_drops_expired():
+    """Higher priority wins, then the earliest discovered; removals and expiry are skipped."""
+    scheduler = OpportunityScheduler()
+    scheduler.push(make_opportunity("low-old", "low", age=30))
+    scheduler.push(make_opportunity("high-new", "high", age=1))
+    scheduler.push(make_opportunity("high-old", "high", age=5))
+    scheduler.push(make_opportunity("critical", "critical"))
+    scheduler.push(make_opportunity("removed", "critical"))
+    scheduler.push(make_opportunity("stale", "critical", ttl=0.5))
+    scheduler.remove("removed")
+
+    expired = scheduler.expire(scheduler.expiry._current_tick + 2.0)
+    assert [opp.id for opp in expired] == ["stale"]
+    assert [opp.id for opp in scheduler.opportunities()] == ["critical", "high-old", "high-new", "low-old"]
+
+    # Re-queueing an id replaces its earlier entry
+    scheduler.push(make_opportunity("low-old", "high", age=30))
+    popped = [scheduler.pop()[0].id for _ in range(4)]
+    assert popped == ["critical", "low-old", "high-old", "high-new"]
+    assert scheduler.pop() is None and len(scheduler) == 0
+
+
+@pytest.mark.asyncio
+async def test_push_wakes_waiting_dispatcher():
+    """A waiter on the wake-up event resumes as soon as an opportunity is queued."""
+    scheduler = OpportunityScheduler()
+    woken = asyncio.Event()
+
+    async def dispatcher() -> None:
+        await scheduler.wakeup.wait()
+        woken.set()
+
+    task = asyncio.create_task(dispatcher())
+    await asyncio.sleep(0)
+    assert not woken.is_set()
+
+    scheduler.push(make_opportunity("critical", "critical"))
+    await asyncio.wait_for(woken.wait(), 0.5)
+    await task
+    opportunity, enqueued_at = scheduler.pop()
+    assert opportunity.id == "critical" and enqueued_at > 0
@@ -0,0 +1,181 @@
+"""
+Tests for the columnar simulation snapshot store.
+
+File: backend/tests/test_columnar_store.py
+"""
+from __future__ import annotations
+
+import asyncio
+import tempfile
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.sim.columnar_store import ColumnarSnapshotStore, migrate_jsonl_directory
+from app.sim.historical_data import HistoricalDataManager, SimulationSnapshot, snapshots_from_columns
+
+PAIRS = ["0x" + f"{i:040x}" for i in range(1, 5)]
+START = datetime(2024, 3, 1)
+
+
+def make_snapshot(index: int, chain: str = "ethereum", minutes: int = 30) -> SimulationSnapshot:
+    """Snapshot ``index`` steps after START, cycling through PAIRS."""
+    return SimulationSnapshot(
+        timestamp=START + timedelta(minutes=minutes * index),
+        pair_address=PAIRS[index % len(PAIRS)],
+        chain=chain,
+        dex="uniswap_v2",
+        price=Decimal("0.00012345") * (index + 1),
+        reserve0=Decimal("1000000"),
+        reserve1=Decimal("250.5"),
+        liquidity_usd=Decimal("500000"),
+        volume_24h=Decimal("125000"),
+        volatility=0.05,
+        trade_count=index,
+        avg_trade_size=Decimal("420.5"),
+        gas_price=Decimal("25") if index % 2 else None,
+        price_change_1h=Decimal("-1.5") if index % 3 == 0 else None,
+    )
+
+
+def test_scan_prunes_and_filters():
+    """Chain/date partitions and part bounds are pruned; rows come back sorted."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = ColumnarSnapshotStore(Path(directory), batch_rows=1000)
+        # 4 days at 30-minute steps, written in reverse to check sorting
+        for index in reversed(range(192)):
+            store.append(make_snapshot(index))
+            store.append(make_snapshot(index, chain="bsc"))
+        assert store.flush() == 384
+        assert store.chains() == ["bsc", "ethereum"]
+        assert len(list((Path(directory) / "chain=ethereum").iterdir())) == 4
+
+        start, end = START + timedelta(days=1, hours=12), START + timedelta(days=2, hours=6)
+        batch = store.scan(start, end, chains=["ethereum"], pairs=[PAIRS[1]])
+
+        expected = [make_snapshot(i) for i in range(192)]
+        expected = [s for s in expected if start <= s.timestamp <= end and s.pair_address == PAIRS[1]]
+        assert len(batch) == len(expected) > 0
+        assert batch["timestamp"].tolist() == [s.timestamp for s in expected]
+        assert set(batch["chain"].tolist()) == {b"ethereum"}
+        assert np.all(np.diff(batch["timestamp"].astype("int64")) > 0)
+        # Only days 1 and 2 of ethereum are opened
+        assert store.get_stats()["parts_scanned"] == 2
+
+        # Empty range and unknown pair
+        assert len(store.scan(START - timedelta(days=5), START - timedelta(days=4))) == 0
+        assert len(store.scan(START, end, pairs=["0x" + "f" * 40])) == 0
+
+
+def test_snapshots_round_trip():
+    """Rows rebuild into snapshots with Decimals and None optionals intact."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = ColumnarSnapshotStore(Path(directory))
+        originals = [make_snapshot(index) for index in range(12)]
+        for snapshot in originals:
+            store.append(snapshot)
+        store.flush()
+
+        restored = snapshots_from_columns(store.scan(START, START + timedelta(days=1)))
+
+        assert [s.model_dump() for s in restored] == [s.model_dump() for s in originals]
+        assert restored[1].gas_price == Decimal("25") and restored[0].gas_price is None
+        assert isinstance(restored[3].price, Decimal) and restored[3].price_change_1h == Decimal("-1.5")
+
+
+def test_scan_selected_columns():
+    """Only the requested columns (plus timestamp) are loaded."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = ColumnarSnapshotStore(Path(directory))
+        for index in range(10):
+            store.append(make_snapshot(index))
+        store.flush()
+
+        batch = store.scan(START, START + timedelta(days=1), columns=["price"])
+
+        assert set(batch.columns) == {"timestamp", "price"}
+        assert batch["price"][2] == pytest.approx(0.00037035)
+        with pytest.raises(ValueError, match="Unknown columns"):
+            store.scan(START, START + timedelta(days=1), columns=["nope"])
+
+
+def test_migrate_jsonl_directory():
+    """Legacy day files are converted, bad lines skipped, sources removed."""
+    with tempfile.TemporaryDirectory() as directory:
+        source = Path(directory) / "simulation"
+        source.mkdir()
+        with open(source / "ethereum_2024-03-01.jsonl", "w", encoding="utf-8") as f:
+            for index in range(20):
+                f.write(make_snapshot(index).model_dump_json() + "\n")
+            f.write("{not json\n\n")
+        (source / "notes.txt").write_text("ignored")
+
+        store = ColumnarSnapshotStore(Path(directory) / "columnar")
+        stats = migrate_jsonl_directory(source, store, remove_source=True)
+
+        assert stats["files"] == 1 and stats["rows"] == 20 and stats["bad_lines"] == 1
+        assert sorted(p.name for p in source.iterdir()) == ["notes.txt"]
+        restored = snapshots_from_columns(store.scan(START, START + timedelta(days=1)))
+        assert [s.price for s in restored] == [make_snapshot(i).price for i in range(20)]
+
+
+@pytest.mark.asyncio
+async def test_manager_buffers_and_reads_both_formats():
+    """Manager reads written parts, buffered rows and legacy JSONL together."""
+    with tempfile.TemporaryDirectory() as directory:
+        manager = HistoricalDataManager(Path(directory), batch_rows=5)
+        legacy = make_snapshot(1, chain="bsc")
+        legacy_file = manager.data_dir / "simulation" / "bsc_2024-03-01.jsonl"
+        legacy_file.write_text(legacy.model_dump_json() + "\n", encoding="utf-8")
+
+        for index in range(7):
+            assert await manager.store_simulation_snapshot(make_snapshot(index))
+        assert manager.sim_store.pending_rows == 2
+
+        end = START + timedelta(days=1)
+        snapshots = await manager.get_simulation_data(START, end)
+        # Buffered rows are read from memory, not flushed as a part
+        assert manager.sim_store.pending_rows == 2
+        assert manager.sim_store.parts_written == 1
+        assert len(snapshots) == 8
+        assert [s.timestamp for s in snapshots] == sorted(s.timestamp for s in snapshots)
+
+        # Cached until the next write
+        assert await manager.get_simulation_data(START, end) is snapshots
+        await manager.store_simulation_snapshot(make_snapshot(8))
+        assert len(await manager.get_simulation_data(START, end)) == 9
+
+        stats = await manager.migrate_simulation_data(remove_source=False)
+        assert stats["rows"] == 1 and not legacy_file.exists()
+        assert (legacy_file.parent / "bsc_2024-03-01.jsonl.migrated").exists()
+        assert len(await manager.get_simulation_data(START, end)) == 9
+        assert (await manager.migrate_simulation_data())["rows"] == 0
+        bsc = await manager.get_simulation_data(START, end, chains=["bsc"])
+        assert [s.model_dump() for s in bsc] == [legacy.model_dump()]
+
+        iterator = await manager.get_data_replay_iterator(START, START + timedelta(hours=2), timedelta(hours=1))
+        assert [len(window) for _, window in iterator] == [3, 2]
+
+
+@pytest.mark.asyncio
+async def test_manager_flushes_on_age_and_close():
+    """Buffered snapshots are written once the oldest is flush_interval old, and on close."""
+    with tempfile.TemporaryDirectory() as directory:
+        manager = HistoricalDataManager(Path(directory), batch_rows=1000, flush_interval=0.05)
+        await manager.store_simulation_snapshot(make_snapshot(0))
+        await manager.store_simulation_snapshot(make_snapshot(1))
+        assert manager.sim_store.pending_rows == 2
+
+        await asyncio.sleep(0.06)
+        await manager.store_simulation_snapshot(make_snapshot(2))
+        assert manager.sim_store.pending_rows == 0 and manager.sim_store.rows_written == 3
+
+        await manager.store_simulation_snapshot(make_snapshot(3))
+        await manager.close()
+        assert manager.sim_store.pending_rows == 0 and manager.sim_store.rows_written == 4
+
+        reopened = HistoricalDataManager(Path(directory))
+        assert len(await reopened.get_simulation_data(START, START + timedelta(days=1))) == 4
@@ -0,0 +1,92 @@
+"""
+Tests for native async contract reads.
+
+File: backend/tests/test_contract_calls.py
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from app.chains.contract_calls import (
+    AsyncContractCaller,
+    ContractCallError,
+    decode_uint_array,
+)
+
+ROUTER = "0x" + "aa" * 20
+TOKEN_A = "0x" + "01" * 20
+TOKEN_B = "0x" + "02" * 20
+
+
+def word(value: int) -> str:
+    """Encode an unsigned value as a 32-byte hex word."""
+    return format(value, "064x")
+
+
+class FakePool:
+    """RPC pool stand-in returning canned ``eth_call`` results by selector."""
+
+    def __init__(self, results: Dict[str, str]) -> None:
+        self.results = results
+        self.requests: List[Tuple[str, Any]] = []
+        self.providers = {"ethereum": ["primary"]}
+
+    async def make_request(self, chain: str, method: str, params: List) -> Any:
+        self.requests.append((method, params))
+        if method == "eth_call":
+            return self.results.get(params[0]["data"][2:10], "0x")
+        raise AssertionError(method)
+
+
+@pytest.mark.asyncio
+async def test_get_amounts_out_encodes_dynamic_path():
+    """The path is ABI-encoded as a dynamic array and the result decoded."""
+    pool = FakePool({"d06ca61f": "0x" + word(32) + word(2) + word(10**18) + word(1234)})
+    caller = AsyncContractCaller(pool=pool)
+
+    amounts = await caller.get_amounts_out("ethereum", ROUTER, 10**18, [TOKEN_A, TOKEN_B])
+
+    assert amounts == [10**18, 1234]
+    method, (call, block) = pool.requests[0]
+    assert (method, call["to"], block) == ("eth_call", ROUTER, "latest")
+    assert call["data"] == (
+        "0xd06ca61f" + word(10**18) + word(64) + word(2)
+        + "0" * 24 + "01" * 20 + "0" * 24 + "02" * 20
+    )
+
+
+@pytest.mark.asyncio
+async def test_quoter_v2_and_slot0_decoding():
+    """QuoterV2 tuples and signed slot0 ticks decode from raw words."""
+    pool = FakePool({
+        "c6a5026a": "0x" + word(500) + word(1 << 96) + word(2) + word(90_000),
+        "3850c7bd": "0x" + word(1 << 96) + format((-60) % (1 << 256), "064x") + word(0) * 5,
+    })
+    caller = AsyncContractCaller(pool=pool)
+
+    quote = await caller.quote_exact_input_single("ethereum", ROUTER, TOKEN_A, TOKEN_B, 3000, 10**6)
+    sqrt_price, tick = await caller.slot0("ethereum", ROUTER)
+
+    assert quote == (500, 1 << 96, 2, 90_000)
+    assert (sqrt_price, tick) == (1 << 96, -60)
+    # Struct params are laid out as (tokenIn, tokenOut, amountIn, fee, sqrtPriceLimitX96)
+    assert pool.requests[0][1][0]["data"][10 + 128:10 + 192] == word(10**6)
+
+
+@pytest.mark.asyncio
+async def test_empty_return_data_raises():
+    """Calls to addresses without code surface as ContractCallError."""
+    caller = AsyncContractCaller(pool=FakePool({}))
+
+    with pytest.raises(ContractCallError):
+        await caller.decimals("ethereum", TOKEN_A)
+    assert await caller.supports_chain("ethereum") is True
+    assert await caller.supports_chain("solana") is False
+
+
+def test_decode_uint_array_rejects_truncated_data():
+    """A length word larger than the payload is rejected."""
+    with pytest.raises(ValueError):
+        decode_uint_array(bytes.fromhex(word(32) + word(3) + word(1)))
@@ -0,0 +1,154 @@
+"""
+Tests for batched Dexscreener lookups, the priority rate limiter and the cache.
+
+File: backend/tests/test_dexscreener_client.py
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from app.discovery.dexscreener import (
+    MAX_ADDRESSES_PER_REQUEST,
+    DexscreenerCache,
+    DexscreenerClient,
+    LookupPriority,
+    TokenBucketLimiter,
+)
+
+WETH = "0x" + "ee" * 20
+
+
+def pair_address(index: int) -> str:
+    return "0x" + format(index, "040x")
+
+
+def token_address(index: int) -> str:
+    return "0x" + format(0x1000 + index, "040x")
+
+
+def pair_json(index: int, chain: str = "ethereum") -> Dict[str, Any]:
+    """API pair object for pair ``index`` trading token ``index`` against WETH."""
+    return {
+        "chainId": chain,
+        "dexId": "uniswap",
+        "pairAddress": pair_address(index),
+        "baseToken": {"address": token_address(index), "name": f"T{index}", "symbol": f"T{index}"},
+        "quoteToken": {"address": WETH, "name": "Wrapped Ether", "symbol": "WETH"},
+        "priceUsd": "1.5",
+        "liquidity": {"usd": 25000},
+    }
+
+
+class FakeDexscreener(DexscreenerClient):
+    """Client answering from an in-memory listing instead of HTTP."""
+
+    def __init__(self, listed: int = 100) -> None:
+        super().__init__()
+        self.listed = {pair_address(i): pair_json(i) for i in range(listed)}
+        self.urls: List[str] = []
+        self.fail_next = False
+
+    async def _get_json(self, url: str) -> Dict[str, Any]:
+        self.urls.append(url)
+        if self.fail_next:
+            self.fail_next = False
+            raise httpx.ConnectError("upstream down")
+        addresses = url.rsplit("/", 1)[1].split(",")
+        if "/dex/pairs/" in url:
+            return {"pairs": [self.listed[a] for a in addresses if a in self.listed] or None}
+        return {"pairs": [
+            pair for pair in self.listed.values()
+            if pair["baseToken"]["address"] in addresses or pair["quoteToken"]["address"] in addresses
+        ]}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_pair_lookups_share_batched_requests():
+    """A discovery burst costs one upstream request per 30 addresses."""
+    client = FakeDexscreener()
+    addresses = [pair_address(i) for i in range(45)]
+
+    responses = await asyncio.gather(*[client.get_pair_by_address(a, "ethereum") for a in addresses])
+
+    assert len(client.urls) == 2
+    assert sorted(len(url.rsplit("/", 1)[1].split(",")) for url in client.urls) == [15, MAX_ADDRESSES_PER_REQUEST]
+    for address, response in zip(addresses, responses):
+        assert response.success and [p.pair_address for p in response.pairs] == [address]
+
+    again = await client.get_pair_by_address(addresses[0].upper().replace("0X", "0x"), "ethereum")
+    assert again.pairs[0].pair_address == addresses[0] and len(client.urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_token_search_demultiplexes_and_caches_misses():
+    """Token searches are batched, filtered by chain, and empty results are cached."""
+    client = FakeDexscreener(listed=3)
+    client.listed[pair_address(9)] = pair_json(9, chain="bsc")
+    tokens = [token_address(0), token_address(2), token_address(9), token_address(50)]
+
+    results = await asyncio.gather(
+        *[client.search_pairs_by_token(t, "ethereum") for t in tokens],
+        client.search_pairs_by_token(token_address(0), "ethereum"),
+    )
+
+    assert len(client.urls) == 1
+    assert [len(r.pairs) for r in results] == [1, 1, 0, 0, 1]
+    assert results[1].pairs[0].base_token.address == token_address(2)
+    assert client.coalesced_lookups == 1
+
+    assert (await client.search_pairs_by_token(token_address(50), "ethereum")).success
+    assert len(client.urls) == 1
+    assert client.get_cache_stats()["negative_hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_reach_every_caller_and_are_not_cached():
+    """An upstream error fails the whole batch once; the next lookup retries."""
+    client = FakeDexscreener()
+    client.fail_next = True
+
+    failed = await asyncio.gather(*[client.get_pair_by_address(pair_address(i), "ethereum") for i in range(3)])
+    assert [r.success for r in failed] == [False] * 3 and "upstream down" in failed[0].error_message
+
+    retried = await client.get_pair_by_address(pair_address(1), "ethereum")
+    assert retried.success and len(client.urls) == 2
+
+    unsupported = await client.get_pair_by_address(pair_address(1), "tron")
+    assert not unsupported.success and len(client.urls) == 2
+
+
+@pytest.mark.asyncio
+async def test_limiter_serves_execution_lane_first():
+    """Queued execution lookups are granted before earlier background ones."""
+    limiter = TokenBucketLimiter(rate=50.0, burst=1)
+    await limiter.acquire()  # Drain the bucket
+    order: List[str] = []
+
+    async def take(name: str, priority: LookupPriority) -> None:
+        await limiter.acquire(priority)
+        order.append(name)
+
+    background = [asyncio.create_task(take(f"bg{i}", LookupPriority.BACKGROUND)) for i in range(3)]
+    await asyncio.sleep(0)
+    execution = asyncio.create_task(take("exec", LookupPriority.EXECUTION))
+    await asyncio.gather(*background, execution)
+
+    assert order == ["exec", "bg0", "bg1", "bg2"]
+    assert limiter.get_stats()["waited"] == 4
+
+
+def test_cache_is_bounded_lru():
+    """The least recently used entry is evicted beyond max_entries."""
+    cache = DexscreenerCache(max_entries=2)
+    cache.put(("pairs", "ethereum", "a"), [])
+    cache.put(("pairs", "ethereum", "b"), [])
+    assert cache.get(("pairs", "ethereum", "a"))[0]
+    cache.put(("pairs", "ethereum", "c"), [])
+
+    assert not cache.get(("pairs", "ethereum", "b"))[0]
+    assert cache.get(("pairs", "ethereum", "a"))[0] and cache.get(("pairs", "ethereum", "c"))[0]
+    assert cache.get_stats()["evictions"] == 1
@@ -0,0 +1,99 @@
+"""
+Tests for batched feature engineering and ensemble inference.
+
+File: backend/tests/test_ensemble_batch.py
+"""
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from app.ai.ensemble_models import (
+    EnsemblePredictionEngine,
+    FeatureEngineering,
+    FeatureMatrix,
+    ModelType,
+    PredictionHorizon,
+)
+
+Request = Tuple[str, str, Dict[str, Any]]
+
+
+def bursts(rounds: int, tokens: int = 12, per_round: int = 6, seed: int = 9) -> List[List[Request]]:
+    """Rounds of market updates over a small token universe."""
+    rng = random.Random(seed)
+    addresses = [f"0x{index:040x}" for index in range(tokens)]
+    prices = {address: rng.uniform(0.5, 5.0) for address in addresses}
+    rounds_out = []
+    for _ in range(rounds):
+        batch = []
+        for address in rng.sample(addresses, per_round):
+            prices[address] *= 1 + rng.gauss(0, 0.05)
+            batch.append((address, "ethereum", {
+                "price": prices[address],
+                "volume": rng.uniform(1e3, 1e6),
+                "liquidity": 1e6,
+                "liquidity_change_1h": rng.gauss(0, 0.1),
+                "whale_activity_1h": rng.randint(0, 5),
+            }))
+        rounds_out.append(batch)
+    return rounds_out
+
+
+@pytest.mark.asyncio
+async def test_batch_matches_per_token_predictions():
+    """One predict_batch call gives the same results as one predict per token."""
+    single, batched = EnsemblePredictionEngine(), EnsemblePredictionEngine()
+    for batch in bursts(30):
+        expected = [await single.predict(token, chain, raw, PredictionHorizon.HOUR_1) for token, chain, raw in batch]
+        results = await batched.predict_batch(batch, PredictionHorizon.HOUR_1)
+
+        assert [r.token_address for r in results] == [token for token, _, _ in batch]
+        for want, got in zip(expected, results):
+            assert float(got.ensemble_price) == pytest.approx(float(want.ensemble_price), rel=1e-12)
+            assert got.ensemble_confidence == pytest.approx(want.ensemble_confidence)
+            assert got.consensus_strength == pytest.approx(want.consensus_strength)
+            assert (got.recommendation, got.risk_level, got.key_factors) == (
+                want.recommendation, want.risk_level, want.key_factors
+            )
+            for model_type in ModelType:
+                if model_type is ModelType.ENSEMBLE:
+                    continue
+                assert got.model_predictions[model_type].probability_up == pytest.approx(
+                    want.model_predictions[model_type].probability_up
+                )
+
+
+@pytest.mark.asyncio
+async def test_feature_matrix_round_trips_market_features():
+    """Rows rebuilt from the matrix carry the engineered values and exact prices."""
+    engineering = FeatureEngineering()
+    batch = bursts(1, per_round=4)[0]
+    matrix = await engineering.engineer_feature_matrix(batch)
+
+    assert matrix.values.shape[0] == len(batch)
+    features = matrix.features(2)
+    assert features.token_address == batch[2][0]
+    assert features.price == Decimal(str(batch[2][2]["price"]))
+    assert features.whale_activity_1h == batch[2][2]["whale_activity_1h"]
+
+    again = FeatureMatrix.from_features([matrix.features(i) for i in range(len(matrix))])
+    np.testing.assert_allclose(again.values, matrix.values)
+
+
+@pytest.mark.asyncio
+async def test_unusable_rows_fall_back_without_failing_the_batch():
+    """A zero price yields the fallback prediction while other rows are scored."""
+    engine = EnsemblePredictionEngine()
+    results = await engine.predict_batch([
+        ("0x" + "01" * 20, "ethereum", {"price": 0, "volume": 1}),
+        ("0x" + "02" * 20, "ethereum", {"price": 2.5, "volume": 100}),
+    ])
+
+    assert results[0].key_factors == ["Insufficient Data"] and results[0].model_predictions == {}
+    assert results[1].ensemble_price > 0 and len(results[1].model_predictions) == 3
+    assert await engine.predict_batch([]) == []
@@ -0,0 +1,166 @@
+"""
+Tests for the staged discovery processing pipeline.
+
+File: backend/tests/test_event_processor_pipeline.py
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List
+
+import pytest
+
+from app.discovery import event_processor as ep
+from app.discovery.chain_watchers import PairCreatedEvent
+
+WBNB = "0xbb4cdb9cbd36b01bd1cbaebf2de08d9173bc095c"
+LOOKUP_DELAY = 0.05
+
+
+def make_event(index: int) -> PairCreatedEvent:
+    """Create a PairCreated event for a new token against WBNB."""
+    return PairCreatedEvent(
+        chain="bsc",
+        dex="pancakeswap_v2",
+        factory_address="0x" + "fa" * 20,
+        pair_address=f"0x{index:040x}",
+        token0=WBNB,
+        token1="0x" + "01" * 20,
+        block_number=100 + index,
+        block_timestamp=0,
+        transaction_hash=f"0x{index:064x}",
+        log_index=0,
+        trace_id=f"trace-{index}",
+    )
+
+
+class SlowLookups:
+    """Dexscreener, security provider and risk manager stand-ins with fixed latency."""
+
+    def __init__(self) -> None:
+        self.started: Dict[str, List[float]] = {"dexscreener": [], "security": [], "risk": []}
+
+    async def validate_discovered_pair(self, *args: Any) -> Dict[str, Any]:
+        self.started["dexscreener"].append(time.perf_counter())
+        await asyncio.sleep(LOOKUP_DELAY)
+        return {
+            "found_in_dexscreener": True,
+            "has_liquidity": True,
+            "market_data": {"liquidity_usd": 60_000},
+        }
+
+    async def check_token_security(self, token: str, chain: str) -> Any:
+        self.started["security"].append(time.perf_counter())
+        await asyncio.sleep(LOOKUP_DELAY)
+        return SimpleNamespace(
+            honeypot_detected=False, honeypot_confidence=0.0, providers_successful=2, risk_factors=[]
+        )
+
+    async def assess_token_risk(self, **kwargs: Any) -> Any:
+        self.started["risk"].append(time.perf_counter())
+        await asyncio.sleep(LOOKUP_DELAY)
+        return SimpleNamespace(
+            overall_risk=SimpleNamespace(value="low"),
+            overall_score=10.0,
+            tradeable=True,
+            warnings=[],
+            recommendations=[],
+        )
+
+
+@pytest.mark.asyncio
+async def test_stages_run_lookups_concurrently(monkeypatch):
+    """Independent lookups overlap and every stage reports latency and depth."""
+    lookups = SlowLookups()
+    monkeypatch.setattr(ep, "dexscreener_client", lookups)
+    monkeypatch.setattr(ep, "security_provider", lookups)
+    monkeypatch.setattr(ep, "risk_manager", lookups)
+
+    processor = ep.EventProcessor()
+    processor.market_intelligence = None
+
+    async def chain_clients() -> Dict[str, Any]:
+        return {"bsc": object()}
+
+    processor._get_chain_clients = chain_clients
+    finished: List[ep.ProcessedPair] = []
+
+    async def on_finished(processed_pair: ep.ProcessedPair) -> None:
+        finished.append(processed_pair)
+
+    processor.add_processing_callback(ep.ProcessingStatus.APPROVED, on_finished)
+    processor.add_processing_callback(ep.ProcessingStatus.REJECTED, on_finished)
+
+    runner = asyncio.create_task(processor.start_processing())
+    for index in range(5):
+        await processor.process_discovered_pair(make_event(index))
+    await asyncio.wait_for(_wait_for(lambda: len(finished) == 5), 5)
+    await processor.stop_processing()
+    await runner
+
+    # Security providers are queried with risk assessment, after screening
+    for screened, secured, assessed in zip(
+        lookups.started["dexscreener"], lookups.started["security"], lookups.started["risk"]
+    ):
+        assert secured - screened >= LOOKUP_DELAY * 0.9
+        assert abs(secured - assessed) < LOOKUP_DELAY / 2
+    assert all(pair.security_provider_data and pair.risk_assessment for pair in finished)
+
+    stats = processor.get_processing_stats()
+    assert stats["pairs_processed"] == 5
+    assert set(stats["stages"]) == {"screen", "analyze", "finalize"}
+    for stage_stats in stats["stages"].values():
+        assert stage_stats["processed"] == 5
+        assert stage_stats["queue_size"] == 0
+        assert stage_stats["latency"]["samples"] == 5
+    assert stats["stages"]["screen"]["latency"]["p50_ms"] < 2 * LOOKUP_DELAY * 1000
+
+
+@pytest.mark.asyncio
+async def test_full_intake_sheds_oldest_pair():
+    """Queueing never blocks; the stalest queued pair makes room and is reported."""
+    processor = ep.EventProcessor()
+    processor.stages["screen"].queue = asyncio.Queue(maxsize=2)
+    dropped: List[ep.ProcessedPair] = []
+
+    async def on_error(processed_pair: ep.ProcessedPair) -> None:
+        dropped.append(processed_pair)
+
+    processor.add_processing_callback(ep.ProcessingStatus.ERROR, on_error)
+
+    for index in range(4):
+        await processor.process_discovered_pair(make_event(index))
+
+    queued = [processor.stages["screen"].queue.get_nowait() for _ in range(2)]
+    assert [job.processed_pair.block_number for job in queued] == [102, 103]
+    assert processor.pairs_shed == 2
+    assert processor.get_processing_stats()["stages"]["screen"]["shed"] == 2
+    assert [pair.block_number for pair in dropped] == [100, 101]
+    assert all(pair.processing_status is ep.ProcessingStatus.ERROR for pair in dropped)
+
+
+@pytest.mark.asyncio
+async def test_expired_pairs_are_shed_before_processing():
+    """A pair older than the opportunity window is dropped by the next stage."""
+    processor = ep.EventProcessor()
+    processor.max_opportunity_age = 1.0
+    await processor.process_discovered_pair(make_event(0))
+    job = processor.stages["screen"].queue.get_nowait()
+    job.enqueued_at -= 5.0
+    processor.stages["screen"].queue.put_nowait(job)
+
+    runner = asyncio.create_task(processor.start_processing())
+    await asyncio.wait_for(_wait_for(lambda: processor.pairs_shed == 1), 5)
+    await processor.stop_processing()
+    await runner
+
+    assert processor.stages["screen"].processed == 0
+    assert processor.pairs_processed == 0
+
+
+async def _wait_for(condition: Any) -> None:
+    """Poll until a condition holds."""
+    while not condition():
+        await asyncio.sleep(0.01)
@@ -0,0 +1,381 @@
+"""
+Tests for the local buy/sell round-trip honeypot simulator.
+
+The stand-in node runs the simulator's bytecode on a minimal EVM
+interpreter, with the router and token implemented in Python (V2 pricing,
+optional transfer taxes and a sell-blocking honeypot mode).
+
+File: backend/tests/test_honeypot_simulator.py
+"""
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable, Dict, List, Tuple
+
+import pytest
+
+from app.services.honeypot_simulator import (
+    SIMULATOR_ADDRESS,
+    HoneypotSimulator,
+    SimulationStatus,
+)
+from app.services.security_providers import SecurityProvider, SecurityProviderClient
+from app.strategy.risk_manager import RiskCategory, RiskLevel, RiskManager
+
+ROUTER = "0x" + "aa" * 20
+WETH = "0x" + "ee" * 20
+PAIR = "0x" + "bb" * 20
+TOKEN = "0x" + "01" * 20
+UNLISTED = "0x" + "02" * 20
+
+MAX_UINT = 2**256 - 1
+SWAP_GAS = 120_000
+
+
+class Revert(Exception):
+    """Raised by stand-in contracts to revert the current call frame."""
+
+
+def words(data: bytes) -> List[int]:
+    """ABI words after the selector."""
+    return [int.from_bytes(data[i:i + 32], "big") for i in range(4, len(data), 32)]
+
+
+def address(word: int) -> str:
+    return "0x" + format(word, "040x")
+
+
+class World:
+    """Chain state for one eth_call: native balances and contract storage."""
+
+    def __init__(self) -> None:
+        self.eth: Dict[str, int] = {}
+        self.storage: Dict[str, Dict[str, Any]] = {}
+        self.code: Dict[str, bytes] = {}
+        self.contracts: Dict[str, Callable] = {}
+        self.gas = 30_000_000
+
+    def call(self, sender: str, to: str, data: bytes, value: int, static: bool = False) -> Tuple[bool, bytes]:
+        """Run one message call, rolling state back if it reverts."""
+        snapshot = copy.deepcopy((self.eth, self.storage))
+        try:
+            if value:
+                if static or self.eth.get(sender, 0) < value:
+                    raise Revert("value transfer")
+                self.eth[sender] -= value
+                self.eth[to] = self.eth.get(to, 0) + value
+            if to in self.contracts:
+                return True, self.contracts[to](self, sender, data, value)
+            if to in self.code:
+                return True, run_evm(self, self.code[to], to, data)
+            return True, b""
+        except Revert:
+            self.eth, self.storage = snapshot
+            return False, b""
+
+
+def run_evm(world: World, code: bytes, this: str, calldata: bytes) -> bytes:
+    """Interpret the opcodes the simulator contract uses."""
+    stack: List[int] = []
+    memory = bytearray()
+    pc = 0
+
+    def mem(offset: int, size: int) -> bytearray:
+        if len(memory) < offset + size:
+            memory.extend(bytes(offset + size - len(memory)))
+        return memory
+
+    while pc < len(code):
+        op = code[pc]
+        pc += 1
+        world.gas -= 3
+        if 0x60 <= op <= 0x7f:
+            size = op - 0x5f
+            stack.append(int.from_bytes(code[pc:pc + size], "big"))
+            pc += size
+        elif op == 0x00:
+            return b""
+        elif op == 0x03:
+            a, b = stack.pop(), stack.pop()
+            stack.append((a - b) % 2**256)
+        elif op == 0x15:
+            stack.append(int(stack.pop() == 0))
+        elif op == 0x19:
+            stack.append(MAX_UINT ^ stack.pop())
+        elif op == 0x30:
+            stack.append(int(this, 16))
+        elif op == 0x35:
+            offset = stack.pop()
+            stack.append(int.from_bytes(calldata[offset:offset + 32].ljust(32, b"\0"), "big"))
+        elif op == 0x36:
+            stack.append(len(calldata))
+        elif op == 0x47:
+            stack.append(world.eth.get(this, 0))
+        elif op == 0x51:
+            offset = stack.pop()
+            stack.append(int.from_bytes(mem(offset, 32)[offset:offset + 32], "big"))
+        elif op == 0x52:
+            offset, value = stack.pop(), stack.pop()
+            mem(offset, 32)[offset:offset + 32] = value.to_bytes(32, "big")
+        elif op == 0x56:
+            pc = stack.pop()
+            assert code[pc] == 0x5b
+        elif op == 0x57:
+            target, condition = stack.pop(), stack.pop()
+            if condition:
+                pc = target
+                assert code[pc] == 0x5b
+        elif op == 0x5a:
+            stack.append(world.gas)
+        elif op == 0x5b:
+            pass
+        elif op in (0xf1, 0xfa):
+            stack.pop()  # forwarded gas
+            to = address(stack.pop())
+            value = stack.pop() if op == 0xf1 else 0
+            args_offset, args_size, ret_offset, ret_size = (stack.pop() for _ in range(4))
+            data = bytes(mem(args_offset, args_size)[args_offset:args_offset + args_size])
+            success, output = world.call(this, to, data, value, static=op == 0xfa)
+            output = output[:ret_size]
+            mem(ret_offset, len(output))[ret_offset:ret_offset + len(output)] = output
+            stack.append(int(success))
+        elif op == 0xf3:
+            offset, size = stack.pop(), stack.pop()
+            return bytes(mem(offset, size)[offset:offset + size])
+        else:
+            raise AssertionError(f"unsupported opcode {op:#x}")
+    return b""
+
+
+def token_contract(buy_tax: float = 0.0, sell_tax: float = 0.0, block_sells: bool = False) -> Callable:
+    """ERC-20 taxing transfers out of (buys) and into (sells) the pair."""
+
+    def transfer(world: World, sender: str, recipient: str, amount: int) -> None:
+        balances = world.storage[TOKEN]["balances"]
+        if balances.get(sender, 0) < amount:
+            raise Revert("balance")
+        if recipient == PAIR and block_sells:
+            raise Revert("sells disabled")
+        tax = buy_tax if sender == PAIR else sell_tax if recipient == PAIR else 0.0
+        fee = int(amount * tax)
+        balances[sender] -= amount
+        balances[recipient] = balances.get(recipient, 0) + amount - fee
+        balances[TOKEN] = balances.get(TOKEN, 0) + fee
+
+    def token(world: World, sender: str, data: bytes, value: int) -> bytes:
+        selector, args = data[:4].hex(), words(data)
+        state = world.storage[TOKEN]
+        if selector == "70a08231":  # balanceOf
+            return state["balances"].get(address(args[0]), 0).to_bytes(32, "big")
+        if selector == "095ea7b3":  # approve
+            state["allowances"][(sender, address(args[0]))] = args[1]
+            return (1).to_bytes(32, "big")
+        if selector == "a9059cbb":  # transfer
+            transfer(world, sender, address(args[0]), args[1])
+            return (1).to_bytes(32, "big")
+        if selector == "23b872dd":  # transferFrom
+            owner, recipient, amount = address(args[0]), address(args[1]), args[2]
+            allowance = state["allowances"].get((owner, sender), 0)
+            if allowance < amount:
+                raise Revert("allowance")
+            state["allowances"][(owner, sender)] = allowance - amount
+            transfer(world, owner, recipient, amount)
+            return (1).to_bytes(32, "big")
+        raise Revert(selector)
+
+    token.transfer = transfer
+    return token
+
+
+def amount_out(amount_in: int, reserve_in: int, reserve_out: int) -> int:
+    with_fee = amount_in * 997
+    return with_fee * reserve_out // (reserve_in * 1000 + with_fee)
+
+
+def router(world: World, sender: str, data: bytes, value: int) -> bytes:
+    """Uniswap V2 router over the single WETH/TOKEN pair."""
+    selector, args = data[:4].hex(), words(data)
+    pair = world.storage[PAIR]
+    token_balance = lambda: world.storage[TOKEN]["balances"].get(PAIR, 0)
+
+    if selector == "d06ca61f":  # getAmountsOut(amountIn, path)
+        amount, path = args[0], [address(word) for word in args[3:5]]
+        if set(path) != {WETH, TOKEN}:
+            raise Revert("no pair")
+        reserves = (pair["weth"], pair["token"]) if path[0] == WETH else (pair["token"], pair["weth"])
+        out = amount_out(amount, *reserves)
+        return b"".join(word.to_bytes(32, "big") for word in (32, 2, amount, out))
+
+    world.gas -= SWAP_GAS
+    if selector == "b6f9de95":  # swapExactETHForTokensSupportingFeeOnTransferTokens
+        recipient = address(args[2])
+        out = amount_out(value, pair["weth"], pair["token"])
+        world.contracts[TOKEN].transfer(world, PAIR, recipient, out)  # Paid out by the pair
+        pair["weth"] += value
+        pair["token"] = token_balance()
+        return b""
+    if selector == "791ac947":  # swapExactTokensForETHSupportingFeeOnTransferTokens
+        amount, recipient = args[0], address(args[3])
+        ok, _ = world.call(ROUTER, TOKEN, bytes.fromhex("23b872dd") + int(sender, 16).to_bytes(32, "big")
+                           + int(PAIR, 16).to_bytes(32, "big") + amount.to_bytes(32, "big"), 0)
+        if not ok:
+            raise Revert("TransferHelper: TRANSFER_FROM_FAILED")
+        out = amount_out(token_balance() - pair["token"], pair["token"], pair["weth"])
+        pair["weth"] -= out
+        pair["token"] = token_balance()
+        ok, _ = world.call(ROUTER, recipient, b"", out)
+        if not ok:
+            raise Revert("TransferHelper: ETH_TRANSFER_FAILED")
+        return b""
+    raise Revert(selector)
+
+
+class StandInNode:
+    """RPC pool stand-in answering state-override ``eth_call`` from a fresh world."""
+
+    def __init__(self, **token_options: Any) -> None:
+        self.token_options = token_options
+        self.requests: List[Tuple[str, List]] = []
+
+    def world(self) -> World:
+        world = World()
+        world.contracts = {ROUTER: router, TOKEN: token_contract(**self.token_options)}
+        world.eth[ROUTER] = 1_000 * 10**18  # Stands in for the WETH the pair holds
+        world.storage[PAIR] = {"weth": 100 * 10**18, "token": 1_000_000 * 10**18}
+        world.storage[TOKEN] = {"balances": {PAIR: 1_000_000 * 10**18}, "allowances": {}}
+        return world
+
+    async def make_request(self, chain: str, method: str, params: List) -> Any:
+        self.requests.append((method, params))
+        assert method == "eth_call"
+        call, block, overrides = params
+        world = self.world()
+        for account, override in overrides.items():
+            world.code[account] = bytes.fromhex(override["code"][2:])
+            world.eth[account] = int(override["balance"], 16)
+        ok, output = world.call("0x" + "00" * 20, call["to"], bytes.fromhex(call["data"][2:]), 0)
+        if not ok:
+            raise Exception("execution reverted")
+        return "0x" + output.hex()
+
+
+def simulator(node: StandInNode) -> HoneypotSimulator:
+    return HoneypotSimulator(pool=node, routers={"ethereum": (ROUTER, WETH)}, amounts_in={"ethereum": 10**17})
+
+
+@pytest.mark.asyncio
+async def test_clean_token_round_trip_in_one_call():
+    """An untaxed token buys and sells with zero tax in a single eth_call."""
+    node = StandInNode()
+    result = await simulator(node).simulate(TOKEN, "ethereum")
+
+    assert result.status is SimulationStatus.OK
+    assert result.received == result.expected_buy > 0
+    assert result.eth_received == result.expected_sell > 0
+    assert (result.buy_tax, result.sell_tax, result.is_honeypot) == (0.0, 0.0, False)
+    assert result.buy_gas > SWAP_GAS and result.sell_gas > SWAP_GAS
+
+    assert len(node.requests) == 1
+    call, block, overrides = node.requests[0][1]
+    assert call["to"] == SIMULATOR_ADDRESS and block == "latest"
+    assert int(overrides[SIMULATOR_ADDRESS]["balance"], 16) == 10**17
+
+
+@pytest.mark.asyncio
+async def test_transfer_taxes_are_measured():
+    """Buy and sell taxes come from amounts actually received against the quotes."""
+    result = await simulator(StandInNode(buy_tax=0.05, sell_tax=0.12)).simulate(TOKEN, "ethereum")
+
+    assert result.status is SimulationStatus.OK
+    assert result.buy_tax == pytest.approx(0.05, abs=1e-9)
+    assert result.sell_tax == pytest.approx(0.12, abs=1e-3)
+    assert not result.is_honeypot
+
+
+@pytest.mark.asyncio
+async def test_unsellable_token_is_a_honeypot():
+    """Buying succeeds but the sell reverts, and state changes inside the call are rolled back."""
+    result = await simulator(StandInNode(block_sells=True)).simulate(TOKEN, "ethereum")
+
+    assert result.status is SimulationStatus.SELL_FAILED
+    assert result.is_honeypot
+    assert result.buy_tax == 0.0 and result.sell_tax is None
+
+
+@pytest.mark.asyncio
+async def test_statuses_for_unlisted_token_and_failed_call():
+    """No pair means no liquidity; a failing RPC is reported as an error and not cached."""
+    node = StandInNode()
+    sim = simulator(node)
+    assert (await sim.simulate(UNLISTED, "ethereum")).status is SimulationStatus.NO_LIQUIDITY
+
+    class FailingNode:
+        async def make_request(self, chain: str, method: str, params: List) -> Any:
+            raise ConnectionError("node down")
+
+    failing = HoneypotSimulator(pool=FailingNode(), routers={"ethereum": (ROUTER, WETH)})
+    result = await failing.simulate(TOKEN, "ethereum")
+    assert result.status is SimulationStatus.ERROR and "node down" in result.error
+    await failing.simulate(TOKEN, "ethereum")
+    assert failing.get_stats()["simulations"] == 2
+
+    with pytest.raises(ValueError):
+        await sim.simulate(TOKEN, "solana")
+
+
+@pytest.mark.asyncio
+async def test_risk_checks_share_one_simulation():
+    """The honeypot and tax checks of one assessment cost one eth_call."""
+    node = StandInNode(buy_tax=0.02, sell_tax=0.25)
+    manager = RiskManager(honeypot_simulator=simulator(node))
+
+    assessment = await manager.assess_token_risk(TOKEN, "ethereum", {"ethereum": object()})
+    factors = {factor.category: factor for factor in assessment.risk_factors}
+
+    assert len(node.requests) == 1
+    assert factors[RiskCategory.HONEYPOT].level is RiskLevel.LOW
+    assert factors[RiskCategory.TAX_EXCESSIVE].level is RiskLevel.HIGH
+    assert factors[RiskCategory.TAX_EXCESSIVE].score == pytest.approx(0.25, abs=1e-3)
+
+    honeypot = RiskManager(honeypot_simulator=simulator(StandInNode(block_sells=True)))
+    assessment = await honeypot.assess_token_risk(TOKEN, "ethereum", {"ethereum": object()})
+    factors = {factor.category: factor for factor in assessment.risk_factors}
+    assert factors[RiskCategory.HONEYPOT].level is RiskLevel.CRITICAL
+    assert not assessment.tradeable
+
+
+@pytest.mark.asyncio
+async def test_security_client_defaults_to_local_simulation():
+    """The aggregated security check needs no remote provider when the simulation runs."""
+    client = SecurityProviderClient(simulator=simulator(StandInNode(block_sells=True)))
+    result = await client.check_token_security(TOKEN, "ethereum")
+
+    assert list(result.provider_results) == [SecurityProvider.LOCAL_SIMULATION.value]
+    assert result.honeypot_detected and "honeypot_detected" in result.risk_factors
+
+
+@pytest.mark.asyncio
+async def test_result_cache_is_bounded():
+    """Past the bound, expired results are pruned first and then the least recently used."""
+
+    class QuoteNode:
+        async def make_request(self, chain: str, method: str, params: List) -> Any:
+            return "0x" + "00" * 32 * 7
+
+    tokens = ["0x" + f"{i:040x}" for i in range(1, 5)]
+    sim = HoneypotSimulator(pool=QuoteNode(), routers={"ethereum": (ROUTER, WETH)}, ttl=60, max_entries=2)
+    for token in tokens[:2]:
+        await sim.simulate(token, "ethereum")
+    await sim.simulate(tokens[0], "ethereum")  # Refreshes tokens[0]
+    await sim.simulate(tokens[2], "ethereum")
+
+    assert list(sim._results) == [("ethereum", tokens[0]), ("ethereum", tokens[2])]
+    assert sim.get_stats()["evictions"] == 1
+
+    sim.ttl = 0
+    await sim.simulate(tokens[3], "ethereum")
+    sim.ttl = 60
+    await sim.simulate(tokens[1], "ethereum")
+    # The expired tokens[3] is pruned rather than evicting a live entry
+    assert list(sim._results) == [("ethereum", tokens[2]), ("ethereum", tokens[1])]
+    assert sim.get_stats()["evictions"] == 2
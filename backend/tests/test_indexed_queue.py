@@ -0,0 +1,85 @@
+"""
+Tests for the indexed double-ended trade priority queue.
+
+File: backend/tests/test_indexed_queue.py
+"""
+from __future__ import annotations
+
+import random
+
+from app.autotrade.indexed_queue import IndexedPriorityQueue
+
+
+def make_queue() -> IndexedPriorityQueue:
+    """Queue of (chain, token) items indexed by chain and token."""
+    return IndexedPriorityQueue({
+        "chain": lambda item: item[0],
+        "token": lambda item: item,
+    })
+
+
+def test_max_and_min_access_with_fifo_ties():
+    """Highest score pops first, ties in insertion order; eviction takes the newest lowest."""
+    queue = make_queue()
+    queue.push("a", ("bsc", "x"), 2.0)
+    queue.push("b", ("bsc", "y"), 5.0)
+    queue.push("c", ("eth", "x"), 2.0)
+    queue.push("d", ("eth", "z"), 5.0)
+
+    assert queue.peek_min()[0] == "c"
+    assert [queue.pop_max()[0] for _ in range(2)] == ["b", "d"]
+    assert queue.pop_min()[0] == "c"
+    assert queue.pop_max()[0] == "a"
+    assert queue.pop_max() is None and len(queue) == 0
+
+
+def test_update_and_remove_keep_indexes_consistent():
+    """Handles re-rank in place and removed keys vanish from secondary indexes."""
+    queue = make_queue()
+    for index, chain in enumerate(["bsc", "bsc", "eth"]):
+        queue.push(f"t{index}", (chain, f"tok{index}"), float(index))
+
+    assert queue.update("t0", 10.0) and queue.update("t0", 1.5) and queue.update("t0", 10.0)
+    assert queue.peek_max()[0] == "t0"
+    assert queue.remove("t1") == ("bsc", "tok1")
+    assert queue.remove("t1") is None
+
+    assert [key for key, _ in queue.members("chain", "bsc")] == ["t0"]
+    assert queue.index_size("token", ("bsc", "tok1")) == 0
+    assert [key for key, _, _ in queue.ordered()] == ["t0", "t2"]
+
+
+def test_matches_sorted_reference_under_random_churn():
+    """Randomized pushes, updates, removes and pops agree with a sorted model."""
+    rng = random.Random(3)
+    queue = make_queue()
+    model = {}
+    order = {}
+
+    for step in range(5000):
+        roll = rng.random()
+        if roll < 0.4 or not model:
+            key = f"k{step}"
+            model[key] = rng.randint(0, 20)
+            order[key] = step
+            queue.push(key, ("bsc", key), model[key])
+        elif roll < 0.55:
+            key = rng.choice(list(model))
+            model[key] = rng.randint(0, 20)
+            queue.update(key, model[key])
+        elif roll < 0.7:
+            key = rng.choice(list(model))
+            del model[key]
+            queue.remove(key)
+        elif roll < 0.85:
+            expected = min(model, key=lambda key: (-model[key], order[key]))
+            assert queue.pop_max()[0] == expected
+            del model[expected]
+        else:
+            expected = min(model, key=lambda key: (model[key], -order[key]))
+            assert queue.pop_min()[0] == expected
+            del model[expected]
+        assert len(queue) == len(model)
+
+    # Tombstones are compacted rather than accumulating
+    assert len(queue._max_heap) <= 3 * len(queue) + 64 + 1
@@ -0,0 +1,115 @@
+"""
+Tests for the vectorized technical indicator library.
+
+File: backend/tests/test_indicators.py
+"""
+from __future__ import annotations
+
+import math
+import random
+import statistics
+from typing import List, Optional
+
+import numpy as np
+import pytest
+
+from app.ai import indicators
+from app.ai.indicators import IndicatorStream
+
+
+def random_walk(length: int, seed: int) -> List[float]:
+    """Positive price path."""
+    rng = random.Random(seed)
+    price, path = 100.0, []
+    for _ in range(length):
+        price *= 1 + rng.gauss(0, 0.02)
+        path.append(price)
+    return path
+
+
+def reference_ema(prices: List[float], period: int, seed: str) -> Optional[float]:
+    """Scalar EMA loop the indicators replace."""
+    k = 2 / (period + 1)
+    if seed == "first":
+        value = prices[0]
+        rest = prices[1:]
+    else:
+        if len(prices) < period:
+            return None
+        value = sum(prices[:period]) / period
+        rest = prices[period:]
+    for price in rest:
+        value = price * k + value * (1 - k)
+    return value
+
+
+SERIES = [random_walk(length, seed) for seed, length in enumerate([3, 14, 15, 20, 26, 60])]
+
+
+@pytest.mark.parametrize("seed", indicators.EMA_SEEDS)
+def test_ema_rows_match_scalar_loop(seed):
+    """Every padded row equals the scalar EMA of its own history."""
+    matrix = indicators.price_matrix(SERIES)
+    for period in (9, 12, 26):
+        latest = indicators.ema(matrix, period, seed)[:, -1]
+        for row, series in zip(latest, SERIES):
+            expected = reference_ema(series, period, seed)
+            if expected is None:
+                assert math.isnan(row)
+            else:
+                assert row == pytest.approx(expected)
+
+
+def test_window_indicators_match_statistics():
+    """RSI, bands and volatility match direct computations; short rows are NaN."""
+    matrix = indicators.price_matrix(SERIES)
+    rsi = indicators.rsi_last(matrix, 14)
+    middle, upper, lower, _ = indicators.bollinger_last(matrix, 20, ddof=1)
+    vol = indicators.volatility(matrix)
+
+    for index, series in enumerate(SERIES):
+        if len(series) >= 15:
+            changes = np.diff(series[-15:])
+            gain, loss = changes.clip(0).mean(), (-changes).clip(0).mean()
+            assert rsi[index] == pytest.approx(100 - 100 / (1 + gain / loss))
+        else:
+            assert math.isnan(rsi[index])
+        if len(series) >= 20:
+            assert middle[index] == pytest.approx(statistics.mean(series[-20:]))
+            assert upper[index] - lower[index] == pytest.approx(4 * statistics.stdev(series[-20:]))
+        returns = [(b - a) / a for a, b in zip(series, series[1:])]
+        assert vol[index] == pytest.approx(statistics.stdev(returns))
+
+
+def test_snapshot_rows_are_independent_of_batch():
+    """A token's indicators do not depend on which other tokens share the matrix."""
+    batch = indicators.compute_indicators(indicators.price_matrix(SERIES))
+    alone = indicators.compute_indicators(np.array(SERIES[-1]))
+    assert len(batch) == len(SERIES)
+    np.testing.assert_allclose(
+        list(batch.row(len(SERIES) - 1).values()), list(alone.row(0).values()), equal_nan=True
+    )
+
+
+def test_stream_matches_batch_after_every_tick():
+    """Streaming updates agree with recomputing the batch over the history so far."""
+    series = SERIES[-1]
+    stream = IndicatorStream(ema_periods=(12, 26), bb_ddof=1)
+    for end in range(1, len(series) + 1):
+        stream.update(series[end - 1])
+        history = np.array(series[:end])
+
+        slow = indicators.ema(history, 26)[0, -1]
+        assert (stream.ema(26) is None) == math.isnan(slow)
+        if stream.ema(26) is not None:
+            assert stream.ema(26) == pytest.approx(slow)
+
+        rsi = indicators.rsi_last(history)[0]
+        assert (stream.rsi is None) == math.isnan(rsi)
+        if stream.rsi is not None:
+            assert stream.rsi == pytest.approx(rsi)
+
+        bands = indicators.bollinger_last(history, ddof=1)
+        if stream.bollinger() is not None:
+            assert stream.bollinger() == pytest.approx([float(values[0]) for values in bands])
+        assert stream.volatility == pytest.approx(indicators.volatility(history)[0])
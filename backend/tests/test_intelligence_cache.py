@@ -0,0 +1,127 @@
+"""
+Tests for the shared market intelligence result cache.
+
+File: backend/tests/test_intelligence_cache.py
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.ai.intelligence_cache import IntelligenceCache, intelligence_key
+from app.ai.market_intelligence import MarketIntelligenceEngine
+
+TOKEN = "0x" + "ab" * 20
+
+
+class CountingCompute:
+    """Coroutine factory counting computations."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("analysis failed")
+        return {"version": self.calls}
+
+
+def test_keys_normalize_evm_addresses_only():
+    """Checksummed and lower-case EVM addresses share a key; base58 stays case-sensitive."""
+    assert intelligence_key("Ethereum", TOKEN.upper().replace("0X", "0x")) == intelligence_key("ethereum", TOKEN)
+    assert intelligence_key("solana", "AbC") != intelligence_key("solana", "abc")
+    assert intelligence_key("bsc", TOKEN, "pair") != intelligence_key("bsc", TOKEN, "market")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_computation():
+    """Callers arriving while a result is being computed wait for it instead of recomputing."""
+    cache = IntelligenceCache(ttl=60)
+    compute = CountingCompute(delay=0.02)
+    key = intelligence_key("bsc", TOKEN)
+
+    results = await asyncio.gather(*(cache.get_or_compute(key, compute) for _ in range(10)))
+    assert compute.calls == 1
+    assert all(result is results[0] for result in results)
+
+    assert await cache.get_or_compute(key, compute) is results[0]
+    stats = cache.get_stats()
+    assert (stats["misses"], stats["coalesced"], stats["hits"]) == (1, 9, 1)
+    assert stats["hit_rate"] == pytest.approx(10 / 11, abs=1e-3)
+
+
+@pytest.mark.asyncio
+async def test_stale_result_served_while_refreshing():
+    """After the TTL the old result is returned at once and replaced by one background refresh."""
+    cache = IntelligenceCache(ttl=0.2, stale_ttl=10)
+    compute = CountingCompute(delay=0.01)
+    key = intelligence_key("bsc", TOKEN)
+
+    first = await cache.get_or_compute(key, compute)
+    await asyncio.sleep(0.25)
+    stale = await asyncio.gather(*(cache.get_or_compute(key, compute) for _ in range(3)))
+    assert all(result is first for result in stale)
+
+    await asyncio.sleep(0.05)
+    assert compute.calls == 2
+    assert cache.get(key) == (True, {"version": 2})
+    assert cache.get_stats()["refreshes"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_and_none_are_not_cached():
+    """Errors reach the caller, failed refreshes keep the stale value, and None is retried."""
+    cache = IntelligenceCache(ttl=0.01, stale_ttl=10)
+    key = intelligence_key("bsc", TOKEN)
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_compute(key, CountingCompute(fail=True))
+
+    async def nothing() -> None:
+        return None
+
+    assert await cache.get_or_compute(key, nothing) is None
+    assert cache.get_stats()["entries"] == 0
+
+    good = await cache.get_or_compute(key, CountingCompute())
+    await asyncio.sleep(0.02)
+    assert await cache.get_or_compute(key, CountingCompute(fail=True)) is good
+    await asyncio.sleep(0)
+    assert cache.get_stats()["refresh_failures"] == 1
+    assert await cache.get_or_compute(key, CountingCompute()) is good
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_bounds_entries():
+    """The least recently used result is evicted first."""
+    cache = IntelligenceCache(max_entries=2)
+    keys = [intelligence_key("bsc", f"0x{index:040x}") for index in range(3)]
+
+    await cache.get_or_compute(keys[0], CountingCompute())
+    await cache.get_or_compute(keys[1], CountingCompute())
+    await cache.get_or_compute(keys[0], CountingCompute())
+    await cache.get_or_compute(keys[2], CountingCompute())
+
+    assert cache.get(keys[0])[0] and cache.get(keys[2])[0]
+    assert not cache.get(keys[1])[0]
+    assert cache.get_stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_engines_share_pair_intelligence():
+    """Separate engines over one cache compute a token's pair intelligence once."""
+    cache = IntelligenceCache(ttl=60)
+    first, second = MarketIntelligenceEngine(cache), MarketIntelligenceEngine(cache)
+
+    results = await asyncio.gather(
+        first.get_pair_intelligence(TOKEN, "ethereum"),
+        second.get_pair_intelligence(TOKEN.upper().replace("0X", "0x"), "ethereum"),
+    )
+    assert results[0] is not None and results[0] is results[1]
+    assert cache.get_stats()["misses"] == 1
@@ -0,0 +1,172 @@
+"""
+Tests for constant-memory ledger export writers.
+
+File: backend/tests/test_ledger_streaming.py
+"""
+from __future__ import annotations
+
+import csv
+import gzip
+import hashlib
+import tempfile
+import tracemalloc
+from datetime import datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, AsyncIterator, Dict, List
+
+import pytest
+
+from app.ledger.streaming import (
+    CSV_FIELDNAMES,
+    CsvStreamWriter,
+    LedgerSummary,
+    file_sha256,
+    ledger_csv_row,
+    ledger_xlsx_row,
+    open_archive_text,
+    write_csv_stream,
+    write_xlsx_stream,
+)
+
+
+def make_entry(index: int) -> SimpleNamespace:
+    """Ledger entry stand-in with the attributes the exporter reads."""
+    return SimpleNamespace(
+        created_at=datetime(2024, 3, 1) + timedelta(minutes=index),
+        trace_id=f"trace-{index:08d}",
+        entry_type="buy" if index % 3 else "sell",
+        description=f"Trade {index}, with a comma",
+        chain="ethereum",
+        wallet_address="0x" + "ab" * 20,
+        amount_gbp=Decimal("10.5") + index,
+        amount_native=Decimal("0.004"),
+        currency="ETH",
+        fx_rate_gbp=Decimal("2600"),
+        pnl_gbp=Decimal("1.25") if index % 3 == 0 else None,
+        pnl_native=None,
+        transaction_id=index,
+        metadata={"token_symbol": "PEPE", "slippage": "0.5"} if index % 2 else None,
+    )
+
+
+async def csv_chunks(count: int, chunk_size: int, fail_after: int = -1) -> AsyncIterator[List[Dict[str, str]]]:
+    for start in range(0, count, chunk_size):
+        if start == fail_after:
+            raise RuntimeError("cursor lost")
+        yield [ledger_csv_row(make_entry(i)) for i in range(start, min(count, start + chunk_size))]
+
+
+@pytest.mark.asyncio
+async def test_gzip_csv_counts_and_hashes_in_one_pass():
+    """Row count, sizes and checksum match what a separate read-back finds."""
+    with tempfile.TemporaryDirectory() as directory:
+        result = await write_csv_stream(Path(directory) / "ledger.csv", csv_chunks(2500, 1000), compression="gzip")
+
+        assert result.path.name == "ledger.csv.gz" and result.compression == "gzip"
+        assert result.rows == 2500
+        assert result.sha256 == file_sha256(result.path)
+        assert result.bytes_written == result.path.stat().st_size
+        raw = gzip.decompress(result.path.read_bytes())
+        assert result.raw_bytes == len(raw) and result.compression_ratio < 0.5
+
+        with open_archive_text(result.path) as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 2500 and list(rows[0]) == CSV_FIELDNAMES
+        assert rows[3]["description"] == "Trade 3, with a comma" and rows[3]["pnl_gbp"] == "1.25"
+        assert sorted(p.name for p in Path(directory).iterdir()) == ["ledger.csv.gz"]
+
+
+@pytest.mark.asyncio
+async def test_failed_export_leaves_no_file():
+    """An error mid-stream removes the partial output."""
+    with tempfile.TemporaryDirectory() as directory:
+        with pytest.raises(RuntimeError, match="cursor lost"):
+            await write_csv_stream(Path(directory) / "ledger.csv", csv_chunks(5000, 1000, fail_after=2000))
+
+        assert list(Path(directory).iterdir()) == []
+
+
+@pytest.mark.parametrize("compression", [None, "gzip", "zstd"])
+def test_abort_closes_stream_and_file(compression):
+    """Aborting closes the compressor and the handle before removing the partial file."""
+    with tempfile.TemporaryDirectory() as directory:
+        writer = CsvStreamWriter(Path(directory) / "ledger.csv", ["a", "b"], compression=compression)
+        writer.write_rows([{"a": 1, "b": 2}])
+
+        writer.abort()
+
+        assert writer._file.closed
+        if compression:
+            assert writer._stream.closed
+        assert list(Path(directory).iterdir()) == []
+
+
+async def traced_export(directory: str, count: int):
+    """Export ``count`` rows uncompressed and return (result, peak traced bytes)."""
+    tracemalloc.start()
+    try:
+        result = await write_csv_stream(Path(directory) / f"ledger_{count}.csv", csv_chunks(count, 2000))
+        return result, tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.asyncio
+async def test_plain_csv_memory_is_flat():
+    """Peak allocation does not grow with the number of rows written."""
+    with tempfile.TemporaryDirectory() as directory:
+        small, small_peak = await traced_export(directory, 8000)
+        large, large_peak = await traced_export(directory, 48_000)
+
+        assert large.rows == 48_000 and large.compression is None
+        assert large.raw_bytes == large.bytes_written > 5 * small.raw_bytes
+        assert large_peak < small_peak * 1.5
+        assert large.sha256 == hashlib.sha256(large.path.read_bytes()).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_zstd_csv_round_trip():
+    """zstd archives are readable through the same helper."""
+    pytest.importorskip("zstandard")
+    with tempfile.TemporaryDirectory() as directory:
+        result = await write_csv_stream(Path(directory) / "ledger.csv", csv_chunks(300, 100), compression="zstd")
+
+        assert result.path.suffix == ".zst" and result.sha256 == file_sha256(result.path)
+        with open_archive_text(result.path) as f:
+            assert sum(1 for _ in csv.DictReader(f)) == 300
+
+
+@pytest.mark.asyncio
+async def test_xlsx_write_only_with_streamed_summary():
+    """Rows stream into a write-only sheet and the summary is built on the way."""
+    openpyxl = pytest.importorskip("openpyxl")
+    summary = LedgerSummary()
+
+    async def chunks() -> AsyncIterator[List[List[Any]]]:
+        for start in range(0, 30, 10):
+            entries = [make_entry(i) for i in range(start, start + 10)]
+            for entry in entries:
+                summary.add(entry)
+            yield [ledger_xlsx_row(entry) for entry in entries]
+
+    with tempfile.TemporaryDirectory() as directory:
+        result = await write_xlsx_stream(Path(directory) / "ledger.xlsx", chunks(), summary=summary)
+
+        workbook = openpyxl.load_workbook(result.path, read_only=True)
+        assert workbook.sheetnames == ["Ledger", "Summary"]
+        assert workbook["Ledger"].max_row == 31 and result.rows == 30
+        assert [row[1] for row in workbook["Summary"].iter_rows(values_only=True)][-1] == 30
+
+
+def test_summary_totals():
+    """Per-type and overall totals match the entries."""
+    summary = LedgerSummary()
+    for index in range(6):
+        summary.add(make_entry(index))
+
+    rows = {row["Entry Type"]: row for row in summary.rows()}
+    assert rows["Sell"]["Count"] == 2 and rows["Buy"]["Count"] == 4
+    assert rows["TOTAL"]["Total Amount (GBP)"] == pytest.approx(sum(10.5 + i for i in range(6)))
+    assert rows["TOTAL"]["Total PnL (GBP)"] == pytest.approx(2.5)
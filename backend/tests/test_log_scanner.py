@@ -0,0 +1,182 @@
+"""
+Tests for the head-following eth_getLogs scanner.
+
+File: backend/tests/test_log_scanner.py
+"""
+from __future__ import annotations
+
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from app.discovery.log_scanner import CursorStore, LogScanner, ScanCursor, log_key
+
+FACTORY = "0x" + "fa" * 20
+TOPIC = "0x" + "0d" * 32
+
+
+class FakeChain:
+    """RPC pool stand-in holding a mutable chain of block hashes and logs."""
+
+    def __init__(self, head: int, max_range: int = 10_000) -> None:
+        self.max_range = max_range
+        self.blocks: Dict[int, Tuple[str, List[Dict[str, Any]]]] = {}
+        self.log_ranges: List[Tuple[int, int]] = []
+        for number in range(head + 1):
+            self.set_block(number, "a")
+
+    @property
+    def head(self) -> int:
+        return max(self.blocks)
+
+    def set_block(self, number: int, fork: str, log_count: int = 0) -> None:
+        """Create or replace a block with ``log_count`` PairCreated logs."""
+        block_hash = f"0x{fork}{number:063x}"
+        logs = [
+            {
+                "address": FACTORY,
+                "topics": [TOPIC],
+                "data": "0x",
+                "blockNumber": hex(number),
+                "blockHash": block_hash,
+                "logIndex": hex(index),
+                "transactionHash": f"0x{fork}{number:031x}{index:032x}",
+            }
+            for index in range(log_count)
+        ]
+        self.blocks[number] = (block_hash, logs)
+
+    async def make_request(self, chain: str, method: str, params: List) -> Any:
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getBlockByNumber":
+            block = self.blocks.get(int(params[0], 16))
+            return {"hash": block[0]} if block else None
+        if method == "eth_getLogs":
+            start, end = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+            if end - start + 1 > self.max_range:
+                raise Exception("RPC Error: block range too large")
+            self.log_ranges.append((start, end))
+            # Providers do not guarantee order; the scanner sorts
+            return [log for number in range(end, start - 1, -1) for log in self.blocks[number][1]]
+        raise AssertionError(method)
+
+
+class Recorder:
+    """Collects emitted and retracted logs."""
+
+    def __init__(self) -> None:
+        self.emitted: List[str] = []
+        self.rollbacks: List[Tuple[int, List[str]]] = []
+
+    async def on_logs(self, logs: List[Dict[str, Any]]) -> None:
+        self.emitted.extend(log["transactionHash"] for log in logs)
+
+    async def on_rollback(self, fork_block: int, logs: List[Dict[str, Any]]) -> None:
+        self.rollbacks.append((fork_block, [log["transactionHash"] for log in logs]))
+
+
+def make_scanner(chain: FakeChain, store: CursorStore, recorder: Recorder, **kwargs: Any) -> LogScanner:
+    """Create a scanner wired to fakes."""
+    return LogScanner(
+        chain="bsc",
+        addresses=[FACTORY],
+        topics=[TOPIC],
+        on_logs=recorder.on_logs,
+        on_rollback=recorder.on_rollback,
+        pool=chain,
+        store=store,
+        reorg_depth=5,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_backfills_gap_in_adaptive_chunks():
+    """A persisted cursor is resumed and oversized ranges are split."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = CursorStore(directory)
+        store.save("discovery", ScanCursor("bsc", 40))
+        chain = FakeChain(head=100, max_range=16)
+        for number in (39, 41, 77, 100):
+            chain.set_block(number, "a", log_count=2)
+        recorder = Recorder()
+        scanner = make_scanner(chain, store, recorder, max_chunk_blocks=64)
+
+        emitted = await scanner.scan_once()
+
+        assert emitted == 6
+        assert recorder.emitted == [
+            log["transactionHash"] for number in (41, 77, 100) for log in chain.blocks[number][1]
+        ]
+        assert chain.log_ranges[0][0] == 41 and chain.log_ranges[-1][1] == 100
+        assert all(end - start < 16 for start, end in chain.log_ranges)
+        assert store.load("discovery", "bsc").last_block == 100
+        # Only logs inside the reorg window are kept for deduplication
+        assert scanner._seen == {log_key(log) for log in chain.blocks[100][1]}
+
+
+@pytest.mark.asyncio
+async def test_reorg_rolls_back_and_reemits():
+    """Logs above the fork point are retracted and the new fork is scanned."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = CursorStore(directory)
+        chain = FakeChain(head=50)
+        recorder = Recorder()
+        scanner = make_scanner(chain, store, recorder)
+        await scanner.scan_once()
+
+        chain.set_block(51, "a", log_count=1)
+        chain.set_block(52, "a", log_count=1)
+        await scanner.scan_once()
+        old_logs = [log["transactionHash"] for number in (51, 52) for log in chain.blocks[number][1]]
+
+        for number in (51, 52, 53):
+            chain.set_block(number, "b", log_count=1 if number != 52 else 0)
+        await scanner.scan_once()
+
+        new_logs = [log["transactionHash"] for number in (51, 53) for log in chain.blocks[number][1]]
+        assert recorder.rollbacks == [(50, old_logs)]
+        assert recorder.emitted == old_logs + new_logs
+        assert scanner.cursor.last_block == 53
+        assert scanner.reorgs == 1
+
+
+@pytest.mark.asyncio
+async def test_restart_does_not_reemit_scanned_blocks():
+    """A new scanner sharing the store continues after the saved cursor."""
+    with tempfile.TemporaryDirectory() as directory:
+        store = CursorStore(directory)
+        chain = FakeChain(head=20)
+        first = Recorder()
+        await make_scanner(chain, store, first).scan_once()
+
+        chain.set_block(21, "a", log_count=1)
+        second = Recorder()
+        await make_scanner(chain, store, second).scan_once()
+
+        assert second.emitted == [chain.blocks[21][1][0]["transactionHash"]]
+        assert second.rollbacks == []
+
+
+@pytest.mark.asyncio
+async def test_pushed_logs_are_not_reemitted_by_scan():
+    """The range scan backfills around pushed logs without duplicating them."""
+    with tempfile.TemporaryDirectory() as directory:
+        chain = FakeChain(head=20)
+        recorder = Recorder()
+        scanner = make_scanner(chain, CursorStore(directory), recorder)
+        await scanner.scan_once()
+
+        for number in (21, 22, 23):
+            chain.set_block(number, "a", log_count=1)
+        # The subscription only saw block 22's log
+        assert await scanner.push_logs(chain.blocks[22][1]) == 1
+        assert await scanner.push_logs(chain.blocks[22][1]) == 0
+        await scanner.scan_once()
+
+        expected = [chain.blocks[number][1][0]["transactionHash"] for number in (22, 21, 23)]
+        assert recorder.emitted == expected
+        assert scanner.logs_pushed == 1
+        assert scanner.cursor.last_block == 23
@@ -36,6 +36,7 @@ from app.ai.market_intelligence import (
     CoordinationPattern,
     get_market_intelligence_engine
 )
+from app.ai.intelligence_cache import IntelligenceCache
 
 
 class TestSentimentAnalyzer:
@@ -460,7 +461,7 @@ class TestMarketIntelligenceEngine:
     @pytest.fixture
     def engine(self):
         """Create MarketIntelligenceEngine instance for testing."""
-        return MarketIntelligenceEngine()
+        return MarketIntelligenceEngine(intelligence_cache=IntelligenceCache())
     
     @pytest.fixture
     def complete_market_data(self):
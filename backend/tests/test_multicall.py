@@ -0,0 +1,148 @@
+"""
+Tests for Multicall3 aggregation and ABI helpers.
+
+File: backend/tests/test_multicall.py
+"""
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import pytest
+
+from app.chains.multicall import (
+    ERC20_DECIMALS_SELECTOR,
+    ERC20_SYMBOL_SELECTOR,
+    MulticallAggregator,
+    MulticallCall,
+    MulticallError,
+    _pad32,
+    decode_reserves,
+    decode_string,
+    encode_aggregate3,
+    encode_call,
+    pair_state_calls,
+    token_metadata_calls,
+)
+
+WORD = 32
+
+
+def encode_results(items: List[Tuple[bool, bytes]]) -> str:
+    """Encode an aggregate3 return value the way Multicall3 does."""
+    encoded = [
+        (1 if ok else 0).to_bytes(WORD, "big")
+        + (2 * WORD).to_bytes(WORD, "big")
+        + len(data).to_bytes(WORD, "big")
+        + _pad32(data)
+        for ok, data in items
+    ]
+    offsets, position = [], len(items) * WORD
+    for item in encoded:
+        offsets.append(position.to_bytes(WORD, "big"))
+        position += len(item)
+    body = WORD.to_bytes(WORD, "big") + len(items).to_bytes(WORD, "big")
+    return "0x" + (body + b"".join(offsets) + b"".join(encoded)).hex()
+
+
+def decode_request(data: str) -> List[Tuple[str, bool, str]]:
+    """Decode aggregate3 calldata back into (target, allow_failure, calldata)."""
+    raw = bytes.fromhex(data[10:])
+    word = lambda offset: int.from_bytes(raw[offset:offset + WORD], "big")  # noqa: E731
+    start = word(0)
+    count = word(start)
+    body = start + WORD
+    calls = []
+    for index in range(count):
+        item = body + word(body + index * WORD)
+        data_start = item + word(item + 2 * WORD)
+        length = word(data_start)
+        calls.append((
+            "0x" + raw[item + 12:item + WORD].hex(),
+            bool(word(item + WORD)),
+            raw[data_start + WORD:data_start + WORD + length].hex(),
+        ))
+    return calls
+
+
+class FakePool:
+    """RPC pool stand-in that answers aggregate3 calls from a handler."""
+
+    def __init__(self, handler) -> None:
+        self.handler = handler
+        self.requests: List[Tuple[str, Any]] = []
+
+    async def make_request(self, chain: str, method: str, params: List) -> Any:
+        self.requests.append((method, params))
+        if method == "eth_blockNumber":
+            return "0x64"
+        return encode_results([self.handler(call) for call in decode_request(params[0]["data"])])
+
+
+def test_aggregate3_calldata_round_trip():
+    """Encoded calldata preserves targets, flags and inner calldata."""
+    calls = [
+        MulticallCall("0x" + "11" * 20, encode_call(ERC20_SYMBOL_SELECTOR)),
+        MulticallCall("0x" + "22" * 20, "0x" + "ab" * 37, allow_failure=False),
+    ]
+
+    decoded = decode_request(encode_aggregate3(calls))
+
+    assert decoded == [
+        ("0x" + "11" * 20, True, ERC20_SYMBOL_SELECTOR),
+        ("0x" + "22" * 20, False, "ab" * 37),
+    ]
+
+
+def test_decode_string_handles_dynamic_and_bytes32():
+    """Both ABI strings and bytes32 symbols decode to text."""
+    dynamic = WORD.to_bytes(WORD, "big") + (4).to_bytes(WORD, "big") + _pad32(b"PEPE")
+    assert decode_string(dynamic) == "PEPE"
+    assert decode_string(b"MKR".ljust(WORD, b"\x00")) == "MKR"
+
+
+@pytest.mark.asyncio
+async def test_aggregate_decodes_results_in_order():
+    """Results are decoded per call and failures are reported individually."""
+    def handler(call):
+        selector = call[2][:8]
+        if selector == ERC20_DECIMALS_SELECTOR:
+            return False, b""
+        if selector == ERC20_SYMBOL_SELECTOR:
+            return True, b"TKN".ljust(WORD, b"\x00")
+        return True, b"Token".ljust(WORD, b"\x00")
+
+    pool = FakePool(handler)
+    aggregator = MulticallAggregator(pool=pool)
+
+    symbol, decimals, name = await aggregator.aggregate(
+        "ethereum", token_metadata_calls("0x" + "11" * 20)
+    )
+
+    assert (symbol.success, symbol.value) == (True, "TKN")
+    assert decimals.success is False
+    assert name.value == "Token"
+    assert [method for method, _ in pool.requests] == ["eth_call"]
+
+
+@pytest.mark.asyncio
+async def test_chunked_aggregate_pins_one_block():
+    """Calls split across batches are all read at the same block."""
+    reserves = b"".join(value.to_bytes(WORD, "big") for value in (5, 7, 9))
+    pool = FakePool(lambda call: (True, reserves))
+    aggregator = MulticallAggregator(pool=pool, max_calls_per_batch=1)
+
+    results = await aggregator.aggregate("bsc", pair_state_calls("0x" + "33" * 20)[:1] * 3)
+
+    assert [result.value for result in results] == [(5, 7, 9)] * 3
+    assert pool.requests[0][0] == "eth_blockNumber"
+    assert all(params[1] == "0x64" for method, params in pool.requests[1:])
+    assert decode_reserves(reserves) == (5, 7, 9)
+
+
+@pytest.mark.asyncio
+async def test_unsupported_chain_raises():
+    """Chains without a known Multicall3 deployment are rejected."""
+    aggregator = MulticallAggregator(pool=FakePool(lambda call: (True, b"")))
+
+    with pytest.raises(MulticallError):
+        await aggregator.aggregate("solana", token_metadata_calls("0x" + "11" * 20))
@@ -0,0 +1,107 @@
+"""
+Tests for retrying failed executions in the order trigger monitor.
+
+File: backend/tests/test_order_triggers.py
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, List, Optional, Tuple
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from backend.app.services.price_bus import PriceTickBus
+from backend.app.storage.models import OrderStatus
+from backend.app.strategy.orders.triggers import OrderTriggerMonitor
+
+PAIR = "0x" + "aa" * 20
+
+
+class FakeOrderRepo:
+    """Records status updates and notifies listeners like the real repository."""
+
+    def __init__(self, order: SimpleNamespace) -> None:
+        self.order = order
+        self.statuses: List[Tuple[OrderStatus, Optional[str]]] = []
+        self.listeners: List[Callable] = []
+
+    def add_change_listener(self, listener: Callable) -> None:
+        self.listeners.append(listener)
+
+    def remove_change_listener(self, listener: Callable) -> None:
+        self.listeners.remove(listener)
+
+    async def get_active_orders(self) -> List[SimpleNamespace]:
+        return [self.order]
+
+    async def update_order_status(
+        self, order_id: str, status: OrderStatus, error_message: Optional[str] = None, **kwargs: Any
+    ) -> bool:
+        self.statuses.append((status, error_message))
+        committed = SimpleNamespace(**{**vars(self.order), "status": status.value})
+        for listener in self.listeners:
+            listener("updated", committed)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_failing_execution_backs_off_then_marks_order_failed():
+    """Each failure holds the order out of the books for longer; the last one fails it."""
+    order = SimpleNamespace(
+        order_id="sl-1", status="active", order_type="stop_loss", chain="ethereum",
+        token_address="0x" + "01" * 20, pair_address=PAIR, side="sell",
+        parameters={"stop_price": "1.0"}, position_id=None,
+    )
+    repo = FakeOrderRepo(order)
+    monitor = OrderTriggerMonitor(
+        repo, None, None, tick_bus=PriceTickBus(), max_execution_attempts=3, retry_backoff=0.1
+    )
+    repo.add_change_listener(monitor._on_order_change)
+    monitor._index_order(order)
+
+    submitted = []
+
+    async def failing_trade(order: Any, price: Decimal) -> SimpleNamespace:
+        submitted.append(price)
+        return SimpleNamespace(success=False, error_message="router reverted")
+
+    monitor._submit_trade = failing_trade
+
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.9"))
+    assert len(submitted) == 1
+    assert monitor.get_monitoring_stats()["backoff_orders_count"] == 1
+
+    # Backing off: further ticks and checks do not resubmit
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.8"))
+    await monitor._check_all_triggers()
+    assert len(submitted) == 1
+
+    await asyncio.sleep(0.12)
+    monitor._release_backoff()
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.8"))
+    assert len(submitted) == 2
+
+    # Second backoff is doubled
+    await asyncio.sleep(0.12)
+    monitor._release_backoff()
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.8"))
+    assert len(submitted) == 2
+    await asyncio.sleep(0.12)
+    monitor._release_backoff()
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.8"))
+    assert len(submitted) == 3
+
+    assert repo.statuses[-1] == (OrderStatus.FAILED, "router reverted")
+    assert [status for status, _ in repo.statuses].count(OrderStatus.ACTIVE) == 2
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.7"))
+    await asyncio.sleep(0.45)
+    monitor._release_backoff()
+    await monitor.on_price_tick("ethereum", PAIR, Decimal("0.7"))
+    assert len(submitted) == 3
+    assert monitor.get_monitoring_stats()["active_orders_count"] == 0
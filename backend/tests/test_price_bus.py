@@ -0,0 +1,117 @@
+"""
+Tests for the in-process price tick bus.
+
+File: backend/tests/test_price_bus.py
+"""
+from __future__ import annotations
+
+import asyncio
+from decimal import Decimal
+from typing import List
+
+import pytest
+
+from app.services.price_bus import PriceSubscription, PriceTick, PriceTickBus
+
+PAIR_A = "0x" + "AA" * 20
+PAIR_B = "0x" + "bb" * 20
+TOKEN = "0x" + "01" * 20
+
+
+def tick(pair: str, price: str, **kwargs) -> PriceTick:
+    """Build a tick for a test pair."""
+    return PriceTick(chain="ethereum", token_address=TOKEN, pair_address=pair, price=Decimal(price), source="test", **kwargs)
+
+
+def test_addresses_are_normalized_per_chain():
+    """EVM addresses are lower-cased; Solana mints keep their case."""
+    assert tick(PAIR_A, "1").key == ("ethereum", PAIR_A.lower())
+    mint = "So11111111111111111111111111111111111111112"
+    assert PriceTick(chain="solana", token_address=mint, price=Decimal(1), source="test").key == ("solana", mint)
+
+
+def test_queue_conflates_per_pair_and_drops_oldest_when_full():
+    """Newer ticks replace waiting ones in place; overflow evicts the oldest pair."""
+    async def noop(_: PriceTick) -> None:
+        return None
+
+    subscription = PriceSubscription("slow", noop, max_pending=2)
+    subscription.offer(tick(PAIR_A, "1"))
+    subscription.offer(tick(PAIR_B, "2"))
+    subscription.offer(tick(PAIR_A, "3"))
+    assert len(subscription) == 2 and subscription.conflated == 1
+
+    subscription.offer(tick("0x" + "cc" * 20, "4"))
+    assert subscription.dropped == 1
+    assert [key[1] for key in subscription._pending] == [PAIR_B, "0x" + "cc" * 20]
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_stall_fast_one():
+    """A blocked consumer keeps only the latest tick while others see every tick."""
+    bus = PriceTickBus()
+    release = asyncio.Event()
+    fast: List[Decimal] = []
+    slow: List[Decimal] = []
+
+    async def fast_handler(received: PriceTick) -> None:
+        fast.append(received.price)
+
+    async def slow_handler(received: PriceTick) -> None:
+        await release.wait()
+        slow.append(received.price)
+
+    bus.subscribe("fast", fast_handler)
+    slow_subscription = bus.subscribe("slow", slow_handler)
+
+    for price in ("1", "2", "3", "4"):
+        bus.publish(tick(PAIR_A, price))
+        await asyncio.sleep(0)
+
+    assert fast == [Decimal(p) for p in ("1", "2", "3", "4")]
+    release.set()
+    await asyncio.sleep(0.01)
+    # First tick was in flight when the rest arrived and were conflated
+    assert slow == [Decimal("1"), Decimal("4")]
+    assert slow_subscription.conflated == 2
+    assert bus.latest("ethereum", PAIR_A).price == Decimal("4")
+    await bus.stop()
+
+
+@pytest.mark.asyncio
+async def test_filter_and_handler_errors_are_isolated():
+    """Rejected ticks never queue and a failing handler keeps its worker alive."""
+    bus = PriceTickBus()
+    seen: List[PriceTick] = []
+
+    async def flaky(received: PriceTick) -> None:
+        if received.price < 0:
+            raise ValueError("bad tick")
+        seen.append(received)
+
+    subscription = bus.subscribe("usd_only", flaky, accept=lambda t: t.price_usd is not None)
+    bus.publish(tick(PAIR_A, "1"))
+    bus.publish(tick(PAIR_A, "-1", price_usd=Decimal("-1")))
+    await asyncio.sleep(0)
+    bus.publish(tick(PAIR_B, "2", price_usd=Decimal("2")))
+    await asyncio.sleep(0)
+
+    assert [t.pair_address for t in seen] == [PAIR_B]
+    assert subscription.errors == 1 and subscription.received == 2
+    assert await bus.unsubscribe("usd_only") and not subscription.is_running
+
+
+def test_quote_tick_does_not_replace_latest_usd_tick():
+    """A reserve tick without a USD price leaves the pair's latest USD tick for replay."""
+    bus = PriceTickBus()
+    bus.publish(tick(PAIR_A, "0.0005", price_usd=Decimal("1.25")))
+    bus.publish(tick(PAIR_A, "0.0006", quote_token=TOKEN))
+    assert bus.latest("ethereum", PAIR_A).price_usd == Decimal("1.25")
+
+    bus.publish(tick(PAIR_A, "0.0007", price_usd=Decimal("1.5")))
+    assert bus.latest("ethereum", PAIR_A).price_usd == Decimal("1.5")
+
+    # Pairs only ever priced in their quote token still record it
+    bus.publish(tick(PAIR_B, "3", quote_token=TOKEN))
+    bus.publish(tick(PAIR_B, "4", quote_token=TOKEN))
+    assert bus.latest("ethereum", PAIR_B).price == Decimal("4")
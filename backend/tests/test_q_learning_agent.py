@@ -0,0 +1,113 @@
+"""
+Tests for the array-backed Q-learning agent.
+
+File: backend/tests/test_q_learning_agent.py
+"""
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.ai.reinforcement_learning import (
+    ActionType,
+    MarketState,
+    QLearningAgent,
+    ReinforcementLearningSystem,
+    ReplayMemory,
+)
+
+
+def market_state(rsi: float = 50.0, price_change_5m: float = 0.0, volatility: float = 0.02) -> MarketState:
+    """Market state varying only in the discretized features under test."""
+    return MarketState(
+        price=Decimal("1.0"), price_change_1m=0.0, price_change_5m=price_change_5m,
+        price_change_15m=0.0, price_momentum=0.0, volume_ratio=1.0, volume_trend=0.0,
+        rsi=rsi, macd=0.0, bollinger_position=0.5, liquidity_score=0.7,
+        volatility=volatility, bid_ask_spread=0.001, current_position_size=0.2,
+        unrealized_pnl=0.0, cash_available=1.0, risk_exposure=0.1,
+        time_in_position=0, market_session="american", sentiment_score=0.0,
+    )
+
+
+def test_state_index_is_a_dense_code_of_the_bins():
+    """Distinct discrete states map to distinct rows; out-of-range changes clamp to the edge bins."""
+    rng = random.Random(4)
+    states = [market_state(rng.uniform(0, 100), rng.uniform(-0.3, 0.3), rng.uniform(0, 0.2)) for _ in range(500)]
+    keys = {}
+    for state in states:
+        index = state.state_index()
+        assert 0 <= index < 10 ** 5
+        assert keys.setdefault(state.discretize(), index) == index
+    assert len(set(keys.values())) == len(keys)
+    assert market_state(price_change_5m=-0.5).discretize().startswith("0_")
+    assert market_state(rsi=80).state_index(n_states=7) == market_state(rsi=80).state_index() % 7
+
+
+def test_online_update_matches_tabular_rule():
+    """update_q_value applies Q <- (1 - lr) Q + lr (r + gamma max Q') and records the transition."""
+    agent = QLearningAgent(learning_rate=0.5, discount_factor=0.9, exploration_rate=0.0)
+    s, s_next = market_state(rsi=30), market_state(rsi=70)
+    agent.q_values[agent.state_index(s_next)] = [0.2, 1.0, -0.4]
+
+    agent.update_q_value(s, ActionType.SELL, 2.0, s_next)
+    assert agent.action_values(s)[1] == pytest.approx(0.5 * (2.0 + 0.9 * 1.0))
+    assert agent.get_action(s, training=False) is ActionType.SELL
+    assert len(agent.experience_buffer) == 1
+
+    agent.update_q_value(s_next, ActionType.BUY, -1.0, s, done=True)
+    assert agent.action_values(s_next)[0] == pytest.approx(0.5 * 0.2 + 0.5 * -1.0)
+    assert agent.get_q_table_summary()["states"] == 2
+
+
+def test_batched_replay_matches_sequential_updates_on_distinct_pairs():
+    """Without repeated state-action pairs, the vectorized replay equals applying samples one by one."""
+    agent = QLearningAgent(learning_rate=0.3, discount_factor=0.9, n_states=64, replay_capacity=64)
+    rng = np.random.default_rng(2)
+    agent.q_values[:] = rng.normal(size=agent.q_values.shape)
+    for state in range(64):
+        agent.experience_buffer.append(state, state % 3, float(rng.normal()), (state * 7 + 1) % 64, state % 5 == 0)
+    exploration_rate = agent.exploration_rate
+
+    # Seed 7 draws 16 distinct slots, hence 16 distinct state-action pairs
+    agent._rng = np.random.default_rng(7)
+    states, actions, rewards, next_states, dones = agent.experience_buffer.sample(16, np.random.default_rng(7))
+    assert len(set(states.tolist())) == 16
+    expected = agent.q_values.copy()
+    before = agent.q_values.copy()
+    for s, a, r, n, d in zip(states, actions, rewards, next_states, dones):
+        target = r + (0.0 if d else 0.9 * before[n].max())
+        expected[s, a] += 0.3 * (target - before[s, a])
+
+    agent.experience_replay(batch_size=16)
+    np.testing.assert_allclose(agent.q_values, expected)
+    assert agent.exploration_rate == exploration_rate
+    assert len(agent.experience_buffer) == 64
+
+
+def test_replay_memory_overwrites_oldest():
+    """The ring buffer keeps the latest ``capacity`` transitions."""
+    memory = ReplayMemory(capacity=4)
+    for step in range(6):
+        memory.append(step, 0, float(step), step + 1, False)
+    assert len(memory) == 4
+    assert sorted(memory.states.tolist()) == [2, 3, 4, 5]
+
+
+def test_table_persists_through_memory_map(tmp_path):
+    """A reopened agent sees the learned values; a mismatched file is replaced."""
+    path = tmp_path / "rl" / "q_table.npy"
+    system = ReinforcementLearningSystem(q_table_path=path)
+    agent = system.q_learning_agent
+    agent.update_q_value(market_state(rsi=25), ActionType.BUY, 1.0, market_state(rsi=35))
+    agent.flush()
+    del system, agent
+
+    reopened = QLearningAgent(table_path=path)
+    assert reopened.action_values(market_state(rsi=25))[0] == pytest.approx(0.1)
+    assert reopened.get_q_table_summary()["total_updates"] == 1
+
+    resized = QLearningAgent(table_path=path, n_states=100)
+    assert resized.q_values.shape == (100, 3) and not resized.q_values.any()
@@ -0,0 +1,128 @@
+"""
+Tests for the Sync-driven V2 reserve mirror.
+
+File: backend/tests/test_reserve_mirror.py
+"""
+from __future__ import annotations
+
+from typing import Any, List, Tuple
+
+import pytest
+
+from app.chains.multicall import MulticallResult
+from app.dex.reserve_mirror import SYNC_TOPIC, ReserveMirror, get_amount_out
+
+FACTORY = "0x" + "fa" * 20
+PAIR = "0x" + "aa" * 20
+TOKEN_A = "0x" + "01" * 20
+TOKEN_B = "0x" + "02" * 20
+
+
+def sync_log(block: int, log_index: int, reserve0: int, reserve1: int, removed: bool = False) -> dict:
+    """Build a raw Sync log for the test pair."""
+    return {
+        "address": PAIR,
+        "topics": [SYNC_TOPIC],
+        "data": "0x" + reserve0.to_bytes(32, "big").hex() + reserve1.to_bytes(32, "big").hex(),
+        "blockNumber": hex(block),
+        "logIndex": hex(log_index),
+        "removed": removed,
+    }
+
+
+class FakePool:
+    """RPC pool stand-in serving a head block and queued logs."""
+
+    def __init__(self, head: int) -> None:
+        self.head = head
+        self.logs: List[dict] = []
+        self.requests: List[Tuple[str, Any]] = []
+
+    async def make_request(self, chain: str, method: str, params: List) -> Any:
+        self.requests.append((method, params))
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        if method == "eth_getLogs":
+            return self.logs
+        raise AssertionError(method)
+
+
+class FakeAggregator:
+    """Multicall stand-in returning fixed reserves."""
+
+    def __init__(self, reserves: Tuple[int, int]) -> None:
+        self.reserves = reserves
+        self.blocks: List[str] = []
+
+    async def aggregate(self, chain: str, calls: List, block_identifier: str = "latest") -> List:
+        self.blocks.append(block_identifier)
+        return [MulticallResult(True, (*self.reserves, 0), b"") for _ in calls]
+
+
+def make_mirror(head: int = 100, reserves: Tuple[int, int] = (1000, 2000)) -> ReserveMirror:
+    """Create a mirror wired to fakes."""
+    return ReserveMirror(pool=FakePool(head), aggregator=FakeAggregator(reserves), auto_sync=False)
+
+
+def test_get_amount_out_matches_router_formula():
+    """Output follows UniswapV2Library.getAmountOut including the fee."""
+    assert get_amount_out(10**18, 10**21, 2 * 10**21, 30) == 1992013962079806432
+    assert get_amount_out(10**18, 10**21, 2 * 10**21, 25) > get_amount_out(10**18, 10**21, 2 * 10**21, 30)
+    assert get_amount_out(0, 10, 10, 30) == 0
+
+
+def test_registered_pair_quotes_in_both_directions():
+    """A freshly registered pair is quoted locally with the right reserve order."""
+    mirror = make_mirror()
+    mirror.register_pair("bsc", FACTORY, PAIR, TOKEN_A, TOKEN_B, 1000, 2000, fee_bps=25)
+
+    amounts, hops = mirror.get_amounts_out("bsc", FACTORY, [TOKEN_B, TOKEN_A], 100)
+
+    assert amounts == [100, get_amount_out(100, 2000, 1000, 25)]
+    assert hops[0].pair_address == PAIR
+    assert mirror.get_amounts_out("bsc", FACTORY, [TOKEN_A, "0x" + "03" * 20], 100) is None
+
+
+@pytest.mark.asyncio
+async def test_sync_logs_update_reserves_in_order():
+    """Seeding pins a block and later Sync logs apply in (block, logIndex) order."""
+    mirror = make_mirror(head=100)
+    mirror.register_pair("bsc", FACTORY, PAIR, TOKEN_A, TOKEN_B, 1, 1)
+
+    await mirror.sync_once("bsc")
+    state = mirror.get_pair("bsc", FACTORY, TOKEN_A, TOKEN_B)
+    assert (state.reserve0, state.reserve1) == (1000, 2000)
+    assert mirror.aggregator.blocks == [hex(100)]
+
+    mirror.pool.head = 102
+    mirror.pool.logs = [sync_log(102, 0, 7, 8), sync_log(101, 3, 5, 6)]
+    assert await mirror.sync_once("bsc") == 2
+    assert (state.reserve0, state.reserve1) == (7, 8)
+
+    # Logs at or before the applied position are ignored
+    assert mirror.apply_sync_log("bsc", sync_log(100, 9, 1, 1)) is False
+
+
+@pytest.mark.asyncio
+async def test_removed_log_forces_reseed():
+    """A reorged Sync log marks the pair for re-seeding at the next head."""
+    mirror = make_mirror(head=100)
+    mirror.register_pair("bsc", FACTORY, PAIR, TOKEN_A, TOKEN_B, 1, 1)
+    await mirror.sync_once("bsc")
+
+    mirror.pool.head = 101
+    mirror.pool.logs = [sync_log(101, 0, 5, 6, removed=True)]
+    await mirror.sync_once("bsc")
+
+    assert mirror.aggregator.blocks == [hex(100), hex(101)]
+    state = mirror.get_pair("bsc", FACTORY, TOKEN_A, TOKEN_B)
+    assert state.needs_seed is False
+
+
+def test_unsynced_pair_goes_stale():
+    """Without a running follower, RPC-read reserves expire after about a block."""
+    mirror = make_mirror()
+    state = mirror.register_pair("bsc", FACTORY, PAIR, TOKEN_A, TOKEN_B, 1000, 2000)
+    state.updated_at -= 60
+
+    assert mirror.get_pair("bsc", FACTORY, TOKEN_A, TOKEN_B) is None
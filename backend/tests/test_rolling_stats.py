@@ -0,0 +1,88 @@
+"""
+Tests for incremental rolling statistics and the anomaly buffers built on them.
+
+File: backend/tests/test_rolling_stats.py
+"""
+from __future__ import annotations
+
+import random
+import statistics
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from app.ai.anomaly_detector import AnomalyType, StatisticalAnomalyDetector, TimeSeriesBuffer, TokenAnomalyTracker
+from app.ai.rolling_stats import RollingWindow
+
+
+@pytest.mark.parametrize("capacity", [1, 2, 5, 9, 100])
+def test_window_matches_full_recompute(capacity):
+    """Every summary equals a from-scratch computation after each append."""
+    rng = random.Random(capacity)
+    window = RollingWindow(capacity)
+    values = []
+
+    for _ in range(600):
+        # Mix of continuous values and repeats to exercise ties
+        value = rng.gauss(100, 15) if rng.random() < 0.7 else float(rng.randint(90, 95))
+        window.append(value)
+        values.append(value)
+        recent = values[-capacity:]
+
+        assert window.values().tolist() == recent
+        assert window.mean == pytest.approx(statistics.mean(recent))
+        median = statistics.median(recent)
+        assert window.median() == median
+        assert window.mad() == pytest.approx(statistics.median([abs(v - median) for v in recent]))
+        if len(recent) > 1:
+            assert window.std == pytest.approx(statistics.stdev(recent), abs=1e-6)
+            assert window.quartiles() == pytest.approx(statistics.quantiles(recent, n=4))
+            assert window.slope() == pytest.approx(np.polyfit(np.arange(len(recent)), recent, 1)[0], abs=1e-7)
+
+
+def test_constant_window_has_zero_deviation():
+    """Sliding updates over identical values do not leave residual variance."""
+    window = RollingWindow(9)
+    for value in [3.7, 120.5, 0.001] * 5 + [42.0] * 30:
+        window.append(value)
+    assert window.std == 0.0 and window.z_score(50.0) == 0.0
+
+
+def test_buffer_lookback_windows_follow_inserts():
+    """Lookback windows created late are backfilled and then kept current."""
+    buffer = TimeSeriesBuffer(max_size=20)
+    for i in range(15):
+        buffer.add_point(datetime.utcnow(), Decimal(i * i))
+    assert buffer.calculate_mean(5) == statistics.mean([i * i for i in range(10, 15)])
+
+    buffer.add_point(datetime.utcnow(), Decimal(1000))
+    recent = [i * i for i in range(11, 15)] + [1000]
+    assert buffer.get_recent_values(5) == recent
+    assert buffer.calculate_std(5) == pytest.approx(statistics.stdev(recent))
+    assert buffer.calculate_trend() == pytest.approx(np.polyfit(range(16), buffer.get_values(), 1)[0])
+
+
+def test_detectors_accept_windows_and_lists_alike():
+    """Window-backed and list-backed detector calls agree."""
+    detector = StatisticalAnomalyDetector()
+    values = [10.0, 11.0, 9.5, 10.2, 10.8, 9.9, 10.1, 30.0]
+    window = RollingWindow(len(values))
+    for value in values:
+        window.append(value)
+
+    for method in (detector.detect_z_score_anomaly, detector.detect_iqr_anomaly, detector.detect_mad_anomaly):
+        assert method(window, 25.0) == method(values, 25.0)
+    assert detector.detect_mad_anomaly(values, 25.0)[0]
+
+
+def test_tracker_flags_crash_against_previous_prices():
+    """A crash is scored against the prior nine prices, not including itself."""
+    tracker = TokenAnomalyTracker("0x" + "11" * 20, "ethereum")
+    for price in ["1.00", "1.01", "0.99", "1.00", "1.02", "0.98", "1.00", "1.01", "0.99"]:
+        assert tracker.update_price(Decimal(price)) is None
+
+    alert = tracker.update_price(Decimal("0.40"))
+    assert alert is not None and alert.anomaly_type is AnomalyType.PRICE_CRASH
+    assert alert.evidence["price_change_pct"] == pytest.approx(60.0, abs=0.1)
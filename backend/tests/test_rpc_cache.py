@@ -0,0 +1,114 @@
+"""
+Tests for the block-scoped RPC response cache.
+
+File: backend/tests/test_rpc_cache.py
+"""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.chains.rpc_cache import CachePolicy, RpcResponseCache
+
+TOKEN = "0x" + "11" * 20
+DECIMALS_CALL = [{"to": TOKEN, "data": "0x313ce567"}, "latest"]
+BALANCE_CALL = [{"to": TOKEN, "data": "0x70a08231" + "00" * 32}, "latest"]
+
+
+class CountingFetch:
+    """Coroutine factory counting upstream calls."""
+
+    def __init__(self, result: str = "0x12", delay: float = 0.0) -> None:
+        self.result = result
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return self.result
+
+
+def test_classification():
+    """Methods and call selectors map to the expected policies."""
+    cache = RpcResponseCache()
+
+    assert cache.classify("eth_chainId", []) is CachePolicy.IMMUTABLE
+    assert cache.classify("eth_call", DECIMALS_CALL) is CachePolicy.IMMUTABLE
+    assert cache.classify("eth_call", BALANCE_CALL) is CachePolicy.BLOCK
+    assert cache.classify("eth_getTransactionCount", ["0xabc", "pending"]) is CachePolicy.UNCACHEABLE
+    assert cache.classify("eth_getTransactionCount", ["0xabc", "latest"]) is CachePolicy.UNCACHEABLE
+    assert cache.classify("eth_estimateGas", [{"to": "0xabc"}, "latest"]) is CachePolicy.UNCACHEABLE
+    assert cache.classify("eth_sendRawTransaction", ["0xdead"]) is CachePolicy.UNCACHEABLE
+
+
+@pytest.mark.asyncio
+async def test_immutable_entries_survive_new_heads():
+    """Immutable reads are fetched once regardless of head changes."""
+    cache = RpcResponseCache()
+    fetch = CountingFetch()
+
+    await cache.get_or_fetch("bsc", "eth_call", DECIMALS_CALL, CachePolicy.IMMUTABLE, fetch)
+    cache.observe_head("bsc", 100)
+    result = await cache.get_or_fetch("bsc", "eth_call", DECIMALS_CALL, CachePolicy.IMMUTABLE, fetch)
+
+    assert result == "0x12"
+    assert fetch.calls == 1
+    assert cache.get_stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_block_entries_invalidate_on_new_head():
+    """Block-scoped reads are reused within a block and refetched after it."""
+    cache = RpcResponseCache()
+    fetch = CountingFetch()
+    cache.observe_head("bsc", 100)
+
+    await cache.get_or_fetch("bsc", "eth_call", BALANCE_CALL, CachePolicy.BLOCK, fetch)
+    await cache.get_or_fetch("bsc", "eth_call", BALANCE_CALL, CachePolicy.BLOCK, fetch)
+    assert fetch.calls == 1
+
+    cache.observe_head("bsc", 101)
+    await cache.get_or_fetch("bsc", "eth_call", BALANCE_CALL, CachePolicy.BLOCK, fetch)
+    assert fetch.calls == 2
+    assert cache.get_stats()["invalidations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_are_coalesced():
+    """Identical in-flight requests share one upstream call."""
+    cache = RpcResponseCache()
+    fetch = CountingFetch(delay=0.01)
+
+    results = await asyncio.gather(*[
+        cache.get_or_fetch("base", "eth_call", BALANCE_CALL, CachePolicy.BLOCK, fetch)
+        for _ in range(10)
+    ])
+
+    assert results == ["0x12"] * 10
+    assert fetch.calls == 1
+    assert cache.get_stats()["coalesced"] == 9
+
+
+@pytest.mark.asyncio
+async def test_empty_immutable_results_are_not_cached():
+    """A missing contract may be deployed later, so empty reads are retried."""
+    cache = RpcResponseCache()
+    fetch = CountingFetch(result="0x")
+
+    await cache.get_or_fetch("base", "eth_call", DECIMALS_CALL, CachePolicy.IMMUTABLE, fetch)
+    await cache.get_or_fetch("base", "eth_call", DECIMALS_CALL, CachePolicy.IMMUTABLE, fetch)
+
+    assert fetch.calls == 2
+
+
+def test_immutable_lru_is_bounded():
+    """The immutable store evicts least recently used entries."""
+    cache = RpcResponseCache(max_entries=2)
+    for index in range(3):
+        cache.put("bsc", "eth_chainId", [index], CachePolicy.IMMUTABLE, "0x38")
+
+    assert cache.get("bsc", "eth_chainId", [0], CachePolicy.IMMUTABLE) == (False, None)
+    assert cache.get("bsc", "eth_chainId", [2], CachePolicy.IMMUTABLE) == (True, "0x38")
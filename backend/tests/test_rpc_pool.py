@@ -0,0 +1,271 @@
+"""
+Tests for RPC pool request batching, hedging and latency tracking.
+
+File: backend/tests/test_rpc_pool.py
+"""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List
+
+import pytest
+
+from app.chains.circuit_breaker import CircuitBreaker, CircuitState
+from app.chains.rpc_pool import ProviderMetrics, RpcPool, RpcProvider
+from app.monitoring.latency import LatencyHistogram
+
+
+class FakeResponse:
+    """Minimal httpx.Response stand-in."""
+
+    def __init__(self, data: Any, status_code: int = 200) -> None:
+        self._data = data
+        self.status_code = status_code
+        self.text = str(data)
+
+    def json(self) -> Any:
+        return self._data
+
+
+class FakeRpcClient:
+    """Records payloads and answers batches in reverse order."""
+
+    def __init__(self, batch_supported: bool = True) -> None:
+        self.batch_supported = batch_supported
+        self.payloads: List[Any] = []
+
+    async def post(self, url: str, json: Any, timeout: int) -> FakeResponse:
+        self.payloads.append(json)
+        if isinstance(json, list):
+            if not self.batch_supported:
+                return FakeResponse({"error": {"code": -32600, "message": "batch unsupported"}})
+            items = []
+            for call in reversed(json):
+                if call["method"] == "eth_fail":
+                    items.append({"id": call["id"], "error": {"code": -32000}})
+                else:
+                    items.append({"id": call["id"], "result": call["method"]})
+            return FakeResponse(items)
+        return FakeResponse({"id": json["id"], "result": f"single:{json['method']}"})
+
+
+class SlowPrimaryClient:
+    """Answers single requests, with the primary node stalling."""
+
+    def __init__(self, primary_delay: float) -> None:
+        self.primary_delay = primary_delay
+        self.cancelled = False
+
+    async def post(self, url: str, json: Any, timeout: int) -> FakeResponse:
+        if url == "http://node":
+            try:
+                await asyncio.sleep(self.primary_delay)
+            except asyncio.CancelledError:
+                self.cancelled = True
+                raise
+        return FakeResponse({"id": json["id"], "result": url})
+
+
+def make_pool(client: Any, max_batch_size: int = 50, backup: bool = False) -> RpcPool:
+    """Create an initialized pool with one or two providers on a test chain."""
+    pool = RpcPool()
+    pool._initialized = True
+    pool.client = client
+    pool.batch_enabled = True
+    pool.batch_window_ms = 0.0
+    pool.batch_max_size = max_batch_size
+    pool.hedge_enabled = False
+    pool.cache_enabled = False
+
+    providers = [RpcProvider(name="primary", url="http://node", chain="test", is_primary=True)]
+    if backup:
+        providers.append(RpcProvider(name="backup", url="http://backup", chain="test"))
+
+    pool.providers = {"test": providers}
+    for provider in providers:
+        pool.metrics[f"test:{provider.name}"] = ProviderMetrics()
+        pool.circuit_breakers[f"test:{provider.name}"] = CircuitBreaker()
+    return pool
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_payload():
+    """Concurrent callers on one chain are sent as a single JSON-RPC array."""
+    client = FakeRpcClient()
+    pool = make_pool(client)
+
+    results = await asyncio.gather(
+        *[pool.make_request("test", method) for method in ("eth_a", "eth_b", "eth_c")]
+    )
+
+    assert results == ["eth_a", "eth_b", "eth_c"]
+    assert len(client.payloads) == 1
+    assert len({call["id"] for call in client.payloads[0]}) == 3
+
+    metrics = pool.metrics["test:primary"]
+    assert metrics.total_requests == 1
+    assert metrics.batch_requests == 1
+    assert metrics.batched_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_item_error_only_fails_its_caller():
+    """A per-item RPC error does not affect other calls in the batch."""
+    client = FakeRpcClient()
+    pool = make_pool(client)
+
+    results = await asyncio.gather(
+        pool.make_request("test", "eth_a"),
+        pool.make_request("test", "eth_fail"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "eth_a"
+    assert isinstance(results[1], Exception)
+    assert pool.metrics["test:primary"].failed_requests == 0
+
+
+@pytest.mark.asyncio
+async def test_max_batch_size_splits_payloads():
+    """Pending calls are flushed once the batch size limit is reached."""
+    client = FakeRpcClient()
+    pool = make_pool(client, max_batch_size=2)
+
+    await asyncio.gather(*[pool.make_request("test", f"eth_{i}") for i in range(5)])
+
+    assert [len(payload) for payload in client.payloads] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batch_rejection_falls_back_to_single_requests():
+    """Providers that reject batches still answer every caller."""
+    client = FakeRpcClient(batch_supported=False)
+    pool = make_pool(client)
+
+    results = await asyncio.gather(
+        pool.make_request("test", "eth_a"),
+        pool.make_request("test", "eth_b"),
+    )
+
+    assert results == ["single:eth_a", "single:eth_b"]
+
+
+@pytest.mark.asyncio
+async def test_batch_fallback_with_response_cache():
+    """Single-request retries of cacheable calls do not wait on their own cache entry."""
+    client = FakeRpcClient(batch_supported=False)
+    pool = make_pool(client)
+    pool.cache_enabled = True
+
+    results = await asyncio.wait_for(
+        asyncio.gather(
+            pool.make_request("test", "eth_chainId"),
+            pool.make_request("test", "eth_getCode", ["0xabc", "latest"]),
+        ),
+        timeout=2,
+    )
+
+    assert results == ["single:eth_chainId", "single:eth_getCode"]
+    assert await pool.make_request("test", "eth_chainId") == "single:eth_chainId"
+    assert pool.response_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_send_raw_transaction_is_never_batched():
+    """Transaction submission bypasses the batch window."""
+    client = FakeRpcClient()
+    pool = make_pool(client)
+
+    result = await pool.make_request("test", "eth_sendRawTransaction", ["0xdead"])
+
+    assert result == "single:eth_sendRawTransaction"
+    assert isinstance(client.payloads[0], dict)
+
+
+def test_latency_histogram_percentiles():
+    """Percentiles use nearest rank over the rolling window."""
+    histogram = LatencyHistogram(window_size=100)
+    for value in range(1, 101):
+        histogram.record(float(value))
+
+    assert histogram.percentile(0.50) == 50.0
+    assert histogram.percentile(0.95) == 95.0
+    assert histogram.percentile(0.99) == 99.0
+
+    histogram.record(1000.0)
+    assert histogram.count == 100
+    assert histogram.percentile(0.99) == 100.0
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_races_backup_provider():
+    """A stalled primary is raced by the backup and the loser is cancelled."""
+    client = SlowPrimaryClient(primary_delay=5.0)
+    pool = make_pool(client, backup=True)
+    pool.batch_enabled = False
+    pool.hedge_enabled = True
+    pool.hedge_default_delay_ms = 20.0
+
+    result = await pool.make_request("test", "eth_call", [{}, "latest"])
+    await asyncio.sleep(0)
+
+    assert result == "http://backup"
+    assert client.cancelled
+    assert pool.hedge_legs["test:backup"] == 1
+    assert pool.hedge_wins["test:backup"] == 1
+    assert pool.metrics["test:primary"].failed_requests == 0
+
+    health = await pool.get_health_status()
+    assert health["test"]["primary"]["latency_ms"]["eth_call"]["samples"] == 1
+    assert health["test"]["backup"]["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelled_half_open_leg_releases_probe():
+    """A half-open provider that loses the race can still be probed later."""
+    client = SlowPrimaryClient(primary_delay=5.0)
+    pool = make_pool(client, backup=True)
+    pool.batch_enabled = False
+    pool.hedge_enabled = True
+    pool.hedge_default_delay_ms = 20.0
+    breaker = pool.circuit_breakers["test:primary"]
+    breaker._state = CircuitState.HALF_OPEN
+
+    result = await pool.make_request("test", "eth_call", [{}, "latest"])
+
+    assert result == "http://backup"
+    assert breaker.state() == CircuitState.HALF_OPEN
+    assert breaker.can_call()
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged():
+    """No hedge leg is started when the first provider answers in time."""
+    client = SlowPrimaryClient(primary_delay=0.0)
+    pool = make_pool(client, backup=True)
+    pool.batch_enabled = False
+    pool.hedge_enabled = True
+    pool.hedge_default_delay_ms = 500.0
+
+    result = await pool.make_request("test", "eth_getTransactionReceipt", ["0x1"])
+
+    assert result == "http://node"
+    assert pool.hedge_legs == {}
+
+
+def test_provider_score_prefers_lower_tail_latency():
+    """Providers with a slow p95 rank behind consistently fast ones."""
+    pool = make_pool(FakeRpcClient(), backup=True)
+    primary, backup = pool.providers["test"]
+    backup.is_primary = True
+
+    for _ in range(18):
+        pool._record_latency("test:primary", "eth_call", 50.0)
+    for _ in range(2):
+        pool._record_latency("test:primary", "eth_call", 3000.0)
+    for _ in range(20):
+        pool._record_latency("test:backup", "eth_call", 60.0)
+
+    primary_score = pool._calculate_provider_score(primary, ProviderMetrics(), "eth_call")
+    backup_score = pool._calculate_provider_score(backup, ProviderMetrics(), "eth_call")
+    assert backup_score < primary_score
@@ -0,0 +1,118 @@
+"""
+Tests for columnar transaction batches and the coordination detectors on them.
+
+File: backend/tests/test_transaction_batch.py
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from app.ai.market_intelligence import CoordinationDetector, CoordinationPattern
+from app.ai.transaction_batch import (
+    NO_ADDRESS,
+    TransactionBatch,
+    cv_similarity,
+    epoch_seconds,
+    group_alternation,
+    group_by,
+    interval_regularity,
+)
+
+BASE = datetime(2026, 3, 1, 12, 0, 0)
+
+
+def test_timestamps_parse_once_to_utc_epoch_seconds():
+    """Naive datetimes read as UTC; Z, +00:00 and other offsets all land on the same clock."""
+    expected = BASE.replace(tzinfo=timezone.utc).timestamp()
+    seconds = epoch_seconds([
+        BASE,
+        BASE.replace(tzinfo=timezone.utc),
+        "2026-03-01T12:00:00Z",
+        "2026-03-01T12:00:00+00:00",
+        "2026-03-01T14:00:00+02:00",
+        expected,
+        None,
+    ], now=1.0)
+    np.testing.assert_allclose(seconds, [expected] * 6 + [1.0])
+
+
+def test_batch_interns_addresses_and_classifies_types():
+    """Addresses get codes in order of first appearance; buy/sell direction follows the type."""
+    batch = TransactionBatch.from_transactions([
+        {"from_address": "0xa", "to_address": "0xb", "type": "BUY", "usd_value": 10},
+        {"from_address": "0xb", "to_address": "", "type": "swap_out"},
+        {"from_address": "0xc", "to_address": "0xa", "type": "buy_limit"},
+    ], now=0.0)
+
+    assert batch.addresses == ["0xa", "0xb", "0xc"]
+    assert batch.from_codes.tolist() == [0, 1, 2]
+    assert batch.to_codes.tolist() == [1, NO_ADDRESS, 0]
+    assert batch.directions.tolist() == [1, -1, 1]
+    assert batch.buys.tolist() == [True, False, False]
+    assert batch.amounts.tolist() == [10.0, 0.0, 0.0]
+
+
+def test_group_reductions_match_per_group_loops():
+    """Grouped similarity, interval regularity and alternation equal a direct per-group computation."""
+    rng = np.random.default_rng(5)
+    keys = rng.integers(0, 6, size=200)
+    times = rng.uniform(0, 1000, size=200)
+    amounts = rng.uniform(1, 100, size=200)
+    directions = rng.integers(-1, 2, size=200)
+    groups = group_by([keys], within=times)
+
+    similarity = cv_similarity(amounts[groups.order], groups.ids, len(groups))
+    regularity = interval_regularity(times[groups.order], groups)
+    alternation = group_alternation(directions[groups.order], groups)
+
+    for group in range(len(groups)):
+        rows = groups.rows(group)
+        assert np.all(keys[rows] == keys[rows[0]]) and np.all(np.diff(times[rows]) >= 0)
+        values = amounts[rows]
+        assert similarity[group] == pytest.approx(max(0.0, 1 - values.std(ddof=1) / values.mean()))
+        gaps = np.diff(times[rows])
+        assert regularity[group] == pytest.approx(max(0.0, 1 - gaps.std(ddof=1) / gaps.mean()))
+        d = directions[rows]
+        flips = np.sum((d[1:] != 0) & (d[:-1] != 0) & (d[1:] != d[:-1]))
+        assert alternation[group] == pytest.approx(flips / (len(d) - 1))
+
+
+@pytest.mark.asyncio
+async def test_detectors_accept_prebuilt_batch():
+    """A wash-trading pair and a bot cluster are found from a columnar batch."""
+    transactions = [
+        {
+            "hash": f"0xw{i}",
+            "from_address": "0xaaaa" if i % 2 == 0 else "0xbbbb",
+            "to_address": "0xbbbb" if i % 2 == 0 else "0xaaaa",
+            "type": "buy" if i % 2 == 0 else "sell",
+            "usd_value": 25000,
+            "timestamp": BASE + timedelta(minutes=15 * i),
+        }
+        for i in range(8)
+    ] + [
+        {
+            "hash": f"0xb{i}",
+            "from_address": f"0xbot{i % 3}",
+            "type": "transfer",
+            "usd_value": 500,
+            "gas_price": 30e9,
+            "timestamp": BASE + timedelta(minutes=i),
+        }
+        for i in range(6)
+    ]
+    batch = TransactionBatch.from_transactions(transactions)
+    alerts = await CoordinationDetector().detect_coordination("0xtoken", batch)
+    by_type = {alert.pattern_type: alert for alert in alerts}
+
+    wash = by_type[CoordinationPattern.WASH_TRADING]
+    assert wash.involved_addresses == ["0xaaaa", "0xbbbb"]
+    assert wash.confidence == pytest.approx(1.0)
+    assert wash.suspicious_transactions == [f"0xw{i}" for i in range(8)]
+
+    bots = by_type[CoordinationPattern.BOT_CLUSTER]
+    assert bots.involved_addresses == ["0xbot0", "0xbot1", "0xbot2"]
+    assert bots.suspicious_transactions == ["0xb0", "0xb3", "0xb1", "0xb4", "0xb2", "0xb5"]
@@ -0,0 +1,112 @@
+"""
+Tests for the per-pair sorted trigger books.
+
+File: backend/tests/test_trigger_book.py
+"""
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+from app.strategy.trigger_book import TriggerBook, TriggerBookIndex, TriggerDirection
+
+PAIR = ("ethereum", "0x" + "aa" * 20)
+
+
+def test_fixed_levels_fire_on_crossing_only():
+    """Below levels fire at or under the tick, above levels at or over it."""
+    book = TriggerBook()
+    book.add_level("sl", "stop_loss", TriggerDirection.BELOW, Decimal("90"))
+    book.add_level("tp", "take_profit", TriggerDirection.ABOVE, Decimal("120"))
+    book.add_level("br", "stop_loss", TriggerDirection.BELOW, Decimal("80"))
+    book.add_level("br", "take_profit", TriggerDirection.ABOVE, Decimal("110"))
+
+    assert book.match(Decimal("100")) == []
+    hits = book.match(Decimal("110"))
+    assert [(hit.order_id, hit.leg) for hit in hits] == [("br", "take_profit")]
+    # Bracket is gone after one leg fired
+    assert "br" not in book and book.match(Decimal("80"))[0].order_id == "sl"
+    assert [hit.order_id for hit in book.match(Decimal("125"))] == ["tp"]
+    assert len(book) == 0
+
+
+def test_trailing_stop_ratchets_with_shared_high():
+    """Overtaken trailing highs follow the market and fire on drawdown by percent."""
+    book = TriggerBook()
+    book.add_trailing("t5", Decimal("5"), Decimal("100"))
+    book.add_trailing("t10", Decimal("10"), Decimal("105"))
+
+    assert book.match(Decimal("120")) == []
+    assert book.trailing_high("t5") == book.trailing_high("t10") == Decimal("120")
+
+    hits = book.match(Decimal("113"))
+    assert [(hit.order_id, hit.level) for hit in hits] == [("t5", Decimal("114.00"))]
+    assert [hit.order_id for hit in book.match(Decimal("108"))] == ["t10"]
+
+
+def test_trailing_stop_added_after_peak_keeps_own_high():
+    """A stop rested below the shared high ratchets from its own high."""
+    book = TriggerBook()
+    book.add_trailing("old", Decimal("50"), Decimal("100"))
+    book.match(Decimal("200"))
+    book.add_trailing("new", Decimal("10"), Decimal("120"))
+
+    assert book.match(Decimal("130")) == []
+    assert book.trailing_high("new") == Decimal("130")
+    assert book.trailing_high("old") == Decimal("200")
+    assert [hit.order_id for hit in book.match(Decimal("117"))] == ["new"]
+
+
+def test_matches_brute_force_under_random_ticks():
+    """Book hits equal a per-order scan across random adds, removes and ticks."""
+    rng = random.Random(3)
+    book = TriggerBook()
+    reference = {}
+    price = Decimal("100")
+
+    for step in range(3000):
+        roll = rng.random()
+        if roll < 0.3:
+            order_id = f"o{step}"
+            if rng.random() < 0.5:
+                level = price + rng.randint(-20, 20)
+                direction = TriggerDirection.BELOW if level < price else TriggerDirection.ABOVE
+                book.add_level(order_id, "fixed", direction, level)
+                reference[order_id] = ["fixed", direction, level]
+            else:
+                trail_percent = Decimal(rng.randint(1, 25))
+                high = price + rng.randint(0, 5)
+                book.add_trailing(order_id, trail_percent, high)
+                reference[order_id] = ["trailing", trail_percent, high]
+        elif roll < 0.35 and reference:
+            order_id = rng.choice(sorted(reference))
+            del reference[order_id]
+            assert book.remove(order_id)
+        else:
+            price = max(Decimal("1"), price + rng.randint(-8, 8))
+            expected = set()
+            for order_id, (kind, a, b) in reference.items():
+                if kind == "fixed":
+                    if (a is TriggerDirection.BELOW and price <= b) or (a is TriggerDirection.ABOVE and price >= b):
+                        expected.add(order_id)
+                else:
+                    reference[order_id][2] = b = max(b, price)
+                    if price <= b * (1 - a / 100):
+                        expected.add(order_id)
+            assert {hit.order_id for hit in book.match(price)} == expected
+            for order_id in expected:
+                del reference[order_id]
+        assert len(book) == len(reference)
+
+
+def test_index_routes_by_pair_and_replaces_orders():
+    """Re-adding an order moves it; empty books are dropped."""
+    index = TriggerBookIndex()
+    other = ("bsc", "0x" + "bb" * 20)
+    index.add_levels(PAIR, "a", [("stop_loss", TriggerDirection.BELOW, Decimal("10"))])
+    index.add_levels(other, "a", [("take_profit", TriggerDirection.ABOVE, Decimal("20"))])
+
+    assert len(index) == 1 and list(index.pairs()) == [other]
+    assert index.match(PAIR, Decimal("5")) == []
+    assert index.match(other, Decimal("25"))[0].leg == "take_profit"
+    assert len(index) == 0 and list(index.pairs()) == []
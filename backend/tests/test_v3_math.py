@@ -0,0 +1,231 @@
+"""
+Tests for the local Uniswap V3 swap simulator and pool mirror.
+
+File: backend/tests/test_v3_math.py
+"""
+from __future__ import annotations
+
+import random
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+
+from app.chains.multicall import MulticallResult
+from app.dex.v3_math import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+    PoolSnapshot,
+    TickWordNotLoaded,
+    compute_swap_step,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+    next_initialized_tick_within_one_word,
+    quote_exact_input,
+    quote_exact_input_curve,
+    tick_position,
+)
+from app.dex.v3_pool_mirror import MINT_TOPIC, SWAP_TOPIC, V3PoolMirror
+
+TICK_SPACING = 60
+
+
+def make_pool(positions: List[Tuple[int, int, int]], tick: int = 0) -> PoolSnapshot:
+    """Build a 0.3% pool snapshot from (tick_lower, tick_upper, liquidity) positions."""
+    pool = PoolSnapshot(
+        sqrt_price_x96=get_sqrt_ratio_at_tick(tick),
+        tick=tick,
+        liquidity=0,
+        fee=3000,
+        tick_spacing=TICK_SPACING,
+        bitmap={word: 0 for word in range(-3, 3)},
+    )
+    for lower, upper, liquidity in positions:
+        for boundary, net in ((lower, liquidity), (upper, -liquidity)):
+            word, bit = tick_position(boundary, TICK_SPACING)
+            pool.bitmap[word] |= 1 << bit
+            pool.liquidity_net[boundary] = pool.liquidity_net.get(boundary, 0) + net
+        if lower <= tick < upper:
+            pool.liquidity += liquidity
+    return pool
+
+
+def reference_swap(pool: PoolSnapshot, zero_for_one: bool, amount_in: int) -> Optional[Tuple[int, int, int]]:
+    """Step-by-step port of UniswapV3Pool.swap for exact input."""
+    limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    remaining, out = amount_in, 0
+    sqrt_price, tick, liquidity = pool.sqrt_price_x96, pool.tick, pool.liquidity
+
+    while remaining and sqrt_price != limit:
+        start = sqrt_price
+        try:
+            tick_next, initialized = next_initialized_tick_within_one_word(
+                pool.bitmap, tick, pool.tick_spacing, zero_for_one
+            )
+        except TickWordNotLoaded:
+            return None
+        tick_next = max(MIN_TICK, min(MAX_TICK, tick_next))
+        sqrt_next = get_sqrt_ratio_at_tick(tick_next)
+        target = max(sqrt_next, limit) if zero_for_one else min(sqrt_next, limit)
+
+        sqrt_price, step_in, step_out, fee = compute_swap_step(sqrt_price, target, liquidity, remaining, pool.fee)
+        remaining -= step_in + fee
+        out += step_out
+
+        if sqrt_price == sqrt_next:
+            if initialized:
+                net = pool.liquidity_net.get(tick_next, 0)
+                liquidity += -net if zero_for_one else net
+            tick = tick_next - 1 if zero_for_one else tick_next
+        elif sqrt_price != start:
+            tick = get_tick_at_sqrt_ratio(sqrt_price)
+
+    if remaining:
+        return None
+    return out, sqrt_price, tick
+
+
+def test_tick_math_bounds_and_inverse():
+    """TickMath matches its documented bounds and round-trips ticks."""
+    assert get_sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert get_sqrt_ratio_at_tick(0) == 1 << 96
+
+    for tick in (-500000, -60, -1, 0, 1, 59, 887271):
+        sqrt_price = get_sqrt_ratio_at_tick(tick)
+        assert get_tick_at_sqrt_ratio(sqrt_price) == tick
+        assert get_tick_at_sqrt_ratio(sqrt_price - 1) == tick - 1
+
+
+def test_compute_swap_step_matches_core_vector():
+    """Capped exact-input step reproduces the Uniswap core SwapMath test vector."""
+    target = 79623317895830914510639640423  # encodePriceSqrt(101, 100)
+
+    sqrt_price, amount_in, amount_out, fee = compute_swap_step(1 << 96, target, 2 * 10**18, 10**18, 600)
+
+    assert sqrt_price == target
+    assert amount_in == 9975124224178055
+    assert amount_out == 9925619580021728
+    assert fee == 5988667735148
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_curve_matches_step_by_step_swap(zero_for_one):
+    """One tick walk reproduces the pool swap loop for every size, across ticks."""
+    pool = make_pool([
+        (-600, 600, 10**20),
+        (-1800, -120, 5 * 10**19),
+        (240, 3000, 2 * 10**19),
+        (-6000, 6000, 10**18),
+    ])
+    rng = random.Random(7)
+    sizes = sorted({rng.randint(1, 5 * 10**18) for _ in range(60)} | {10**15, 10**21})
+
+    quotes = quote_exact_input_curve(pool, zero_for_one, sizes)
+
+    for size, quote in zip(sizes, quotes):
+        expected = reference_swap(pool, zero_for_one, size)
+        if expected is None:
+            assert quote is None
+            continue
+        assert (quote.amount_out, quote.sqrt_price_after, quote.tick_after) == expected
+    assert any(quote and quote.initialized_ticks_crossed > 0 for quote in quotes)
+
+
+def test_swap_leaving_loaded_words_is_unquotable():
+    """Sizes that would need unloaded bitmap words fall back to the caller."""
+    pool = make_pool([(-600, 600, 10**12)])
+    pool.bitmap = {0: pool.bitmap[0], -1: pool.bitmap[-1]}
+
+    assert quote_exact_input(pool, True, 10**6) is not None
+    assert quote_exact_input(pool, True, 10**30) is None
+
+
+class FakeAggregator:
+    """Multicall stand-in answering pool reads from a snapshot."""
+
+    def __init__(self, pool: PoolSnapshot) -> None:
+        self.pool = pool
+        self.rounds = 0
+
+    async def aggregate(self, chain: str, calls: List, block_identifier: str = "latest") -> List:
+        self.rounds += 1
+        results = []
+        for call in calls:
+            selector, arg = call.call_data[2:10], call.call_data[10:]
+            if selector == "3850c7bd":
+                value = (self.pool.sqrt_price_x96, self.pool.tick)
+            elif selector == "1a686502":
+                value = self.pool.liquidity
+            elif selector == "d0c93a7c":
+                value = self.pool.tick_spacing
+            elif selector == "5339c296":
+                word = int(arg, 16) - (1 << 256) if int(arg, 16) >> 255 else int(arg, 16)
+                value = self.pool.bitmap.get(word, 0)
+            else:
+                tick = int(arg, 16) - (1 << 256) if int(arg, 16) >> 255 else int(arg, 16)
+                net = self.pool.liquidity_net[tick]
+                value = (abs(net), net)
+            results.append(MulticallResult(True, value, b""))
+        return results
+
+
+class FakePool:
+    """RPC pool stand-in serving a head block and queued logs."""
+
+    def __init__(self, head: int) -> None:
+        self.head = head
+        self.logs: List[Dict] = []
+
+    async def make_request(self, chain: str, method: str, params: List):
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        return self.logs
+
+
+def word(value: int) -> str:
+    """Encode a signed value as a 32-byte hex word."""
+    return format(value % (1 << 256), "064x")
+
+
+@pytest.mark.asyncio
+async def test_mirror_seeds_and_follows_pool_logs():
+    """Seeded state quotes locally and tracks Swap and Mint logs."""
+    source = make_pool([(-600, 600, 10**20)])
+    factory, pool_address = "0x" + "fa" * 20, "0x" + "cc" * 20
+    token0, token1 = "0x" + "01" * 20, "0x" + "02" * 20
+    mirror = V3PoolMirror(pool=FakePool(100), aggregator=FakeAggregator(source), auto_sync=False)
+
+    mirror.register_pool("ethereum", factory, pool_address, token0, token1, 3000)
+    assert mirror.quote("ethereum", factory, token0, token1, 10**18, [3000]) is None
+
+    await mirror.sync_once("ethereum")
+    quotes = mirror.quote("ethereum", factory, token0, token1, 10**18, [3000])
+    assert quotes[3000].amount_out == reference_swap(source, True, 10**18)[0]
+
+    moved = get_sqrt_ratio_at_tick(-30)
+    mirror.pool.head = 101
+    mirror.pool.logs = [
+        {
+            "address": pool_address,
+            "topics": [SWAP_TOPIC, "0x" + word(0), "0x" + word(0)],
+            "data": "0x" + word(10**18) + word(-(10**18)) + word(moved) + word(10**20) + word(-30),
+            "blockNumber": hex(101),
+            "logIndex": "0x0",
+        },
+        {
+            "address": pool_address,
+            "topics": [MINT_TOPIC, "0x" + word(0), "0x" + word(-120), "0x" + word(120)],
+            "data": "0x" + word(0) + word(10**19) + word(0) + word(0),
+            "blockNumber": hex(101),
+            "logIndex": "0x1",
+        },
+    ]
+    assert await mirror.sync_once("ethereum") == 2
+
+    state = mirror.get_pool("ethereum", factory, token0, token1, 3000)
+    assert state.snapshot.tick == -30
+    assert state.snapshot.liquidity == 10**20 + 10**19
+    assert state.snapshot.liquidity_net[-120] == 10**19
+    assert state.snapshot.bitmap[tick_position(120, TICK_SPACING)[0]] >> tick_position(120, TICK_SPACING)[1] & 1
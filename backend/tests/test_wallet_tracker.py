@@ -0,0 +1,160 @@
+"""
+Tests for copy-trade wallet tracking over recorded block logs.
+
+File: backend/tests/test_wallet_tracker.py
+"""
+from __future__ import annotations
+
+import json
+import random
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from app.discovery.log_scanner import CursorStore, LogScanner, ScanCursor
+from app.strategy.wallet_tracker import (
+    TRACKED_TOPICS,
+    TRANSFER_TOPIC,
+    V2_SWAP_TOPIC,
+    TrackedAddressIndex,
+    TrackedTrade,
+    WalletTracker,
+    address_topic,
+)
+
+FIXTURE = json.loads((Path(__file__).parent / "fixtures" / "copytrade_blocks.json").read_text())
+TRADER_A, TRADER_B = FIXTURE["tracked"]
+E = 10 ** 18
+
+
+def recorded_logs() -> List[Dict[str, Any]]:
+    return [log for block in FIXTURE["blocks"] for log in block["logs"]]
+
+
+def random_address(rng: random.Random) -> str:
+    return "0x" + format(rng.getrandbits(160), "040x")
+
+
+def noise_logs(block: Dict[str, Any], count: int, seed: int = 7) -> List[Dict[str, Any]]:
+    """Untracked transfers and swaps to pad a recorded block to mainnet density."""
+    rng = random.Random(seed)
+    logs = []
+    for index in range(count):
+        topic = TRANSFER_TOPIC if index % 3 else V2_SWAP_TOPIC
+        logs.append({
+            "address": random_address(rng),
+            "topics": [topic, address_topic(random_address(rng)), address_topic(random_address(rng))],
+            "data": "0x" + format(rng.getrandbits(64), "064x"),
+            "blockNumber": block["number"],
+            "blockHash": block["hash"],
+            "transactionHash": "0x" + format(rng.getrandbits(256), "064x"),
+            "logIndex": hex(1000 + index),
+        })
+    return logs
+
+
+class TradeRecorder:
+    """Collects trades handed on per block."""
+
+    def __init__(self) -> None:
+        self.batches: List[List[TrackedTrade]] = []
+
+    async def __call__(self, trades: List[TrackedTrade]) -> None:
+        self.batches.append(trades)
+
+
+@pytest.mark.asyncio
+async def test_recorded_blocks_yield_tracked_swaps_only():
+    """Buys and sells through pools are found; transfers, NFTs and token-to-token legs are not."""
+    recorder = TradeRecorder()
+    tracker = WalletTracker("ethereum", TrackedAddressIndex(FIXTURE["tracked"]), on_trades=recorder)
+
+    trades = await tracker.process_logs(recorded_logs())
+
+    assert [(t.trader_address, t.side, t.dex_version, t.block_number) for t in trades] == [
+        (TRADER_A, "buy", "v2", 19_530_000),
+        (TRADER_B, "sell", "v3", 19_530_000),
+        (TRADER_B, "buy", "v2", 19_530_001),
+    ]
+    buy, sell, _ = trades
+    assert (buy.token_amount, buy.native_amount) == (1_250_000 * E, E // 2)
+    assert (sell.token_amount, sell.native_amount) == (30_000 * E, 12 * E // 10)
+    assert buy.timestamp == datetime.utcfromtimestamp(1_710_800_003)
+    assert [len(batch) for batch in recorder.batches] == [2, 1]
+
+    stats = tracker.get_stats()
+    assert stats["blocks"] == 2 and stats["trades"] == 3 and stats["matched_transactions"] == 5
+    assert set(stats["match_latency_ms"]) == {"p50", "p95", "max"}
+
+
+def test_dense_block_with_thousands_of_tracked_addresses():
+    """Padding a block with noise and tracking 5000 traders finds the same trades."""
+    rng = random.Random(11)
+    tracked = [random_address(rng) for _ in range(5000)] + [TRADER_A.upper().replace("0X", "0x"), TRADER_B]
+    index = TrackedAddressIndex(tracked)
+    tracker = WalletTracker("ethereum", index)
+    block = FIXTURE["blocks"][0]
+
+    trades = tracker.match_block(block["logs"] + noise_logs(block, 3000))
+
+    assert [(t.trader_address, t.side) for t in trades] == [(TRADER_A, "buy"), (TRADER_B, "sell")]
+    assert tracker.get_stats()["matched_transactions"] == 4
+
+
+def test_index_add_and_remove():
+    """Removed traders stop matching until they are tracked again."""
+    index = TrackedAddressIndex([TRADER_A, TRADER_B])
+    tracker = WalletTracker("ethereum", index)
+    block = FIXTURE["blocks"][0]
+
+    index.remove(TRADER_B)
+    assert [t.trader_address for t in tracker.match_block(block["logs"])] == [TRADER_A]
+    assert TRADER_B not in index and TRADER_A.upper().replace("0X", "0x") in index
+
+    index.add(TRADER_B.upper().replace("0X", "0x"))
+    assert len(index) == 2
+    assert [t.trader_address for t in tracker.match_block(block["logs"])] == [TRADER_A, TRADER_B]
+
+
+class RecordedChain:
+    """RPC pool stand-in replaying the recorded blocks."""
+
+    def __init__(self) -> None:
+        self.blocks = {int(block["number"], 16): block for block in FIXTURE["blocks"]}
+        self.filters: List[Dict[str, Any]] = []
+
+    async def make_request(self, chain: str, method: str, params: List) -> Any:
+        if method == "eth_blockNumber":
+            return hex(max(self.blocks))
+        if method == "eth_getBlockByNumber":
+            block = self.blocks.get(int(params[0], 16))
+            return {"hash": block["hash"]} if block else None
+        if method == "eth_getLogs":
+            self.filters.append(params[0])
+            start, end = int(params[0]["fromBlock"], 16), int(params[0]["toBlock"], 16)
+            return [log for number in range(start, end + 1) for log in self.blocks[number]["logs"]]
+        raise AssertionError(method)
+
+
+@pytest.mark.asyncio
+async def test_log_scanner_drives_tracker_without_address_filter():
+    """The scanner pulls every Transfer/Swap log and the tracker matches them locally."""
+    chain = RecordedChain()
+    recorder = TradeRecorder()
+    tracker = WalletTracker("ethereum", TrackedAddressIndex(FIXTURE["tracked"]), on_trades=recorder)
+    with tempfile.TemporaryDirectory() as directory:
+        store = CursorStore(Path(directory))
+        store.save("copytrade", ScanCursor("ethereum", int(FIXTURE["blocks"][0]["number"], 16) - 1))
+        scanner = LogScanner(
+            "ethereum", [], list(TRACKED_TOPICS), tracker.process_logs,
+            name="copytrade", pool=chain, store=store,
+        )
+
+        await scanner.scan_once()
+
+    assert "address" not in chain.filters[0] and chain.filters[0]["topics"] == [list(TRACKED_TOPICS)]
+    assert [len(batch) for batch in recorder.batches] == [2, 1]
+
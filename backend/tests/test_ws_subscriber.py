@@ -0,0 +1,98 @@
+"""
+Tests for the eth_subscribe transport against a local WebSocket node.
+
+File: backend/tests/test_ws_subscriber.py
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, List
+
+import pytest
+import websockets
+
+from app.discovery import ws_subscriber
+from app.discovery.ws_subscriber import WsSubscriber
+
+FACTORY = "0x" + "fa" * 20
+TOPIC = "0x" + "0d" * 32
+
+
+class StandInNode:
+    """Minimal eth_subscribe server that pushes scripted notifications."""
+
+    def __init__(self, sessions: List[List[Dict[str, Any]]]) -> None:
+        # Each session is the list of (kind, result) pushes before closing
+        self.sessions = sessions
+        self.subscribe_params: List[List[Any]] = []
+        self.connections = 0
+
+    async def handler(self, ws: Any) -> None:
+        session = self.sessions[min(self.connections, len(self.sessions) - 1)]
+        self.connections += 1
+        ids: Dict[str, str] = {}
+        while len(ids) < 2:
+            request = json.loads(await ws.recv())
+            self.subscribe_params.append(request["params"])
+            kind = request["params"][0]
+            ids[kind] = f"0x{self.connections}{len(ids)}"
+            await ws.send(json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": ids[kind]}))
+        for push in session:
+            await ws.send(json.dumps({
+                "jsonrpc": "2.0",
+                "method": "eth_subscription",
+                "params": {"subscription": ids[push["kind"]], "result": push["result"]},
+            }))
+        if self.connections < len(self.sessions):
+            await ws.close()
+        else:
+            await ws.wait_closed()
+
+
+def head(number: int) -> Dict[str, Any]:
+    return {"kind": "newHeads", "result": {"number": hex(number), "hash": "0x" + "ab" * 32}}
+
+
+@pytest.mark.asyncio
+async def test_resubscribes_after_disconnect_and_counts_gaps():
+    """Both subscriptions are recreated on reconnect and skipped heads are counted."""
+    log = {"address": FACTORY, "topics": [TOPIC], "blockNumber": hex(11), "logIndex": "0x0"}
+    node = StandInNode([
+        [head(10), {"kind": "logs", "result": log}, head(11)],
+        [head(14)],
+    ])
+    heads: List[int] = []
+    pushed: List[Dict[str, Any]] = []
+    done = asyncio.Event()
+
+    async def on_head(number: int) -> None:
+        heads.append(number)
+        if number == 14:
+            done.set()
+
+    async def on_logs(logs: List[Dict[str, Any]]) -> None:
+        pushed.extend(logs)
+
+    original_delay = ws_subscriber.MIN_RECONNECT_DELAY
+    ws_subscriber.MIN_RECONNECT_DELAY = 0.01
+    try:
+        async with websockets.serve(node.handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            subscriber = WsSubscriber("bsc", f"ws://127.0.0.1:{port}", [FACTORY], [TOPIC], on_head, on_logs)
+            task = asyncio.create_task(subscriber.run())
+            await asyncio.wait_for(done.wait(), 5)
+            subscriber.stop()
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    finally:
+        ws_subscriber.MIN_RECONNECT_DELAY = original_delay
+
+    assert heads == [10, 11, 14]
+    assert pushed == [log]
+    assert node.connections == 2
+    assert [params[0] for params in node.subscribe_params] == ["newHeads", "logs"] * 2
+    assert node.subscribe_params[1][1] == {"address": [FACTORY], "topics": [[TOPIC]]}
+    assert subscriber.gaps_detected == 1
+    assert subscriber.connections == 2 and subscriber.disconnects >= 1
+